@@ -693,6 +693,7 @@ class TreeNode:
         self.tag = tag
         self.text = text
         self.children = []
+        self.index = None # Nodes under this node by tag, see index_tree
 
 def parse_arxml(file_path):
     tree = ET.parse(file_path)
@@ -707,8 +708,20 @@ def parse_arxml(file_path):
         return node
 
     tree_root = parse_element(root)
+    index_tree(tree_root)
     return tree_root
 
+# Index the nodes of a tree by tag in document order, the interfaces search the whole tree for every element
+def index_tree(root):
+    index = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        index.setdefault(node.tag, []).append(node)
+        stack.extend(reversed(node.children))
+    root.index = index
+    return index
+
 # Printing parsed tree
 def print_tree(node, indent=0):
     print("  " * indent + node.tag + (": " + node.text if node.text else ""))
@@ -728,6 +741,9 @@ def print_specific_tree(node, tag, indent = 0):
 
 # Finds the first node under root with the target_tag
 def find_first_root(node, target_tag):
+    if node.index is not None:
+        nodes = node.index.get(target_tag)
+        return nodes[0] if nodes else None
     if node.tag == target_tag:
         return node
 
@@ -740,6 +756,8 @@ def find_first_root(node, target_tag):
 
 # Finds all the nodes under root with the target_tag
 def find_roots_of_tag(node, target_tag):
+    if node.index is not None:
+        return list(node.index.get(target_tag, ()))
     roots = []
 
     if node.tag == target_tag:
@@ -1102,58 +1120,94 @@ def parse_command_line():
 
     return parser.parse_args()
 
+def convert_arxml(file_path, package, output, tree=None, progress=None):
+    """
+    Parse one ARXML file and pass the FIDL and FDEPL text of every service
+        interface to output(path, text), the path relative to the output
+        directory, e.g. "fidl/Sensor.fidl". An FDEPL is generated only for
+        an interface with instances.
+
+    :param package: Package name of the FIDLs and FDEPLs, None for the ARXML packages.
+    :param tree: parse_arxml result of file_path, e.g. kept from an earlier run, parsed here if None.
+    :param progress: Called with (phase, name, done, total) for every interface parsed
+        (phase "parse") and generated (phase "generate").
+    :return: Number of interfaces parsed without and with errors.
+    """
+    error_cnt = 0
+    success_cnt = 0
+    print(f"Parsing ARXML: {file_path}")
+    
+    if tree is None:
+        tree = parse_arxml(file_path)
+    if tree is None:
+        raise Exception(f"Failed to parse ARMXL: {file_path}")
+    roots = find_roots_of_tag(tree, "SERVICE-INTERFACE")
+    package_names = []
+    if package:
+        package_names = package.split('.')
+    Interfaces = []
+    for index, root in enumerate(roots):
+        if progress is not None:
+            name_node = find_first_root(root, "SHORT-NAME")
+            progress("parse", name_node.text if name_node is not None else "", index + 1, len(roots))
+        try:
+            Interfaces.append(Interface(root, tree, package = package_names))
+            success_cnt += 1
+            print(f"Parsing done without errors")
+        except Exception as e:
+            print(f"INTERFACE PARSING ERROR {e}")
+            error_cnt += 1
+            if package:
+                package_names = package.split('.')
+            else:
+                package_names = []
+            continue
+    
+    for index, interface in enumerate(Interfaces):
+        if progress is not None:
+            progress("generate", interface.name, index + 1, len(Interfaces))
+        try:
+            dump_interface(interface)
+            print(f"Generating FIDL, FDEPL of {interface.name}")
+            fidl_str = generate_fidl_from_arxml(interface)
+            fdepl_str = None
+            if interface.instances:
+                fdepl_str = generate_fdepl_from_arxml(interface)
+            output("fidl/{}.fidl".format(interface.name), fidl_str)
+            if fdepl_str is not None:
+                output("fidl/{}.fdepl".format(interface.name), fdepl_str)
+            print(f"FIDL, FDPEL generation done without errors")
+        except Exception as e:
+            print("CODE GENERATION ERROR at {}: {}".format(interface.name, e))
+            continue
+    return success_cnt, error_cnt
+
+def generate_arxml_files(arxml_files, package=None, sink=None):
+    """
+    FIDL and FDEPL texts of the service interfaces of ARXML files, without touching disk.
+
+    :param sink: Called with (path, text) for every file as it is generated, the files are not kept then.
+    :return: OrderedDict of the texts by path, e.g. "fidl/Sensor.fidl", empty with sink.
+    """
+    files = OrderedDict()
+    output = sink if sink is not None else files.__setitem__
+    for arxml in arxml_files:
+        convert_arxml(os.path.abspath(arxml), package, output)
+    return files
+
 # Main
 def main(args):
     
+    def output(path, text):
+        with open(os.path.join(args.output_dir, path), "w") as f:
+            f.write(text)
+    
     try:
         for arxml in args.arxml:
-            error_cnt = 0
-            success_cnt = 0
             # current_dir = os.path.dirname(os.path.abspath(__file__))
             file_path = os.path.abspath(arxml)
-            
-            print(f"Parsing ARXML: {file_path}")
-            
-            tree = parse_arxml(file_path)
-            if tree is None:
-                raise Exception(f"Failed to parse ARMXL: {file_path}")
-            roots = find_roots_of_tag(tree, "SERVICE-INTERFACE")
-            package = []
-            if args.package:
-                package = args.package.split('.')
-            Interfaces = []
-            for root in roots:
-                try:
-                    Interfaces.append(Interface(root, tree, package = package))
-                    success_cnt += 1
-                    print(f"Parsing done without errors")
-                except Exception as e:
-                    print(f"INTERFACE PARSING ERROR {e}")
-                    error_cnt += 1
-                    if args.package:
-                        package = args.package.split('.')
-                    else:
-                        package = []
-                    continue
             os.makedirs(args.output_dir + '/fidl', exist_ok = True)
-            
-            for interface in Interfaces:
-                try:
-                    dump_interface(interface)
-                    print(f"Generating FIDL, FDEPL of {interface.name}")
-                    fidl_str = generate_fidl_from_arxml(interface)
-                    if interface.instances:
-                        fdepl_str = generate_fdepl_from_arxml(interface)
-                    f = open("{}/fidl/{}.fidl".format(args.output_dir,interface.name), "w")
-                    f.write(fidl_str)
-                    f.close()
-                    f = open("{}/fidl/{}.fdepl".format(args.output_dir,interface.name), "w")
-                    f.write(fdepl_str)
-                    f.close()
-                    print(f"FIDL, FDPEL generation done without errors")
-                except Exception as e:
-                    print("CODE GENERATION ERROR at {}: {}".format(interface.name, e))
-                    continue
+            success_cnt, error_cnt = convert_arxml(file_path, args.package, output)
             print(f"Total {success_cnt+error_cnt} interfaces in {file_path}\nSuccess: {success_cnt} Error: {error_cnt}")
     except (ET.ParseError, FileNotFoundError, Exception) as e:
         print("EXECUTION ERROR: {}".format(e))
@@ -0,0 +1,553 @@
+"""
+FIDL code generation benchmark.
+
+Generates deterministic synthetic FIDL models, or takes the given FIDL files,
+and measures the AIDL (convert_to_aidl) and the JNI/C++/Service
+(convert_to_src_client) emitters separately and together
+(convert_to_aidl_and_src_client, main option 2). Parsing is not part of the
+measurement. Every measurement records the time, the peak Python memory of
+one extra run under tracemalloc and the output size. Results are written as
+JSON, which can be compared with the results of another version using
+--compare.
+
+    python benchmarks/codegen_benchmark.py -o before.json
+    python benchmarks/codegen_benchmark.py -o after.json --compare before.json
+
+The standard suite has one rich interface in three sizes. The scaling suite
+varies one dimension of a base model at a time: number of interfaces,
+members per interface, struct nesting depth, implicit or explicit arrays,
+arrays of structs, maps and enumerations, so the results show how the
+generator scales with each of them.
+
+    python benchmarks/codegen_benchmark.py --suite scaling -o scaling.json
+
+--stream runs the converters in streaming mode, which writes the files of
+every interface as soon as they are generated; its peak memory stays at
+about one interface instead of growing with the model.
+
+--golden keeps the generated files of each model in a directory on the first
+run and compares the output of later runs with them, so that a change of the
+emitters can be checked for identical output. The output does not depend on
+the hash seed, tests/test_golden.py checks the same for two small models.
+
+    python benchmarks/codegen_benchmark.py --golden golden/
+"""
+
+import argparse
+import collections
+import contextlib
+import filecmp
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import fidl_module_converter as fidl
+from pyfranca import Processor
+
+
+STAGES = ["convert_to_aidl", "convert_to_src_client", "convert_to_aidl_and_src_client"]
+
+SUITES = ["standard", "scaling", "all"]
+
+# Model name -> member groups of the synthetic interface.
+MODELS = {
+    "model_small": 5,
+    "model_medium": 50,
+    "model_large": 200,
+}
+
+ScalingSpec = collections.namedtuple("ScalingSpec", ["interfaces", "members", "depth", "arrays", "struct_arrays",
+                                                     "maps", "enumerations"])
+
+# Base model of the scaling suite, each dimension is varied with the others kept.
+SCALING_BASE = ScalingSpec(interfaces=2, members=24, depth=2, arrays="explicit", struct_arrays=True,
+                           maps=1, enumerations=1)
+
+# Dimension -> values of the scaling suite. --scale multiplies interfaces and members.
+SCALING = collections.OrderedDict([
+    ("interfaces", [1, 4, 16]),
+    ("members", [6, 24, 96]),
+    ("depth", [0, 2, 4, 8]),
+    ("arrays", ["explicit", "implicit"]),
+    ("struct_arrays", [False, True]),
+    ("maps", [0, 1, 4]),
+    ("enumerations", [0, 1, 8]),
+])
+
+JNI_VERSION = "JNI_VERSION_1_6"
+JAVA_PACKAGE = "com.example.bench"
+
+# Object addresses leak into a few generated comments.
+ADDRESS_RE = re.compile(rb"0x[0-9a-f]+")
+
+
+############################################ Model ##################################################################################
+
+class ModelGenerator(object):
+    """
+    Deterministic synthetic FIDL model generator.
+
+    The model has a type collection and one interface. Every member group of
+        the interface has attributes, methods and broadcasts of primitive,
+        implicit array, struct, nested struct, array of structs, enumeration
+        and map types, so every emitter path is exercised.
+    """
+
+    def __init__(self, members):
+        self.members = members
+
+    def generate_group(self, n):
+        return (f"    attribute ByteBuffer raw{n}\n"
+                f"    attribute UInt64 counter{n} readonly\n"
+                f"    attribute Sample sample{n}\n"
+                f"    attribute Wrapper wrapper{n}\n"
+                f"    attribute Samples samples{n}\n"
+                f"    attribute Levels levels{n}\n"
+                f"    attribute Level level{n}\n"
+                f"    attribute Local local{n}\n"
+                f"    attribute Locals locals{n}\n"
+                f"    attribute Sample[] sampleList{n}\n"
+                f"    attribute Lookup lookup{n}\n"
+                f"    method configure{n} {{\n"
+                f"        in {{ Sample s ByteBuffer blob Wrapper w Level l UInt16[] nums }}\n"
+                f"        out {{ Wrapper result Samples all Double d }}\n"
+                f"    }}\n"
+                f"    method fetch{n} {{\n"
+                f"        in {{ Int32 idx }}\n"
+                f"        out {{ Local loc }}\n"
+                f"    }}\n"
+                f"    method listAll{n} {{\n"
+                f"        out {{ Local[] items }}\n"
+                f"    }}\n"
+                f"    method reset{n} fireAndForget {{\n"
+                f"        in {{ Boolean hard }}\n"
+                f"    }}\n"
+                f"    broadcast changed{n} {{\n"
+                f"        out {{ Sample s Level l Int32[] vals }}\n"
+                f"    }}\n"
+                f"    broadcast wrapped{n} {{\n"
+                f"        out {{ Wrapper w }}\n"
+                f"    }}\n")
+
+    def generate(self, directory):
+        """
+        Write the model.
+
+        :param directory: Output directory.
+        :return: Path of the FIDL file.
+        """
+        out = ["package bench.codegen\n\n",
+               "typeCollection Shared {\n"
+               "    version { major 1 minor 0 }\n"
+               "    struct Sample {\n"
+               "        UInt32 id\n"
+               "        String tag\n"
+               "        Int16[] values\n"
+               "        ByteBuffer payload\n"
+               "    }\n"
+               "    struct Wrapper {\n"
+               "        Sample first\n"
+               "        Sample[] more\n"
+               "        Level level\n"
+               "        UInt8 flag\n"
+               "    }\n"
+               "    array Samples of Sample\n"
+               "    array Levels of Int64\n"
+               "    enumeration Level {\n"
+               "        LOW = 0\n"
+               "        HIGH = 0x10\n"
+               "    }\n"
+               "    map Lookup {\n"
+               "        String to Sample\n"
+               "    }\n"
+               "}\n\n",
+               "interface Sensor {\n"
+               "    version { major 1 minor 0 }\n"
+               "    struct Local {\n"
+               "        Float f\n"
+               "        Shared.Sample s\n"
+               "        Boolean[] bits\n"
+               "    }\n"
+               "    array Locals of Local\n"]
+        for n in range(self.members):
+            out.append(self.generate_group(n))
+        out.append("}\n")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "Sensor.fidl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(out))
+        return path
+
+
+class ScalingModelGenerator(object):
+    """
+    Deterministic FIDL model generator of the scaling suite.
+
+    A type collection has a chain of depth nested structs, enumerations,
+        maps and, with explicit arrays, array types. Every interface has
+        members attributes, methods and broadcasts, whose types rotate
+        through a primitive, the most nested struct, a primitive array, an
+        array of the most nested struct, the maps and the enumerations.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+
+    def member_types(self):
+        spec = self.spec
+        top = f"Nest{spec.depth}"
+        types = ["UInt32", top, "Int32[]" if spec.arrays == "implicit" else "Ints"]
+        if spec.struct_arrays:
+            types.append(f"{top}[]" if spec.arrays == "implicit" else f"{top}List")
+        types.extend(f"Table{m}" for m in range(spec.maps))
+        types.extend(f"Mode{e}" for e in range(spec.enumerations))
+        return types
+
+    def generate(self, directory):
+        """
+        Write the model.
+
+        :param directory: Output directory.
+        :return: Path of the FIDL file.
+        """
+        spec = self.spec
+        out = ["package bench.scaling\n\n",
+               "typeCollection Types {\n"
+               "    version { major 1 minor 0 }\n"
+               "    struct Nest0 {\n"
+               "        UInt32 id\n"
+               "        String tag\n"
+               "    }\n"]
+        for d in range(1, spec.depth + 1):
+            out.append(f"    struct Nest{d} {{\n"
+                       f"        Nest{d - 1} inner\n"
+                       f"        UInt16 level\n"
+                       f"    }}\n")
+        if spec.arrays == "explicit":
+            out.append("    array Ints of Int32\n")
+            if spec.struct_arrays:
+                out.append(f"    array Nest{spec.depth}List of Nest{spec.depth}\n")
+        for e in range(spec.enumerations):
+            out.append(f"    enumeration Mode{e} {{\n"
+                       f"        OFF = 0\n"
+                       f"        ON = 1\n"
+                       f"    }}\n")
+        for m in range(spec.maps):
+            out.append(f"    map Table{m} {{\n"
+                       f"        UInt32 to Nest0\n"
+                       f"    }}\n")
+        out.append("}\n\n")
+        types = self.member_types()
+        for i in range(spec.interfaces):
+            out.append(f"interface Service{i} {{\n"
+                       f"    version {{ major 1 minor 0 }}\n")
+            for k in range(spec.members):
+                first = types[k % len(types)]
+                second = types[(k + 1) % len(types)]
+                out.append(f"    attribute {first} value{k}\n"
+                           f"    method call{k} {{\n"
+                           f"        in {{ {first} arg Int32 idx }}\n"
+                           f"        out {{ {second} result }}\n"
+                           f"    }}\n"
+                           f"    broadcast event{k} {{\n"
+                           f"        out {{ {first} data }}\n"
+                           f"    }}\n")
+            out.append("}\n\n")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "Scaling.fidl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(out))
+        return path
+
+
+def scaling_specs(scale):
+    """
+    :return: List of (model name, dimension, value, ScalingSpec) of the scaling suite.
+    """
+    base = SCALING_BASE._replace(interfaces=max(1, int(SCALING_BASE.interfaces * scale)),
+                                 members=max(1, int(SCALING_BASE.members * scale)))
+    specs = []
+    for dimension, values in SCALING.items():
+        for value in values:
+            if dimension in ("interfaces", "members"):
+                value = max(1, int(value * scale))
+            specs.append((f"scaling_{dimension}_{value}", dimension, value, base._replace(**{dimension: value})))
+    return specs
+
+
+############################################ Measurement ############################################################################
+
+def load_packages(files):
+    processor = Processor()
+    for path in files:
+        processor.import_file(path)
+    fidl.annotate_types(processor.packages)
+    return processor.packages
+
+
+def run_stage(stage, packages, output_dir, jobs, stream=False):
+    # The emitters print their errors, keep the benchmark output readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        if stage == "convert_to_aidl":
+            fidl.convert_to_aidl(packages, JAVA_PACKAGE, output_dir, jobs=jobs, stream=stream)
+        elif stage == "convert_to_src_client":
+            fidl.convert_to_src_client(packages, JNI_VERSION, JAVA_PACKAGE, output_dir, jobs=jobs, stream=stream)
+        else:
+            fidl.convert_to_aidl_and_src_client(packages, JNI_VERSION, JAVA_PACKAGE, output_dir, jobs=jobs, stream=stream)
+
+
+def output_size(directory):
+    files = 0
+    size = 0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            files += 1
+            size += os.path.getsize(os.path.join(root, name))
+    return files, size
+
+
+def peak_memory(stage, files, directory, jobs=1, stream=False):
+    """
+    Peak Python memory of one run of a stage, in bytes. tracemalloc slows
+    the run down, so it is not timed. Worker processes of jobs > 1 are not
+    traced.
+    """
+    packages = load_packages(files)
+    shutil.rmtree(directory, ignore_errors=True)
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        run_stage(stage, packages, directory, jobs, stream)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def measure(stage, files, repeat, directory, jobs=1, memory=True, stream=False):
+    """
+    Time a stage on freshly parsed models, parsing is not timed.
+
+    :return: Dictionary of the measurements.
+    """
+    times = []
+    for _ in range(repeat):
+        packages = load_packages(files)
+        shutil.rmtree(directory, ignore_errors=True)
+        start = time.perf_counter()
+        run_stage(stage, packages, directory, jobs, stream)
+        times.append(time.perf_counter() - start)
+    result = {
+        "seconds_min": min(times),
+        "seconds_median": statistics.median(times),
+        "peak_memory_bytes": peak_memory(stage, files, directory, jobs, stream) if memory else None,
+    }
+    output_files, output_bytes = output_size(directory)
+    result["output_files"] = output_files
+    result["output_bytes"] = output_bytes
+    return result
+
+
+############################################ Golden files ###########################################################################
+
+def normalized(path):
+    with open(path, "rb") as f:
+        return ADDRESS_RE.sub(b"0x0", f.read())
+
+
+def check_golden(name, output_dir, golden_dir):
+    """
+    Keep the output of a model as golden files, or compare it with them.
+
+    :return: List of the differing files, empty if the output is identical.
+    """
+    golden = os.path.join(golden_dir, name)
+    if not os.path.isdir(golden):
+        shutil.copytree(output_dir, golden)
+        print(f"{name:<28} golden files written to {golden}")
+        return []
+    differences = []
+    comparison = filecmp.dircmp(golden, output_dir)
+    stack = [("", comparison)]
+    while stack:
+        prefix, current = stack.pop()
+        differences.extend(os.path.join(prefix, f) for f in current.left_only + current.right_only)
+        for file_name in current.common_files:
+            if normalized(os.path.join(current.left, file_name)) != normalized(os.path.join(current.right, file_name)):
+                differences.append(os.path.join(prefix, file_name))
+        stack.extend((os.path.join(prefix, d), sub) for d, sub in current.subdirs.items())
+    if differences:
+        print(f"{name:<28} output differs from {golden}: {', '.join(sorted(differences)[:10])}")
+    else:
+        print(f"{name:<28} output identical to {golden}")
+    return differences
+
+
+def run_model(name, files, directory, args, info):
+    results = []
+    output_dir = os.path.join(directory, "out", name)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    for stage in args.stages:
+        stage_dir = os.path.join(directory, "stage", name, stage)
+        result = {"model": name, "stage": stage, "jobs": args.jobs, "stream": args.stream,
+                  "suite": info["suite"], "dimension": info.get("dimension"), "value": info.get("value")}
+        result.update(measure(stage, files, args.repeat, stage_dir, args.jobs, args.memory, args.stream))
+        results.append(result)
+        memory = result["peak_memory_bytes"]
+        memory = f"{memory / 1024 / 1024:10.1f} MiB" if memory is not None else ""
+        print(f"{name:<28} {stage:<30} {result['seconds_min'] * 1000:10.1f} ms "
+              f"{result['output_bytes'] / 1024:12.1f} KiB {memory}")
+        shutil.copytree(stage_dir, output_dir, dirs_exist_ok=True)
+    differences = check_golden(name, output_dir, args.golden) if args.golden else []
+    model = dict(info)
+    model.update({
+        "model": name,
+        "files": [os.path.basename(path) for path in files],
+        "bytes": sum(os.path.getsize(path) for path in files),
+    })
+    return model, results, differences
+
+
+def compare(results, baseline_file):
+    """
+    Print time ratios against the results of a previous run.
+    """
+    with open(baseline_file, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = dict(((r["model"], r["stage"]), r) for r in baseline["results"])
+    print(f"\nCompared with {baseline_file} (new / old):")
+    for result in results:
+        old = previous.get((result["model"], result["stage"]))
+        if old is None:
+            continue
+        time_ratio = result["seconds_min"] / old["seconds_min"] if old["seconds_min"] else float("nan")
+        line = f"{result['model']:<28} {result['stage']:<30} time x{time_ratio:6.2f}"
+        if result.get("peak_memory_bytes") and old.get("peak_memory_bytes"):
+            line += f"  memory x{result['peak_memory_bytes'] / old['peak_memory_bytes']:6.2f}"
+        if old.get("output_bytes"):
+            line += f"  output x{result['output_bytes'] / old['output_bytes']:6.2f}"
+        print(line)
+
+
+def parse_command_line():
+    parser = argparse.ArgumentParser(description="FIDL code generation benchmark.")
+    parser.add_argument(
+        "-o", "--output", dest="output", action="store", default="codegen_benchmark.json", help="JSON result file."
+    )
+    parser.add_argument(
+        "--suite", dest="suite", action="store", choices=SUITES, default="standard",
+        help="Synthetic model suite: the standard models, the scaling models or both."
+    )
+    parser.add_argument(
+        "-m", "--model", dest="models", metavar="model", action="append",
+        help="Synthetic model of the suite to run, may be repeated. All models of the suite by default."
+    )
+    parser.add_argument(
+        "-f", "--fidl", dest="fidl", metavar="fidl", action="append",
+        help="FIDL file to measure instead of the synthetic models, may be repeated."
+    )
+    parser.add_argument(
+        "--stage", dest="stages", metavar="stage", action="append", choices=STAGES,
+        help="Stage to measure, may be repeated. All stages by default."
+    )
+    parser.add_argument(
+        "-r", "--repeat", dest="repeat", action="store", type=int, default=3, help="Timed runs per measurement."
+    )
+    parser.add_argument(
+        "-j", "--jobs", dest="jobs", action="store", type=int, default=1,
+        help="Generation processes, 0 for one per CPU."
+    )
+    parser.add_argument(
+        "--stream", dest="stream", action="store_true",
+        help="Write the files of every interface as soon as they are generated."
+    )
+    parser.add_argument(
+        "--scale", dest="scale", action="store", type=float, default=1.0, help="Multiplier for the member groups."
+    )
+    parser.add_argument(
+        "--no-memory", dest="memory", action="store_false", help="Do not measure the peak memory."
+    )
+    parser.add_argument(
+        "--golden", dest="golden", action="store",
+        help="Golden file directory, written on the first run and compared with on later runs."
+    )
+    parser.add_argument(
+        "--workdir", dest="workdir", action="store", help="Keep the models and the generated files in this directory."
+    )
+    parser.add_argument(
+        "--compare", dest="compare", action="store", help="JSON result file of a previous run to compare with."
+    )
+    args = parser.parse_args()
+    if not args.stages:
+        args.stages = list(STAGES)
+    return args
+
+
+def main():
+    args = parse_command_line()
+    directory = args.workdir if args.workdir else tempfile.mkdtemp(prefix="codegen_benchmark_")
+    models = []
+    results = []
+    differences = []
+    try:
+        if args.fidl:
+            runs = [(os.path.splitext(os.path.basename(args.fidl[0]))[0], [os.path.abspath(f) for f in args.fidl],
+                     {"suite": "fidl"})]
+        else:
+            runs = []
+            if args.suite in ("standard", "all"):
+                for name, groups in MODELS.items():
+                    members = max(1, int(groups * args.scale))
+                    runs.append((name, lambda path, members=members: ModelGenerator(members).generate(path),
+                                 {"suite": "standard", "members": members}))
+            if args.suite in ("scaling", "all"):
+                for name, dimension, value, spec in scaling_specs(args.scale):
+                    runs.append((name, lambda path, spec=spec: ScalingModelGenerator(spec).generate(path),
+                                 {"suite": "scaling", "dimension": dimension, "value": value, "spec": spec._asdict()}))
+            if args.models:
+                unknown = sorted(set(args.models) - set(name for name, _, _ in runs))
+                if unknown:
+                    sys.exit(f"Unknown model of the {args.suite} suite: {', '.join(unknown)}")
+                runs = [run for run in runs if run[0] in args.models]
+            runs = [(name, [generate(os.path.join(directory, "models", name))], info) for name, generate, info in runs]
+        for name, files, info in runs:
+            model, model_results, model_differences = run_model(name, files, directory, args, info)
+            models.append(model)
+            results.extend(model_results)
+            differences.extend(model_differences)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(directory, ignore_errors=True)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "suite": args.suite,
+            "scale": args.scale,
+            "repeat": args.repeat,
+            "hash_seed": os.environ.get("PYTHONHASHSEED"),
+        },
+        "models": models,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+    if differences:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
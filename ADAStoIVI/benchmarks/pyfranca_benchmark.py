@@ -0,0 +1,395 @@
+"""
+pyfranca parse and resolve benchmark.
+
+Generates a deterministic synthetic FIDL corpus for each scenario and
+measures franca_lexer tokenize_data, Parser.parse and Processor.import_file
+separately, for time and peak memory. Results are written as JSON, which can
+be compared with the results of another version using --compare.
+
+    python benchmarks/pyfranca_benchmark.py -o before.json
+    python benchmarks/pyfranca_benchmark.py -o after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pyfranca
+from pyfranca import franca_lexer, franca_parser, franca_processor
+
+try:
+    from pyfranca import franca_fastparser
+except ImportError:
+    # Versions without the fast engine.
+    franca_fastparser = None
+
+
+PRIMITIVE_TYPES = ["Int8", "Int16", "Int32", "Int64", "UInt8", "UInt16", "UInt32",
+                   "UInt64", "Boolean", "Float", "Double", "String", "ByteBuffer"]
+
+# Scenario name -> generator parameters. Each scenario varies one dimension
+#   of the default parameters.
+DEFAULT_PARAMS = {
+    "types": 100,           # Structs per type collection.
+    "interfaces": 1,        # Interfaces per file.
+    "members": 20,          # Attributes, methods and broadcasts per interface.
+    "enumerators": 10,      # Enumerators per enumeration.
+    "depth": 1,             # Import levels below the root file.
+    "fanout": 1,            # Files per import level.
+    "comments": 0.2,        # Share of elements with a structured comment.
+}
+
+SCENARIOS = {
+    "size_small": {"types": 25},
+    "size_medium": {"types": 200},
+    "size_large": {"types": 800, "members": 80},
+    "imports_deep": {"types": 20, "depth": 8},
+    "imports_wide": {"types": 20, "depth": 2, "fanout": 6},
+    "enumerations_large": {"types": 10, "enumerators": 2000},
+    "comments_none": {"types": 200, "comments": 0.0},
+    "comments_dense": {"types": 200, "comments": 1.0},
+}
+
+STAGES = ["tokenize_data", "Parser.parse", "Processor.import_file"]
+
+
+############################################ Corpus #################################################################################
+
+class CorpusGenerator(object):
+    """
+    Deterministic synthetic FIDL corpus generator.
+
+    The root file imports every file of the first level, every file of a
+        level imports every file of the next level. Struct fields and
+        interface members refer to local types by name and to types of
+        imported files by FQN.
+    """
+
+    def __init__(self, seed=0, **params):
+        self.params = dict(DEFAULT_PARAMS)
+        self.params.update(params)
+        self.random = random.Random(seed)
+
+    @staticmethod
+    def package_name(level, index):
+        return f"bench.l{level}.p{index}"
+
+    @staticmethod
+    def file_name(level, index):
+        return f"l{level}_p{index}.fidl"
+
+    def comment(self, name, indent):
+        if self.random.random() >= self.params["comments"]:
+            return ""
+        return (f"{indent}<** @description: Synthetic element {name} used to measure the parser.\n"
+                f"{indent}    @author: pyfranca benchmark **>\n")
+
+    def type_name(self, level, index, imported):
+        """
+        Pick a type for a field or an argument.
+        """
+        choice = self.random.random()
+        types = self.params["types"]
+        if imported and choice < 0.3:
+            # FQN reference into an imported file.
+            package = self.package_name(level + 1, self.random.randrange(self.params["fanout"]))
+            return f"{package}.Types.S{self.random.randrange(types)}"
+        elif choice < 0.6:
+            return PRIMITIVE_TYPES[self.random.randrange(len(PRIMITIVE_TYPES))]
+        elif choice < 0.7:
+            return f"A{self.random.randrange(types)}"
+        elif choice < 0.8:
+            return "E0"
+        elif index > 0:
+            # Only refer to structs defined before, no cycles.
+            return f"S{self.random.randrange(index)}"
+        return "UInt32"
+
+    def generate_file(self, level, index):
+        params = self.params
+        imported = level < params["depth"]
+        out = []
+        out.append(self.comment(f"package {level}.{index}", ""))
+        out.append(f"package {self.package_name(level, index)}\n\n")
+        if imported:
+            for child in range(params["fanout"]):
+                out.append(f"import {self.package_name(level + 1, child)}.Types.* "
+                           f"from \"{self.file_name(level + 1, child)}\"\n")
+            out.append("\n")
+
+        out.append("typeCollection Types {\n")
+        out.append("    version { major 1 minor 0 }\n\n")
+        out.append(self.comment("E0", "    "))
+        out.append("    enumeration E0 {\n")
+        for n in range(params["enumerators"]):
+            out.append(self.comment(f"E0.V{n}", "        "))
+            out.append(f"        V{n} = {n}\n")
+        out.append("    }\n\n")
+        for n in range(params["types"]):
+            out.append(self.comment(f"S{n}", "    "))
+            out.append(f"    struct S{n} {{\n")
+            for field in range(1 + n % 5):
+                out.append(self.comment(f"S{n}.f{field}", "        "))
+                out.append(f"        {self.type_name(level, n, imported)} f{field}\n")
+            out.append("    }\n")
+        for n in range(params["types"]):
+            out.append(self.comment(f"A{n}", "    "))
+            out.append(f"    array A{n} of {PRIMITIVE_TYPES[n % len(PRIMITIVE_TYPES)]}\n")
+        out.append(f"    map M0 {{ String to E0 }}\n")
+        out.append(f"    typedef T0 is UInt64\n")
+        out.append(f"    const UInt32 C0 = 0x{level:04X}\n")
+        out.append("}\n\n")
+
+        for n in range(params["interfaces"]):
+            out.append(self.comment(f"Service{n}", ""))
+            out.append(f"interface Service{n} {{\n")
+            out.append("    version { major 1 minor 0 }\n")
+            for member in range(params["members"]):
+                kind = member % 3
+                out.append(self.comment(f"Service{n}.m{member}", "    "))
+                if kind == 0:
+                    out.append(f"    attribute {self.type_name(level, params['types'], imported)} a{member} readonly\n")
+                elif kind == 1:
+                    out.append(f"    method m{member} {{\n"
+                               f"        in {{ {self.type_name(level, params['types'], imported)} x "
+                               f"{self.type_name(level, params['types'], imported)} y }}\n"
+                               f"        out {{ {self.type_name(level, params['types'], imported)} r }}\n"
+                               f"        error E0\n"
+                               f"    }}\n")
+                else:
+                    out.append(f"    broadcast b{member} {{\n"
+                               f"        out {{ {self.type_name(level, params['types'], imported)} v }}\n"
+                               f"    }}\n")
+            out.append("}\n\n")
+        return "".join(out)
+
+    def generate(self, directory):
+        """
+        Write the corpus.
+
+        :param directory: Output directory.
+        :return: Path of the root file.
+        """
+        os.makedirs(directory, exist_ok=True)
+        levels = [(0, 1)] + [(level, self.params["fanout"]) for level in range(1, self.params["depth"] + 1)]
+        for level, count in levels:
+            for index in range(count):
+                with open(os.path.join(directory, self.file_name(level, index)), "w", encoding="utf-8") as f:
+                    f.write(self.generate_file(level, index))
+        return os.path.join(directory, self.file_name(0, 0))
+
+
+############################################ Measurement ############################################################################
+
+def create_lexer(engine):
+    if engine == "fast":
+        return franca_fastparser.FastLexer()
+    return franca_lexer.Lexer()
+
+
+def create_parser(engine, comments):
+    if engine == "fast":
+        return franca_fastparser.FastParser(comments=comments)
+    return franca_parser.Parser(comments=comments)
+
+
+def create_processor(engine, comments, lazy):
+    kwargs = {}
+    if engine != "ply":
+        kwargs["engine"] = engine
+    if comments != "parse":
+        kwargs["comments"] = comments
+    if lazy:
+        kwargs["lazy"] = True
+    return franca_processor.Processor(**kwargs)
+
+
+def stage_function(stage, engine, texts, root, comments, lazy):
+    """
+    Build a function running one stage over the corpus.
+    """
+    if stage == "tokenize_data":
+        lexer = create_lexer(engine)
+        def run():
+            for text in texts:
+                lexer.tokenize_data(text)
+    elif stage == "Parser.parse":
+        parser = create_parser(engine, comments)
+        def run():
+            for text in texts:
+                parser.parse(text)
+    else:
+        def run():
+            create_processor(engine, comments, lazy).import_file(root)
+    return run
+
+
+def measure(run, repeat):
+    """
+    Time a function, then measure its peak memory in a separate run.
+
+    :return: Dictionary of the measurements.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds_min": min(times),
+        "seconds_median": statistics.median(times),
+        "peak_bytes": peak,
+    }
+
+
+def run_scenario(name, params, directory, args):
+    generator = CorpusGenerator(seed=args.seed, **params)
+    root = generator.generate(os.path.join(directory, name))
+    files = sorted(os.listdir(os.path.dirname(root)))
+    texts = []
+    for file_name in files:
+        with open(os.path.join(os.path.dirname(root), file_name), "r", encoding="utf-8") as f:
+            texts.append(f.read())
+    corpus = {
+        "files": len(texts),
+        "bytes": sum(len(text.encode("utf-8")) for text in texts),
+        "lines": sum(text.count("\n") for text in texts),
+        "tokens": len(create_lexer("ply").tokenize_data("\n".join(texts))),
+    }
+    results = []
+    for engine in args.engines:
+        for stage in args.stages:
+            run = stage_function(stage, engine, texts, root, args.comments, args.lazy)
+            result = {"scenario": name, "engine": engine, "stage": stage}
+            result.update(measure(run, args.repeat))
+            results.append(result)
+            print(f"{name:<20} {engine:<5} {stage:<22} "
+                  f"{result['seconds_min'] * 1000:10.1f} ms {result['peak_bytes'] / 1024:12.1f} KiB")
+    return {"scenario": name, "params": generator.params, "corpus": corpus}, results
+
+
+def compare(results, baseline_file):
+    """
+    Print time and memory ratios against the results of a previous run.
+    """
+    with open(baseline_file, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = dict(((r["scenario"], r["engine"], r["stage"]), r) for r in baseline["results"])
+    print(f"\nCompared with {baseline_file} (new / old):")
+    for result in results:
+        old = previous.get((result["scenario"], result["engine"], result["stage"]))
+        if old is None:
+            continue
+        time_ratio = result["seconds_min"] / old["seconds_min"] if old["seconds_min"] else float("nan")
+        peak_ratio = result["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else float("nan")
+        print(f"{result['scenario']:<20} {result['engine']:<5} {result['stage']:<22} "
+              f"time x{time_ratio:6.2f}   peak x{peak_ratio:6.2f}")
+
+
+def parse_command_line():
+    parser = argparse.ArgumentParser(description="pyfranca parse and resolve benchmark.")
+    parser.add_argument(
+        "-o", "--output", dest="output", action="store", default="pyfranca_benchmark.json", help="JSON result file."
+    )
+    parser.add_argument(
+        "-s", "--scenario", dest="scenarios", metavar="scenario", action="append", choices=sorted(SCENARIOS),
+        help="Scenario to run, may be repeated. All scenarios by default."
+    )
+    parser.add_argument(
+        "--stage", dest="stages", metavar="stage", action="append", choices=STAGES,
+        help="Stage to measure, may be repeated. All stages by default."
+    )
+    parser.add_argument(
+        "--engine", dest="engines", metavar="engine", action="append", choices=["ply", "fast"],
+        help="Parser engine, may be repeated. All available engines by default."
+    )
+    parser.add_argument(
+        "--comments", dest="comments", action="store", choices=["parse", "lazy", "drop"], default="parse",
+        help="Structured comment handling mode."
+    )
+    parser.add_argument(
+        "-L", "--lazy", dest="lazy", action="store_true", help="Resolve type references lazily."
+    )
+    parser.add_argument(
+        "-r", "--repeat", dest="repeat", action="store", type=int, default=3, help="Timed runs per measurement."
+    )
+    parser.add_argument(
+        "--scale", dest="scale", action="store", type=float, default=1.0, help="Multiplier for type and member counts."
+    )
+    parser.add_argument(
+        "--seed", dest="seed", action="store", type=int, default=0, help="Corpus generator seed."
+    )
+    parser.add_argument(
+        "--corpus", dest="corpus", action="store", help="Keep the generated corpus in this directory."
+    )
+    parser.add_argument(
+        "--compare", dest="compare", action="store", help="JSON result file of a previous run to compare with."
+    )
+    args = parser.parse_args()
+    if not args.scenarios:
+        args.scenarios = list(SCENARIOS)
+    if not args.stages:
+        args.stages = list(STAGES)
+    if not args.engines:
+        args.engines = ["ply", "fast"] if franca_fastparser else ["ply"]
+    if "fast" in args.engines and franca_fastparser is None:
+        parser.error("The fast engine is not available in this version of pyfranca.")
+    return args
+
+
+def main():
+    args = parse_command_line()
+    directory = args.corpus if args.corpus else tempfile.mkdtemp(prefix="pyfranca_benchmark_")
+    scenarios = []
+    results = []
+    try:
+        for name in args.scenarios:
+            params = dict(SCENARIOS[name])
+            for key in ("types", "members", "enumerators"):
+                if key in params or args.scale != 1.0:
+                    params[key] = max(1, int(params.get(key, DEFAULT_PARAMS[key]) * args.scale))
+            scenario, scenario_results = run_scenario(name, params, directory, args)
+            scenarios.append(scenario)
+            results.extend(scenario_results)
+    finally:
+        if not args.corpus:
+            shutil.rmtree(directory, ignore_errors=True)
+    report = {
+        "meta": {
+            "pyfranca": pyfranca.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "scale": args.scale,
+            "repeat": args.repeat,
+            "comments": args.comments,
+            "lazy": args.lazy,
+        },
+        "scenarios": scenarios,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Startup benchmark of the SDVGen entry points.
+
+Runs each case in a fresh interpreter with `python -X importtime`, records
+the wall time, the total import time and the slowest modules, and checks
+that a case does not import modules it must not need (e.g. tkinter or the
+FIDL generator for `sdvgen_cli.py --help`). The tree is byte-compiled
+first, so the cases measure imports from an up to date bytecode cache even
+with PYTHONDONTWRITEBYTECODE. Results are written as JSON, which can be
+compared with the results of another version using --compare.
+
+    python benchmarks/startup_benchmark.py -o before.json
+    python benchmarks/startup_benchmark.py -o after.json --compare before.json
+
+Exits with 1 if a case imported a forbidden module or failed.
+"""
+
+import argparse
+import compileall
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+ARXML = """<?xml version="1.0" encoding="UTF-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.0">
+<AR-PACKAGES><AR-PACKAGE><SHORT-NAME>startup</SHORT-NAME><ELEMENTS>
+<SERVICE-INTERFACE><SHORT-NAME>Startup</SHORT-NAME>
+ <NAMESPACES><SYMBOL-PROPS><SHORT-NAME>org</SHORT-NAME><SYMBOL>org</SYMBOL></SYMBOL-PROPS></NAMESPACES>
+ <METHODS><CLIENT-SERVER-OPERATION><SHORT-NAME>ping</SHORT-NAME><ARGUMENTS>
+  <ARGUMENT-DATA-PROTOTYPE><SHORT-NAME>a</SHORT-NAME><TYPE-TREF>/types/int32_t</TYPE-TREF><DIRECTION>IN</DIRECTION></ARGUMENT-DATA-PROTOTYPE>
+ </ARGUMENTS></CLIENT-SERVER-OPERATION></METHODS>
+</SERVICE-INTERFACE>
+<SOMEIP-SERVICE-INTERFACE-DEPLOYMENT><SHORT-NAME>Startup</SHORT-NAME>
+ <METHOD-DEPLOYMENTS><SOMEIP-METHOD-DEPLOYMENT><SHORT-NAME>ping</SHORT-NAME><METHOD-ID>1</METHOD-ID><TRANSPORT-PROTOCOL>TCP</TRANSPORT-PROTOCOL></SOMEIP-METHOD-DEPLOYMENT></METHOD-DEPLOYMENTS>
+ <SERVICE-INTERFACE-ID>4660</SERVICE-INTERFACE-ID>
+ <SERVICE-INTERFACE-VERSION><MAJOR-VERSION>1</MAJOR-VERSION><MINOR-VERSION>0</MINOR-VERSION></SERVICE-INTERFACE-VERSION>
+</SOMEIP-SERVICE-INTERFACE-DEPLOYMENT>
+<PROVIDED-SOMEIP-SERVICE-INSTANCE><SHORT-NAME>StartupInstance</SHORT-NAME><SERVICE-INTERFACE-DEPLOYMENT-REF>/startup/Startup</SERVICE-INTERFACE-DEPLOYMENT-REF><SERVICE-INSTANCE-ID>1</SERVICE-INSTANCE-ID></PROVIDED-SOMEIP-SERVICE-INSTANCE>
+</ELEMENTS></AR-PACKAGE></AR-PACKAGES></AUTOSAR>
+"""
+
+FIDL = """package org.example.startup
+
+interface Startup {
+    version { major 1 minor 0 }
+    attribute UInt32 counter
+    method ping {
+        in { Int32 a }
+        out { Int32 b }
+    }
+}
+"""
+
+# Case name -> (arguments of the interpreter, modules the case must not import).
+#   {dir} is the temporary directory with the inputs and outputs.
+HEADLESS = ["tkinter", "sdvgen_gui"]
+GENERATOR = ["fidl_module_converter", "pyfranca", "ply"]
+CASES = {
+    "cli_help": (["sdvgen_cli.py", "--help"], HEADLESS + GENERATOR + ["arxml_converter"]),
+    "sdvgen_cli_help": (["SDVGen.py", "-C", "--help"], HEADLESS + GENERATOR + ["arxml_converter"]),
+    "cli_arxml": (["sdvgen_cli.py", "arxml", "-O", "{dir}/arxml", "{dir}/Startup.arxml"], HEADLESS + GENERATOR),
+    "cli_fidl": (["sdvgen_cli.py", "fidl", "-J", "com.example.gen", "-O", "{dir}/fidl", "{dir}/Startup.fidl"], HEADLESS),
+    "import_fidl_module_converter": (["-c", "import fidl_module_converter"], HEADLESS),
+    "import_gui": (["-c", "import sdvgen_gui"], []),
+}
+
+
+def parse_importtime(stderr):
+    """
+    Parse the `-X importtime` lines of stderr.
+
+    :return: List of (module, self microseconds, cumulative microseconds).
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def run_case(name, directory, args):
+    argv, forbidden = CASES[name]
+    command = [sys.executable, "-X", "importtime"] + [arg.format(dir=directory) for arg in argv]
+    times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        process = subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                 universal_newlines=True)
+        times.append(time.perf_counter() - start)
+    modules = parse_importtime(process.stderr)
+    imported = set(module.split(".")[0] for module, _, _ in modules)
+    result = {
+        "case": name,
+        "returncode": process.returncode,
+        "seconds_min": min(times),
+        "seconds_median": statistics.median(times),
+        "import_seconds": sum(self_us for _, self_us, _ in modules) / 1e6,
+        "modules": len(modules),
+        "forbidden": sorted(module for module in forbidden if module in imported),
+        "slowest": [{"module": module, "self_us": self_us, "cumulative_us": cumulative_us}
+                    for module, self_us, cumulative_us in sorted(modules, key=lambda m: -m[1])[:args.top]],
+    }
+    status = "ok"
+    if process.returncode:
+        status = f"exit {process.returncode}"
+    if result["forbidden"]:
+        status = "imports " + ", ".join(result["forbidden"])
+    print(f"{name:<30} {result['seconds_min'] * 1000:8.1f} ms  imports {result['import_seconds'] * 1000:8.1f} ms "
+          f"{result['modules']:5d} modules  {status}")
+    return result
+
+
+def compare(results, baseline_file):
+    """
+    Print wall and import time ratios against the results of a previous run.
+    """
+    with open(baseline_file, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = dict((r["case"], r) for r in baseline["results"])
+    print(f"\nCompared with {baseline_file} (new / old):")
+    for result in results:
+        old = previous.get(result["case"])
+        if old is None:
+            continue
+        time_ratio = result["seconds_min"] / old["seconds_min"] if old["seconds_min"] else float("nan")
+        import_ratio = result["import_seconds"] / old["import_seconds"] if old["import_seconds"] else float("nan")
+        print(f"{result['case']:<30} time x{time_ratio:6.2f}   imports x{import_ratio:6.2f}   "
+              f"modules {old['modules']} -> {result['modules']}")
+
+
+def parse_command_line():
+    parser = argparse.ArgumentParser(description="Startup benchmark of the SDVGen entry points.")
+    parser.add_argument(
+        "-o", "--output", dest="output", action="store", default="startup_benchmark.json", help="JSON result file."
+    )
+    parser.add_argument(
+        "-c", "--case", dest="cases", metavar="case", action="append", choices=sorted(CASES),
+        help="Case to run, may be repeated. All cases by default."
+    )
+    parser.add_argument(
+        "-r", "--repeat", dest="repeat", action="store", type=int, default=5, help="Timed runs per case."
+    )
+    parser.add_argument(
+        "--top", dest="top", action="store", type=int, default=10, help="Slowest modules recorded per case."
+    )
+    parser.add_argument(
+        "--compare", dest="compare", action="store", help="JSON result file of a previous run to compare with."
+    )
+    args = parser.parse_args()
+    if not args.cases:
+        args.cases = list(CASES)
+    return args
+
+
+def main():
+    args = parse_command_line()
+    compileall.compile_dir(ROOT, quiet=1)
+    directory = tempfile.mkdtemp(prefix="startup_benchmark_")
+    results = []
+    try:
+        with open(os.path.join(directory, "Startup.arxml"), "w", encoding="utf-8") as f:
+            f.write(ARXML)
+        with open(os.path.join(directory, "Startup.fidl"), "w", encoding="utf-8") as f:
+            f.write(FIDL)
+        for name in args.cases:
+            results.append(run_case(name, directory, args))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+    # import_gui fails where tkinter is not installed
+    failed = [r["case"] for r in results if r["forbidden"] or (r["returncode"] and r["case"] != "import_gui")]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+################################################################
+#            Shared output helpers of the converters           #
+################################################################
+# 생성기를 import하지 않고 쓸 수 있는 부분. sdvgen_cli의 --help와 arxml 명령은 fidl_module_converter 대신 이것만 import함
+
+import os
+
+# fidl_module_converter가 지원하는 JNI 버전
+JNI_VERSIONS = ['JNI_VERSION_1_1','JNI_VERSION_1_2','JNI_VERSION_1_4','JNI_VERSION_1_6','JNI_VERSION_1_8','JNI_VERSION_9','JNI_VERSION_10','JNI_VERSION_19','JNI_VERSION_20','JNI_VERSION_21']
+
+# --incremental의 manifest, 출력 디렉토리에 생성됨
+MANIFEST_FILE = ".fidl_manifest.json"
+
+class CodeBuffer(object):
+    """
+    List-joined output buffer.
+
+    `+=` and write() append a piece, the pieces are joined only once by
+        getvalue() or written as they are by write_to().
+    """
+    __slots__ = ("parts",)
+
+    def __init__(self, text=""):
+        self.parts = [text] if text else []
+
+    def __iadd__(self, text):
+        self.parts.append(text)
+        return self
+
+    def write(self, text):
+        self.parts.append(text)
+
+    def __len__(self):
+        return sum(len(part) for part in self.parts)
+
+    def getvalue(self):
+        if(len(self.parts) > 1):
+            self.parts = ["".join(self.parts)]
+        return self.parts[0] if self.parts else ""
+
+    def write_to(self, stream):
+        stream.writelines(self.parts)
+
+def write_output_file(path, text):
+    """
+    Write text to path, unless the file already has this content.
+
+    An unchanged output keeps its modification time, so the Android build
+        does not compile it again. Missing directories of path are created.
+
+    :param text: str or CodeBuffer.
+    :return: True if the file was written.
+    """
+    if(isinstance(text, CodeBuffer)):
+        text = text.getvalue()
+    try:
+        with open(path, "r") as f:
+            if(f.read() == text):
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    try:
+        f = open(path, "w")
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        f = open(path, "w")
+    with f:
+        f.write(text)
+    return True
@@ -4,13 +4,14 @@
 #                  with FIDL to AIDL translator                #
 ################################################################
 
-import argparse, os, sys
-from collections import OrderedDict
+import copy, os, sys
+import functools, hashlib, inspect, json, keyword, re, time
+from collections import ChainMap, OrderedDict, namedtuple
 import io
-import re
 
 from pyfranca import Processor, LexerException, ParserException, \
     ProcessorException, ast
+from converter_common import JNI_VERSIONS, MANIFEST_FILE, CodeBuffer, write_output_file
 
 def capitalize_first_letter(input_string):
     return input_string[0].upper() + input_string[1:]
@@ -18,6 +19,933 @@ def capitalize_first_letter(input_string):
 def lower_first_letter(input_string):
     return input_string[0].lower() + input_string[1:]
 
+############################### Code templates ################################
+# 생성 코드의 고정된 부분은 실행마다 한 번만 컴파일하고, 출력은 리스트 버퍼로 모아서 한 번에 join 함
+class CodeTemplate(object):
+    """
+    Code template compiled once into literal and field segments.
+
+    Templates use the str.format syntax with plain field names only, "{{"
+        and "}}" are literal braces. The segments are compiled into the
+        function render(**values), which returns the text as fast as the
+        f-string it replaces, render_to() appends the text to a CodeBuffer.
+        Values of fields the template does not use are ignored.
+    """
+    __slots__ = ("source", "literals", "fields", "render")
+
+    _formatter = None
+
+    def __init__(self, source):
+        if(CodeTemplate._formatter is None):
+            import string
+            CodeTemplate._formatter = string.Formatter()
+        self.source = source
+        self.literals = []
+        self.fields = []
+        # Escaped braces end a literal chunk without a field, those chunks are merged.
+        pending = []
+        for literal, field, spec, conversion in CodeTemplate._formatter.parse(source):
+            pending.append(literal)
+            if(field is None):
+                continue
+            if(spec or conversion or not field.isidentifier() or keyword.iskeyword(field) or field == "unused"):
+                raise ValueError("Unsupported template field: {{{}}}".format(field))
+            self.literals.append("".join(pending))
+            self.fields.append(field)
+            pending = []
+        self.literals.append("".join(pending))
+        self.render = self._compile()
+
+    def _compile(self):
+        # render(*, field, ..., **unused): the adjacent literals and f-strings of
+        #   the return expression are joined by the compiler into one string build
+        parts = []
+        for index, field in enumerate(self.fields):
+            if(self.literals[index]):
+                parts.append(repr(self.literals[index]))
+            parts.append("f'{{{}}}'".format(field))
+        if(self.literals[-1] or not parts):
+            parts.append(repr(self.literals[-1]))
+        parameters = list(OrderedDict.fromkeys(self.fields)) + ["**unused"]
+        if(self.fields):
+            parameters.insert(0, "*")
+        source = "def render({}):\n    return {}\n".format(", ".join(parameters), " ".join(parts))
+        namespace = {}
+        exec(compile(source, "<code template>", "exec"), namespace)
+        return namespace["render"]
+
+    def render_to(self, out, values):
+        out.write(self.render(**values))
+
+
+code_templates = {}
+
+def code_template(source):
+    """
+    Return the compiled template of source, compiling it on first use.
+    """
+    template = code_templates.get(source)
+    if(template is None):
+        template = code_templates[source] = CodeTemplate(source)
+    return template
+
+def indent_lines(text, prefix="\t"):
+    """
+    Prefix every line of text, same as joining the prefixed split('\\n')
+        lines but in one pass.
+    """
+    return prefix + text.replace("\n", "\n" + prefix)
+
+############################### Profiling ###############################
+# --profile: 인터페이스와 attribute/method/broadcast 단위로 생성 시간, 재귀 깊이, 출력 크기를 기록
+RECURSIVE_EMITTERS = ("struct_fields_sub_gen", "struct_fields_set_gen", "complex_array")
+
+generation_profile = None
+
+class ProfileRecord(object):
+    """
+    Generation cost of an interface or of one of its members.
+
+    seconds and bytes include everything generated for it, by all
+        backends. depth is the deepest nesting of each recursive emitter.
+        Members converted by the shared conversion functions record the
+        nesting of the functions they call, see profile_conversion.
+
+    The shared conversion functions of a namespace are recorded as its
+        member of kind "conversions", which also counts for the namespace.
+    """
+
+    __slots__ = ("name", "kind", "seconds", "bytes", "calls", "depth", "members", "parent")
+
+    def __init__(self, name, kind, parent=None):
+        self.name = name
+        self.kind = kind
+        self.seconds = 0.0
+        self.bytes = 0
+        self.calls = 0
+        self.depth = dict.fromkeys(RECURSIVE_EMITTERS, 0)
+        self.members = OrderedDict() if kind in ("interface", "typecollection") else None
+        self.parent = parent
+
+    def to_dict(self):
+        record = OrderedDict([("name", self.name), ("kind", self.kind), ("seconds", self.seconds),
+                              ("bytes", self.bytes), ("calls", self.calls), ("depth", dict(self.depth))])
+        if(self.members is not None):
+            record["members"] = [member.to_dict() for member in self.members.values()]
+        return record
+
+class GenerationProfile(object):
+    """
+    Profile of the emitters decorated with profiled and profiled_recursion.
+
+    Members are recorded under the interface being generated. Inherited
+        members are generated once, see inherited_members, so they count for
+        the first derived interface generated.
+    """
+
+    def __init__(self):
+        self.interfaces = OrderedDict()
+        self.stack = []
+        self.active = dict.fromkeys(RECURSIVE_EMITTERS, 0)
+        self.probes = []
+
+    def interface(self, interface):
+        name = qualified_name(interface)
+        record = self.interfaces.get(name)
+        if(record is None):
+            kind = "interface" if isinstance(interface, ast.Interface) else "typecollection"
+            record = self.interfaces[name] = ProfileRecord(name, kind)
+        return record
+
+    def enter(self, level, node):
+        if(level == "interface"):
+            record = self.interface(node)
+        elif(level == "conversions"):
+            parent = self.interface(node)
+            record = parent.members.get(("conversions", node.name))
+            if(record is None):
+                record = parent.members[("conversions", node.name)] = ProfileRecord(node.name + "Conversions", "conversions", parent)
+        else:
+            parent = None
+            for item in reversed(self.stack):
+                if(item.kind == "interface"):
+                    parent = item
+                    break
+            if(parent is None):
+                parent = self.interface(node.namespace)
+            kind = type(node).__name__.lower()
+            record = parent.members.get((kind, node.name))
+            if(record is None):
+                record = parent.members[(kind, node.name)] = ProfileRecord(node.name, kind)
+        record.calls += 1
+        self.stack.append(record)
+        return record
+
+    def leave(self, record, seconds):
+        self.stack.pop()
+        record.seconds += seconds
+        if(record.parent is not None):
+            record.parent.seconds += seconds
+
+    def emitted(self, record, size):
+        record.bytes += size
+        if(record.parent is not None):
+            record.parent.bytes += size
+
+    def reach(self, emitter, depth):
+        """
+        Record that the recursive emitter is nested depth deep.
+        """
+        for record in self.stack:
+            if(record.depth[emitter] < depth):
+                record.depth[emitter] = depth
+        for probe in self.probes:
+            if(probe[emitter] < depth):
+                probe[emitter] = depth
+
+    def measure(self, function, args):
+        """
+        Call function(*args).
+
+        :return: The result and the nesting of each recursive emitter the
+            call reached below the current one, for replay.
+        """
+        start = dict(self.active)
+        probe = dict(start)
+        self.probes.append(probe)
+        try:
+            result = function(*args)
+        finally:
+            self.probes.remove(probe)
+        return result, dict((emitter, probe[emitter] - start[emitter]) for emitter in RECURSIVE_EMITTERS if probe[emitter] > start[emitter])
+
+    def replay(self, nesting):
+        """
+        Record the nesting measured for a call that is not made again.
+        """
+        for emitter, levels in nesting.items():
+            self.reach(emitter, self.active[emitter] + levels)
+
+    def to_dict(self):
+        return OrderedDict([
+            ("seconds", sum(record.seconds for record in self.interfaces.values())),
+            ("bytes", sum(record.bytes for record in self.interfaces.values())),
+            ("interfaces", [record.to_dict() for record in self.interfaces.values()]),
+        ])
+
+    def summary(self, top=10):
+        """
+        Human readable top-N tables of the interfaces and members. depth
+            is given as struct_fields_sub_gen/struct_fields_set_gen/complex_array.
+        """
+        members = [(interface, member) for interface in self.interfaces.values() for member in interface.members.values()]
+        def row(name, record):
+            depth = "/".join("{}".format(record.depth[emitter]) for emitter in RECURSIVE_EMITTERS)
+            return "{:<50} {:>10.1f} ms {:>10.1f} KiB {:>9}".format(name, record.seconds * 1000, record.bytes / 1024, depth)
+        lines = []
+        tables = [
+            ("Slowest interfaces", [(record.name, record) for record in self.interfaces.values()], lambda record: record.seconds),
+            ("Slowest members", [("{}.{}".format(i.name, m.name), m) for i, m in members], lambda record: record.seconds),
+            ("Largest members", [("{}.{}".format(i.name, m.name), m) for i, m in members], lambda record: record.bytes),
+            ("Deepest members", [("{}.{}".format(i.name, m.name), m) for i, m in members], lambda record: max(record.depth.values())),
+        ]
+        for title, records, key in tables:
+            lines.append("{:<50} {:>13} {:>14} {:>9}".format(title, "time", "emitted", "depth"))
+            for name, record in sorted(records, key=lambda item: key(item[1]), reverse=True)[:top]:
+                lines.append(row(name, record))
+        return "\n".join(lines)
+
+def start_profile():
+    global generation_profile
+    generation_profile = GenerationProfile()
+    return generation_profile
+
+def stop_profile():
+    global generation_profile
+    profile = generation_profile
+    generation_profile = None
+    return profile
+
+def emitted_bytes(result):
+    if(isinstance(result, str)):
+        return len(result.encode("utf-8"))
+    if(isinstance(result, CodeBuffer)):
+        return emitted_bytes(result.getvalue())
+    if(isinstance(result, dict)):
+        return sum(emitted_bytes(value) for value in result.values())
+    if(isinstance(result, (list, tuple))):
+        return sum(emitted_bytes(value) for value in result)
+    return 0
+
+def profiled(level):
+    """
+    Record the calls of an emitter in generation_profile, if profiling.
+
+    :param level: "interface", "member" or "conversions", recorded for the
+        first argument of the emitter, an ast.Interface, an Attribute,
+        Method or Broadcast, or the namespace of shared conversion functions.
+    """
+    def decorator(function):
+        parameter = function.__code__.co_varnames[0]
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profile = generation_profile
+            if(profile is None):
+                return function(*args, **kwargs)
+            record = profile.enter(level, args[0] if args else kwargs[parameter])
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                profile.leave(record, time.perf_counter() - start)
+            profile.emitted(record, emitted_bytes(result))
+            return result
+        return wrapper
+    return decorator
+
+def profiled_recursion(function):
+    """
+    Record the nesting depth of a recursive emitter in generation_profile, if profiling.
+    """
+    name = function.__name__
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        profile = generation_profile
+        if(profile is None):
+            return function(*args, **kwargs)
+        profile.active[name] += 1
+        try:
+            profile.reach(name, profile.active[name])
+            return function(*args, **kwargs)
+        finally:
+            profile.active[name] -= 1
+    return wrapper
+
+############################### Conversion snippets ###############################
+# 중첩 struct/array 변환 코드는 (type, 방향, context) 마다 한 번만 생성함.
+#   이름 접두사(field_name_extends 등)는 placeholder로 생성하고, 결과는 접두사를 매개변수로 하는 SnippetTemplate으로 저장함
+conversion_snippets = {}
+
+SNIPPET_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+# Placeholder of a prefix parameter: a cased letter, so that capitalize_first_letter
+#   and lower_first_letter on it select the case of the name, and a private use
+#   terminator, which FIDL identifiers cannot contain.
+SNIPPET_END = "\ue000"
+SNIPPET_SLOT = re.compile("([ωΩ])(\\d+)" + SNIPPET_END)
+
+def snippet_placeholder(index, upper):
+    return ("Ω" if upper else "ω") + f"{index}" + SNIPPET_END
+
+class SnippetTemplate(object):
+    """
+    Cached emitter output with its prefix parameters as slots.
+
+    The text is split once at the placeholders, render() joins the literal
+        segments with the names, in the case each slot was generated in.
+
+    :param slot: Pattern of the placeholders, with the letter and the index as groups.
+    """
+    __slots__ = ("literals", "slots")
+
+    def __init__(self, text, slot=SNIPPET_SLOT):
+        parts = slot.split(text)
+        self.literals = parts[0::3]
+        self.slots = [(int(index), case.isupper()) for case, index in zip(parts[1::3], parts[2::3])]
+
+    def render(self, names):
+        if(not self.slots):
+            return self.literals[0]
+        out = [self.literals[0]]
+        for (index, upper), literal in zip(self.slots, self.literals[1:]):
+            out.append(names[index][upper])
+            out.append(literal)
+        return "".join(out)
+
+def compile_snippet(result):
+    if(isinstance(result, tuple)):
+        return tuple(compile_snippet(value) for value in result)
+    return SnippetTemplate(result)
+
+def render_snippet(template, names):
+    if(isinstance(template, tuple)):
+        return tuple(render_snippet(value, names) for value in template)
+    return template.render(names)
+
+def clear_conversion_snippets():
+    conversion_snippets.clear()
+
+def snippet_key(value):
+    if(value.__class__ in SNIPPET_SCALARS):
+        return value
+    if(isinstance(value, ast.Namespace) or isinstance(getattr(value, "namespace", None), ast.Namespace)):
+        return (id(value), qualified_name(value))
+    return id(value)
+
+def memoized_snippet(*prefixes):
+    """
+    Reuse the code an emitter generated for the same element and context.
+
+    The emitter is called once per key: its name, the identity of the
+    element, interface and model arguments, with the qualified name of the
+    AST nodes among them, the scalar arguments and, for the name prefix
+    parameters, only whether they are empty and the case of their first
+    letter. Non-empty prefixes are passed as placeholders and the output is
+    cached as a SnippetTemplate with the prefixes as parameters, so a nested
+    struct reached under many attribute names is generated once. The cache
+    keeps its elements alive and is cleared by annotate_types. AST nodes
+    must not be renamed while it is used, names reached through them are
+    not part of the key, see inherited_namespace.
+
+    Put it outside profiled_recursion: the nesting the recursive emitters
+    reached is cached with the output and recorded again for every hit.
+
+    :param prefixes: names of the str parameters that are only concatenated
+        into identifiers, never inspected.
+    """
+    def decorator(function):
+        emitter = inspect.unwrap(function)
+        parameters = emitter.__code__.co_varnames[:emitter.__code__.co_argcount]
+        defaults = dict(zip(reversed(parameters), reversed(emitter.__defaults__ or ())))
+        positions = [parameters.index(prefix) for prefix in prefixes]
+        placeholders = {index: (snippet_placeholder(index, False), snippet_placeholder(index, True)) for index in positions}
+        name = function.__name__
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            values = list(args)
+            if(len(values) < len(parameters)):
+                values += [kwargs[parameter] if parameter in kwargs else defaults[parameter] for parameter in parameters[len(values):]]
+            names = {}
+            for index in positions:
+                value = values[index]
+                if(value != ""):
+                    if(value[0].islower() == value[0].isupper() or SNIPPET_END in value):
+                        return function(*values)
+                    names[index] = (lower_first_letter(value), capitalize_first_letter(value))
+                    values[index] = placeholders[index][value[0].isupper()]
+            key = (name, tuple(map(type, values)), *[snippet_key(value) for value in values])
+            entry = conversion_snippets.get(key)
+            profile = generation_profile
+            if(entry is None or (profile is not None and entry[2] is None)):
+                if(profile is None):
+                    result, nesting = function(*values), None
+                else:
+                    result, nesting = profile.measure(function, values)
+                entry = conversion_snippets[key] = (compile_snippet(result) if names else result, values, nesting)
+            elif(profile is not None):
+                profile.replay(entry[2])
+            if(names):
+                return render_snippet(entry[0], names)
+            return entry[0]
+        return wrapper
+    return decorator
+
+############################### Parallel generation ###############################
+# 인터페이스 단위 코드 생성을 프로세스 풀에서 실행함. fork로 모델을 물려받으므로 AST는 pickle 하지 않고 결과 문자열만 돌려받음
+interface_jobs = None
+
+def run_interface_job(index):
+    function, tasks = interface_jobs
+    return function(*tasks[index])
+
+def iter_interface_jobs(function, tasks, jobs=1):
+    """
+    Run function(*task) for every task, yield the results in task order,
+        each as soon as it and the results before it are done.
+
+    With jobs > 1 the tasks run in a pool of forked processes, which
+        inherit the models, only the results are sent back. jobs 0 uses
+        one process per CPU. Where fork is not available, or when
+        profiling, the tasks run serially, each when its result is asked for.
+    """
+    global interface_jobs
+    import multiprocessing
+    if(jobs == 0):
+        jobs = os.cpu_count() or 1
+    if(jobs <= 1 or len(tasks) <= 1 or generation_profile is not None or "fork" not in multiprocessing.get_all_start_methods()):
+        for task in tasks:
+            yield function(*task)
+        return
+    interface_jobs = (function, tasks)
+    sys.stdout.flush()
+    try:
+        with multiprocessing.get_context("fork").Pool(min(jobs, len(tasks))) as pool:
+            for result in pool.imap(run_interface_job, range(len(tasks)), chunksize=1):
+                yield result
+    finally:
+        interface_jobs = None
+
+def run_interface_jobs(function, tasks, jobs=1):
+    """
+    Run function(*task) for every task, return the results in task order.
+        See iter_interface_jobs.
+    """
+    return list(iter_interface_jobs(function, tasks, jobs))
+
+class InterfaceJobResults(object):
+    """
+    iter_interface_jobs results by key, run as they are looked up.
+
+    Keys must be looked up in task order. The results of skipped keys are
+        dropped, so only the results not looked up yet are kept.
+    """
+
+    def __init__(self, function, keys, tasks, jobs=1):
+        self.keys = iter(keys)
+        self.results = iter_interface_jobs(function, tasks, jobs)
+
+    def __getitem__(self, key):
+        for job_key, result in zip(self.keys, self.results):
+            if(job_key == key):
+                return result
+        raise KeyError(key)
+
+############################### Interface inheritance ###############################
+# extends 체인은 AST에서 Interface.reference로 따라감 (생성된 코드의 텍스트 치환 없이)
+#   상속된 멤버는 base의 복사본을 INHERITED_NAME 이름으로 한 번만 생성하고, 파생 인터페이스마다 이름만 채워 넣음
+INHERITED_NAME = "Ψ0" + SNIPPET_END
+INHERITED_SLOT = re.compile("([ψΨ])(0)" + SNIPPET_END)
+
+NAMESPACE_MEMBERS = ("typedefs", "enumerations", "structs", "arrays", "maps", "constants")
+INTERFACE_MEMBERS = NAMESPACE_MEMBERS + ("attributes", "methods", "broadcasts")
+
+def interface_ancestors(interface):
+    """
+    Base interfaces of interface through the extends chain, nearest first.
+    """
+    ancestors = []
+    base = interface.reference
+    while(base is not None and base is not interface and base not in ancestors):
+        ancestors.append(base)
+        base = base.reference
+    return ancestors
+
+def inherited_namespace(base):
+    """
+    Copy of the interface base named INHERITED_NAME.
+
+    The members, their types and the references between them are copied,
+        so that every name the emitters take from the interface or from
+        the namespace of its types is INHERITED_NAME. Everything else, the
+        types of other namespaces included, is shared with base, which is
+        left unchanged. The copies are annotated again.
+    """
+    namespace = copy.copy(base)
+    namespace.name = INHERITED_NAME
+    copies = {base: namespace}
+
+    def own(node):
+        node = copy.copy(node)
+        if(getattr(node, "namespace", None) is base):
+            node.namespace = namespace
+        if(hasattr(node, "descriptor")):
+            node.descriptor = None
+        return node
+
+    def copy_type(item_type):
+        if(isinstance(item_type, ast.Reference)):
+            target = copies.get(item_type.reference)
+            if(target is None):
+                return item_type
+            reference = own(item_type)
+            reference.reference = target
+            return reference
+        if(isinstance(item_type, ast.Array) and item_type.name is None):
+            array = own(item_type)
+            array.type = copy_type(item_type.type)
+            return array
+        return item_type
+
+    def copy_typed(items):
+        # Struct fields and arguments
+        if(not items):
+            return items
+        copied = OrderedDict()
+        for name, item in items.items():
+            item = copied[name] = own(item)
+            item.type = copy_type(item.type)
+        return copied
+
+    for members in INTERFACE_MEMBERS:
+        setattr(namespace, members, OrderedDict((name, own(item)) for name, item in getattr(base, members).items()))
+        for original, item in zip(getattr(base, members).values(), getattr(namespace, members).values()):
+            copies[original] = item
+    for members in INTERFACE_MEMBERS:
+        for item in getattr(namespace, members).values():
+            if(isinstance(item, (ast.Typedef, ast.Array, ast.Constant, ast.Attribute))):
+                item.type = copy_type(item.type)
+            elif(isinstance(item, (ast.Struct, ast.Enumeration))):
+                item.reference = copies.get(item.reference, item.reference)
+                if(isinstance(item, ast.Struct)):
+                    item.fields = copy_typed(item.fields)
+            elif(isinstance(item, ast.Map)):
+                item.key_type = copy_type(item.key_type)
+                item.value_type = copy_type(item.value_type)
+            elif(isinstance(item, ast.Method)):
+                item.in_args = copy_typed(item.in_args)
+                item.out_args = copy_typed(item.out_args)
+                if(isinstance(item.errors, ast.Reference)):
+                    item.errors = copy_type(item.errors)
+            elif(isinstance(item, ast.Broadcast)):
+                item.out_args = copy_typed(item.out_args)
+    annotate_namespace(namespace)
+    return namespace
+
+############################### Progress ###############################
+# GUI의 작업 프로세스가 네임스페이스마다 진행 상황을 받는 hook (sdvgen_worker.py)
+generation_progress = None
+
+def set_progress(callback):
+    """
+    Report every generated interface and type collection to
+        callback(phase, namespace, done, total), phase "aidl" or "client".
+
+    :param callback: None to stop reporting.
+    """
+    global generation_progress
+    generation_progress = callback
+
+class ProgressCounter(object):
+    """
+    Counts the generated namespaces of one phase for generation_progress.
+    """
+
+    def __init__(self, phase, packages, selected=None):
+        self.phase = phase
+        self.done = 0
+        self.total = 0
+        if(generation_progress is not None):
+            for package in packages.values():
+                for name in list(package.interfaces) + list(package.typecollections):
+                    if(selected is None or (package.name, name) in selected):
+                        self.total += 1
+
+    def __call__(self, namespace):
+        self.done += 1
+        if(generation_progress is not None):
+            generation_progress(self.phase, namespace, self.done, self.total)
+
+############################### Incremental generation ###############################
+# 출력 디렉토리의 manifest에 출력 파일마다 생성에 쓰인 모델 요소의 hash를 기록하고, 바뀐 인터페이스/타입 컬렉션만 다시 생성함
+MANIFEST_VERSION = 1
+
+# 생성 결과에 영향이 없는 속성 (주석은 dump에만 쓰임)
+FINGERPRINT_SKIPPED = frozenset(["namespace", "package", "comments", "descriptor", "files", "imports", "_resolver", "_reference"])
+
+
+def qualified_name(node):
+    namespace = getattr(node, "namespace", None)
+    if(isinstance(node, ast.Namespace)):
+        package = node.package
+        return "{}.{}".format(package.name if package else "", node.name)
+    if(namespace is not None):
+        return "{}.{}".format(qualified_name(namespace), node.name)
+    return "{}".format(node.name)
+
+def fingerprint_node(node, out, dependencies):
+    """
+    Append the canonical text of an AST node to out.
+
+    Referenced types and base interfaces are not followed, they are only
+        named in the text and appended to dependencies.
+    """
+    if(node is None or isinstance(node, (str, int, float, bool))):
+        out.append(repr(node))
+    elif(isinstance(node, ast.Reference)):
+        try:
+            target = node.reference
+        except (ProcessorException) as e:
+            target = None
+            out.append("unresolved {} {}".format(node.name, e))
+        out.append("reference {} {}".format(node.name, qualified_name(target) if target is not None else None))
+        if(target is not None):
+            dependencies.append(target)
+    elif(hasattr(node, "items")):
+        out.append("{")
+        for key, value in node.items():
+            out.append(repr(key))
+            fingerprint_node(value, out, dependencies)
+        out.append("}")
+    elif(isinstance(node, (set, frozenset))):
+        out.append(repr(sorted(repr(item) for item in node)))
+    elif(isinstance(node, (list, tuple))):
+        out.append("[")
+        for item in node:
+            fingerprint_node(item, out, dependencies)
+        out.append("]")
+    else:
+        out.append(type(node).__name__)
+        for cls in type(node).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if(slot in FINGERPRINT_SKIPPED):
+                    continue
+                value = getattr(node, slot, None)
+                out.append(slot)
+                # Base struct, enumeration or interface (extends)
+                if(slot == "reference" and value is not None):
+                    out.append(qualified_name(value))
+                    dependencies.append(value)
+                else:
+                    fingerprint_node(value, out, dependencies)
+
+class ModelFingerprints(object):
+    """
+    Hashes of interfaces and type collections with everything their
+        generated code depends on.
+
+    The hash of a namespace covers its own members, the transitive closure
+        of the types it references, its extends chain and the type
+        collections of its package, which the emitters read as well.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+
+    def node(self, node):
+        # Canonical text and dependencies of one node, shared by all units
+        entry = self.nodes.get(id(node))
+        if(entry is None):
+            out = []
+            dependencies = []
+            fingerprint_node(node, out, dependencies)
+            entry = (node, "\n".join(out).encode("utf-8"), dependencies)
+            self.nodes[id(node)] = entry
+        return entry
+
+    def namespace(self, namespace):
+        digest = hashlib.sha256()
+        queue = [namespace]
+        seen = set()
+        while(queue):
+            node = queue.pop(0)
+            if(id(node) in seen):
+                continue
+            seen.add(id(node))
+            _, text, dependencies = self.node(node)
+            digest.update(text)
+            queue.extend(dependencies)
+            if(isinstance(node, ast.Interface) and node.package is not None):
+                queue.extend(node.package.typecollections.values())
+        return digest.hexdigest()
+
+generator_digest = None
+
+def generator_sources():
+    """
+    Source files of the generator: this module with its code templates,
+        converter_common and every module of the pyfranca package, which
+        builds the model the emitters read.
+    """
+    import converter_common, pyfranca
+    sources = [os.path.abspath(__file__), os.path.abspath(converter_common.__file__)]
+    pyfranca_dir = os.path.dirname(os.path.abspath(pyfranca.__file__))
+    for name in sorted(os.listdir(pyfranca_dir)):
+        if(name.endswith(".py")):
+            sources.append(os.path.join(pyfranca_dir, name))
+    return sources
+
+def generator_source_digest():
+    # 실행 중인 코드는 import 시점의 소스이므로 프로세스마다 한 번만 계산함
+    global generator_digest
+    if(generator_digest is None):
+        digest = hashlib.sha256()
+        for path in generator_sources():
+            with open(path, "rb") as f:
+                source = f.read()
+            digest.update(repr((os.path.basename(path), len(source))).encode("utf-8"))
+            digest.update(source)
+        generator_digest = digest.hexdigest()
+    return generator_digest
+
+def generator_context(packages, *settings):
+    """
+    Hash input shared by all outputs: the sources of the generator, its
+        settings and the package, type collection and interface names of
+        the model, which the emitters use across namespaces.
+    """
+    digest = hashlib.sha256(generator_source_digest().encode("utf-8"))
+    for setting in settings:
+        digest.update(repr(setting).encode("utf-8"))
+    for package in packages.values():
+        digest.update(repr((package.name, list(package.typecollections), list(package.interfaces))).encode("utf-8"))
+    return digest.hexdigest()
+
+class GenerationManifest(object):
+    """
+    Output files of an output directory with the hashes of the model
+        elements they were generated from.
+
+    Every output belongs to a unit, one interface or type collection for
+        one backend ("aidl" or "src"). A unit is generated again when its
+        hash changed, or one of its outputs was removed or edited.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_FILE)
+        self.files = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if(manifest.get("version") == MANIFEST_VERSION):
+                self.files = manifest["files"]
+        except (OSError, ValueError, KeyError):
+            self.files = {}
+        self.unit_files = {}
+        for path, entry in self.files.items():
+            self.unit_files.setdefault(entry["unit"], []).append(path)
+        self.inputs = {}
+        self.kept = set()
+        self.backends = set()
+        self.owners = {}
+        self.written = {}
+
+    @staticmethod
+    def unit(backend, package, namespace):
+        kind = "interface" if isinstance(namespace, ast.Interface) else "typecollection"
+        return "{} {} {}.{}".format(backend, kind, package.name, namespace.name)
+
+    def unchanged(self, unit, inputs):
+        self.inputs[unit] = inputs
+        paths = self.unit_files.get(unit)
+        if(not paths):
+            return False
+        for path in paths:
+            entry = self.files[path]
+            if(entry["inputs"] != inputs):
+                return False
+            try:
+                with open(os.path.join(self.output_dir, path), "r") as f:
+                    if(hashlib.sha256(f.read().encode("utf-8")).hexdigest() != entry["sha256"]):
+                        return False
+            except (OSError, UnicodeDecodeError):
+                return False
+        return True
+
+    def keep(self, unit):
+        self.kept.add(unit)
+
+    def own(self, path, unit):
+        self.owners[path] = unit
+
+    def output(self, path, text):
+        """
+        write_output_file, recording the output in the manifest.
+        """
+        if(isinstance(text, CodeBuffer)):
+            text = text.getvalue()
+        written = write_output_file(path, text)
+        relative = os.path.relpath(path, self.output_dir).replace(os.sep, "/")
+        unit = self.owners.get(relative)
+        if(unit is not None):
+            self.written[relative] = {"unit": unit, "inputs": self.inputs[unit],
+                                      "sha256": hashlib.sha256(text.encode("utf-8")).hexdigest()}
+        return written
+
+    def save(self):
+        files = OrderedDict()
+        for path in sorted(self.files):
+            unit = self.files[path]["unit"]
+            if((unit in self.kept or unit.split(" ")[0] not in self.backends) and path not in self.written):
+                files[path] = self.files[path]
+        files.update(self.written)
+        os.makedirs(self.output_dir, exist_ok=True)
+        write_output_file(self.path, json.dumps({"version": MANIFEST_VERSION, "files": OrderedDict(sorted(files.items()))}, indent=1) + "\n")
+
+def select_units(packages, manifest, contexts):
+    """
+    Select the interfaces and type collections to generate.
+
+    A namespace is selected when its unit of one of the backends changed.
+        The extends chain of a selected interface is selected too, its AIDL
+        is flattened into the derived interface. AIDL imports of the type
+        collections of a package go to the last interface generated before
+        them, so those are selected together.
+
+    :param contexts: generator_context of each backend by backend name.
+    :return: Set of (package name, namespace name) of the selected namespaces.
+    """
+    fingerprints = ModelFingerprints()
+    manifest.backends.update(contexts)
+    selected = set()
+    coupled = {}
+    last_interface = None
+    for package in packages.values():
+        for interface in package.interfaces.values():
+            last_interface = (package, interface)
+        for typecollection in package.typecollections.values():
+            if(last_interface is not None):
+                coupled.setdefault((package.name, typecollection.name), []).append((last_interface[0].name, last_interface[1].name))
+                coupled.setdefault((last_interface[0].name, last_interface[1].name), []).append((package.name, typecollection.name))
+        for namespace in list(package.interfaces.values()) + list(package.typecollections.values()):
+            model = fingerprints.namespace(namespace)
+            for backend, context in contexts.items():
+                unit = manifest.unit(backend, package, namespace)
+                inputs = hashlib.sha256("{} {}".format(context, model).encode("utf-8")).hexdigest()
+                if(not manifest.unchanged(unit, inputs)):
+                    selected.add((package.name, namespace.name))
+    queue = list(selected)
+    while(queue):
+        key = queue.pop()
+        related = list(coupled.get(key, ()))
+        package = packages.get(key[0])
+        interface = package.interfaces.get(key[1]) if package is not None else None
+        if(interface is not None):
+            related.extend((base.package.name, base.name) for base in interface_ancestors(interface))
+        for other in related:
+            if(other not in selected):
+                selected.add(other)
+                queue.append(other)
+    for package in packages.values():
+        for namespace in list(package.interfaces.values()) + list(package.typecollections.values()):
+            if((package.name, namespace.name) not in selected):
+                for backend in contexts:
+                    manifest.keep(manifest.unit(backend, package, namespace))
+    return selected
+
+def own_aidl_outputs(manifest, packages, job_results, selected):
+    """
+    Record the unit of every AIDL file of the selected namespaces. The
+        outputs of an interface that failed are not recorded, so it is
+        generated again.
+    """
+    for package in packages.values():
+        for interface in package.interfaces.values():
+            result = job_results.get((package.name, interface.name))
+            if(result is None or result[1] is not None):
+                continue
+            unit = manifest.unit("aidl", package, interface)
+            for name in list(result[0][0]) + list(result[0][3]):
+                manifest.own("aidl/{}.aidl".format(name), unit)
+        for typecollection in package.typecollections.values():
+            if((package.name, typecollection.name) not in selected):
+                continue
+            unit = manifest.unit("aidl", package, typecollection)
+            for name in [typecollection.name] + list(typecollection.structs) + list(typecollection.arrays) + list(typecollection.enumerations):
+                manifest.own("aidl/{}.aidl".format(name), unit)
+
+def own_src_outputs(manifest, packages, selected):
+    """
+    Record the unit of every native client, JNI and Service stub file of
+        the selected namespaces.
+    """
+    for package in packages.values():
+        for interface in package.interfaces.values():
+            if((package.name, interface.name) not in selected):
+                continue
+            unit = manifest.unit("src", package, interface)
+            manifest.own("src/{}Client.cpp".format(interface.name), unit)
+            manifest.own("stub/{}Service.java".format(capitalize_first_letter(interface.name)), unit)
+            manifest.own("src/{}JNI.java".format(interface.name), unit)
+            if(has_conversions(interface)):
+                manifest.own("src/{}Conversions.hpp".format(interface.name), unit)
+        for typecollection in package.typecollections.values():
+            if((package.name, typecollection.name) in selected):
+                unit = manifest.unit("src", package, typecollection)
+                manifest.own("src/{}JNI.java".format(typecollection.name), unit)
+                if(has_conversions(typecollection)):
+                    manifest.own("src/{}Conversions.hpp".format(typecollection.name), unit)
+
 ############################### AIDL Generation ###############################
 def get_type_name(item):
     if(issubclass(type(item), ast.Array)):
@@ -167,19 +1095,23 @@ def convert_aidl_type(typename):
 def get_aidl_type_name(item):
     typename = ''
     if(issubclass(type(item), ast.Array)):
-        typename = convert_aidl_type(item.type.name)
+        typename = type_spelling(item.type.name).aidl
         return typename + '[]'
     elif(isinstance(item, ast.Reference)):
         if(isinstance(item.reference, ast.Map)):
-            typename = convert_aidl_type(item.reference.name)
+            typename = type_spelling(item.reference.name).aidl
             return typename + '[]'
         else:
-            typename = convert_aidl_type(item.name)
+            typename = type_spelling(item.name).aidl
             return typename
     else:
-        typename = convert_aidl_type(item.name)
+        typename = type_spelling(item.name).aidl
         return typename
 
+# Referenced types in a stable order, the AIDL generators collect them in sets
+def sorted_references(references):
+    return sorted(references, key=lambda reference: (reference.namespace.name, reference.name))
+
 ########################## Broadcast #########################################
 def generate_aidl_broadcast(broadcast, interface_name):
     aidl_str = ""
@@ -188,6 +1120,7 @@ def generate_aidl_broadcast(broadcast, interface_name):
     
     return aidl_str
 
+@profiled("member")
 def generate_aidl_method_parcelable(method, package_name):
     aidl_str = ""
     list_references = set()
@@ -207,7 +1140,7 @@ def generate_aidl_method_parcelable(method, package_name):
                 list_references.add(arg.type.reference.type.reference)
     aidl_str += "}\n"
 
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         import_str += "import {}.{};\n".format(package_name, reference.name)
     import_str += "\n"
     
@@ -311,6 +1244,7 @@ def generate_aidl_array(array):
     aidl_str += "}\n"
     return aidl_str
 
+@profiled("member")
 def generate_aidl_handler_interface_from_fidl_attribute(attribute, package_name):
     import_str = ""
     interface_str = ""
@@ -327,10 +1261,11 @@ def generate_aidl_handler_interface_from_fidl_attribute(attribute, package_name)
                 list_references.add(attribute.type.type.reference)
             elif(attribute.type.name != None and isinstance(attribute.type.reference.type, ast.Reference)):
                 list_references.add(attribute.type.reference.type.reference)
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         import_str += "import {}.{};\n".format(package_name, reference.name)
     return interface_str, import_str
 
+@profiled("member")
 def generate_aidl_callback_interface_from_fidl_broadcast(broadcast, package_name):
     import_str = ""
     interface_str = ""
@@ -352,7 +1287,7 @@ def generate_aidl_callback_interface_from_fidl_broadcast(broadcast, package_name
             interface_str += ", "
     interface_str += ");"
     interface_str += "\n"
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         import_str += "import {}.{};\n".format(package_name, reference.name)
     return interface_str, import_str
 
@@ -414,7 +1349,7 @@ def generate_aidl_interface_from_fidl_interface(interface, package_name):
     #         if(isinstance(array.type, ast.Reference)):
     #             list_references.add(array.type.reference)
     #         interface_str += generate_aidl_array(array)
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         if(reference.namespace.name == interface.name):
             continue
         # AIDL 12 이상부터 nested parcelable 지원으로 주석처리
@@ -440,7 +1375,7 @@ def generate_aidl_parcelable_from_fidl_struct(struct, package_name):
                 list_references.add(field.type.reference.type.reference)
     interface_str += generate_aidl_parcelabele(struct)
 
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         import_str += "import {}.{};\n".format(package_name, reference.name)
     import_str += "\n"
     
@@ -454,7 +1389,7 @@ def generate_aidl_parcelable_from_fidl_array(array, package_name):
     if(isinstance(array.type, ast.Reference)):
         list_references.add(array.type.reference)
     interface_str += generate_aidl_array(array)
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         # if(reference.namespace.name == array.type.reference.namespace.name):
         #     continue
         import_str += "import {}.{};\n".format(package_name, reference.name)
@@ -468,7 +1403,7 @@ def generate_aidl_parcelable_from_fidl_enum(enum, package_name):
     list_references = set()
 
     interface_str += generate_aidl_enumerate(enum)
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         # if(reference.namespace.name == array.type.reference.namespace.name):
         #     continue
         import_str += "import {}.{};\n".format(package_name, reference.name)
@@ -486,7 +1421,7 @@ def generate_aidl_parcelable_from_fidl_map(map, package_name):
         list_references.add(map.key_type.reference)
     if(isinstance(map.value_type, ast.Reference)):
         list_references.add(map.value_type.reference)
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         # if(reference.namespace.name == map.type.reference.namespace.name):
         #    continue
         import_str += "import {}.{};\n".format(package_name, reference.name)
@@ -529,152 +1464,237 @@ def generate_aidl_interface_from_fidl_typecollection(interface, package_name):
     #         if(isinstance(array.type, ast.Reference)):
     #             list_references.add(array.type.reference)
     #         interface_str += generate_aidl_array(array)
-    for reference in list_references:
+    for reference in sorted_references(list_references):
         # AIDL 12 이상부터 nested parcelable 지원으로 주석처리
         #import_str += "import {}.{}.{};\n".format(package_name, reference.namespace.name, reference.name)
         import_str += "import {}.{};\n".format(package_name, reference.name)
     import_str += "\n"
     return interface_str, import_str
 
-def convert_to_aidl(packages, package_name, output_dir):
-    interfaces = OrderedDict()
-    imports = OrderedDict()
-    extends = OrderedDict()
-    parcel = OrderedDict()
-    parcel_imports = OrderedDict()
-    
+def generate_aidl_files_from_fidl_interface(interface, package_name, interfaces, imports, extends, parcel, parcel_imports):
+    """
+    Add the AIDL interface, handler, callback and parcelable texts of one interface to the given OrderedDicts.
+    """
+    interface_str, import_str = generate_aidl_interface_from_fidl_interface(interface, package_name)
+    interfaces[interface.name] = interface_str
+    imports[interface.name] = import_str
+    extends[interface.name] = interface.reference.name if interface.reference else None
+    # Unsupported data types filtering
+    # if(interface.maps):
+    #     raise Exception("Interface {}, Maps are not supported".format(interface.name))
     
-    os.makedirs(output_dir + '/aidl', exist_ok=True)
+    if(interface.attributes):
+        for attribute in interface.attributes.values():
+            hanlder_interface_str, handler_import_str = generate_aidl_handler_interface_from_fidl_attribute(attribute, package_name=package_name)
+            #interfaces[interface.name] += "\n\tinterface {} {{\n \t{} \t}}\n".format((capitalize_first_letter(broadcast.name)+"Callback"),callback_interface_str)
+            interfaces["{}{}Handler".format(interface.name, capitalize_first_letter(attribute.name))] = hanlder_interface_str
+            imports["{}{}Handler".format(interface.name, capitalize_first_letter(attribute.name))] = handler_import_str
+            imports[interface.name] += "import {}.{}{}Handler;\n".format(package_name, interface.name, capitalize_first_letter(attribute.name))
+    if(interface.broadcasts):
+        for broadcast in interface.broadcasts.values(): 
+            callback_interface_str, callback_import_str = generate_aidl_callback_interface_from_fidl_broadcast(broadcast, package_name)
+            #interfaces[interface.name] += "\n\tinterface {} {{\n \t{} \t}}\n".format((capitalize_first_letter(broadcast.name)+"Callback"),callback_interface_str)
+            interfaces["{}{}Callback".format(interface.name, capitalize_first_letter(broadcast.name))] = callback_interface_str
+            imports["{}{}Callback".format(interface.name, capitalize_first_letter(broadcast.name))] = callback_import_str
+            imports[interface.name] += "import {}.{}{}Callback;\n".format(package_name, interface.name, capitalize_first_letter(broadcast.name))
+    if(interface.structs):
+        for struct in interface.structs.values():
+            struct_interface_str, struct_import_str = generate_aidl_parcelable_from_fidl_struct(struct, package_name)
+            ## Android 12
+            # parcel["{}.{}".format(interface.name, struct.name)] = struct_interface_str
+            # parcel_imports["{}.{}".format(interface.name, struct.name)] = struct_import_str
+            # imports[interface.name] += "import {}.{}.{};\n".format(package_name, interface.name, struct.name)
+            parcel["{}".format(struct.name)] = struct_interface_str
+            parcel_imports["{}".format(struct.name)] = struct_import_str
+            imports[interface.name] += "import {}.{};\n".format(package_name, struct.name)
+    if(interface.arrays):
+        for array in interface.arrays.values():
+            array_interface_str, array_import_str = generate_aidl_parcelable_from_fidl_array(array, package_name)
+            ## Android 12 does not allow nested parcelables
+            # parcel["{}.{}".format(interface.name, array.name)] = array_interface_str
+            # parcel_imports["{}.{}".format(interface.name, array.name)] = array_import_str
+            # imports[interface.name] += "import {}.{}.{};\n".format(package_name, interface.name, array.name)
+            parcel["{}".format(array.name)] = array_interface_str
+            parcel_imports["{}".format(array.name)] = array_import_str
+            imports[interface.name] += "import {}.{};\n".format(package_name, array.name)
+    if(interface.enumerations):
+        for enum in interface.enumerations.values():
+            enum_interface_str, enum_import_str = generate_aidl_parcelable_from_fidl_enum(enum, package_name)
+            parcel["{}".format(enum.name)] = enum_interface_str
+            parcel_imports["{}".format(enum.name)] = enum_import_str
+            imports[interface.name] += "import {}.{};\n".format(package_name, enum.name)
+    if(interface.maps):
+        for map in interface.maps.values():
+            map_interface_str, map_import_str = generate_aidl_parcelable_from_fidl_map(map, package_name)
+            parcel["{}".format(map.name)] = map_interface_str
+            parcel_imports["{}".format(map.name)] = map_import_str
+            imports[interface.name] += "import {}.{};\n".format(package_name, map.name)
+            # print(imports[interface.name])
+            
+    if(interface.methods):
+        for method in interface.methods.values():
+            if(len(method.out_args.values()) > 1):
+                method_interface_str, method_import_str = generate_aidl_method_parcelable(method, package_name)
+                # parcel["{}.{}ReturnType".format(interface.name, method.name)] = method_interface_str
+                # parcel_imports["{}.{}ReturnType".format(interface.name, method.name)] = method_import_str
+                # imports[interface.name] += "import {}.{}.{}ReturnType;\n".format(package_name, interface.name, capitalize_first_letter(method.name))
+                parcel["{}ReturnType".format(method.name)] = method_interface_str
+                parcel_imports["{}ReturnType".format(method.name)] = method_import_str
+                imports[interface.name] += "import {}.{}ReturnType;\n".format(package_name, capitalize_first_letter(method.name))
+
+@profiled("interface")
+def generate_aidl_files_job(interface, package_name):
+    """
+    generate_aidl_files_from_fidl_interface into new OrderedDicts, for run_interface_jobs.
+
+    :return: The OrderedDicts and the error message, None if there was no error.
+    """
+    outputs = tuple(OrderedDict() for _ in range(5))
+    try:
+        generate_aidl_files_from_fidl_interface(interface, package_name, *outputs)
+    except (Exception) as e:
+        return outputs, "{}".format(e)
+    return outputs, None
+
+def iter_aidl(packages, package_name, job_results=None, selected=None, jobs=1):
+    """
+    Generate the AIDL texts of all packages, one namespace at a time.
+
+    The imports of the parcelables of a type collection are added to the
+        imports of the interface generated last before it, so the texts of
+        an interface are complete only when the next interface is yielded.
+
+    :param job_results: generate_aidl_files_job results by (package, interface) name, generated here in jobs processes if None.
+    :param selected: Set of (package, namespace) names to generate, all if None.
+    :return: Iterator of (package, namespace, outputs, error). outputs is the
+        tuple of the interfaces, imports, extends, parcel and parcel_imports
+        OrderedDicts of the namespace, error the message of a failed interface or None.
+    """
+    if(job_results is None):
+        job_keys = []
+        job_tasks = []
+        for package in packages.values():
+            for interface in package.interfaces.values():
+                if(selected is None or (package.name, interface.name) in selected):
+                    job_keys.append((package.name, interface.name))
+                    job_tasks.append((interface, package_name))
+        job_results = InterfaceJobResults(generate_aidl_files_job, job_keys, job_tasks, jobs)
+    last_imports = {}
+    progress = ProgressCounter("aidl", packages, selected)
 
     for package in packages.values():
         try:
             if(package.interfaces):
                 for interface in package.interfaces.values():
-                    interface_str, import_str = generate_aidl_interface_from_fidl_interface(interface, package_name)
-                    interfaces[interface.name] = interface_str
-                    imports[interface.name] = import_str
-                    extends[interface.name] = interface.extends if interface.extends else None
-                    # Unsupported data types filtering
-                    # if(interface.maps):
-                    #     raise Exception("Interface {}, Maps are not supported".format(interface.name))
-                    
-                    if(interface.attributes):
-                        for attribute in interface.attributes.values():
-                            hanlder_interface_str, handler_import_str = generate_aidl_handler_interface_from_fidl_attribute(attribute, package_name=package_name)
-                            #interfaces[interface.name] += "\n\tinterface {} {{\n \t{} \t}}\n".format((capitalize_first_letter(broadcast.name)+"Callback"),callback_interface_str)
-                            interfaces["{}{}Handler".format(interface.name, capitalize_first_letter(attribute.name))] = hanlder_interface_str
-                            imports["{}{}Handler".format(interface.name, capitalize_first_letter(attribute.name))] = handler_import_str
-                            imports[interface.name] += "import {}.{}{}Handler;\n".format(package_name, interface.name, capitalize_first_letter(attribute.name))
-                    if(interface.broadcasts):
-                        for broadcast in interface.broadcasts.values(): 
-                            callback_interface_str, callback_import_str = generate_aidl_callback_interface_from_fidl_broadcast(broadcast, package_name)
-                            #interfaces[interface.name] += "\n\tinterface {} {{\n \t{} \t}}\n".format((capitalize_first_letter(broadcast.name)+"Callback"),callback_interface_str)
-                            interfaces["{}{}Callback".format(interface.name, capitalize_first_letter(broadcast.name))] = callback_interface_str
-                            imports["{}{}Callback".format(interface.name, capitalize_first_letter(broadcast.name))] = callback_import_str
-                            imports[interface.name] += "import {}.{}{}Callback;\n".format(package_name, interface.name, capitalize_first_letter(broadcast.name))
-                    if(interface.structs):
-                        for struct in interface.structs.values():
-                            struct_interface_str, struct_import_str = generate_aidl_parcelable_from_fidl_struct(struct, package_name)
-                            ## Android 12
-                            # parcel["{}.{}".format(interface.name, struct.name)] = struct_interface_str
-                            # parcel_imports["{}.{}".format(interface.name, struct.name)] = struct_import_str
-                            # imports[interface.name] += "import {}.{}.{};\n".format(package_name, interface.name, struct.name)
-                            parcel["{}".format(struct.name)] = struct_interface_str
-                            parcel_imports["{}".format(struct.name)] = struct_import_str
-                            imports[interface.name] += "import {}.{};\n".format(package_name, struct.name)
-                    if(interface.arrays):
-                        for array in interface.arrays.values():
-                            array_interface_str, array_import_str = generate_aidl_parcelable_from_fidl_array(array, package_name)
-                            ## Android 12 does not allow nested parcelables
-                            # parcel["{}.{}".format(interface.name, array.name)] = array_interface_str
-                            # parcel_imports["{}.{}".format(interface.name, array.name)] = array_import_str
-                            # imports[interface.name] += "import {}.{}.{};\n".format(package_name, interface.name, array.name)
-                            parcel["{}".format(array.name)] = array_interface_str
-                            parcel_imports["{}".format(array.name)] = array_import_str
-                            imports[interface.name] += "import {}.{};\n".format(package_name, array.name)
-                    if(interface.enumerations):
-                        for enum in interface.enumerations.values():
-                            enum_interface_str, enum_import_str = generate_aidl_parcelable_from_fidl_enum(enum, package_name)
-                            parcel["{}".format(enum.name)] = enum_interface_str
-                            parcel_imports["{}".format(enum.name)] = enum_import_str
-                            imports[interface.name] += "import {}.{};\n".format(package_name, enum.name)
-                    if(interface.maps):
-                        for map in interface.maps.values():
-                            map_interface_str, map_import_str = generate_aidl_parcelable_from_fidl_map(map, package_name)
-                            parcel["{}".format(map.name)] = map_interface_str
-                            parcel_imports["{}".format(map.name)] = map_import_str
-                            imports[interface.name] += "import {}.{};\n".format(package_name, map.name)
-                            # print(imports[interface.name])
-                            
-                    if(interface.methods):
-                        for method in interface.methods.values():
-                            if(len(method.out_args.values()) > 1):
-                                method_interface_str, method_import_str = generate_aidl_method_parcelable(method, package_name)
-                                # parcel["{}.{}ReturnType".format(interface.name, method.name)] = method_interface_str
-                                # parcel_imports["{}.{}ReturnType".format(interface.name, method.name)] = method_import_str
-                                # imports[interface.name] += "import {}.{}.{}ReturnType;\n".format(package_name, interface.name, capitalize_first_letter(method.name))
-                                parcel["{}ReturnType".format(method.name)] = method_interface_str
-                                parcel_imports["{}ReturnType".format(method.name)] = method_import_str
-                                imports[interface.name] += "import {}.{}ReturnType;\n".format(package_name, capitalize_first_letter(method.name))
+                    if(selected is not None and (package.name, interface.name) not in selected):
+                        continue
+                    outputs, error = job_results[(package.name, interface.name)]
+                    last_imports = outputs[1]
+                    progress(interface)
+                    yield package, interface, outputs, error
+                    if(error is not None):
+                        raise Exception(error)
             if(package.typecollections):
                 for typecollection in package.typecollections.values():
-                    interface_str, import_str = generate_aidl_interface_from_fidl_typecollection(typecollection, package_name)
-                    interfaces[typecollection.name] = interface_str
-                    imports[typecollection.name] = import_str
-                    if(typecollection.structs):
-                        for struct in typecollection.structs.values():
-                            struct_interface_str, struct_import_str = generate_aidl_parcelable_from_fidl_struct(struct, package_name)
-                            # parcel["{}.{}".format(typecollection.name, struct.name)] = struct_interface_str
-                            # parcel_imports["{}.{}".format(typecollection.name, struct.name)] = struct_import_str
-                            # imports[interface.name] += "import {}.{}.{};\n".format(package_name, typecollection.name, struct.name)
-                            parcel["{}".format(struct.name)] = struct_interface_str
-                            parcel_imports["{}".format(struct.name)] = struct_import_str
-                            imports[interface.name] += "import {}.{};\n".format(package_name, struct.name)
-                    if(typecollection.arrays):
-                        for array in typecollection.arrays.values():
-                            array_interface_str, array_import_str = generate_aidl_parcelable_from_fidl_array(array, package_name)
-                            # parcel["{}.{}".format(typecollection.name,array.name)] = array_interface_str
-                            # parcel_imports["{}.{}".format(typecollection.name,array.name)] = array_import_str
-                            # imports[interface.name] += "import {}.{}.{};\n".format(package_name, typecollection.name, array.name)
-                            parcel["{}".format(array.name)] = array_interface_str
-                            parcel_imports["{}".format(array.name)] = array_import_str
-                            imports[interface.name] += "import {}.{};\n".format(package_name, array.name)
-                    if(typecollection.enumerations):
-                        for enum in typecollection.enumerations.values():
-                            enum_interface_str, enum_import_str = generate_aidl_parcelable_from_fidl_enum(enum, package_name)
-                            parcel["{}".format(enum.name)] = enum_interface_str
-                            parcel_imports["{}".format(enum.name)] = enum_import_str
-                            imports[interface.name] += "import {}.{};\n".format(package_name, enum.name)
+                    if(selected is not None and (package.name, typecollection.name) not in selected):
+                        continue
+                    outputs = tuple(OrderedDict() for _ in range(5))
+                    interfaces, imports, extends, parcel, parcel_imports = outputs
+                    error = None
+                    try:
+                        interface_str, import_str = generate_aidl_interface_from_fidl_typecollection(typecollection, package_name)
+                        interfaces[typecollection.name] = interface_str
+                        imports[typecollection.name] = import_str
+                        if(typecollection.structs):
+                            for struct in typecollection.structs.values():
+                                struct_interface_str, struct_import_str = generate_aidl_parcelable_from_fidl_struct(struct, package_name)
+                                # parcel["{}.{}".format(typecollection.name, struct.name)] = struct_interface_str
+                                # parcel_imports["{}.{}".format(typecollection.name, struct.name)] = struct_import_str
+                                # imports[interface.name] += "import {}.{}.{};\n".format(package_name, typecollection.name, struct.name)
+                                parcel["{}".format(struct.name)] = struct_interface_str
+                                parcel_imports["{}".format(struct.name)] = struct_import_str
+                                last_imports[interface.name] += "import {}.{};\n".format(package_name, struct.name)
+                        if(typecollection.arrays):
+                            for array in typecollection.arrays.values():
+                                array_interface_str, array_import_str = generate_aidl_parcelable_from_fidl_array(array, package_name)
+                                # parcel["{}.{}".format(typecollection.name,array.name)] = array_interface_str
+                                # parcel_imports["{}.{}".format(typecollection.name,array.name)] = array_import_str
+                                # imports[interface.name] += "import {}.{}.{};\n".format(package_name, typecollection.name, array.name)
+                                parcel["{}".format(array.name)] = array_interface_str
+                                parcel_imports["{}".format(array.name)] = array_import_str
+                                last_imports[interface.name] += "import {}.{};\n".format(package_name, array.name)
+                        if(typecollection.enumerations):
+                            for enum in typecollection.enumerations.values():
+                                enum_interface_str, enum_import_str = generate_aidl_parcelable_from_fidl_enum(enum, package_name)
+                                parcel["{}".format(enum.name)] = enum_interface_str
+                                parcel_imports["{}".format(enum.name)] = enum_import_str
+                                last_imports[interface.name] += "import {}.{};\n".format(package_name, enum.name)
+                    except (Exception) as e:
+                        error = e
+                    # 에러 전까지 생성된 파일은 그대로 씀
+                    progress(typecollection)
+                    yield package, typecollection, outputs, None
+                    if(error is not None):
+                        raise error
         except (Exception) as e:
             print("ERROR during AIDL generation: {}".format(e))
             continue
-        
-    for interface, interface_str in interfaces.items():
+
+def collect_aidl(packages, package_name, job_results=None, selected=None):
+    """
+    Generate the AIDL texts of all packages.
+
+    :param job_results: generate_aidl_files_job results by (package, interface) name, generated here if None.
+    :param selected: Set of (package, namespace) names to generate, all if None.
+    :return: Tuple of the interfaces, imports, extends, parcel and parcel_imports OrderedDicts.
+    """
+    # 타입 컬렉션이 앞 인터페이스의 imports를 바꾸므로 전부 생성한 뒤에 합침
+    units = [outputs for _, _, outputs, _ in iter_aidl(packages, package_name, job_results, selected)]
+    collected = tuple(OrderedDict() for _ in range(5))
+    for outputs in units:
+        for target, output in zip(collected, outputs):
+            target.update(output)
+    return collected
+
+def write_aidl(outputs, package_name, output_dir, output=write_output_file, context=None):
+    """
+    Write the AIDL files of outputs.
+
+    :param context: Outputs the extends chains are resolved in, outputs if None.
+    """
+    interfaces, imports, extends, parcel, parcel_imports = context if context is not None else outputs
+
+    for interface, interface_str in outputs[0].items():
         aidl_str = ""
         aidl_str += "// Auto-generated by FIDL-AIDL Converter\n"
         aidl_str += "// Filename: {}.aidl\n\n".format(interface)
         aidl_str += "package {};\n\n".format(package_name)
+        # AIDL은 상속이 없으므로 extends 체인 전체의 멤버를 펼침 (최상위 base부터)
+        ancestors = []
+        base = extends.get(interface)
+        while(base and base != interface and base not in ancestors):
+            ancestors.append(base)
+            base = extends.get(base)
+        ancestors.reverse()
         imports_set = set()
-        if(extends.get(interface)):
-            for _import in imports.get(extends.get(interface)).split('\n'):
+        for base in ancestors:
+            for _import in imports.get(base, "").split('\n'):
                 if(_import):
                     imports_set.add(_import)        
         for _import in imports.get(interface).split('\n'):
             if(_import):
                 imports_set.add(_import)
-        imports_set = list(imports_set)
+        imports_set = sorted(imports_set)
         for _import in imports_set:
             aidl_str += _import + "\n"
         aidl_str += "\ninterface {} {{ \n".format(interface)
-        if(extends.get(interface)):
-            aidl_str += interfaces.get(extends.get(interface))
+        for base in ancestors:
+            aidl_str += interfaces.get(base, "")
         aidl_str += interface_str
         aidl_str += "}\n"
-        f = open("{}/aidl/{}.aidl".format(output_dir,interface), "w")
-        f.write(aidl_str)
-        f.close()
+        output("{}/aidl/{}.aidl".format(output_dir,interface), aidl_str)
         
-    for interface, interface_str in parcel.items():
+    for interface, interface_str in outputs[3].items():
         tcollection = interface.split('.')[0]
         aidl_str = ""
         aidl_str += "// Auto-generated by FIDL-AIDL Converter\n"
@@ -688,7 +1708,7 @@ def convert_to_aidl(packages, package_name, output_dir):
         for _import in parcel_imports.get(interface).split('\n'):
             if(_import):
                 imports_set.add(_import)
-        imports_set = list(imports_set)
+        imports_set = sorted(imports_set)
         for _import in imports_set:
             aidl_str += _import + "\n"
         #aidl_str += "\ninterface {} {{ \n".format(interface)
@@ -697,9 +1717,102 @@ def convert_to_aidl(packages, package_name, output_dir):
             aidl_str += interfaces.get(extends.get(interface))
         aidl_str += interface_str
         #aidl_str += "}\n"
-        f = open("{}/aidl/{}.aidl".format(output_dir,interface), "w")
-        f.write(aidl_str)
-        f.close()
+        output("{}/aidl/{}.aidl".format(output_dir,interface), aidl_str)
+
+def stream_aidl(packages, package_name, output_dir, output=write_output_file, jobs=1, manifest=None, selected=None):
+    """
+    Write the AIDL files of every namespace as soon as its texts are complete.
+
+    Of the written namespaces only the extends and the texts of the
+        interfaces other interfaces extend are kept, the AIDL of a derived
+        interface repeats the members of its bases. An interface whose base
+        comes later is written right after its base.
+    """
+    bases = set(interface.reference.name for package in packages.values()
+                for interface in package.interfaces.values() if interface.reference is not None)
+    retained = tuple(OrderedDict() for _ in range(5))
+    pending = []
+    deferred = []
+
+    def retain(outputs):
+        retained[2].update(outputs[2])
+        for index in (0, 1, 4):
+            for name in bases.intersection(outputs[index]):
+                retained[index][name] = outputs[index][name]
+
+    def context(outputs):
+        return tuple(ChainMap(own, kept) for own, kept in zip(outputs, retained))
+
+    def ready(outputs):
+        # extends 체인의 base가 모두 이미 써졌는지
+        for interface, base in outputs[2].items():
+            chain = []
+            while(base and base != interface and base not in chain):
+                if(base not in retained[2]):
+                    return False
+                chain.append(base)
+                base = retained[2].get(base)
+        return True
+
+    def flush(outputs):
+        if(not ready(outputs)):
+            deferred.append(outputs)
+            return
+        retain(outputs)
+        write_aidl(outputs, package_name, output_dir, output, context(outputs))
+        # base를 기다리던 인터페이스
+        waiting = [unit_outputs for unit_outputs in deferred if ready(unit_outputs)]
+        deferred[:] = [unit_outputs for unit_outputs in deferred if not ready(unit_outputs)]
+        for unit_outputs in waiting:
+            flush(unit_outputs)
+
+    for package, namespace, outputs, error in iter_aidl(packages, package_name, selected=selected, jobs=jobs):
+        if(manifest is not None and error is None):
+            unit = manifest.unit("aidl", package, namespace)
+            for name in list(outputs[0]) + list(outputs[3]):
+                manifest.own("aidl/{}.aidl".format(name), unit)
+        # 인터페이스는 다음 인터페이스가 나올 때까지 뒤의 타입 컬렉션과 함께 보류
+        if(isinstance(namespace, ast.Interface)):
+            for unit_outputs in pending:
+                flush(unit_outputs)
+            del pending[:]
+        pending.append(outputs)
+    for unit_outputs in pending:
+        flush(unit_outputs)
+    for unit_outputs in deferred:
+        retain(unit_outputs)
+    for unit_outputs in deferred:
+        write_aidl(unit_outputs, package_name, output_dir, output, context(unit_outputs))
+
+def convert_to_aidl(packages, package_name, output_dir, jobs=1, manifest=None, output=write_output_file, stream=False):
+    # 증분 생성: manifest가 있으면 바뀐 인터페이스/타입 컬렉션만 생성
+    # output(path, text)이 파일을 씀, VirtualOutput이면 메모리에 남김
+    # stream: 인터페이스마다 생성되는 대로 써서 전체 출력을 메모리에 모으지 않음
+    selected = None
+    if(manifest is not None):
+        selected = select_units(packages, manifest, {"aidl": generator_context(packages, "aidl", package_name)})
+        output = manifest.output
+    if(stream):
+        stream_aidl(packages, package_name, output_dir, output, jobs, manifest, selected)
+        if(manifest is not None):
+            manifest.save()
+        return
+    # 병렬 생성: 결과를 패키지/인터페이스 순서대로 합쳐서 직렬 생성과 같은 출력을 만듦
+    job_results = None
+    if(jobs != 1 or manifest is not None):
+        job_keys = []
+        job_tasks = []
+        for package in packages.values():
+            for interface in package.interfaces.values():
+                if(selected is None or (package.name, interface.name) in selected):
+                    job_keys.append((package.name, interface.name))
+                    job_tasks.append((interface, package_name))
+        job_results = dict(zip(job_keys, run_interface_jobs(generate_aidl_files_job, job_tasks, jobs)))
+    if(manifest is not None):
+        own_aidl_outputs(manifest, packages, job_results, selected)
+    write_aidl(collect_aidl(packages, package_name, job_results, selected), package_name, output_dir, output)
+    if(manifest is not None):
+        manifest.save()
 ################################################################################### AIDL End
 
 # CPP code에서 사용되는 data type으로 변환
@@ -820,56 +1933,186 @@ def convert_java_code_type(typename):
         return 'String'
     return typename
 
-# Function for checking the data type of an element
-def check_type_ver2(arg, interface):
-    type_list = ['Int8', 'UInt8', 'Int16', 'UInt16', 'Int32', 'UInt32', 'Int64', 'UInt64', 'Double', 'Float', 'Boolean']
-    if(arg.type.name in type_list):
-        return 1
+# Spellings of one Franca type name in the generated languages
+TypeSpelling = namedtuple("TypeSpelling", ["name", "cpp", "jni", "java", "java_code", "aidl"])
+
+# Classification of a typed element (Attribute, Argument, StructField, Array, ...)
+#   code: check_type_ver2 code; 3 and 4 depend on the interface and are derived
+#         from 6 and 7 with local_name in check_type_ver2
+#   target: referenced type, or the type itself if it is not a reference
+#   element: element type of an array, references followed
+#   array_depth: number of nested arrays
+#   unsigned: unsigned integer (of the elements for an array)
+#   spelling: TypeSpelling of the type name as written
+#   element_spelling: TypeSpelling of the element type name of an array
+#   local_name: name of a referenced array or struct that may be defined in the interface
+#   error: message of an unsupported type
+#   type: type the element is generated as, see element_type
+TypeDescriptor = namedtuple("TypeDescriptor", ["code", "target", "element", "array_depth", "unsigned",
+                                               "spelling", "element_spelling", "local_name", "error", "type"])
+
+# ByteBuffer is generated as an implicit array of UInt8
+BYTE_BUFFER_TYPE = ast.Array(name=None, element_type=ast.Array(name="UInt8", element_type=ast.UInt8()))
+BYTE_BUFFER_TYPE.namespace = "CommonAPI"
+
+PRIMITIVE_TYPE_NAMES = frozenset(['Int8', 'UInt8', 'Int16', 'UInt16', 'Int32', 'UInt32', 'Int64', 'UInt64', 'Double', 'Float', 'Boolean'])
+
+type_spellings = {}
+
+def type_spelling(typename):
+    spelling = type_spellings.get(typename)
+    if spelling is None:
+        spelling = TypeSpelling(typename, convert_cpp_type(typename), convert_jni_type(typename),
+                                convert_java_type(typename), convert_java_code_type(typename),
+                                convert_aidl_type(typename))
+        type_spellings[typename] = spelling
+    return spelling
+
+def describe_type(arg):
+    arg_type = arg.type
+    code = -1
+    element = None
+    element_name = None
+    local_name = None
+    error = None
+    if(arg.type.name in PRIMITIVE_TYPE_NAMES):
+        code = 1
     elif(arg.type.name == 'String'):
-        return 2
+        code = 2
     elif(isinstance(arg.type, ast.Reference)):
-        if(isinstance(arg.type.reference, ast.Array)):
-            if(isinstance(arg.type.reference.type, ast.Reference)):
-                if(isinstance(arg.type.reference.type.reference, ast.Struct)):
-                    return 9 # Explicit array of struct
-                else:
-                    raise Exception(f"Unsupported data type: {arg.name}")
-            else:
-                if(arg.type.reference.name in interface.arrays and len(arg.type.name.split('.')) == 1):
-                    return 3 # explicit array in interface
+        reference = arg.type.reference
+        unqualified = len(arg.type.name.split('.')) == 1
+        if(isinstance(reference, ast.Array)):
+            element_name = reference.type.name
+            if(isinstance(reference.type, ast.Reference)):
+                element = reference.type.reference
+                if(isinstance(element, ast.Struct)):
+                    code = 9 # Explicit array of struct
                 else:
-                    return 6 # explicit array in typeCollection
-        elif(isinstance(arg.type.reference, ast.Struct)):
-            if(arg.type.reference.name in interface.structs and len(arg.type.name.split('.')) == 1):
-                return 4
+                    error = f"Unsupported data type: {arg.name}"
             else:
-                return 7
-        elif(isinstance(arg.type.reference, ast.Enumeration)):
-            return 8
+                element = reference.type
+                code = 6 # explicit array in typeCollection, 3 if in the interface
+                if(unqualified):
+                    local_name = reference.name
+        elif(isinstance(reference, ast.Struct)):
+            code = 7 # 4 if in the interface
+            if(unqualified):
+                local_name = reference.name
+        elif(isinstance(reference, ast.Enumeration)):
+            code = 8
         # Map = implict struct array with only two elements, key and value
-        elif(isinstance(arg.type.reference, ast.Map)):
-            #print(arg.name)
-            return 11
+        elif(isinstance(reference, ast.Map)):
+            code = 11
+        else:
+            code = None
     elif(arg.type.name is None):
+        element_name = arg.type.type.name
         if(isinstance(arg.type.type, ast.Reference)):
-            if(isinstance(arg.type.type.reference, ast.Struct)):
-                #print("I10 " + arg.name)
-                return 10 # Implict array of struct
+            element = arg.type.type.reference
+            if(isinstance(element, ast.Struct)):
+                code = 10 # Implict array of struct
             else:
-                raise Exception(f"Unsupported data type: {arg.name}")
+                error = f"Unsupported data type: {arg.name}"
         else:
-            return 5 # implicit array
-    
+            element = arg.type.type
+            code = 5 # implicit array
     elif(isinstance(arg.type, ast.Constant)):
-        return 15
+        code = 15
     elif(arg.type.name == 'ByteBuffer'):
-        #print("H")
-        #print(dir(arg.type.namespace), arg.type, arg.type.name, arg.type.namespace)
-        arg.type = ast.Array(name=None, element_type=ast.Array(name="UInt8", element_type=ast.UInt8()))
-        arg.type.namespace = "CommonAPI"
-        return 5
-    else:
-        return -1
+        arg_type = BYTE_BUFFER_TYPE
+        element = arg_type.type
+        element_name = element.name
+        code = 5
+
+    target = arg_type.reference if isinstance(arg_type, ast.Reference) else arg_type
+    array_depth = 0
+    item = arg_type
+    while item is not None:
+        if(isinstance(item, ast.Reference)):
+            item = item.reference
+        elif(isinstance(item, ast.Array)):
+            array_depth += 1
+            item = item.type
+        else:
+            break
+    spelling = type_spelling(arg_type.name)
+    element_spelling = type_spelling(element_name) if element_name is not None else None
+    unsigned = bool(isUnsigned(element_name if element_name is not None else arg_type.name))
+    return TypeDescriptor(code, target, element, array_depth, unsigned, spelling, element_spelling, local_name, error, arg_type)
+
+# Type descriptor of an element, classified on first use
+def type_descriptor(arg):
+    descriptor = getattr(arg, "descriptor", None)
+    if descriptor is None:
+        descriptor = describe_type(arg)
+        if hasattr(arg, "descriptor"):
+            arg.descriptor = descriptor
+    return descriptor
+
+# Type an element is generated as: its type, or the implicit UInt8 array of a
+#   ByteBuffer. The parsed model keeps the ByteBuffer.
+def element_type(arg):
+    return type_descriptor(arg).type
+
+# Type a map key or value is generated as, see element_type
+def generated_type(item_type):
+    if(item_type.name == 'ByteBuffer'):
+        return BYTE_BUFFER_TYPE
+    return item_type
+
+def annotate_namespace(namespace):
+    for item in namespace.arrays.values():
+        annotate_element(item)
+    for struct in namespace.structs.values():
+        for field in struct.fields.values():
+            annotate_element(field)
+    if(isinstance(namespace, ast.Interface)):
+        for attribute in namespace.attributes.values():
+            annotate_element(attribute)
+        for method in namespace.methods.values():
+            for arg in method.in_args.values():
+                annotate_element(arg)
+            for arg in method.out_args.values():
+                annotate_element(arg)
+        for broadcast in namespace.broadcasts.values():
+            for arg in broadcast.out_args.values():
+                annotate_element(arg)
+
+def annotate_element(arg):
+    try:
+        arg.descriptor = describe_type(arg)
+    except ProcessorException:
+        # Unresolved lazy reference, see resolve_lazy_references
+        return
+    # Implicit arrays are classified as elements of their own, too
+    item_type = arg.descriptor.type
+    if(isinstance(item_type, ast.Array) and item_type.name is None):
+        item_type.descriptor = describe_type(item_type)
+
+# Classify every typed element of the packages once. Emitters read the
+#   descriptors through check_type_ver2 and type_descriptor. Run again after
+#   the model changed.
+def annotate_types(packages):
+    clear_conversion_snippets()
+    clear_inherited_members()
+    for package in packages.values():
+        for typecollection in package.typecollections.values():
+            annotate_namespace(typecollection)
+        for interface in package.interfaces.values():
+            annotate_namespace(interface)
+
+# Function for checking the data type of an element
+def check_type_ver2(arg, interface):
+    descriptor = type_descriptor(arg)
+    if(descriptor.error):
+        raise Exception(descriptor.error)
+    if(descriptor.local_name is not None):
+        if(descriptor.code == 6 and descriptor.local_name in interface.arrays):
+            return 3 # explicit array in interface
+        if(descriptor.code == 7 and descriptor.local_name in interface.structs):
+            return 4
+    return descriptor.code
 
 # Not in use
 def check_type(typename, interface):
@@ -915,10 +2158,11 @@ def upcast_cpp_int(typename):
 def struct_fields(struct, java_class):
     fields_str = ""
     #fields_construct_str = ""
-    for field in struct.values():        
-        if(field.type.name is None):
-            if(isinstance(field.type.type, ast.Reference)):
-                depth_check = field.type
+    for field in struct.values():
+        item_type = element_type(field)
+        if(item_type.name is None):
+            if(isinstance(item_type.type, ast.Reference)):
+                depth_check = item_type
                 array_depth = ""
                 while(isinstance(depth_check.type, ast.Reference)):
                     array_depth += "["
@@ -926,17 +2170,17 @@ def struct_fields(struct, java_class):
                         depth_check = depth_check.type.reference
                     else:
                         break
-                if(isinstance(field.type.type.reference, ast.Struct)):
-                    fields_str += "{}L{}{}JNI${};".format(array_depth, java_class,field.type.type.reference.namespace.name,field.type.type.reference.name)
-                elif(isinstance(field.type.reference.type.reference, ast.Array)):
-                    fields_str += "{}[{}".format(convert_jni_type(array_depth,field.type.type.reference.name))
+                if(isinstance(item_type.type.reference, ast.Struct)):
+                    fields_str += "{}L{}{}JNI${};".format(array_depth, java_class,item_type.type.reference.namespace.name,item_type.type.reference.name)
+                elif(isinstance(item_type.reference.type.reference, ast.Array)):
+                    fields_str += "{}[{}".format(convert_jni_type(array_depth,item_type.type.reference.name))
             else:
-                fields_str += "[{}".format(convert_jni_type(field.type.type.name))
+                fields_str += "[{}".format(convert_jni_type(item_type.type.name))
         else:
-            if(isinstance(field.type, ast.Reference)):
-                if(isinstance(field.type.reference, ast.Array)):
-                    if(isinstance(field.type.reference.type, ast.Reference)):
-                        depth_check = field.type.reference
+            if(isinstance(item_type, ast.Reference)):
+                if(isinstance(item_type.reference, ast.Array)):
+                    if(isinstance(item_type.reference.type, ast.Reference)):
+                        depth_check = item_type.reference
                         array_depth = ""
                         while(isinstance(depth_check.type, ast.Reference)):
                             array_depth += "["
@@ -944,26 +2188,26 @@ def struct_fields(struct, java_class):
                                 depth_check = depth_check.type.reference
                             else:
                                 break
-                        if(isinstance(field.type.reference.type.reference, ast.Struct)):
+                        if(isinstance(item_type.reference.type.reference, ast.Struct)):
                             fields_str += "{}L{}{}JNI${};".format(array_depth, java_class,depth_check.type.reference.namespace.name,depth_check.type.reference.name)
-                        elif(isinstance(field.type.reference.type.reference, ast.Array)):
-                            fields_str += "{}[{}".format(convert_jni_type(array_depth,field.type.reference.type.name))
+                        elif(isinstance(item_type.reference.type.reference, ast.Array)):
+                            fields_str += "{}[{}".format(convert_jni_type(array_depth,item_type.reference.type.name))
                     else:
-                        if(len(field.type.name.split('.')) > 1 ):
-                            fields_str += "[{}".format(convert_jni_type(field.type.reference.type.name))
+                        if(len(item_type.name.split('.')) > 1 ):
+                            fields_str += "[{}".format(convert_jni_type(item_type.reference.type.name))
                         else:
-                            fields_str += "[{}".format(convert_jni_type(field.type.reference.type.name))
-                elif(isinstance(field.type.reference, ast.Struct)):
-                    if(len(field.type.name.split('.')) > 1 ):
+                            fields_str += "[{}".format(convert_jni_type(item_type.reference.type.name))
+                elif(isinstance(item_type.reference, ast.Struct)):
+                    if(len(item_type.name.split('.')) > 1 ):
                         ### Interface와 TypeCollection에 동일한 이름을 가진 데이터구조가 존재할 경우 interface의 것으로 override 되는 문제점 존재
                         #### ARXML에서 TypeCollection을 지원하지 않음에 따라 더 이상 typeCollection에 대한 코드 업데이트는 하지 않음.
-                        fields_str += "L{}{}JNI${};".format(java_class,field.type.name.split('.')[0],field.type.reference.name)
+                        fields_str += "L{}{}JNI${};".format(java_class,item_type.name.split('.')[0],item_type.reference.name)
                     else:
-                        fields_str += "L{}{}JNI${};".format(java_class,field.type.reference.namespace.name,field.type.reference.name)
-                elif(isinstance(field.type.reference, ast.Enumeration)):
+                        fields_str += "L{}{}JNI${};".format(java_class,item_type.reference.namespace.name,item_type.reference.name)
+                elif(isinstance(item_type.reference, ast.Enumeration)):
                     fields_str += "B"
             else:
-                fields_str += convert_jni_type(field.type.name)
+                fields_str += convert_jni_type(item_type.name)
     
     # print(fields_str)
     
@@ -975,7 +2219,7 @@ def array_in_struct_gen(array,attribute_low, field, packages, interface, is_sub
     array_name = array.name
     field_name = capitalize_first_letter(field.name)
     if check_type_ver2(array,interface) == 1:
-        type_array = capitalize_first_letter(convert_aidl_type(array.type.name))
+        type_array = capitalize_first_letter(type_spelling(array.type.name).aidl)
     else:
         type_array = "Object"
 
@@ -1035,6 +2279,8 @@ def array_in_struct_gen(array,attribute_low, field, packages, interface, is_sub
     return arr_str
 
 ## struct의 세부 field에 따라 코드 생성하는 함수
+@memoized_snippet("field_name_extends")
+@profiled_recursion
 def struct_fields_sub_gen(attribute, interface, packages, java_class, field_name_extends="", is_sub = True, depth=0):
     fields_str = ""
     type_checked = 0
@@ -1120,7 +2366,7 @@ def struct_fields_sub_gen(attribute, interface, packages, java_class, field_name
             fields_str += ");"
         ## None type array
         elif(type_checked == 5):
-            array = field.type
+            array = element_type(field)
             fields_str += array_in_struct_gen(array,attribute_low, field, packages, java_class, is_sub)
         ## TypeColleciton Array
         elif(type_checked == 6):
@@ -1207,6 +2453,8 @@ def struct_fields_sub_gen(attribute, interface, packages, java_class, field_name
     return fields_str
 
 # Set 할 때 필요한 코드 생성 함수, set call 이전과 set call 이후 두 가지 str 반환
+@memoized_snippet("field_name_extends")
+@profiled_recursion
 def struct_fields_set_gen(attribute, interface, packages, java_class, field_name_extends="", is_complex=False, is_implicit=False, depth=0):
     fields_str = ""
     fields_str_after = ""
@@ -1250,7 +2498,7 @@ def struct_fields_set_gen(attribute, interface, packages, java_class, field_name
             #field_name = capitalize_first_letter(field.name)
             #field_name_low = lower_first_letter(field.name)
             fields_str += f"""\n\t\tjfieldID {attribute_low}{field_name}FID = {env}->GetFieldID({defined}{attribute.type.reference.name}Clazz, \"{field_name_low}\", \"{field_type_jni}\");"""
-            fields_str += f"""\n\t\t{field_type_java} {attribute_low}{field_name} = {env}->Get{capitalize_first_letter(convert_aidl_type(field.type.name))}Field({attribute_low}, {attribute_low}{field_name}FID);"""
+            fields_str += f"""\n\t\t{field_type_java} {attribute_low}{field_name} = {env}->Get{capitalize_first_letter(type_spelling(field.type.name).aidl)}Field({attribute_low}, {attribute_low}{field_name}FID);"""
             fields_str += f"""
         _{attribute_low}.set{field_name}(static_cast<{field_type_cpp}>({attribute_low}{field_name}));"""
             fields_str_after += f"""\n\t\t{attribute_low}{field_name} = static_cast<{field_type_java}>(_{attribute_low}Response.get{field_name}());"""
@@ -1271,7 +2519,7 @@ def struct_fields_set_gen(attribute, interface, packages, java_class, field_name
             if(type_checked == 3):
                 array = interface.arrays[field.type.name]
             elif(type_checked == 5):
-                array = field.type
+                array = element_type(field)
             elif(type_checked == 6):
                 array = field.type.reference
             type_jni_array = convert_jni_type(array.type.name)
@@ -1282,7 +2530,7 @@ def struct_fields_set_gen(attribute, interface, packages, java_class, field_name
             if(array.type.name != "String"):
                 fields_str += f"""\n\t\tjfieldID {attribute_low}{field_name}FID = {env}->GetFieldID({defined}{attribute.type.reference.name}Clazz, \"{field_name_low}\", \"[{type_jni_array}\");
         {type_java_array}Array {attribute_low}{field_name} = reinterpret_cast<{type_java_array}Array>({env}->GetObjectField({attribute_low},{attribute_low}{field_name}FID));
-        {type_java_array}* {attribute_low}{field_name}Data = {env}->Get{capitalize_first_letter(convert_aidl_type(array.type.name))}ArrayElements({attribute_low}{field_name}, nullptr);
+        {type_java_array}* {attribute_low}{field_name}Data = {env}->Get{capitalize_first_letter(type_spelling(array.type.name).aidl)}ArrayElements({attribute_low}{field_name}, nullptr);
         jsize {attribute_low}{field_name}Length = {env}->GetArrayLength({attribute_low}{field_name});"""
             ## String array, set
             else:
@@ -1320,7 +2568,7 @@ def struct_fields_set_gen(attribute, interface, packages, java_class, field_name
                 fields_str_after += f"""\n\t\t_{attribute_low}{field_name} = _{attribute_low}Response.get{field_name}();{temp_cast}
         {attribute_low}{field_name}Data = static_cast<{type_java_array}*>(_{attribute_low}{field_name}{temp}.data());
         {attribute_low}{field_name}Length = static_cast<jsize>(_{attribute_low}{field_name}{temp}.size());
-        {env}->Set{capitalize_first_letter(convert_aidl_type(array.type.name))}ArrayRegion({attribute_low}{field_name}, 0, {attribute_low}{field_name}Length, {attribute_low}{field_name}Data);"""
+        {env}->Set{capitalize_first_letter(type_spelling(array.type.name).aidl)}ArrayRegion({attribute_low}{field_name}, 0, {attribute_low}{field_name}Length, {attribute_low}{field_name}Data);"""
             ## String array, get
             else:
                 fields_str_after += f"""
@@ -1459,6 +2707,7 @@ def struct_fields_set_gen(attribute, interface, packages, java_class, field_name
     return fields_str, fields_str_after
 
 ##################  Complex Array Code Gen  ###################
+@memoized_snippet("field_name_extends")
 def struct_fields_for_complex_array(attribute, interface, packages, java_class, field_name_extends="", is_sub = True, is_implicit=False, is_get=False, depth=0, is_method_out = False):
     fields_str = ""
     type_checked = 0
@@ -1536,7 +2785,7 @@ def struct_fields_for_complex_array(attribute, interface, packages, java_class,
             fields_str += ");"
         ## None type array
         elif(type_checked == 5):
-            array = field.type
+            array = element_type(field)
             fields_str += array_in_struct_gen(array,attribute_low, field, packages, java_class, is_sub)
         ## TypeColleciton Array
         elif(type_checked == 6):
@@ -1622,6 +2871,8 @@ def struct_fields_for_complex_array(attribute, interface, packages, java_class,
     return fields_str
 
 
+@memoized_snippet("field_name_extends")
+@profiled_recursion
 def complex_array(attribute, interface, packages, java_class, field_name_extends="", is_sub=0, is_implicit=False, depth=0):
     src_str = ""
     
@@ -1704,10 +2955,8 @@ def complex_array(attribute, interface, packages, java_class, field_name_extends
                 struct_for_loop = struct_for_loop.replace(f"_{attribute_low}.get", f"_{attribute_low}Response[i{for_loop_depth}].get")
             else:
                 struct_for_loop = struct_for_loop.replace(f"_{attribute_low}.get", f"_{attribute_low}[i{for_loop_depth}].get")
-            struct_for_loop_lines = struct_for_loop.split('\n')
             if(is_sub == 0):
-                struct_for_loop_lines = ['\t' + indentation[:-1] + line for line in struct_for_loop_lines]
-            struct_for_loop = '\n'.join(struct_for_loop_lines)
+                struct_for_loop = indent_lines(struct_for_loop, '\t' + indentation[:-1])
         
         struct_set_for_loop = ""
         struct_set_after = ""
@@ -1715,9 +2964,7 @@ def complex_array(attribute, interface, packages, java_class, field_name_extends
             struct_set_for_loop, struct_set_after = struct_fields_set_gen(attribute, interface, packages, java_class, field_name_extends=field_name_extends, is_complex=True, is_implicit=is_implicit, depth=depth)
             struct_set_for_loop = struct_set_for_loop.replace(f"_{attribute_low}.set", f"_{attribute_low}[i{for_loop_depth}].set")
             struct_set_for_loop = struct_set_for_loop.replace(f"{attribute_low},", f"{attribute_low}Obj,")
-            struct_for_loop_lines = struct_set_for_loop.split('\n')
-            struct_for_loop_lines = ['\t' + indentation[:-1] + line for line in struct_for_loop_lines]
-            struct_set_for_loop = '\n'.join(struct_for_loop_lines)
+            struct_set_for_loop = indent_lines(struct_set_for_loop, '\t' + indentation[:-1])
 
         if(is_sub == 0):
             src_str += f"""
@@ -1909,6 +3156,7 @@ def check_type_map(arg, interface):
     else:
         return -1
 
+@memoized_snippet("map_name", "upper")
 def map_struct_cast(value, interface, java_class, map_name, upper="", indentation=0, is_key = False, is_set = False, is_sub=True):
     cast_str = ""
     pair = ".second"
@@ -1938,7 +3186,6 @@ def map_struct_cast(value, interface, java_class, map_name, upper="", indentatio
                 """
                     cast_str += map_struct_cast(field,interface,java_class,upper,upper=field.name, indentation=indentation+1, is_key=is_key, is_set=is_set, is_sub=is_sub)
                 if(not is_sub):
-                    print(map_name)
                     cast_str += f"""jclass {field.reference.namespace.name}{field.reference.name}Clazz = env->FindClass("{java_class}{field.reference.namespace.name}JNI${field.reference.name}");
                 jmethodID {field.reference.namespace.name}{field.reference.name}Constructor = env->GetMethodID({field.reference.namespace.name}{field.reference.name}Clazz, "<init>", "({struct_fields(field,java_class)}V)");
                 """
@@ -1979,7 +3226,7 @@ def map_struct_cast(value, interface, java_class, map_name, upper="", indentatio
 def map_key_value_cast(map, interface, java_class, is_key = True, is_set = False, is_sub=True):
     cast_str = ""
     key_type = map.type.reference.key_type
-    value_type = map.type.reference.value_type
+    value_type = generated_type(map.type.reference.value_type)
     type = key_type
     type_checked = 0
     k_or_v = ""
@@ -1997,7 +3244,7 @@ def map_key_value_cast(map, interface, java_class, is_key = True, is_set = False
     # sub or get
     if(not is_set):
         if(type_checked == 1):
-            cast_str += f"""{convert_java_type(type.name)} {map_low}{k_or_v} = static_cast<{convert_java_type(type)}>(pair{pair});"""
+            cast_str += f"""{convert_java_type(type.name)} {map_low}{k_or_v} = static_cast<{convert_java_type(type.name)}>(pair{pair});"""
         elif(type_checked == 2):
             cast_str += f"""{convert_java_type(type.name)} {map_low}{k_or_v} = env->NewStringUTF((pair{pair}).c_str());"""
         elif(type_checked == 4):
@@ -2043,7 +3290,7 @@ def map_key_value_cast(map, interface, java_class, is_key = True, is_set = False
         if(type_checked == 1):
             cast_str += f"""jfieldID {map_low}{k_or_v}FID = env->GetFieldID({map.type.reference.namespace.name}{map.type.reference.name}Clazz, "{lower_first_letter(k_or_v)}", "{convert_jni_type(type.name)}");
             {convert_java_type(type.name)} {map_low}{k_or_v} = env->GetObjectField({map_low}Obj, {map_low}{k_or_v}FID);
-            {convert_cpp_type(type.name)} _{map_low}{k_or_v} = static_cast<{convert_cpp_type(type)}>({map_low}{k_or_v});"""
+            {convert_cpp_type(type.name)} _{map_low}{k_or_v} = static_cast<{convert_cpp_type(type.name)}>({map_low}{k_or_v});"""
         elif(type_checked == 2):
             cast_str += f"""jfieldID {map_low}{k_or_v}FID = env->GetFieldID({map.type.reference.namespace.name}{map.type.reference.name}Clazz, "{lower_first_letter(k_or_v)}", "{convert_jni_type(type.name)}");
             {convert_java_type(type.name)} {map_low}{k_or_v} = (jstring)env->GetObjectField({map_low}Obj, {map_low}{k_or_v}FID);
@@ -2093,13 +3340,33 @@ def generate_src_map(map, package_name, interface, java_package_name, upper="",
     if(upper != ""):
         upper = upper + "."
         
-    # ByteBuffer check
     check_type_map(map.type.reference.key_type, interface)
     check_type_map(map.type.reference.value_type, interface)
-    if(map.type.reference.value_type.name == 'ByteBuffer'):
-        map.type.reference.value_type = ast.Array(name=None, element_type=ast.Array(name="UInt8", element_type=ast.UInt8()))
-        #print("FFFF", dir(map.type.reference.value_type), map.type.reference.value_type.name)
-    #
+    # map은 {Namespace}Conversions.hpp의 공유 변환 함수로 변환, 호출하는 쪽이 쓰는 변수 이름은 그대로 둠
+    shared = shared_map_conversion(map)
+    if(shared is not None):
+        prefix = conversion_prefix(shared)
+        if(type == 0):
+            map_str += f"""
+            jmethodID {map_cap}MID = {env}->GetMethodID({interface.name}Clazz, "subAttribute{map_cap}Handler", "([L{java_package_name}{shared.namespace.name}JNI${shared.name};)V");
+            jobjectArray {map_low} = {prefix}MapToJava({env}, _{map_low});
+            """
+        elif(type == 1 or type == 4):
+            map_str += f"""
+        jobjectArray {map_low} = {prefix}MapToJava({env}, _{map_low});
+        """
+        elif(type == 2):
+            map_str += f"""
+        {shared.namespace.name}::{shared.name} _{map_low} = {prefix}MapFromJava({env}, {map_low});
+        {shared.namespace.name}::{shared.name} _{map_low}Response;
+        """
+        elif(type == 3):
+            map_str += f"""
+        jobjectArray {map_low}Response = {prefix}MapToJava({env}, _{map_low}Response);
+        """
+        return map_str
+    # ByteBuffer check
+    value_type = generated_type(map.type.reference.value_type)
     
     indent = "s"*indentation
     key_constructor = ""
@@ -2108,16 +3375,15 @@ def generate_src_map(map, package_name, interface, java_package_name, upper="",
         key_constructor = "L"+java_package_name+map.type.reference.namespace.name+"JNI${}".format(map.type.reference.key_type.name) +";"
     else:
         key_constructor = convert_jni_type(map.type.reference.key_type.name)
-    if(isinstance(map.type.reference.value_type, ast.Reference)):
-        if(isinstance(map.type.reference.value_type.reference, ast.Struct)):
-            value_constructor = "L"+java_package_name+map.type.reference.namespace.name+"JNI${}".format(map.type.reference.value_type.name) +";"
-        elif(isinstance(map.type.reference.value_type.reference, ast.Array)):
-            value_constructor = "["+ convert_jni_type(map.type.reference.value_type.reference.type.name)
-    elif(isinstance(map.type.reference.value_type, ast.Array)):
-        #print(convert_jni_type(map.type.reference.value_type.type.name))
-        value_constructor = "["+ convert_jni_type(map.type.reference.value_type.type.name)
+    if(isinstance(value_type, ast.Reference)):
+        if(isinstance(value_type.reference, ast.Struct)):
+            value_constructor = "L"+java_package_name+map.type.reference.namespace.name+"JNI${}".format(value_type.name) +";"
+        elif(isinstance(value_type.reference, ast.Array)):
+            value_constructor = "["+ convert_jni_type(value_type.reference.type.name)
+    elif(isinstance(value_type, ast.Array)):
+        value_constructor = "["+ convert_jni_type(value_type.type.name)
     else:
-        value_constructor = convert_jni_type(map.type.reference.value_type.name)
+        value_constructor = convert_jni_type(value_type.name)
     
     
     # init
@@ -2215,51 +3481,553 @@ def generate_src_map(map, package_name, interface, java_package_name, upper="",
     
     return map_str
 
-################################### Attribute ############################
+############################### Shared conversion functions ###############################
+# struct, struct 배열과 map의 SOME/IP <-> Java 변환을 사용하는 곳마다 펼치지 않고, namespace 별 헤더 src/{Namespace}Conversions.hpp에
+#   struct 당 한 번 생성한 {Namespace}{Struct}ToJava / FromJava, map 당 {Namespace}{Map}MapToJava / MapFromJava 함수를 호출함.
+#   Map을 가진 struct는 struct_fields가 map field의 JNI signature를 만들지 않으므로 지금처럼 사용하는 곳에서 변환함
+CONVERSION_HEADER_TEMPLATE = code_template("""// Auto-generated by FIDL-SRC Converter
+// Filename: {namespace}Conversions.hpp
+
+#ifndef {guard}
+#define {guard}
+
+#include <string>
+#include <vector>
+#include <jni.h>
+#include "{type_header}"
+{includes}""")
+
+CONVERSION_CLASS_TEMPLATE = code_template("""
+inline jclass &{prefix}Class(){{
+    static jclass clazz = nullptr;
+    return clazz;
+}}
+""")
+
+CONVERSION_ARRAY_TEMPLATE = code_template("""
+inline jobjectArray {prefix}ArrayToJava(JNIEnv *env, const std::vector<{cpp_type}> &values){{
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), {prefix}Class(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){{
+        jobject item = {prefix}ToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }}
+    return array;
+}}
 
-def generate_src_attribute(attribute, package_name, interface, java_package_name):
-    env = "env"
-    package_names = package_name.split('.')
-    src_str = ""
-    attr_type = attribute.type.name
-    java_package = ""
-    java_class = ""
-    version = interface.version.major
-    for name in java_package_name:
-        java_package += "{}_".format(name)
-        java_class += "{}/".format(name)
-    # interface_cap = capitalize_first_letter(interface.name)
-    interface_cap = interface.name
-    interface_low = lower_first_letter(interface.name)
-    attribute_cap = capitalize_first_letter(attribute.name)
-    attribute_low = lower_first_letter(attribute.name)
-    reference_cap = ""
-    reference_type = ""
-    interface_extension = "JNI"
-    if(isinstance(attribute.type, ast.Reference)):
-        reference_cap = capitalize_first_letter(attribute.type.reference.namespace.name)
-        reference_type = attribute.type.reference.name
+inline std::vector<{cpp_type}> {prefix}ArrayFromJava(JNIEnv *env, jobjectArray array){{
+    std::vector<{cpp_type}> values;
+    if(array == nullptr){{
+        return values;
+    }}
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){{
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back({prefix}FromJava(env, item));
+        env->DeleteLocalRef(item);
+    }}
+    return values;
+}}
+""")
 
-    type_cpp = convert_cpp_type(attr_type)
-    type_jni = convert_jni_type(attr_type)
-    type_java = convert_java_type(attr_type)
-    array_name = attribute.type.name
-    struct_name = attribute.type.name
-    cpp_package = "::v{}".format(version)
-    for name in package_names:
-        cpp_package += "::{}".format(name)
-    
-    ### type validation
-    type_checked = check_type_ver2(attribute, interface)
-    
-    if(type_checked < 1 or type_checked > 11):
-        return src_str
-    ###
-    
-    array = ""
-    type_array = ""
-    type_jni_array = ""
-    type_java_array = ""
+# 상속된 멤버를 생성하는 base 복사본의 실제 이름, inherited_members 참고
+renamed_namespaces = {}
+
+def namespace_name(namespace):
+    """
+    Name of namespace in the CommonAPI headers, also for the copy of a base
+        interface its inherited members are generated on.
+    """
+    return renamed_namespaces.get(namespace, namespace.name)
+
+def conversion_prefix(struct):
+    return namespace_name(struct.namespace) + struct.name
+
+def cpp_qualified_name(item):
+    """
+    Fully qualified CommonAPI C++ name of a struct, array or enumeration.
+    """
+    namespace = item.namespace
+    qualified = "::v{}".format(namespace.version.major) if namespace.version is not None else ""
+    for name in namespace.package.name.split("."):
+        qualified += "::{}".format(name)
+    return "{}::{}::{}".format(qualified, namespace_name(namespace), item.name)
+
+def conversion_element_supported(descriptor):
+    spelling = descriptor.element_spelling
+    return spelling is not None and (spelling.name in PRIMITIVE_TYPE_NAMES or spelling.name == "String")
+
+def conversion_supported(struct, visiting=()):
+    """
+    Whether the shared functions convert struct: every field, nested
+        structs included, is a primitive, String, enumeration, struct, one
+        dimensional array of those or array of structs.
+    """
+    if(struct in visiting):
+        return False
+    visiting += (struct,)
+    for field in struct.fields.values():
+        descriptor = type_descriptor(field)
+        if(descriptor.error or descriptor.code is None):
+            return False
+        if(descriptor.code in (5, 6)):
+            if(not conversion_element_supported(descriptor)):
+                return False
+        elif(descriptor.code == 7):
+            if(not conversion_supported(descriptor.target, visiting)):
+                return False
+        elif(descriptor.code in (9, 10)):
+            if(not conversion_supported(descriptor.element, visiting)):
+                return False
+        elif(descriptor.code not in (1, 2, 8)):
+            return False
+    return True
+
+def shared_conversion(arg):
+    """
+    Struct of arg converted by the shared functions, for a struct or an
+        array of structs, None if arg is converted where it is used.
+    """
+    descriptor = type_descriptor(arg)
+    if(descriptor.error):
+        return None
+    if(descriptor.code == 7):
+        struct = descriptor.target
+    elif(descriptor.code in (9, 10)):
+        struct = descriptor.element
+    else:
+        return None
+    return struct if conversion_supported(struct) else None
+
+class MapEntry(object):
+    """
+    Key or value of a map as a typed element, for describe_type.
+    """
+    __slots__ = ("name", "type")
+
+    def __init__(self, name, item_type):
+        self.name = name
+        self.type = item_type
+
+def map_entry_descriptors(item):
+    return describe_type(MapEntry("key", item.key_type)), describe_type(MapEntry("value", item.value_type))
+
+def map_entry_supported(item, descriptor, codes):
+    # The Java class of a map declares enumerations and structs by their bare name,
+    #   so only structs of the map's own namespace resolve there. Maps with other
+    #   entries keep the conversion where they are used.
+    if(descriptor.error or descriptor.code not in codes):
+        return False
+    if(descriptor.code in (5, 6)):
+        return conversion_element_supported(descriptor)
+    if(descriptor.code == 7):
+        return descriptor.target.namespace is item.namespace and conversion_supported(descriptor.target)
+    return True
+
+def map_conversion_supported(item):
+    """
+    Whether the shared functions convert the map item: the key is a
+        primitive, String or struct, the value one of those or a one
+        dimensional array of primitives or Strings.
+    """
+    key, value = map_entry_descriptors(item)
+    return map_entry_supported(item, key, (1, 2, 7)) and map_entry_supported(item, value, (1, 2, 5, 6, 7))
+
+def shared_map_conversion(arg):
+    """
+    Map of arg converted by the shared functions, None if arg is not a map
+        or the map is converted where it is used.
+    """
+    descriptor = type_descriptor(arg)
+    if(descriptor.error or descriptor.code != 11):
+        return None
+    return descriptor.target if map_conversion_supported(descriptor.target) else None
+
+def conversion_nesting(struct, visiting=()):
+    """
+    Nesting of the shared conversion functions of struct, the levels the
+        inline emitters recurse for it.
+
+    :return: Tuple of the levels of structs in struct fields and of the
+        levels of struct arrays.
+    """
+    visiting += (struct,)
+    structs = 1
+    arrays = 0
+    for field in struct.fields.values():
+        descriptor = type_descriptor(field)
+        if(descriptor.code == 7 and descriptor.target not in visiting):
+            nested, nested_arrays = conversion_nesting(descriptor.target, visiting)
+            structs = max(structs, nested + 1)
+            arrays = max(arrays, nested_arrays)
+        elif(descriptor.code in (9, 10)):
+            arrays = max(arrays, 1)
+    return structs, arrays
+
+def profile_conversion(arg, shared, *emitters):
+    """
+    Record in generation_profile the nesting of the shared conversion
+        functions a member calls for arg, as the recursive emitters would
+        have recursed for it.
+
+    :param shared: Struct of arg, see shared_conversion, nothing is recorded if None.
+    :param emitters: struct_fields_sub_gen for the conversion to Java,
+        struct_fields_set_gen for the conversion from Java.
+    """
+    profile = generation_profile
+    if(profile is None or shared is None):
+        return
+    structs, arrays = conversion_nesting(shared)
+    if(type_descriptor(arg).code in (9, 10)):
+        arrays += 1
+    for emitter in emitters:
+        profile.reach(emitter, structs)
+    if(arrays):
+        profile.reach("complex_array", arrays)
+
+def has_conversions(namespace):
+    return (any(conversion_supported(struct) for struct in namespace.structs.values())
+            or any(map_conversion_supported(item) for item in namespace.maps.values()))
+
+def conversion_namespaces(interface):
+    """
+    Names of the namespaces whose conversion headers the client of
+        interface includes, for its own and its inherited members.
+    """
+    names = []
+    for namespace in [interface] + interface_ancestors(interface):
+        args = list(namespace.attributes.values())
+        for method in namespace.methods.values():
+            args += list(method.in_args.values()) + list(method.out_args.values())
+        for broadcast in namespace.broadcasts.values():
+            args += list(broadcast.out_args.values())
+        for arg in args:
+            shared = shared_conversion(arg) or shared_map_conversion(arg)
+            if(shared is not None and shared.namespace.name not in names):
+                names.append(shared.namespace.name)
+    return names
+
+def conversion_to_java(descriptor, local, source, items):
+    """
+    Statements converting the C++ expression source to the JNI value local,
+        and whether local is a local reference. items names the reference
+        to an array source.
+    """
+    if(descriptor.code == 1):
+        return "    {0} {1} = static_cast<{0}>({2});\n".format(descriptor.spelling.java, local, source), False
+    elif(descriptor.code == 2):
+        return "    jstring {} = env->NewStringUTF({}.c_str());\n".format(local, source), True
+    elif(descriptor.code == 8):
+        return "    jbyte {} = static_cast<jbyte>(static_cast<uint8_t>({}));\n".format(local, source), False
+    elif(descriptor.code == 7):
+        return "    jobject {} = {}ToJava(env, {});\n".format(local, conversion_prefix(descriptor.target), source), True
+    elif(descriptor.code in (9, 10)):
+        return "    jobjectArray {} = {}ArrayToJava(env, {});\n".format(local, conversion_prefix(descriptor.element), source), True
+    elif(descriptor.element_spelling.name == "String"):
+        return f"""    const auto &{items} = {source};
+    jobjectArray {local} = env->NewObjectArray(static_cast<jsize>({items}.size()), env->FindClass("java/lang/String"), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>({items}.size()); i++){{
+        jstring item = env->NewStringUTF({items}[i].c_str());
+        env->SetObjectArrayElement({local}, i, item);
+        env->DeleteLocalRef(item);
+    }}
+""", True
+    element = descriptor.element_spelling
+    array_type = capitalize_first_letter(element.java_code)
+    return f"""    const auto &{items} = {source};
+    std::vector<{element.java}> {local}Data({items}.begin(), {items}.end());
+    {element.java}Array {local} = env->New{array_type}Array(static_cast<jsize>({local}Data.size()));
+    env->Set{array_type}ArrayRegion({local}, 0, static_cast<jsize>({local}Data.size()), {local}Data.data());
+""", True
+
+def conversion_from_java(descriptor, local, store):
+    """
+    Statements reading the JNI field {local}FID of object and passing the
+        converted C++ value to store, a format string with one field.
+    """
+    if(descriptor.code == 1):
+        return "    {};\n".format(store.format("static_cast<{}>(env->Get{}Field(object, {}FID))".format(descriptor.spelling.cpp, capitalize_first_letter(descriptor.spelling.java_code), local)))
+    elif(descriptor.code == 2):
+        return f"""    jstring {local} = static_cast<jstring>(env->GetObjectField(object, {local}FID));
+    if({local} != nullptr){{
+        const char *{local}Chars = env->GetStringUTFChars({local}, nullptr);
+        {store.format("std::string({}Chars)".format(local))};
+        env->ReleaseStringUTFChars({local}, {local}Chars);
+        env->DeleteLocalRef({local});
+    }}
+"""
+    elif(descriptor.code == 8):
+        return "    {};\n".format(store.format("{}::Literal(static_cast<uint8_t>(env->GetByteField(object, {}FID)))".format(cpp_qualified_name(descriptor.target), local)))
+    elif(descriptor.code == 7):
+        return f"""    jobject {local} = env->GetObjectField(object, {local}FID);
+    {store.format("{}FromJava(env, {})".format(conversion_prefix(descriptor.target), local))};
+    env->DeleteLocalRef({local});
+"""
+    elif(descriptor.code in (9, 10)):
+        return f"""    jobjectArray {local} = static_cast<jobjectArray>(env->GetObjectField(object, {local}FID));
+    {store.format("{}ArrayFromJava(env, {})".format(conversion_prefix(descriptor.element), local))};
+    env->DeleteLocalRef({local});
+"""
+    element = descriptor.element_spelling
+    if(descriptor.code == 6):
+        array_cpp = cpp_qualified_name(descriptor.target)
+    else:
+        array_cpp = "std::vector<{}>".format(element.cpp)
+    if(element.name == "String"):
+        return f"""    jobjectArray {local} = static_cast<jobjectArray>(env->GetObjectField(object, {local}FID));
+    if({local} != nullptr){{
+        {array_cpp} {local}Value;
+        jsize {local}Length = env->GetArrayLength({local});
+        for(jsize i = 0; i < {local}Length; i++){{
+            jstring item = static_cast<jstring>(env->GetObjectArrayElement({local}, i));
+            const char *itemChars = env->GetStringUTFChars(item, nullptr);
+            {local}Value.push_back(std::string(itemChars));
+            env->ReleaseStringUTFChars(item, itemChars);
+            env->DeleteLocalRef(item);
+        }}
+        {store.format(local + "Value")};
+        env->DeleteLocalRef({local});
+    }}
+"""
+    array_type = capitalize_first_letter(element.java_code)
+    return f"""    {element.java}Array {local} = static_cast<{element.java}Array>(env->GetObjectField(object, {local}FID));
+    if({local} != nullptr){{
+        jsize {local}Length = env->GetArrayLength({local});
+        {element.java} *{local}Data = env->Get{array_type}ArrayElements({local}, nullptr);
+        {store.format("{0}({1}Data, {1}Data + {1}Length)".format(array_cpp, local))};
+        env->Release{array_type}ArrayElements({local}, {local}Data, JNI_ABORT);
+        env->DeleteLocalRef({local});
+    }}
+"""
+
+def generate_struct_to_java(struct, java_class):
+    prefix = conversion_prefix(struct)
+    body = CodeBuffer()
+    arguments = []
+    local_refs = []
+    for field in struct.fields.values():
+        field_cap = capitalize_first_letter(field.name)
+        local = "field" + field_cap
+        arguments.append(local)
+        code, local_ref = conversion_to_java(type_descriptor(field), local, "value.get{}()".format(field_cap), "value" + field_cap)
+        body += code
+        if(local_ref):
+            local_refs.append(local)
+    code = CodeBuffer("\ninline jobject {}ToJava(JNIEnv *env, const {} &value){{\n".format(prefix, cpp_qualified_name(struct)))
+    code += "    static jmethodID constructor = env->GetMethodID({}Class(), \"<init>\", \"({})V\");\n".format(prefix, struct_fields(struct.fields, java_class))
+    code += body.getvalue()
+    code += "    jobject object = env->NewObject({}Class(), constructor{});\n".format(prefix, "".join(", " + argument for argument in arguments))
+    for local in local_refs:
+        code += "    env->DeleteLocalRef({});\n".format(local)
+    code += "    return object;\n}\n"
+    return code.getvalue()
+
+def generate_struct_from_java(struct, java_class):
+    prefix = conversion_prefix(struct)
+    cpp_type = cpp_qualified_name(struct)
+    code = CodeBuffer(f"""
+inline {cpp_type} {prefix}FromJava(JNIEnv *env, jobject object){{
+    {cpp_type} value;
+    if(object == nullptr){{
+        return value;
+    }}
+""")
+    for field in struct.fields.values():
+        field_cap = capitalize_first_letter(field.name)
+        local = "field" + field_cap
+        code += "    static jfieldID {}FID = env->GetFieldID({}Class(), \"{}\", \"{}\");\n".format(local, prefix, field.name, struct_fields({field.name: field}, java_class))
+        code += conversion_from_java(type_descriptor(field), local, "value.set" + field_cap + "({})")
+    code += "    return value;\n}\n"
+    return code.getvalue()
+
+def map_entry_signature(item, descriptor, java_class):
+    if(descriptor.code == 7):
+        return "L{}{}JNI${};".format(java_class, item.namespace.name, descriptor.target.name)
+    if(descriptor.code in (5, 6)):
+        return "[" + descriptor.element_spelling.jni
+    return descriptor.spelling.jni
+
+def map_entry_cpp(descriptor):
+    if(descriptor.code in (6, 7)):
+        return cpp_qualified_name(descriptor.target)
+    if(descriptor.code == 5):
+        return "std::vector<{}>".format(descriptor.element_spelling.cpp)
+    return descriptor.spelling.cpp
+
+def generate_map_to_java(item, java_class):
+    prefix = conversion_prefix(item)
+    key, value = map_entry_descriptors(item)
+    code = CodeBuffer("\ninline jobjectArray {}MapToJava(JNIEnv *env, const {} &values){{\n".format(prefix, cpp_qualified_name(item)))
+    code += "    static jmethodID constructor = env->GetMethodID({}Class(), \"<init>\", \"({}{})V\");\n".format(prefix, map_entry_signature(item, key, java_class), map_entry_signature(item, value, java_class))
+    code += "    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), {}Class(), nullptr);\n".format(prefix)
+    code += "    jsize index = 0;\n    for(const auto &pair: values){\n"
+    local_refs = []
+    for descriptor, local, source in ((key, "key", "pair.first"), (value, "value", "pair.second")):
+        statements, local_ref = conversion_to_java(descriptor, local, source, local + "Items")
+        code += indent_lines(statements[:-1], "    ") + "\n"
+        if(local_ref):
+            local_refs.append(local)
+    code += "        jobject item = env->NewObject({}Class(), constructor, key, value);\n".format(prefix)
+    code += "        env->SetObjectArrayElement(array, index++, item);\n"
+    code += "        env->DeleteLocalRef(item);\n"
+    for local in local_refs:
+        code += "        env->DeleteLocalRef({});\n".format(local)
+    code += "    }\n    return array;\n}\n"
+    return code.getvalue()
+
+def generate_map_from_java(item, java_class):
+    prefix = conversion_prefix(item)
+    cpp_type = cpp_qualified_name(item)
+    key, value = map_entry_descriptors(item)
+    code = CodeBuffer(f"""
+inline {cpp_type} {prefix}MapFromJava(JNIEnv *env, jobjectArray array){{
+    {cpp_type} values;
+    if(array == nullptr){{
+        return values;
+    }}
+""")
+    for descriptor, local in ((key, "key"), (value, "value")):
+        code += "    static jfieldID {0}FID = env->GetFieldID({1}Class(), \"{0}\", \"{2}\");\n".format(local, prefix, map_entry_signature(item, descriptor, java_class))
+    code += "    jsize length = env->GetArrayLength(array);\n"
+    code += "    for(jsize index = 0; index < length; index++){\n"
+    code += "        jobject object = env->GetObjectArrayElement(array, index);\n"
+    code += "        {} entryKey;\n".format(map_entry_cpp(key))
+    code += "        {} entryValue;\n".format(map_entry_cpp(value))
+    for descriptor, local, store in ((key, "key", "entryKey = {}"), (value, "value", "entryValue = {}")):
+        code += indent_lines(conversion_from_java(descriptor, local, store)[:-1], "    ") + "\n"
+    code += "        values[entryKey] = entryValue;\n"
+    code += "        env->DeleteLocalRef(object);\n"
+    code += "    }\n    return values;\n}\n"
+    return code.getvalue()
+
+def conversion_dependencies(namespace, structs):
+    names = []
+    for struct in structs:
+        for field in struct.fields.values():
+            descriptor = type_descriptor(field)
+            nested = descriptor.target if descriptor.code == 7 else descriptor.element if descriptor.code in (9, 10) else None
+            if(nested is not None and nested.namespace is not namespace and nested.namespace.name not in names):
+                names.append(nested.namespace.name)
+    return names
+
+@profiled("conversions")
+def generate_conversion_header(namespace, java_package_name):
+    """
+    Text of src/{Namespace}Conversions.hpp with the shared conversion
+        functions of the structs and maps of namespace, None if it has none.
+
+    {Namespace}ConversionsInit caches the Java classes, it is called by
+        start() on a Java thread, before the callbacks run on native threads
+        where FindClass does not see the application classes.
+    """
+    structs = [struct for struct in namespace.structs.values() if conversion_supported(struct)]
+    maps = [item for item in namespace.maps.values() if map_conversion_supported(item)]
+    if(not structs and not maps):
+        return None
+    java_class = "".join("{}/".format(name) for name in java_package_name)
+    type_header = "v{}/".format(namespace.version.major) if namespace.version is not None else ""
+    type_header += "".join("{}/".format(name) for name in namespace.package.name.split("."))
+    dependencies = conversion_dependencies(namespace, structs)
+    header = CodeBuffer()
+    CONVERSION_HEADER_TEMPLATE.render_to(header, {
+        "namespace": namespace.name,
+        "guard": "{}_CONVERSIONS_HPP".format(namespace.name.upper()),
+        "type_header": "{}{}.hpp".format(type_header, namespace.name),
+        "includes": "".join("#include \"{}Conversions.hpp\"\n".format(name) for name in dependencies),
+    })
+    for struct in structs:
+        prefix = conversion_prefix(struct)
+        cpp_type = cpp_qualified_name(struct)
+        header += "\ninline jobject {}ToJava(JNIEnv *env, const {} &value);\n".format(prefix, cpp_type)
+        header += "inline {} {}FromJava(JNIEnv *env, jobject object);\n".format(cpp_type, prefix)
+        header += "inline jobjectArray {}ArrayToJava(JNIEnv *env, const std::vector<{}> &values);\n".format(prefix, cpp_type)
+        header += "inline std::vector<{}> {}ArrayFromJava(JNIEnv *env, jobjectArray array);".format(cpp_type, prefix)
+    for item in maps:
+        prefix = conversion_prefix(item)
+        cpp_type = cpp_qualified_name(item)
+        header += "\ninline jobjectArray {}MapToJava(JNIEnv *env, const {} &values);\n".format(prefix, cpp_type)
+        header += "inline {} {}MapFromJava(JNIEnv *env, jobjectArray array);".format(cpp_type, prefix)
+    header += "\n"
+    for item in structs + maps:
+        CONVERSION_CLASS_TEMPLATE.render_to(header, {"prefix": conversion_prefix(item)})
+    header += "\ninline void {}ConversionsInit(JNIEnv *env){{\n".format(namespace.name)
+    for name in dependencies:
+        header += "    {}ConversionsInit(env);\n".format(name)
+    for item in structs + maps:
+        prefix = conversion_prefix(item)
+        header += "    if({}Class() == nullptr){{\n".format(prefix)
+        header += "        {}Class() = static_cast<jclass>(env->NewGlobalRef(env->FindClass(\"{}{}JNI${}\")));\n".format(prefix, java_class, namespace.name, item.name)
+        header += "    }\n"
+    header += "}\n"
+    if(generation_profile is not None):
+        for struct in structs:
+            structs_nesting, arrays_nesting = conversion_nesting(struct)
+            generation_profile.reach("struct_fields_sub_gen", structs_nesting)
+            generation_profile.reach("struct_fields_set_gen", structs_nesting)
+            generation_profile.reach("complex_array", arrays_nesting)
+    for struct in structs:
+        header += generate_struct_to_java(struct, java_class)
+        header += generate_struct_from_java(struct, java_class)
+        CONVERSION_ARRAY_TEMPLATE.render_to(header, {"prefix": conversion_prefix(struct), "cpp_type": cpp_qualified_name(struct)})
+    for item in maps:
+        header += generate_map_to_java(item, java_class)
+        header += generate_map_from_java(item, java_class)
+    header += "\n#endif\n"
+    return header.getvalue()
+
+################################### Attribute ############################
+
+@profiled("member")
+def generate_src_attribute(attribute, package_name, interface, java_package_name):
+    env = "env"
+    package_names = package_name.split('.')
+    src_str = CodeBuffer()
+    attr_type = attribute.type.name
+    java_package = ""
+    java_class = ""
+    version = interface.version.major
+    for name in java_package_name:
+        java_package += "{}_".format(name)
+        java_class += "{}/".format(name)
+    # interface_cap = capitalize_first_letter(interface.name)
+    interface_cap = interface.name
+    interface_low = lower_first_letter(interface.name)
+    attribute_cap = capitalize_first_letter(attribute.name)
+    attribute_low = lower_first_letter(attribute.name)
+    reference_cap = ""
+    reference_type = ""
+    interface_extension = "JNI"
+    if(isinstance(attribute.type, ast.Reference)):
+        reference_cap = capitalize_first_letter(attribute.type.reference.namespace.name)
+        reference_type = attribute.type.reference.name
+
+    descriptor = type_descriptor(attribute)
+    type_cpp = descriptor.spelling.cpp
+    type_jni = descriptor.spelling.jni
+    type_java = descriptor.spelling.java
+    array_name = attribute.type.name
+    struct_name = attribute.type.name
+    cpp_package = "::v{}".format(version)
+    for name in package_names:
+        cpp_package += "::{}".format(name)
+    
+    ### type validation
+    type_checked = check_type_ver2(attribute, interface)
+    
+    if(type_checked < 1 or type_checked > 11):
+        return src_str.getvalue()
+    ###
+    
+    # struct와 struct 배열은 {Namespace}Conversions.hpp의 공유 변환 함수로 변환
+    shared = shared_conversion(attribute)
+    shared_prefix = conversion_prefix(shared) if shared is not None else ""
+    profile_conversion(attribute, shared, "struct_fields_sub_gen", "struct_fields_set_gen")
+    
+    array = ""
+    type_array = ""
+    type_jni_array = ""
+    type_java_array = ""
     type_cpp_array = ""
 
     struct = ""
@@ -2269,43 +4037,45 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
 
     if(type_checked == 3):
         array = interface.arrays[attr_type]
-        type_array = capitalize_first_letter(convert_aidl_type(array.type.name))
-        type_jni_array = convert_jni_type(array.type.name)
-        type_java_array = convert_java_type(array.type.name)
+        type_array = capitalize_first_letter(descriptor.element_spelling.aidl)
+        type_jni_array = descriptor.element_spelling.jni
+        type_java_array = descriptor.element_spelling.java
         if(array.type.name == "String"):
             type_java_array = "jobject"
-        type_cpp_array = upcast_cpp_int(array.type.name)
+        type_cpp_array = upcast_cpp_int(descriptor.element_spelling.name)
         
     elif(type_checked == 4):
         struct = interface.structs[attr_type]
         type_jni_struct = "L{}{}JNI${};".format(java_class,interface_cap,attr_type)
         type_fields_jni = struct_fields(struct.fields, java_class)
     elif(type_checked == 5):
-        array = attribute.type
-        type_array = capitalize_first_letter(convert_aidl_type(attribute.type.type.name))
-        type_cpp = convert_cpp_type(attribute.type.type.name)
-        type_jni = convert_jni_type(attribute.type.type.name)
-        type_java = convert_java_type(attribute.type.type.name)
-        type_jni_array = convert_jni_type(attribute.type.type.name)
-        type_java_array = convert_java_type(attribute.type.type.name)
+        array = element_type(attribute)
+        element = descriptor.element_spelling
+        type_array = capitalize_first_letter(element.aidl)
+        type_cpp = element.cpp
+        type_jni = element.jni
+        type_java = element.java
+        type_jni_array = element.jni
+        type_java_array = element.java
         if(type_java_array == "jstring"):
             type_java_array = "jobject"
-        type_cpp_array = upcast_cpp_int(attribute.type.type.name)
+        type_cpp_array = upcast_cpp_int(element.name)
         if(type_cpp_array == None):
             type_cpp_array = "std::string"
         
     elif(type_checked == 6):
         array = attribute.type.reference
         array_name = attribute.type.reference.name
-        type_array = capitalize_first_letter(convert_aidl_type(attribute.type.reference.type.name))
-        type_cpp = convert_cpp_type(attribute.type.reference.type.name)
-        type_jni = convert_jni_type(attribute.type.reference.type.name)
-        type_java = convert_java_type(attribute.type.reference.type.name)
-        type_jni_array = convert_jni_type(attribute.type.reference.type.name)
-        type_java_array = convert_java_type(attribute.type.reference.type.name)
+        element = descriptor.element_spelling
+        type_array = capitalize_first_letter(element.aidl)
+        type_cpp = element.cpp
+        type_jni = element.jni
+        type_java = element.java
+        type_jni_array = element.jni
+        type_java_array = element.java
         if(type_java_array == "jstring"):
             type_java_array = "jobject"
-        type_cpp_array = upcast_cpp_int(attribute.type.reference.type.name)
+        type_cpp_array = upcast_cpp_int(element.name)
     elif(type_checked == 7):
         type_jni_struct = "L{}{}JNI${};".format(java_class,interface_cap,attribute.type.reference.name)
         struct = attribute.type.name
@@ -2331,57 +4101,57 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
 
     
     if((type_checked >= 1 and type_checked <= 11)):
-        src_str += f"""
+        src_str += code_template("""
     JNIEXPORT void JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_subAttribute{attribute_cap}(JNIEnv *env, jobject instance, jlong proxyptr){{
         {interface_cap}Client* _{interface_cap}Client = reinterpret_cast<{interface_cap}Client*>(proxyptr);
         _{interface_cap}Client->{interface_cap}Instance = {env}->NewGlobalRef(instance);
     \t_{interface_cap}Client->myProxy->get{attribute_cap}Attribute().getChangedEvent().subscribe(
-    """
+    """).render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap, env=env)
     
     #sub 2번 - 개별 - primitive와 아닌 것이 차이가 남
     if(type_checked == 1 or type_checked == 2):
-        src_str += f"""\t\t[_{interface_cap}Client]({type_cpp} _{attribute_low}){{"""
+        src_str += code_template("""\t\t[_{interface_cap}Client]({type_cpp} _{attribute_low}){{""").render(interface_cap=interface_cap, type_cpp=type_cpp, attribute_low=attribute_low)
     ### 3, 4, 6 통합 가능함 왜냐면 3개다 reference를 가지는 형태라 reference가 interface나 typecollection으로 나뉘어도 동일한 방법으로 추출 가능
     elif(type_checked == 3):
-        src_str += f"""\t\t[_{interface_cap}Client]({interface_cap}::{array_name} _{attribute_low}){{"""
+        src_str += code_template("""\t\t[_{interface_cap}Client]({interface_cap}::{array_name} _{attribute_low}){{""").render(interface_cap=interface_cap, array_name=array_name, attribute_low=attribute_low)
     elif(type_checked == 4):
-        src_str += f"""\t\t[_{interface_cap}Client]({interface_cap}::{struct_name} _{attribute_low}){{"""
+        src_str += code_template("""\t\t[_{interface_cap}Client]({interface_cap}::{struct_name} _{attribute_low}){{""").render(interface_cap=interface_cap, struct_name=struct_name, attribute_low=attribute_low)
     elif(type_checked == 5):
-        src_str += f"""\t\t[_{interface_cap}Client](std::vector<{type_cpp}> _{attribute_low}){{"""
+        src_str += code_template("""\t\t[_{interface_cap}Client](std::vector<{type_cpp}> _{attribute_low}){{""").render(interface_cap=interface_cap, type_cpp=type_cpp, attribute_low=attribute_low)
     elif(type_checked == 6 or type_checked == 7 or type_checked == 8):
-        src_str += f"""\t\t[_{interface_cap}Client]({reference_cap}::{attribute.type.reference.name} _{attribute_low}){{"""    
+        src_str += code_template("""\t\t[_{interface_cap}Client]({reference_cap}::{reference_name} _{attribute_low}){{""").render(interface_cap=interface_cap, reference_cap=reference_cap, reference_name=attribute.type.reference.name, attribute_low=attribute_low)    
     elif(type_checked == 9):
-        src_str += f"""\t\t[_{interface_cap}Client]({reference_cap}::{attribute.type.reference.name} _{attribute_low}){{"""
+        src_str += code_template("""\t\t[_{interface_cap}Client]({reference_cap}::{reference_name} _{attribute_low}){{""").render(interface_cap=interface_cap, reference_cap=reference_cap, reference_name=attribute.type.reference.name, attribute_low=attribute_low)
     elif(type_checked == 10):
-        src_str += f"""\t\t[_{interface_cap}Client](std::vector<{attribute.type.type.reference.namespace.name}::{attribute.type.type.reference.name}> _{attribute_low}){{"""
+        src_str += code_template("""\t\t[_{interface_cap}Client](std::vector<{element_namespace}::{element_name}> _{attribute_low}){{""").render(interface_cap=interface_cap, element_namespace=attribute.type.type.reference.namespace.name, element_name=attribute.type.type.reference.name, attribute_low=attribute_low)
     elif(type_checked == 11):
-        src_str += f"""\t\t[_{interface_cap}Client]({attribute.type.reference.namespace.name}::{attribute.type.reference.name} _{attribute_low}){{"""
+        src_str += code_template("""\t\t[_{interface_cap}Client]({reference_namespace}::{reference_name} _{attribute_low}){{""").render(interface_cap=interface_cap, reference_namespace=attribute.type.reference.namespace.name, reference_name=attribute.type.reference.name, attribute_low=attribute_low)
     
     #sub 3번 공통
     if(type_checked >= 1 and type_checked <= 11):
-        src_str += f"""\n\t\t\tJNIEnv* {env};
+        src_str += code_template("""\n\t\t\tJNIEnv* {env};
     \t\tif((jvm)->AttachCurrentThread(&{env},nullptr) != JNI_OK){{
     \t\t    LOGI("Attach Error!");    
     \t\t}};
     \t\tjobject {interface_cap}Instance = _{interface_cap}Client->{interface_cap}Instance;
-    \t\tjclass {interface_cap}Clazz = {env}->GetObjectClass({interface_cap}Instance);"""
+    \t\tjclass {interface_cap}Clazz = {env}->GetObjectClass({interface_cap}Instance);""").render(env=env, interface_cap=interface_cap)
     
     #sub 4번 개별 - type jni가 달라져야함 공통으로 만들려면 별도로 type_jni 추출할 때 array가 가능하게 해야함 근데 안 될 듯
     if(type_checked == 1):
-        src_str += f"""\n\t\t\tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "({type_jni})V");
-        \t{type_java} {attribute_low} = static_cast<{type_java}>(_{attribute_low});"""
+        src_str += code_template("""\n\t\t\tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "({type_jni})V");
+        \t{type_java} {attribute_low} = static_cast<{type_java}>(_{attribute_low});""").render(attribute_cap=attribute_cap, env=env, interface_cap=interface_cap, type_jni=type_jni, type_java=type_java, attribute_low=attribute_low)
     elif(type_checked == 2):
-        src_str += f"""\n\t\t\tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "({type_jni})V");
-        \t{type_java} {attribute_low} = {env}->NewStringUTF(_{attribute_low}.c_str());"""
+        src_str += code_template("""\n\t\t\tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "({type_jni})V");
+        \t{type_java} {attribute_low} = {env}->NewStringUTF(_{attribute_low}.c_str());""").render(attribute_cap=attribute_cap, env=env, interface_cap=interface_cap, type_jni=type_jni, type_java=type_java, attribute_low=attribute_low)
     elif(type_checked == 3 or type_checked == 5):
-        src_str += f"""\n\t\t\tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "([{type_jni_array})V");"""
-        if(isUnsigned(array.type.name) or array.type.name == "Int16"):
-            src_str += f"""
+        src_str += code_template("""\n\t\t\tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "([{type_jni_array})V");""").render(attribute_cap=attribute_cap, env=env, interface_cap=interface_cap, type_jni_array=type_jni_array)
+        if(descriptor.unsigned or array.type.name == "Int16"):
+            src_str += code_template("""
             std::vector<{type_cpp_array}> _{attribute_low}Signed;
             _{attribute_low}Signed.assign(_{attribute_low}.begin(), _{attribute_low}.end());
-            {type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}Signed.data());"""
+            {type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}Signed.data());""").render(type_cpp_array=type_cpp_array, attribute_low=attribute_low, type_java_array=type_java_array)
         elif(array.type.name == "String"):
-            src_str += f"""
+            src_str += code_template("""
             jsize {attribute_cap}Length = static_cast<jsize>(_{attribute_low}.size());
             jstring {attribute_cap}Str = {env}->NewStringUTF("");
             jclass {attribute_cap}Clazz = {env}->GetObjectClass({attribute_cap}Str);
@@ -2391,208 +4161,223 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
                 {attribute_cap}Str = {env}->NewStringUTF(_{attribute_low}[s].c_str());
                 {env}->SetObjectArrayElement({attribute_low}, s, {attribute_cap}Str);
             }}
-            {env}->DeleteLocalRef({attribute_cap}Str);"""
+            {env}->DeleteLocalRef({attribute_cap}Str);""").render(attribute_cap=attribute_cap, attribute_low=attribute_low, env=env)
         else:
-            src_str += f"""
-    \t\t{type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}.data());"""
+            src_str += code_template("""
+    \t\t{type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}.data());""").render(type_java_array=type_java_array, attribute_low=attribute_low)
         if(array.type.name != "String"):
-            src_str += f"""
+            src_str += code_template("""
     \t\tjsize {attribute_low}Length = static_cast<jsize>(_{attribute_low}.size());
     \t\t{type_java_array}Array {attribute_low} = {env}->New{type_array}Array({attribute_low}Length);
-    \t\t{env}->Set{type_array}ArrayRegion({attribute_low}, 0, {attribute_low}Length, {attribute_low}Data);"""
+    \t\t{env}->Set{type_array}ArrayRegion({attribute_low}, 0, {attribute_low}Length, {attribute_low}Data);""").render(attribute_low=attribute_low, type_java_array=type_java_array, env=env, type_array=type_array)
+    elif(shared is not None and (type_checked == 4 or type_checked == 7)):
+        src_str += code_template("""
+        \tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "({type_jni_struct})V");
+        \tjobject {attribute_low} = {shared_prefix}ToJava({env}, _{attribute_low});""").render(attribute_cap=attribute_cap, env=env, interface_cap=interface_cap, type_jni_struct=type_jni_struct, attribute_low=attribute_low, shared_prefix=shared_prefix)
     # Structs
     elif(type_checked == 4 or type_checked == 7):
         # 최초 interface1Clazz 등을 위함
         reference_list = [interface_cap]
         if(attribute.type.reference.namespace.name not in reference_list):
             reference_list.append(attribute.type.reference.namespace.name)
-            src_str += f"""
-    \t\tjobject {capitalize_first_letter(attribute.type.reference.namespace.name)}Instance = {env}->AllocObject(_{interface_cap}Client->{capitalize_first_letter(attribute.type.reference.namespace.name)}Clazz);
-    \t\tjclass {capitalize_first_letter(attribute.type.reference.namespace.name)}Clazz = {env}->GetObjectClass({capitalize_first_letter(attribute.type.reference.namespace.name)}Instance);"""
+            src_str += code_template("""
+    \t\tjobject {namespace_cap}Instance = {env}->AllocObject(_{interface_cap}Client->{namespace_cap}Clazz);
+    \t\tjclass {namespace_cap}Clazz = {env}->GetObjectClass({namespace_cap}Instance);""").render(namespace_cap=capitalize_first_letter(attribute.type.reference.namespace.name), env=env, interface_cap=interface_cap)
         for field in attribute.type.reference.fields.values():
             if(isinstance(field.type, ast.Reference)):
                 if(isinstance(field.type.reference, ast.Struct)):
                     if(field.type.reference.namespace.name not in reference_list):
                         reference_list.append(field.type.reference.namespace.name)
-                        src_str += f"""
-    \t\tjobject {capitalize_first_letter(field.type.reference.namespace.name)}Instance = {env}->AllocObject(_{interface_cap}Client->{capitalize_first_letter(field.type.reference.namespace.name)}Clazz);
-    \t\tjclass {capitalize_first_letter(field.type.reference.namespace.name)}Clazz = {env}->GetObjectClass({capitalize_first_letter(field.type.reference.namespace.name)}Instance);"""
+                        src_str += code_template("""
+    \t\tjobject {field_namespace_cap}Instance = {env}->AllocObject(_{interface_cap}Client->{field_namespace_cap}Clazz);
+    \t\tjclass {field_namespace_cap}Clazz = {env}->GetObjectClass({field_namespace_cap}Instance);""").render(field_namespace_cap=capitalize_first_letter(field.type.reference.namespace.name), env=env, interface_cap=interface_cap)
         
-        src_str += f"""
-        \tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "({type_jni_struct})V");"""
+        src_str += code_template("""
+        \tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "({type_jni_struct})V");""").render(attribute_cap=attribute_cap, env=env, interface_cap=interface_cap, type_jni_struct=type_jni_struct)
         ###
         src_str += struct_fields_sub_gen(attribute,interface,cpp_package,java_class,"")
-        src_str += f"""
-        \tjobject {attribute_low} = {env}->NewObject({defined}{struct_name}Clazz, {defined}{struct_name}Constructor"""
+        src_str += code_template("""
+        \tjobject {attribute_low} = {env}->NewObject({defined}{struct_name}Clazz, {defined}{struct_name}Constructor""").render(attribute_low=attribute_low, env=env, defined=defined, struct_name=struct_name)
         #for field in interface.structs[attr_type].fields.values():
         for field in attribute.type.reference.fields.values():
             src_str += ", {}{}".format(attribute_low, capitalize_first_letter(field.name))
         src_str += ");"
     elif(type_checked == 6):
-        src_str += f"""\n\t\t\tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "([{type_jni_array})V");"""
-        if(isUnsigned(attribute.type.reference.type.name) or array.type.name == "Int16"):
-            src_str += f"""
+        src_str += code_template("""\n\t\t\tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "([{type_jni_array})V");""").render(attribute_cap=attribute_cap, env=env, interface_cap=interface_cap, type_jni_array=type_jni_array)
+        if(descriptor.unsigned or array.type.name == "Int16"):
+            src_str += code_template("""
             std::vector<{type_cpp_array}> _{attribute_low}Signed;
             _{attribute_low}Signed.assign(_{attribute_low}.begin(), _{attribute_low}.end());
-            {type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}Signed.data());"""
+            {type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}Signed.data());""").render(type_cpp_array=type_cpp_array, attribute_low=attribute_low, type_java_array=type_java_array)
         else:
-            src_str += f"""
-    \t\t{type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}.data());"""
-        src_str += f"""
+            src_str += code_template("""
+    \t\t{type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}.data());""").render(type_java_array=type_java_array, attribute_low=attribute_low)
+        src_str += code_template("""
     \t\tjsize {attribute_low}Length = static_cast<jsize>(_{attribute_low}.size());
     \t\t{type_java_array}Array {attribute_low} = {env}->New{type_array}Array({attribute_low}Length);
-    \t\t{env}->Set{type_array}ArrayRegion({attribute_low}, 0, {attribute_low}Length, {attribute_low}Data);"""
+    \t\t{env}->Set{type_array}ArrayRegion({attribute_low}, 0, {attribute_low}Length, {attribute_low}Data);""").render(attribute_low=attribute_low, type_java_array=type_java_array, env=env, type_array=type_array)
     elif(type_checked == 8):
         if(reference_cap != interface_cap):
-            src_str += f"""
-    \t\tjobject {capitalize_first_letter(attribute.type.reference.namespace.name)}Instance = {env}->AllocObject(_{interface_cap}Client->{capitalize_first_letter(attribute.type.reference.namespace.name)}Clazz);
-    \t\tjclass {capitalize_first_letter(attribute.type.reference.namespace.name)}Clazz = {env}->GetObjectClass({capitalize_first_letter(attribute.type.reference.namespace.name)}Instance);"""
-        src_str += f"""
+            src_str += code_template("""
+    \t\tjobject {namespace_cap}Instance = {env}->AllocObject(_{interface_cap}Client->{namespace_cap}Clazz);
+    \t\tjclass {namespace_cap}Clazz = {env}->GetObjectClass({namespace_cap}Instance);""").render(namespace_cap=capitalize_first_letter(attribute.type.reference.namespace.name), env=env, interface_cap=interface_cap)
+        src_str += code_template("""
         \tjmethodID {attribute_cap}MID = {env}->GetMethodID({reference_cap}Clazz, "subAttribute{attribute_cap}Handler", "(B)V");
         \tuint8_t _{attribute_low}Int = static_cast<uint8_t>(_{attribute_low});
-        \tjbyte {attribute_low} = static_cast<jbyte>(_{attribute_low}Int);"""
+        \tjbyte {attribute_low} = static_cast<jbyte>(_{attribute_low}Int);""").render(attribute_cap=attribute_cap, env=env, reference_cap=reference_cap, attribute_low=attribute_low)
+    elif(shared is not None and (type_checked == 9 or type_checked == 10)):
+        src_str += code_template("""
+        \tjmethodID {attribute_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subAttribute{attribute_cap}Handler", "([L{java_class}{interface_cap}JNI${shared_name};)V");
+        \tjobjectArray {attribute_low} = {shared_prefix}ArrayToJava({env}, _{attribute_low});
+            {env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});
+            {env}->DeleteLocalRef({attribute_low});
+            jvm->DetachCurrentThread();
+            }}
+        );
+    }}\n
+    """).render(attribute_cap=attribute_cap, env=env, interface_cap=interface_cap, java_class=java_class, shared_name=shared.name, attribute_low=attribute_low, shared_prefix=shared_prefix)
     elif(type_checked == 9):
         src_str += complex_array(attribute, interface, cpp_package, java_class)
-        src_str += f"""{env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});
+        src_str += code_template("""{env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});
             {env}->DeleteLocalRef({attribute_low});
             jvm->DetachCurrentThread();
             }}
         );
     }}\n
-    """
+    """).render(env=env, interface_cap=interface_cap, attribute_cap=attribute_cap, attribute_low=attribute_low)
     elif(type_checked == 10):
         src_str += complex_array(attribute, interface, cpp_package, java_class, field_name_extends="", is_sub=0, is_implicit=True)
-        src_str += f"""{env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});
+        src_str += code_template("""{env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});
             {env}->DeleteLocalRef({attribute_low});
             jvm->DetachCurrentThread();
             }}
         );
     }}\n
-    """
+    """).render(env=env, interface_cap=interface_cap, attribute_cap=attribute_cap, attribute_low=attribute_low)
     elif(type_checked == 11):
         # src_str += complex_array(attribute, interface, cpp_package, java_class, field_name_extends="", is_sub=0, is_implicit=True)
         src_str += generate_src_map(attribute, cpp_package, interface, java_class, upper="", indentation=0, type=0)
-        src_str += f"""{env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});
+        src_str += code_template("""{env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});
             {env}->DeleteLocalRef({attribute_low});
             jvm->DetachCurrentThread();
             }}
         );
     }}\n
-    """
+    """).render(env=env, interface_cap=interface_cap, attribute_cap=attribute_cap, attribute_low=attribute_low)
     #sub 5번 공통
     if(type_checked >= 1 and type_checked <= 8):
-        src_str += f"""\n\t\t\t{env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});"""
+        src_str += code_template("""\n\t\t\t{env}->CallVoidMethod({interface_cap}Instance, {attribute_cap}MID, {attribute_low});""").render(env=env, interface_cap=interface_cap, attribute_cap=attribute_cap, attribute_low=attribute_low)
     
     #sub 6번 개별
     if(type_checked >= 3 and type_checked <= 7):
-        src_str += f"""\n\t\t\t{env}->DeleteLocalRef({attribute_low});"""
+        src_str += code_template("""\n\t\t\t{env}->DeleteLocalRef({attribute_low});""").render(env=env, attribute_low=attribute_low)
     
     #sub 7번 공통
     if(type_checked >= 1 and type_checked <= 8):
-        src_str += f"""\n\t\t\tjvm->DetachCurrentThread();
+        src_str += code_template("""\n\t\t\tjvm->DetachCurrentThread();
     \t\t}}
     \t);
     }}\n
-    """
+    """).render()
     ###################################################################################################################
     ##### get code
     #1번 개별, return type 때문
     if(type_checked == 1 or type_checked == 2):
-        src_str += f"""JNIEXPORT {type_java} JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{"""
+        src_str += code_template("""JNIEXPORT {type_java} JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{""").render(type_java=type_java, java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap)
     elif(type_checked == 3 or type_checked == 5):
-        src_str += f"""JNIEXPORT {type_java_array}Array JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{"""
+        src_str += code_template("""JNIEXPORT {type_java_array}Array JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{""").render(type_java_array=type_java_array, java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap)
     elif(type_checked == 4 or type_checked == 7): # or type_checked == 8):
-        src_str += f"""JNIEXPORT jobject JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{"""
+        src_str += code_template("""JNIEXPORT jobject JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{""").render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap)
     elif(type_checked == 6):
-        src_str += f"""JNIEXPORT {type_java_array}Array JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{""" 
+        src_str += code_template("""JNIEXPORT {type_java_array}Array JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{""").render(type_java_array=type_java_array, java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap) 
     elif(type_checked == 8):
-        src_str += f"""JNIEXPORT jbyte JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{"""
+        src_str += code_template("""JNIEXPORT jbyte JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{""").render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap)
     elif(type_checked == 9 or type_checked == 10 or type_checked == 11):
-        src_str += f"""JNIEXPORT jobjectArray JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{"""
+        src_str += code_template("""JNIEXPORT jobjectArray JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_getAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){{""").render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap)
     
     
     if(type_checked >= 1 and type_checked <= 11):
-        src_str += f"""
+        src_str += code_template("""
     \t{interface_cap}Client* _{interface_cap}Client = reinterpret_cast<{interface_cap}Client*>(proxyptr);
     \t//_{interface_cap}Client->{interface_cap}Instance = {env}->NewGlobalRef(instance);
     \tCommonAPI::CallStatus callStatus;
     \tCommonAPI::CallInfo info(static_cast<int>(timeout));
     \tinfo.sender_ = static_cast<int>(sender);
-    """
+    """).render(interface_cap=interface_cap, env=env)
     
     #1-1번 2.28 추가, Enumeration의 경우 instance를 사용해야 하는데 이때 필요한 instance가 해당 interface의 것이 아닐 수도 있음.
     list_get = []
     # if(type_checked == 8 or type_checked == 4 or type_checked == 6 or type_checked == 7):
-    if(isinstance(attribute.type, ast.Reference)):
+    if(isinstance(attribute.type, ast.Reference) and shared is None):
         if(isinstance(attribute.type.reference, ast.Enumeration) and (attribute.type.reference.namespace.name not in list_get)):
             list_get.append(attribute.type.reference.namespace.name)
-            src_str += f"""\tjobject {attribute.type.reference.namespace.name}Instance = {env}->AllocObject(_{interface_cap}Client->{attribute.type.reference.namespace.name}Clazz);
-            """
+            src_str += code_template("""\tjobject {reference_namespace}Instance = {env}->AllocObject(_{interface_cap}Client->{reference_namespace}Clazz);
+            """).render(reference_namespace=attribute.type.reference.namespace.name, env=env, interface_cap=interface_cap)
         elif(isinstance(attribute.type.reference, ast.Struct)):
             for field in attribute.type.reference.fields.values():
                 if(isinstance(field.type, ast.Reference)):
                     if(isinstance(field.type.reference, ast.Enumeration) and (field.type.reference.namespace.name not in list_get)):
                         list_get.append(field.type.reference.namespace.name)
-                        src_str += f"""\tjobject {field.type.reference.namespace.name}Instance = {env}->AllocObject(_{interface_cap}Client->{field.type.reference.namespace.name}Clazz);
-            """
+                        src_str += code_template("""\tjobject {field_namespace}Instance = {env}->AllocObject(_{interface_cap}Client->{field_namespace}Clazz);
+            """).render(field_namespace=field.type.reference.namespace.name, env=env, interface_cap=interface_cap)
             
     
     #2번 개별, 변수 getValue의 인자 선언
     # if primitive
     if(type_checked == 1 or type_checked == 2):
-        src_str += f"""\t{type_cpp} _{attribute_low};"""
+        src_str += code_template("""\t{type_cpp} _{attribute_low};""").render(type_cpp=type_cpp, attribute_low=attribute_low)
     elif(type_checked == 3):
-        src_str += f"""
-        /*{cpp_package}::*/{interface_cap}::{array_name} _{attribute_low};"""
+        src_str += code_template("""
+        /*{cpp_package}::*/{interface_cap}::{array_name} _{attribute_low};""").render(cpp_package=cpp_package, interface_cap=interface_cap, array_name=array_name, attribute_low=attribute_low)
     elif(type_checked == 4):
-        src_str += f"""
-        /*{cpp_package}::*/{interface_cap}::{struct_name} _{attribute_low};"""
+        src_str += code_template("""
+        /*{cpp_package}::*/{interface_cap}::{struct_name} _{attribute_low};""").render(cpp_package=cpp_package, interface_cap=interface_cap, struct_name=struct_name, attribute_low=attribute_low)
     elif(type_checked == 5):
-        src_str += f"""
-        std::vector<{convert_cpp_type(attribute.type.type.name)}> _{attribute_low};"""
+        src_str += code_template("""
+        std::vector<{element_cpp}> _{attribute_low};""").render(element_cpp=descriptor.element_spelling.cpp, attribute_low=attribute_low)
     elif(type_checked == 6 or type_checked == 7):
-        src_str += f"""
-        /*{cpp_package}::*/{reference_cap}::{attribute.type.reference.name} _{attribute_low};"""
+        src_str += code_template("""
+        /*{cpp_package}::*/{reference_cap}::{reference_name} _{attribute_low};""").render(cpp_package=cpp_package, reference_cap=reference_cap, reference_name=attribute.type.reference.name, attribute_low=attribute_low)
     elif(type_checked == 8):
-        src_str += f"""
-        /*{cpp_package}::*/{reference_cap}::{attribute.type.reference.name} _{attribute_low};"""
+        src_str += code_template("""
+        /*{cpp_package}::*/{reference_cap}::{reference_name} _{attribute_low};""").render(cpp_package=cpp_package, reference_cap=reference_cap, reference_name=attribute.type.reference.name, attribute_low=attribute_low)
     elif(type_checked == 9):
-        src_str += f"""
-        /*{cpp_package}::*/{reference_cap}::{attribute.type.reference.name} _{attribute_low};"""
+        src_str += code_template("""
+        /*{cpp_package}::*/{reference_cap}::{reference_name} _{attribute_low};""").render(cpp_package=cpp_package, reference_cap=reference_cap, reference_name=attribute.type.reference.name, attribute_low=attribute_low)
     elif(type_checked == 10):
-        src_str += f"""
-        std::vector<{attribute.type.type.reference.namespace.name}::{attribute.type.type.reference.name}> _{attribute_low};"""
+        src_str += code_template("""
+        std::vector<{element_namespace}::{element_name}> _{attribute_low};""").render(element_namespace=attribute.type.type.reference.namespace.name, element_name=attribute.type.type.reference.name, attribute_low=attribute_low)
     elif(type_checked == 11):
-        src_str += f"""
-        {attribute.type.reference.namespace.name}::{attribute.type.reference.name} _{attribute_low};"""
+        src_str += code_template("""
+        {reference_namespace}::{reference_name} _{attribute_low};""").render(reference_namespace=attribute.type.reference.namespace.name, reference_name=attribute.type.reference.name, attribute_low=attribute_low)
         
     #3번 getvalue call
     if(type_checked >= 1 and type_checked <= 11):
-        src_str += f"""
+        src_str += code_template("""
     \t_{interface_cap}Client->myProxy->get{attribute_cap}Attribute().getValue(callStatus, _{attribute_low}, &info);
     \tif(callStatus != CommonAPI::CallStatus::SUCCESS) {{
     \t\tLOGE("Get Value {attribute_low} failed!");
-    \t}}"""
+    \t}}""").render(interface_cap=interface_cap, attribute_cap=attribute_cap, attribute_low=attribute_low)
     
     #4번 개별 return
     if(type_checked == 1):
-        src_str += f"""
+        src_str += code_template("""
         return static_cast<{type_java}>(_{attribute_low});
     }}\n
-    """
+    """).render(type_java=type_java, attribute_low=attribute_low)
     elif(type_checked == 2):
-        src_str += f"""{type_java} {attribute_low} = env->NewStringUTF(_{attribute_low}.c_str());
+        src_str += code_template("""{type_java} {attribute_low} = env->NewStringUTF(_{attribute_low}.c_str());
     \n\treturn {attribute_low};
     }}\n
-    """
+    """).render(type_java=type_java, attribute_low=attribute_low)
     elif(type_checked == 3 or type_checked == 5 or type_checked == 6):
-        if(isUnsigned(array.type.name) or array.type.name == "Int16"):
-            src_str += f"""
+        if(descriptor.unsigned or array.type.name == "Int16"):
+            src_str += code_template("""
         std::vector<{type_cpp_array}> _{attribute_low}Signed;
         _{attribute_low}Signed.assign(_{attribute_low}.begin(), _{attribute_low}.end());
-        {type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}Signed.data());"""
+        {type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}Signed.data());""").render(type_cpp_array=type_cpp_array, attribute_low=attribute_low, type_java_array=type_java_array)
         elif(array.type.name == "String"):
-            src_str += f"""
+            src_str += code_template("""
         jsize {attribute_cap}Length = static_cast<jsize>(_{attribute_low}.size());
         jstring {attribute_cap}Str = {env}->NewStringUTF("");
         jclass {attribute_cap}Clazz = {env}->GetObjectClass({attribute_cap}Str);
@@ -2607,90 +4392,101 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
         
         return {attribute_low};
     }}\n
-    """
+    """).render(attribute_cap=attribute_cap, attribute_low=attribute_low, env=env)
         else:
-            src_str += f"""
-        {type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}.data());"""
+            src_str += code_template("""
+        {type_java_array}* {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}.data());""").render(type_java_array=type_java_array, attribute_low=attribute_low)
         
         if(array.type.name != "String"):
-            src_str += f"""
+            src_str += code_template("""
         jsize {attribute_low}Length = static_cast<jsize>(_{attribute_low}.size());
         {type_java_array}Array {attribute_low} = env->New{type_array}Array({attribute_low}Length);
         env->Set{type_array}ArrayRegion({attribute_low}, 0, {attribute_low}Length, {attribute_low}Data);
         return {attribute_low};
     }}\n
-    """
+    """).render(attribute_low=attribute_low, type_java_array=type_java_array, type_array=type_array)
+    elif(shared is not None and (type_checked == 4 or type_checked == 7)):
+        src_str += code_template("""
+        jobject {attribute_low} = {shared_prefix}ToJava({env}, _{attribute_low});
+        return {attribute_low};
+    }}\n\n""").render(attribute_low=attribute_low, shared_prefix=shared_prefix, env=env)
+    elif(shared is not None and (type_checked == 9 or type_checked == 10)):
+        src_str += code_template("""
+        jobjectArray {attribute_low} = {shared_prefix}ArrayToJava({env}, _{attribute_low});
+        return {attribute_low};
+    }}\n
+    """).render(attribute_low=attribute_low, shared_prefix=shared_prefix, env=env)
     elif(type_checked == 4 or type_checked == 7):
         ## struct_fields_sub_gen 으로 아래 부분 전체 대체 가능?
         src_str += struct_fields_sub_gen(attribute,interface,cpp_package,java_class,"",False)
-        src_str += f"""
-        jobject {attribute_low} = env->NewObject({defined}{struct_name}Clazz, {defined}{struct_name}Constructor"""
+        src_str += code_template("""
+        jobject {attribute_low} = env->NewObject({defined}{struct_name}Clazz, {defined}{struct_name}Constructor""").render(attribute_low=attribute_low, defined=defined, struct_name=struct_name)
         for field in attribute.type.reference.fields.values():
             src_str += ", {}{}".format(attribute_low, capitalize_first_letter(field.name))
         src_str += ");"
         ##### 여기까지 대체
         #4-1 2.28 Enumeration 추가로 별도 instance 만들 시 해당 instance 삭제
         for ref in list_get:
-            src_str += f"""
-        {env}->DeleteLocalRef({ref}Instance);"""
-        src_str += f"""
+            src_str += code_template("""
+        {env}->DeleteLocalRef({ref}Instance);""").render(env=env, ref=ref)
+        src_str += code_template("""
         return {attribute_low};
-    }}\n\n"""
+    }}\n\n""").render(attribute_low=attribute_low)
     elif(type_checked == 8):
-        src_str += f"""
+        src_str += code_template("""
         uint8_t _{attribute_low}Int = static_cast<uint8_t>(_{attribute_low});
         jbyte {attribute_low}Int = static_cast<jbyte>(_{attribute_low}Int);
         {env}->DeleteLocalRef({reference_cap}Instance);
         return {attribute_low}Int;
-    }}\n\n"""
+    }}\n\n""").render(attribute_low=attribute_low, env=env, reference_cap=reference_cap)
     elif(type_checked == 9):
         src_str += complex_array(attribute, interface, cpp_package, java_class, field_name_extends="", is_sub=1)
-        src_str += f"""return {attribute_low};
+        src_str += code_template("""return {attribute_low};
     }}\n
-    """
+    """).render(attribute_low=attribute_low)
     elif(type_checked == 10):
         src_str += complex_array(attribute, interface, cpp_package, java_class, field_name_extends="", is_sub=1, is_implicit=True)
-        src_str += f"""return {attribute_low};
+        src_str += code_template("""return {attribute_low};
     }}\n
-    """
+    """).render(attribute_low=attribute_low)
     elif(type_checked == 11):
         ### type 1 만들어야함
         src_str += generate_src_map(attribute, cpp_package, interface, java_class, upper="", indentation=0, type=1)
-        src_str += f"""return {attribute_low};
+        src_str += code_template("""return {attribute_low};
     }}\n
-    """
+    """).render(attribute_low=attribute_low)
     
     ################################################################################################################
     ### set code, if not readonly
     ####1번 개별, return type 때문
     if('readonly' not in attribute.flags):
         if(type_checked == 1 or type_checked == 2):
-            src_str += f"""
-    JNIEXPORT {type_java} JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, {type_java} {attribute_low}){{"""
+            src_str += code_template("""
+    JNIEXPORT {type_java} JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, {type_java} {attribute_low}){{""").render(type_java=type_java, java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap, attribute_low=attribute_low)
         elif(type_checked == 3 or type_checked == 5 or type_checked == 6):
-            src_str += f"""
-    JNIEXPORT {type_java_array}Array JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, {type_java_array}Array {attribute_low}){{"""
+            src_str += code_template("""
+    JNIEXPORT {type_java_array}Array JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, {type_java_array}Array {attribute_low}){{""").render(type_java_array=type_java_array, java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap, attribute_low=attribute_low)
         elif(type_checked == 4 or type_checked == 7): #or type_checked == 8):
-            src_str += f"""
-    JNIEXPORT jobject JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject {attribute_low}){{"""    
+            src_str += code_template("""
+    JNIEXPORT jobject JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject {attribute_low}){{""").render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap, attribute_low=attribute_low)    
         elif(type_checked == 8):
-            src_str += f"""
-    JNIEXPORT jbyte JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyte {attribute_low}){{"""    
+            src_str += code_template("""
+    JNIEXPORT jbyte JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyte {attribute_low}){{""").render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap, attribute_low=attribute_low)    
         elif(type_checked == 9 or type_checked == 10 or type_checked == 11):
-            src_str += f"""
-    JNIEXPORT jobjectArray JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray {attribute_low}){{"""    
+            src_str += code_template("""
+    JNIEXPORT jobjectArray JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_setAttribute{attribute_cap}Value(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray {attribute_low}){{""").render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap, attribute_low=attribute_low)    
     
-        src_str += f"""
+        src_str += code_template("""
     \t{interface_cap}Client* _{interface_cap}Client = reinterpret_cast<{interface_cap}Client*>(proxyptr);
     \t//_{interface_cap}Client->{interface_cap}Instance = {env}->NewGlobalRef(instance);
     \tCommonAPI::CallStatus callStatus;
     \tCommonAPI::CallInfo info(static_cast<int>(timeout));
-    \tinfo.sender_ = static_cast<int>(sender);"""
+    \tinfo.sender_ = static_cast<int>(sender);""").render(interface_cap=interface_cap, env=env)
     
         ### 1-1 Enumeration 때문에 추가
         list_set = []
         # if(type_checked == 8 or type_checked == 4 or type_checked == 6 or type_checked == 7):
-        if(isinstance(attribute.type, ast.Reference)):
+        if(isinstance(attribute.type, ast.Reference) and shared is None):
             if(isinstance(attribute.type.reference, ast.Enumeration) and (attribute.type.reference.namespace.name not in list_set)):
                 list_set.append(attribute.type.reference.namespace.name)
                 #src_str += f"""\n\t\t//jobject {attribute.type.reference.namespace.name}Instance = {env}->AllocObject({interface_low}Client->{attribute.type.reference.namespace.name}Clazz);"""
@@ -2699,28 +4495,28 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
                     if(isinstance(field.type, ast.Reference)):
                         if(isinstance(field.type.reference, ast.Enumeration) and (field.type.reference.namespace.name not in list_set)):
                             list_set.append(field.type.reference.namespace.name)
-                            src_str += f"""\n\t\tjobject {field.type.reference.namespace.name}Instance = {env}->AllocObject(_{interface_cap}Client->{field.type.reference.namespace.name}Clazz);"""
+                            src_str += code_template("""\n\t\tjobject {field_namespace}Instance = {env}->AllocObject(_{interface_cap}Client->{field_namespace}Clazz);""").render(field_namespace=field.type.reference.namespace.name, env=env, interface_cap=interface_cap)
         src_str_temp = ""
         src_str_struct = ""
         ####2번 개별, 변수 선언
         if(type_checked == 1):
-            src_str += f"""
+            src_str += code_template("""
         {type_cpp} _{attribute_low} = static_cast<{type_cpp}>({attribute_low});
-        {type_cpp} _{attribute_low}Response;"""
+        {type_cpp} _{attribute_low}Response;""").render(type_cpp=type_cpp, attribute_low=attribute_low)
         elif(type_checked == 2):
-            src_str += f"""
+            src_str += code_template("""
             const char* char_{attribute_low} = env->GetStringUTFChars({attribute_low},nullptr);
             {type_cpp} _{attribute_low}(char_{attribute_low});
-            {type_cpp} _{attribute_low}Response;"""
+            {type_cpp} _{attribute_low}Response;""").render(attribute_low=attribute_low, type_cpp=type_cpp)
         elif(type_checked == 3 or type_checked == 6):
             if(array.type.name != "String"):
-                src_str += f"""
+                src_str += code_template("""
         {type_java_array}* {attribute_low}Data = env->Get{type_array}ArrayElements({attribute_low}, nullptr);
         jsize {attribute_low}Length = env->GetArrayLength({attribute_low});
         /*{cpp_package}::*/{reference_cap}::{array_name} _{attribute_low}({attribute_low}Data, {attribute_low}Data + {attribute_low}Length);
-        /*{cpp_package}::*/{reference_cap}::{array_name} _{attribute_low}Response;"""
+        /*{cpp_package}::*/{reference_cap}::{array_name} _{attribute_low}Response;""").render(type_java_array=type_java_array, attribute_low=attribute_low, type_array=type_array, cpp_package=cpp_package, reference_cap=reference_cap, array_name=array_name)
             else:
-                src_str += f"""
+                src_str += code_template("""
         jsize {attribute_cap}Length = env->GetArrayLength({attribute_low});
         /*{cpp_package}::*/{reference_cap}::{array_name} _{attribute_low};
         /*{cpp_package}::*/{reference_cap}::{array_name} _{attribute_low}Response;
@@ -2730,24 +4526,32 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
             const char *{attribute_cap}Cstr = {env}->GetStringUTFChars({attribute_cap}Str, nullptr);
             _{attribute_low}.push_back(std::string({attribute_cap}Cstr));
         }}
-        """
+        """).render(attribute_cap=attribute_cap, attribute_low=attribute_low, cpp_package=cpp_package, reference_cap=reference_cap, array_name=array_name, env=env)
+        elif(shared is not None and (type_checked == 4 or type_checked == 7)):
+            src_str += code_template("""
+        {shared_cpp} _{attribute_low} = {shared_prefix}FromJava({env}, {attribute_low});
+        {shared_cpp} _{attribute_low}Response;""").render(shared_cpp=cpp_qualified_name(shared), attribute_low=attribute_low, shared_prefix=shared_prefix, env=env)
+        elif(shared is not None and (type_checked == 9 or type_checked == 10)):
+            src_str += code_template("""
+        std::vector<{shared_cpp}> _{attribute_low} = {shared_prefix}ArrayFromJava({env}, {attribute_low});
+        std::vector<{shared_cpp}> _{attribute_low}Response;""").render(shared_cpp=cpp_qualified_name(shared), attribute_low=attribute_low, shared_prefix=shared_prefix, env=env)
         elif(type_checked == 4 or type_checked == 7):
-            src_str += f"""
+            src_str += code_template("""
         jclass {defined}{struct_name}Clazz = env->GetObjectClass({attribute_low});
         jmethodID {defined}{struct_name}Constructor = env->GetMethodID({defined}{struct_name}Clazz, "<init>", "({type_fields_jni})V");
         /*{cpp_package}::*/{reference_cap}::{struct_name} _{attribute_low};
-        /*{cpp_package}::*/{reference_cap}::{struct_name} _{attribute_low}Response;"""
+        /*{cpp_package}::*/{reference_cap}::{struct_name} _{attribute_low}Response;""").render(defined=defined, struct_name=struct_name, attribute_low=attribute_low, type_fields_jni=type_fields_jni, cpp_package=cpp_package, reference_cap=reference_cap)
             src_str_temp, src_str_struct = struct_fields_set_gen(attribute,interface,cpp_package,java_class)
             src_str += src_str_temp
         elif(type_checked == 5):
             if(array.type.name != "String"):
-                src_str += f"""
+                src_str += code_template("""
         {type_java_array}* {attribute_low}Data = env->Get{type_array}ArrayElements({attribute_low}, nullptr);
         jsize {attribute_low}Length = env->GetArrayLength({attribute_low});
         std::vector<{type_cpp}> _{attribute_low}({attribute_low}Data, {attribute_low}Data + {attribute_low}Length);
-        std::vector<{type_cpp}> _{attribute_low}Response;"""
+        std::vector<{type_cpp}> _{attribute_low}Response;""").render(type_java_array=type_java_array, attribute_low=attribute_low, type_array=type_array, type_cpp=type_cpp)
             else:
-                src_str += f"""
+                src_str += code_template("""
         jsize {attribute_cap}Length = env->GetArrayLength({attribute_low});
         std::vector<{type_cpp}> _{attribute_low};
         std::vector<{type_cpp}> _{attribute_low}Response;
@@ -2757,13 +4561,13 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
             const char *{attribute_cap}Cstr = {env}->GetStringUTFChars({attribute_cap}Str, nullptr);
             _{attribute_low}.push_back(std::string({attribute_cap}Cstr));
         }}
-        """
+        """).render(attribute_cap=attribute_cap, attribute_low=attribute_low, type_cpp=type_cpp, env=env)
         elif(type_checked == 8):
-            src_str += f"""
+            src_str += code_template("""
         jbyte {attribute_low}Int = {attribute_low};
         uint8_t _{attribute_low}Int = static_cast<uint8_t>({attribute_low}Int);
         {reference_cap}::{reference_type} _{attribute_low} = {reference_cap}::{reference_type}::Literal(_{attribute_low}Int);
-        {reference_cap}::{reference_type} _{attribute_low}Response;"""
+        {reference_cap}::{reference_type} _{attribute_low}Response;""").render(attribute_low=attribute_low, reference_cap=reference_cap, reference_type=reference_type)
         elif(type_checked == 9):
             src_str += complex_array(attribute, interface, cpp_package, java_class, "", 3)
         elif(type_checked == 10):
@@ -2772,30 +4576,30 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
             src_str += generate_src_map(attribute,cpp_package,interface,java_class,upper="",indentation=0,type=2)
             
         ####3번 setValue call
-        src_str += f"""
+        src_str += code_template("""
         _{interface_cap}Client->myProxy->get{attribute_cap}Attribute().setValue(_{attribute_low}, callStatus, _{attribute_low}Response, &info);
         if(callStatus != CommonAPI::CallStatus::SUCCESS) {{
         \tLOGE("Set Value {attribute_low} failed!");
-        }}"""
+        }}""").render(interface_cap=interface_cap, attribute_cap=attribute_cap, attribute_low=attribute_low)
         
         ####4번 return
         if(type_checked == 1):
-            src_str += f"""
+            src_str += code_template("""
         return static_cast<{type_java}>(_{attribute_low}Response);
-        }}\n"""
+        }}\n""").render(type_java=type_java, attribute_low=attribute_low)
         elif(type_checked == 2):
-            src_str += f"""
+            src_str += code_template("""
         {type_java} {attribute_low}Response = env->NewStringUTF(_{attribute_low}Response.c_str());
         return {attribute_low}Response;
-        }}\n"""
+        }}\n""").render(type_java=type_java, attribute_low=attribute_low)
         elif(type_checked == 3 or type_checked == 5 or type_checked == 6):
-            if(isUnsigned(array.type.name) or array.type.name == "Int16"):
-                src_str += f"""
+            if(descriptor.unsigned or array.type.name == "Int16"):
+                src_str += code_template("""
         std::vector<{type_cpp_array}> _{attribute_low}ResponseSigned;
         _{attribute_low}ResponseSigned.assign(_{attribute_low}Response.begin(), _{attribute_low}Response.end());
-        {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}ResponseSigned.data());"""
+        {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}ResponseSigned.data());""").render(type_cpp_array=type_cpp_array, attribute_low=attribute_low, type_java_array=type_java_array)
             elif(array.type.name == "String"):
-                src_str += f"""
+                src_str += code_template("""
         jclass {attribute_cap}Clazz = {env}->GetObjectClass({attribute_cap}Str);
         {type_java_array}Array {attribute_low}Response = {env}->NewObjectArray({attribute_cap}Length, {attribute_cap}Clazz, nullptr);
         
@@ -2807,65 +4611,75 @@ def generate_src_attribute(attribute, package_name, interface, java_package_name
         
         return {attribute_low}Response;
     }}
-    """
+    """).render(attribute_cap=attribute_cap, env=env, type_java_array=type_java_array, attribute_low=attribute_low)
             else:
-                src_str += f"""
-        {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}Response.data());"""
+                src_str += code_template("""
+        {attribute_low}Data = static_cast<{type_java_array}*>(_{attribute_low}Response.data());""").render(attribute_low=attribute_low, type_java_array=type_java_array)
             if(array.type.name != "String"):
-                src_str += f"""
+                src_str += code_template("""
         {type_java_array}Array {attribute_low}Response = env->New{type_array}Array({attribute_low}Length);
         env->Set{type_array}ArrayRegion({attribute_low}Response, 0, {attribute_low}Length, {attribute_low}Data);
         return {attribute_low}Response;
-        }}\n"""
+        }}\n""").render(type_java_array=type_java_array, attribute_low=attribute_low, type_array=type_array)
+        elif(shared is not None and (type_checked == 4 or type_checked == 7)):
+            src_str += code_template("""
+        jobject {attribute_low}Response = {shared_prefix}ToJava({env}, _{attribute_low}Response);
+        return {attribute_low}Response;
+    }}\n""").render(attribute_low=attribute_low, shared_prefix=shared_prefix, env=env)
+        elif(shared is not None and (type_checked == 9 or type_checked == 10)):
+            src_str += code_template("""
+        jobjectArray {attribute_low}Response = {shared_prefix}ArrayToJava({env}, _{attribute_low}Response);
+        return {attribute_low}Response;
+    }}\n""").render(attribute_low=attribute_low, shared_prefix=shared_prefix, env=env)
         elif(type_checked == 4 or type_checked == 7):
             src_str += src_str_struct
-            src_str += f"""
-        jobject {attribute_low}Response = env->NewObject({defined}{attribute.type.reference.name}Clazz, {defined}{attribute.type.reference.name}Constructor"""
+            src_str += code_template("""
+        jobject {attribute_low}Response = env->NewObject({defined}{reference_name}Clazz, {defined}{reference_name}Constructor""").render(attribute_low=attribute_low, defined=defined, reference_name=attribute.type.reference.name)
             for field in attribute.type.reference.fields.values():
                 src_str += ", {}{}".format(attribute_low,capitalize_first_letter(field.name));
             src_str += ");"
             for ref in list_set:
-                src_str += f"""
-        {env}->DeleteLocalRef({ref}Instance);"""
-            src_str += f"""
+                src_str += code_template("""
+        {env}->DeleteLocalRef({ref}Instance);""").render(env=env, ref=ref)
+            src_str += code_template("""
         return {attribute_low}Response;
-    }}\n"""
+    }}\n""").render(attribute_low=attribute_low)
         elif(type_checked == 8):
-            src_str += f"""
+            src_str += code_template("""
         _{attribute_low}Int = static_cast<uint8_t>(_{attribute_low}Response);
         jbyte {attribute_low}Response = static_cast<jbyte>(_{attribute_low}Int);
         return {attribute_low}Response;
-    }}\n"""
+    }}\n""").render(attribute_low=attribute_low)
         elif(type_checked == 9):
             src_str += complex_array(attribute, interface, cpp_package, java_class, field_name_extends="", is_sub=2)
-            src_str += f"""
+            src_str += code_template("""
         return {attribute_low}Response;
-    }}\n"""
+    }}\n""").render(attribute_low=attribute_low)
         elif(type_checked == 10):
             src_str += complex_array(attribute, interface, cpp_package, java_class, field_name_extends="", is_sub=2, is_implicit=True)
-            src_str += f"""
+            src_str += code_template("""
         return {attribute_low}Response;
-    }}\n"""
+    }}\n""").render(attribute_low=attribute_low)
         elif(type_checked == 11):
             src_str += generate_src_map(attribute,cpp_package,interface,java_class,upper="",indentation=0,type=3)
-            src_str += f"""
+            src_str += code_template("""
         return {attribute_low}Response;
-    }}\n"""
+    }}\n""").render(attribute_low=attribute_low)
 
     ###################################################################################################################
     ### unsub code, same for all
-    src_str += f"""
+    src_str += code_template("""
     JNIEXPORT void JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_unsubAttribute{attribute_cap}(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){{
     \t{interface_cap}Client* _{interface_cap}Client = reinterpret_cast<{interface_cap}Client*>(proxyptr);
     \t//_{interface_cap}Client->{interface_cap}Instance = {env}->NewGlobalRef(instance);
     \tint _subscription = static_cast<int>(subscription);
     \t_{interface_cap}Client->myProxy->get{attribute_cap}Attribute().getChangedEvent().unsubscribe(_subscription);
-    }}\n"""
+    }}\n""").render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, attribute_cap=attribute_cap, env=env)
 
     src_str += """\n////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 ////////////////////////////////////////////////////////////////////////////////////////////////////////////////////\n"""
 
-    return(src_str)
+    return src_str.getvalue()
 
 ##################################### METHOD ################################################################################
 def struct_fields_method_in_gen(arg, interface, packages, java_class, field_name_extends=""):
@@ -2901,7 +4715,7 @@ def struct_fields_method_in_gen(arg, interface, packages, java_class, field_name
             #field_name = capitalize_first_letter(field.name)
             #field_name_low = lower_first_letter(field.name)
             fields_str += f"""\n\t\tjfieldID {arg_low}{field_name}FID = {env}->GetFieldID({defined}{arg.type.reference.name}Clazz, \"{field_name_low}\", \"{field_type_jni}\");"""
-            fields_str += f"""\n\t\t{field_type_java} {arg_low}{field_name} = {env}->Get{capitalize_first_letter(convert_aidl_type(field.type.name))}Field({arg_low}, {arg_low}{field_name}FID);"""
+            fields_str += f"""\n\t\t{field_type_java} {arg_low}{field_name} = {env}->Get{capitalize_first_letter(type_spelling(field.type.name).aidl)}Field({arg_low}, {arg_low}{field_name}FID);"""
             fields_str += f"""
         _{arg_low}.set{field_name}(static_cast<{field_type_cpp}>({arg_low}{field_name}));"""
         elif(type_checked == 2):
@@ -2920,7 +4734,7 @@ def struct_fields_method_in_gen(arg, interface, packages, java_class, field_name
             if(type_checked == 3):
                 array = interface.arrays[field.type.name]
             elif(type_checked == 5):
-                array = field.type
+                array = element_type(field)
             elif(type_checked == 6):
                 array = field.type.reference
             type_jni_array = convert_jni_type(array.type.name)
@@ -2931,7 +4745,7 @@ def struct_fields_method_in_gen(arg, interface, packages, java_class, field_name
             if(array.type.name != "String"):
                 fields_str += f"""\n\t\tjfieldID {arg_low}{field_name}FID = {env}->GetFieldID({defined}{arg.type.reference.name}Clazz, \"{field_name_low}\", \"[{type_jni_array}\");
         {type_java_array}Array {arg_low}{field_name} = reinterpret_cast<{type_java_array}Array>({env}->GetObjectField({arg_low},{arg_low}{field_name}FID));
-        {type_java_array}* {arg_low}{field_name}Data = {env}->Get{capitalize_first_letter(convert_aidl_type(array.type.name))}ArrayElements({arg_low}{field_name}, nullptr);
+        {type_java_array}* {arg_low}{field_name}Data = {env}->Get{capitalize_first_letter(type_spelling(array.type.name).aidl)}ArrayElements({arg_low}{field_name}, nullptr);
         jsize {arg_low}{field_name}Length = {env}->GetArrayLength({arg_low}{field_name});"""
             else:
                 string_array_gen = ""
@@ -3070,7 +4884,7 @@ def struct_fields_method_out_gen(arg, interface, packages, java_class, field_nam
                 array = interface.arrays[field.type.name]
                 array_gen = "{}::{}".format(array.namespace.name, array.name)
             elif(type_checked == 5):
-                array = field.type
+                array = element_type(field)
                 array_gen = "std::vector<{}>".format(convert_cpp_type(array.type.name))
             elif(type_checked == 6):
                 array = field.type.reference
@@ -3088,7 +4902,7 @@ def struct_fields_method_out_gen(arg, interface, packages, java_class, field_nam
         {type_java_array}* {arg_low}{field_name}Data = static_cast<{type_java_array}*>(_{arg_low}{field_name}{temp}.data());
         jsize {arg_low}{field_name}Length = static_cast<jsize>(_{arg_low}{field_name}{temp}.size());
         {type_java_array}Array {arg_low}{field_name};
-        {env}->Set{capitalize_first_letter(convert_aidl_type(array.type.name))}ArrayRegion({arg_low}{field_name}, 0, {arg_low}{field_name}Length, {arg_low}{field_name}Data);
+        {env}->Set{capitalize_first_letter(type_spelling(array.type.name).aidl)}ArrayRegion({arg_low}{field_name}, 0, {arg_low}{field_name}Length, {arg_low}{field_name}Data);
         """
             # String array
             else:
@@ -3177,9 +4991,10 @@ def struct_fields_method_out_gen(arg, interface, packages, java_class, field_nam
     return fields_str
 
 
+@profiled("member")
 def generate_src_method(method, package_name, interface, java_package_name):
     package_names = package_name.split('.')
-    src_str = ""
+    src_str = CodeBuffer()
     java_package = ""
     java_class = ""
     for name in java_package_name:
@@ -3212,8 +5027,8 @@ def generate_src_method(method, package_name, interface, java_package_name):
     errors_method_call = ""
     if(method.errors):
         if(isinstance(method.errors, ast.Reference)):
-            errors_str += f"""
-        {method.errors.reference.namespace.name}::{method.errors.reference.name} _{lower_first_letter(method.errors.name)};"""
+            errors_str += code_template("""
+        {errors_namespace}::{errors_name} _{errors_low};""").render(errors_namespace=method.errors.reference.namespace.name, errors_name=method.errors.reference.name, errors_low=lower_first_letter(method.errors.name))
             errors_method_call = ", _{}".format(lower_first_letter(method.errors.name))
     
     # Method 1: Return type of method
@@ -3221,17 +5036,18 @@ def generate_src_method(method, package_name, interface, java_package_name):
         return_type = "jobject"
     elif len(method.out_args.values()) == 1:
         arg =  next(iter(method.out_args.values()))
+        descriptor = type_descriptor(arg)
         type_checked = check_type_ver2(arg, interface)
         if(type_checked == 1 or type_checked == 2):
-            return_type = "{}".format(convert_java_type(arg.type.name))
+            return_type = "{}".format(descriptor.spelling.java)
         elif(type_checked == 3 or type_checked == 5 or type_checked == 6):
             if(type_checked == 3):
                 array = interface.arrays[arg.type.name]
             elif(type_checked == 5):
-                array = arg.type
+                array = element_type(arg)
             elif(type_checked == 6):
                 array = arg.type.reference
-            return_type = "{}Array".format(convert_java_type(array.type.name))
+            return_type = "{}Array".format(descriptor.element_spelling.java)
         elif(type_checked == 8):
             return_type = "jbyte"
         elif(type_checked == 9 or type_checked == 10 or type_checked == 11):
@@ -3243,48 +5059,51 @@ def generate_src_method(method, package_name, interface, java_package_name):
 
     cnt = 1
     for arg in method.out_args.values():
+        descriptor = type_descriptor(arg)
         type_checked = check_type_ver2(arg, interface)
         arg_low = lower_first_letter(arg.name)
         arg_cap = capitalize_first_letter(arg.name)
+        shared = shared_conversion(arg)
+        profile_conversion(arg, shared, "struct_fields_sub_gen")
         out_args_cpp_val += ", _{}".format(arg_low)
         out_args_return += "{}".format(arg_low)
         ### type 마다 다르게 처리됨
         if(type_checked == 1 or type_checked == 2):
-            out_args_type_jni += "{}".format(convert_jni_type(arg.type.name))
-            out_args_cpp_gen += "{} _{};\n\t\t".format(convert_cpp_type(arg.type.name), arg_low)
+            out_args_type_jni += "{}".format(descriptor.spelling.jni)
+            out_args_cpp_gen += "{} _{};\n\t\t".format(descriptor.spelling.cpp, arg_low)
             if(type_checked == 1):
-                out_args_after += "\n\t\t{} {} = static_cast<{}>(_{});".format(convert_java_type(arg.type.name), arg_low, convert_java_type(arg.type.name),arg_low)
+                out_args_after += "\n\t\t{} {} = static_cast<{}>(_{});".format(descriptor.spelling.java, arg_low, descriptor.spelling.java,arg_low)
             else:
-                out_args_after += "\n\t\t{} {} = env->NewStringUTF(_{}.c_str());".format(convert_java_type(arg.type.name), arg_low, arg_low)
+                out_args_after += "\n\t\t{} {} = env->NewStringUTF(_{}.c_str());".format(descriptor.spelling.java, arg_low, arg_low)
             
         elif(type_checked == 3 or type_checked == 5 or type_checked == 6):
             if(type_checked == 3):
                 array = interface.arrays[arg.type.name]
             elif(type_checked == 5):
-                array = arg.type
+                array = element_type(arg)
             elif(type_checked == 6):
                 array = arg.type.reference
-            array_java_type = convert_java_type(array.type.name)
-            array_jni_type = capitalize_first_letter(convert_java_code_type(array.type.name))
-            array_cpp_type = upcast_cpp_int(array.type.name)
-            out_args_type_jni += "[{}".format(convert_jni_type(array.type.name))
+            array_java_type = descriptor.element_spelling.java
+            array_jni_type = capitalize_first_letter(descriptor.element_spelling.java_code)
+            array_cpp_type = upcast_cpp_int(descriptor.element_spelling.name)
+            out_args_type_jni += "[{}".format(descriptor.element_spelling.jni)
             if(type_checked == 3 or type_checked == 6):
-                out_args_cpp_gen += f"""{arg.type.reference.namespace.name}::{arg.type.reference.name} _{arg_low};
-        """
+                out_args_cpp_gen += code_template("""{reference_namespace}::{reference_name} _{arg_low};
+        """).render(reference_namespace=arg.type.reference.namespace.name, reference_name=arg.type.reference.name, arg_low=arg_low)
             elif(type_checked == 5):
-                out_args_cpp_gen += f"""std::vector<{convert_cpp_type(array.type.name)}> _{arg_low};
-        """
+                out_args_cpp_gen += code_template("""std::vector<{element_cpp}> _{arg_low};
+        """).render(element_cpp=descriptor.element_spelling.cpp, arg_low=arg_low)
             ### jshort (int16_t) to int cast
             short_to_int = ""
             int_extension = ""
-            if(isUnsigned(array.type.name) or array.type.name == "Int16"):
-                out_args_after += f"""
+            if(descriptor.unsigned or array.type.name == "Int16"):
+                out_args_after += code_template("""
         std::vector<{array_cpp_type}> _{arg_low}Signed;
         _{arg_low}Signed.assign(_{arg_low}.begin(), _{arg_low}.end());
-        {array_java_type}* {arg_low}Data = static_cast<{array_java_type}*>(_{arg_low}Signed.data());"""
+        {array_java_type}* {arg_low}Data = static_cast<{array_java_type}*>(_{arg_low}Signed.data());""").render(array_cpp_type=array_cpp_type, arg_low=arg_low, array_java_type=array_java_type)
             # String array
             elif(array.type.name == "String"):
-                out_args_after += f"""
+                out_args_after += code_template("""
         jsize {arg_low}Length = static_cast<jsize>(_{arg_low}.size());
         jstring {arg_low}Str = {env}->NewStringUTF("");
         jclass {arg_low}StrClazz = {env}->GetObjectClass({arg_low}Str);
@@ -3294,31 +5113,45 @@ def generate_src_method(method, package_name, interface, java_package_name):
             {env}->SetObjectArrayElement({arg_low}, sss, {arg_low}Str);
         }}
         {env}->DeleteLocalRef({arg_low}Str);
-        """
+        """).render(arg_low=arg_low, env=env)
             #
             else:
                 out_args_after += short_to_int
-                out_args_after += f"""
-        {array_java_type}* {arg_low}Data = static_cast<{array_java_type}*>(_{int_extension}{arg_low}.data());"""
+                out_args_after += code_template("""
+        {array_java_type}* {arg_low}Data = static_cast<{array_java_type}*>(_{int_extension}{arg_low}.data());""").render(array_java_type=array_java_type, arg_low=arg_low, int_extension=int_extension)
             if(array.type.name != "String"):
-                out_args_after += f"""
+                out_args_after += code_template("""
         jsize {arg_low}Length = static_cast<jsize>(_{arg_low}.size());
         {array_java_type}Array {arg_low} = env->New{array_jni_type}Array({arg_low}Length);
         env->Set{array_jni_type}ArrayRegion({arg_low}, 0, {arg_low}Length, {arg_low}Data);
-        """
+        """).render(arg_low=arg_low, array_java_type=array_java_type, array_jni_type=array_jni_type)
+        elif(shared is not None and (type_checked == 4 or type_checked == 7)):
+            out_args_type_jni += "L{}{}JNI${};".format(java_class,capitalize_first_letter(shared.namespace.name),shared.name)
+            out_args_cpp_gen += code_template("""
+        {shared_cpp} _{arg_low};
+        """).render(shared_cpp=cpp_qualified_name(shared), arg_low=arg_low)
+            out_args_after += code_template("""jobject {arg_low} = {shared_prefix}ToJava({env}, _{arg_low});
+        """).render(arg_low=arg_low, shared_prefix=conversion_prefix(shared), env=env)
+        elif(shared is not None and (type_checked == 9 or type_checked == 10)):
+            out_args_type_jni += "[L{}{}JNI${};".format(java_class,shared.namespace.name,shared.name)
+            out_args_cpp_gen += code_template("""
+        std::vector<{shared_cpp}> _{arg_low};
+        """).render(shared_cpp=cpp_qualified_name(shared), arg_low=arg_low)
+            out_args_after += code_template("""jobjectArray {arg_low} = {shared_prefix}ArrayToJava({env}, _{arg_low});
+        """).render(arg_low=arg_low, shared_prefix=conversion_prefix(shared), env=env)
         elif(type_checked == 4 or type_checked == 7):
             defined = capitalize_first_letter(arg.type.reference.namespace.name)
             struct_name = capitalize_first_letter(arg.type.reference.name)
             struct_fields_jni = struct_fields(arg.type.reference.fields,java_class=java_class)
             out_args_type_jni += "L{}{}JNI${};".format(java_class,defined,arg.type.reference.name)
-            out_args_cpp_gen += f"""
-        {defined}::{arg.type.reference.name} _{arg_low};
-        """
-            out_args_after += f"""jclass out{defined}{struct_name}Clazz = {env}->FindClass("{java_class}{defined}{interface_extension}${arg.type.reference.name}");
+            out_args_cpp_gen += code_template("""
+        {defined}::{reference_name} _{arg_low};
+        """).render(defined=defined, reference_name=arg.type.reference.name, arg_low=arg_low)
+            out_args_after += code_template("""jclass out{defined}{struct_name}Clazz = {env}->FindClass("{java_class}{defined}{interface_extension}${reference_name}");
         jmethodID out{defined}{struct_name}Constructor = {env}->GetMethodID(out{defined}{struct_name}Clazz, "<init>", "({struct_fields_jni})V");
-        """
+        """).render(defined=defined, struct_name=struct_name, env=env, java_class=java_class, interface_extension=interface_extension, reference_name=arg.type.reference.name, struct_fields_jni=struct_fields_jni)
             out_args_after += struct_fields_method_out_gen(arg,interface,cpp_package,java_class, "")
-            out_args_after += f"""jobject {arg_low} = {env}->NewObject(out{defined}{struct_name}Clazz, out{defined}{struct_name}Constructor"""
+            out_args_after += code_template("""jobject {arg_low} = {env}->NewObject(out{defined}{struct_name}Clazz, out{defined}{struct_name}Constructor""").render(arg_low=arg_low, env=env, defined=defined, struct_name=struct_name)
             for field in arg.type.reference.fields.values():
                 out_args_after += ", {}{}".format(arg_low, capitalize_first_letter(field.name));
             out_args_after += ");"
@@ -3329,28 +5162,28 @@ def generate_src_method(method, package_name, interface, java_package_name):
         #     out_args_cpp_gen += f"""jclass {reference_cap}{reference_type}Clazz = {env}->GetObjectClass({reference_cap}Instance);
         # {reference_cap}::{reference_type} _{arg_low};
         # """
-            out_args_cpp_gen += f"""{reference_cap}::{reference_type} _{arg_low};
-        """
-            out_args_after += f"""uint8_t _{arg_low}Int = static_cast<uint8_t>(_{arg_low});
+            out_args_cpp_gen += code_template("""{reference_cap}::{reference_type} _{arg_low};
+        """).render(reference_cap=reference_cap, reference_type=reference_type, arg_low=arg_low)
+            out_args_after += code_template("""uint8_t _{arg_low}Int = static_cast<uint8_t>(_{arg_low});
         jbyte {arg_low} = static_cast<jbyte>(_{arg_low}Int);
-        """
+        """).render(arg_low=arg_low)
         ### Complex array
         elif(type_checked == 9):
-            out_args_cpp_gen += f"""
-        {arg.type.reference.namespace.name}::{arg.type.reference.name} _{arg_low};
-        """
+            out_args_cpp_gen += code_template("""
+        {reference_namespace}::{reference_name} _{arg_low};
+        """).render(reference_namespace=arg.type.reference.namespace.name, reference_name=arg.type.reference.name, arg_low=arg_low)
             out_args_type_jni += "[L{}{}JNI${};".format(java_class,arg.type.reference.type.reference.namespace.name,arg.type.reference.type.reference.name)
             out_args_after += complex_array(arg, interface, cpp_namespace, java_class, "", 5)
         elif(type_checked == 10):
-            out_args_cpp_gen += f"""
-        std::vector<{arg.type.type.reference.namespace.name}::{arg.type.type.reference.name}> _{arg_low};
-        """
+            out_args_cpp_gen += code_template("""
+        std::vector<{element_namespace}::{element_name}> _{arg_low};
+        """).render(element_namespace=arg.type.type.reference.namespace.name, element_name=arg.type.type.reference.name, arg_low=arg_low)
             out_args_type_jni += "[L{}{}JNI${};".format(java_class,arg.type.type.reference.namespace.name,arg.type.type.reference.name)
             out_args_after += complex_array(arg, interface, cpp_namespace, java_class, "", 5, is_implicit=True)
         elif(type_checked == 11):
-            out_args_cpp_gen += f"""
-        {arg.type.reference.namespace.name}::{arg.type.reference.name} _{arg_low};
-        """
+            out_args_cpp_gen += code_template("""
+        {reference_namespace}::{reference_name} _{arg_low};
+        """).render(reference_namespace=arg.type.reference.namespace.name, reference_name=arg.type.reference.name, arg_low=arg_low)
             out_args_type_jni += "[L{}{}JNI${};".format(java_class,arg.type.reference.namespace.name,arg.type.reference.name)
             out_args_after += generate_src_map(arg, cpp_namespace, interface, java_class, "", 0, 4)
         ###
@@ -3364,37 +5197,40 @@ def generate_src_method(method, package_name, interface, java_package_name):
         ### type 마다 다르게 처리됨
         arg_low = lower_first_letter(arg.name)
         arg_cap = capitalize_first_letter(arg.name)
+        descriptor = type_descriptor(arg)
         type_checked = check_type_ver2(arg, interface)
+        shared = shared_conversion(arg)
+        profile_conversion(arg, shared, "struct_fields_set_gen")
         if(type_checked == 1):
-            in_args += ", {} {}".format(convert_java_type(arg.type.name), arg_low)
-            in_args_cpp_gen += "{} _{} = static_cast<{}>({});\n\t\t".format(convert_cpp_type(arg.type.name),arg_low,convert_cpp_type(arg.type.name),arg_low)
+            in_args += ", {} {}".format(descriptor.spelling.java, arg_low)
+            in_args_cpp_gen += "{} _{} = static_cast<{}>({});\n\t\t".format(descriptor.spelling.cpp,arg_low,descriptor.spelling.cpp,arg_low)
         elif(type_checked == 2):
-            in_args += ", {} {}".format(convert_java_type(arg.type.name), arg_low)
-            in_args_cpp_gen += "{} _{} = {}->GetStringUTFChars({}, nullptr);\n\t\t".format(convert_cpp_type(arg.type.name),arg_low,env,arg_low)
+            in_args += ", {} {}".format(descriptor.spelling.java, arg_low)
+            in_args_cpp_gen += "{} _{} = {}->GetStringUTFChars({}, nullptr);\n\t\t".format(descriptor.spelling.cpp,arg_low,env,arg_low)
         elif(type_checked == 3 or type_checked == 5 or type_checked == 6):
             if(type_checked == 3):
                 array = interface.arrays[arg.type.name]
             elif(type_checked == 5):
-                array = arg.type
+                array = element_type(arg)
             elif(type_checked == 6):
                 array = arg.type.reference
-            array_java_type = convert_java_type(array.type.name)
+            array_java_type = descriptor.element_spelling.java
             if(array.type.name == "String"):
                 array_java_type = "jobject"
-            array_jni_type = capitalize_first_letter(convert_aidl_type(array.type.name))
+            array_jni_type = capitalize_first_letter(descriptor.element_spelling.aidl)
             in_args += ", {}Array {}".format(array_java_type, arg_low)
             ### String array 별도 처리
             if(array.type.name != "String"):
-                in_args_cpp_gen += f"""{array_java_type}* {arg_low}Data = {env}->Get{array_jni_type}ArrayElements({arg_low}, nullptr);
+                in_args_cpp_gen += code_template("""{array_java_type}* {arg_low}Data = {env}->Get{array_jni_type}ArrayElements({arg_low}, nullptr);
         jsize {arg_low}Length = {env}->GetArrayLength({arg_low});
-        """
+        """).render(array_java_type=array_java_type, arg_low=arg_low, env=env, array_jni_type=array_jni_type)
             else:
                 in_args_string_gen = ""
                 if(type_checked == 3):
-                    in_args_string_gen = f"{arg.type.reference.namespace.name}::{arg.type.reference.name}"
+                    in_args_string_gen = code_template("{reference_namespace}::{reference_name}").render(reference_namespace=arg.type.reference.namespace.name, reference_name=arg.type.reference.name)
                 elif(type_checked == 5):
-                    in_args_string_gen = f"std::vector<std::string>"
-                in_args_cpp_gen += f"""{in_args_string_gen} _{arg_low};
+                    in_args_string_gen = code_template("std::vector<std::string>").render()
+                in_args_cpp_gen += code_template("""{in_args_string_gen} _{arg_low};
         jsize {arg_low}Length = {env}->GetArrayLength({arg_low});
         jstring {arg_low}Str = {env}->NewStringUTF("");
         for(int sss = 0; sss < {arg_low}Length; sss++){{
@@ -3403,13 +5239,21 @@ def generate_src_method(method, package_name, interface, java_package_name):
             _{arg_low}.push_back(std::string({arg_low}Cstr));
         }}
         {env}->DeleteLocalRef({arg_low}Str);
-        """
+        """).render(in_args_string_gen=in_args_string_gen, arg_low=arg_low, env=env)
             if((type_checked == 3 and array.type.name != "String") or type_checked == 6):
-                in_args_cpp_gen += f"""{arg.type.reference.namespace.name}::{arg.type.reference.name} _{arg_low}({arg_low}Data, {arg_low}Data + {arg_low}Length);
-        """
+                in_args_cpp_gen += code_template("""{reference_namespace}::{reference_name} _{arg_low}({arg_low}Data, {arg_low}Data + {arg_low}Length);
+        """).render(reference_namespace=arg.type.reference.namespace.name, reference_name=arg.type.reference.name, arg_low=arg_low)
             elif(type_checked == 5 and array.type.name != "String"):
-                in_args_cpp_gen += f"""std::vector<{convert_cpp_type(array.type.name)}> _{arg_low}({arg_low}Data, {arg_low}Data + {arg_low}Length);
-        """
+                in_args_cpp_gen += code_template("""std::vector<{element_cpp}> _{arg_low}({arg_low}Data, {arg_low}Data + {arg_low}Length);
+        """).render(element_cpp=descriptor.element_spelling.cpp, arg_low=arg_low)
+        elif(shared is not None and (type_checked == 4 or type_checked == 7)):
+            in_args += ", jobject {}".format(arg_low)
+            in_args_cpp_gen += code_template("""{shared_cpp} _{arg_low} = {shared_prefix}FromJava({env}, {arg_low});
+        """).render(shared_cpp=cpp_qualified_name(shared), arg_low=arg_low, shared_prefix=conversion_prefix(shared), env=env)
+        elif(shared is not None and (type_checked == 9 or type_checked == 10)):
+            in_args += ", jobjectArray {}".format(arg_low)
+            in_args_cpp_gen += code_template("""std::vector<{shared_cpp}> _{arg_low} = {shared_prefix}ArrayFromJava({env}, {arg_low});
+        """).render(shared_cpp=cpp_qualified_name(shared), arg_low=arg_low, shared_prefix=conversion_prefix(shared), env=env)
         elif(type_checked == 4 or type_checked == 7):
             defined = capitalize_first_letter(arg.type.reference.namespace.name)
             if(type_checked == 4):
@@ -3417,9 +5261,9 @@ def generate_src_method(method, package_name, interface, java_package_name):
             else:
                 struct_name = arg.type.reference.name
             in_args += ", jobject {}".format(arg_low)
-            in_args_cpp_gen += f"""jclass {defined}{struct_name}Clazz = {env}->GetObjectClass({arg_low});
+            in_args_cpp_gen += code_template("""jclass {defined}{struct_name}Clazz = {env}->GetObjectClass({arg_low});
         {defined}::{struct_name} _{arg_low};
-        """
+        """).render(defined=defined, struct_name=struct_name, env=env, arg_low=arg_low)
             in_args_cpp_gen += struct_fields_method_in_gen(arg,interface,cpp_package,java_class,"")
             
         elif(type_checked == 8):
@@ -3431,10 +5275,10 @@ def generate_src_method(method, package_name, interface, java_package_name):
         # uint8_t _{arg_low}Int = static_cast<uint8_t>({arg_low}Int);
         # {reference_cap}::{reference_type} _{arg_low} = {reference_cap}::{reference_type}::Literal(_{arg_low}Int);
         # """
-            in_args_cpp_gen += f"""jbyte {arg_low}Int = {arg_low};
+            in_args_cpp_gen += code_template("""jbyte {arg_low}Int = {arg_low};
         uint8_t _{arg_low}Int = static_cast<uint8_t>({arg_low}Int);
         {reference_cap}::{reference_type} _{arg_low} = {reference_cap}::{reference_type}::Literal(_{arg_low}Int);
-        """
+        """).render(arg_low=arg_low, reference_cap=reference_cap, reference_type=reference_type)
         ### Complex Array
         elif(type_checked == 9):
             in_args += ", jobjectArray {}".format(arg_low)
@@ -3448,13 +5292,13 @@ def generate_src_method(method, package_name, interface, java_package_name):
         ###
         in_args_cpp_val += "_{}, ".format(arg_low)
     
-    src_str += f"""
+    src_str += code_template("""
     JNIEXPORT {return_type} JNICALL
-    Java_{java_package}{interface_cap}{interface_extension}_{method_cap}(JNIEnv *env, jobject instance, jlong proxyptr{in_args}){{"""
+    Java_{java_package}{interface_cap}{interface_extension}_{method_cap}(JNIEnv *env, jobject instance, jlong proxyptr{in_args}){{""").render(return_type=return_type, java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, method_cap=method_cap, in_args=in_args)
     # proxy translation
-    src_str += f"""
+    src_str += code_template("""
         {interface_cap}Client* _{interface_cap}Client = reinterpret_cast<{interface_cap}Client*>(proxyptr);
-        _{interface_cap}Client->{interface_cap}Instance = env->NewGlobalRef(instance);"""   
+        _{interface_cap}Client->{interface_cap}Instance = env->NewGlobalRef(instance);""").render(interface_cap=interface_cap)   
     # if there is an eumuerator in the in_args or out_args
     list_get = []
     # if(type_checked == 8 or type_checked == 4 or type_checked == 6 or type_checked == 7):
@@ -3462,69 +5306,70 @@ def generate_src_method(method, package_name, interface, java_package_name):
         if(isinstance(arg.type, ast.Reference)):
             if(isinstance(arg.type.reference, ast.Enumeration) and (arg.type.reference.namespace.name not in list_get)):
                 list_get.append(arg.type.reference.namespace.name)
-                src_str += f"""
-        jobject {arg.type.reference.namespace.name}Instance = {env}->AllocObject(_{interface_cap}Client->{arg.type.reference.namespace.name}Clazz);
-        """
-            elif(isinstance(arg.type.reference, ast.Struct)):
+                src_str += code_template("""
+        jobject {reference_namespace}Instance = {env}->AllocObject(_{interface_cap}Client->{reference_namespace}Clazz);
+        """).render(reference_namespace=arg.type.reference.namespace.name, env=env, interface_cap=interface_cap)
+            elif(isinstance(arg.type.reference, ast.Struct) and shared_conversion(arg) is None):
                 for field in arg.type.reference.fields.values():
                     if(isinstance(field.type, ast.Reference)):
                         if(isinstance(field.type.reference, ast.Enumeration) and (field.type.reference.namespace.name not in list_get)):
                             list_get.append(field.type.reference.namespace.name)
-                            src_str += f"""
-        jobject {field.type.reference.namespace.name}Instance = {env}->AllocObject(_{interface_cap}Client->{field.type.reference.namespace.name}Clazz);
-        """
+                            src_str += code_template("""
+        jobject {field_namespace}Instance = {env}->AllocObject(_{interface_cap}Client->{field_namespace}Clazz);
+        """).render(field_namespace=field.type.reference.namespace.name, env=env, interface_cap=interface_cap)
     for arg in method.out_args.values():
         if(isinstance(arg.type, ast.Reference)):
             if(isinstance(arg.type.reference, ast.Enumeration) and (arg.type.reference.namespace.name not in list_get)):
                 list_get.append(arg.type.reference.namespace.name)
-                src_str += f"""
-        jobject {arg.type.reference.namespace.name}Instance = {env}->AllocObject(_{interface_cap}Client->{arg.type.reference.namespace.name}Clazz);
-        """
-            elif(isinstance(arg.type.reference, ast.Struct)):
+                src_str += code_template("""
+        jobject {reference_namespace}Instance = {env}->AllocObject(_{interface_cap}Client->{reference_namespace}Clazz);
+        """).render(reference_namespace=arg.type.reference.namespace.name, env=env, interface_cap=interface_cap)
+            elif(isinstance(arg.type.reference, ast.Struct) and shared_conversion(arg) is None):
                 for field in arg.type.reference.fields.values():
                     if(isinstance(field.type, ast.Reference)):
                         if(isinstance(field.type.reference, ast.Enumeration) and (field.type.reference.namespace.name not in list_get)):
                             list_get.append(field.type.reference.namespace.name)
-                            src_str += f"""
-        jobject {field.type.reference.namespace.name}Instance = {env}->AllocObject(_{interface_cap}Client->{field.type.reference.namespace.name}Clazz);
-        """ 
+                            src_str += code_template("""
+        jobject {field_namespace}Instance = {env}->AllocObject(_{interface_cap}Client->{field_namespace}Clazz);
+        """).render(field_namespace=field.type.reference.namespace.name, env=env, interface_cap=interface_cap) 
         
 
     
     # if return has multiple variables
     if len(method.out_args.values()) > 1:
-        src_str += f"""
+        src_str += code_template("""
         jclass {method_low}Clazz = env->FindClass("{java_class}{interface_cap}{interface_extension}${method_cap}ReturnType");
-        jmethodID {method_low}Constructor = env->GetMethodID({method_low}Clazz, "<init>", "({out_args_type_jni})V");"""
+        jmethodID {method_low}Constructor = env->GetMethodID({method_low}Clazz, "<init>", "({out_args_type_jni})V");""").render(method_low=method_low, java_class=java_class, interface_cap=interface_cap, interface_extension=interface_extension, method_cap=method_cap, out_args_type_jni=out_args_type_jni)
     # body
-    src_str += f"""
+    src_str += code_template("""
         {in_args_cpp_gen}{out_args_cpp_gen}
         CommonAPI::CallStatus callStatus;{errors_str}
-        _{interface_cap}Client->myProxy->{method.name}({in_args_cpp_val}callStatus{errors_method_call}{out_args_cpp_val});
+        _{interface_cap}Client->myProxy->{method_name}({in_args_cpp_val}callStatus{errors_method_call}{out_args_cpp_val});
         if(callStatus != CommonAPI::CallStatus::SUCCESS){{
             LOGE("{method_low} failed!");
         }}
-        {out_args_after}"""
+        {out_args_after}""").render(in_args_cpp_gen=in_args_cpp_gen, out_args_cpp_gen=out_args_cpp_gen, errors_str=errors_str, interface_cap=interface_cap, method_name=method.name, in_args_cpp_val=in_args_cpp_val, errors_method_call=errors_method_call, out_args_cpp_val=out_args_cpp_val, method_low=method_low, out_args_after=out_args_after)
     # retrun
     if len(method.out_args.values()) > 1:
-        src_str += f"""
+        src_str += code_template("""
         jobject {method_cap}ReturnType = env->NewObject({method_low}Clazz, {method_low}Constructor, {out_args_return});
         return {method_cap}ReturnType;
-    }}\n"""
+    }}\n""").render(method_cap=method_cap, method_low=method_low, out_args_return=out_args_return)
     elif len(method.out_args.values()) == 1:
-        src_str += f"""
+        src_str += code_template("""
         return {out_args_return};
-    }}\n"""
+    }}\n""").render(out_args_return=out_args_return)
     else:
-        src_str += f"""
-    }}"""
+        src_str += code_template("""
+    }}""").render()
         
-    return src_str
+    return src_str.getvalue()
 ############################### Broadcast #############################################################
 
 ### it is the same as attribute sub and unsub but slightly different
+@profiled("member")
 def generate_src_broadcast(broadcast, package_name, interface, java_package_name):
-    src_str = ""
+    src_str = CodeBuffer()
     package_names = package_name.split('.')
     cpp_package = ""
     for name in package_names:
@@ -3549,19 +5394,20 @@ def generate_src_broadcast(broadcast, package_name, interface, java_package_name
     out_args_jni = struct_fields(broadcast.out_args, java_class= java_class)
     count_args = 1
     for out_arg in broadcast.out_args.values():
+        descriptor = type_descriptor(out_arg)
         arg_type_checked = check_type_ver2(out_arg, interface)
         if(arg_type_checked == 1 or arg_type_checked == 2):
-            out_args_lambda += "{} _{}".format(convert_cpp_type(out_arg.type.name),lower_first_letter(out_arg.name))
+            out_args_lambda += "{} _{}".format(descriptor.spelling.cpp,lower_first_letter(out_arg.name))
         elif(arg_type_checked > 2 and arg_type_checked <= 9):
-            if(out_arg.type.name is None):
-                out_args_lambda += "std::vector<{}> _{}".format(convert_cpp_type(out_arg.type.type.name),lower_first_letter(out_arg.name))
+            if(descriptor.type.name is None):
+                out_args_lambda += "std::vector<{}> _{}".format(descriptor.element_spelling.cpp,lower_first_letter(out_arg.name))
             else:
                 if(isinstance(out_arg.type, ast.Reference)):
                     out_args_lambda += "{}::{} _{}".format(out_arg.type.reference.namespace.name, out_arg.type.reference.name, lower_first_letter(out_arg.name))
         elif(arg_type_checked == 10):
-            out_args_lambda += "std::vector<{}::{}> _{}".format(out_arg.type.type.reference.namespace.name,convert_cpp_type(out_arg.type.type.name),lower_first_letter(out_arg.name))
+            out_args_lambda += "std::vector<{}::{}> _{}".format(out_arg.type.type.reference.namespace.name,descriptor.element_spelling.cpp,lower_first_letter(out_arg.name))
         elif(arg_type_checked == 11):
-            out_args_lambda += "{}::{} _{}".format(out_arg.type.reference.namespace.name,convert_cpp_type(out_arg.type.name),lower_first_letter(out_arg.name))
+            out_args_lambda += "{}::{} _{}".format(out_arg.type.reference.namespace.name,descriptor.spelling.cpp,lower_first_letter(out_arg.name))
         #out_args_jni += 
         if(count_args < len(broadcast.out_args.values())):
             out_args_lambda += ", "
@@ -3570,7 +5416,7 @@ def generate_src_broadcast(broadcast, package_name, interface, java_package_name
     env = "env"
     
     # broadcast 1
-    src_str += f"""\tJNIEXPORT void JNICALL
+    src_str += code_template("""\tJNIEXPORT void JNICALL
     Java_{java_package}{interface_cap}{interface_extension}_subBroadcast{broadcast_cap}(JNIEnv *env, jobject instance, jlong proxyptr){{
         {interface_cap}Client* _{interface_cap}Client = reinterpret_cast<{interface_cap}Client*>(proxyptr);
         _{interface_cap}Client->{interface_cap}Instance = {env}->NewGlobalRef(instance);
@@ -3582,62 +5428,65 @@ def generate_src_broadcast(broadcast, package_name, interface, java_package_name
             }}
             jobject {interface_cap}Instance = _{interface_cap}Client->{interface_cap}Instance;
             jclass {interface_cap}Clazz = {env}->GetObjectClass({interface_cap}Instance);
-            """
+            """).render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, broadcast_cap=broadcast_cap, env=env, out_args_lambda=out_args_lambda)
     
     # broadcast 2: Obtaining Interface and TypeCollection Clazz, affected by out_args of broadcast
     reference_list = [interface_cap]
     for out_arg in broadcast.out_args.values():
-        if(isinstance(out_arg.type, ast.Reference)):
+        if(isinstance(out_arg.type, ast.Reference) and shared_conversion(out_arg) is None):
             if(out_arg.type.reference.namespace.name not in reference_list):
                 reference_list.append(out_arg.type.reference.namespace.name)
-                src_str += f"""jobject {capitalize_first_letter(out_arg.type.reference.namespace.name)}Instance = {env}->AllocObject(_{interface_cap}Client->{capitalize_first_letter(out_arg.type.reference.namespace.name)}Clazz);
-                jclass {capitalize_first_letter(out_arg.type.reference.namespace.name)}Clazz = {env}->GetObjectClass({capitalize_first_letter(out_arg.type.reference.namespace.name)}Instance);
-                """
+                src_str += code_template("""jobject {namespace_cap}Instance = {env}->AllocObject(_{interface_cap}Client->{namespace_cap}Clazz);
+                jclass {namespace_cap}Clazz = {env}->GetObjectClass({namespace_cap}Instance);
+                """).render(namespace_cap=capitalize_first_letter(out_arg.type.reference.namespace.name), env=env, interface_cap=interface_cap)
     
 # Starting from this part, things can be changed when integration with android stub occurs
     # broadcast 3: Obtaining Method ID of the handler
-    src_str += f"""jmethodID {broadcast_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subBroadcast{broadcast_cap}Callback", "({out_args_jni})V");
-                """
+    src_str += code_template("""jmethodID {broadcast_cap}MID = {env}->GetMethodID({interface_cap}Clazz, "subBroadcast{broadcast_cap}Callback", "({out_args_jni})V");
+                """).render(broadcast_cap=broadcast_cap, env=env, interface_cap=interface_cap, out_args_jni=out_args_jni)
                 
     # broadcast 4: Necessary jobs for each out_arg in out_args, same as sub_struct_gen
     for out_arg in broadcast.out_args.values():
+        descriptor = type_descriptor(out_arg)
         type_checked = check_type_ver2(out_arg, interface)
         if(type_checked < 1 or type_checked > 11):
             continue
         arg_cap = capitalize_first_letter(out_arg.name)
         arg_low = lower_first_letter(out_arg.name)
+        shared = shared_conversion(out_arg)
+        profile_conversion(out_arg, shared, "struct_fields_sub_gen")
         ## Primitive except String
         if(type_checked == 1):
-            type_java = convert_java_type(out_arg.type.name)
-            src_str += f"""{type_java} {arg_low} = static_cast<{type_java}>(_{arg_low});
-                """ 
+            type_java = descriptor.spelling.java
+            src_str += code_template("""{type_java} {arg_low} = static_cast<{type_java}>(_{arg_low});
+                """).render(type_java=type_java, arg_low=arg_low) 
         ## String
         elif(type_checked == 2):
-            type_java = convert_java_type(out_arg.type.name)
-            src_str += f"""{type_java} {arg_low} = {env}->NewStringUTF(_{arg_low}.c_str());
-                """
+            type_java = descriptor.spelling.java
+            src_str += code_template("""{type_java} {arg_low} = {env}->NewStringUTF(_{arg_low}.c_str());
+                """).render(type_java=type_java, arg_low=arg_low, env=env)
         ## Arrays
         elif(type_checked == 3 or type_checked == 5 or type_checked ==6 ):
             if(type_checked == 3):
                 array = interface.arrays[out_arg.type.name]
             elif(type_checked == 5):
-                array = out_arg.type
+                array = element_type(out_arg)
             elif(type_checked == 6):
                 array = out_arg.type.reference
             ### varibles for array
-            type_array = capitalize_first_letter(convert_aidl_type(array.type.name))
-            type_java_array = convert_java_type(array.type.name)
-            type_cpp_array = upcast_cpp_int(array.type.name)
+            type_array = capitalize_first_letter(descriptor.element_spelling.aidl)
+            type_java_array = descriptor.element_spelling.java
+            type_cpp_array = upcast_cpp_int(descriptor.element_spelling.name)
             ### jshort (int16_t) to int cast
             short_to_int = ""
             int_extension = ""
-            if(isUnsigned(array.type.name) or array.type.name == "Int16"):
-                src_str += f"""std::vector<{type_cpp_array}> _{arg_low}Signed;
+            if(descriptor.unsigned or array.type.name == "Int16"):
+                src_str += code_template("""std::vector<{type_cpp_array}> _{arg_low}Signed;
                 _{arg_low}Signed.assign(_{int_extension}{arg_low}.begin(), _{int_extension}{arg_low}.end());
                 {type_java_array}* {arg_low}Data = static_cast<{type_java_array}*>(_{arg_low}Signed.data());
-                """
+                """).render(type_cpp_array=type_cpp_array, arg_low=arg_low, int_extension=int_extension, type_java_array=type_java_array)
             elif(array.type.name == "String"):
-                src_str += f"""jsize {arg_low}Length = static_cast<jsize>(_{arg_low}.size());
+                src_str += code_template("""jsize {arg_low}Length = static_cast<jsize>(_{arg_low}.size());
                 jstring {arg_low}Str = {env}->NewStringUTF("");
                 jclass {arg_low}StrClazz = {env}->GetObjectClass({arg_low}Str);
                 jobjectArray {arg_low} = {env}->NewObjectArray({arg_low}Length, {arg_low}StrClazz, nullptr);
@@ -3646,16 +5495,23 @@ def generate_src_broadcast(broadcast, package_name, interface, java_package_name
                     {env}->SetObjectArrayElement({arg_low}, s, {arg_low}Str);
                 }}
                 {env}->DeleteLocalRef({arg_low}Str);
-                """
+                """).render(arg_low=arg_low, env=env)
             else:
                 src_str += short_to_int
-                src_str += f"""{type_java_array}* {arg_low}Data = static_cast<{type_java_array}*>(_{int_extension}{arg_low}.data());
-                """
+                src_str += code_template("""{type_java_array}* {arg_low}Data = static_cast<{type_java_array}*>(_{int_extension}{arg_low}.data());
+                """).render(type_java_array=type_java_array, arg_low=arg_low, int_extension=int_extension)
             if(array.type.name != "String"):
-                src_str += f"""jsize {arg_low}Length = static_cast<jsize>(_{arg_low}.size());
+                src_str += code_template("""jsize {arg_low}Length = static_cast<jsize>(_{arg_low}.size());
         \t\t{type_java_array}Array {arg_low} = {env}->New{type_array}Array({arg_low}Length);
         \t\t{env}->Set{type_array}ArrayRegion({arg_low}, 0, {arg_low}Length, {arg_low}Data);
-                """
+                """).render(arg_low=arg_low, type_java_array=type_java_array, env=env, type_array=type_array)
+        ## Struct and array of struct, shared conversion functions
+        elif(shared is not None and (type_checked == 4 or type_checked == 7)):
+            src_str += code_template("""jobject {arg_low} = {shared_prefix}ToJava({env}, _{arg_low});
+                """).render(arg_low=arg_low, shared_prefix=conversion_prefix(shared), env=env)
+        elif(shared is not None and (type_checked == 9 or type_checked == 10)):
+            src_str += code_template("""jobjectArray {arg_low} = {shared_prefix}ArrayToJava({env}, _{arg_low});
+                """).render(arg_low=arg_low, shared_prefix=conversion_prefix(shared), env=env)
         ## Struct
         elif(type_checked == 4 or type_checked == 7):
             defined = out_arg.type.reference.namespace.name
@@ -3667,20 +5523,20 @@ def generate_src_broadcast(broadcast, package_name, interface, java_package_name
             lines_result = '\n'.join(lines_tab)
             src_str += lines_result
             ###
-            src_str += f"""
-            \tjobject {arg_low} = {env}->NewObject({defined}{struct_name}Clazz, {defined}{struct_name}Constructor"""
+            src_str += code_template("""
+            \tjobject {arg_low} = {env}->NewObject({defined}{struct_name}Clazz, {defined}{struct_name}Constructor""").render(arg_low=arg_low, env=env, defined=defined, struct_name=struct_name)
         #for field in interface.structs[attr_type].fields.values():
             for field in out_arg.type.reference.fields.values():
                 src_str += ", {}{}".format(arg_low, capitalize_first_letter(field.name))
-            src_str += f""");
-                """
+            src_str += code_template(""");
+                """).render()
         ## Enumeration
         elif(type_checked == 8):
             reference_cap = capitalize_first_letter(out_arg.type.reference.namespace.name)
             reference_type = out_arg.type.reference.name
-            src_str += f"""uint8_t _{arg_low}Int = static_cast<uint8_t>(_{arg_low});
+            src_str += code_template("""uint8_t _{arg_low}Int = static_cast<uint8_t>(_{arg_low});
         \t\tjbyte {arg_low} = static_cast<jbyte>(_{arg_low}Int);
-                """
+                """).render(arg_low=arg_low)
         ## Complex Array
         elif(type_checked == 9):
             src_str += complex_array(out_arg, interface, cpp_package, java_class, "", 4)
@@ -3692,34 +5548,35 @@ def generate_src_broadcast(broadcast, package_name, interface, java_package_name
 # Until this part can be changed.
 
     # broadcast 5: Call Void Method, Detach Current Thread and Return
-    src_str += f"""{env}->CallVoidMethod({interface_cap}Instance,{broadcast_cap}MID"""
+    src_str += code_template("""{env}->CallVoidMethod({interface_cap}Instance,{broadcast_cap}MID""").render(env=env, interface_cap=interface_cap, broadcast_cap=broadcast_cap)
     for out_arg in broadcast.out_args.values():
         src_str += ", {}".format(lower_first_letter(out_arg.name))
     src_str += ");"
     
-    src_str += f"""
+    src_str += code_template("""
                 jvm->DetachCurrentThread();
             }}
         );
     }}
-    """
+    """).render()
 # unsub
-    src_str += f"""
+    src_str += code_template("""
     JNIEXPORT void JNICALL\n\tJava_{java_package}{interface_cap}{interface_extension}_unsubBroadcast{broadcast_cap}(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){{
         {interface_cap}Client* _{interface_cap}Client = reinterpret_cast<{interface_cap}Client*>(proxyptr);
         _{interface_cap}Client->{interface_cap}Instance = {env}->NewGlobalRef(instance);
     \tint32_t _subscription = static_cast<int>(subscription);
     \t_{interface_cap}Client->myProxy->get{broadcast_cap}Event().unsubscribe(_subscription);
-    }}\n"""
+    }}\n""").render(java_package=java_package, interface_cap=interface_cap, interface_extension=interface_extension, broadcast_cap=broadcast_cap, env=env)
 
     src_str += """\n////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 ////////////////////////////////////////////////////////////////////////////////////////////////////////////////////\n"""
 
-    return src_str
+    return src_str.getvalue()
         
 ######################################### JNI and STUB FROM NOW ON ##########################################
 ################################################ Attribute ##################################################
 # casting for struct
+@memoized_snippet("upper")
 def generate_jni_attribute_struct_cast(attribute, interface, upper="", isget=True, ismethod=False, iscomplex=False, depth=0):
     struct_cast = ""
     attribute_low = lower_first_letter(attribute.name)
@@ -3778,9 +5635,7 @@ def generate_jni_attribute_struct_cast(attribute, interface, upper="", isget=Tru
                 struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper=attribute_low, isget=True, ismethod= False, iscomplex= True, depth = depth+1)
                 struct_cast_temp = struct_cast_temp.replace(f"_{attribute_low}.{field_name}.", f"_{attribute_low}.{field_name}[j{for_loop_depth}].")
                 struct_cast_temp = struct_cast_temp.replace(f"{attribute_low}.{field_name}.", f"{attribute_low}.{field_name}.data[j{for_loop_depth}].")
-                struct_cast_temp_lines = struct_cast_temp.split('\n')
-                struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-                struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+                struct_cast_temp = indent_lines(struct_cast_temp)
                 struct_cast += f"""
             for(int j{for_loop_depth} = 0; j{for_loop_depth} < {attribute_low}.{field_name}.data.length; j{for_loop_depth}++){{{struct_cast_temp}
             }}"""
@@ -3790,9 +5645,7 @@ def generate_jni_attribute_struct_cast(attribute, interface, upper="", isget=Tru
                 struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper=attribute_low, isget=True, ismethod= False, iscomplex= True, isimplicit=True, depth = depth+1)
                 struct_cast_temp = struct_cast_temp.replace(f"_{attribute_low}.{field_name}.", f"_{attribute_low}.{field_name}[j{for_loop_depth}].")
                 struct_cast_temp = struct_cast_temp.replace(f"{attribute_low}.{field_name}.", f"{attribute_low}.{field_name}[j{for_loop_depth}].")
-                struct_cast_temp_lines = struct_cast_temp.split('\n')
-                struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-                struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+                struct_cast_temp = indent_lines(struct_cast_temp)
                 struct_cast += f"""
             for(int j{for_loop_depth} = 0; j{for_loop_depth} < {attribute_low}.{field_name}.length; j{for_loop_depth}++){{{struct_cast_temp}
             }}"""
@@ -3834,9 +5687,7 @@ def generate_jni_attribute_struct_cast(attribute, interface, upper="", isget=Tru
                 struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper=attribute_low, isget=False, ismethod= False, iscomplex= True, depth = depth+1)
                 struct_cast_temp = struct_cast_temp.replace(f"_{attribute_low}.{field_name}.", f"_{attribute_low}.{field_name}[k{for_loop_depth}].")
                 struct_cast_temp = struct_cast_temp.replace(f"{attribute_low}.{field_name}.", f"{attribute_low}.{field_name}.data[k{for_loop_depth}].")
-                struct_cast_temp_lines = struct_cast_temp.split('\n')
-                struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-                struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+                struct_cast_temp = indent_lines(struct_cast_temp)
                 struct_cast += f"""
             for(int k{for_loop_depth} = 0; k{for_loop_depth} < {attribute_low}.{field_name}.data.length; k{for_loop_depth}++){{{struct_cast_temp}
             }}"""
@@ -3846,9 +5697,7 @@ def generate_jni_attribute_struct_cast(attribute, interface, upper="", isget=Tru
                 struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper=attribute_low, isget=False, ismethod= False, iscomplex= True, isimplicit=True, depth = depth+1)
                 struct_cast_temp = struct_cast_temp.replace(f"_{attribute_low}.{field_name}.", f"_{attribute_low}.{field_name}[k{for_loop_depth}].")
                 struct_cast_temp = struct_cast_temp.replace(f"{attribute_low}.{field_name}.", f"{attribute_low}.{field_name}[k{for_loop_depth}].")
-                struct_cast_temp_lines = struct_cast_temp.split('\n')
-                struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-                struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+                struct_cast_temp = indent_lines(struct_cast_temp)
                 struct_cast += f"""
             for(int k{for_loop_depth} = 0; k{for_loop_depth} < {attribute_low}.{field_name}.length; k{for_loop_depth}++){{{struct_cast_temp}
             }}"""
@@ -3893,7 +5742,7 @@ def generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=Tr
             {attribute_low}.{field_name}.data = new {capitalize_first_letter(convert_java_code_type(field.type.name))}[_{attribute_low}.{field_name}.length];"""
                     elif(field_type == 5):
                         struct_cast += f"""
-            {attribute_low}.{field_name} = new {capitalize_first_letter(convert_java_code_type(field.type.type.name))}[_{attribute_low}.{field_name}.length];"""
+            {attribute_low}.{field_name} = new {capitalize_first_letter(convert_java_code_type(element_type(field).type.name))}[_{attribute_low}.{field_name}.length];"""
                 struct_cast += f"""
             {attribute_low}.{field_name}{type_data} = _{attribute_low}.{field_name};"""
             elif(field_type == 4 or field_type == 7):
@@ -3911,9 +5760,7 @@ def generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=Tr
                 struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper=attribute_low, isget=True, ismethod= False, iscomplex= True, depth = depth+1)
                 struct_cast_temp = struct_cast_temp.replace(f"_{attribute_low}.{field_name}.", f"_{attribute_low}.{field_name}[j{for_loop_depth}].")
                 struct_cast_temp = struct_cast_temp.replace(f"{attribute_low}.{field_name}.", f"{attribute_low}.{field_name}.data[j{for_loop_depth}].")
-                struct_cast_temp_lines = struct_cast_temp.split('\n')
-                struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-                struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+                struct_cast_temp = indent_lines(struct_cast_temp)
                 struct_cast += f"""
             for(int j{for_loop_depth} = 0; j{for_loop_depth} < _{attribute_low}.{field_name}.length; j{for_loop_depth}++){{
                 {attribute_low}.{field_name}.data[j{for_loop_depth}] = new {field.type.reference.type.reference.name}();{struct_cast_temp}
@@ -3924,9 +5771,7 @@ def generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=Tr
                 struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper=attribute_low, isget=True, ismethod= False, iscomplex= True, isimplicit=True, depth = depth+1)
                 struct_cast_temp = struct_cast_temp.replace(f"_{attribute_low}.{field_name}.", f"_{attribute_low}.{field_name}[j{for_loop_depth}].")
                 struct_cast_temp = struct_cast_temp.replace(f"{attribute_low}.{field_name}.", f"{attribute_low}.{field_name}[j{for_loop_depth}].")
-                struct_cast_temp_lines = struct_cast_temp.split('\n')
-                struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-                struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+                struct_cast_temp = indent_lines(struct_cast_temp)
                 struct_cast += f"""
             for(int j{for_loop_depth} = 0; j{for_loop_depth} < _{attribute_low}.{field_name}.length; j{for_loop_depth}++){{
                 {attribute_low}.{field_name}[j{for_loop_depth}] = new {field.type.type.reference.name}();{struct_cast_temp}
@@ -3961,9 +5806,7 @@ def generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=Tr
                 struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper=attribute_low, isget=False, ismethod= False, iscomplex= True, depth = depth+1)
                 struct_cast_temp = struct_cast_temp.replace(f"_{attribute_low}.{field_name}.", f"_{attribute_low}.{field_name}[k{for_loop_depth}].")
                 struct_cast_temp = struct_cast_temp.replace(f"{attribute_low}.{field_name}.", f"{attribute_low}.{field_name}.data[k{for_loop_depth}].")
-                struct_cast_temp_lines = struct_cast_temp.split('\n')
-                struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-                struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+                struct_cast_temp = indent_lines(struct_cast_temp)
                 struct_cast += f"""
             for(int k{for_loop_depth} = 0; k{for_loop_depth} < {attribute_low}.{field_name}.data.length; k{for_loop_depth}++){{{struct_cast_temp}
             }}"""
@@ -3973,9 +5816,7 @@ def generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=Tr
                 struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper=attribute_low, isget=False, ismethod= False, iscomplex= True, isimplicit=True, depth = depth+1)
                 struct_cast_temp = struct_cast_temp.replace(f"_{attribute_low}.{field_name}.", f"_{attribute_low}.{field_name}[k{for_loop_depth}].")
                 struct_cast_temp = struct_cast_temp.replace(f"{attribute_low}.{field_name}.", f"{attribute_low}.{field_name}[k{for_loop_depth}].")
-                struct_cast_temp_lines = struct_cast_temp.split('\n')
-                struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-                struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+                struct_cast_temp = indent_lines(struct_cast_temp)
                 struct_cast += f"""
             for(int k{for_loop_depth} = 0; k{for_loop_depth} < {attribute_low}.{field_name}.length; k{for_loop_depth}++){{{struct_cast_temp}
             }}"""
@@ -3989,12 +5830,13 @@ def generate_jni_attribute_get_cast(attribute, interface):
     get_cast = ""
     attribute_low = lower_first_letter(attribute.name)
     attribute_cap = capitalize_first_letter(attribute.name)
-    type_service = convert_java_code_type(attribute.type.name)
+    descriptor = type_descriptor(attribute)
+    type_service = descriptor.spelling.java_code
     type_checked = check_type_ver2(attribute, interface)
     
     # implicit array 
     if(type_checked != 5 and type_checked != 10 and type_checked != 12 and type_checked != 14):
-        type_service = convert_java_code_type(attribute.type.name).split('.')[-1]
+        type_service = descriptor.spelling.java_code.split('.')[-1]
     
     # null error avoidance
     is_get_null = ""
@@ -4011,28 +5853,28 @@ def generate_jni_attribute_get_cast(attribute, interface):
         type_java = ""
         type_data = ""
         if(type_checked == 5):
-            type_java = convert_java_code_type(attribute.type.type.name) + "[]"
-            type_service = convert_java_code_type(attribute.type.type.name) + "[]"
+            type_java = descriptor.element_spelling.java_code + "[]"
+            type_service = descriptor.element_spelling.java_code + "[]"
             get_cast = f"""{type_java} _{attribute_low} = myProxy.getAttribute{attribute_cap}Value();
             {type_service} {attribute_low};
             {attribute_low}{type_data} = _{attribute_low};
             return {attribute_low};"""
         elif(type_checked == 3):
-            type_java = convert_java_code_type(interface.arrays[attribute.type.name].type.name) + "[]"
+            type_java = descriptor.element_spelling.java_code + "[]"
             type_data = ".data"
             get_cast = f"""{type_java} _{attribute_low} = myProxy.getAttribute{attribute_cap}Value();
             {type_service} {attribute_low} = new {type_service}();
             {attribute_low}{type_data} = _{attribute_low};
             return {attribute_low};"""
         elif(type_checked == 6):
-            type_java = convert_java_code_type(attribute.type.reference.type.name) + "[]"
+            type_java = descriptor.element_spelling.java_code + "[]"
             type_data = ".data"
             get_cast = f"""{type_java} _{attribute_low} = myProxy.getAttribute{attribute_cap}Value();
             {type_service} {attribute_low} = new {type_service}();
             {attribute_low}{type_data} = _{attribute_low};
             return {attribute_low};"""
     elif(type_checked == 4 or type_checked == 7):
-        type_java = convert_java_code_type(attribute.type.name)
+        type_java = descriptor.spelling.java_code
         get_cast = f"""{attribute.type.reference.namespace.name+"JNI."}{type_java.split('.')[-1]} _{attribute_low} = myProxy.getAttribute{attribute_cap}Value();
             {type_service} {attribute_low} = new {type_service}();"""
         get_cast += generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=True)
@@ -4044,9 +5886,7 @@ def generate_jni_attribute_get_cast(attribute, interface):
         get_cast_temp = generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=True, ismethod= False, iscomplex= True)
         get_cast_temp = get_cast_temp.replace(f"_{attribute_low}.", f"_{attribute_low}[i].")
         get_cast_temp = get_cast_temp.replace(f"{attribute_low}.", f"{attribute_low}.data[i].")
-        get_cast_temp_lines = get_cast_temp.split('\n')
-        get_cast_temp_lines = ['\t' + line for line in get_cast_temp_lines]
-        get_cast_temp = '\n'.join(get_cast_temp_lines)
+        get_cast_temp = indent_lines(get_cast_temp)
         
         get_cast = f"""{attribute.type.reference.namespace.name}JNI.{attribute.type.reference.type.name}[] _{attribute_low} = myProxy.getAttribute{attribute_cap}Value();
             {is_get_null}{attribute.type.name} {attribute_low} = new {attribute.type.name}();
@@ -4059,9 +5899,7 @@ def generate_jni_attribute_get_cast(attribute, interface):
         get_cast_temp = generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=True, ismethod= False, iscomplex= True, isimplicit=True)
         get_cast_temp = get_cast_temp.replace(f"_{attribute_low}.", f"_{attribute_low}[i].")
         get_cast_temp = get_cast_temp.replace(f"{attribute_low}.", f"{attribute_low}[i].")
-        get_cast_temp_lines = get_cast_temp.split('\n')
-        get_cast_temp_lines = ['\t' + line for line in get_cast_temp_lines]
-        get_cast_temp = '\n'.join(get_cast_temp_lines)
+        get_cast_temp = indent_lines(get_cast_temp)
         
         get_cast = f"""{attribute.type.type.reference.namespace.name}JNI.{attribute.type.type.reference.name}[] _{attribute_low} = myProxy.getAttribute{attribute_cap}Value();
             {is_get_null}{attribute.type.type.reference.name}[] {attribute_low} = new {attribute.type.type.reference.name}[_{attribute_low}.length];
@@ -4083,25 +5921,26 @@ def generate_jni_attribute_set_cast(attribute, interface):
     set_cast = ""
     attribute_low = lower_first_letter(attribute.name)
     attribute_cap = capitalize_first_letter(attribute.name)
-    type_service = convert_java_code_type(attribute.type.name)
+    descriptor = type_descriptor(attribute)
+    type_service = descriptor.spelling.java_code
     type_checked = check_type_ver2(attribute, interface)
     if(type_checked == 1 or type_checked == 2):
         set_cast = f"""myProxy.setAttribute{attribute_cap}Value({attribute_low});"""    
     elif(type_checked == 3 or type_checked == 5 or type_checked == 6):
         type_java = ""
         if(type_checked == 5):
-            type_java = convert_java_code_type(attribute.type.type.name) + "[]"
+            type_java = descriptor.element_spelling.java_code + "[]"
             set_cast = f"""myProxy.setAttribute{attribute_cap}Value({attribute_low});"""
         elif(type_checked == 3):
-            type_java = convert_java_code_type(interface.arrays[attribute.type.name].type.name) + "[]"
+            type_java = descriptor.element_spelling.java_code + "[]"
             set_cast = f"""{type_java} _{attribute_low} = {attribute_low}.data;
             myProxy.setAttribute{attribute_cap}Value(_{attribute_low});"""
         elif(type_checked == 6):
-            type_java = convert_java_code_type(attribute.type.reference.type.name) + "[]"
+            type_java = descriptor.element_spelling.java_code + "[]"
             set_cast = f"""{type_java} _{attribute_low} = {attribute_low}.data;
             myProxy.setAttribute{attribute_cap}Value(_{attribute_low});"""
     elif(type_checked == 4 or type_checked == 7):
-        type_java = convert_java_code_type(attribute.type.name)
+        type_java = descriptor.spelling.java_code
         set_cast = f"""{attribute.type.reference.namespace.name+"JNI."}{type_java.split('.')[-1]} _{attribute_low} = new {attribute.type.reference.namespace.name+"JNI."}{type_java.split('.')[-1]}();"""
         #### for declaration for struct in struct is needed
         set_cast += generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=False)
@@ -4113,9 +5952,7 @@ def generate_jni_attribute_set_cast(attribute, interface):
         set_cast_temp = generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=False, ismethod= False, iscomplex = True)
         set_cast_temp = set_cast_temp.replace(f"_{attribute_low}.", f"_{attribute_low}[i].")
         set_cast_temp = set_cast_temp.replace(f"{attribute_low}.", f"{attribute_low}.data[i].")
-        set_cast_temp_lines = set_cast_temp.split('\n')
-        set_cast_temp_lines = ['\t' + line for line in set_cast_temp_lines]
-        set_cast_temp = '\n'.join(set_cast_temp_lines)
+        set_cast_temp = indent_lines(set_cast_temp)
         
         set_cast = f"""{attribute.type.reference.namespace.name}JNI.{attribute.type.reference.type.name}[] _{attribute_low} = new {attribute.type.reference.namespace.name}JNI.{attribute.type.reference.type.name}[{attribute_low}.data.length];
             for(int i = 0; i < {attribute_low}.data.length; i++){{
@@ -4126,9 +5963,7 @@ def generate_jni_attribute_set_cast(attribute, interface):
         set_cast_temp = generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=False, ismethod= False, iscomplex = True, isimplicit=True)
         set_cast_temp = set_cast_temp.replace(f"_{attribute_low}.", f"_{attribute_low}[i].")
         set_cast_temp = set_cast_temp.replace(f"{attribute_low}.", f"{attribute_low}[i].")
-        set_cast_temp_lines = set_cast_temp.split('\n')
-        set_cast_temp_lines = ['\t' + line for line in set_cast_temp_lines]
-        set_cast_temp = '\n'.join(set_cast_temp_lines)
+        set_cast_temp = indent_lines(set_cast_temp)
         
         set_cast = f"""{attribute.type.type.reference.namespace.name}JNI.{attribute.type.type.reference.name}[] _{attribute_low} = new {attribute.type.type.reference.namespace.name}JNI.{attribute.type.type.reference.name}[{attribute_low}.length];
             for(int i = 0; i < {attribute_low}.length; i++){{
@@ -4242,22 +6077,24 @@ def generate_jni_map_cast(map, upper="", interface=None, indentation=0, type=0):
 
 
 # stub code에서 사용할 handler, sub, get, set, unsub 필요함. 그리고 반환하는 것까지
+@profiled("member")
 def generate_jni_attribute(attribute, interface, jni_attribute_cnt):
     attr_type = attribute.type.name
     attribute_cap = capitalize_first_letter(attribute.name)
     attribute_low = lower_first_letter(attribute.name)
-    type_java = convert_java_code_type(attribute.type.name)
-    type_service = convert_java_code_type(attribute.type.name)
+    descriptor = type_descriptor(attribute)
+    type_java = descriptor.spelling.java_code
+    type_service = descriptor.spelling.java_code
     type_checked = check_type_ver2(attribute, interface)
     get_cast_str = generate_jni_attribute_get_cast(attribute, interface)
     set_cast_str = generate_jni_attribute_set_cast(attribute, interface)
     if(type_checked == 5 or type_checked == 10):
-        type_java = convert_java_code_type(attribute.type.type.name) + "[]"
-        type_service = convert_java_code_type(attribute.type.type.name) + "[]"
+        type_java = descriptor.element_spelling.java_code + "[]"
+        type_service = descriptor.element_spelling.java_code + "[]"
     elif(type_checked == 3):
-        type_java = convert_java_code_type(interface.arrays[attribute.type.name].type.name) + "[]"
+        type_java = descriptor.element_spelling.java_code + "[]"
     elif(type_checked == 6):
-        type_java = convert_java_code_type(attribute.type.reference.type.name) + "[]"
+        type_java = descriptor.element_spelling.java_code + "[]"
     elif(type_checked == 8):
         type_java = "byte"
         type_service = "byte"
@@ -4304,67 +6141,63 @@ def generate_jni_attribute(attribute, interface, jni_attribute_cnt):
         java_interface = attribute.type.reference.namespace.name + "JNI."
         
     attribute_cast = ""
-    jni_str = ""
-    stub_handler = ""
-    stub_main = ""
+    jni_str = CodeBuffer()
+    stub_handler = CodeBuffer()
+    stub_main = CodeBuffer()
     
     ## attribute cast
     if(type_checked == 3 or type_checked == 6):
-        attribute_cast = f"""/*{attribute.type.reference.namespace.name}.*/{type_service.split('.')[-1]} {attribute_low} = new /*{attribute.type.reference.namespace.name}.*/{type_service.split('.')[-1]}();
-            {attribute_low}.data = _{attribute_low};"""
+        attribute_cast = code_template("""/*{reference_namespace}.*/{type_service_name} {attribute_low} = new /*{reference_namespace}.*/{type_service_name}();
+            {attribute_low}.data = _{attribute_low};""").render(reference_namespace=attribute.type.reference.namespace.name, type_service_name=type_service.split('.')[-1], attribute_low=attribute_low)
     elif(type_checked == 4 or type_checked == 7):
-        attribute_cast = f"""/*{attribute.type.reference.namespace.name}.*/{type_service.split('.')[-1]} {attribute_low} = new /*{attribute.type.reference.namespace.name}.*/{type_service.split('.')[-1]}();"""
+        attribute_cast = code_template("""/*{reference_namespace}.*/{type_service_name} {attribute_low} = new /*{reference_namespace}.*/{type_service_name}();""").render(reference_namespace=attribute.type.reference.namespace.name, type_service_name=type_service.split('.')[-1], attribute_low=attribute_low)
         attribute_cast += generate_stub_attribute_struct_cast(attribute,interface,upper="",isget=True,ismethod=False)
     elif(type_checked == 9):
-        attribute_cast = f"""/*{attribute.type.reference.namespace.name}.*/{type_service.split('.')[-1]} {attribute_low} = new /*{attribute.type.reference.namespace.name}.*/{type_service.split('.')[-1]}();
-            {attribute_low}.data = new {attribute.type.reference.type.name}[_{attribute_low}.length];"""
+        attribute_cast = code_template("""/*{reference_namespace}.*/{type_service_name} {attribute_low} = new /*{reference_namespace}.*/{type_service_name}();
+            {attribute_low}.data = new {element_name}[_{attribute_low}.length];""").render(reference_namespace=attribute.type.reference.namespace.name, type_service_name=type_service.split('.')[-1], attribute_low=attribute_low, element_name=attribute.type.reference.type.name)
         attribute_cast_temp = generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=True, ismethod= False, iscomplex= True)
         attribute_cast_temp = attribute_cast_temp.replace(f"_{attribute_low}.", f"_{attribute_low}[i].")
         attribute_cast_temp = attribute_cast_temp.replace(f"{attribute_low}.", f"{attribute_low}.data[i].")
-        attribute_cast_temp_lines = attribute_cast_temp.split('\n')
-        attribute_cast_temp_lines = ['\t' + line for line in attribute_cast_temp_lines]
-        attribute_cast_temp = '\n'.join(attribute_cast_temp_lines)
-        for_loop_temp = f"""
+        attribute_cast_temp = indent_lines(attribute_cast_temp)
+        for_loop_temp = code_template("""
             for(int i = 0; i < _{attribute_low}.length; i++){{
-                //{attribute.type.reference.namespace.name}JNI.{attribute.type.reference.type.name} _{attribute_low}Element = _{attribute_low}[i];
-                {attribute_low}.data[i] = new {attribute.type.reference.type.name}();
+                //{reference_namespace}JNI.{element_name} _{attribute_low}Element = _{attribute_low}[i];
+                {attribute_low}.data[i] = new {element_name}();
             {attribute_cast_temp}
-            }}"""
+            }}""").render(attribute_low=attribute_low, reference_namespace=attribute.type.reference.namespace.name, element_name=attribute.type.reference.type.name, attribute_cast_temp=attribute_cast_temp)
         attribute_cast += for_loop_temp
     elif(type_checked == 10):
-        attribute_cast = f"""{type_service.split('.')[-1]} {attribute_low} = new {attribute.type.type.reference.name}[_{attribute_low}.length];"""
+        attribute_cast = code_template("""{type_service_name} {attribute_low} = new {element_name}[_{attribute_low}.length];""").render(type_service_name=type_service.split('.')[-1], attribute_low=attribute_low, element_name=attribute.type.type.reference.name)
         attribute_cast_temp = generate_stub_attribute_struct_cast(attribute, interface, upper="", isget=True, ismethod= False, iscomplex= True, isimplicit=True)
         attribute_cast_temp = attribute_cast_temp.replace(f"_{attribute_low}.", f"_{attribute_low}[i].")
         attribute_cast_temp = attribute_cast_temp.replace(f"{attribute_low}.", f"{attribute_low}[i].")
-        attribute_cast_temp_lines = attribute_cast_temp.split('\n')
-        attribute_cast_temp_lines = ['\t' + line for line in attribute_cast_temp_lines]
-        attribute_cast_temp = '\n'.join(attribute_cast_temp_lines)
-        for_loop_temp = f"""
+        attribute_cast_temp = indent_lines(attribute_cast_temp)
+        for_loop_temp = code_template("""
             for(int i = 0; i < _{attribute_low}.length; i++){{
-                {attribute_low}[i] = new {attribute.type.type.reference.name}();
+                {attribute_low}[i] = new {element_name}();
             {attribute_cast_temp}
-            }}"""
+            }}""").render(attribute_low=attribute_low, element_name=attribute.type.type.reference.name, attribute_cast_temp=attribute_cast_temp)
         attribute_cast += for_loop_temp
     elif(type_checked == 11):
-        attribute_cast = f"""{type_service.split('.')[-1]} {attribute_low} = new {type_service.split('[]')[0]}[_{attribute_low}.length];
-            """
+        attribute_cast = code_template("""{type_service_name} {attribute_low} = new {type_service_element}[_{attribute_low}.length];
+            """).render(type_service_name=type_service.split('.')[-1], attribute_low=attribute_low, type_service_element=type_service.split('[]')[0])
         attribute_cast += generate_jni_map_cast(attribute, "", interface)
     # Not in use
     else:
         if(type_checked % 2 == 0):
-            attribute_cast = f"""{type_java} {attribute_low} = _{attribute_low};"""
+            attribute_cast = code_template("""{type_java} {attribute_low} = _{attribute_low};""").render(type_java=type_java, attribute_low=attribute_low)
         else:
-            attribute_cast = f"""{type_java.split('.')[-1]} {attribute_low} = _{attribute_low};"""
+            attribute_cast = code_template("""{type_java_name} {attribute_low} = _{attribute_low};""").render(type_java_name=type_java.split('.')[-1], attribute_low=attribute_low)
     
     
     
     if(type_checked >= 1 and type_checked <= 11):
-        stub_handler += f"""
-    private static ArrayList<{capitalize_first_letter(interface.name)}{attribute_cap}Handler> {attribute_cap}Handler = new ArrayList<>();
-    void Attribute{attribute_cap}Handle({java_interface}{type_java.split('.')[-1]} _{attribute_low}){{
+        stub_handler += code_template("""
+    private static ArrayList<{interface_name_cap}{attribute_cap}Handler> {attribute_cap}Handler = new ArrayList<>();
+    void Attribute{attribute_cap}Handle({java_interface}{type_java_name} _{attribute_low}){{
         if(this.{attribute_cap}Handler != null){{
             {attribute_cast}
-            for({capitalize_first_letter(interface.name)}{attribute_cap}Handler handler : this.{attribute_cap}Handler){{
+            for({interface_name_cap}{attribute_cap}Handler handler : this.{attribute_cap}Handler){{
                 try {{
                     handler.run{attribute_cap}Handler({attribute_low});
                 }} catch (RemoteException e) {{
@@ -4373,34 +6206,34 @@ def generate_jni_attribute(attribute, interface, jni_attribute_cnt):
             }}
         }}
     }}
-    """
-        stub_main += f"""
+    """).render(interface_name_cap=capitalize_first_letter(interface.name), attribute_cap=attribute_cap, java_interface=java_interface, type_java_name=type_java.split('.')[-1], attribute_low=attribute_low, attribute_cast=attribute_cast)
+        stub_main += code_template("""
         @Override
-        public void subscribeAttribute{attribute_cap}({capitalize_first_letter(interface.name)}{attribute_cap}Handler handler) throws RemoteException {{
+        public void subscribeAttribute{attribute_cap}({interface_name_cap}{attribute_cap}Handler handler) throws RemoteException {{
             if(myProxy == null){{
                 if(!proxyGeneration()){{
                     return;
                 }}
             }}
-            if(!{capitalize_first_letter(interface.name)}Service.{attribute_cap}Handler.contains(handler)){{
-                {capitalize_first_letter(interface.name)}Service.{attribute_cap}Handler.add(handler);
-                if({capitalize_first_letter(interface.name)}Service.{attribute_cap}Handler.size() == 1){{
+            if(!{interface_name_cap}Service.{attribute_cap}Handler.contains(handler)){{
+                {interface_name_cap}Service.{attribute_cap}Handler.add(handler);
+                if({interface_name_cap}Service.{attribute_cap}Handler.size() == 1){{
                     myProxy.subscribeAttribute{attribute_cap}();    
                 }}
             }}
-        }}"""
+        }}""").render(attribute_cap=attribute_cap, interface_name_cap=capitalize_first_letter(interface.name))
         # set
         if(set_flag):
-            stub_main += f"""
+            stub_main += code_template("""
         @Override
-        public void setAttribute{attribute_cap}Value({type_service.split('.')[-1]} {attribute_low}) throws RemoteException {{
+        public void setAttribute{attribute_cap}Value({type_service_name} {attribute_low}) throws RemoteException {{
             if(myProxy == null){{
                 if(!proxyGeneration()){{
                     return;
                 }}
             }}
             {set_cast_str}
-        }}"""
+        }}""").render(attribute_cap=attribute_cap, type_service_name=type_service.split('.')[-1], attribute_low=attribute_low, set_cast_str=set_cast_str)
         # get
         return_null = ""
         if(type_service.split('.')[-1] == "void"):
@@ -4411,51 +6244,51 @@ def generate_jni_attribute(attribute, interface, jni_attribute_cnt):
             return_null = "false"
         else:
             return_null = " null"
-        stub_main += f"""
+        stub_main += code_template("""
         @Override
-        public {type_service.split('.')[-1]} getAttribute{attribute_cap}Value() throws RemoteException {{
+        public {type_service_name} getAttribute{attribute_cap}Value() throws RemoteException {{
             if(myProxy == null){{
                 if(!proxyGeneration()){{
                     return {return_null};
                 }}
             }}
             {get_cast_str}
-        }}"""
+        }}""").render(type_service_name=type_service.split('.')[-1], attribute_cap=attribute_cap, return_null=return_null, get_cast_str=get_cast_str)
         # unsubscribe
-        stub_main += f"""
+        stub_main += code_template("""
         @Override
-        public void unsubscribeAttribute{attribute_cap}({capitalize_first_letter(interface.name)}{attribute_cap}Handler handler) throws RemoteException {{
+        public void unsubscribeAttribute{attribute_cap}({interface_name_cap}{attribute_cap}Handler handler) throws RemoteException {{
             if(myProxy == null){{
                 if(!proxyGeneration()){{
                     return;
                 }}
             }}
-            if({capitalize_first_letter(interface.name)}Service.{attribute_cap}Handler.contains(handler)){{
-                {capitalize_first_letter(interface.name)}Service.{attribute_cap}Handler.remove(handler);
-                if({capitalize_first_letter(interface.name)}Service.{attribute_cap}Handler.size() == 0){{
+            if({interface_name_cap}Service.{attribute_cap}Handler.contains(handler)){{
+                {interface_name_cap}Service.{attribute_cap}Handler.remove(handler);
+                if({interface_name_cap}Service.{attribute_cap}Handler.size() == 0){{
                     myProxy.unsubscribeAttribute{attribute_cap}(); 
                 }}
             }}
         }}
-        """
+        """).render(attribute_cap=attribute_cap, interface_name_cap=capitalize_first_letter(interface.name))
         
     #subscribe wrapper
     if(type_checked >= 1 and type_checked <= 11):
-        jni_str += f"""
+        jni_str += code_template("""
     int Attribute{attribute_cap}Subscription = -1;
     public void subscribeAttribute{attribute_cap}(){{
         subAttribute{attribute_cap}(this.proxyptr);
         ++Attribute{attribute_cap}Subscription;
     }}
-        """
+        """).render(attribute_cap=attribute_cap)
 
     # Get Set Wrapper
     if(type_checked >= 1 and type_checked <= 11):
-        jni_str += f"""
+        jni_str += code_template("""
     public {type_java} getAttribute{attribute_cap}Value(){{
         return getAttribute{attribute_cap}Value(this.proxyptr, service.timeout, service.sender);   
     }}
-        """
+        """).render(type_java=type_java, attribute_cap=attribute_cap)
         if(set_flag):
             if(type_java == "short"):
                 if_short = "(short)"
@@ -4464,11 +6297,11 @@ def generate_jni_attribute(attribute, interface, jni_attribute_cnt):
             if(type_checked == 1 or type_checked == 2):
                 attr_type_set = type_java
             elif(type_checked == 3):
-                attr_type_set = convert_java_code_type(interface.arrays[attribute.type.name].type.name)+"[]"
+                attr_type_set = descriptor.element_spelling.java_code+"[]"
             elif(type_checked == 5):
-                attr_type_set = convert_java_code_type(attribute.type.type.name)+"[]"
+                attr_type_set = descriptor.element_spelling.java_code+"[]"
             elif(type_checked == 6):
-                attr_type_set = convert_java_code_type(attribute.type.reference.type.name)+"[]"
+                attr_type_set = descriptor.element_spelling.java_code+"[]"
             elif(type_checked == 8):
                 attr_type_set = "byte"
             elif(type_checked == 9):
@@ -4479,107 +6312,107 @@ def generate_jni_attribute(attribute, interface, jni_attribute_cnt):
                 attr_type_set = attribute.type.reference.name+"[]"
             else:
                 attr_type_set = attr_type
-            jni_str += f"""
+            jni_str += code_template("""
     public void setAttribute{attribute_cap}Value({attr_type_set} {attribute_low}){{
         setAttribute{attribute_cap}Value(this.proxyptr, service.timeout, service.sender,{if_short}{attribute_low});   
     }}
-        """
+        """).render(attribute_cap=attribute_cap, attr_type_set=attr_type_set, attribute_low=attribute_low, if_short=if_short)
     
     # JNI native functions
     if(type_checked == 1 or type_checked == 2 or type_checked == 9 or type_checked == 10 or type_checked == 11):
-        jni_str += f"""
+        jni_str += code_template("""
     public native void subAttribute{attribute_cap}(long proxyptr);
     public void subAttribute{attribute_cap}Handler({type_java} {attribute_low}){{
         service.Attribute{attribute_cap}Handle({attribute_low});
-    }}"""
+    }}""").render(attribute_cap=attribute_cap, type_java=type_java, attribute_low=attribute_low)
         if(set_flag):
-            jni_str += f"""
+            jni_str += code_template("""
     public native {type_java} getAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender);
     public native {type_java} setAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender, {type_java} {attribute_low});
-    public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);\n\n"""
+    public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);\n\n""").render(type_java=type_java, attribute_cap=attribute_cap, attribute_low=attribute_low)
         else:
-            jni_str += f"""
+            jni_str += code_template("""
     public native {type_java} getAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender);
-    public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);\n\n"""
+    public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);\n\n""").render(type_java=type_java, attribute_cap=attribute_cap)
     elif(type_checked == 3 or type_checked == 5 or type_checked == 6):
         if(type_checked == 3):
             array = interface.arrays[attribute.type.name]
         elif(type_checked == 5):
-            array = attribute.type
+            array = element_type(attribute)
         elif(type_checked == 6):
             array = attribute.type.reference
             
-        type_java_array = convert_java_code_type(array.type.name)
-        jni_str += f"""
+        type_java_array = descriptor.element_spelling.java_code
+        jni_str += code_template("""
     public native void subAttribute{attribute_cap}(long proxyptr);
     public void subAttribute{attribute_cap}Handler({type_java_array}[] {attribute_low}){{
         service.Attribute{attribute_cap}Handle({attribute_low});
-    }}"""
+    }}""").render(attribute_cap=attribute_cap, type_java_array=type_java_array, attribute_low=attribute_low)
         if(set_flag):
-            jni_str += f"""
+            jni_str += code_template("""
     public native {type_java_array}[] getAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender);
     public native {type_java_array}[] setAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender, {type_java_array}[] {attribute_low});
-    public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);\n\n"""
+    public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);\n\n""").render(type_java_array=type_java_array, attribute_cap=attribute_cap, attribute_low=attribute_low)
         else:
-            jni_str += f"""
+            jni_str += code_template("""
     public native {type_java_array}[] getAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender);
-    public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);\n\n"""
+    public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);\n\n""").render(type_java_array=type_java_array, attribute_cap=attribute_cap)
     elif(type_checked == 4 or type_checked == 7):
         if(type_checked == 4):
             struct = interface.structs[attr_type]
         
     #     ## {struct_name}ToCPP
-        jni_str += f"""
+        jni_str += code_template("""
     public native void subAttribute{attribute_cap}(long proxyptr);
     public void subAttribute{attribute_cap}Handler({attr_type} {attribute_low}){{
         service.Attribute{attribute_cap}Handle({attribute_low});
-    }}"""
+    }}""").render(attribute_cap=attribute_cap, attr_type=attr_type, attribute_low=attribute_low)
         
         
         ## sub, get, set, unsub if readonly no set
         if(set_flag):
-            jni_str += f"""
+            jni_str += code_template("""
     public native {attr_type} getAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender);
     public native {attr_type} setAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender, {attr_type} {attribute_low});
     public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);
     
-    """
+    """).render(attr_type=attr_type, attribute_cap=attribute_cap, attribute_low=attribute_low)
         else:
-            jni_str += f"""
+            jni_str += code_template("""
     public native {attr_type} getAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender);
     public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);
     
-    """
+    """).render(attr_type=attr_type, attribute_cap=attribute_cap)
     elif(type_checked == 8):
-        jni_str += f"""
+        jni_str += code_template("""
     public native void subAttribute{attribute_cap}(long proxyptr);
     public void subAttribute{attribute_cap}Handler({attr_type} {attribute_low}){{
         service.Attribute{attribute_cap}Handle({attribute_low});
-    }}"""
+    }}""").render(attribute_cap=attribute_cap, attr_type=attr_type, attribute_low=attribute_low)
     
         if(set_flag):
-            jni_str += f"""
+            jni_str += code_template("""
     public native {attr_type} getAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender);
     public native {attr_type} setAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender, {attr_type} {attribute_low});
     public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);
     
-    """
+    """).render(attr_type=attr_type, attribute_cap=attribute_cap, attribute_low=attribute_low)
         else:
-            jni_str += f"""
+            jni_str += code_template("""
     public native {attr_type} getAttribute{attribute_cap}Value(long proxyptr, int timeout, int sender);
     public native void unsubAttribute{attribute_cap}(long proxyptr, int subscription);
     
-    """
+    """).render(attr_type=attr_type, attribute_cap=attribute_cap)
     # Unsub Wrapper
-    jni_str += f"""
+    jni_str += code_template("""
     public void unsubscribeAttribute{attribute_cap}(){{
         if(this.Attribute{attribute_cap}Subscription >= 0){{
             unsubAttribute{attribute_cap}(this.proxyptr, this.Attribute{attribute_cap}Subscription--);
         }}
     }}
-    ///////////////////////////////////////////////////////////////////////////////////////"""
+    ///////////////////////////////////////////////////////////////////////////////////////""").render(attribute_cap=attribute_cap)
 
-    return jni_str, stub_main, stub_handler
+    return jni_str.getvalue(), stub_main.getvalue(), stub_handler.getvalue()
 
 ########################################### Method ############################################
 # out_cast
@@ -4602,7 +6435,7 @@ def generate_jni_method_out_cast(method, interface, upper=""):
                 struct_cast += f"""{field_name} = new {field.type.reference.name}();
             {field_name}.data = new {capitalize_first_letter(convert_java_code_type(field.type.reference.type.name))}[_{field_name}.length];"""
             elif(field_type == 5):
-                struct_cast += f"""{field_name} = new {capitalize_first_letter(convert_java_code_type(field.type.type.name))}[_{field_name}.length];"""
+                struct_cast += f"""{field_name} = new {capitalize_first_letter(convert_java_code_type(element_type(field).type.name))}[_{field_name}.length];"""
             struct_cast += f"""
             {field_name}{type_data} = _{field_name};
             """
@@ -4617,9 +6450,7 @@ def generate_jni_method_out_cast(method, interface, upper=""):
         elif(field_type == 9):
             struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper,isget=True,ismethod=True, iscomplex=True)
             struct_cast_temp = struct_cast_temp.replace(f"{field_name}.", f"{field_name}.data[i].")
-            struct_cast_temp_lines = struct_cast_temp.split('\n')
-            struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-            struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+            struct_cast_temp = indent_lines(struct_cast_temp)
         
             struct_cast += f"""{field_name}.data = new {field.type.reference.type.name}[_{field_name}.length];
             for(int i = 0; i < _{field_name}.length; i ++){{
@@ -4630,9 +6461,7 @@ def generate_jni_method_out_cast(method, interface, upper=""):
         elif(field_type == 10):
             struct_cast_temp = generate_stub_attribute_struct_cast(field, interface, upper,isget=True,ismethod=True, iscomplex=True, isimplicit=True)
             struct_cast_temp = struct_cast_temp.replace(f"{field_name}.", f"{field_name}[i].")
-            struct_cast_temp_lines = struct_cast_temp.split('\n')
-            struct_cast_temp_lines = ['\t' + line for line in struct_cast_temp_lines]
-            struct_cast_temp = '\n'.join(struct_cast_temp_lines)
+            struct_cast_temp = indent_lines(struct_cast_temp)
             # {field.type.type.reference.name}[] #
             struct_cast += f"""{field_name} = new {field.type.type.reference.name}[_{field_name}.length];
             for(int i = 0; i < _{field_name}.length; i ++){{
@@ -4650,12 +6479,13 @@ def generate_jni_method_out_cast(method, interface, upper=""):
     return struct_cast
 
 # stub code에 추가할 내용 필요(완료), returun 해서 stub code에 반환 필요
+@profiled("member")
 def generate_jni_method(method, package_name, interface ,java_package_name):
-    jni_str = ""
-    stub_str = ""
-    jni_str += f"""
+    jni_str = CodeBuffer()
+    stub_str = CodeBuffer()
+    jni_str += code_template("""
     /////////////////////////////////////////////////////////////////////////////////////////
-    """
+    """).render()
     
     method_low = lower_first_letter(method.name)
     method_cap = capitalize_first_letter(method.name)
@@ -4675,14 +6505,15 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
     if len(method.out_args.values()) > 1:
         cnt = 1
         for arg in method.out_args.values():
+            descriptor = type_descriptor(arg)
             type_checked = check_type_ver2(arg,interface)
-            arg_type = convert_java_code_type(arg.type.name)
+            arg_type = descriptor.spelling.java_code
             if(type_checked == 3):
-                arg_type = convert_java_code_type(interface.arrays[arg.type.name].type.name) + "[]"
+                arg_type = descriptor.element_spelling.java_code + "[]"
             elif(type_checked == 5):
-                arg_type = convert_java_code_type(arg.type.type.name) + "[]"
+                arg_type = descriptor.element_spelling.java_code + "[]"
             elif(type_checked == 6):
-                arg_type = convert_java_code_type(arg.type.reference.type.name) + "[]"
+                arg_type = descriptor.element_spelling.java_code + "[]"
             elif(type_checked == 8):
                 arg_type = "byte"
             elif(type_checked == 9):
@@ -4713,32 +6544,33 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
         
         
         # if returnType needed
-        jni_str += f"""
+        jni_str += code_template("""
     static class {method_cap}ReturnType{{
         {out_args_gen}
         {out_args_con1}
         {out_args_con2}
     }}
-    """
+    """).render(method_cap=method_cap, out_args_gen=out_args_gen, out_args_con1=out_args_con1, out_args_con2=out_args_con2)
     
     if len(method.out_args.values()) > 1:
         return_type = "{}ReturnType".format(method_cap)
         return_type_service = return_type
-        return_service = f"""{return_type} {method.name}Service = new {return_type}();"""
-        return_result = f"""return {method.name}Service;"""
+        return_service = code_template("""{return_type} {method_name}Service = new {return_type}();""").render(return_type=return_type, method_name=method.name)
+        return_result = code_template("""return {method_name}Service;""").render(method_name=method.name)
     elif len(method.out_args.values()) == 1:
         arg = next(iter(method.out_args.values()))
+        descriptor = type_descriptor(arg)
         type_checked = check_type_ver2(arg,interface)
-        arg_type = convert_java_code_type(arg.type.name)
+        arg_type = descriptor.spelling.java_code
         return_type_service = arg_type
         return_type_service_init = ";"
         if(type_checked == 3):
-            arg_type = convert_java_code_type(interface.arrays[arg.type.name].type.name) + "[]"
+            arg_type = descriptor.element_spelling.java_code + "[]"
         elif(type_checked == 5):
-            arg_type = convert_java_code_type(arg.type.type.name) + "[]"
-            return_type_service = convert_java_code_type(arg.type.type.name) + "[]"
+            arg_type = descriptor.element_spelling.java_code + "[]"
+            return_type_service = descriptor.element_spelling.java_code + "[]"
         elif(type_checked == 6):
-            arg_type = convert_java_code_type(arg.type.reference.type.name) + "[]"
+            arg_type = descriptor.element_spelling.java_code + "[]"
         elif(type_checked == 8):
             arg_type = "byte"
             return_type_service = "byte"
@@ -4746,22 +6578,22 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
             # arg_type = arg.type.reference.namespace.name + "JNI." + arg.type.reference.type.name + "[]"
             arg_type = arg.type.reference.type.name + "[]"
             return_type_service = arg.type.reference.name
-            return_type_service_init = f""" = new {return_type_service}();"""
+            return_type_service_init = code_template(""" = new {return_type_service}();""").render(return_type_service=return_type_service)
         elif(type_checked == 10):
             # arg_type = arg.type.type.reference.namespace.name + "JNI." + arg.type.type.reference.name + "[]"
             arg_type = arg.type.type.reference.name + "[]"
             return_type_service = arg.type.type.reference.name + "[]"
-            return_type_service_init = f""";"""
+            return_type_service_init = code_template(""";""").render()
         elif(type_checked == 11):
             arg_type = arg.type.reference.name + "[]"
             return_type_service = arg.type.reference.name + "[]"
-            return_type_service_init = f""";"""
+            return_type_service_init = code_template(""";""").render()
             
         if(type_checked >= 3 and type_checked <= 7 and type_checked != 5):
             return_type_service_init = " = new {}();".format(return_type_service)
         return_type = "{}".format(arg_type)
-        return_service = f"""{return_type_service} {lower_first_letter(arg.name)}{return_type_service_init}"""
-        return_result = f"""return {lower_first_letter(arg.name)};"""
+        return_service = code_template("""{return_type_service} {arg_low}{return_type_service_init}""").render(return_type_service=return_type_service, arg_low=lower_first_letter(arg.name), return_type_service_init=return_type_service_init)
+        return_result = code_template("""return {arg_low};""").render(arg_low=lower_first_letter(arg.name))
     else:
         return_type = "void"
         return_type_service = "void"
@@ -4777,33 +6609,34 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
         in_args_valid = ", "
     cnt = 1
     for arg in method.in_args.values():
+        descriptor = type_descriptor(arg)
         type_checked = check_type_ver2(arg,interface)
-        arg_type = convert_java_code_type(arg.type.name)
-        arg_type_service = convert_java_code_type(arg.type.name)
+        arg_type = descriptor.spelling.java_code
+        arg_type_service = descriptor.spelling.java_code
         if(type_checked == 3):
-            arg_type = convert_java_code_type(interface.arrays[arg.type.name].type.name) + "[]"
-            return_in_cast += f"""{arg_type} _{lower_first_letter(arg.name)} = {lower_first_letter(arg.name)}.data;"""
+            arg_type = descriptor.element_spelling.java_code + "[]"
+            return_in_cast += code_template("""{arg_type} _{arg_low} = {arg_low}.data;""").render(arg_type=arg_type, arg_low=lower_first_letter(arg.name))
             in_args_call += "_{}".format(lower_first_letter(arg.name))
             in_args_call_jni += "{}".format(lower_first_letter(arg.name))
         elif(type_checked == 5):
-            arg_type = convert_java_code_type(arg.type.type.name) + "[]"
-            arg_type_service = convert_java_code_type(arg.type.type.name) + "[]"
+            arg_type = descriptor.element_spelling.java_code + "[]"
+            arg_type_service = descriptor.element_spelling.java_code + "[]"
             in_args_call += "{}".format(lower_first_letter(arg.name))
             in_args_call_jni += "{}".format(lower_first_letter(arg.name))
         elif(type_checked == 6):
-            arg_type = convert_java_code_type(arg.type.reference.type.name) + "[]"
-            return_in_cast += f"""{arg_type} _{lower_first_letter(arg.name)} = {lower_first_letter(arg.name)}.data;"""
+            arg_type = descriptor.element_spelling.java_code + "[]"
+            return_in_cast += code_template("""{arg_type} _{arg_low} = {arg_low}.data;""").render(arg_type=arg_type, arg_low=lower_first_letter(arg.name))
             in_args_call += "_{}".format(lower_first_letter(arg.name))
             in_args_call_jni += "{}".format(lower_first_letter(arg.name))
         elif(type_checked == 4 or type_checked == 7):
-            return_in_cast += f"""{arg.type.reference.namespace.name+"JNI."}{arg_type.split('.')[-1]} _{lower_first_letter(arg.name)} = new {arg.type.reference.namespace.name+"JNI."}{arg_type.split('.')[-1]}();"""
+            return_in_cast += code_template("""{jni_namespace}{arg_type_name} _{arg_low} = new {jni_namespace}{arg_type_name}();""").render(jni_namespace=arg.type.reference.namespace.name + 'JNI.', arg_type_name=arg_type.split('.')[-1], arg_low=lower_first_letter(arg.name))
             return_in_cast += generate_jni_attribute_struct_cast(arg,interface,upper="",isget=False)
             in_args_call += "_{}".format(lower_first_letter(arg.name))
             in_args_call_jni += "{}".format(lower_first_letter(arg.name))
         elif(type_checked == 8):
             arg_type = "byte"
             arg_type_service = "byte"
-            return_in_cast += f"""byte _{lower_first_letter(arg.name)} = {lower_first_letter(arg.name)};"""
+            return_in_cast += code_template("""byte _{arg_low} = {arg_low};""").render(arg_low=lower_first_letter(arg.name))
             in_args_call += "_{}".format(lower_first_letter(arg.name))
             in_args_call_jni += "{}".format(lower_first_letter(arg.name))
         elif(type_checked == 9):
@@ -4812,13 +6645,11 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
             return_in_cast_temp = generate_stub_attribute_struct_cast(arg, interface, upper="", isget=False, ismethod= False, iscomplex = True)
             return_in_cast_temp = return_in_cast_temp.replace(f"_{lower_first_letter(arg.name)}.", f"_{lower_first_letter(arg.name)}[i].")
             return_in_cast_temp = return_in_cast_temp.replace(f"{lower_first_letter(arg.name)}.", f"{lower_first_letter(arg.name)}.data[i].")
-            return_in_cast_temp_lines = return_in_cast_temp.split('\n')
-            return_in_cast_temp_lines = ['\t' + line for line in return_in_cast_temp_lines]
-            return_in_cast_temp = '\n'.join(return_in_cast_temp_lines)
-            return_in_cast += f"""{arg.type.reference.namespace.name}JNI.{arg.type.reference.type.name}[] _{lower_first_letter(arg.name)} = new {arg.type.reference.namespace.name}JNI.{arg.type.reference.type.name}[{lower_first_letter(arg.name)}.data.length];
-            for(int i = 0; i < {lower_first_letter(arg.name)}.data.length; i++){{
-                _{lower_first_letter(arg.name)}[i] = new {arg.type.reference.namespace.name}JNI.{arg.type.reference.type.name}();{return_in_cast_temp}
-            }}"""
+            return_in_cast_temp = indent_lines(return_in_cast_temp)
+            return_in_cast += code_template("""{reference_namespace}JNI.{element_name}[] _{arg_low} = new {reference_namespace}JNI.{element_name}[{arg_low}.data.length];
+            for(int i = 0; i < {arg_low}.data.length; i++){{
+                _{arg_low}[i] = new {reference_namespace}JNI.{element_name}();{return_in_cast_temp}
+            }}""").render(reference_namespace=arg.type.reference.namespace.name, element_name=arg.type.reference.type.name, arg_low=lower_first_letter(arg.name), return_in_cast_temp=return_in_cast_temp)
             in_args_call += "_{}".format(lower_first_letter(arg.name))
             in_args_call_jni += "{}".format(lower_first_letter(arg.name))
         elif(type_checked == 10):
@@ -4827,22 +6658,20 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
             return_in_cast_temp = generate_stub_attribute_struct_cast(arg, interface, upper="", isget=False, ismethod= False, iscomplex = True, isimplicit=True)
             return_in_cast_temp = return_in_cast_temp.replace(f"_{lower_first_letter(arg.name)}.", f"_{lower_first_letter(arg.name)}[i].")
             return_in_cast_temp = return_in_cast_temp.replace(f"{lower_first_letter(arg.name)}.", f"{lower_first_letter(arg.name)}[i].")
-            return_in_cast_temp_lines = return_in_cast_temp.split('\n')
-            return_in_cast_temp_lines = ['\t' + line for line in return_in_cast_temp_lines]
-            return_in_cast_temp = '\n'.join(return_in_cast_temp_lines)
-            return_in_cast += f"""{arg.type.type.reference.namespace.name}JNI.{arg.type.type.reference.name}[] _{lower_first_letter(arg.name)} = new {arg.type.type.reference.namespace.name}JNI.{arg.type.type.reference.name}[{lower_first_letter(arg.name)}.length];
-            for(int i = 0; i < {lower_first_letter(arg.name)}.length; i++){{
-                _{lower_first_letter(arg.name)}[i] = new {arg.type.type.reference.namespace.name}JNI.{arg.type.type.reference.name}();{return_in_cast_temp}
-            }}"""
+            return_in_cast_temp = indent_lines(return_in_cast_temp)
+            return_in_cast += code_template("""{element_namespace}JNI.{element_name}[] _{arg_low} = new {element_namespace}JNI.{element_name}[{arg_low}.length];
+            for(int i = 0; i < {arg_low}.length; i++){{
+                _{arg_low}[i] = new {element_namespace}JNI.{element_name}();{return_in_cast_temp}
+            }}""").render(element_namespace=arg.type.type.reference.namespace.name, element_name=arg.type.type.reference.name, arg_low=lower_first_letter(arg.name), return_in_cast_temp=return_in_cast_temp)
             in_args_call += "_{}".format(lower_first_letter(arg.name))
             in_args_call_jni += "{}".format(lower_first_letter(arg.name))
         elif(type_checked == 11):
             arg_type = arg.type.reference.name + "[]"
             arg_type_service = arg.type.reference.name + "[]"
             return_in_cast_temp = generate_jni_map_cast(arg, upper="",interface=interface, indentation=0,type=2)
-            return_in_cast += f"""{arg.type.reference.namespace.name}JNI.{arg.type.reference.name}[] _{lower_first_letter(arg.name)} = new {arg.type.reference.namespace.name}JNI.{arg.type.reference.name}[{lower_first_letter(arg.name)}.length];
+            return_in_cast += code_template("""{reference_namespace}JNI.{reference_name}[] _{arg_low} = new {reference_namespace}JNI.{reference_name}[{arg_low}.length];
             {return_in_cast_temp}
-            """
+            """).render(reference_namespace=arg.type.reference.namespace.name, reference_name=arg.type.reference.name, arg_low=lower_first_letter(arg.name), return_in_cast_temp=return_in_cast_temp)
             in_args_call += "_{}".format(lower_first_letter(arg.name))
             in_args_call_jni += "{}".format(lower_first_letter(arg.name))
         else:
@@ -4863,31 +6692,31 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
     
     if(return_type != "void"):
         if(len(method.out_args.values())>1):
-            return_method = f"""{capitalize_first_letter(interface.name)}JNI.{return_type} _{method.name}Service = myProxy.{method.name}({in_args_call});"""
+            return_method = code_template("""{interface_name_cap}JNI.{return_type} _{method_name}Service = myProxy.{method_name}({in_args_call});""").render(interface_name_cap=capitalize_first_letter(interface.name), return_type=return_type, method_name=method.name, in_args_call=in_args_call)
             #return_out_cast = generate_jni_attribute_struct_cast()
             return_out_cast = generate_jni_method_out_cast(method,interface,upper=method.name+"Service")
         else:
             arg_temp = next(iter(method.out_args.values()))
             type_temp = check_type_ver2(arg_temp, interface)
             if(type_temp == 1 or type_temp == 2):
-                return_method = f"""{convert_java_code_type(arg_temp.type.name)} _{lower_first_letter(arg_temp.name)} = myProxy.{method.name}({in_args_call});"""
+                return_method = code_template("""{java_type} _{arg_low} = myProxy.{method_name}({in_args_call});""").render(java_type=convert_java_code_type(arg_temp.type.name), arg_low=lower_first_letter(arg_temp.name), method_name=method.name, in_args_call=in_args_call)
             elif(type_temp == 5):
-                return_method = f"""{convert_java_code_type(arg_temp.type.type.name)}[] _{lower_first_letter(arg_temp.name)} = myProxy.{method.name}({in_args_call});"""
+                return_method = code_template("""{java_element_type}[] _{arg_low} = myProxy.{method_name}({in_args_call});""").render(java_element_type=convert_java_code_type(element_type(arg_temp).type.name), arg_low=lower_first_letter(arg_temp.name), method_name=method.name, in_args_call=in_args_call)
             elif(type_temp == 4 or type_temp == 7):
-                return_method = f"""{arg_temp.type.reference.namespace.name+"JNI."}{return_type.split('.')[-1]} _{lower_first_letter(arg_temp.name)} = myProxy.{method.name}({in_args_call});"""
+                return_method = code_template("""{jni_namespace}{return_type_name} _{arg_low} = myProxy.{method_name}({in_args_call});""").render(jni_namespace=arg_temp.type.reference.namespace.name + 'JNI.', return_type_name=return_type.split('.')[-1], arg_low=lower_first_letter(arg_temp.name), method_name=method.name, in_args_call=in_args_call)
             elif(type_temp == 8):
-                return_method = f"""byte _{lower_first_letter(arg_temp.name)} = myProxy.{method.name}({in_args_call});"""
+                return_method = code_template("""byte _{arg_low} = myProxy.{method_name}({in_args_call});""").render(arg_low=lower_first_letter(arg_temp.name), method_name=method.name, in_args_call=in_args_call)
             elif(type_temp == 9):
-                return_method = f"""{arg_temp.type.reference.type.reference.namespace.name+"JNI."}{return_type} _{lower_first_letter(arg_temp.name)} = myProxy.{method.name}({in_args_call});"""
+                return_method = code_template("""{jni_namespace}{return_type} _{arg_low} = myProxy.{method_name}({in_args_call});""").render(jni_namespace=arg_temp.type.reference.type.reference.namespace.name + 'JNI.', return_type=return_type, arg_low=lower_first_letter(arg_temp.name), method_name=method.name, in_args_call=in_args_call)
             elif(type_temp == 10):
-                return_method = f"""{arg_temp.type.type.reference.namespace.name+"JNI."}{return_type} _{lower_first_letter(arg_temp.name)} = myProxy.{method.name}({in_args_call});"""
+                return_method = code_template("""{jni_namespace}{return_type} _{arg_low} = myProxy.{method_name}({in_args_call});""").render(jni_namespace=arg_temp.type.type.reference.namespace.name + 'JNI.', return_type=return_type, arg_low=lower_first_letter(arg_temp.name), method_name=method.name, in_args_call=in_args_call)
             elif(type_temp == 11):
-                return_method = f"""{arg_temp.type.reference.namespace.name+"JNI."}{return_type} _{lower_first_letter(arg_temp.name)} = myProxy.{method.name}({in_args_call});"""
+                return_method = code_template("""{jni_namespace}{return_type} _{arg_low} = myProxy.{method_name}({in_args_call});""").render(jni_namespace=arg_temp.type.reference.namespace.name + 'JNI.', return_type=return_type, arg_low=lower_first_letter(arg_temp.name), method_name=method.name, in_args_call=in_args_call)
             else:
-                return_method = f"""{return_type} _{lower_first_letter(arg_temp.name)} = myProxy.{method.name}({in_args_call});"""
+                return_method = code_template("""{return_type} _{arg_low} = myProxy.{method_name}({in_args_call});""").render(return_type=return_type, arg_low=lower_first_letter(arg_temp.name), method_name=method.name, in_args_call=in_args_call)
             return_out_cast = generate_jni_method_out_cast(method,interface,upper="")
     else:
-        return_method = f"""myProxy.{method.name}({in_args_call});"""
+        return_method = code_template("""myProxy.{method_name}({in_args_call});""").render(method_name=method.name, in_args_call=in_args_call)
     
     # method call
     if len(return_type.split('.')) > 1:
@@ -4900,12 +6729,12 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
     else:
         fireandForget = "return "
     
-    jni_str += f"""
-    public {return_type_jni} {method.name}({in_args_jni}){{
+    jni_str += code_template("""
+    public {return_type_jni} {method_name}({in_args_jni}){{
         {fireandForget}{method_cap}(this.proxyptr{in_args_valid}{in_args_call_jni});
     }}
     public native {return_type_jni} {method_cap}(long proxyptr{in_args_valid}{in_args_jni});
-    """
+    """).render(return_type_jni=return_type_jni, method_name=method.name, in_args_jni=in_args_jni, fireandForget=fireandForget, method_cap=method_cap, in_args_valid=in_args_valid, in_args_call_jni=in_args_call_jni)
     return_null = ""
     if(return_type_service == "void"):
         return_null = ""
@@ -4915,9 +6744,9 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
         return_null = "false"
     else:
         return_null = " null"
-    stub_str += f"""
+    stub_str += code_template("""
         @Override
-        public {return_type_service} {method.name}({in_args}) throws RemoteException{{
+        public {return_type_service} {method_name}({in_args}) throws RemoteException{{
             if(myProxy == null){{
                 if(!proxyGeneration()){{
                     return{return_null};
@@ -4929,11 +6758,11 @@ def generate_jni_method(method, package_name, interface ,java_package_name):
             {return_out_cast}
             {return_result}
         }}
-        """
-    jni_str += f"""
-    /////////////////////////////////////////////////////////////////////////////////////////"""
+        """).render(return_type_service=return_type_service, method_name=method.name, in_args=in_args, return_null=return_null, return_service=return_service, return_in_cast=return_in_cast, return_method=return_method, return_out_cast=return_out_cast, return_result=return_result)
+    jni_str += code_template("""
+    /////////////////////////////////////////////////////////////////////////////////////////""").render()
     
-    return jni_str, stub_str
+    return jni_str.getvalue(), stub_str.getvalue()
 ################################################ TypeCollection and Data Types #######################################
 ###JNI Typecollection generation 하는 부분
 def generate_jni_typecollection(typecollection, java_package, is_typecollection = True):
@@ -4957,7 +6786,7 @@ public class {typecollection_cap}JNI{{
                 if(type_checked_field == 3):
                     array = typecollection.arrays[field.type.name]
                 elif(type_checked_field == 5):
-                    array = field.type
+                    array = element_type(field)
                 elif(type_checked_field == 6):
                     array = field.type.reference
                 jni_str += f"""\n\t\t{convert_java_code_type(array.type.name)}[] {field.name};"""    
@@ -4983,7 +6812,7 @@ public class {typecollection_cap}JNI{{
                 if(type_checked_field == 3):
                     array = typecollection.arrays[field.type.name]
                 elif(type_checked_field == 5):
-                    array = field.type
+                    array = element_type(field)
                 elif(type_checked_field == 6):
                     array = field.type.reference
                 jni_str += "{}[] {}".format(convert_java_code_type(array.type.name),field.name)
@@ -5045,14 +6874,8 @@ public class {typecollection_cap}JNI{{
         
     return jni_str
 ####################################### Broadcast #########################################################################
-def generate_jni_broadcast(broadcast, interface):
-    jni_str = ""
-    broadcast_cap = capitalize_first_letter(broadcast.name)
-    stub_main = ""
-    stub_handler = ""
-    
-    # broadcast 1 JNI gen
-    jni_str += f"""///////////////////////////////////////////////////////////////////////////////////////
+# generate_jni_broadcast 템플릿 (JNI 구독, Stub callback handler, Stub subscribe/unsubscribe)
+JNI_BROADCAST_SUBSCRIBE_TEMPLATE = code_template("""///////////////////////////////////////////////////////////////////////////////////////
     int {broadcast_cap}Subscription = -1;
     public native void subBroadcast{broadcast_cap}(long proxyptr);
     public native void unsubBroadcast{broadcast_cap}(long proxyptr, int subscription);
@@ -5065,29 +6888,88 @@ def generate_jni_broadcast(broadcast, interface):
             unsubBroadcast{broadcast_cap}(this.proxyptr, this.{broadcast_cap}Subscription--);
         }}
     }}
-    """
+    """)
+
+STUB_BROADCAST_HANDLER_TEMPLATE = code_template("""
+    private static ArrayList<{interface_cap}{broadcast_cap}Callback> {broadcast_cap}Callback = new ArrayList<>();
+    void {broadcast_cap}Callback({out_args}){{
+        if(this.{broadcast_cap}Callback != null){{
+            {broadcast_cast}for({interface_cap}{broadcast_cap}Callback callback : this.{broadcast_cap}Callback){{
+                try {{
+                    callback.on{broadcast_cap}Received({out_args_call});
+                }} catch (RemoteException e) {{
+                    throw new RuntimeException(e);
+                }}
+            }}
+        }}
+    }}
+    """)
+
+STUB_BROADCAST_MAIN_TEMPLATE = code_template("""
+        @Override
+        public void subscribe{broadcast_cap}({interface_cap}{broadcast_cap}Callback callback) throws RemoteException {{
+            if(myProxy == null){{
+                if(!proxyGeneration()){{
+                    return;
+                }}
+            }}
+            if(!{interface_cap}Service.{broadcast_cap}Callback.contains(callback)){{
+                {interface_cap}Service.{broadcast_cap}Callback.add(callback);
+                if({interface_cap}Service.{broadcast_cap}Callback.size() == 1){{
+                    myProxy.subscribe{broadcast_cap}();
+                }}
+            }}
+        }}
+        
+        @Override
+        public void unsubscribe{broadcast_cap}({interface_cap}{broadcast_cap}Callback callback) throws RemoteException {{
+            if(myProxy == null){{
+                if(!proxyGeneration()){{
+                    return;
+                }}
+            }}
+            if({interface_cap}Service.{broadcast_cap}Callback.contains(callback)){{
+                {interface_cap}Service.{broadcast_cap}Callback.remove(callback);
+                if({interface_cap}Service.{broadcast_cap}Callback.size() == 1){{
+                    myProxy.unsubscribe{broadcast_cap}();
+                }}
+            }}
+        }}
+        """)
+
+@profiled("member")
+def generate_jni_broadcast(broadcast, interface):
+    jni_str = CodeBuffer()
+    broadcast_cap = capitalize_first_letter(broadcast.name)
+    interface_cap = capitalize_first_letter(interface.name)
+    stub_main = CodeBuffer()
+    stub_handler = CodeBuffer()
+    
+    # broadcast 1 JNI gen
+    JNI_BROADCAST_SUBSCRIBE_TEMPLATE.render_to(jni_str, {"broadcast_cap": broadcast_cap})
     # broadcast 2 Callback, not needed after integrating the code with Stub
     
     # braodcast 4 JNI Callback gen
-    out_args = ""
-    out_args_call = ""
+    out_args = CodeBuffer()
+    out_args_call = CodeBuffer()
     jni_str += f"""
     public void subBroadcast{broadcast_cap}Callback("""
     count_args = 1
     for out_arg in broadcast.out_args.values():
+        descriptor = type_descriptor(out_arg)
         arg_type_checked = check_type_ver2(out_arg, interface)
         if(arg_type_checked == 1 or arg_type_checked == 2):
-            jni_str += "{} {}".format(convert_java_code_type(out_arg.type.name),(out_arg.name))
-            out_args += "{} _{}".format(convert_java_code_type(out_arg.type.name),lower_first_letter(out_arg.name))
+            jni_str += "{} {}".format(descriptor.spelling.java_code,(out_arg.name))
+            out_args += "{} _{}".format(descriptor.spelling.java_code,lower_first_letter(out_arg.name))
             out_args_call += "{}".format(lower_first_letter(out_arg.name))
         elif(arg_type_checked == 3 or arg_type_checked == 5 or arg_type_checked == 6):
-            if(out_arg.type.name is None):
-                jni_str += "{}[] {}".format(convert_java_code_type(out_arg.type.type.name),out_arg.name)
-                out_args += "{}[] _{}".format(convert_java_code_type(out_arg.type.type.name),lower_first_letter(out_arg.name))
+            if(descriptor.type.name is None):
+                jni_str += "{}[] {}".format(descriptor.element_spelling.java_code,out_arg.name)
+                out_args += "{}[] _{}".format(descriptor.element_spelling.java_code,lower_first_letter(out_arg.name))
                 out_args_call += "{}".format(lower_first_letter(out_arg.name))
             else:
-                jni_str += "{}[] {}".format(convert_java_code_type(out_arg.type.reference.type.name), out_arg.name)
-                out_args += "{}[] _{}".format(convert_java_code_type(out_arg.type.reference.type.name),lower_first_letter(out_arg.name))
+                jni_str += "{}[] {}".format(descriptor.element_spelling.java_code, out_arg.name)
+                out_args += "{}[] _{}".format(descriptor.element_spelling.java_code,lower_first_letter(out_arg.name))
                 out_args_call += "{}".format(lower_first_letter(out_arg.name))
         elif(arg_type_checked == 8):
             jni_str += "{} {}".format("byte", out_arg.name)
@@ -5119,11 +7001,12 @@ def generate_jni_broadcast(broadcast, interface):
         service.{broadcast_cap}Callback("""
     count_args_call = 1
     for out_arg in broadcast.out_args.values():
+        descriptor = type_descriptor(out_arg)
         arg_type_checked = check_type_ver2(out_arg, interface)
         if(arg_type_checked == 1 or arg_type_checked == 2):
             jni_str += "{}".format((out_arg.name))
         elif(arg_type_checked == 3 or arg_type_checked == 5 or arg_type_checked == 6):
-            if(out_arg.type.name is None):
+            if(descriptor.type.name is None):
                 jni_str += "{}".format(out_arg.name)
             else:
                 jni_str += "{}".format(out_arg.name)
@@ -5139,12 +7022,13 @@ def generate_jni_broadcast(broadcast, interface):
     """
     
     # bcast cast for callback, needs to be done for out_args
-    broadcast_cast = ""
+    broadcast_cast = CodeBuffer()
     for arg in broadcast.out_args.values():
+        descriptor = type_descriptor(arg)
         cast_type = check_type_ver2(arg, interface)
-        arg_java = convert_java_code_type(arg.type.name)
+        arg_java = descriptor.spelling.java_code
         if(arg_java is None):
-            arg_java = convert_java_code_type(arg.type.type.name) + "[]"
+            arg_java = descriptor.element_spelling.java_code + "[]"
         if(cast_type == 3 or cast_type == 6):
             broadcast_cast += f"""{arg.type.name.split('.')[-1]} {lower_first_letter(arg.name)} = new {arg.type.name.split('.')[-1]}();
             {lower_first_letter(arg.name)}.data = _{lower_first_letter(arg.name)};
@@ -5168,9 +7052,7 @@ def generate_jni_broadcast(broadcast, interface):
                 broadcast_cast_temp = generate_stub_attribute_struct_cast(arg, interface, upper="", isget=True, ismethod= False, iscomplex= True, isimplicit=True)
                 broadcast_cast_temp = broadcast_cast_temp.replace(f"_{lower_first_letter(arg.name)}.", f"_{lower_first_letter(arg.name)}[i].")
                 broadcast_cast_temp = broadcast_cast_temp.replace(f"{lower_first_letter(arg.name)}.", f"{lower_first_letter(arg.name)}[i].")
-            broadcast_cast_temp_lines = broadcast_cast_temp.split('\n')
-            broadcast_cast_temp_lines = ['\t' + line for line in broadcast_cast_temp_lines]
-            broadcast_cast_temp = '\n'.join(broadcast_cast_temp_lines)
+            broadcast_cast_temp = indent_lines(broadcast_cast_temp)
             if(cast_type == 9):
                 for_loop_temp = f"""
             for(int i = 0; i < _{lower_first_letter(arg.name)}.length; i++){{
@@ -5195,66 +7077,29 @@ def generate_jni_broadcast(broadcast, interface):
             """
 
     # AIDL 분리 버전
-    stub_handler += f"""
-    private static ArrayList<{capitalize_first_letter(interface.name)}{broadcast_cap}Callback> {broadcast_cap}Callback = new ArrayList<>();
-    void {broadcast_cap}Callback({out_args}){{
-        if(this.{broadcast_cap}Callback != null){{
-            {broadcast_cast}for({capitalize_first_letter(interface.name)}{broadcast_cap}Callback callback : this.{broadcast_cap}Callback){{
-                try {{
-                    callback.on{broadcast_cap}Received({out_args_call});
-                }} catch (RemoteException e) {{
-                    throw new RuntimeException(e);
-                }}
-            }}
-        }}
-    }}
-    """
+    STUB_BROADCAST_HANDLER_TEMPLATE.render_to(stub_handler, {
+        "interface_cap": interface_cap,
+        "broadcast_cap": broadcast_cap,
+        "out_args": out_args.getvalue(),
+        "out_args_call": out_args_call.getvalue(),
+        "broadcast_cast": broadcast_cast.getvalue(),
+    })
     
     # stub main
     ## subscribe # 분리하는 버전
-    stub_main += f"""
-        @Override
-        public void subscribe{broadcast_cap}({capitalize_first_letter(interface.name)}{broadcast_cap}Callback callback) throws RemoteException {{
-            if(myProxy == null){{
-                if(!proxyGeneration()){{
-                    return;
-                }}
-            }}
-            if(!{capitalize_first_letter(interface.name)}Service.{broadcast_cap}Callback.contains(callback)){{
-                {capitalize_first_letter(interface.name)}Service.{broadcast_cap}Callback.add(callback);
-                if({capitalize_first_letter(interface.name)}Service.{broadcast_cap}Callback.size() == 1){{
-                    myProxy.subscribe{broadcast_cap}();
-                }}
-            }}
-        }}
-        
-        @Override
-        public void unsubscribe{broadcast_cap}({capitalize_first_letter(interface.name)}{broadcast_cap}Callback callback) throws RemoteException {{
-            if(myProxy == null){{
-                if(!proxyGeneration()){{
-                    return;
-                }}
-            }}
-            if({capitalize_first_letter(interface.name)}Service.{broadcast_cap}Callback.contains(callback)){{
-                {capitalize_first_letter(interface.name)}Service.{broadcast_cap}Callback.remove(callback);
-                if({capitalize_first_letter(interface.name)}Service.{broadcast_cap}Callback.size() == 1){{
-                    myProxy.unsubscribe{broadcast_cap}();
-                }}
-            }}
-        }}
-        """
+    STUB_BROADCAST_MAIN_TEMPLATE.render_to(stub_main, {"interface_cap": interface_cap, "broadcast_cap": broadcast_cap})
     
     
     
-    return jni_str, stub_main, stub_handler
+    return jni_str.getvalue(), stub_main.getvalue(), stub_handler.getvalue()
 ###############################################################################################################################
 ################################ FIDL AST into codes #######################################################################
 def generate_src_client_from_fidl_interface(interface, package_name, java_package_name, typecollection):
-    jni_str = ""
-    interface_str = ""
+    jni_str = CodeBuffer()
+    interface_str = CodeBuffer()
     list_references = set()
-    stub_handler = ""
-    stub_main = ""
+    stub_handler = CodeBuffer()
+    stub_main = CodeBuffer()
     stub_handler_temp = ""
     stub_main_temp = ""
     jni_str += generate_jni_typecollection(interface, java_package_name, False)
@@ -5356,116 +7201,19 @@ def generate_src_client_from_fidl_interface(interface, package_name, java_packag
             jni_str += jni_str_temp
             stub_main += stub_main_temp
     #interface_str += "\n}"
-    return interface_str, jni_str, stub_main, stub_handler
+    return interface_str.getvalue(), jni_str.getvalue(), stub_main.getvalue(), stub_handler.getvalue()
 
 
-def convert_to_src_client(packages, jni_version, jpackage_name, output_dir):
-    interfaces = OrderedDict()
-    stub_main = OrderedDict()
-    stub_handler = OrderedDict()
-    jnis = OrderedDict()
-    extends = OrderedDict()
-    jni_typecollection = OrderedDict()
-    imports = list()
-    java_package_name = jpackage_name.split(".")
-    java_packages = ""
-    java_class = ""
-    package_name = ""
-    for name in java_package_name:
-        java_packages += "{}_".format(name)
-        java_class += "{}/".format(name)
-        
-    versions = OrderedDict()
-    # package_names = package_name.split(".")
-    # cpp_package = ""
-    # cpp_header = ""
-    # for name in package_names:
-    #     cpp_package += "::{}".format(name)
-    #     cpp_header += "{}/".format(name)
-    os.makedirs(output_dir + '/src', exist_ok=True)
-    os.makedirs(output_dir + '/stub', exist_ok=True)
+# convert_to_src_client 템플릿 (Client.cpp, Service.java)
+SRC_CLIENT_HEADER_TEMPLATE = code_template("// Auto-generated by FIDL-SRC Converter\n// Filename: {interface}Client.cpp\n\n#include <iostream>\n#include <jni.h>\n#include <string.h>\n#include <CommonAPI/CommonAPI.hpp>\n#include \"v{version}/{cpp_header}{interface}Proxy.hpp\"\n{conversion_includes}\n")
 
-    for package in packages.values():
-        ## exception
-        # try:
-        package_name = package.name
-        package_names = package.name.split(".")
-        cpp_package = ""
-        cpp_header = ""
-        for name in package_names:
-            cpp_package += "::{}".format(name)
-            cpp_header += "{}/".format(name)
-        if(package.interfaces):
-            for interface in package.interfaces.values():
-                # Unsupported data type filtering
-                # if(interface.maps):
-                #    raise Exception("Interface {}, Maps are not supported".format(interface.name))
-                
-                
-                interface_str, jni_attr_str, stub_main_str, stub_handler_str = generate_src_client_from_fidl_interface(interface, package.name, java_package_name, package.typecollections)
-                interfaces[interface.name] = interface_str
-                jnis[interface.name] = jni_attr_str
-                stub_main[interface.name] = stub_main_str
-                stub_handler[interface.name] = stub_handler_str
-                versions[interface.name] = interface.version.major
-                extends[interface.name] = interface.extends if interface.extends else None
-                if(interface.broadcasts):
-                    for broadcast in interface.broadcasts.values(): 
-                        jni_str_temp, stub_main_temp, stub_handler_temp = generate_jni_broadcast(broadcast, interface)
-                        jnis[interface.name] += jni_str_temp
-                        stub_main[interface.name] += stub_main_temp
-                        stub_handler[interface.name] += stub_handler_temp
-        if(package.typecollections):
-            for typecollection in package.typecollections.values():
-        #         interface_str, import_str = generate_aidl_interface_from_fidl_typecollection(typecollection, package_name)
-        #         interfaces[typecollection.name] = interface_str
-                jni_typecollection_str = generate_jni_typecollection(typecollection, jpackage_name)
-                jni_typecollection[typecollection.name] = jni_typecollection_str
-                imports.append(typecollection.name)
-        ## exception
-        # except (Exception) as e:
-        #     print("ERROR during code generation: {}".format(e))
-        #     continue
-    
-    for interface, interface_str in interfaces.items():
-        version_str = versions[interface]
-        src_str = ""
-        src_str += "// Auto-generated by FIDL-SRC Converter\n"
-        src_str += "// Filename: {}Client.cpp\n\n".format(interface)
-        src_str += "#include <iostream>\n#include <jni.h>\n#include <string.h>\n#include <CommonAPI/CommonAPI.hpp>\n#include \"v{}/{}{}Proxy.hpp\"\n\n".format(version_str,cpp_header,interface)
-        if(extends[interface] is not None):
-            src_str += "//extends interface {}\n\n".format(extends[interface],extends[interface]) #flattening
-        src_str += "#define LOGI(...) ((void)__android_log_print(ANDROID_LOG_INFO, LOG_TAG, __VA_ARGS__))\n#define LOGE(...) ((void)__android_log_print(ANDROID_LOG_ERROR, LOG_TAG, __VA_ARGS__))\n#include <android/log.h>\n#define LOG_TAG \"{}ClientCPP\"\n".format(interface)
-        src_str += "using namespace v{}{};\n\n".format(version_str,cpp_package)
-        
-        # 변수들
-        interface_cap = interface
-        interface_low = interface
-        interface_extension = "JNI"
-        #######
-        
-        class_code_template = f"""class {interface_cap}Client{{\n\tpublic:\n\t{interface_cap}Client(){{\n\t}};\n\tstd::shared_ptr<{interface_cap}Proxy<>> myProxy;\n\tvoid main(std::string pinstance, std::string pconnection);\n\tjclass {interface_cap}Clazz;\n\tjobject {interface_cap}Instance;"""
-        for item in imports:
-            class_code_template += "\n\tjclass {}Clazz;\n\t//jobject {}Instance".format(item, item)
-        class_code_template += f"""\n}};
-        \n"""
-        
-        src_str += class_code_template
+SRC_CLIENT_LOG_TEMPLATE = code_template("#define LOGI(...) ((void)__android_log_print(ANDROID_LOG_INFO, LOG_TAG, __VA_ARGS__))\n#define LOGE(...) ((void)__android_log_print(ANDROID_LOG_ERROR, LOG_TAG, __VA_ARGS__))\n#include <android/log.h>\n#define LOG_TAG \"{interface}ClientCPP\"\nusing namespace v{version}{cpp_package};\n\n")
 
-        src_str += "JavaVM *jvm;\nJNIEnv *jenv;\n"
-        javainit_code_template = """jobject {interface_cap}Instance = nullptr;"""
-        javainit_values = {
-            "interface_cap": capitalize_first_letter(interface)
-        }
-        #src_str += javainit_code_template.format(**javainit_values)
-        
-        #for item in imports:
-        #    src_str += "\njobject {}Instace = nullptr;".format(item)
-        
-        src_str += f"""\nJNIEXPORT jint JNICALL JNI_OnLoad(JavaVM* vm, void* reserved){{\n\tjvm = vm;\n\tif ((vm)->GetEnv((void**)&jenv, {jni_version}) != JNI_OK) {{\n\t\treturn JNI_ERR; //Failed to obtain JNIEnv\n\t}}\n\treturn {jni_version};\n}}"""
+SRC_CLIENT_CLASS_TEMPLATE = code_template("""class {interface_cap}Client{{\n\tpublic:\n\t{interface_cap}Client(){{\n\t}};\n\tstd::shared_ptr<{interface_cap}Proxy<>> myProxy;\n\tvoid main(std::string pinstance, std::string pconnection);\n\tjclass {interface_cap}Clazz;\n\tjobject {interface_cap}Instance;""")
 
+SRC_CLIENT_ONLOAD_TEMPLATE = code_template("""\nJNIEXPORT jint JNICALL JNI_OnLoad(JavaVM* vm, void* reserved){{\n\tjvm = vm;\n\tif ((vm)->GetEnv((void**)&jenv, {jni_version}) != JNI_OK) {{\n\t\treturn JNI_ERR; //Failed to obtain JNIEnv\n\t}}\n\treturn {jni_version};\n}}""")
 
-        start_code_template = f"""\n\tJNIEXPORT jlong JNICALL\n\tJava_{java_packages}{interface_cap}JNI_start(JNIEnv *env, jobject instance, jstring pinstance, jstring pconnection){{
+SRC_CLIENT_START_TEMPLATE = code_template("""\n\tJNIEXPORT jlong JNICALL\n\tJava_{java_packages}{interface_cap}JNI_start(JNIEnv *env, jobject instance, jstring pinstance, jstring pconnection){{
         {interface_cap}Client* _{interface_cap}Client = new {interface_cap}Client();
         const char* char_instance = env->GetStringUTFChars(pinstance,nullptr);
 		std::string _instance(char_instance);
@@ -5474,7 +7222,7 @@ def convert_to_src_client(packages, jni_version, jpackage_name, output_dir):
         _{interface_cap}Client->main(_instance, _connection);
         _{interface_cap}Client->{interface_cap}Clazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("{java_class}{interface_cap}{interface_extension}")));
         _{interface_cap}Client->{interface_cap}Instance = nullptr;
-        if(!(_{interface_cap}Client->myProxy->isAvailable())){{
+{conversions_init}        if(!(_{interface_cap}Client->myProxy->isAvailable())){{
             delete _{interface_cap}Client;
             _{interface_cap}Client = nullptr;
             return (jlong)0;
@@ -5482,14 +7230,11 @@ def convert_to_src_client(packages, jni_version, jpackage_name, output_dir):
         else{{
             return reinterpret_cast<jlong>(_{interface_cap}Client);
         }}
-    """
-    #### 여기서부터 계속 작업해야 함. 우선 global variable을 최대한 줄이기 위한 테스트들. -> 전부 줄였음. 02.28
-        for item in imports:
-            start_code_template += f"""_{interface_cap}Client->{capitalize_first_letter(item)}Clazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("{java_class}{capitalize_first_letter(item)}{interface_extension}")));"""
-        start_code_template += f"""}}\n"""
+    """)
 
+SRC_CLIENT_START_IMPORT_TEMPLATE = code_template("""_{interface_cap}Client->{item_cap}Clazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("{java_class}{item_cap}{interface_extension}")));""")
 
-        main_code_template = f"""\n\nvoid {interface_cap}Client::main(std::string pinstance, std::string pconnection){{\n\tstd::shared_ptr<CommonAPI::Runtime> runtime = CommonAPI::Runtime::get();\n\t
+SRC_CLIENT_MAIN_TEMPLATE = code_template("""\n\nvoid {interface_cap}Client::main(std::string pinstance, std::string pconnection){{\n\tstd::shared_ptr<CommonAPI::Runtime> runtime = CommonAPI::Runtime::get();\n\t
     std::string domain = \"local\";\n\t//std::string instance = \"{package_name}.{interface_cap}\";\n\tstd::string instance = pinstance;\n\tstd::string connection = pconnection;
     myProxy = runtime->buildProxy<{interface_cap}Proxy>(domain, instance,connection);
     int8_t break_cnt = 0;
@@ -5501,49 +7246,9 @@ def convert_to_src_client(packages, jni_version, jpackage_name, output_dir):
         break_cnt++;
     }}
 }}
-"""
-
-        src_str += main_code_template
-
-        # imports_set = set()
-        # if(extends.get(interface)):
-        #     for _import in imports.get(extends.get(interface)).split('\n'):
-        #         if(_import):
-        #             imports_set.add(_import)        
-        # for _import in imports.get(interface).split('\n'):
-        #     if(_import):
-        #         imports_set.add(_import)
-        # imports_set = list(imports_set)
-        # for _import in imports_set:
-        #     src_str += _import + "\n"
-        #src_str += "\ninterface {} {{ \n".format(interface)
-        #if(extends.get(interface)):
-        #    src_str += interfaces.get(extends.get(interface))
-        
-        interface_extend_str = interface_str
-        ## if interface extends 구현 측면에서 flattening 필요
-        if(extends[interface] is not None):
-            interface_extend_temp = interfaces[extends[interface]]
-            word_to_replace = capitalize_first_letter(extends[interface])
-            pattern = r'{}'.format(re.escape(word_to_replace))
-            replacement_word = capitalize_first_letter(interface)
-            interface_extend = re.sub(pattern, replacement_word, interface_extend_temp)
-            interface_extend_str += interface_extend
-        src_str += "extern \"C\"{"
-        src_str += interface_extend_str
-        src_str += start_code_template #.format(**start_values)
-        src_str += "}\n"
-
-        
+""")
 
-        f = open("{}/src/{}Client.cpp".format(output_dir,interface), "w")
-        f.write(src_str)
-        f.close()
-
-    #stub_str = ""
-    
-    for interface, stub_main_str in stub_main.items():
-        stub_str = f"""package {jpackage_name};\n
+STUB_SERVICE_TEMPLATE = code_template("""package {jpackage_name};\n
 import android.app.Service;
 import android.content.Intent;
 import android.os.IBinder;
@@ -5551,18 +7256,18 @@ import android.os.RemoteException;
 import android.util.Log;
 import java.util.ArrayList;
     
-public class {capitalize_first_letter(interface)}Service extends Service{{
-    public {capitalize_first_letter(interface)}Service(){{}}
-    private {capitalize_first_letter(interface)}JNI myProxy;
+public class {interface_cap}Service extends Service{{
+    public {interface_cap}Service(){{}}
+    private {interface_cap}JNI myProxy;
     public static int timeout = 1000; // Needs to be changed
     public static int sender = 5555; // Needs to be changed
     public static String connection = ""; // Needs to be changed
     public static String instance = ""; // Needs to be changed
-    private static final String TAG = "{capitalize_first_letter(interface)}Service";
+    private static final String TAG = "{interface_cap}Service";
     
     public boolean proxyGeneration(){{
         if(myProxy == null){{
-            myProxy = new {capitalize_first_letter(interface)}JNI(this, instance, connection);
+            myProxy = new {interface_cap}JNI(this, instance, connection);
         }}
         if(myProxy.proxyptr == 0){{
             Log.d(TAG, "Proxy Connection Failed!");
@@ -5578,7 +7283,7 @@ public class {capitalize_first_letter(interface)}Service extends Service{{
     @Override
     public void onCreate(){{
         super.onCreate();
-        myProxy = new {capitalize_first_letter(interface)}JNI(this, instance, connection);
+        myProxy = new {interface_cap}JNI(this, instance, connection);
         if(myProxy.proxyptr == 0){{
             Log.d(TAG, "Proxy Connection Failed!");
             myProxy = null;
@@ -5589,32 +7294,281 @@ public class {capitalize_first_letter(interface)}Service extends Service{{
     public IBinder onBind(Intent intent){{
         Log.d(TAG, "onBind");
         return binder;
-    }}"""
-        if(extends[interface] is not None):
-            stub_main_extend_temp = stub_main[extends[interface]]
-            word_to_replace = capitalize_first_letter(extends[interface])
-            pattern = r'{}'.format(re.escape(word_to_replace))
-            replacement_word = capitalize_first_letter(interface)
-            #stub_main_extend_temp.replace(word_to_replace, replacement_word)
-            stub_main_extend = re.sub(pattern, replacement_word, stub_main_extend_temp)
-            stub_main_str += stub_main_extend
-        stub_str += f"""
-    private final {capitalize_first_letter(interface)}.Stub binder = new {capitalize_first_letter(interface)}.Stub(){{{stub_main_str}
-    }};"""
-        stub_handler_str = stub_handler[interface]
+    }}""")
+
+STUB_SERVICE_BINDER_TEMPLATE = code_template("""
+    private final {interface_cap}.Stub binder = new {interface_cap}.Stub(){{{stub_main}
+    }};""")
+
+# 상속된 멤버의 SnippetTemplate, (base, java package) 마다 한 번 생성함
+inherited_templates = {}
+
+def clear_inherited_members():
+    for namespace, _ in inherited_templates.values():
+        renamed_namespaces.pop(namespace, None)
+    inherited_templates.clear()
+
+def generate_src_client_members(interface, package_name, java_package_name, typecollection, name=None):
+    """
+    C++ client, JNI class and Service stub texts of the members declared by one interface, broadcasts included.
+
+    :param name: Name of the interface the members are generated for, the
+        name of interface if None. The members of a base interface are
+        generated once, see inherited_members, and rendered with name.
+    :return: Tuple of the client, JNI, stub main and stub handler texts.
+    """
+    if(name is not None and name != interface.name):
+        names = {0: (lower_first_letter(name), capitalize_first_letter(name))}
+        return tuple(template.render(names) for template in inherited_members(interface, java_package_name))
+    interface_str, jni_attr_str, stub_main_str, stub_handler_str = generate_src_client_from_fidl_interface(interface, package_name, java_package_name, typecollection)
+    jni_str = CodeBuffer(jni_attr_str)
+    stub_main = CodeBuffer(stub_main_str)
+    stub_handler = CodeBuffer(stub_handler_str)
+    if(interface.broadcasts):
+        for broadcast in interface.broadcasts.values(): 
+            jni_str_temp, stub_main_temp, stub_handler_temp = generate_jni_broadcast(broadcast, interface)
+            jni_str += jni_str_temp
+            stub_main += stub_main_temp
+            stub_handler += stub_handler_temp
+    return interface_str, jni_str.getvalue(), stub_main.getvalue(), stub_handler.getvalue()
+
+def inherited_members(base, java_package_name):
+    """
+    Texts of the members declared by base as SnippetTemplates over the name
+        of the derived interface, generated once for all derived interfaces.
+
+    The emitters spell the client, JNI, Service, Handler and Callback names
+        from Namespace.name, so the members are generated on a copy of base
+        named INHERITED_NAME, see inherited_namespace. base itself is never
+        renamed. The shared conversion functions keep the real name, see
+        namespace_name.
+    """
+    key = (base, tuple(java_package_name))
+    entry = inherited_templates.get(key)
+    if(entry is None):
+        namespace = inherited_namespace(base)
+        renamed_namespaces[namespace] = base.name
+        package = base.package
+        texts = generate_src_client_members(namespace, package.name, java_package_name, package.typecollections)
+        entry = inherited_templates[key] = (namespace, tuple(SnippetTemplate(text, INHERITED_SLOT) for text in texts))
+    return entry[1]
+
+@profiled("interface")
+def generate_src_client_files_from_fidl_interface(interface, package_name, java_package_name, typecollection):
+    """
+    C++ client, JNI class and Service stub texts of one interface.
+
+    The client and the stub also get the members of every interface of the
+        extends chain, resolved on the AST. The JNI class has only the
+        members of interface, it extends the JNI class of the base.
+
+    :return: Tuple of the client, JNI, stub main and stub handler texts.
+    """
+    interface_str, jni_str, stub_main_str, stub_handler_str = generate_src_client_members(interface, package_name, java_package_name, typecollection)
+    ancestors = interface_ancestors(interface)
+    if(not ancestors):
+        return interface_str, jni_str, stub_main_str, stub_handler_str
+    interface_str = CodeBuffer(interface_str)
+    stub_main = CodeBuffer(stub_main_str)
+    stub_handler = CodeBuffer(stub_handler_str)
+    for base in ancestors:
+        base_str, _, base_main_str, base_handler_str = generate_src_client_members(base, base.package.name, java_package_name, base.package.typecollections, interface.name)
+        interface_str += base_str
+        stub_main += base_main_str
+        stub_handler += base_handler_str
+    return interface_str.getvalue(), jni_str, stub_main.getvalue(), stub_handler.getvalue()
+
+SrcClientOutputs = namedtuple("SrcClientOutputs", ["interfaces", "jnis", "stub_main", "stub_handler", "versions", "extends",
+                                                   "jni_typecollection", "imports", "package_name", "cpp_package", "cpp_header",
+                                                   "conversions", "conversion_includes"])
+
+def src_client_outputs(packages):
+    """
+    SrcClientOutputs without namespaces.
+
+    Every native client declares the classes of the type collections of
+        all packages, and uses the package name, C++ namespace and header
+        directory of the last package.
+    """
+    imports = list()
+    package_name = ""
+    # package_names = package_name.split(".")
+    # cpp_package = ""
+    # cpp_header = ""
+    # for name in package_names:
+    #     cpp_package += "::{}".format(name)
+    #     cpp_header += "{}/".format(name)
+    cpp_package = ""
+    cpp_header = ""
+    for package in packages.values():
+        package_name = package.name
+        package_names = package.name.split(".")
+        cpp_package = ""
+        cpp_header = ""
+        for name in package_names:
+            cpp_package += "::{}".format(name)
+            cpp_header += "{}/".format(name)
+        if(package.typecollections):
+            for typecollection in package.typecollections.values():
+                imports.append(typecollection.name)
+    return SrcClientOutputs(OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict(),
+                            OrderedDict(), imports, package_name, cpp_package, cpp_header,
+                            OrderedDict(), OrderedDict())
+
+def iter_src_client(packages, jpackage_name, job_results=None, jobs=1, selected=None):
+    """
+    Generate the JNI, C++ client and Service stub texts of all packages, one namespace at a time.
+
+    :param job_results: generate_src_client_files_from_fidl_interface results by (package, interface) name, generated here in jobs processes if None.
+    :param selected: Set of (package, namespace) names to generate, all if None.
+    :return: Iterator of SrcClientOutputs of one namespace each, see src_client_outputs.
+    """
+    java_package_name = jpackage_name.split(".")
+    empty = src_client_outputs(packages)
+
+    def namespace_outputs():
+        # 네임스페이스마다 새 OrderedDict, 나머지는 공유
+        return empty._replace(**dict((field, OrderedDict()) for field, value in zip(empty._fields, empty) if isinstance(value, OrderedDict)))
+
+    if(job_results is None):
+        job_keys = []
+        job_tasks = []
+        for package in packages.values():
+            for interface in package.interfaces.values():
+                if(selected is None or (package.name, interface.name) in selected):
+                    job_keys.append((package.name, interface.name))
+                    job_tasks.append((interface, package.name, java_package_name, package.typecollections))
+        job_results = InterfaceJobResults(generate_src_client_files_from_fidl_interface, job_keys, job_tasks, jobs)
+    progress = ProgressCounter("client", packages, selected)
+
+    for package in packages.values():
+        ## exception
+        # try:
+        if(package.interfaces):
+            for interface in package.interfaces.values():
+                # Unsupported data type filtering
+                # if(interface.maps):
+                #    raise Exception("Interface {}, Maps are not supported".format(interface.name))
+                
+                
+                if(selected is not None and (package.name, interface.name) not in selected):
+                    continue
+                outputs = namespace_outputs()
+                interface_str, jni_attr_str, stub_main_str, stub_handler_str = job_results[(package.name, interface.name)]
+                outputs.interfaces[interface.name] = interface_str
+                outputs.jnis[interface.name] = jni_attr_str
+                outputs.stub_main[interface.name] = stub_main_str
+                outputs.stub_handler[interface.name] = stub_handler_str
+                outputs.versions[interface.name] = interface.version.major
+                outputs.extends[interface.name] = interface.reference.name if interface.reference else None
+                outputs.conversion_includes[interface.name] = conversion_namespaces(interface)
+                header = generate_conversion_header(interface, java_package_name)
+                if(header is not None):
+                    outputs.conversions[interface.name] = header
+                progress(interface)
+                yield outputs
+        if(package.typecollections):
+            for typecollection in package.typecollections.values():
+        #         interface_str, import_str = generate_aidl_interface_from_fidl_typecollection(typecollection, package_name)
+        #         interfaces[typecollection.name] = interface_str
+                if(selected is not None and (package.name, typecollection.name) not in selected):
+                    continue
+                outputs = namespace_outputs()
+                jni_typecollection_str = generate_jni_typecollection(typecollection, jpackage_name)
+                outputs.jni_typecollection[typecollection.name] = jni_typecollection_str
+                header = generate_conversion_header(typecollection, java_package_name)
+                if(header is not None):
+                    outputs.conversions[typecollection.name] = header
+                progress(typecollection)
+                yield outputs
+        ## exception
+        # except (Exception) as e:
+        #     print("ERROR during code generation: {}".format(e))
+        #     continue
+
+def collect_src_client(packages, jpackage_name, job_results=None, jobs=1, selected=None):
+    """
+    Generate the JNI, C++ client and Service stub texts of all packages.
+
+    :param job_results: generate_src_client_files_from_fidl_interface results by (package, interface) name, generated here if None.
+    :param selected: Set of (package, namespace) names to generate, all if None.
+    :return: SrcClientOutputs, see src_client_outputs.
+    """
+    collected = src_client_outputs(packages)
+    for outputs in iter_src_client(packages, jpackage_name, job_results, jobs, selected):
+        for target, output in zip(collected, outputs):
+            if(isinstance(target, OrderedDict)):
+                target.update(output)
+    return collected
+
+def write_src_client(outputs, jni_version, jpackage_name, output_dir, output=write_output_file):
+    interfaces, jnis, stub_main, stub_handler, versions, extends = outputs[:6]
+    jni_typecollection, imports, package_name, cpp_package, cpp_header = outputs[6:11]
+    java_package_name = jpackage_name.split(".")
+    java_packages = ""
+    java_class = ""
+    for name in java_package_name:
+        java_packages += "{}_".format(name)
+        java_class += "{}/".format(name)
+
+    for interface, interface_str in interfaces.items():
+        version_str = versions[interface]
+        src_str = CodeBuffer()
+        includes = outputs.conversion_includes[interface]
+        SRC_CLIENT_HEADER_TEMPLATE.render_to(src_str, {"interface": interface, "version": version_str, "cpp_header": cpp_header,
+                                                       "conversion_includes": "".join("#include \"{}Conversions.hpp\"\n".format(name) for name in includes)})
         if(extends[interface] is not None):
-            stub_handler_extend_temp = stub_handler[extends[interface]]
-            word_to_replace = capitalize_first_letter(extends[interface])
-            pattern = r'{}'.format(re.escape(word_to_replace))
-            replacement_word = capitalize_first_letter(interface)
-            stub_handler_extend = re.sub(pattern,replacement_word,stub_handler_extend_temp)
-            stub_handler_str += stub_handler_extend
-        stub_str += stub_handler_str
-        stub_str += f"""
-}}"""
-        f = open("{}/stub/{}.java".format(output_dir,capitalize_first_letter(interface)+"Service"), "w")
-        f.write(stub_str)
-        f.close()
+            src_str += "//extends interface {}\n\n".format(extends[interface],extends[interface]) #flattening
+        SRC_CLIENT_LOG_TEMPLATE.render_to(src_str, {"interface": interface, "version": version_str, "cpp_package": cpp_package})
+        
+        # 변수들
+        interface_cap = interface
+        interface_low = interface
+        interface_extension = "JNI"
+        #######
+        
+        SRC_CLIENT_CLASS_TEMPLATE.render_to(src_str, {"interface_cap": interface_cap})
+        for item in imports:
+            src_str += "\n\tjclass {}Clazz;\n\t//jobject {}Instance".format(item, item)
+        src_str += "\n};\n        \n"
+
+        src_str += "JavaVM *jvm;\nJNIEnv *jenv;\n"
+        SRC_CLIENT_ONLOAD_TEMPLATE.render_to(src_str, {"jni_version": jni_version})
+
+        #### 여기서부터 계속 작업해야 함. 우선 global variable을 최대한 줄이기 위한 테스트들. -> 전부 줄였음. 02.28
+        start_code = CodeBuffer()
+        start_values = {
+            "interface_cap": interface_cap,
+            "interface_extension": interface_extension,
+            "java_packages": java_packages,
+            "java_class": java_class,
+            "conversions_init": "".join("        {}ConversionsInit(env);\n".format(name) for name in includes),
+        }
+        SRC_CLIENT_START_TEMPLATE.render_to(start_code, start_values)
+        for item in imports:
+            start_values["item_cap"] = capitalize_first_letter(item)
+            SRC_CLIENT_START_IMPORT_TEMPLATE.render_to(start_code, start_values)
+        start_code += "}\n"
+
+        SRC_CLIENT_MAIN_TEMPLATE.render_to(src_str, {"interface_cap": interface_cap, "package_name": package_name})
+
+        src_str += "extern \"C\"{"
+        src_str += interface_str
+        src_str += start_code.getvalue()
+        src_str += "}\n"
+
+        output("{}/src/{}Client.cpp".format(output_dir,interface), src_str)
+
+    #stub_str = ""
+    
+    for interface, stub_main_str in stub_main.items():
+        interface_cap = capitalize_first_letter(interface)
+        stub_str = CodeBuffer()
+        STUB_SERVICE_TEMPLATE.render_to(stub_str, {"jpackage_name": jpackage_name, "interface_cap": interface_cap})
+        STUB_SERVICE_BINDER_TEMPLATE.render_to(stub_str, {"interface_cap": interface_cap, "stub_main": stub_main_str})
+        stub_str += stub_handler[interface]
+        stub_str += "\n}"
+        output("{}/stub/{}.java".format(output_dir,capitalize_first_letter(interface)+"Service"), stub_str)
         
         # f = open("outputs/stub/{}.java".format(capitalize_first_letter(interface)+"Service"), "w")
         # f.write(stub_str)
@@ -5622,7 +7576,7 @@ public class {capitalize_first_letter(interface)}Service extends Service{{
 
 
     for interface, interface_str in jnis.items():
-        jni_str = "package {};\n\n".format(jpackage_name)
+        jni_str = CodeBuffer("package {};\n\n".format(jpackage_name))
         if(extends[interface] is not None):
             jni_str += "public class {}JNI extends {}JNI{{\n".format(capitalize_first_letter(interface), capitalize_first_letter(extends[interface]))
         else:
@@ -5633,92 +7587,270 @@ public class {capitalize_first_letter(interface)}Service extends Service{{
         jni_str += interface_str
         jni_str += "\n\t{}JNI({}Service service, String instance, String connection){{\n\t\tthis.proxyptr = start(instance, connection);\n\t\tthis.service = service;\n\t}}\n".format(interface,interface)
         jni_str += "\n}"
-        f = open("{}/src/{}.java".format(output_dir,interface+"JNI"), "w")
-        f.write(jni_str)
-        f.close()
+        output("{}/src/{}.java".format(output_dir,interface+"JNI"), jni_str)
 
     for typecollection, typecollection_str in jni_typecollection.items():
-        jni_str = ""
-        jni_str += typecollection_str
-        f = open("{}/src/{}.java".format(output_dir, typecollection+"JNI"), "w")
-        f.write(jni_str)
-        f.close()
-
-######################################### Argument parser ####################################################################
-
-def parse_command_line():
-    parser = argparse.ArgumentParser(
-        description="Behavioral cloning model trainer.")
-    parser.add_argument(
-        "-C", "--CLI",dest="cli", action="store_true", help="Use this option to run the tool as CLI"
-    )
-    parser.add_argument(
-        "-V", "--jni_version", dest="jniversion", action="store", help="Version of the JNI.", required=False
-    )
-    parser.add_argument(
-        "-J", "--packagejava", dest="packagejava", action = "store", help="Package name of Java", required=False
-    )
-    parser.add_argument(
-        "-O", "--output", dest="output_dir", action="store", help="Output directory.", required=False, default='outputs'
-    )
-    # parser.add_argument(
-    #     "fidl", nargs="+",
-    #     help="Input FIDL file.")
-    
-    if not parser.parse_known_args()[0].cli:
-        parser.add_argument(
-            "fidl", nargs="*", help="Input FIDL file."
-        )
+        output("{}/src/{}.java".format(output_dir, typecollection+"JNI"), typecollection_str)
+
+    for namespace, header_str in outputs.conversions.items():
+        output("{}/src/{}Conversions.hpp".format(output_dir, namespace), header_str)
+
+def convert_to_src_client(packages, jni_version, jpackage_name, output_dir, jobs=1, manifest=None, output=write_output_file, stream=False):
+    # 증분 생성: manifest가 있으면 바뀐 인터페이스/타입 컬렉션만 생성
+    # stream: 인터페이스마다 생성되는 대로 써서 전체 출력을 메모리에 모으지 않음
+    selected = None
+    if(manifest is not None):
+        selected = select_units(packages, manifest, {"src": generator_context(packages, "src", jni_version, jpackage_name)})
+        own_src_outputs(manifest, packages, selected)
+        output = manifest.output
+    if(stream):
+        for outputs in iter_src_client(packages, jpackage_name, jobs=jobs, selected=selected):
+            write_src_client(outputs, jni_version, jpackage_name, output_dir, output)
     else:
-        parser.add_argument(
-            "fidl", nargs="+", help="Input FIDL file."
-        )
-    
-    parser.add_argument(
-        "-I", "--import", dest="import_dirs", metavar="import_dir",
-        action="append", help="Model import directories.")
-    
-    args = parser.parse_args()
-    
-    if args.cli and not args.jniversion :
-        parser.error("--jni_version is required if -C or --CLI is given")
-    if args.cli and not args.packagejava :
-        parser.error("--packagejava is required if -C or --CLI is given")
-        
-    return args
-    
+        write_src_client(collect_src_client(packages, jpackage_name, jobs=jobs, selected=selected), jni_version, jpackage_name, output_dir, output)
+    if(manifest is not None):
+        manifest.save()
+
+############################### AIDL + native client ###############################
+
+def generate_interface_files_job(interface, aidl_package_name, package_name, java_package_name, typecollection):
+    """
+    AIDL and native client texts of one interface, for run_interface_jobs,
+        so that one process pool generates both.
+
+    The emitters run one after the other and share only what annotate_types
+        computed before the pool was forked.
+
+    :return: generate_aidl_files_job result and the
+        generate_src_client_files_from_fidl_interface result, or its exception.
+    """
+    aidl_result = generate_aidl_files_job(interface, aidl_package_name)
+    try:
+        src_result = generate_src_client_files_from_fidl_interface(interface, package_name, java_package_name, typecollection)
+    except (Exception) as e:
+        src_result = e
+    return aidl_result, src_result
+
+def convert_to_aidl_and_src_client(packages, jni_version, jpackage_name, output_dir, jobs=1, manifest=None, output=write_output_file, stream=False):
+    """
+    convert_to_aidl and convert_to_src_client with one process pool, see
+        generate_interface_files_job. The generation time is about the sum of
+        the two, only the second pool start is saved.
+
+    The output is the same as of the two functions one after the other: the
+        AIDL files are written first, then an error of the native client
+        generation is raised. With stream the two functions run one after
+        the other, each writing the files of an interface as soon as they
+        are generated.
+    """
+    if(stream):
+        convert_to_aidl(packages, jpackage_name, output_dir, jobs, manifest, output, stream=True)
+        convert_to_src_client(packages, jni_version, jpackage_name, output_dir, jobs, manifest, output, stream=True)
+        return
+    selected = None
+    if(manifest is not None):
+        selected = select_units(packages, manifest, {"aidl": generator_context(packages, "aidl", jpackage_name),
+                                                     "src": generator_context(packages, "src", jni_version, jpackage_name)})
+        output = manifest.output
+    job_keys = []
+    job_tasks = []
+    for package in packages.values():
+        for interface in package.interfaces.values():
+            if(selected is None or (package.name, interface.name) in selected):
+                job_keys.append((package.name, interface.name))
+                job_tasks.append((interface, jpackage_name, package.name, jpackage_name.split("."), package.typecollections))
+    job_results = dict(zip(job_keys, run_interface_jobs(generate_interface_files_job, job_tasks, jobs)))
+
+    aidl_results = dict((key, result[0]) for key, result in job_results.items())
+    if(manifest is not None):
+        own_aidl_outputs(manifest, packages, aidl_results, selected)
+    write_aidl(collect_aidl(packages, jpackage_name, aidl_results, selected), jpackage_name, output_dir, output)
+
+    src_results = dict((key, result[1]) for key, result in job_results.items())
+    for src_result in src_results.values():
+        if(isinstance(src_result, Exception)):
+            raise src_result
+    if(manifest is not None):
+        own_src_outputs(manifest, packages, selected)
+    write_src_client(collect_src_client(packages, jpackage_name, src_results, selected=selected), jni_version, jpackage_name, output_dir, output)
+    if(manifest is not None):
+        manifest.save()
+
+############################### Virtual output ###############################
+# 빌드 시스템에 내장할 때 파일을 쓰지 않고 경로 -> 내용으로 돌려주거나 호출자의 sink로 넘김
+
+class VirtualOutput(object):
+    """
+    Output of the converters kept in memory instead of written.
+
+    Pass it as output to convert_to_aidl, convert_to_src_client or
+        convert_to_aidl_and_src_client. Paths are relative to output_dir,
+        with "/" separators, e.g. "src/SensorClient.cpp".
+
+    :param sink: Called with (path, text) for every file as it is generated.
+        The files are not kept then. generate_aidl_files and the like
+        stream with a sink, so the files of an interface are passed on
+        before the next interface is generated.
+    """
+
+    def __init__(self, output_dir=".", sink=None):
+        self.output_dir = output_dir
+        self.sink = sink
+        self.files = OrderedDict()
+
+    def __call__(self, path, text):
+        if(isinstance(text, CodeBuffer)):
+            text = text.getvalue()
+        relative = os.path.relpath(path, self.output_dir).replace(os.sep, "/")
+        if(self.sink is not None):
+            self.sink(relative, text)
+        else:
+            self.files[relative] = text
+        return True
+
+    def write(self, output_dir):
+        """
+        Write the kept files under output_dir, only those whose content changed.
+
+        :return: Relative paths of the written files.
+        """
+        return [path for path, text in self.files.items() if write_output_file(os.path.join(output_dir, path), text)]
+
+def generate_aidl_files(packages, package_name, jobs=1, sink=None):
+    """
+    convert_to_aidl without touching disk.
+
+    :return: OrderedDict of the AIDL texts by path, e.g. "aidl/Sensor.aidl", empty with sink.
+    """
+    output = VirtualOutput(sink=sink)
+    convert_to_aidl(packages, package_name, output.output_dir, jobs=jobs, output=output, stream=sink is not None)
+    return output.files
+
+def generate_src_client_files(packages, jni_version, jpackage_name, jobs=1, sink=None):
+    """
+    convert_to_src_client without touching disk.
+
+    :return: OrderedDict of the native client, JNI, Service stub and
+        conversion header texts by path, empty with sink.
+    """
+    output = VirtualOutput(sink=sink)
+    convert_to_src_client(packages, jni_version, jpackage_name, output.output_dir, jobs=jobs, output=output, stream=sink is not None)
+    return output.files
+
+def generate_aidl_and_src_client_files(packages, jni_version, jpackage_name, jobs=1, sink=None):
+    """
+    convert_to_aidl_and_src_client without touching disk.
+
+    :return: OrderedDict of all texts by path, empty with sink.
+    """
+    output = VirtualOutput(sink=sink)
+    convert_to_aidl_and_src_client(packages, jni_version, jpackage_name, output.output_dir, jobs=jobs, output=output, stream=sink is not None)
+    return output.files
+
 ############################################ Main ####################################################################################    
     
-def main(args, option=2):
-    
-    # If for CLI
-    processor = Processor()
-    if args.import_dirs:
+def create_processor(args, parser=None):
+    """
+    Processor with the parser and import options of args.
+
+    :param parser: Parser of the processor, see Processor, one of the engine of args if None.
+    """
+    processor = Processor(lazy=getattr(args, "lazy", False), comments=getattr(args, "comments", "parse"), engine=getattr(args, "engine", "ply"), parser=parser)
+    if getattr(args, "import_dirs", None):
         processor.package_paths.extend(args.import_dirs)
-    for fidl in args.fidl:
-        try:
-            processor.import_file(fidl)
-        except (LexerException, ParserException, ProcessorException) as e:
-            print("ERROR: {}".format(e))
-            continue
-        
-    dump_packages(processor.packages)
-    jni_list = ['JNI_VERSION_1_1','JNI_VERSION_1_2','JNI_VERSION_1_4','JNI_VERSION_1_6','JNI_VERSION_1_8','JNI_VERSION_9','JNI_VERSION_10','JNI_VERSION_19','JNI_VERSION_20','JNI_VERSION_21']
+    return processor
+
+def element_references(item):
+    # Type references of a typed element, the elements of implicit arrays followed
+    while(isinstance(item, ast.Array) and item.name is None):
+        item = item.type
+    if(isinstance(item, ast.Reference)):
+        yield item
+
+def namespace_references(namespace):
+    for typedef in namespace.typedefs.values():
+        yield from element_references(typedef.type)
+    for struct in namespace.structs.values():
+        for field in struct.fields.values():
+            yield from element_references(field.type)
+    for array in namespace.arrays.values():
+        yield from element_references(array.type)
+    for map in namespace.maps.values():
+        yield from element_references(map.key_type)
+        yield from element_references(map.value_type)
+    for constant in namespace.constants.values():
+        yield from element_references(constant.type)
+    if(isinstance(namespace, ast.Interface)):
+        for attribute in namespace.attributes.values():
+            yield from element_references(attribute.type)
+        for method in namespace.methods.values():
+            for arg in list(method.in_args.values()) + list(method.out_args.values()):
+                yield from element_references(arg.type)
+            if(isinstance(method.errors, ast.Reference)):
+                yield method.errors
+        for broadcast in namespace.broadcasts.values():
+            for arg in broadcast.out_args.values():
+                yield from element_references(arg.type)
+
+def resolve_lazy_references(processor):
+    """
+    Resolve every type reference of a lazy (-L) processor before the
+        generation, an unresolved one would otherwise raise in the middle of
+        an emitter. Unresolved references stay None as in the eager mode.
+
+    :raise ProcessorException: With the errors of all unresolved references,
+        as Processor.import_files.
+    """
+    if not processor.lazy:
+        return
+    errors = []
+    for package in processor.packages.values():
+        for namespace in list(package.typecollections.values()) + list(package.interfaces.values()):
+            for reference in namespace_references(namespace):
+                try:
+                    reference.reference
+                except (ProcessorException) as e:
+                    reference.reference = None
+                    errors.append(e)
+    if errors:
+        raise ProcessorException("\n".join(str(error) for error in errors), errors)
+
+def generate(packages, args, option=2):
+    """
+    Generate the outputs of the parsed packages with the options of args.
+
+    :param option: 0 for the AIDL, 1 for the native client, 2 for both.
+    :return: False if the options are invalid, True otherwise.
+    """
+    annotate_types(packages)
 
     jni_version = args.jniversion
-    if jni_version not in jni_list:
+    if jni_version not in JNI_VERSIONS:
         print("ERROR: There is no matching JNI version!")
-        return 0
-    if(option == 0):
-        convert_to_aidl(processor.packages, args.packagejava, args.output_dir)
-    elif(option == 1):
-        convert_to_src_client(processor.packages, jni_version, args.packagejava, args.output_dir)
-    elif(option == 2):
-        convert_to_aidl(processor.packages, args.packagejava, args.output_dir)
-        convert_to_src_client(processor.packages, jni_version, args.packagejava, args.output_dir)
-    
+        return False
+    jobs = getattr(args, "jobs", 1)
+    stream = getattr(args, "stream", False)
+    manifest = GenerationManifest(args.output_dir) if getattr(args, "incremental", False) else None
+    profile_file = getattr(args, "profile", None)
+    if(profile_file):
+        start_profile()
+    try:
+        if(option == 0):
+            convert_to_aidl(packages, args.packagejava, args.output_dir, jobs=jobs, manifest=manifest, stream=stream)
+        elif(option == 1):
+            convert_to_src_client(packages, jni_version, args.packagejava, args.output_dir, jobs=jobs, manifest=manifest, stream=stream)
+        elif(option == 2):
+            convert_to_aidl_and_src_client(packages, jni_version, args.packagejava, args.output_dir, jobs=jobs, manifest=manifest, stream=stream)
+    finally:
+        profile = stop_profile() if profile_file else None
+    if(profile is not None):
+        with open(profile_file, "w", encoding="utf-8") as f:
+            json.dump(profile.to_dict(), f, indent=1)
+        print(profile.summary(getattr(args, "profile_top", 10)))
+        print("Profile written to {}".format(profile_file))
+    return True
 
 if __name__ == "__main__":
-    args = parse_command_line()
-    args.jniversion = "JNI_VERSION_"+args.jniversion
-    main(args)
+    # 명령줄은 sdvgen_cli.py fidl과 같음, 예전의 -C는 무시함
+    import sdvgen_cli
+    sys.exit(sdvgen_cli.main(["fidl"] + [arg for arg in sys.argv[1:] if arg not in ("-C", "--CLI")]))
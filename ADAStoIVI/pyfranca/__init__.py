@@ -4,6 +4,7 @@ Pyfranca package.
 
 from pyfranca.franca_lexer import LexerException, Lexer
 from pyfranca.franca_parser import ParserException, Parser
+from pyfranca.franca_fastparser import FastLexer, FastParser
 from pyfranca.franca_processor import ProcessorException, Processor
 
 
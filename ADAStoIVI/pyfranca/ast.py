@@ -3,7 +3,14 @@ Franca abstract syntax tree representation.
 """
 
 from abc import ABCMeta
-from collections import OrderedDict
+from types import MappingProxyType
+
+
+# Shared read-only defaults for nodes without comments, flags or arguments.
+#   Most nodes have none, so they all point at the same empty objects instead
+#   of carrying their own containers.
+EMPTY_MAPPING = MappingProxyType({})
+EMPTY_FLAGS = ()
 
 
 class ASTException(Exception):
@@ -21,6 +28,9 @@ class Package(object):
     AST representation of a Franca package.
     """
 
+    __slots__ = ("name", "files", "imports", "interfaces", "typecollections",
+                 "comments")
+
     def __init__(self, name, file_name=None, imports=None,
                  interfaces=None, typecollections=None, comments=None):
         """
@@ -29,10 +39,9 @@ class Package(object):
         self.name = name
         self.files = [file_name] if file_name else []
         self.imports = imports if imports else []
-        self.interfaces = interfaces if interfaces else OrderedDict()
-        self.typecollections = typecollections if typecollections else \
-            OrderedDict()
-        self.comments = comments if comments else OrderedDict()
+        self.interfaces = interfaces if interfaces else {}
+        self.typecollections = typecollections if typecollections else {}
+        self.comments = comments if comments else EMPTY_MAPPING
 
         for item in self.interfaces.values():
             item.package = self
@@ -81,6 +90,9 @@ class Package(object):
 
 class Import(object):
 
+    __slots__ = ("file", "namespace", "package_reference",
+                 "namespace_reference")
+
     def __init__(self, file_name, namespace=None):
         self.file = file_name
         self.namespace = namespace          # None for "import model"
@@ -91,18 +103,22 @@ class Namespace(object):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = ("package", "name", "flags", "version", "typedefs",
+                 "enumerations", "structs", "arrays", "maps", "constants",
+                 "comments")
+
     def __init__(self, name, flags=None, members=None, comments=None):
         self.package = None
         self.name = name
-        self.flags = flags if flags else []         # Unused
+        self.flags = flags if flags else EMPTY_FLAGS    # Unused
         self.version = None
-        self.typedefs = OrderedDict()
-        self.enumerations = OrderedDict()
-        self.structs = OrderedDict()
-        self.arrays = OrderedDict()
-        self.maps = OrderedDict()
-        self.constants = OrderedDict()
-        self.comments = comments if comments else OrderedDict()
+        self.typedefs = {}
+        self.enumerations = {}
+        self.structs = {}
+        self.arrays = {}
+        self.maps = {}
+        self.constants = {}
+        self.comments = comments if comments else EMPTY_MAPPING
         if members:
             for member in members:
                 self._add_member(member)
@@ -183,6 +199,8 @@ class Namespace(object):
 
 class TypeCollection(Namespace):
 
+    __slots__ = ()
+
     def __init__(self, name, flags=None, members=None, comments=None):
         super(TypeCollection, self).__init__(name, flags=flags,
                                              members=members, comments=comments)
@@ -192,101 +210,135 @@ class Type(object):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = ("namespace", "name", "comments")
+
     def __init__(self, name=None, comments=None):
         self.namespace = None
         self.name = name if name else self.__class__.__name__
-        self.comments = comments if comments else OrderedDict()
+        self.comments = comments if comments else EMPTY_MAPPING
 
 
 class Typedef(Type):
 
+    __slots__ = ("type", "descriptor")
+
     def __init__(self, name, base_type, comments=None):
         super(Typedef, self).__init__(name, comments)
         self.type = base_type
+        # Type descriptor attached by code generators.
+        self.descriptor = None
 
 
 class PrimitiveType(Type):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = ()
+
     def __init__(self):
         super(PrimitiveType, self).__init__()
 
 
 class Int8(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(Int8, self).__init__()
 
 
 class Int16(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(Int16, self).__init__()
 
 
 class Int32(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(Int32, self).__init__()
 
 
 class Int64(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(Int64, self).__init__()
 
 
 class UInt8(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(UInt8, self).__init__()
 
 
 class UInt16(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(UInt16, self).__init__()
 
 
 class UInt32(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(UInt32, self).__init__()
 
 
 class UInt64(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(UInt64, self).__init__()
 
 
 class Boolean(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(Boolean, self).__init__()
 
 
 class Float(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(Float, self).__init__()
 
 
 class Double(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(Double, self).__init__()
 
 
 class String(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(String, self).__init__()
 
 
 class ByteBuffer(PrimitiveType):
 
+    __slots__ = ()
+
     def __init__(self):
         super(ByteBuffer, self).__init__()
     
@@ -300,6 +352,8 @@ class ComplexType(Type):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = ()
+
     def __init__(self, comments=None):
         super(ComplexType, self).__init__(comments=comments)
 
@@ -308,6 +362,8 @@ class Value(Type):
 
     _metaclass__ = ABCMeta
 
+    __slots__ = ("value",)
+
     def __init__(self, value, value_type=None):
         super(Value, self).__init__(value_type if value_type else self.__class__.__name__)
         self.value = value
@@ -319,6 +375,8 @@ class IntegerValue(Value):
     DECIMAL = 10
     HEXADECIMAL = 16
 
+    __slots__ = ("base",)
+
     def __init__(self, value, base=DECIMAL):
         super(IntegerValue, self).__init__(value)
         self.base = base
@@ -326,76 +384,98 @@ class IntegerValue(Value):
 
 class BooleanValue(Value):
 
+    __slots__ = ()
+
     def __init__(self, value):
         super(BooleanValue, self).__init__(value)
 
 
 class FloatValue(Value):
 
+    __slots__ = ()
+
     def __init__(self, value):
         super(FloatValue, self).__init__(value)
 
 
 class DoubleValue(Value):
 
+    __slots__ = ()
+
     def __init__(self, value):
         super(DoubleValue, self).__init__(value)
 
 
 class StringValue(Value):
 
+    __slots__ = ()
+
     def __init__(self, value):
         super(StringValue, self).__init__(value)
 
 
 class Enumeration(ComplexType):
 
+    __slots__ = ("enumerators", "extends", "reference", "flags")
+
     def __init__(self, name, enumerators=None, extends=None, flags=None, comments=None):
         super(Enumeration, self).__init__(comments=comments)
         self.name = name
-        self.enumerators = enumerators if enumerators else OrderedDict()
+        self.enumerators = enumerators if enumerators else EMPTY_MAPPING
         self.extends = extends
         self.reference = None
-        self.flags = flags if flags else []         # Unused
+        self.flags = flags if flags else EMPTY_FLAGS    # Unused
 
 
 class Enumerator(object):
 
+    __slots__ = ("name", "value", "comments")
+
     def __init__(self, name, value=None, comments=None):
         self.name = name
         self.value = value
-        self.comments = comments if comments else OrderedDict()
+        self.comments = comments if comments else EMPTY_MAPPING
 
 
 class Struct(ComplexType):
 
+    __slots__ = ("fields", "extends", "reference", "flags")
+
     def __init__(self, name, fields=None, extends=None, flags=None, comments=None):
         super(Struct, self).__init__(comments=comments)
         self.name = name
-        self.fields = fields if fields else OrderedDict()
+        self.fields = fields if fields else EMPTY_MAPPING
         self.extends = extends
         self.reference = None
-        self.flags = flags if flags else []
+        self.flags = flags if flags else EMPTY_FLAGS
 
 
 class StructField(object):
 
+    __slots__ = ("name", "type", "comments", "descriptor")
+
     def __init__(self, name, field_type, comments=None):
         self.name = name
         self.type = field_type
-        self.comments = comments if comments else OrderedDict()
+        self.comments = comments if comments else EMPTY_MAPPING
+        self.descriptor = None
 
 
 class Array(ComplexType):
 
+    __slots__ = ("type", "descriptor")
+
     def __init__(self, name, element_type, comments=None):
         super(Array, self).__init__(comments=comments)
         self.name = name            # None for implicit arrays.
         self.type = element_type
+        self.descriptor = None
 
 
 class Map(ComplexType):
 
+    __slots__ = ("key_type", "value_type")
+
     def __init__(self, name, key_type, value_type, comments=None):
         super(Map, self).__init__(comments=comments)
         self.name = name
@@ -405,28 +485,65 @@ class Map(ComplexType):
 
 class Constant(ComplexType):
 
+    __slots__ = ("type", "value", "descriptor")
+
     def __init__(self, name, element_type, element_value, comments=None):
         super(Constant, self).__init__(comments=comments)
         self.name = name
         self.type = element_type
         self.value = element_value
+        self.descriptor = None
 
 
 class Reference(Type):
 
+    __slots__ = ("_reference", "_resolver")
+
     def __init__(self, name):
         super(Reference, self).__init__()
         self.name = name
-        self.reference = None
+        self._reference = None
+        self._resolver = None
+
+    @property
+    def reference(self):
+        """
+        Dereferenced ast.Type object.
+
+        A reference bound with bind() is resolved on first access.
+        """
+        if self._reference is None and self._resolver is not None:
+            self._reference = self._resolver(self.namespace, self.name)
+            self._resolver = None
+        return self._reference
+
+    @reference.setter
+    def reference(self, value):
+        self._reference = value
+        self._resolver = None
+
+    def bind(self, resolver):
+        """
+        Defer resolution of the reference until it is first accessed.
+
+        A reference resolved before is dropped.
+
+        :param resolver: Callable taking the context ast.Namespace and the
+            referenced name, returning the dereferenced ast.Type object.
+        """
+        self._reference = None
+        self._resolver = resolver
 
 
 class Interface(Namespace):
 
+    __slots__ = ("attributes", "methods", "broadcasts", "extends", "reference")
+
     def __init__(self, name, flags=None, members=None, extends=None, comments=None):
         super(Interface, self).__init__(name=name, flags=flags, members=None, comments=comments)
-        self.attributes = OrderedDict()
-        self.methods = OrderedDict()
-        self.broadcasts = OrderedDict()
+        self.attributes = {}
+        self.methods = {}
+        self.broadcasts = {}
         self.extends = extends
         self.reference = None
         if members:
@@ -491,6 +608,8 @@ class Interface(Namespace):
 
 class Version(object):
 
+    __slots__ = ("major", "minor")
+
     def __init__(self, major, minor):
         self.major = major
         self.minor = minor
@@ -501,35 +620,46 @@ class Version(object):
 
 class Attribute(Type):
 
+    __slots__ = ("type", "flags", "descriptor")
+
     def __init__(self, name, attr_type, flags=None, comments=None):
         super(Attribute, self).__init__(name, comments)
         self.type = attr_type
-        self.flags = flags if flags else []
+        self.flags = flags if flags else EMPTY_FLAGS
+        self.descriptor = None
 
 
 class Method(Type):
 
+    __slots__ = ("flags", "in_args", "out_args", "errors")
+
     def __init__(self, name, flags=None,
                  in_args=None, out_args=None, errors=None, comments=None):
         super(Method, self).__init__(name, comments)
-        self.flags = flags if flags else []
-        self.in_args = in_args if in_args else OrderedDict()
-        self.out_args = out_args if out_args else OrderedDict()
-        # Errors can be an OrderedDict() or a Reference to an enumeration.
-        self.errors = errors if errors else OrderedDict()
+        self.flags = flags if flags else EMPTY_FLAGS
+        self.in_args = in_args if in_args else EMPTY_MAPPING
+        self.out_args = out_args if out_args else EMPTY_MAPPING
+        # Errors can be a mapping of enumerators or a Reference to an
+        #   enumeration.
+        self.errors = errors if errors else EMPTY_MAPPING
 
 
 class Broadcast(Type):
 
+    __slots__ = ("flags", "out_args")
+
     def __init__(self, name, flags=None, out_args=None, comments=None):
         super(Broadcast, self).__init__(name, comments)
-        self.flags = flags if flags else []
-        self.out_args = out_args if out_args else OrderedDict()
+        self.flags = flags if flags else EMPTY_FLAGS
+        self.out_args = out_args if out_args else EMPTY_MAPPING
 
 
 class Argument(object):
 
+    __slots__ = ("name", "type", "comments", "descriptor")
+
     def __init__(self, name, arg_type, comments=None):
         self.name = name
         self.type = arg_type
-        self.comments = comments if comments else OrderedDict()
+        self.comments = comments if comments else EMPTY_MAPPING
+        self.descriptor = None
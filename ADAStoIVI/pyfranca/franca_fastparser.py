@@ -0,0 +1,619 @@
+"""
+Franca fast-path lexer and parser.
+
+A hand-written alternative to the PLY based franca_lexer and franca_parser
+modules. It accepts the same language and builds the same AST.
+"""
+
+import re
+from pyfranca import franca_lexer
+from pyfranca import franca_parser
+from pyfranca import ast
+from pyfranca.franca_lexer import LexerException
+from pyfranca.franca_parser import ParserException, InArgumentGroup, \
+    OutArgumentGroup, ErrorArgumentGroup
+
+
+# Pseudo token types.
+END = "$end"
+ERROR = "$error"
+
+
+class FastLexer(object):
+    """
+    Franca IDL lexer based on a single compiled master regular expression.
+
+    Tokens are (type, value, lineno) tuples. Token types and values are the
+        same as the ones of franca_lexer.Lexer.
+    """
+
+    keywords = franca_lexer.Lexer.keywords
+    tokens = franca_lexer.Lexer.tokens
+    literals = franca_lexer.Lexer.literals
+
+    _keyword_map = franca_lexer.Lexer._keyword_map
+
+    # Token rules in the order of franca_lexer.Lexer, which decides the
+    #   match when several rules apply.
+    _rules = (
+        ("IGNORE", r"[ \t]+"),
+        ("NEWLINE", r"\n+"),
+        ("LINE_COMMENT", r"//[^\r\n]*"),
+        ("BLOCK_COMMENT", r"/\*[\s\S]*?\*/"),
+        ("STRUCTURED_COMMENT", r"<\*\*[\s\S]*?\*\*>"),
+        ("STRING_VAL", r"\"[^\"]*\""),
+        ("REAL_VAL", r"[+-]?(?:(?:(?:[0-9]*\.[0-9]+|[0-9]+\.)"
+                     r"(?:[eE][-+]?[0-9]+)?|[0-9]+[eE][-+]?[0-9]+)[fFdD]?)"),
+        ("HEXADECIMAL_VAL", r"0[xX][0-9a-fA-F]+"),
+        ("BINARY_VAL", r"0[bB][01]+"),
+        ("INTEGER_VAL", r"[+-]?\d+"),
+        ("BOOLEAN_VAL", r"true|false"),
+        ("ID", r"[A-Za-z][A-Za-z0-9_]*"),
+        ("LITERAL", "[" + re.escape("".join(literals)) + "]"),
+        ("ILLEGAL", r"[\s\S]"),
+    )
+    _token_re = re.compile("|".join(
+        "(?P<{}>{})".format(name, rule) for name, rule in _rules))
+
+    def scan(self, data):
+        """
+        Tokenize input data.
+
+        An illegal character ends the token list with an ERROR token holding
+            the LexerException, so that a parser reports it only when it gets
+            that far. The list always ends with an END or an ERROR token.
+
+        :param data: Input text to tokenize.
+        :return: List of tokens.
+        """
+        tokens = []
+        append = tokens.append
+        keyword_map = self._keyword_map
+        lineno = 1
+        for match in self._token_re.finditer(data):
+            kind = match.lastgroup
+            if kind == "IGNORE":
+                continue
+            elif kind == "ID":
+                value = match.group()
+                append((keyword_map.get(value, "ID"), value, lineno))
+            elif kind == "NEWLINE":
+                lineno += match.end() - match.start()
+            elif kind == "LITERAL":
+                value = match.group()
+                append((value, value, lineno))
+            elif kind == "STRUCTURED_COMMENT":
+                value = match.group()
+                append((kind, value[3:-3].strip(), lineno))
+                lineno += value.count("\n")
+            elif kind == "LINE_COMMENT":
+                continue
+            elif kind == "BLOCK_COMMENT":
+                lineno += match.group().count("\n")
+            elif kind == "INTEGER_VAL":
+                append((kind, int(match.group(), 10), lineno))
+            elif kind == "STRING_VAL":
+                append((kind, match.group()[1:-1], lineno))
+            elif kind == "REAL_VAL":
+                append((kind, match.group(), lineno))
+            elif kind == "HEXADECIMAL_VAL":
+                append((kind, int(match.group(), 16), lineno))
+            elif kind == "BINARY_VAL":
+                append((kind, int(match.group(), 2), lineno))
+            elif kind == "BOOLEAN_VAL":
+                append((kind, match.group() == "true", lineno))
+            else:
+                append((ERROR, LexerException(
+                    "Illegal character '{}' at line {}.".format(
+                        match.group(), lineno)), lineno))
+                return tokens
+        append((END, None, lineno))
+        return tokens
+
+    def tokenize(self, data):
+        """
+        Tokenize input data to stdout for testing purposes.
+
+        :param data: Input text to parse.
+        """
+        for token in self.tokenize_data(data):
+            print(token)
+
+    def tokenize_data(self, data):
+        """
+        Tokenize input data.
+
+        :param data: Input text to parse.
+        :return: List of tokens, without the END token.
+        """
+        tokens = self.scan(data)
+        kind, value, _ = tokens.pop()
+        if kind == ERROR:
+            raise value
+        return tokens
+
+    def tokenize_file(self, fspec):
+        """
+        Tokenize input file to stdout for testing purposes.
+
+        :param fspec: Input file to parse.
+        """
+        with open(fspec, "r") as f:
+            data = f.read()
+        return self.tokenize(data)
+
+
+class FastParser(object):
+    """
+    Franca IDL recursive descent parser.
+
+    Builds the same AST and raises the same errors as franca_parser.Parser,
+        without PLY table construction and per token overhead.
+    """
+
+    _primitive_types = dict(
+        (keyword.upper(), getattr(ast, keyword)) for keyword in (
+            "Int8", "Int16", "Int32", "Int64",
+            "UInt8", "UInt16", "UInt32", "UInt64",
+            "Boolean", "Float", "Double", "String", "ByteBuffer"))
+
+    _integer_types = frozenset((
+        "INT8", "INT16", "INT32", "INT64",
+        "UINT8", "UINT16", "UINT32", "UINT64"))
+
+    _integer_values = {
+        "INTEGER_VAL": ast.IntegerValue.DECIMAL,
+        "HEXADECIMAL_VAL": ast.IntegerValue.HEXADECIMAL,
+        "BINARY_VAL": ast.IntegerValue.BINARY,
+    }
+
+    _flags = frozenset((
+        "SELECTIVE", "FIREANDFORGET", "POLYMORPHIC", "NOSUBSCRIPTIONS",
+        "READONLY"))
+
+    # Tokens that may follow a complete definition. The PLY parser checks
+    #   the next token before it reduces a definition, so a semantic error
+    #   of the definition is only raised if that token is valid.
+    _field_follow = frozenset(_primitive_types) | frozenset((
+        "ID", "*", "STRUCTURED_COMMENT", "}"))
+    _enumerator_follow = frozenset(("ID", "STRUCTURED_COMMENT", "}"))
+    _def_follow = frozenset((
+        "IMPORT", "STRUCTURED_COMMENT", "TYPECOLLECTION", "INTERFACE", END))
+
+    structured_comment = franca_parser.Parser.structured_comment
+
+    def __init__(self, the_lexer=None,
+                 comments=franca_parser.Parser.COMMENTS_PARSE):
+        """
+        Constructor.
+
+        :param the_lexer: a FastLexer object to use.
+        :param comments: Structured comment handling mode, one of the
+            franca_parser.Parser.COMMENTS_* constants.
+        """
+        self.comments = comments
+        if not the_lexer:
+            the_lexer = FastLexer()
+        self._lexer = the_lexer
+        self._tokens = None
+        self._pos = 0
+
+    @staticmethod
+    def _error(token):
+        kind, value, lineno = token
+        if kind == END:
+            raise ParserException("Reached unexpected end of file.")
+        elif kind == ERROR:
+            raise value
+        raise ParserException("Syntax error at line {} near '{}'.".format(
+                              lineno, value))
+
+    def _peek(self):
+        return self._tokens[self._pos][0]
+
+    def _next(self):
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _expect(self, kind):
+        token = self._tokens[self._pos]
+        if token[0] != kind:
+            self._error(token)
+        self._pos += 1
+        return token[1]
+
+    def _lookahead(self, kinds):
+        token = self._tokens[self._pos]
+        if token[0] not in kinds:
+            self._error(token)
+
+    def _structured_comment(self):
+        token = self._tokens[self._pos]
+        if token[0] == "STRUCTURED_COMMENT":
+            self._pos += 1
+            return self.structured_comment(token[1])
+        return None
+
+    def _fqn(self, token):
+        kind, value, _ = token
+        if kind == "*":
+            return value
+        elif kind != "ID":
+            self._error(token)
+        names = [value]
+        while self._tokens[self._pos][0] == ".":
+            self._pos += 1
+            token = self._next()
+            if token[0] == "ID":
+                names.append(token[1])
+            elif token[0] == "*":
+                names.append(token[1])
+                break
+            else:
+                self._error(token)
+        return ".".join(names)
+
+    def _type(self):
+        token = self._next()
+        type_class = self._primitive_types.get(token[0])
+        if type_class is not None:
+            if self._peek() == "[":
+                self._pos += 1
+                self._expect("]")
+                return ast.Array(name=None, element_type=type_class())
+            return type_class()
+        name = self._fqn(token)
+        if self._peek() == "[":
+            self._pos += 1
+            self._expect("]")
+            element_type = ast.Reference(name=name)
+            return ast.Array(name=None, element_type=element_type)
+        return ast.Reference(name=name)
+
+    def _flag_defs(self):
+        flags = None
+        while self._peek() in self._flags:
+            if flags is None:
+                flags = []
+            flags.append(self._next()[1])
+        return flags
+
+    def _integer_val(self, token):
+        base = self._integer_values.get(token[0])
+        if base is None:
+            self._error(token)
+        return ast.IntegerValue(token[1], base)
+
+    def _value(self, token):
+        kind = token[0]
+        if kind == "BOOLEAN_VAL":
+            return ast.BooleanValue(token[1])
+        elif kind == "STRING_VAL":
+            return ast.StringValue(token[1])
+        elif kind == "REAL_VAL":
+            return franca_parser.Parser._real_value(token[1])
+        return self._integer_val(token)
+
+    def _package_def(self):
+        comments = self._structured_comment()
+        self._expect("PACKAGE")
+        name = self._fqn(self._next())
+        defs = []
+        while self._peek() != END:
+            defs.append(self._def())
+        imports, interfaces, typecollections = \
+            franca_parser.Parser._package_def(defs)
+        return ast.Package(name=name, file_name=None, imports=imports,
+                           interfaces=interfaces,
+                           typecollections=typecollections,
+                           comments=comments)
+
+    def _def(self):
+        if self._peek() == "IMPORT":
+            self._pos += 1
+            token = self._next()
+            if token[0] == "MODEL":
+                return ast.Import(file_name=self._expect("STRING_VAL"))
+            namespace = self._fqn(token)
+            self._expect("FROM")
+            return ast.Import(file_name=self._expect("STRING_VAL"),
+                              namespace=namespace)
+        comments = self._structured_comment()
+        token = self._next()
+        if token[0] == "TYPECOLLECTION":
+            return self._typecollection(comments)
+        elif token[0] == "INTERFACE":
+            return self._interface(comments)
+        self._error(token)
+
+    def _typecollection(self, comments):
+        name = self._expect("ID")
+        self._expect("{")
+        members = self._members(self._typecollection_members)
+        self._expect("}")
+        self._lookahead(self._def_follow)
+        try:
+            return ast.TypeCollection(name=name, flags=None, members=members,
+                                      comments=comments)
+        except ast.ASTException as e:
+            raise ParserException(e.message)
+
+    def _interface(self, comments):
+        name = self._expect("ID")
+        extends = None
+        if self._peek() == "EXTENDS":
+            self._pos += 1
+            extends = self._fqn(self._next())
+        self._expect("{")
+        members = self._members(self._interface_members)
+        self._expect("}")
+        self._lookahead(self._def_follow)
+        try:
+            return ast.Interface(name=name, flags=None, members=members,
+                                 extends=extends, comments=comments)
+        except ast.ASTException as e:
+            raise ParserException(e.message)
+
+    def _members(self, handlers):
+        members = []
+        while True:
+            kind = self._peek()
+            if kind == "}":
+                break
+            elif kind == "VERSION":
+                members.append(self._version_def())
+                continue
+            comments = self._structured_comment()
+            token = self._next()
+            handler = handlers.get(token[0])
+            if handler is None:
+                self._error(token)
+            members.append(handler(self, comments))
+        return members if members else None
+
+    def _version_def(self):
+        self._pos += 1
+        self._expect("{")
+        self._expect("MAJOR")
+        major = self._expect("INTEGER_VAL")
+        self._expect("MINOR")
+        minor = self._expect("INTEGER_VAL")
+        self._expect("}")
+        return ast.Version(major=major, minor=minor)
+
+    def _type_def(self, comments):
+        name = self._expect("ID")
+        self._expect("IS")
+        return ast.Typedef(name=name, base_type=self._type(),
+                           comments=comments)
+
+    def _attribute_def(self, comments):
+        attr_type = self._type()
+        name = self._expect("ID")
+        flags = self._flag_defs()
+        return ast.Attribute(name=name, attr_type=attr_type, flags=flags,
+                             comments=comments)
+
+    def _arg_group_defs(self):
+        self._expect("{")
+        arg_groups = []
+        while True:
+            kind = self._peek()
+            if kind == "IN":
+                self._pos += 1
+                self._expect("{")
+                arg_groups.append(InArgumentGroup(self._arg_defs()))
+                self._expect("}")
+            elif kind == "OUT":
+                self._pos += 1
+                self._expect("{")
+                arg_groups.append(OutArgumentGroup(self._arg_defs()))
+                self._expect("}")
+            elif kind == "ERROR":
+                self._pos += 1
+                if self._peek() == "{":
+                    self._pos += 1
+                    arg_groups.append(
+                        ErrorArgumentGroup(self._enumerators()))
+                    self._expect("}")
+                else:
+                    arg_groups.append(ErrorArgumentGroup(self._type()))
+            else:
+                break
+        self._expect("}")
+        self._lookahead(self._member_follow)
+        return franca_parser.Parser._method_def(arg_groups)
+
+    def _arg_defs(self):
+        args = {}
+        while True:
+            comments = self._structured_comment()
+            arg_type = self._type()
+            name = self._expect("ID")
+            self._lookahead(self._field_follow)
+            if name in args:
+                raise ParserException("Duplicate argument '{}'.".format(name))
+            args[name] = ast.Argument(name=name, arg_type=arg_type,
+                                      comments=comments)
+            if self._peek() == "}":
+                return args
+
+    def _method_def(self, comments):
+        name = self._expect("ID")
+        flags = self._flag_defs()
+        in_args, out_args, errors = self._arg_group_defs()
+        return ast.Method(name=name, flags=flags, in_args=in_args,
+                          out_args=out_args, errors=errors, comments=comments)
+
+    def _broadcast_def(self, comments):
+        name = self._expect("ID")
+        flags = self._flag_defs()
+        in_args, out_args, errors = self._arg_group_defs()
+        if in_args or errors:
+            raise ParserException("In arguments and errors cannot be part "
+                                  "of a broadcast definition.")
+        return ast.Broadcast(name=name, flags=flags, out_args=out_args,
+                             comments=comments)
+
+    def _enumeration_def(self, comments):
+        name = self._expect("ID")
+        if self._peek() == "EXTENDS":
+            self._pos += 1
+            extends = self._fqn(self._next())
+            self._expect("{")
+            enumerators = self._enumerators()
+            self._expect("}")
+            return ast.Enumeration(name=name, enumerators=enumerators,
+                                   extends=extends, comments=comments)
+        self._expect("{")
+        enumerators = self._enumerators()
+        self._expect("}")
+        return ast.Enumeration(name=name, enumerators=enumerators,
+                               comments=comments)
+
+    def _enumerators(self):
+        enumerators = {}
+        while self._peek() != "}":
+            comments = self._structured_comment()
+            name = self._expect("ID")
+            if self._peek() == "=":
+                self._pos += 1
+                value = self._integer_val(self._next())
+                enumerator = ast.Enumerator(name=name, value=value,
+                                            comments=comments)
+            else:
+                enumerator = ast.Enumerator(name=name, comments=comments)
+            self._lookahead(self._enumerator_follow)
+            if name in enumerators:
+                raise ParserException(
+                    "Duplicate enumerator '{}'.".format(name))
+            enumerators[name] = enumerator
+        return enumerators if enumerators else None
+
+    def _struct_def(self, comments):
+        name = self._expect("ID")
+        if self._peek() == "EXTENDS":
+            self._pos += 1
+            extends = self._fqn(self._next())
+            self._expect("{")
+            fields = self._struct_fields()
+            self._expect("}")
+            return ast.Struct(name=name, fields=fields, extends=extends,
+                              comments=comments)
+        flags = self._flag_defs()
+        self._expect("{")
+        fields = self._struct_fields()
+        self._expect("}")
+        return ast.Struct(name=name, fields=fields, flags=flags,
+                          comments=comments)
+
+    def _struct_fields(self):
+        fields = {}
+        while self._peek() != "}":
+            comments = self._structured_comment()
+            field_type = self._type()
+            name = self._expect("ID")
+            self._lookahead(self._field_follow)
+            if name in fields:
+                raise ParserException(
+                    "Duplicate structure field '{}'.".format(name))
+            fields[name] = ast.StructField(name=name, field_type=field_type,
+                                           comments=comments)
+        return fields if fields else None
+
+    def _array_def(self, comments):
+        name = self._expect("ID")
+        self._expect("OF")
+        return ast.Array(name=name, element_type=self._type(),
+                         comments=comments)
+
+    def _map_def(self, comments):
+        name = self._expect("ID")
+        self._expect("{")
+        key_type = self._type()
+        self._expect("TO")
+        value_type = self._type()
+        self._expect("}")
+        return ast.Map(name=name, key_type=key_type, value_type=value_type,
+                       comments=comments)
+
+    def _constant_def(self, comments):
+        token = self._next()
+        kind = token[0]
+        if kind not in self._integer_types and kind not in (
+                "FLOAT", "DOUBLE", "BOOLEAN", "STRING"):
+            self._error(token)
+        type_class = self._primitive_types[kind]
+        name = self._expect("ID")
+        self._expect("=")
+        value_token = self._next()
+        value = self._value(value_token)
+        value_kind = value_token[0]
+        if kind in self._integer_types:
+            if value_kind in self._integer_values:
+                value = ast.IntegerValue(value.value, value.base)
+            elif value_kind == "STRING_VAL":
+                self._error(value_token)
+            else:
+                value = ast.IntegerValue(int(value.value))
+        elif kind == "FLOAT":
+            if value_kind == "STRING_VAL":
+                self._error(value_token)
+            value = ast.FloatValue(float(value.value))
+        elif kind == "DOUBLE":
+            if value_kind == "STRING_VAL":
+                self._error(value_token)
+            value = ast.DoubleValue(float(value.value))
+        elif kind == "BOOLEAN":
+            value = ast.BooleanValue(bool(value.value))
+        else:
+            value = ast.StringValue(str(value.value))
+        return ast.Constant(name=name, element_type=type_class(),
+                            element_value=value, comments=comments)
+
+    _typecollection_members = {
+        "TYPEDEF": _type_def,
+        "ENUMERATION": _enumeration_def,
+        "STRUCT": _struct_def,
+        "ARRAY": _array_def,
+        "MAP": _map_def,
+        "CONST": _constant_def,
+    }
+
+    _interface_members = dict(_typecollection_members, **{
+        "ATTRIBUTE": _attribute_def,
+        "METHOD": _method_def,
+        "BROADCAST": _broadcast_def,
+    })
+
+    _member_follow = frozenset(_interface_members) | frozenset((
+        "VERSION", "STRUCTURED_COMMENT", "}"))
+
+    def parse(self, fidl):
+        """
+        Parse input text
+
+        :param fidl: Input text to parse.
+        :return: AST representation of the input.
+        """
+        self._tokens = self._lexer.scan(fidl)
+        self._pos = 0
+        try:
+            return self._package_def()
+        finally:
+            self._tokens = None
+
+    def parse_file(self, fspec):
+        """
+        Parse input file
+
+        :param fspec: Specification of a fidl to parse.
+        :return: AST representation of the input.
+        """
+        with open(fspec, "r", encoding='utf-8') as f:
+            fidl = f.read()
+        package = self.parse(fidl)
+        if package:
+            package.files = [fspec]
+        return package
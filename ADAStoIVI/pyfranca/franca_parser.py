@@ -2,8 +2,8 @@
 Franca parser.
 """
 
-from collections import OrderedDict
 from abc import ABCMeta
+from collections.abc import Mapping
 import ply.yacc as yacc
 from pyfranca import franca_lexer
 from pyfranca import ast
@@ -15,7 +15,7 @@ class ArgumentGroup(object):
     __metaclass__ = ABCMeta
 
     def __init__(self, arguments=None):
-        self.arguments = arguments if arguments else OrderedDict()
+        self.arguments = arguments if arguments else {}
 
 
 class InArgumentGroup(ArgumentGroup):
@@ -40,16 +40,60 @@ class ParserException(Exception):
         return self.message
 
 
+class StructuredComments(Mapping):
+    """
+    Structured comment kept as raw text until its content is first accessed.
+    """
+
+    __slots__ = ("_text", "_comments")
+
+    def __init__(self, text):
+        self._text = text
+        self._comments = None
+
+    def _parse(self):
+        if self._comments is None:
+            self._comments = Parser.parse_structured_comment(self._text)
+            self._text = None
+        return self._comments
+
+    def __getitem__(self, key):
+        return self._parse()[key]
+
+    def __iter__(self):
+        return iter(self._parse())
+
+    def __len__(self):
+        return len(self._parse())
+
+    def __bool__(self):
+        # Avoid parsing for truth tests. A comment without any known key
+        #   tests true but is empty.
+        if self._comments is None:
+            return bool(self._text)
+        return bool(self._comments)
+
+
 class Parser(object):
     """
     Franca IDL PLY parser.
     """
 
+    # Structured comment handling modes.
+    COMMENTS_PARSE = "parse"    # Parse while parsing the model.
+    COMMENTS_LAZY = "lazy"      # Parse when the comments are first accessed.
+    COMMENTS_DROP = "drop"      # Discard structured comments.
+
+    _comment_keys = ('@description', '@author', '@deprecated', '@source_uri',
+                     '@source_alias', '@see', '@experimental')
+    _comment_key_set = frozenset(_comment_keys)
+    _comment_re = re.compile('(' + '|'.join(_comment_keys) + ')')
+
     @staticmethod
     def _package_def(members):
         imports = []
-        interfaces = OrderedDict()
-        typecollections = OrderedDict()
+        interfaces = {}
+        typecollections = {}
         if members:
             for member in members:
                 if isinstance(member, ast.Import):
@@ -68,36 +112,39 @@ class Parser(object):
         Parse a structured comment.
 
         :param comment: Structured comment of an Franca-IDL symbol to parse.
-        :return: OrderedDict of all comments. Key is Franca-IDL keyword, e.g. @description, value conatins the text.
-        """
-        keys = ['@description', '@author', '@deprecated', '@source_uri', '@source_alias', '@see', '@experimental']
-
-        strings = re.split('(' + '|'.join(keys) + ')', comment)
-
-        # remove optional spaces, ':' and finally empty strings
-        strings = [item.strip() for item in strings]
-        strings = [item.lstrip(':') for item in strings]
-        strings = [item.strip() for item in strings]
-        for item in strings:
-            if item == "":
-                strings.remove(item)
-
-        comments = OrderedDict()
-        length = len(strings)
-        i = 0
-        while i < length:
-            key = strings[i]
-            if key in keys:
+        :return: dict of all comments. Key is Franca-IDL keyword, e.g. @description, value conatins the text.
+        """
+        keys = Parser._comment_key_set
+        comments = {}
+        # Key waiting for its text.
+        key = None
+        for item in Parser._comment_re.split(comment):
+            # remove optional spaces, ':' and finally empty strings
+            item = item.strip().lstrip(':').strip()
+            if not item:
+                continue
+            if item in keys:
+                key = item
                 comments[key] = ""
-
-                if i < (length - 1):
-                    item = strings[i + 1]
-                    if item not in keys:
-                        comments[key] = item
-                        i += 1
-            i += 1
+            elif key is not None:
+                comments[key] = item
+                key = None
         return comments
 
+    def structured_comment(self, comment):
+        """
+        Handle a structured comment according to the comment mode.
+
+        :param comment: Structured comment text.
+        :return: Comments mapping or None.
+        """
+        if self.comments == Parser.COMMENTS_PARSE:
+            return Parser.parse_structured_comment(comment)
+        elif self.comments == Parser.COMMENTS_LAZY:
+            return StructuredComments(comment)
+        else:
+            return None
+
     # noinspection PyIncorrectDocstring
     @staticmethod
     def p_package_def(p):
@@ -111,12 +158,11 @@ class Parser(object):
                            comments=p[1])
 
     # noinspection PyIncorrectDocstring
-    @staticmethod
-    def p_structured_comment_1(p):
+    def p_structured_comment_1(self, p):
         """
         structured_comment : STRUCTURED_COMMENT
         """
-        p[0] = Parser.parse_structured_comment(p[1])
+        p[0] = self.structured_comment(p[1])
 
     # noinspection PyIncorrectDocstring
     @staticmethod
@@ -494,7 +540,7 @@ class Parser(object):
         """
         arg_defs : arg_def
         """
-        p[0] = OrderedDict()
+        p[0] = {}
         p[0][p[1].name] = p[1]
 
     # noinspection PyIncorrectDocstring
@@ -540,7 +586,7 @@ class Parser(object):
         """
         enumerators : enumerator
         """
-        p[0] = OrderedDict()
+        p[0] = {}
         p[0][p[1].name] = p[1]
 
     # noinspection PyUnusedLocal, PyIncorrectDocstring
@@ -602,7 +648,7 @@ class Parser(object):
         """
         struct_fields : struct_field
         """
-        p[0] = OrderedDict()
+        p[0] = {}
         p[0][p[1].name] = p[1]
 
     # noinspection PyUnusedLocal, PyIncorrectDocstring
@@ -761,12 +807,16 @@ class Parser(object):
         """
         real_val : REAL_VAL
         """
-        if re.match(r".*[dD]", p[1]):
-            p[0] = ast.DoubleValue(float(p[1][:-1]))
-        elif re.match(r".*[fF]", p[1]):
-            p[0] = ast.FloatValue(float(p[1][:-1]))
+        p[0] = Parser._real_value(p[1])
+
+    @staticmethod
+    def _real_value(text):
+        if re.match(r".*[dD]", text):
+            return ast.DoubleValue(float(text[:-1]))
+        elif re.match(r".*[fF]", text):
+            return ast.FloatValue(float(text[:-1]))
         else:
-            p[0] = ast.DoubleValue(float(p[1]))
+            return ast.DoubleValue(float(text))
 
     # noinspection PyIncorrectDocstring
     @staticmethod
@@ -865,12 +915,15 @@ class Parser(object):
         else:
             raise ParserException("Reached unexpected end of file.")
 
-    def __init__(self, the_lexer=None, **kwargs):
+    def __init__(self, the_lexer=None, comments=COMMENTS_PARSE, **kwargs):
         """
         Constructor.
 
         :param lexer: a lexer object to use.
+        :param comments: Structured comment handling mode, one of the
+            COMMENTS_* constants.
         """
+        self.comments = comments
         if not the_lexer:
             the_lexer = franca_lexer.Lexer()
         self._lexer = the_lexer
@@ -889,7 +942,9 @@ class Parser(object):
         :param fidl: Input text to parse.
         :return: AST representation of the input.
         """
-        package = self._parser.parse(fidl)
+        # The parser may be reused, line numbers start over for each input.
+        self._lexer.lexer.lineno = 1
+        package = self._parser.parse(fidl, lexer=self._lexer.lexer)
         return package
 
     def parse_file(self, fspec):
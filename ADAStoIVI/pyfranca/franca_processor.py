@@ -1,14 +1,16 @@
 
 import os
-from collections import OrderedDict
-from pyfranca import franca_parser, ast
+from collections.abc import Mapping
+from pyfranca import franca_lexer, franca_parser, franca_fastparser, ast
 
 
 class ProcessorException(Exception):
 
-    def __init__(self, message):
+    def __init__(self, message, errors=None):
         super(ProcessorException, self).__init__()
         self.message = message
+        # Individual errors of a batched import.
+        self.errors = errors if errors else []
 
     def __str__(self):
         return self.message
@@ -19,14 +21,55 @@ class Processor(object):
     Franca IDL processor.
     """
 
-    def __init__(self):
+    # Parser engines.
+    ENGINE_PLY = "ply"      # PLY based franca_parser.Parser.
+    ENGINE_FAST = "fast"    # Hand-written franca_fastparser.FastParser.
+
+    def __init__(self, lazy=False,
+                 comments=franca_parser.Parser.COMMENTS_PARSE,
+                 engine=ENGINE_PLY, parser=None):
         """
         Constructor.
+
+        :param lazy: Resolve type references on first access instead of
+            when a package is imported.
+        :param comments: Structured comment handling mode, one of the
+            franca_parser.Parser.COMMENTS_* constants.
+        :param engine: Parser engine, one of the ENGINE_* constants.
+        :param parser: Parser to use instead of creating one of engine, e.g.
+            one shared by several processors. Any object with the parse and
+            parse_file methods of franca_parser.Parser.
         """
+        if engine not in (Processor.ENGINE_PLY, Processor.ENGINE_FAST):
+            raise ProcessorException(
+                "Unknown parser engine '{}'.".format(engine))
         # Default package paths.
         self.package_paths = []
+        self.lazy = lazy
+        self.comments = comments
+        self.engine = engine
+        # Parser shared by all imports, created on first use.
+        self._parser = parser
         self.files = {}
         self.packages = {}
+        # Package name -> names of the packages it imports.
+        self.dependencies = {}
+        # File specification -> parsed ast.Package of that file alone, and
+        #   the imports and namespaces it contributed to the merged package.
+        self._parts = {}
+        self._contents = {}
+        # Re-resolve references that are already resolved.
+        self._rebind = False
+        # Directory -> names in it, each directory is listed once per batch.
+        self._listings = {}
+        # (Import directory, file specification) -> canonical path.
+        self._aliases = {}
+        # (Device, inode) -> canonical path of every loaded file.
+        self._identities = {}
+        # Packages waiting for reference resolution during a batched import.
+        self._deferred = None
+        # Errors collected during a batched import.
+        self._errors = None
 
     @staticmethod
     def basename(namespace):
@@ -209,9 +252,16 @@ class Processor(object):
         elif isinstance(name, ast.Reference):
             if not name.namespace:
                 name.namespace = namespace
-            if not name.reference:
-                resolved_name = self.resolve(namespace, name.name)
-                name.reference = resolved_name
+            if self.lazy:
+                # Only record the context, the lookup happens on first access.
+                name.bind(self.resolve)
+            elif self._rebind or not name.reference:
+                try:
+                    resolved_name = self.resolve(namespace, name.name)
+                except ProcessorException as e:
+                    self._report(e)
+                else:
+                    name.reference = resolved_name
         elif isinstance(name, ast.Attribute):
             self._update_type_references(name.namespace, name.type)
         elif isinstance(name, ast.Method):
@@ -219,7 +269,7 @@ class Processor(object):
                 self._update_type_references(name.namespace, arg.type)
             for arg in name.out_args.values():
                 self._update_type_references(name.namespace, arg.type)
-            if isinstance(name.errors, OrderedDict):
+            if isinstance(name.errors, Mapping):
                 pass
             elif isinstance(name.errors, ast.Reference):
                 # Errors can be a reference to an enumeration
@@ -236,6 +286,18 @@ class Processor(object):
         else:
             assert False
 
+    def _update_member_references(self, namespace, name):
+        """
+        Update type references in a namespace member.
+
+        :param namespace: ast.Namespace context.
+        :param name: ast.Type object.
+        """
+        try:
+            self._update_type_references(namespace, name)
+        except ProcessorException as e:
+            self._report(e)
+
     def _update_namespace_references(self, namespace):
         """
         Update type references in a namespace.
@@ -243,17 +305,17 @@ class Processor(object):
         :param namespace: ast.Namespace object.
         """
         for name in namespace.typedefs.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
         for name in namespace.enumerations.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
         for name in namespace.structs.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
         for name in namespace.arrays.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
         for name in namespace.maps.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
         for name in namespace.constants.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
 
     def _update_interface_references(self, namespace):
         """
@@ -263,27 +325,37 @@ class Processor(object):
         """
         self._update_namespace_references(namespace)
         for name in namespace.attributes.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
         for name in namespace.methods.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
         for name in namespace.broadcasts.values():
-            self._update_type_references(namespace, name)
+            self._update_member_references(namespace, name)
         if namespace.extends:
-            namespace.reference = self.resolve_namespace(
-                namespace.package, namespace.extends)
-            if not isinstance(namespace.reference, ast.Interface):
-                raise ProcessorException(
-                    "Invalid interface reference '{}'.".format(
-                        namespace.extends))
+            try:
+                namespace.reference = self.resolve_namespace(
+                    namespace.package, namespace.extends)
+                if not isinstance(namespace.reference, ast.Interface):
+                    raise ProcessorException(
+                        "Invalid interface reference '{}'.".format(
+                            namespace.extends))
+            except ProcessorException as e:
+                self._report(e)
 
-    def _update_package_references(self, package):
+    def _update_package_references(self, package, part=None):
         """
         Update type references in a package.
 
         :param package: ast.Package object.
+        :param part: ast.Package merged into package. Only its imports and
+            namespaces are updated. Defaults to the whole package.
         """
-        for package_import in package.imports:
-            assert package_import.package_reference is not None
+        if not part:
+            part = package
+        for package_import in part.imports:
+            if package_import.package_reference is None:
+                self._report(ProcessorException(
+                    "Model '{}' not loaded.".format(package_import.file)))
+                continue
             if package_import.namespace:
                 # Namespace import
                 package_reference = package_import.package_reference
@@ -298,56 +370,268 @@ class Processor(object):
                     namespace = package_reference[namespace_name]
                     package_import.namespace_reference = namespace
                 else:
-                    raise ProcessorException(
+                    self._report(ProcessorException(
                         "Namespace '{}' not found.".format(
-                            package_import.namespace))
+                            package_import.namespace)))
             else:
                 # Model import
                 assert package_import.namespace_reference is None
-        for namespace in package.typecollections:
-            self._update_namespace_references(
-                package.typecollections[namespace])
-        for namespace in package.interfaces:
-            self._update_interface_references(
-                package.interfaces[namespace])
+        # Namespaces dropped as duplicates while merging keep pointing at
+        #   the merged part and are skipped.
+        for namespace in part.typecollections.values():
+            if namespace.package is package:
+                self._update_namespace_references(namespace)
+        for namespace in part.interfaces.values():
+            if namespace.package is package:
+                self._update_interface_references(namespace)
+
+    def _report(self, error):
+        """
+        Raise an error, or record it while a batched import is running.
+
+        :param error: ProcessorException object.
+        """
+        if self._errors is None:
+            raise error
+        self._errors.append(error)
 
-    def import_package(self, fspec, package, references=None):
+    def import_package(self, fspec, package, references=None, errors=None):
         """
         Import an ast.Package into the processor.
 
         :param fspec: File specification of the package.
         :param package: ast.Package object.
         :param references: A list of package references.
+        :param errors: A list to collect the errors of the imported models
+            in, instead of raising the first one.
         """
         if not isinstance(package, ast.Package):
             ValueError("Expected ast.Package as input.")
         if not references:
             references = []
+        part = package
         # Check whether package is already imported
+        if package.name in self.packages and \
+                fspec in self.packages[package.name].files:
+            return
+        # Remember what the file contributes before it gets merged.
+        self._parts[fspec] = part
+        self._contents[fspec] = (list(part.imports), dict(part.interfaces),
+                                 dict(part.typecollections))
         if package.name in self.packages:
-            if fspec not in self.packages[package.name].files:
-                # Merge the new package into the already existing one.
-                self.packages[package.name] += package
-                # Register the package file in the processor.
-                self.files[fspec] = self.packages[package.name]
-                package = self.packages[package.name]
-            else:
-                return
+            # Merge the new package into the already existing one.
+            self.packages[package.name] += package
+            # Register the package file in the processor.
+            self.files[fspec] = self.packages[package.name]
+            package = self.packages[package.name]
         else:
             # Register the package in the processor.
             self.packages[package.name] = package
             # Register the package file in the processor.
             self.files[fspec] = package
-        # Process package imports
-        fspec_path = os.path.abspath(fspec)
-        fspec_dir = os.path.dirname(fspec_path)
-        for package_import in package.imports:
-            imported_package = self.import_file(
-                package_import.file, references + [package.name], fspec_dir)
+        if self._deferred is not None:
+            # Resolved once all files of the batch are loaded.
+            self._deferred[package.name] = package
+        # Process imports of the new file only, the ones of previously
+        #   merged files are already bound.
+        self._import_models(package, part, fspec, references, errors)
+        # Update type references
+        if self._deferred is None:
+            self._update_package_references(package, part)
+
+    def _import_models(self, package, part, fspec, references, errors=None):
+        """
+        Import the models a file imports and bind its imports to them.
+
+        :param package: ast.Package the file is merged into.
+        :param part: ast.Package of the file alone.
+        :param fspec: File specification of the file.
+        :param references: A list of package references.
+        :param errors: A list to collect the errors in, None to raise them.
+        """
+        fspec_dir = os.path.dirname(os.path.abspath(fspec))
+        for package_import in part.imports:
+            try:
+                imported_package = self.import_file(
+                    package_import.file, references + [package.name],
+                    fspec_dir)
+            except (franca_lexer.LexerException,
+                    franca_parser.ParserException,
+                    ProcessorException) as e:
+                if errors is None:
+                    raise
+                errors.append(ProcessorException(
+                    "{}: {}".format(package_import.file, e)))
+                continue
             # Update import reference
             package_import.package_reference = imported_package
-        # Update type references
-        self._update_package_references(package)
+            self.dependencies.setdefault(package.name, set()).add(
+                imported_package.name)
+
+    def _rebuild_package(self, package):
+        """
+        Rebuild a merged package from the current contents of its files.
+
+        :param package: ast.Package object.
+        """
+        files = package.files
+        package.files = []
+        package.imports = []
+        package.interfaces = {}
+        package.typecollections = {}
+        for fspec in files:
+            imports, interfaces, typecollections = self._contents[fspec]
+            package += ast.Package(package.name, fspec, list(imports),
+                                   dict(interfaces), dict(typecollections))
+        self._update_dependencies(package)
+
+    def _update_dependencies(self, package):
+        """
+        Record the packages a package imports from its bound imports.
+
+        :param package: ast.Package object.
+        """
+        self.dependencies[package.name] = set(
+            package_import.package_reference.name
+            for package_import in package.imports
+            if package_import.package_reference is not None)
+
+    def dependents(self, names):
+        """
+        Find the packages that depend on packages, directly or through
+            other packages.
+
+        :param names: Package names.
+        :return: A set of the package names, including the given ones.
+        """
+        affected = set(names)
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            for dependent, dependencies in self.dependencies.items():
+                if name in dependencies and dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+        return affected
+
+    def _resolve_packages(self, packages, errors):
+        """
+        Update type references in packages, collecting errors.
+
+        :param packages: ast.Package objects.
+        :param errors: A list of ProcessorException objects to extend.
+        """
+        self._errors = errors
+        try:
+            for package in packages:
+                self._update_package_references(package)
+        finally:
+            self._errors = None
+        if errors:
+            raise ProcessorException(
+                "\n".join(str(error) for error in errors), errors)
+
+    def reload_file(self, fspec, fidl=None):
+        """
+        Re-parse a changed FIDL file and update the processor incrementally.
+
+        Only the package of the file and the packages that depend on it are
+            resolved again; all other packages are left untouched.
+
+        :param fspec: File specification of a file already imported.
+        :param fidl: New FIDL string of a package imported with
+            import_string, None to read the file.
+        :return: A set of the names of the affected packages.
+        """
+        if fidl is None:
+            fspec = os.path.realpath(fspec)
+        if fspec not in self._parts:
+            raise ProcessorException("Model '{}' not loaded.".format(fspec))
+        self._clear_listings()
+        if fidl is None:
+            # Editors often replace the file, which gives it a new inode.
+            self._identities = dict(
+                (identity, canonical)
+                for identity, canonical in self._identities.items()
+                if canonical != fspec)
+            self._identities[self._file_identity(fspec)] = fspec
+        old_part = self._parts[fspec]
+        package = self.files[fspec]
+        parser = self.parser()
+        if fidl is None:
+            part = parser.parse_file(fspec)
+        else:
+            part = parser.parse(fidl)
+            part.files = [fspec]
+        affected = self.dependents([package.name])
+        errors = []
+        self._deferred = {}
+        try:
+            if part.name == package.name:
+                self._parts[fspec] = part
+                self._contents[fspec] = (list(part.imports),
+                                         dict(part.interfaces),
+                                         dict(part.typecollections))
+                self._import_models(package, part, fspec, [], errors)
+                self._rebuild_package(package)
+            else:
+                # The file moved to another package. Nothing below raises,
+                #   errors of its imports are collected and reported with
+                #   the unresolved references.
+                del self.files[fspec]
+                del self._parts[fspec]
+                del self._contents[fspec]
+                package.files.remove(fspec)
+                self.import_package(fspec, part, errors=errors)
+                if package.files:
+                    self._rebuild_package(package)
+                else:
+                    # A package without imports has no dependencies entry.
+                    del self.packages[package.name]
+                    self.dependencies.pop(package.name, None)
+                    affected.discard(package.name)
+                affected |= self.dependents([part.name])
+            # Imports bound to the old parsed file follow the new one. The
+            #   merged package itself is rebuilt in place, unless the file
+            #   moved and left it empty.
+            stale = []
+            if old_part is not package:
+                stale.append(old_part)
+            if package.name not in self.packages:
+                stale.append(package)
+            for name in affected:
+                rebound = False
+                for package_import in self.packages[name].imports:
+                    if any(package_import.package_reference is item
+                           for item in stale):
+                        package_import.package_reference = part
+                        rebound = True
+                if rebound:
+                    self._update_dependencies(self.packages[name])
+        finally:
+            deferred, self._deferred = self._deferred, None
+        affected |= set(deferred)
+        self._rebind = True
+        try:
+            self._resolve_packages(
+                [self.packages[name] for name in sorted(affected)], errors)
+        finally:
+            self._rebind = False
+        return affected
+
+    def parser(self):
+        """
+        Parser of the selected engine.
+
+        :return: A franca_parser.Parser or franca_fastparser.FastParser.
+        """
+        if self._parser is None:
+            if self.engine == Processor.ENGINE_FAST:
+                self._parser = franca_fastparser.FastParser(
+                    comments=self.comments)
+            else:
+                self._parser = franca_parser.Parser(comments=self.comments)
+        return self._parser
 
     def import_string(self, fspec, fidl, references=None):
         """
@@ -359,13 +643,71 @@ class Processor(object):
         :return: The parsed ast.Package.
         """
         # Parse the string.
-        parser = franca_parser.Parser()
+        parser = self.parser()
         package = parser.parse(fidl)
         package.files = [fspec]
         # Import the package in the processor.
         self.import_package(fspec, package, references)
         return package
 
+    def import_files(self, fspecs):
+        """
+        Parse FIDL files and import them into the processor as packages.
+
+        All files, including their imports, are loaded before any type
+            reference is resolved, so each package is resolved once no matter
+            how many files it is split across. Errors do not stop the import;
+            they are collected and raised together at the end.
+
+        :param fspecs: A list of file specifications.
+        :return: A list of the parsed ast.Package objects.
+        """
+        packages = []
+        errors = []
+        self._clear_listings()
+        self._deferred = {}
+        try:
+            for fspec in fspecs:
+                try:
+                    packages.append(self.import_file(fspec))
+                except (franca_lexer.LexerException,
+                        franca_parser.ParserException,
+                        ProcessorException) as e:
+                    errors.append(ProcessorException(
+                        "{}: {}".format(fspec, e)))
+        finally:
+            deferred, self._deferred = self._deferred, None
+        self._resolve_packages(deferred.values(), errors)
+        return packages
+
+    def import_strings(self, fidls):
+        """
+        Parse FIDL strings and import them into the processor as packages.
+
+        Like import_files, all strings are loaded before any type reference
+            is resolved and errors are raised together at the end.
+
+        :param fidls: A dictionary of FIDL strings by file specification.
+        :return: A list of the parsed ast.Package objects.
+        """
+        packages = []
+        errors = []
+        self._clear_listings()
+        self._deferred = {}
+        try:
+            for fspec, fidl in fidls.items():
+                try:
+                    packages.append(self.import_string(fspec, fidl))
+                except (franca_lexer.LexerException,
+                        franca_parser.ParserException,
+                        ProcessorException) as e:
+                    errors.append(ProcessorException(
+                        "{}: {}".format(fspec, e)))
+        finally:
+            deferred, self._deferred = self._deferred, None
+        self._resolve_packages(deferred.values(), errors)
+        return packages
+
     def import_file(self, fspec, references=None, package_path=None):
         """
         Parse an FIDL file and import it into the processor as package.
@@ -378,28 +720,87 @@ class Processor(object):
         if fspec in self.files:
             # File already loaded.
             return self.files[fspec]
-        if not os.path.exists(fspec):
-            if os.path.isabs(fspec):
-                # Absolute specification
-                raise ProcessorException(
-                    "Model '{}' not found.".format(fspec))
-            else:
-                # Relative specification.
-                package_paths = self.package_paths[:]
-                if package_path:
-                    package_paths.insert(0, package_path)
-                # Check in the package path list.
-                for path in package_paths:
-                    temp_fspec = os.path.join(path, fspec)
-                    if os.path.exists(temp_fspec):
-                        fspec = temp_fspec
-                        break
-                else:
-                    raise ProcessorException(
-                        "Model '{}' not found.".format(fspec))
+        key = (package_path, fspec)
+        canonical = self._aliases.get(key)
+        if canonical is None:
+            canonical = os.path.realpath(self._find_file(fspec, package_path))
+            self._aliases[key] = canonical
+        if canonical in self.files:
+            # File already loaded through another path.
+            return self.files[canonical]
+        identity = self._file_identity(canonical)
+        if self._identities.get(identity) in self.files:
+            # Same file reached through a hard link or another mount.
+            return self.files[self._identities[identity]]
+        self._identities[identity] = canonical
         # Parse the file.
-        parser = franca_parser.Parser()
-        package = parser.parse_file(fspec)
+        parser = self.parser()
+        package = parser.parse_file(canonical)
         # Import the package in the processor.
-        self.import_package(fspec, package, references)
+        self.import_package(canonical, package, references)
         return package
+
+    def _find_file(self, fspec, package_path=None):
+        """
+        Locate a model file.
+
+        :param fspec: File specification.
+        :param package_path: Additional model path to search for imports.
+        :return: Path of the model file.
+        """
+        if self._exists(fspec):
+            return fspec
+        if os.path.isabs(fspec):
+            # Absolute specification
+            raise ProcessorException(
+                "Model '{}' not found.".format(fspec))
+        # Relative specification.
+        package_paths = self.package_paths[:]
+        if package_path:
+            package_paths.insert(0, package_path)
+        # Check in the package path list.
+        for path in package_paths:
+            temp_fspec = os.path.join(path, fspec)
+            if self._exists(temp_fspec):
+                return temp_fspec
+        raise ProcessorException(
+            "Model '{}' not found.".format(fspec))
+
+    def _clear_listings(self):
+        """
+        Forget the directory listings and the located import paths.
+
+        Files may have been added or replaced since the last scan, e.g. in
+            a processor kept by a long-running process, so every batch and
+            every reload lists the directories again.
+        """
+        self._listings.clear()
+        self._aliases.clear()
+
+    def _exists(self, fspec):
+        """
+        Check whether a file exists, listing its directory only once.
+
+        :param fspec: File specification.
+        :return: True if the file exists.
+        """
+        directory, name = os.path.split(os.path.abspath(fspec))
+        listing = self._listings.get(directory)
+        if listing is None:
+            try:
+                listing = frozenset(os.listdir(directory))
+            except OSError:
+                listing = frozenset()
+            self._listings[directory] = listing
+        return name in listing
+
+    @staticmethod
+    def _file_identity(fspec):
+        """
+        Identify a file by its device and inode.
+
+        :param fspec: File specification.
+        :return: (device, inode) tuple.
+        """
+        stat = os.stat(fspec)
+        return stat.st_dev, stat.st_ino
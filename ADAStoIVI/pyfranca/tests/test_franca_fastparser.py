@@ -0,0 +1,183 @@
+"""
+Differential tests of franca_fastparser.FastParser against the PLY based
+franca_parser.Parser: both must build the same AST and raise the same errors.
+"""
+
+import os
+import random
+import unittest
+from collections.abc import Mapping
+
+from pyfranca import franca_lexer, franca_parser, franca_fastparser
+
+# Directory of the converters, every .fidl below it is a test input.
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+MODES = (franca_parser.Parser.COMMENTS_PARSE,
+         franca_parser.Parser.COMMENTS_LAZY,
+         franca_parser.Parser.COMMENTS_DROP)
+
+# Malformed inputs where a semantic error and a syntax error compete.
+MALFORMED = [
+    "package p\ntypeCollection T {\n struct W {\n Int32 a\n Int32 a [\n }\n}\n",
+    "package p\ntypeCollection T {\n struct W {\n Int32 a\n Int32 a *\n }\n}\n",
+    "package p\ntypeCollection T {\n struct W {\n Int32 a\n Int32 a }\n}\n",
+    "package p\ninterface I {\n method m {\n in { Int32 a Int32 a = }\n }\n}\n",
+    "package p\ninterface I {\n method m {\n in { Int32 a Int32 a }\n }\n}\n",
+    "package p\ntypeCollection T {\n enumeration E {\n A A .\n }\n}\n",
+    "package p\ntypeCollection T {\n enumeration E {\n A A = 1 [\n }\n}\n",
+    "package p\ntypeCollection T {\n enumeration E {\n A = 1 A\n }\n}\n",
+    "package p\ntypeCollection T {\n typedef A is Int32\n typedef A is Int32\n } x\n",
+    "package p\ntypeCollection T {\n typedef A is Int32\n typedef A is Int32\n }\n",
+    "package p\ntypeCollection T {\n typedef A is Int32\n typedef A is Int32\n } #\n",
+    "package p\ninterface T {\n attribute Int32 a\n attribute Int32 a\n } [\n",
+    "package p\ninterface T {\n broadcast b { in { Int32 a } } x\n }\n",
+    "package p\ninterface T {\n broadcast b { in { Int32 a } } }\n",
+    "package p\ninterface T {\n method m { in { Int32 a } in { Int32 b } } [\n }\n",
+    "package p\ninterface T {\n method m { in { Int32 a } in { Int32 b } } }\n",
+    "package p\ninterface T {\n method m { error { A A } [ }\n }\n",
+    "package p\ninterface T {\n const String s = 1.5f\n const Int8 i = \"s\"\n}\n",
+    "package p\ninterface T {\n attribute Int32 a\n",
+    "package p\n/* unterminated\ninterface T {\n}\n",
+    "package p\ninterface T {\n attribute Int32 a $\n}\n",
+    "",
+]
+
+# Words inserted by the mutations of the test inputs.
+MUTATION_WORDS = ["{", "}", "[]", "[", "]", "=", ".", "*", "\n",
+                  "<** @description: x **>", "readonly", "0x1F", "1.5f",
+                  "\"s\"", "true", "#", "in", "out", "error", "extends",
+                  "const", "to", "of", "is", "Int32", "String"]
+MUTATIONS = 500
+
+
+def fidl_files():
+    """
+    All .fidl files of the examples and the test fixtures.
+    """
+    files = []
+    for directory, _, names in os.walk(ROOT):
+        for name in sorted(names):
+            if name.endswith(".fidl"):
+                files.append(os.path.join(directory, name))
+    return sorted(files)
+
+
+def mutations(fidl, count, seed):
+    """
+    Deterministic malformed variants of a model: words and lines removed,
+        duplicated, swapped or replaced.
+    """
+    rnd = random.Random(seed)
+    words = fidl.split(" ")
+    lines = fidl.split("\n")
+    for _ in range(count):
+        if rnd.random() < 0.5:
+            variant = list(words)
+            index = rnd.randrange(len(variant))
+            operation = rnd.randrange(4)
+            if operation == 0:
+                del variant[index]
+            elif operation == 1:
+                variant.insert(index, rnd.choice(variant))
+            elif operation == 2:
+                variant[index] = rnd.choice(MUTATION_WORDS)
+            else:
+                other = rnd.randrange(len(variant))
+                variant[index], variant[other] = variant[other], variant[index]
+            yield " ".join(variant)
+        else:
+            variant = list(lines)
+            index = rnd.randrange(len(variant))
+            variant.insert(index, rnd.choice(variant))
+            yield "\n".join(variant)
+
+
+def node_slots(node):
+    slots = []
+    for cls in type(node).__mro__:
+        slots.extend(getattr(cls, "__slots__", ()))
+    if hasattr(node, "__dict__"):
+        slots.extend(vars(node))
+    return [slot for slot in slots if slot != "__weakref__"]
+
+
+class TestFastParser(unittest.TestCase):
+    """Compare FastParser with the PLY Parser."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parsers = dict(
+            (mode, (franca_parser.Parser(comments=mode),
+                    franca_fastparser.FastParser(comments=mode)))
+            for mode in MODES)
+
+    def assertSameNode(self, expected, actual, path, seen):
+        self.assertIs(type(actual), type(expected), path)
+        if expected is None or isinstance(expected, (str, int, float, bool)):
+            self.assertEqual(actual, expected, path)
+        elif isinstance(expected, (list, tuple)):
+            self.assertEqual(len(actual), len(expected), path)
+            for index, (a, b) in enumerate(zip(expected, actual)):
+                self.assertSameNode(a, b, "{}[{}]".format(path, index), seen)
+        elif isinstance(expected, Mapping):
+            # Keys in the same order, the generators depend on it.
+            self.assertEqual(list(actual), list(expected), path)
+            for key in expected:
+                self.assertSameNode(expected[key], actual[key],
+                                    "{}[{!r}]".format(path, key), seen)
+        elif id(expected) not in seen:
+            seen.add(id(expected))
+            for slot in node_slots(expected):
+                self.assertSameNode(getattr(expected, slot, None),
+                                    getattr(actual, slot, None),
+                                    "{}.{}".format(path, slot), seen)
+
+    def parse(self, parser, fidl):
+        try:
+            return "ok", parser.parse(fidl)
+        except (franca_lexer.LexerException,
+                franca_parser.ParserException) as e:
+            return type(e).__name__, str(e)
+
+    def assertSameParse(self, fidl, mode, name):
+        ply_parser, fast_parser = self.parsers[mode]
+        expected = self.parse(ply_parser, fidl)
+        actual = self.parse(fast_parser, fidl)
+        if expected[0] != "ok" or actual[0] != "ok":
+            # Same exception type and message, which holds the line.
+            self.assertEqual(actual, expected, name)
+        else:
+            self.assertSameNode(expected[1], actual[1], name, set())
+
+    def test_inputs_found(self):
+        names = [os.path.basename(fspec) for fspec in fidl_files()]
+        self.assertIn("Grammar.fidl", names)
+
+    def test_fidl_files(self):
+        for fspec in fidl_files():
+            with open(fspec, "r", encoding="utf-8") as f:
+                fidl = f.read()
+            for mode in MODES:
+                with self.subTest(fidl=fspec, comments=mode):
+                    self.assertSameParse(fidl, mode, fspec)
+
+    def test_malformed(self):
+        for index, fidl in enumerate(MALFORMED):
+            with self.subTest(index=index):
+                self.assertSameParse(fidl, MODES[0], fidl)
+
+    def test_mutations(self):
+        for seed, fspec in enumerate(fidl_files()):
+            with open(fspec, "r", encoding="utf-8") as f:
+                fidl = f.read()
+            for index, variant in enumerate(
+                    mutations(fidl, MUTATIONS, seed)):
+                mode = MODES[index % len(MODES)]
+                with self.subTest(fidl=fspec, mutation=index):
+                    self.assertSameParse(variant, mode, variant)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests of the structured comment handling of franca_parser.Parser.
+"""
+
+import unittest
+
+from pyfranca import franca_parser, franca_fastparser
+
+FIDL = """
+<** @description: Sensor package **>
+package P
+<** @description: The sensor.
+        Reports samples.
+    @author: Jane Doe
+    @deprecated
+    @see: Other **>
+interface I {
+    <** @description : Current rate @experimental **>
+    attribute Int32 rate
+}
+"""
+
+
+def comments(package):
+    interface = package.interfaces["I"]
+    return [package.comments, interface.comments,
+            interface.attributes["rate"].comments]
+
+
+class TestStructuredComments(unittest.TestCase):
+    """Test the parsing of structured comments and the comment modes."""
+
+    def test_parse_structured_comment(self):
+        parsed = franca_parser.Parser.parse_structured_comment(
+            " @description: first line\n      second line"
+            " @author: Jane Doe @deprecated @see : Other ")
+        self.assertEqual(parsed, {
+            "@description": "first line\n      second line",
+            "@author": "Jane Doe",
+            "@deprecated": "",
+            "@see": "Other",
+        })
+        self.assertEqual(
+            franca_parser.Parser.parse_structured_comment(" no tags "), {})
+
+    def test_multi_line_description(self):
+        package = franca_parser.Parser().parse(FIDL)
+        self.assertEqual(comments(package), [
+            {"@description": "Sensor package"},
+            {"@description": "The sensor.\n        Reports samples.",
+             "@author": "Jane Doe", "@deprecated": "", "@see": "Other"},
+            {"@description": "Current rate", "@experimental": ""},
+        ])
+
+    def test_lazy(self):
+        expected = comments(franca_parser.Parser().parse(FIDL))
+        for parser in (franca_parser.Parser, franca_fastparser.FastParser):
+            with self.subTest(parser=parser.__name__):
+                lazy = comments(parser(
+                    comments=franca_parser.Parser.COMMENTS_LAZY).parse(FIDL))
+                for item in lazy:
+                    self.assertIsInstance(
+                        item, franca_parser.StructuredComments)
+                    # Truth tests do not parse.
+                    self.assertTrue(item)
+                    self.assertIsNone(item._comments)
+                # Parsed on first access, as the eager mode does.
+                self.assertEqual(lazy[1]["@author"], "Jane Doe")
+                self.assertIsNotNone(lazy[1]._comments)
+                self.assertIsNone(lazy[2]._comments)
+                self.assertEqual([dict(item) for item in lazy], expected)
+
+    def test_drop(self):
+        for parser in (franca_parser.Parser, franca_fastparser.FastParser):
+            with self.subTest(parser=parser.__name__):
+                dropped = comments(parser(
+                    comments=franca_parser.Parser.COMMENTS_DROP).parse(FIDL))
+                self.assertEqual([dict(item) for item in dropped],
+                                 [{}, {}, {}])
+
+
+if __name__ == "__main__":
+    unittest.main()
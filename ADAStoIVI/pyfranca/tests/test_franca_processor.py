@@ -0,0 +1,277 @@
+"""
+Tests of franca_processor.Processor imports and incremental reloads.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyfranca import Processor, ProcessorException
+
+
+class TestReloadFile(unittest.TestCase):
+    """Test Processor.reload_file."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, name, text):
+        fspec = os.path.join(self.tmp_dir, name)
+        with open(fspec, "w") as f:
+            f.write(text)
+        return os.path.realpath(fspec)
+
+    def test_rename_package_without_imports(self):
+        fspec = self.write("a.fidl", """
+            package P.old
+            typeCollection TC {
+                typedef A is Int32
+            }
+        """)
+        processor = Processor()
+        processor.import_files([fspec])
+        self.write("a.fidl", """
+            package P.new
+            typeCollection TC {
+                typedef A is Int32
+            }
+        """)
+        affected = processor.reload_file(fspec)
+        self.assertEqual(affected, {"P.new"})
+        self.assertEqual(set(processor.packages), {"P.new"})
+        self.assertNotIn("P.old", processor.dependencies)
+        self.assertIs(processor.files[fspec], processor.packages["P.new"])
+        self.assertEqual(processor.packages["P.new"].files, [fspec])
+        self.assertIn("A", processor.packages["P.new"]["TC"].typedefs)
+
+    def test_rename_package_of_imported_file(self):
+        base = self.write("base.fidl", """
+            package P.base
+            typeCollection TC {
+                typedef A is Int32
+            }
+        """)
+        user = self.write("user.fidl", """
+            package P.user
+            import P.base.TC.* from "base.fidl"
+            typeCollection TC {
+                typedef B is A
+            }
+        """)
+        processor = Processor()
+        processor.import_files([user])
+        self.assertEqual(processor.dependencies, {"P.user": {"P.base"}})
+        self.write("base.fidl", """
+            package P.moved
+            typeCollection TC {
+                typedef A is Int32
+            }
+        """)
+        # The namespace import of P.user no longer matches.
+        with self.assertRaises(ProcessorException) as context:
+            processor.reload_file(base)
+        self.assertIn("P.base.TC.*", str(context.exception))
+        self.assertEqual(set(processor.packages), {"P.moved", "P.user"})
+        self.assertIs(processor.files[base], processor.packages["P.moved"])
+        self.assertNotIn("P.base", processor.dependencies)
+        self.assertEqual(processor.dependencies["P.user"], {"P.moved"})
+
+    def test_reimport_keeps_contents(self):
+        fspec = self.write("a.fidl", """
+            package P
+            typeCollection TC {
+                typedef A is Int32
+            }
+        """)
+        processor = Processor()
+        processor.import_file(fspec)
+        contents = processor._contents[fspec]
+        # Imported again under the same path, the package is not rebuilt.
+        processor.import_string(fspec, """
+            package P
+            typeCollection Other {
+                typedef B is Int32
+            }
+        """)
+        self.assertIs(processor._contents[fspec], contents)
+        self.assertEqual(set(processor.packages["P"].typecollections),
+                         {"TC"})
+        processor.reload_file(fspec)
+        self.assertEqual(set(processor.packages["P"].typecollections),
+                         {"TC"})
+
+
+class TestImportFiles(unittest.TestCase):
+    """Test the batched Processor.import_files."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, name, text):
+        fspec = os.path.join(self.tmp_dir, name)
+        with open(fspec, "w") as f:
+            f.write(text)
+        return fspec
+
+    def test_errors_aggregated(self):
+        syntax = self.write("syntax.fidl", """
+            package P.syntax
+            typeCollection TC {
+                typedef A is
+            }
+        """)
+        good = self.write("good.fidl", """
+            package P.good
+            typeCollection TC {
+                typedef A is Int32
+            }
+        """)
+        unresolved = self.write("unresolved.fidl", """
+            package P.unresolved
+            typeCollection TC {
+                typedef A is Missing
+            }
+        """)
+        processor = Processor()
+        with self.assertRaises(ProcessorException) as context:
+            processor.import_files([syntax, good, unresolved])
+        errors = context.exception.errors
+        self.assertEqual(len(errors), 2)
+        for error in errors:
+            self.assertIsInstance(error, ProcessorException)
+        self.assertTrue(str(errors[0]).startswith(syntax + ": "))
+        self.assertIn("Syntax error", str(errors[0]))
+        self.assertIn("Missing", str(errors[1]))
+        self.assertEqual(str(context.exception),
+                         "\n".join(str(error) for error in errors))
+        # The errors did not stop the other files.
+        self.assertEqual(set(processor.packages), {"P.good", "P.unresolved"})
+        self.assertEqual(
+            processor.packages["P.good"]["TC"].typedefs["A"].type.name,
+            "Int32")
+
+
+class TestLazyResolution(unittest.TestCase):
+    """Test Processor(lazy=True) reference resolution."""
+
+    FIDL = """
+        package P
+        typeCollection TC {
+            struct S { Int32 a }
+            typedef A is S
+        }
+        interface I {
+            attribute TC.A attr
+            method m { in { TC.S s } }
+        }
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, name, text):
+        fspec = os.path.join(self.tmp_dir, name)
+        with open(fspec, "w") as f:
+            f.write(text)
+        return fspec
+
+    @staticmethod
+    def references(package):
+        tc = package.typecollections["TC"]
+        interface = package.interfaces["I"]
+        return [tc.typedefs["A"].type,
+                interface.attributes["attr"].type,
+                interface.methods["m"].in_args["s"].type]
+
+    def test_resolved_on_access(self):
+        fspec = self.write("a.fidl", self.FIDL)
+        lazy = Processor(lazy=True)
+        lazy.import_files([fspec])
+        references = self.references(lazy.packages["P"])
+        # Only bound to the resolver until first accessed.
+        for reference in references:
+            self.assertIsNone(reference._reference)
+            self.assertIsNotNone(reference._resolver)
+        tc = lazy.packages["P"].typecollections["TC"]
+        self.assertIs(references[0].reference, tc.structs["S"])
+        self.assertIsNone(references[0]._resolver)
+        self.assertIsNotNone(references[1]._resolver)
+        # Same targets as the eager resolution.
+        eager = Processor()
+        eager.import_files([fspec])
+        for lazy_reference, eager_reference in zip(
+                references, self.references(eager.packages["P"])):
+            self.assertIs(type(lazy_reference.reference),
+                          type(eager_reference.reference))
+            self.assertEqual(lazy_reference.reference.name,
+                             eager_reference.reference.name)
+            self.assertEqual(lazy_reference.reference.namespace.name,
+                             eager_reference.reference.namespace.name)
+
+    def test_unresolved_on_access(self):
+        fspec = self.write("a.fidl", self.FIDL.replace(
+            "typedef A is S", "typedef A is Missing"))
+        with self.assertRaises(ProcessorException):
+            Processor().import_files([fspec])
+        # The lazy import succeeds, the access raises.
+        processor = Processor(lazy=True)
+        processor.import_files([fspec])
+        reference = self.references(processor.packages["P"])[0]
+        with self.assertRaises(ProcessorException) as context:
+            reference.reference
+        self.assertIn("Missing", str(context.exception))
+
+
+class TestImportDirectories(unittest.TestCase):
+    """Test model lookup in the package paths."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.import_dir = os.path.join(self.tmp_dir, "imports")
+        os.mkdir(self.import_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, name, text):
+        fspec = os.path.join(self.tmp_dir, name)
+        with open(fspec, "w") as f:
+            f.write(text)
+        return fspec
+
+    def test_file_added_between_batches(self):
+        user = """
+            package P.{}
+            import model "common.fidl"
+            typeCollection TC {{
+                typedef B is Int32
+            }}
+        """
+        processor = Processor()
+        processor.package_paths.append(self.import_dir)
+        with self.assertRaises(ProcessorException):
+            processor.import_files([self.write("a.fidl", user.format("a"))])
+        # Added to the import directory after it was listed.
+        self.write(os.path.join("imports", "common.fidl"), """
+            package P.common
+            typeCollection TC {
+                typedef A is Int32
+            }
+        """)
+        processor.import_files([self.write("b.fidl", user.format("b"))])
+        self.assertIn("P.common", processor.packages)
+        self.assertEqual(processor.dependencies["P.b"], {"P.common"})
+
+
+if __name__ == "__main__":
+    unittest.main()
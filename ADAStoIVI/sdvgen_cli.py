@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+################################################################
+#                        SDVGen CLI Tool                       #
+################################################################
+# GUI 없이 빌드 서버에서 쓰는 명령줄 도구
+#
+#   python sdvgen_cli.py arxml -P org.example -O outputs Sensor.arxml
+#   python sdvgen_cli.py fidl -J com.example.gen -O outputs Sensor.fidl
+#   python sdvgen_cli.py pipeline -P org.example -J com.example.gen -O outputs Sensor.arxml
+#
+# pipeline은 ARXML에서 생성한 FIDL을 디스크에서 다시 읽지 않고 메모리에서 바로 파싱함
+#
+#   python sdvgen_cli.py serve --socket /tmp/sdvgen.sock
+#   python sdvgen_cli.py --connect /tmp/sdvgen.sock fidl -J com.example.gen -O outputs Sensor.fidl
+#
+# serve는 모델과 파서를 메모리에 유지하는 daemon, --connect는 명령을 daemon에서 실행함 (sdvgen_daemon.py)
+# daemon에 연결할 수 없으면 --connect 없이 실행함
+#
+#   python sdvgen_cli.py pipeline --watch -P org.example -J com.example.gen -O outputs Sensor.arxml
+#
+# --watch는 입력 파일이 바뀔 때마다 바뀐 부분만 다시 생성함 (sdvgen_watch.py)
+
+# 변환기는 명령이 실행될 때 import함. --help와 arxml 명령은 FIDL 생성기와 pyfranca를 import하지 않음
+import argparse, os, sys, time
+from collections import OrderedDict
+from converter_common import JNI_VERSIONS, MANIFEST_FILE, write_output_file
+
+# fidl 하위 명령이 생성하는 출력, fidl_module_converter.generate의 option
+TARGETS = OrderedDict([("aidl", 0), ("client", 1), ("all", 2)])
+
+############################################ Commands ####################################################################################
+
+class Models(object):
+    """
+    Where the commands get their FIDL processor and ARXML trees from.
+        The daemon keeps them between requests, see sdvgen_daemon.
+
+    :ivar progress: Passed to arxml_converter.convert_arxml, see sdvgen_worker.
+    """
+    progress = None
+
+    def processor(self, args):
+        import fidl_module_converter as fidl
+        return fidl.create_processor(args)
+
+    def arxml_tree(self, path):
+        import arxml_converter as arxml
+        return arxml.parse_arxml(path)
+
+def jni_version(version):
+    """
+    JNI version given as "1_6" or "JNI_VERSION_1_6".
+    """
+    if not version.startswith("JNI_VERSION_"):
+        version = "JNI_VERSION_" + version
+    if version not in JNI_VERSIONS:
+        raise argparse.ArgumentTypeError("unknown JNI version {}, one of {}".format(version, ", ".join(JNI_VERSIONS)))
+    return version
+
+def print_errors(e):
+    for error in e.errors:
+        print("ERROR: {}".format(error))
+
+def write_files(files, output_dir):
+    for path, text in files.items():
+        write_output_file(os.path.join(output_dir, path), text)
+
+def run_arxml(args, models):
+    """
+    ARXML to FIDL and FDEPL.
+
+    :return: Exit status, 1 if an interface failed.
+    """
+    import arxml_converter as arxml
+    errors = 0
+    for arxml_file in args.arxml:
+        file_path = os.path.abspath(arxml_file)
+        success_cnt, error_cnt = arxml.convert_arxml(file_path, args.package,
+                                                     lambda path, text: write_output_file(os.path.join(args.output_dir, path), text),
+                                                     models.arxml_tree(file_path), models.progress)
+        print("Total {} interfaces in {}\nSuccess: {} Error: {}".format(success_cnt + error_cnt, arxml_file, success_cnt, error_cnt))
+        errors += error_cnt
+    return 1 if errors else 0
+
+def run_fidl(args, models):
+    """
+    FIDL to AIDL and the native client.
+
+    :return: Exit status, 1 if a model did not parse.
+    """
+    import fidl_module_converter as fidl
+    from pyfranca import ProcessorException
+    status = 0
+    processor = models.processor(args)
+    try:
+        processor.import_files(args.fidl)
+    except ProcessorException as e:
+        print_errors(e)
+        status = 1
+    try:
+        fidl.resolve_lazy_references(processor)
+    except ProcessorException as e:
+        print_errors(e)
+        status = 1
+    if args.dump:
+        fidl.dump_packages(processor.packages)
+    if not fidl.generate(processor.packages, args, TARGETS[args.target]):
+        return 1
+    return status
+
+def run_pipeline(args, models):
+    """
+    ARXML to FIDL to AIDL and the native client in one process.
+
+    The FIDLs go from the ARXML converter to the parser in memory, they are
+        written to the output directory only as a build artifact.
+
+    :return: Exit status, 1 if an interface or a model failed.
+    """
+    import arxml_converter as arxml
+    import fidl_module_converter as fidl
+    from pyfranca import ProcessorException
+    status = 0
+    timings = OrderedDict()
+
+    start = time.perf_counter()
+    files = OrderedDict()
+    for arxml_file in args.arxml:
+        file_path = os.path.abspath(arxml_file)
+        success_cnt, error_cnt = arxml.convert_arxml(file_path, args.package, files.__setitem__, models.arxml_tree(file_path), models.progress)
+        print("Total {} interfaces in {}\nSuccess: {} Error: {}".format(success_cnt + error_cnt, arxml_file, success_cnt, error_cnt))
+        if error_cnt:
+            status = 1
+    if args.fidl_output:
+        write_files(files, args.output_dir)
+    timings["arxml"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    processor = models.processor(args)
+    fidls = OrderedDict((os.path.join(args.output_dir, path), text) for path, text in files.items() if path.endswith(".fidl"))
+    try:
+        processor.import_strings(fidls)
+    except ProcessorException as e:
+        print_errors(e)
+        status = 1
+    try:
+        fidl.resolve_lazy_references(processor)
+    except ProcessorException as e:
+        print_errors(e)
+        status = 1
+    if args.dump:
+        fidl.dump_packages(processor.packages)
+    timings["fidl"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if not fidl.generate(processor.packages, args, TARGETS[args.target]):
+        return 1
+    timings["generate"] = time.perf_counter() - start
+
+    print("Stages: {}".format(", ".join("{} {:.3f}s".format(stage, seconds) for stage, seconds in timings.items())))
+    return status
+
+def run_serve(args, models):
+    """
+    Run the daemon until it is stopped.
+    """
+    import sdvgen_daemon
+    return sdvgen_daemon.serve(args.socket, args.max_requests)
+
+######################################### Argument parser ####################################################################
+
+def add_output_argument(parser):
+    parser.add_argument(
+        "-O", "--output", dest="output_dir", action="store", help="Output directory.", default='outputs'
+    )
+
+def add_watch_arguments(parser):
+    parser.add_argument(
+        "--watch", dest="watch", action="store_true", help="Run again whenever the inputs change, parsing and generating only what changed (sdvgen_watch.py)."
+    )
+    parser.add_argument(
+        "--debounce", dest="debounce", metavar="seconds", action="store", type=float, default=0.3, help="With --watch, wait until the inputs stayed unchanged this long."
+    )
+    parser.add_argument(
+        "--poll-interval", dest="poll_interval", metavar="seconds", action="store", type=float, default=1.0, help="With --watch, check the inputs this often when inotify is not available."
+    )
+
+def add_fidl_arguments(parser):
+    parser.add_argument(
+        "-V", "--jni_version", dest="jniversion", action="store", type=jni_version, default="JNI_VERSION_1_6", help="Version of the JNI, e.g. 1_6."
+    )
+    parser.add_argument(
+        "-J", "--packagejava", dest="packagejava", action="store", help="Package name of Java", required=True
+    )
+    parser.add_argument(
+        "-T", "--target", dest="target", action="store", choices=list(TARGETS), default="all", help="Generate the AIDL, the native client (JNI, C++ client and Service stub) or both."
+    )
+    parser.add_argument(
+        "-I", "--import", dest="import_dirs", metavar="import_dir", action="append", help="Model import directories."
+    )
+    parser.add_argument(
+        "-L", "--lazy", dest="lazy", action="store_true", help="Resolve type references only when they are used."
+    )
+    parser.add_argument(
+        "--comments", dest="comments", action="store", choices=["parse", "lazy", "drop"], default="parse", help="Parse structured comments eagerly, on first use, or drop them."
+    )
+    parser.add_argument(
+        "--engine", dest="engine", action="store", choices=["ply", "fast"], default="ply", help="FIDL parser engine: PLY or the hand-written fast parser."
+    )
+    parser.add_argument(
+        "-j", "--jobs", dest="jobs", action="store", type=int, default=1, help="Generate interfaces in this many processes, 0 for one per CPU."
+    )
+    parser.add_argument(
+        "--incremental", dest="incremental", action="store_true", help="Generate only the interfaces and type collections changed since the last run, recorded in {} of the output directory.".format(MANIFEST_FILE)
+    )
+    parser.add_argument(
+        "--stream", dest="stream", action="store_true", help="Write the files of every interface as soon as they are generated."
+    )
+    parser.add_argument(
+        "--profile", dest="profile", metavar="json", action="store", help="Write the generation profile of every interface and member to this JSON file. Generates serially."
+    )
+    parser.add_argument(
+        "--profile-top", dest="profile_top", metavar="N", action="store", type=int, default=10, help="Entries of each --profile summary table."
+    )
+    parser.add_argument(
+        "--dump", dest="dump", action="store_true", help="Print the parsed models."
+    )
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="sdvgen", description="SDVGen code converter without the GUI.")
+    parser.add_argument(
+        "--connect", dest="connect", metavar="socket", action="store", help="Run the command in the daemon listening on this socket, see serve."
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+
+    command = commands.add_parser("arxml", help="ARXML to FIDL and FDEPL.")
+    command.add_argument(
+        "-P", "--package", dest="package", action="store", help="Use this option if you want to specify package of the FIDLs and FDEPLs"
+    )
+    command.add_argument(
+        "arxml", nargs="+", help="Input ARXML file(s)"
+    )
+    add_output_argument(command)
+    add_watch_arguments(command)
+    command.set_defaults(run=run_arxml)
+
+    command = commands.add_parser("fidl", help="FIDL to AIDL and the native client.")
+    add_fidl_arguments(command)
+    command.add_argument(
+        "fidl", nargs="+", help="Input FIDL file(s)."
+    )
+    add_output_argument(command)
+    add_watch_arguments(command)
+    command.set_defaults(run=run_fidl)
+
+    command = commands.add_parser("pipeline", help="ARXML to FIDL to AIDL and the native client, the models stay in memory.")
+    command.add_argument(
+        "-P", "--package", dest="package", action="store", help="Package of the FIDLs generated from the ARXML."
+    )
+    command.add_argument(
+        "--no-fidl-output", dest="fidl_output", action="store_false", help="Do not write the intermediate FIDL and FDEPL files."
+    )
+    add_fidl_arguments(command)
+    command.add_argument(
+        "arxml", nargs="+", help="Input ARXML file(s)"
+    )
+    add_output_argument(command)
+    add_watch_arguments(command)
+    command.set_defaults(run=run_pipeline)
+
+    command = commands.add_parser("serve", help="Daemon keeping the parsers, the parsed models and the generators loaded, runs the commands sent with --connect.")
+    command.add_argument(
+        "--socket", dest="socket", action="store", help="Unix domain socket to listen on.", required=True
+    )
+    command.add_argument(
+        "--max-requests", dest="max_requests", metavar="N", action="store", type=int, default=os.cpu_count() or 1, help="Requests run at the same time."
+    )
+    command.set_defaults(run=run_serve)
+
+    args = parser.parse_args(argv)
+    if args.connect and args.command == "serve":
+        parser.error("--connect can not be used with serve")
+    if args.connect and getattr(args, "watch", False):
+        parser.error("--connect can not be used with --watch")
+    return args
+
+############################################ Main ####################################################################################
+
+def execute(args, models=None):
+    """
+    Run the command of parsed arguments.
+
+    :param models: Models of the command, new ones if None.
+    :return: Exit status.
+    """
+    if models is None:
+        models = Models()
+    if getattr(args, "watch", False):
+        import sdvgen_watch
+        return sdvgen_watch.watch(args, models)
+    try:
+        return args.run(args, models)
+    except (Exception) as e:
+        print("EXECUTION ERROR: {}".format(e))
+        return 1
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parse_command_line(argv)
+    if args.connect:
+        import sdvgen_daemon
+        try:
+            response = sdvgen_daemon.request(args.connect, argv)
+        except (sdvgen_daemon.DaemonUnavailable) as e:
+            # daemon이 없으면 이 프로세스에서 실행함
+            sys.stderr.write("No daemon on {}, running the command here\n".format(e))
+            return execute(args)
+        sys.stdout.write(response["output"])
+        return response["status"]
+    return execute(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
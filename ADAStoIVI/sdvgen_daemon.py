@@ -0,0 +1,510 @@
+#!/usr/bin/env python
+################################################################
+#                         SDVGen Daemon                        #
+################################################################
+# 빌드 시스템이 모듈마다 생성기를 실행할 때마다 드는 Python 시작, import, PLY 테이블 생성, 모델 파싱을
+# 한 번만 하도록 상주하는 daemon. sdvgen_cli.py serve로 시작하고 sdvgen_cli.py --connect로 명령을 보냄
+#
+# Unix domain socket에 연결마다 JSON 요청 하나, 클라이언트는 요청을 보낸 뒤 쓰기 쪽을 닫음
+#   {"argv": ["fidl", "-J", "com.example.gen", "-O", "outputs", "Sensor.fidl"], "cwd": "/path/of/the/module"}
+# 응답
+#   {"status": 0, "output": "...", "seconds": 0.42}
+#
+# 요청마다 fork한 프로세스에서 실행하므로 동시에 처리되는 요청끼리 생성기의 전역 상태, 작업 디렉토리, 출력이 섞이지 않음.
+# 요청 프로세스는 daemon이 파싱해 둔 FIDL/ARXML과 fidl 명령의 resolve된 Processor를 그대로 물려받고,
+# 직접 파싱한 파일 목록과 사용한 Processor를 돌려주면 daemon이 다음 요청을 위해 파싱하거나 바뀐 파일만
+# reload_file로 갱신해 둠. 같은 출력 디렉토리의 요청은 차례로 실행됨.
+# 요청과 요청 프로세스의 보고는 selectors로 non-blocking으로 읽으므로 느린 클라이언트가 다른 요청을 막지 않음.
+# 보고된 파일의 파싱과 Processor 갱신은 처리할 연결이 없을 때 하나씩 함.
+# socket은 daemon을 실행한 사용자만 연결할 수 있음 (0600).
+
+import contextlib, io, json, os, selectors, signal, socket, sys, time
+from collections import OrderedDict, deque
+import arxml_converter as arxml
+import fidl_module_converter as fidl
+import sdvgen_cli
+from pyfranca import Processor
+
+# 이 시간 안에 요청을 다 보내지 않는 연결은 닫음
+REQUEST_TIMEOUT = 10.0
+
+# daemon이 유지하는 resolve된 Processor의 수, 오래 쓰지 않은 것부터 버림
+MAX_PROCESSORS = 16
+
+############################################ Models ####################################################################################
+
+class ModelCache(object):
+    """
+    Parsed FIDL files and ARXML trees by path, valid while the file keeps
+        its modification time and size, and the FIDL parsers.
+
+    The entries are never resolved in the daemon. A request process gets
+        them through fork and resolves its own copy. Only the Processors of
+        fidl requests are kept resolved, by the inputs of the request.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.parsers = {}
+        self.processors = OrderedDict()
+
+    @staticmethod
+    def signature(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def parser(self, engine, comments):
+        """
+        FIDL parser of engine and comments, see Processor.
+        """
+        parser = self.parsers.get((engine, comments))
+        if parser is None:
+            parser = Processor(comments=comments, engine=engine).parser()
+            self.parsers[(engine, comments)] = parser
+        return parser
+
+    def take(self, key, path):
+        """
+        Remove and return the entry of key, None if path changed since it was parsed.
+        """
+        entry = self.entries.pop(key, None)
+        if entry is not None and entry[0] == self.signature(path):
+            return entry[1]
+        return None
+
+    def load(self, kind, path, engine=None, comments=None):
+        """
+        Parse a "fidl" or "arxml" file into the cache, unless the cached one is current.
+        """
+        key = (kind, path, engine, comments)
+        signature = self.signature(path)
+        entry = self.entries.get(key)
+        if signature is None or (entry is not None and entry[0] == signature):
+            return
+        try:
+            if kind == "fidl":
+                value = self.parser(engine, comments).parse_file(path)
+            else:
+                value = arxml.parse_arxml(path)
+        except (Exception) as e:
+            # 요청에서 이미 에러로 보고됨
+            self.entries.pop(key, None)
+            return
+        self.entries[key] = (signature, value)
+
+    def refresh_processor(self, spec):
+        """
+        Bring the Processor of a fidl request up to date for the next
+            request: reload the files that changed since it was resolved,
+            or import and resolve the files of spec if it has none yet.
+            A Processor with errors is dropped, the next request reports them.
+
+        :param spec: Inputs of the request, see processor_spec.
+        """
+        key = processor_key(spec)
+        entry = self.processors.pop(key, None)
+        since = time.time()
+        try:
+            changed = entry.changed() if entry is not None else None
+            if changed is None:
+                processor = Processor(lazy=spec["lazy"], comments=spec["comments"], engine=spec["engine"],
+                                      parser=self.parser(spec["engine"], spec["comments"]))
+                processor.package_paths.extend(spec["import_dirs"])
+                processor.import_files(spec["fidl"])
+                entry = ProcessorEntry(processor)
+            else:
+                for fspec in changed:
+                    entry.processor.reload_file(fspec)
+            fidl.resolve_lazy_references(entry.processor)
+        except (Exception) as e:
+            # 요청에서 이미 에러로 보고됨
+            return
+        entry.snapshot(since)
+        self.processors[key] = entry
+        while len(self.processors) > MAX_PROCESSORS:
+            self.processors.popitem(last=False)
+
+class ProcessorEntry(object):
+    """
+    Resolved Processor of the daemon with the signatures of its files.
+    """
+
+    def __init__(self, processor):
+        self.processor = processor
+        self.signatures = {}
+
+    def snapshot(self, since):
+        """
+        Record the signatures of the files, files modified after since may
+            have been read before the change and count as changed.
+        """
+        since_ns = int(since * 1e9)
+        self.signatures = {}
+        for fspec in self.processor.files:
+            signature = ModelCache.signature(fspec)
+            self.signatures[fspec] = signature if signature is not None and signature[0] < since_ns else None
+
+    def changed(self):
+        """
+        :return: Files changed since the snapshot, None if one was removed.
+        """
+        changed = []
+        for fspec, signature in self.signatures.items():
+            current = ModelCache.signature(fspec)
+            if current is None:
+                return None
+            if current != signature:
+                changed.append(fspec)
+        return changed
+
+def processor_spec(args):
+    """
+    Inputs of the Processor of a fidl request, with real paths, so that
+        requests from other directories share it.
+    """
+    return {"fidl": [os.path.realpath(fspec) for fspec in args.fidl],
+            "import_dirs": [os.path.realpath(path) for path in (args.import_dirs or [])],
+            "engine": getattr(args, "engine", "ply"), "comments": getattr(args, "comments", "parse"),
+            "lazy": getattr(args, "lazy", False)}
+
+def processor_key(spec):
+    return (tuple(spec["fidl"]), tuple(spec["import_dirs"]), spec["engine"], spec["comments"], spec["lazy"])
+
+class CachingParser(object):
+    """
+    FIDL parser of a request, parse_file takes unchanged files from the cache
+        and records the files it parses itself.
+    """
+
+    def __init__(self, models, engine, comments):
+        self.models = models
+        self.engine = engine
+        self.comments = comments
+
+    def parse(self, fidl):
+        return self.models.cache.parser(self.engine, self.comments).parse(fidl)
+
+    def parse_file(self, fspec):
+        package = self.models.cache.take(("fidl", fspec, self.engine, self.comments), fspec)
+        if package is None:
+            package = self.models.cache.parser(self.engine, self.comments).parse_file(fspec)
+            self.models.parsed.append(["fidl", fspec, self.engine, self.comments])
+        return package
+
+class DaemonModels(sdvgen_cli.Models):
+    """
+    Models of a request, taken from the cache of the daemon.
+
+    :ivar parsed: Files the request parsed itself, as arguments of ModelCache.load.
+    :ivar processors: Inputs of the Processors the request used, as arguments
+        of ModelCache.refresh_processor.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.parsed = []
+        self.processors = []
+
+    def processor(self, args):
+        parser = CachingParser(self, getattr(args, "engine", "ply"), getattr(args, "comments", "parse"))
+        if(args.command != "fidl"):
+            return fidl.create_processor(args, parser)
+        spec = processor_spec(args)
+        self.processors.append(spec)
+        entry = self.cache.processors.get(processor_key(spec))
+        changed = entry.changed() if entry is not None else None
+        if(changed is not None):
+            # 이 프로세스의 복사본만 바뀌므로 실패하면 새 Processor로 에러를 보고함
+            try:
+                for fspec in changed:
+                    entry.processor.reload_file(fspec)
+                return entry.processor
+            except (Exception) as e:
+                pass
+        return fidl.create_processor(args, parser)
+
+    def arxml_tree(self, path):
+        tree = self.cache.take(("arxml", path, None, None), path)
+        if tree is None:
+            tree = arxml.parse_arxml(path)
+            self.parsed.append(["arxml", path, None, None])
+        return tree
+
+############################################ Requests ####################################################################################
+
+class DaemonUnavailable(Exception):
+    """
+    No daemon accepts connections on the socket, the request was not sent.
+    """
+
+def receive(connection):
+    chunks = []
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+def request(socket_path, argv, cwd=None):
+    """
+    Run a sdvgen_cli command in the daemon.
+
+    :param cwd: Directory the paths of argv are relative to, the current one if None.
+    :return: Response dictionary with the exit status, the output and the seconds of the command.
+    :raise DaemonUnavailable: The daemon could not be reached.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(socket_path)
+        except (OSError) as e:
+            raise DaemonUnavailable("{}: {}".format(socket_path, e))
+        client.sendall(json.dumps({"argv": list(argv), "cwd": cwd or os.getcwd()}).encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        return json.loads(receive(client).decode("utf-8"))
+    finally:
+        client.close()
+
+def output_key(request):
+    """
+    Real path of the output directory of a request, None if its arguments are invalid.
+    """
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            args = sdvgen_cli.parse_command_line(request["argv"])
+        return os.path.realpath(os.path.join(request.get("cwd", "/"), args.output_dir))
+    except (SystemExit, Exception):
+        return None
+
+def run_request(connection, request, cache):
+    """
+    Run one request in its process and send the response.
+
+    :return: Report of the files the request parsed itself and the
+        Processors it used.
+    """
+    start = time.perf_counter()
+    models = DaemonModels(cache)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            os.chdir(request.get("cwd", "/"))
+            args = sdvgen_cli.parse_command_line(request["argv"])
+            if(args.command == "serve"):
+                print("ERROR: serve can not run in the daemon")
+                status = 1
+            else:
+                status = sdvgen_cli.execute(args, models)
+        except (SystemExit) as e:
+            # argparse
+            status = e.code if isinstance(e.code, int) else 1
+        except (Exception) as e:
+            print("REQUEST ERROR: {}".format(e))
+            status = 1
+    response = {"status": status, "output": output.getvalue(), "seconds": time.perf_counter() - start}
+    connection.sendall(json.dumps(response).encode("utf-8"))
+    connection.close()
+    return {"parsed": models.parsed, "processors": models.processors}
+
+def start_request(connection, request, cache, inherited):
+    """
+    Fork the process of a request.
+
+    :param inherited: Sockets, report pipe descriptors and the selector of
+        the daemon, which the process closes.
+    :return: Non-blocking descriptor of the pipe the process writes its
+        report to, and its pid.
+    """
+    read_fd, write_fd = os.pipe()
+    sys.stdout.flush()
+    pid = os.fork()
+    if(pid == 0):
+        status = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            os.close(read_fd)
+            for item in inherited:
+                if(isinstance(item, int)):
+                    os.close(item)
+                elif(item is not connection):
+                    item.close()
+            report = run_request(connection, request, cache)
+            with os.fdopen(write_fd, "w") as pipe:
+                json.dump(report, pipe)
+            status = 0
+        finally:
+            os._exit(status)
+    os.close(write_fd)
+    connection.close()
+    os.set_blocking(read_fd, False)
+    return read_fd, pid
+
+def queue_report(refreshes, report):
+    """
+    Queue the files a request parsed and the Processors it used, see refresh.
+
+    :param refreshes: Queued refreshes by their key, a refresh queued again
+        keeps its place.
+    :param report: JSON report of the request process, empty if it failed.
+    """
+    try:
+        report = json.loads(report.decode("utf-8")) if report else {}
+    except (ValueError):
+        report = {}
+    for entry in report.get("parsed", []):
+        refreshes[("load",) + tuple(entry)] = ("load", entry)
+    for spec in report.get("processors", []):
+        refreshes[("processor",) + processor_key(spec)] = ("processor", spec)
+
+def refresh(cache, item):
+    """
+    Parse a file into the cache or refresh a Processor, queued by queue_report.
+    """
+    kind, value = item
+    if(kind == "load"):
+        cache.load(*value)
+    else:
+        cache.refresh_processor(value)
+
+def error_response(message):
+    return json.dumps({"status": 1, "output": "ERROR: {}\n".format(message), "seconds": 0.0}).encode("utf-8")
+
+############################################ Server ####################################################################################
+
+def stop(signum, frame):
+    raise SystemExit(0)
+
+def serve(socket_path, max_requests=1):
+    """
+    Serve requests on a Unix domain socket until SIGTERM or SIGINT.
+
+    :param max_requests: Requests run at the same time.
+    :return: Exit status.
+    """
+    if(os.path.exists(socket_path)):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+            print("ERROR: A daemon is already listening on {}".format(socket_path))
+            return 1
+        except (OSError):
+            os.unlink(socket_path)
+        finally:
+            probe.close()
+    cache = ModelCache()
+    cache.parser("ply", "parse")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    server.listen(64)
+    signal.signal(signal.SIGTERM, stop)
+    print("Listening on {}".format(socket_path))
+    sys.stdout.flush()
+
+    running = {} # report pipe -> (pid, output directory, received chunks)
+    pending = deque() # (connection, request, output directory)
+    receiving = {} # connection -> (received chunks, deadline)
+    refreshes = OrderedDict() # see queue_report
+    selector = selectors.DefaultSelector()
+    selector.register(server, selectors.EVENT_READ)
+
+    def start_pending():
+        busy = set(key for _, key, _ in running.values() if key is not None)
+        for item in list(pending):
+            if(len(running) >= max_requests):
+                break
+            connection, request, key = item
+            if(key is not None and key in busy):
+                continue
+            pending.remove(item)
+            inherited = [server, selector] + list(running) + list(receiving) + [other for other, _, _ in pending]
+            report, pid = start_request(connection, request, cache, inherited)
+            running[report] = (pid, key, [])
+            selector.register(report, selectors.EVENT_READ)
+            busy.add(key)
+
+    def drop(connection):
+        selector.unregister(connection)
+        del receiving[connection]
+        connection.close()
+
+    try:
+        while True:
+            timeout = None
+            if(receiving):
+                timeout = max(0, min(deadline for _, deadline in receiving.values()) - time.monotonic())
+            if(refreshes and not pending):
+                timeout = 0
+            events = selector.select(timeout)
+            for selected, _ in events:
+                ready = selected.fileobj
+                if(ready is server):
+                    connection, _ = server.accept()
+                    connection.setblocking(False)
+                    receiving[connection] = ([], time.monotonic() + REQUEST_TIMEOUT)
+                    selector.register(connection, selectors.EVENT_READ)
+                elif(ready in receiving):
+                    try:
+                        chunk = ready.recv(65536)
+                    except (BlockingIOError):
+                        continue
+                    except (OSError):
+                        drop(ready)
+                        continue
+                    if(chunk):
+                        receiving[ready][0].append(chunk)
+                        continue
+                    chunks, _ = receiving[ready]
+                    selector.unregister(ready)
+                    del receiving[ready]
+                    ready.setblocking(True)
+                    try:
+                        request = json.loads(b"".join(chunks).decode("utf-8"))
+                        if(not isinstance(request, dict) or not isinstance(request.get("argv"), list)):
+                            raise ValueError("argv missing")
+                    except (ValueError) as e:
+                        try:
+                            ready.sendall(error_response("Invalid request: {}".format(e)))
+                        except (OSError):
+                            pass
+                        ready.close()
+                        continue
+                    pending.append((ready, request, output_key(request)))
+                else:
+                    try:
+                        chunk = os.read(ready, 65536)
+                    except (BlockingIOError):
+                        continue
+                    if(chunk):
+                        running[ready][2].append(chunk)
+                        continue
+                    selector.unregister(ready)
+                    os.close(ready)
+                    pid, _, chunks = running.pop(ready)
+                    os.waitpid(pid, 0)
+                    queue_report(refreshes, b"".join(chunks))
+            now = time.monotonic()
+            for connection, (_, deadline) in list(receiving.items()):
+                if(deadline <= now):
+                    drop(connection)
+            start_pending()
+            if(refreshes and not events and not pending):
+                # 기다리는 연결이 없을 때만, 하나 끝날 때마다 다시 select
+                _, item = refreshes.popitem(last=False)
+                refresh(cache, item)
+    except (KeyboardInterrupt):
+        pass
+    finally:
+        selector.close()
+        server.close()
+        if(os.path.exists(socket_path)):
+            os.unlink(socket_path)
+        for connection in list(receiving) + [connection for connection, _, _ in pending]:
+            connection.close()
+        for report, (pid, _, _) in running.items():
+            os.close(report)
+            os.waitpid(pid, 0)
+    return 0
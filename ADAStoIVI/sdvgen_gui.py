@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+################################################################
+#                        SDVGen GUI Tool                       #
+################################################################
+# SDVGen.py가 GUI를 실행할 때만 import함. 변환기는 작업 프로세스에서만 import함
+import sys
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import re
+import sdvgen_worker
+
+# 작업 프로세스의 event를 읽는 간격 (ms)
+POLL_INTERVAL = 100
+
+class GUIApp(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("Code Converter ver0.3 (240719)")
+        self.geometry("1200x800")  # Increased size to accommodate all buttons
+
+        # Left frame for monitor
+        self.monitor_frame = tk.Frame(self)
+        self.monitor_frame.pack(side=tk.LEFT, fill=tk.Y)
+
+        # Monitor
+        self.monitor = tk.Text(self.monitor_frame, height=50, state="disabled")
+        self.monitor.pack(fill="both", padx=10, pady=10)
+
+        # Right frame for other widgets
+        self.widget_frame = tk.Frame(self)
+        self.widget_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+
+        # Variables
+        self.selected_files = []
+        self.selected_arxml_files = []
+        self.package_name = tk.StringVar()
+        self.package_name.set("Write your Java package name")
+        self.arxml_package_name = tk.StringVar()
+        self.arxml_package_name.set("Write your FIDL package name")
+        self.committed_package = tk.StringVar()  # Variable to store committed package name
+        self.committed_arxml_package = tk.StringVar()
+        self.output_dir = "outputs"
+        self.version = tk.StringVar()
+        self.version.set("JNI_VERSION_1_6")
+
+
+        # New Package Name Entry for ARXML
+        self.arxml_package_name_entry = tk.Entry(self.widget_frame, textvariable=self.arxml_package_name, fg="grey")
+        self.arxml_package_name_entry.bind("<FocusIn>", self.clear_arxml_entry)
+        self.arxml_package_name_entry.bind("<FocusOut>", self.restore_arxml_placeholder)
+        self.arxml_package_name_entry.pack(pady=10)
+
+        # New Commit Button for ARXML
+        self.arxml_commit_button = tk.Button(self.widget_frame, text="Commit FIDL Package", command=self.print_arxml_package_name_and_save)
+        self.arxml_commit_button.pack()
+
+        # Committed ARXML Package Name Display
+        self.committed_arxml_package_label = tk.Label(self.widget_frame, text="Committed FIDL Package Name:")
+        self.committed_arxml_package_label.pack()
+        self.committed_arxml_package_display = tk.Label(self.widget_frame, textvariable=self.committed_arxml_package)
+        self.committed_arxml_package_display.pack()
+
+        # Selected ARXML Files
+        self.selected_arxml_files_label = tk.Label(self.widget_frame, text="Selected ARXML Files:")
+        self.selected_arxml_files_label.pack()
+        self.selected_arxml_files_text = tk.Text(self.widget_frame, height=3, width=50)
+        self.selected_arxml_files_text.pack()
+        self.select_arxml_files_button = tk.Button(self.widget_frame, text="Select ARXML Files", command=self.select_arxml_files)
+        self.select_arxml_files_button.pack(pady=5)
+
+        # Output Directory Selection
+        self.output_dir_label = tk.Label(self.widget_frame, text="Output Directory:")
+        self.output_dir_label.pack()
+        self.output_dir_text = tk.Text(self.widget_frame, height=1, width=50)
+        self.output_dir_text.insert(tk.END, self.output_dir)
+        self.output_dir_text.pack()
+        self.select_output_dir_button = tk.Button(self.widget_frame, text="Select Output Dir", command=self.select_output_dir)
+        self.select_output_dir_button.pack()
+        
+        # ARXML Converter Button
+        self.convert3_button = tk.Button(self.widget_frame, text="ARXML to FIDL and FDEPL", command=self.convert3)
+        self.convert3_button.pack(padx=10, pady=5) #side="left",
+        
+        # Separator
+        self.separator1 = ttk.Separator(self.widget_frame, orient='horizontal')
+        self.separator1.pack()
+        
+        # Version Selection
+        self.version_label = tk.Label(self.widget_frame, text="Select JNI Version:")
+        self.version_label.pack()
+        self.version_option_menu = tk.OptionMenu(self.widget_frame, self.version, "JNI_VERSION_1_1", "JNI_VERSION_1_2", "JNI_VERSION_1_4", "JNI_VERSION_1_6", "JNI_VERSION_1_8", "JNI_VERSION_9", "JNI_VERSION_10", "JNI_VERSION_19", "JNI_VERSION_20", "JNI_VERSION_21")
+        self.version_option_menu.pack()
+
+        # Package Name Entry
+        self.package_name_entry = tk.Entry(self.widget_frame, textvariable=self.package_name, fg="grey")
+        self.package_name_entry.bind("<FocusIn>", self.clear_entry)
+        self.package_name_entry.bind("<FocusOut>", self.restore_placeholder)
+        self.package_name_entry.pack()
+
+        # Commit Button
+        self.commit_button = tk.Button(self.widget_frame, text="Commit", command=self.print_package_name_and_save)
+        self.commit_button.pack()
+        
+        # Committed Package Name Display
+        self.committed_package_label = tk.Label(self.widget_frame, text="Committed Package Name:")
+        self.committed_package_label.pack()
+        self.committed_package_display = tk.Label(self.widget_frame, textvariable=self.committed_package)
+        self.committed_package_display.pack()
+
+        # Selected Files
+        self.selected_files_label = tk.Label(self.widget_frame, text="Selected FIDL Files:")
+        self.selected_files_label.pack()
+        self.selected_files_text = tk.Text(self.widget_frame, height=3, width=50)
+        self.selected_files_text.pack()
+        self.select_files_button = tk.Button(self.widget_frame, text="Select FIDL Files", command=self.select_files)
+        self.select_files_button.pack(pady=5)
+
+        # Convert Buttons
+        self.convert1_button = tk.Button(self.widget_frame, text="FIDL to AIDL", command=self.convert1)
+        self.convert1_button.pack(padx=10, pady=5)
+        self.convert2_button = tk.Button(self.widget_frame, text="FIDL to Communication Module Code", command=self.convert2)
+        self.convert2_button.pack(padx=10, pady=5) #side="left",
+
+        # Separator
+        self.separator2 = ttk.Separator(self.widget_frame, orient='horizontal')
+        self.separator2.pack()
+
+        # Progress of the running conversion
+        self.conversions = sdvgen_worker.ConversionQueue(self.conversion_event)
+        self.polling = False
+        self.status = tk.StringVar()
+        self.status.set("Idle")
+        self.progress_text = tk.StringVar()
+        self.status_label = tk.Label(self.widget_frame, textvariable=self.status)
+        self.status_label.pack()
+        self.progress_bar = ttk.Progressbar(self.widget_frame, orient="horizontal", length=400, mode="determinate")
+        self.progress_bar.pack(pady=5)
+        self.progress_label = tk.Label(self.widget_frame, textvariable=self.progress_text)
+        self.progress_label.pack()
+        self.cancel_button = tk.Button(self.widget_frame, text="Cancel", command=self.cancel_conversion, state="disabled")
+        self.cancel_button.pack(padx=10, pady=5)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def clear_entry(self, event):
+        if self.package_name_entry.get() == "Write your Java package name":
+            self.package_name_entry.delete(0, tk.END)
+            self.package_name_entry.config(fg="black")
+
+    def restore_placeholder(self, event):
+        if not self.package_name_entry.get():
+            self.package_name_entry.config(fg="grey")
+            self.package_name_entry.insert(0, "Write your Java package name")
+
+    def clear_arxml_entry(self, event):
+        if self.arxml_package_name_entry.get() == "Write your FIDL package name":
+            self.arxml_package_name_entry.delete(0, tk.END)
+            self.arxml_package_name_entry.config(fg="black")
+
+    def restore_arxml_placeholder(self, event):
+        if not self.arxml_package_name_entry.get():
+            self.arxml_package_name_entry.config(fg="grey")
+            self.arxml_package_name_entry.insert(0, "Write your FIDL package name")
+
+    def print_arxml_package_name_and_save(self):
+        package_name = self.arxml_package_name.get()
+        # Validate the package name format
+        if self.validate_package_name(package_name):
+            self.committed_arxml_package.set(package_name)  # Save the committed ARXML package name
+        else:
+            messagebox.showerror("Error", "Invalid ARXML package name format")
+
+    def print_package_name_and_save(self):
+        package_name = self.package_name.get()
+        # Validate the package name format
+        if self.validate_package_name(package_name):
+            self.committed_package.set(package_name)  # Save the committed package name
+        else:
+            messagebox.showerror("Error", "Invalid package name format")
+
+    def validate_package_name(self, package_name):
+        # Validate package name format
+        if not package_name:
+            return False
+        # if not package_name.replace(".", "").isalpha():
+        #     return False
+        if not re.match(r'^[A-Za-z0-9.]+$', package_name):
+            return False
+        if package_name.endswith("."):
+            return False
+        return True
+
+    def select_output_dir(self):
+        self.output_dir = filedialog.askdirectory()
+        self.output_dir_text.delete(1.0, tk.END)
+        self.output_dir_text.insert(tk.END, self.output_dir)
+
+    def select_files(self):
+        self.selected_files = filedialog.askopenfilenames(filetypes=[("FIDL Files", "*.fidl")])
+        self.selected_files_text.delete(1.0, tk.END)
+        for file in self.selected_files:
+            self.selected_files_text.insert(tk.END, f"{file}\n")
+
+    def select_arxml_files(self):
+        self.selected_arxml_files = filedialog.askopenfilenames(filetypes=[("ARXML Files", "*.arxml")])
+        self.selected_arxml_files_text.delete(1.0, tk.END)
+        for file in self.selected_arxml_files:
+            self.selected_arxml_files_text.insert(tk.END, f"{file}\n")
+
+    ############ Conversions ############
+    # 변환은 sdvgen_worker.ConversionQueue가 작업 프로세스에서 sdvgen_cli 명령으로 실행하고 (sdvgen_worker.py), 출력과 진행 상황은 after()로 poll해서 표시함.
+    # 실행 중에 누른 변환은 차례로 실행됨
+
+    def write_monitor(self, text):
+        self.monitor.configure(state="normal")
+        self.monitor.insert(tk.END, text)
+        self.monitor.see(tk.END)
+        self.monitor.configure(state="disabled")
+
+    def queue_conversion(self, title, argv):
+        self.conversions.add(title, argv)
+        self.update_status()
+        if not self.polling:
+            self.polling = True
+            self.after(POLL_INTERVAL, self.poll_events)
+
+    def poll_events(self):
+        self.polling = self.conversions.poll()
+        if self.polling:
+            self.after(POLL_INTERVAL, self.poll_events)
+
+    def conversion_event(self, title, kind, value):
+        if(kind == "started"):
+            self.write_monitor("{}.\n".format(title))
+            self.progress_bar.configure(mode="indeterminate", value=0)
+            self.progress_bar.start()
+            self.cancel_button.configure(state="normal")
+            self.update_status()
+        elif(kind == "output"):
+            self.write_monitor(value)
+        elif(kind == "progress"):
+            self.show_progress(value)
+        elif(kind == "finished"):
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode="determinate", value=0)
+            self.write_monitor("{}: {}\n".format(title, value))
+            self.progress_text.set("{}: {}".format(title, value))
+            self.cancel_button.configure(state="disabled")
+            self.update_status()
+
+    def show_progress(self, progress):
+        if(progress["total"]):
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode="determinate", maximum=progress["total"], value=progress["done"])
+        text = progress["phase"]
+        if progress["interface"]:
+            text += " {}".format(progress["interface"])
+        if progress["total"]:
+            text += " ({}/{})".format(progress["done"], progress["total"])
+        if progress["file"]:
+            text += " in {}".format(progress["file"])
+        self.progress_text.set(text)
+
+    def cancel_conversion(self):
+        dropped = self.conversions.cancel()
+        if dropped:
+            self.write_monitor("{} queued conversions cancelled.\n".format(dropped))
+
+    def update_status(self):
+        if self.conversions.current is None:
+            self.status.set("Idle")
+        else:
+            self.status.set("Running: {}, {} queued".format(self.conversions.current, len(self.conversions.queued)))
+
+    def on_close(self):
+        self.cancel_conversion()
+        self.destroy()
+
+    # FIDL to AIDL conversion
+    def convert1(self):
+        if not self.selected_files or not self.committed_package.get():
+            messagebox.showerror("Error", "File not selected or package name not given")
+        else:
+            self.queue_conversion("Converting FIDL to AIDL",
+                                  ["fidl", "-T", "aidl", "--dump", "-V", self.version.get(), "-J", self.package_name.get(), "-O", self.output_dir] + list(self.selected_files))
+
+    # FIDL to Communication Module Code generation
+    def convert2(self):
+        if not self.selected_files or not self.committed_package.get():
+            messagebox.showerror("Error", "File not selected or package name not given")
+        else:
+            self.queue_conversion("Converting FIDL to Communication Module Codes",
+                                  ["fidl", "-T", "client", "--dump", "-V", self.version.get(), "-J", self.package_name.get(), "-O", self.output_dir] + list(self.selected_files))
+
+    # ARXML to FIDL conversion
+    def convert3(self):
+        if not self.selected_arxml_files or not self.committed_arxml_package.get():
+            messagebox.showerror("Error", "File not selected or package name not given")
+        else:
+            self.queue_conversion("Converting ARXML to FIDL and FDEPL",
+                                  ["arxml", "-P", self.arxml_package_name.get(), "-O", self.output_dir] + list(self.selected_arxml_files))
+
+def main():
+    app = GUIApp()
+    app.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+################################################################
+#                          SDVGen Watch                        #
+################################################################
+# sdvgen_cli.py의 arxml, fidl, pipeline 명령에 --watch를 주면 입력 파일을 지켜보다가 바뀔 때마다 다시 생성함
+#
+#   python sdvgen_cli.py pipeline --watch -P org.example -J com.example.gen -O outputs Sensor.arxml
+#
+# Linux에서는 inotify, 그 외에는 --poll-interval 간격으로 파일의 수정 시각과 크기를 비교함.
+# 저장이 끝날 때까지 --debounce 동안 기다린 뒤, 바뀐 파일만 다시 파싱하고 (Processor.reload_file)
+# 바뀐 인터페이스의 출력만 다시 생성함 (--incremental의 manifest). 파일이 추가, 삭제되었거나
+# 이전 파싱이 실패했으면 전부 다시 파싱함.
+
+import ctypes, ctypes.util, os, select, struct, sys, time
+from collections import OrderedDict
+import arxml_converter as arxml
+import sdvgen_cli
+from converter_common import write_output_file
+
+# 디렉토리를 지켜볼 때 입력으로 보는 파일
+MODEL_SUFFIXES = (".fidl", ".fdepl", ".arxml")
+
+############################################ Watchers ####################################################################################
+
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+class Watcher(object):
+    """
+    Waits for changes of files, and of the model files of directories.
+
+    A subclass implements poll(timeout), which returns the set of the paths
+        changed within timeout seconds, empty if nothing changed, and blocks
+        until something changed if timeout is None.
+    """
+
+    def __init__(self):
+        self.files = set()
+        self.directories = set()
+        self.pending = set()
+
+    def watch(self, files, directories, since):
+        """
+        Watch these files and directories from now on.
+
+        :param since: time.time() before the files were read, files modified
+            after it are reported by the next wait.
+        """
+        self.files = set(os.path.realpath(path) for path in files)
+        self.directories = set(os.path.realpath(path) for path in directories if os.path.isdir(path))
+        since_ns = int(since * 1e9)
+        self.pending = set(path for path in self.files
+                           if file_signature(path) is None or file_signature(path)[0] >= since_ns)
+
+    def interesting(self, path):
+        return path in self.files or (os.path.dirname(path) in self.directories and path.endswith(MODEL_SUFFIXES))
+
+    def wait(self, debounce):
+        """
+        Block until watched files changed and then stayed unchanged for debounce seconds.
+
+        :return: Set of the changed paths.
+        """
+        changed, self.pending = self.pending, set()
+        while not changed:
+            changed = self.poll(None)
+        while True:
+            more = self.poll(debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self):
+        pass
+
+class PollingWatcher(Watcher):
+    """
+    Compares the modification time and size of the files every interval seconds.
+    """
+
+    def __init__(self, interval):
+        Watcher.__init__(self)
+        self.interval = interval
+        self.snapshot = {}
+
+    def scan(self):
+        snapshot = dict((path, file_signature(path)) for path in self.files)
+        for directory in self.directories:
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for name in names:
+                if name.endswith(MODEL_SUFFIXES):
+                    path = os.path.join(directory, name)
+                    snapshot[path] = file_signature(path)
+        return snapshot
+
+    def watch(self, files, directories, since):
+        Watcher.watch(self, files, directories, since)
+        self.snapshot = self.scan()
+
+    def poll(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if(delay > 0):
+                time.sleep(delay)
+            snapshot = self.scan()
+            changed = set(path for path in set(snapshot) | set(self.snapshot)
+                          if snapshot.get(path) != self.snapshot.get(path))
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+class InotifyWatcher(Watcher):
+    """
+    Linux inotify on the directories of the files, editors often replace a
+        file instead of writing it.
+
+    :raise OSError: inotify is not available.
+    """
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_DELETE = 0x200
+    IN_CLOEXEC = 0x80000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        Watcher.__init__(self)
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_CLOEXEC)
+        if(self.fd < 0):
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {} # watch descriptor -> directory
+
+    def watch(self, files, directories, since):
+        Watcher.watch(self, files, directories, since)
+        wanted = set(os.path.dirname(path) for path in self.files) | self.directories
+        for wd, directory in list(self.watches.items()):
+            if directory not in wanted:
+                self.libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+        for directory in wanted - set(self.watches.values()):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+            if(wd >= 0):
+                self.watches[wd] = directory
+
+    def poll(self, timeout):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        data = os.read(self.fd, 65536)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if wd in self.watches and name:
+                path = os.path.join(self.watches[wd], name)
+                if self.interesting(path):
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+def create_watcher(interval):
+    """
+    inotify if available, polling every interval seconds otherwise.
+    """
+    try:
+        return InotifyWatcher()
+    except (OSError, AttributeError) as e:
+        print("Polling every {}s, inotify is not available: {}".format(interval, e))
+        return PollingWatcher(interval)
+
+############################################ Sessions ####################################################################################
+
+def print_exception(e):
+    for error in (getattr(e, "errors", None) or [e]):
+        print("ERROR: {}".format(error))
+
+class FidlModels(object):
+    """
+    FIDL processor kept between cycles.
+    """
+
+    def __init__(self, args, models):
+        self.args = args
+        self.models = models
+        self.processor = None
+        self.failed = True
+
+    def load(self, fidls, changed):
+        """
+        Parse the FIDLs, again only the changed ones if the last parse succeeded
+            and no file was added or removed.
+
+        :param fidls: List of FIDL files, or dictionary of FIDL strings by file specification.
+        :param changed: File specifications of the changed FIDLs, None to parse all.
+        :return: True if the models parsed.
+        """
+        import fidl_module_converter as fidl
+        from pyfranca import LexerException, ParserException, ProcessorException
+        strings = isinstance(fidls, dict)
+        loaded = (self.processor is not None and not self.failed and changed is not None and
+                  all(fspec in self.processor.files and (strings or os.path.isfile(fspec)) for fspec in changed))
+        try:
+            if loaded:
+                for fspec in changed:
+                    try:
+                        self.processor.reload_file(fspec, fidls[fspec] if strings else None)
+                    except (LexerException, ParserException, OSError) as e:
+                        raise ProcessorException("{}: {}".format(fspec, e))
+            else:
+                self.processor = self.models.processor(self.args)
+                self.failed = True
+                if strings:
+                    self.processor.import_strings(fidls)
+                else:
+                    self.processor.import_files(fidls)
+            fidl.resolve_lazy_references(self.processor)
+            self.failed = False
+        except (Exception) as e:
+            # 다음 변경에서 처음부터 다시 파싱함
+            print_exception(e)
+            self.failed = True
+        if self.args.dump and not self.failed:
+            fidl.dump_packages(self.processor.packages)
+        return not self.failed
+
+    def generate(self, timings):
+        """
+        :return: Exit status.
+        """
+        import fidl_module_converter as fidl
+        if self.failed:
+            print("Not generated, the models have errors")
+            return 1
+        start = time.perf_counter()
+        generated = fidl.generate(self.processor.packages, self.args, sdvgen_cli.TARGETS[self.args.target])
+        timings["generate"] = time.perf_counter() - start
+        return 0 if generated else 1
+
+class ArxmlSession(object):
+    """
+    arxml: converts the changed ARXML files again.
+    """
+
+    def __init__(self, args, models):
+        self.args = args
+        self.models = models
+
+    def inputs(self):
+        return [os.path.abspath(path) for path in self.args.arxml], []
+
+    def run(self, changed, timings):
+        start = time.perf_counter()
+        status = 0
+        for arxml_file in self.args.arxml:
+            file_path = os.path.abspath(arxml_file)
+            if changed is not None and os.path.realpath(file_path) not in changed:
+                continue
+            try:
+                success_cnt, error_cnt = arxml.convert_arxml(file_path, self.args.package,
+                                                             lambda path, text: write_output_file(os.path.join(self.args.output_dir, path), text),
+                                                             self.models.arxml_tree(file_path))
+            except (Exception) as e:
+                print("ERROR: {}: {}".format(arxml_file, e))
+                status = 1
+                continue
+            print("Total {} interfaces in {}\nSuccess: {} Error: {}".format(success_cnt + error_cnt, arxml_file, success_cnt, error_cnt))
+            if error_cnt:
+                status = 1
+        timings["arxml"] = time.perf_counter() - start
+        return status
+
+class FidlSession(object):
+    """
+    fidl: parses the changed FIDL files again, the imported ones included.
+    """
+
+    def __init__(self, args, models):
+        self.args = args
+        self.fidl = FidlModels(args, models)
+
+    def inputs(self):
+        files = [os.path.realpath(path) for path in self.args.fidl]
+        if self.fidl.processor is not None:
+            files.extend(self.fidl.processor.files)
+        return files, self.args.import_dirs or []
+
+    def run(self, changed, timings):
+        start = time.perf_counter()
+        self.fidl.load(self.args.fidl, changed)
+        timings["parse"] = time.perf_counter() - start
+        return self.fidl.generate(timings)
+
+class PipelineSession(object):
+    """
+    pipeline: converts the changed ARXML files again and parses the FIDLs
+        whose text changed.
+    """
+
+    def __init__(self, args, models):
+        self.args = args
+        self.models = models
+        self.files = OrderedDict() # ARXML path -> generated files
+        self.errors = set() # ARXML paths with errors
+        self.fidl = FidlModels(args, models)
+
+    def inputs(self):
+        return [os.path.abspath(path) for path in self.args.arxml], self.args.import_dirs or []
+
+    def fidls(self):
+        return OrderedDict((os.path.join(self.args.output_dir, path), text)
+                           for files in self.files.values() for path, text in files.items() if path.endswith(".fidl"))
+
+    def run(self, changed, timings):
+        start = time.perf_counter()
+        old_fidls = self.fidls()
+        for arxml_file in self.args.arxml:
+            file_path = os.path.abspath(arxml_file)
+            if changed is not None and os.path.realpath(file_path) not in changed and file_path in self.files:
+                continue
+            files = OrderedDict()
+            self.errors.discard(file_path)
+            try:
+                success_cnt, error_cnt = arxml.convert_arxml(file_path, self.args.package, files.__setitem__, self.models.arxml_tree(file_path))
+            except (Exception) as e:
+                print("ERROR: {}: {}".format(arxml_file, e))
+                success_cnt, error_cnt = 0, 1
+            print("Total {} interfaces in {}\nSuccess: {} Error: {}".format(success_cnt + error_cnt, arxml_file, success_cnt, error_cnt))
+            if error_cnt:
+                self.errors.add(file_path)
+            self.files[file_path] = files
+            if self.args.fidl_output:
+                sdvgen_cli.write_files(files, self.args.output_dir)
+        timings["arxml"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fidls = self.fidls()
+        if list(fidls) == list(old_fidls):
+            changed_fidls = [fspec for fspec, text in fidls.items() if old_fidls[fspec] != text]
+        else:
+            # Interfaces were added or removed
+            changed_fidls = None
+        if changed_fidls != [] or self.fidl.failed:
+            self.fidl.load(fidls, changed_fidls)
+        timings["parse"] = time.perf_counter() - start
+
+        status = self.fidl.generate(timings)
+        return 1 if self.errors else status
+
+SESSIONS = {"arxml": ArxmlSession, "fidl": FidlSession, "pipeline": PipelineSession}
+
+############################################ Watch ####################################################################################
+
+def watch(args, models):
+    """
+    Run the command of args, and again whenever its inputs change, until SIGINT.
+
+    :return: Exit status of the last cycle.
+    """
+    # Regenerate only the interfaces whose models changed
+    args.incremental = True
+    session = SESSIONS[args.command](args, models)
+    watcher = create_watcher(args.poll_interval)
+    status = 0
+    changed = None
+    cycle = 0
+    try:
+        while True:
+            cycle += 1
+            since = time.time()
+            start = time.perf_counter()
+            timings = OrderedDict()
+            try:
+                status = session.run(changed, timings)
+            except (Exception) as e:
+                print("EXECUTION ERROR: {}".format(e))
+                status = 1
+            timings["total"] = time.perf_counter() - start
+            print("Cycle {}{}: {}".format(cycle,
+                                         "" if changed is None else " ({})".format(", ".join(sorted(os.path.basename(path) for path in changed))),
+                                         ", ".join("{} {:.3f}s".format(stage, seconds) for stage, seconds in timings.items())))
+            files, directories = session.inputs()
+            watcher.watch(files, directories, since)
+            print("Watching {} files, Ctrl+C to stop".format(len(watcher.files)))
+            sys.stdout.flush()
+            changed = watcher.wait(args.debounce)
+    except (KeyboardInterrupt):
+        pass
+    finally:
+        watcher.close()
+    return status
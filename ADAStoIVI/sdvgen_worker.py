@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+################################################################
+#                       SDVGen GUI Worker                      #
+################################################################
+# GUI의 변환을 별도 프로세스에서 sdvgen_cli 명령으로 실행하고, 출력과 진행 상황을 queue로 보냄 (sdvgen_gui.py)
+# ConversionQueue는 변환을 차례로 작업 프로세스에서 실행하고 취소함, GUI 없이도 씀
+#
+# Events, (kind, value) tuples:
+#   ("output", text)       printed text of the conversion
+#   ("progress", {"file": ..., "interface": ..., "phase": ..., "done": 1, "total": 4})
+#   ("done", status)       exit status of the command, the last event
+
+import os, queue, sys, time
+from collections import deque
+import sdvgen_cli
+
+# 출력은 모아서 보냄, 생성기는 빈 줄을 많이 출력함
+OUTPUT_BUFFER = 4096
+OUTPUT_DELAY = 0.1
+
+class QueueWriter(object):
+    """
+    stdout of the worker process, sends what is written as output events.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.parts = []
+        self.size = 0
+        self.flushed = time.monotonic()
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if(self.size >= OUTPUT_BUFFER or time.monotonic() - self.flushed >= OUTPUT_DELAY):
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self.parts:
+            self.events.put(("output", "".join(self.parts)))
+            self.parts = []
+            self.size = 0
+        self.flushed = time.monotonic()
+
+class Worker(object):
+    """
+    Progress of the running command.
+
+    :ivar file: Input file parsed last.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.output = QueueWriter(events)
+        self.file = None
+
+    def progress(self, phase, interface=None, done=0, total=0, file=None):
+        self.output.flush()
+        self.events.put(("progress", {"file": file or self.file, "interface": interface, "phase": phase, "done": done, "total": total}))
+
+    def generation_progress(self, phase, namespace, done, total):
+        package = namespace.package
+        files = ", ".join(os.path.basename(fspec) for fspec in package.files) if package is not None else None
+        self.progress(phase, namespace.name, done, total, files)
+
+    def arxml_progress(self, phase, interface, done, total):
+        self.progress("arxml " + phase, interface, done, total)
+
+class ProgressParser(object):
+    """
+    FIDL parser reporting every file it parses.
+    """
+
+    def __init__(self, parser, worker):
+        self.parser = parser
+        self.worker = worker
+
+    def parse(self, fidl):
+        return self.parser.parse(fidl)
+
+    def parse_file(self, fspec):
+        self.worker.file = os.path.basename(fspec)
+        self.worker.progress("parse")
+        return self.parser.parse_file(fspec)
+
+class WorkerModels(sdvgen_cli.Models):
+    """
+    Models of the worker, reporting every parsed file and interface.
+    """
+
+    def __init__(self, worker):
+        self.worker = worker
+        self.progress = worker.arxml_progress
+
+    def processor(self, args):
+        import fidl_module_converter as fidl
+        from pyfranca import Processor
+        parser = Processor(comments=args.comments, engine=args.engine).parser()
+        return fidl.create_processor(args, ProgressParser(parser, self.worker))
+
+    def arxml_tree(self, path):
+        self.worker.file = os.path.basename(path)
+        self.worker.progress("arxml parse")
+        return sdvgen_cli.Models.arxml_tree(self, path)
+
+def run(argv, events):
+    """
+    Process target: run a sdvgen_cli command, sending its output and progress to events.
+
+    stdout and stderr are replaced in the worker process only.
+    """
+    worker = Worker(events)
+    sys.stdout = sys.stderr = worker.output
+    status = 1
+    try:
+        args = sdvgen_cli.parse_command_line(argv)
+        if(args.command in ("fidl", "pipeline")):
+            import fidl_module_converter as fidl
+            fidl.set_progress(worker.generation_progress)
+        status = sdvgen_cli.execute(args, WorkerModels(worker))
+    except (SystemExit) as e:
+        # argparse
+        status = e.code if isinstance(e.code, int) else 1
+    except (Exception) as e:
+        print("EXECUTION ERROR: {}".format(e))
+    finally:
+        worker.output.flush()
+        events.put(("done", status))
+
+############################################ Queue ####################################################################################
+
+class ConversionQueue(object):
+    """
+    sdvgen_cli commands run one after the other, each in a new worker process.
+
+    Call poll regularly, e.g. from a GUI timer. What happens to a command is
+        passed to listener(title, kind, value): "started" with None, the
+        "output" and "progress" events of run, and "finished" with the
+        result text as the last one.
+
+    :param context: multiprocessing context of the worker processes, spawn if None.
+    """
+
+    def __init__(self, listener, context=None):
+        import multiprocessing
+        self.listener = listener
+        # Tk는 fork된 프로세스에서 안전하지 않음
+        self.context = context or multiprocessing.get_context("spawn")
+        self.queued = deque()
+        self.process = None
+        self.events = None
+        self.current = None
+
+    def add(self, title, argv):
+        """
+        Queue a command, it starts right away if none is running.
+        """
+        self.queued.append((title, argv))
+        if self.process is None:
+            self.start()
+
+    def start(self):
+        title, argv = self.queued.popleft()
+        self.events = self.context.Queue()
+        self.process = self.context.Process(target=run, args=(argv, self.events), daemon=True)
+        self.process.start()
+        self.current = title
+        self.listener(title, "started", None)
+
+    def poll(self):
+        """
+        Pass on the events of the running command, start the next one when it finished.
+
+        :return: True while a command is running.
+        """
+        if self.process is None:
+            return False
+        try:
+            while True:
+                kind, value = self.events.get_nowait()
+                if(kind == "done"):
+                    self.finish("Done" if value == 0 else "Finished with errors")
+                    return self.process is not None
+                self.listener(self.current, kind, value)
+        except queue.Empty:
+            pass
+        if not self.process.is_alive():
+            self.finish("Stopped with exit code {}".format(self.process.exitcode))
+        return self.process is not None
+
+    def finish(self, result):
+        self.process.join()
+        title = self.current
+        self.process = None
+        self.events = None
+        self.current = None
+        self.listener(title, "finished", result)
+        if self.queued:
+            self.start()
+
+    def cancel(self, queued=True):
+        """
+        Stop the running command, the next one starts unless queued.
+
+        :param queued: Drop the queued commands too.
+        :return: Number of dropped commands.
+        """
+        if self.process is None:
+            return 0
+        dropped = len(self.queued) if queued else 0
+        if queued:
+            self.queued.clear()
+        self.process.terminate()
+        self.finish("Cancelled")
+        return dropped
@@ -0,0 +1,270 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: BlobsConversions.hpp
+
+#ifndef BLOBS_CONVERSIONS_HPP
+#define BLOBS_CONVERSIONS_HPP
+
+#include <string>
+#include <vector>
+#include <jni.h>
+#include "v1/org/example/bytes/Blobs.hpp"
+
+inline jobject BlobsFrameToJava(JNIEnv *env, const ::v1::org::example::bytes::Blobs::Frame &value);
+inline ::v1::org::example::bytes::Blobs::Frame BlobsFrameFromJava(JNIEnv *env, jobject object);
+inline jobjectArray BlobsFrameArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::bytes::Blobs::Frame> &values);
+inline std::vector<::v1::org::example::bytes::Blobs::Frame> BlobsFrameArrayFromJava(JNIEnv *env, jobjectArray array);
+inline jobject BlobsEnvelopeToJava(JNIEnv *env, const ::v1::org::example::bytes::Blobs::Envelope &value);
+inline ::v1::org::example::bytes::Blobs::Envelope BlobsEnvelopeFromJava(JNIEnv *env, jobject object);
+inline jobjectArray BlobsEnvelopeArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::bytes::Blobs::Envelope> &values);
+inline std::vector<::v1::org::example::bytes::Blobs::Envelope> BlobsEnvelopeArrayFromJava(JNIEnv *env, jobjectArray array);
+inline jobjectArray BlobsStoreMapToJava(JNIEnv *env, const ::v1::org::example::bytes::Blobs::Store &values);
+inline ::v1::org::example::bytes::Blobs::Store BlobsStoreMapFromJava(JNIEnv *env, jobjectArray array);
+inline jobjectArray BlobsFramesMapToJava(JNIEnv *env, const ::v1::org::example::bytes::Blobs::Frames &values);
+inline ::v1::org::example::bytes::Blobs::Frames BlobsFramesMapFromJava(JNIEnv *env, jobjectArray array);
+
+inline jclass &BlobsFrameClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline jclass &BlobsEnvelopeClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline jclass &BlobsStoreClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline jclass &BlobsFramesClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline void BlobsConversionsInit(JNIEnv *env){
+    if(BlobsFrameClass() == nullptr){
+        BlobsFrameClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/BlobsJNI$Frame")));
+    }
+    if(BlobsEnvelopeClass() == nullptr){
+        BlobsEnvelopeClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/BlobsJNI$Envelope")));
+    }
+    if(BlobsStoreClass() == nullptr){
+        BlobsStoreClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/BlobsJNI$Store")));
+    }
+    if(BlobsFramesClass() == nullptr){
+        BlobsFramesClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/BlobsJNI$Frames")));
+    }
+}
+
+inline jobject BlobsFrameToJava(JNIEnv *env, const ::v1::org::example::bytes::Blobs::Frame &value){
+    static jmethodID constructor = env->GetMethodID(BlobsFrameClass(), "<init>", "(J[B)V");
+    jlong fieldId = static_cast<jlong>(value.getId());
+    const auto &valueData = value.getData();
+    std::vector<jbyte> fieldDataData(valueData.begin(), valueData.end());
+    jbyteArray fieldData = env->NewByteArray(static_cast<jsize>(fieldDataData.size()));
+    env->SetByteArrayRegion(fieldData, 0, static_cast<jsize>(fieldDataData.size()), fieldDataData.data());
+    jobject object = env->NewObject(BlobsFrameClass(), constructor, fieldId, fieldData);
+    env->DeleteLocalRef(fieldData);
+    return object;
+}
+
+inline ::v1::org::example::bytes::Blobs::Frame BlobsFrameFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::bytes::Blobs::Frame value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldIdFID = env->GetFieldID(BlobsFrameClass(), "id", "J");
+    value.setId(static_cast<uint32_t>(env->GetLongField(object, fieldIdFID)));
+    static jfieldID fieldDataFID = env->GetFieldID(BlobsFrameClass(), "data", "[B");
+    jbyteArray fieldData = static_cast<jbyteArray>(env->GetObjectField(object, fieldDataFID));
+    if(fieldData != nullptr){
+        jsize fieldDataLength = env->GetArrayLength(fieldData);
+        jbyte *fieldDataData = env->GetByteArrayElements(fieldData, nullptr);
+        value.setData(std::vector<uint8_t>(fieldDataData, fieldDataData + fieldDataLength));
+        env->ReleaseByteArrayElements(fieldData, fieldDataData, JNI_ABORT);
+        env->DeleteLocalRef(fieldData);
+    }
+    return value;
+}
+
+inline jobjectArray BlobsFrameArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::bytes::Blobs::Frame> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), BlobsFrameClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = BlobsFrameToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::bytes::Blobs::Frame> BlobsFrameArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::bytes::Blobs::Frame> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(BlobsFrameFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+inline jobject BlobsEnvelopeToJava(JNIEnv *env, const ::v1::org::example::bytes::Blobs::Envelope &value){
+    static jmethodID constructor = env->GetMethodID(BlobsEnvelopeClass(), "<init>", "(Lcom/example/gen/BlobsJNI$Frame;[Lcom/example/gen/BlobsJNI$Frame;[B)V");
+    jobject fieldFrame = BlobsFrameToJava(env, value.getFrame());
+    jobjectArray fieldFrames = BlobsFrameArrayToJava(env, value.getFrames());
+    const auto &valueTrailer = value.getTrailer();
+    std::vector<jbyte> fieldTrailerData(valueTrailer.begin(), valueTrailer.end());
+    jbyteArray fieldTrailer = env->NewByteArray(static_cast<jsize>(fieldTrailerData.size()));
+    env->SetByteArrayRegion(fieldTrailer, 0, static_cast<jsize>(fieldTrailerData.size()), fieldTrailerData.data());
+    jobject object = env->NewObject(BlobsEnvelopeClass(), constructor, fieldFrame, fieldFrames, fieldTrailer);
+    env->DeleteLocalRef(fieldFrame);
+    env->DeleteLocalRef(fieldFrames);
+    env->DeleteLocalRef(fieldTrailer);
+    return object;
+}
+
+inline ::v1::org::example::bytes::Blobs::Envelope BlobsEnvelopeFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::bytes::Blobs::Envelope value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldFrameFID = env->GetFieldID(BlobsEnvelopeClass(), "frame", "Lcom/example/gen/BlobsJNI$Frame;");
+    jobject fieldFrame = env->GetObjectField(object, fieldFrameFID);
+    value.setFrame(BlobsFrameFromJava(env, fieldFrame));
+    env->DeleteLocalRef(fieldFrame);
+    static jfieldID fieldFramesFID = env->GetFieldID(BlobsEnvelopeClass(), "frames", "[Lcom/example/gen/BlobsJNI$Frame;");
+    jobjectArray fieldFrames = static_cast<jobjectArray>(env->GetObjectField(object, fieldFramesFID));
+    value.setFrames(BlobsFrameArrayFromJava(env, fieldFrames));
+    env->DeleteLocalRef(fieldFrames);
+    static jfieldID fieldTrailerFID = env->GetFieldID(BlobsEnvelopeClass(), "trailer", "[B");
+    jbyteArray fieldTrailer = static_cast<jbyteArray>(env->GetObjectField(object, fieldTrailerFID));
+    if(fieldTrailer != nullptr){
+        jsize fieldTrailerLength = env->GetArrayLength(fieldTrailer);
+        jbyte *fieldTrailerData = env->GetByteArrayElements(fieldTrailer, nullptr);
+        value.setTrailer(std::vector<uint8_t>(fieldTrailerData, fieldTrailerData + fieldTrailerLength));
+        env->ReleaseByteArrayElements(fieldTrailer, fieldTrailerData, JNI_ABORT);
+        env->DeleteLocalRef(fieldTrailer);
+    }
+    return value;
+}
+
+inline jobjectArray BlobsEnvelopeArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::bytes::Blobs::Envelope> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), BlobsEnvelopeClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = BlobsEnvelopeToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::bytes::Blobs::Envelope> BlobsEnvelopeArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::bytes::Blobs::Envelope> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(BlobsEnvelopeFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+inline jobjectArray BlobsStoreMapToJava(JNIEnv *env, const ::v1::org::example::bytes::Blobs::Store &values){
+    static jmethodID constructor = env->GetMethodID(BlobsStoreClass(), "<init>", "(Ljava/lang/String;[B)V");
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), BlobsStoreClass(), nullptr);
+    jsize index = 0;
+    for(const auto &pair: values){
+        jstring key = env->NewStringUTF(pair.first.c_str());
+        const auto &valueItems = pair.second;
+        std::vector<jbyte> valueData(valueItems.begin(), valueItems.end());
+        jbyteArray value = env->NewByteArray(static_cast<jsize>(valueData.size()));
+        env->SetByteArrayRegion(value, 0, static_cast<jsize>(valueData.size()), valueData.data());
+        jobject item = env->NewObject(BlobsStoreClass(), constructor, key, value);
+        env->SetObjectArrayElement(array, index++, item);
+        env->DeleteLocalRef(item);
+        env->DeleteLocalRef(key);
+        env->DeleteLocalRef(value);
+    }
+    return array;
+}
+
+inline ::v1::org::example::bytes::Blobs::Store BlobsStoreMapFromJava(JNIEnv *env, jobjectArray array){
+    ::v1::org::example::bytes::Blobs::Store values;
+    if(array == nullptr){
+        return values;
+    }
+    static jfieldID keyFID = env->GetFieldID(BlobsStoreClass(), "key", "Ljava/lang/String;");
+    static jfieldID valueFID = env->GetFieldID(BlobsStoreClass(), "value", "[B");
+    jsize length = env->GetArrayLength(array);
+    for(jsize index = 0; index < length; index++){
+        jobject object = env->GetObjectArrayElement(array, index);
+        std::string entryKey;
+        std::vector<uint8_t> entryValue;
+        jstring key = static_cast<jstring>(env->GetObjectField(object, keyFID));
+        if(key != nullptr){
+            const char *keyChars = env->GetStringUTFChars(key, nullptr);
+            entryKey = std::string(keyChars);
+            env->ReleaseStringUTFChars(key, keyChars);
+            env->DeleteLocalRef(key);
+        }
+        jbyteArray value = static_cast<jbyteArray>(env->GetObjectField(object, valueFID));
+        if(value != nullptr){
+            jsize valueLength = env->GetArrayLength(value);
+            jbyte *valueData = env->GetByteArrayElements(value, nullptr);
+            entryValue = std::vector<uint8_t>(valueData, valueData + valueLength);
+            env->ReleaseByteArrayElements(value, valueData, JNI_ABORT);
+            env->DeleteLocalRef(value);
+        }
+        values[entryKey] = entryValue;
+        env->DeleteLocalRef(object);
+    }
+    return values;
+}
+
+inline jobjectArray BlobsFramesMapToJava(JNIEnv *env, const ::v1::org::example::bytes::Blobs::Frames &values){
+    static jmethodID constructor = env->GetMethodID(BlobsFramesClass(), "<init>", "(JLcom/example/gen/BlobsJNI$Frame;)V");
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), BlobsFramesClass(), nullptr);
+    jsize index = 0;
+    for(const auto &pair: values){
+        jlong key = static_cast<jlong>(pair.first);
+        jobject value = BlobsFrameToJava(env, pair.second);
+        jobject item = env->NewObject(BlobsFramesClass(), constructor, key, value);
+        env->SetObjectArrayElement(array, index++, item);
+        env->DeleteLocalRef(item);
+        env->DeleteLocalRef(value);
+    }
+    return array;
+}
+
+inline ::v1::org::example::bytes::Blobs::Frames BlobsFramesMapFromJava(JNIEnv *env, jobjectArray array){
+    ::v1::org::example::bytes::Blobs::Frames values;
+    if(array == nullptr){
+        return values;
+    }
+    static jfieldID keyFID = env->GetFieldID(BlobsFramesClass(), "key", "J");
+    static jfieldID valueFID = env->GetFieldID(BlobsFramesClass(), "value", "Lcom/example/gen/BlobsJNI$Frame;");
+    jsize length = env->GetArrayLength(array);
+    for(jsize index = 0; index < length; index++){
+        jobject object = env->GetObjectArrayElement(array, index);
+        uint32_t entryKey;
+        ::v1::org::example::bytes::Blobs::Frame entryValue;
+        entryKey = static_cast<uint32_t>(env->GetLongField(object, keyFID));
+        jobject value = env->GetObjectField(object, valueFID);
+        entryValue = BlobsFrameFromJava(env, value);
+        env->DeleteLocalRef(value);
+        values[entryKey] = entryValue;
+        env->DeleteLocalRef(object);
+    }
+    return values;
+}
+
+#endif
@@ -0,0 +1,58 @@
+package com.example.gen;
+public class BlobsJNI{
+    
+    public static class Frame {
+		long id;
+		byte[] data;
+
+		public Frame(){}
+        
+		public Frame(long id, byte[] data){
+			this.id = id;
+			this.data = data;
+		}
+	}
+    public Frame FrameToCPP() {
+        return new Frame();
+    }
+    public static class Envelope {
+		Frame frame;
+		Frame[] frames;
+		byte[] trailer;
+
+		public Envelope(){}
+        
+		public Envelope(Frame frame, Frame[] frames, byte[] trailer){
+			this.frame = frame;
+			this.frames = frames;
+			this.trailer = trailer;
+		}
+	}
+    public Envelope EnvelopeToCPP() {
+        return new Envelope();
+    }
+    public static class Store {
+        String key;
+        byte[] value;
+        public Store() {}
+        public Store(String key, byte[] value){
+            this.key = key;
+            this.value = value;
+        }
+    }
+    public Store StoreToCPP() {
+        return new Store();
+    }
+    public static class Frames {
+        long key;
+        Frame value;
+        public Frames() {}
+        public Frames(long key, Frame value){
+            this.key = key;
+            this.value = value;
+        }
+    }
+    public Frames FramesToCPP() {
+        return new Frames();
+    }
+}
\ No newline at end of file
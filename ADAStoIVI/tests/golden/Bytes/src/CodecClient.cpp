@@ -0,0 +1,924 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: CodecClient.cpp
+
+#include <iostream>
+#include <jni.h>
+#include <string.h>
+#include <CommonAPI/CommonAPI.hpp>
+#include "v1/org/example/bytes/CodecProxy.hpp"
+#include "BlobsConversions.hpp"
+#include "CodecConversions.hpp"
+
+#define LOGI(...) ((void)__android_log_print(ANDROID_LOG_INFO, LOG_TAG, __VA_ARGS__))
+#define LOGE(...) ((void)__android_log_print(ANDROID_LOG_ERROR, LOG_TAG, __VA_ARGS__))
+#include <android/log.h>
+#define LOG_TAG "CodecClientCPP"
+using namespace v1::org::example::bytes;
+
+class CodecClient{
+	public:
+	CodecClient(){
+	};
+	std::shared_ptr<CodecProxy<>> myProxy;
+	void main(std::string pinstance, std::string pconnection);
+	jclass CodecClazz;
+	jobject CodecInstance;
+	jclass BlobsClazz;
+	//jobject BlobsInstance
+};
+        
+JavaVM *jvm;
+JNIEnv *jenv;
+
+JNIEXPORT jint JNICALL JNI_OnLoad(JavaVM* vm, void* reserved){
+	jvm = vm;
+	if ((vm)->GetEnv((void**)&jenv, JNI_VERSION_1_6) != JNI_OK) {
+		return JNI_ERR; //Failed to obtain JNIEnv
+	}
+	return JNI_VERSION_1_6;
+}
+
+void CodecClient::main(std::string pinstance, std::string pconnection){
+	std::shared_ptr<CommonAPI::Runtime> runtime = CommonAPI::Runtime::get();
+	
+    std::string domain = "local";
+	//std::string instance = "org.example.bytes.Codec";
+	std::string instance = pinstance;
+	std::string connection = pconnection;
+    myProxy = runtime->buildProxy<CodecProxy>(domain, instance,connection);
+    int8_t break_cnt = 0;
+    while(!myProxy->isAvailable()){
+        std::this_thread::sleep_for(std::chrono::microseconds(10));
+        if(break_cnt == 50){
+            break;
+        }
+        break_cnt++;
+    }
+}
+extern "C"{
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributeBuffer(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getBufferAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](std::vector<uint8_t> _buffer){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+			jmethodID BufferMID = env->GetMethodID(CodecClazz, "subAttributeBufferHandler", "([B)V");
+            std::vector<int8_t> _bufferSigned;
+            _bufferSigned.assign(_buffer.begin(), _buffer.end());
+            jbyte* bufferData = static_cast<jbyte*>(_bufferSigned.data());
+    		jsize bufferLength = static_cast<jsize>(_buffer.size());
+    		jbyteArray buffer = env->NewByteArray(bufferLength);
+    		env->SetByteArrayRegion(buffer, 0, bufferLength, bufferData);
+			env->CallVoidMethod(CodecInstance, BufferMID, buffer);
+			env->DeleteLocalRef(buffer);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jbyteArray JNICALL
+	Java_com_example_gen_CodecJNI_getAttributeBufferValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        std::vector<uint8_t> _buffer;
+    	_CodecClient->myProxy->getBufferAttribute().getValue(callStatus, _buffer, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value buffer failed!");
+    	}
+        std::vector<int8_t> _bufferSigned;
+        _bufferSigned.assign(_buffer.begin(), _buffer.end());
+        jbyte* bufferData = static_cast<jbyte*>(_bufferSigned.data());
+        jsize bufferLength = static_cast<jsize>(_buffer.size());
+        jbyteArray buffer = env->NewByteArray(bufferLength);
+        env->SetByteArrayRegion(buffer, 0, bufferLength, bufferData);
+        return buffer;
+    }
+
+    
+    JNIEXPORT jbyteArray JNICALL
+	Java_com_example_gen_CodecJNI_setAttributeBufferValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyteArray buffer){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        jbyte* bufferData = env->GetByteArrayElements(buffer, nullptr);
+        jsize bufferLength = env->GetArrayLength(buffer);
+        std::vector<uint8_t> _buffer(bufferData, bufferData + bufferLength);
+        std::vector<uint8_t> _bufferResponse;
+        _CodecClient->myProxy->getBufferAttribute().setValue(_buffer, callStatus, _bufferResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value buffer failed!");
+        }
+        std::vector<int8_t> _bufferResponseSigned;
+        _bufferResponseSigned.assign(_bufferResponse.begin(), _bufferResponse.end());
+        bufferData = static_cast<jbyte*>(_bufferResponseSigned.data());
+        jbyteArray bufferResponse = env->NewByteArray(bufferLength);
+        env->SetByteArrayRegion(bufferResponse, 0, bufferLength, bufferData);
+        return bufferResponse;
+        }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributeBuffer(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getBufferAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributeBufferRo(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getBufferRoAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](std::vector<uint8_t> _bufferRo){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+			jmethodID BufferRoMID = env->GetMethodID(CodecClazz, "subAttributeBufferRoHandler", "([B)V");
+            std::vector<int8_t> _bufferRoSigned;
+            _bufferRoSigned.assign(_bufferRo.begin(), _bufferRo.end());
+            jbyte* bufferRoData = static_cast<jbyte*>(_bufferRoSigned.data());
+    		jsize bufferRoLength = static_cast<jsize>(_bufferRo.size());
+    		jbyteArray bufferRo = env->NewByteArray(bufferRoLength);
+    		env->SetByteArrayRegion(bufferRo, 0, bufferRoLength, bufferRoData);
+			env->CallVoidMethod(CodecInstance, BufferRoMID, bufferRo);
+			env->DeleteLocalRef(bufferRo);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jbyteArray JNICALL
+	Java_com_example_gen_CodecJNI_getAttributeBufferRoValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        std::vector<uint8_t> _bufferRo;
+    	_CodecClient->myProxy->getBufferRoAttribute().getValue(callStatus, _bufferRo, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value bufferRo failed!");
+    	}
+        std::vector<int8_t> _bufferRoSigned;
+        _bufferRoSigned.assign(_bufferRo.begin(), _bufferRo.end());
+        jbyte* bufferRoData = static_cast<jbyte*>(_bufferRoSigned.data());
+        jsize bufferRoLength = static_cast<jsize>(_bufferRo.size());
+        jbyteArray bufferRo = env->NewByteArray(bufferRoLength);
+        env->SetByteArrayRegion(bufferRo, 0, bufferRoLength, bufferRoData);
+        return bufferRo;
+    }
+
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributeBufferRo(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getBufferRoAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributeStore(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getStoreAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](Blobs::Store _store){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+            jmethodID StoreMID = env->GetMethodID(CodecClazz, "subAttributeStoreHandler", "([Lcom/example/gen/BlobsJNI$Store;)V");
+            jobjectArray store = BlobsStoreMapToJava(env, _store);
+            env->CallVoidMethod(CodecInstance, StoreMID, store);
+            env->DeleteLocalRef(store);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_getAttributeStoreValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        Blobs::Store _store;
+    	_CodecClient->myProxy->getStoreAttribute().getValue(callStatus, _store, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value store failed!");
+    	}
+        jobjectArray store = BlobsStoreMapToJava(env, _store);
+        return store;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_setAttributeStoreValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray store){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        Blobs::Store _store = BlobsStoreMapFromJava(env, store);
+        Blobs::Store _storeResponse;
+        
+        _CodecClient->myProxy->getStoreAttribute().setValue(_store, callStatus, _storeResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value store failed!");
+        }
+        jobjectArray storeResponse = BlobsStoreMapToJava(env, _storeResponse);
+        
+        return storeResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributeStore(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getStoreAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributePacket(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getPacketAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](Codec::Packet _packet){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+        	jmethodID PacketMID = env->GetMethodID(CodecClazz, "subAttributePacketHandler", "(Lcom/example/gen/CodecJNI$Packet;)V");
+        	jobject packet = CodecPacketToJava(env, _packet);
+			env->CallVoidMethod(CodecInstance, PacketMID, packet);
+			env->DeleteLocalRef(packet);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_CodecJNI_getAttributePacketValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::bytes::*/Codec::Packet _packet;
+    	_CodecClient->myProxy->getPacketAttribute().getValue(callStatus, _packet, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value packet failed!");
+    	}
+        jobject packet = CodecPacketToJava(env, _packet);
+        return packet;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_CodecJNI_setAttributePacketValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject packet){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::bytes::Codec::Packet _packet = CodecPacketFromJava(env, packet);
+        ::v1::org::example::bytes::Codec::Packet _packetResponse;
+        _CodecClient->myProxy->getPacketAttribute().setValue(_packet, callStatus, _packetResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value packet failed!");
+        }
+        jobject packetResponse = CodecPacketToJava(env, _packetResponse);
+        return packetResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributePacket(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getPacketAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributePackets(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getPacketsAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](Codec::Packets _packets){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+        	jmethodID PacketsMID = env->GetMethodID(CodecClazz, "subAttributePacketsHandler", "([Lcom/example/gen/CodecJNI$Packet;)V");
+        	jobjectArray packets = CodecPacketArrayToJava(env, _packets);
+            env->CallVoidMethod(CodecInstance, PacketsMID, packets);
+            env->DeleteLocalRef(packets);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_getAttributePacketsValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::bytes::*/Codec::Packets _packets;
+    	_CodecClient->myProxy->getPacketsAttribute().getValue(callStatus, _packets, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value packets failed!");
+    	}
+        jobjectArray packets = CodecPacketArrayToJava(env, _packets);
+        return packets;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_setAttributePacketsValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray packets){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        std::vector<::v1::org::example::bytes::Codec::Packet> _packets = CodecPacketArrayFromJava(env, packets);
+        std::vector<::v1::org::example::bytes::Codec::Packet> _packetsResponse;
+        _CodecClient->myProxy->getPacketsAttribute().setValue(_packets, callStatus, _packetsResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value packets failed!");
+        }
+        jobjectArray packetsResponse = CodecPacketArrayToJava(env, _packetsResponse);
+        return packetsResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributePackets(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getPacketsAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributePacketList(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getPacketListAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](std::vector<Codec::Packet> _packetList){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+        	jmethodID PacketListMID = env->GetMethodID(CodecClazz, "subAttributePacketListHandler", "([Lcom/example/gen/CodecJNI$Packet;)V");
+        	jobjectArray packetList = CodecPacketArrayToJava(env, _packetList);
+            env->CallVoidMethod(CodecInstance, PacketListMID, packetList);
+            env->DeleteLocalRef(packetList);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_getAttributePacketListValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        std::vector<Codec::Packet> _packetList;
+    	_CodecClient->myProxy->getPacketListAttribute().getValue(callStatus, _packetList, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value packetList failed!");
+    	}
+        jobjectArray packetList = CodecPacketArrayToJava(env, _packetList);
+        return packetList;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_setAttributePacketListValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray packetList){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        std::vector<::v1::org::example::bytes::Codec::Packet> _packetList = CodecPacketArrayFromJava(env, packetList);
+        std::vector<::v1::org::example::bytes::Codec::Packet> _packetListResponse;
+        _CodecClient->myProxy->getPacketListAttribute().setValue(_packetList, callStatus, _packetListResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value packetList failed!");
+        }
+        jobjectArray packetListResponse = CodecPacketArrayToJava(env, _packetListResponse);
+        return packetListResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributePacketList(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getPacketListAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributeFrames(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getFramesAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](Blobs::Frames _frames){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+            jmethodID FramesMID = env->GetMethodID(CodecClazz, "subAttributeFramesHandler", "([Lcom/example/gen/BlobsJNI$Frames;)V");
+            jobjectArray frames = BlobsFramesMapToJava(env, _frames);
+            env->CallVoidMethod(CodecInstance, FramesMID, frames);
+            env->DeleteLocalRef(frames);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_getAttributeFramesValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        Blobs::Frames _frames;
+    	_CodecClient->myProxy->getFramesAttribute().getValue(callStatus, _frames, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value frames failed!");
+    	}
+        jobjectArray frames = BlobsFramesMapToJava(env, _frames);
+        return frames;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_setAttributeFramesValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray frames){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        Blobs::Frames _frames = BlobsFramesMapFromJava(env, frames);
+        Blobs::Frames _framesResponse;
+        
+        _CodecClient->myProxy->getFramesAttribute().setValue(_frames, callStatus, _framesResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value frames failed!");
+        }
+        jobjectArray framesResponse = BlobsFramesMapToJava(env, _framesResponse);
+        
+        return framesResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributeFrames(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getFramesAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributeEnvelope(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getEnvelopeAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](Blobs::Envelope _envelope){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+        	jmethodID EnvelopeMID = env->GetMethodID(CodecClazz, "subAttributeEnvelopeHandler", "(Lcom/example/gen/CodecJNI$Envelope;)V");
+        	jobject envelope = BlobsEnvelopeToJava(env, _envelope);
+			env->CallVoidMethod(CodecInstance, EnvelopeMID, envelope);
+			env->DeleteLocalRef(envelope);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_CodecJNI_getAttributeEnvelopeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::bytes::*/Blobs::Envelope _envelope;
+    	_CodecClient->myProxy->getEnvelopeAttribute().getValue(callStatus, _envelope, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value envelope failed!");
+    	}
+        jobject envelope = BlobsEnvelopeToJava(env, _envelope);
+        return envelope;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_CodecJNI_setAttributeEnvelopeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject envelope){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::bytes::Blobs::Envelope _envelope = BlobsEnvelopeFromJava(env, envelope);
+        ::v1::org::example::bytes::Blobs::Envelope _envelopeResponse;
+        _CodecClient->myProxy->getEnvelopeAttribute().setValue(_envelope, callStatus, _envelopeResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value envelope failed!");
+        }
+        jobject envelopeResponse = BlobsEnvelopeToJava(env, _envelopeResponse);
+        return envelopeResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributeEnvelope(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getEnvelopeAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_subAttributeFrameList(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	_CodecClient->myProxy->getFrameListAttribute().getChangedEvent().subscribe(
+    		[_CodecClient](Blobs::FrameList _frameList){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject CodecInstance = _CodecClient->CodecInstance;
+    		jclass CodecClazz = env->GetObjectClass(CodecInstance);
+        	jmethodID FrameListMID = env->GetMethodID(CodecClazz, "subAttributeFrameListHandler", "([Lcom/example/gen/CodecJNI$Frame;)V");
+        	jobjectArray frameList = BlobsFrameArrayToJava(env, _frameList);
+            env->CallVoidMethod(CodecInstance, FrameListMID, frameList);
+            env->DeleteLocalRef(frameList);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_getAttributeFrameListValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::bytes::*/Blobs::FrameList _frameList;
+    	_CodecClient->myProxy->getFrameListAttribute().getValue(callStatus, _frameList, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value frameList failed!");
+    	}
+        jobjectArray frameList = BlobsFrameArrayToJava(env, _frameList);
+        return frameList;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_CodecJNI_setAttributeFrameListValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray frameList){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        std::vector<::v1::org::example::bytes::Blobs::Frame> _frameList = BlobsFrameArrayFromJava(env, frameList);
+        std::vector<::v1::org::example::bytes::Blobs::Frame> _frameListResponse;
+        _CodecClient->myProxy->getFrameListAttribute().setValue(_frameList, callStatus, _frameListResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value frameList failed!");
+        }
+        jobjectArray frameListResponse = BlobsFrameArrayToJava(env, _frameListResponse);
+        return frameListResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubAttributeFrameList(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+    	//_CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getFrameListAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_CodecJNI_subBroadcastReceived(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+        _CodecClient->myProxy->getReceivedEvent().subscribe(
+            [_CodecClient](std::vector<uint8_t> _data, Codec::Packet _p){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastReceived!");  
+            }
+            jobject CodecInstance = _CodecClient->CodecInstance;
+            jclass CodecClazz = env->GetObjectClass(CodecInstance);
+            jmethodID ReceivedMID = env->GetMethodID(CodecClazz, "subBroadcastReceivedCallback", "([BLcom/example/gen/CodecJNI$Packet;)V");
+                std::vector<int8_t> _dataSigned;
+                _dataSigned.assign(_data.begin(), _data.end());
+                jbyte* dataData = static_cast<jbyte*>(_dataSigned.data());
+                jsize dataLength = static_cast<jsize>(_data.size());
+        		jbyteArray data = env->NewByteArray(dataLength);
+        		env->SetByteArrayRegion(data, 0, dataLength, dataData);
+                jobject p = CodecPacketToJava(env, _p);
+                env->CallVoidMethod(CodecInstance,ReceivedMID, data, p);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubBroadcastReceived(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getReceivedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_CodecJNI_subBroadcastRaw(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+        _CodecClient->myProxy->getRawEvent().subscribe(
+            [_CodecClient](std::vector<uint8_t> _data){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastRaw!");  
+            }
+            jobject CodecInstance = _CodecClient->CodecInstance;
+            jclass CodecClazz = env->GetObjectClass(CodecInstance);
+            jmethodID RawMID = env->GetMethodID(CodecClazz, "subBroadcastRawCallback", "([B)V");
+                std::vector<int8_t> _dataSigned;
+                _dataSigned.assign(_data.begin(), _data.end());
+                jbyte* dataData = static_cast<jbyte*>(_dataSigned.data());
+                jsize dataLength = static_cast<jsize>(_data.size());
+        		jbyteArray data = env->NewByteArray(dataLength);
+        		env->SetByteArrayRegion(data, 0, dataLength, dataData);
+                env->CallVoidMethod(CodecInstance,RawMID, data);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubBroadcastRaw(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getRawEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_CodecJNI_subBroadcastEnvelopes(JNIEnv *env, jobject instance, jlong proxyptr){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+        _CodecClient->myProxy->getEnvelopesEvent().subscribe(
+            [_CodecClient](Blobs::Envelope _e, Blobs::Blobs.Store _s){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastEnvelopes!");  
+            }
+            jobject CodecInstance = _CodecClient->CodecInstance;
+            jclass CodecClazz = env->GetObjectClass(CodecInstance);
+            jobject BlobsInstance = env->AllocObject(_CodecClient->BlobsClazz);
+                jclass BlobsClazz = env->GetObjectClass(BlobsInstance);
+                jmethodID EnvelopesMID = env->GetMethodID(CodecClazz, "subBroadcastEnvelopesCallback", "(Lcom/example/gen/BlobsJNI$Envelope;)V");
+                jobject e = BlobsEnvelopeToJava(env, _e);
+                
+            jmethodID SMID = env->GetMethodID(CodecClazz, "subAttributeSHandler", "([Lcom/example/gen/BlobsJNI$Store;)V");
+            jobjectArray s = BlobsStoreMapToJava(env, _s);
+            env->CallVoidMethod(CodecInstance,EnvelopesMID, e, s);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_CodecJNI_unsubBroadcastEnvelopes(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_CodecClient->myProxy->getEnvelopesEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT jobject JNICALL
+    Java_com_example_gen_CodecJNI_Encode(JNIEnv *env, jobject instance, jlong proxyptr, jbyteArray input, jobject p, jobject e){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+        jclass encodeClazz = env->FindClass("com/example/gen/CodecJNI$EncodeReturnType");
+        jmethodID encodeConstructor = env->GetMethodID(encodeClazz, "<init>", "([BLcom/example/gen/BlobsJNI$Frame;Lcom/example/gen/BlobsJNI$Envelope;)V");
+        jbyte* inputData = env->GetByteArrayElements(input, nullptr);
+        jsize inputLength = env->GetArrayLength(input);
+        std::vector<uint8_t> _input(inputData, inputData + inputLength);
+        ::v1::org::example::bytes::Codec::Packet _p = CodecPacketFromJava(env, p);
+        ::v1::org::example::bytes::Blobs::Envelope _e = BlobsEnvelopeFromJava(env, e);
+        std::vector<uint8_t> _output;
+        
+        ::v1::org::example::bytes::Blobs::Frame _f;
+        
+        ::v1::org::example::bytes::Blobs::Envelope _e2;
+        
+        CommonAPI::CallStatus callStatus;
+        _CodecClient->myProxy->encode(_input, _p, _e, callStatus, _output, _f, _e2);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("encode failed!");
+        }
+        
+        std::vector<int8_t> _outputSigned;
+        _outputSigned.assign(_output.begin(), _output.end());
+        jbyte* outputData = static_cast<jbyte*>(_outputSigned.data());
+        jsize outputLength = static_cast<jsize>(_output.size());
+        jbyteArray output = env->NewByteArray(outputLength);
+        env->SetByteArrayRegion(output, 0, outputLength, outputData);
+        jobject f = BlobsFrameToJava(env, _f);
+        jobject e2 = BlobsEnvelopeToJava(env, _e2);
+        
+        jobject EncodeReturnType = env->NewObject(encodeClazz, encodeConstructor, output, f, e2);
+        return EncodeReturnType;
+    }
+
+    JNIEXPORT jobject JNICALL
+    Java_com_example_gen_CodecJNI_Decode(JNIEnv *env, jobject instance, jlong proxyptr, jobjectArray ps, jobjectArray fl){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+        jclass decodeClazz = env->FindClass("com/example/gen/CodecJNI$DecodeReturnType");
+        jmethodID decodeConstructor = env->GetMethodID(decodeClazz, "<init>", "([Lcom/example/gen/CodecJNI$Packet;[Lcom/example/gen/BlobsJNI$Frame;)V");
+        std::vector<::v1::org::example::bytes::Codec::Packet> _ps = CodecPacketArrayFromJava(env, ps);
+        std::vector<::v1::org::example::bytes::Blobs::Frame> _fl = BlobsFrameArrayFromJava(env, fl);
+        
+        std::vector<::v1::org::example::bytes::Codec::Packet> _out1;
+        
+        std::vector<::v1::org::example::bytes::Blobs::Frame> _fs;
+        
+        CommonAPI::CallStatus callStatus;
+        _CodecClient->myProxy->decode(_ps, _fl, callStatus, _out1, _fs);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("decode failed!");
+        }
+        jobjectArray out1 = CodecPacketArrayToJava(env, _out1);
+        jobjectArray fs = BlobsFrameArrayToJava(env, _fs);
+        
+        jobject DecodeReturnType = env->NewObject(decodeClazz, decodeConstructor, out1, fs);
+        return DecodeReturnType;
+    }
+
+    JNIEXPORT jbyteArray JNICALL
+    Java_com_example_gen_CodecJNI_Single(JNIEnv *env, jobject instance, jlong proxyptr, jbyteArray only){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+        jbyte* onlyData = env->GetByteArrayElements(only, nullptr);
+        jsize onlyLength = env->GetArrayLength(only);
+        std::vector<uint8_t> _only(onlyData, onlyData + onlyLength);
+        std::vector<uint8_t> _result;
+        
+        CommonAPI::CallStatus callStatus;
+        _CodecClient->myProxy->single(_only, callStatus, _result);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("single failed!");
+        }
+        
+        std::vector<int8_t> _resultSigned;
+        _resultSigned.assign(_result.begin(), _result.end());
+        jbyte* resultData = static_cast<jbyte*>(_resultSigned.data());
+        jsize resultLength = static_cast<jsize>(_result.size());
+        jbyteArray result = env->NewByteArray(resultLength);
+        env->SetByteArrayRegion(result, 0, resultLength, resultData);
+        
+        return result;
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+    Java_com_example_gen_CodecJNI_Store(JNIEnv *env, jobject instance, jlong proxyptr, jobjectArray s){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+        
+        Blobs::Store _s = BlobsStoreMapFromJava(env, s);
+        Blobs::Store _sResponse;
+        
+        Blobs::Store _r;
+        
+        CommonAPI::CallStatus callStatus;
+        _CodecClient->myProxy->store(_s, callStatus, _r);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("store failed!");
+        }
+        
+        jobjectArray r = BlobsStoreMapToJava(env, _r);
+        
+        return r;
+    }
+
+    JNIEXPORT void JNICALL
+    Java_com_example_gen_CodecJNI_Push(JNIEnv *env, jobject instance, jlong proxyptr, jbyteArray data){
+        CodecClient* _CodecClient = reinterpret_cast<CodecClient*>(proxyptr);
+        _CodecClient->CodecInstance = env->NewGlobalRef(instance);
+        jbyte* dataData = env->GetByteArrayElements(data, nullptr);
+        jsize dataLength = env->GetArrayLength(data);
+        std::vector<uint8_t> _data(dataData, dataData + dataLength);
+        
+        CommonAPI::CallStatus callStatus;
+        _CodecClient->myProxy->push(_data, callStatus);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("push failed!");
+        }
+        
+    }
+	JNIEXPORT jlong JNICALL
+	Java_com_example_gen_CodecJNI_start(JNIEnv *env, jobject instance, jstring pinstance, jstring pconnection){
+        CodecClient* _CodecClient = new CodecClient();
+        const char* char_instance = env->GetStringUTFChars(pinstance,nullptr);
+		std::string _instance(char_instance);
+        const char* char_connection = env->GetStringUTFChars(pconnection,nullptr);
+		std::string _connection(char_connection);
+        _CodecClient->main(_instance, _connection);
+        _CodecClient->CodecClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/CodecJNI")));
+        _CodecClient->CodecInstance = nullptr;
+        BlobsConversionsInit(env);
+        CodecConversionsInit(env);
+        if(!(_CodecClient->myProxy->isAvailable())){
+            delete _CodecClient;
+            _CodecClient = nullptr;
+            return (jlong)0;
+        }
+        else{
+            return reinterpret_cast<jlong>(_CodecClient);
+        }
+    _CodecClient->BlobsClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/BlobsJNI")));}
+}
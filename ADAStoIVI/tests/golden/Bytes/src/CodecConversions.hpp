@@ -0,0 +1,89 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: CodecConversions.hpp
+
+#ifndef CODEC_CONVERSIONS_HPP
+#define CODEC_CONVERSIONS_HPP
+
+#include <string>
+#include <vector>
+#include <jni.h>
+#include "v1/org/example/bytes/Codec.hpp"
+#include "BlobsConversions.hpp"
+
+inline jobject CodecPacketToJava(JNIEnv *env, const ::v1::org::example::bytes::Codec::Packet &value);
+inline ::v1::org::example::bytes::Codec::Packet CodecPacketFromJava(JNIEnv *env, jobject object);
+inline jobjectArray CodecPacketArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::bytes::Codec::Packet> &values);
+inline std::vector<::v1::org::example::bytes::Codec::Packet> CodecPacketArrayFromJava(JNIEnv *env, jobjectArray array);
+
+inline jclass &CodecPacketClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline void CodecConversionsInit(JNIEnv *env){
+    BlobsConversionsInit(env);
+    if(CodecPacketClass() == nullptr){
+        CodecPacketClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/CodecJNI$Packet")));
+    }
+}
+
+inline jobject CodecPacketToJava(JNIEnv *env, const ::v1::org::example::bytes::Codec::Packet &value){
+    static jmethodID constructor = env->GetMethodID(CodecPacketClass(), "<init>", "([BLcom/example/gen/BlobsJNI$Frame;)V");
+    const auto &valueHead = value.getHead();
+    std::vector<jbyte> fieldHeadData(valueHead.begin(), valueHead.end());
+    jbyteArray fieldHead = env->NewByteArray(static_cast<jsize>(fieldHeadData.size()));
+    env->SetByteArrayRegion(fieldHead, 0, static_cast<jsize>(fieldHeadData.size()), fieldHeadData.data());
+    jobject fieldFrame = BlobsFrameToJava(env, value.getFrame());
+    jobject object = env->NewObject(CodecPacketClass(), constructor, fieldHead, fieldFrame);
+    env->DeleteLocalRef(fieldHead);
+    env->DeleteLocalRef(fieldFrame);
+    return object;
+}
+
+inline ::v1::org::example::bytes::Codec::Packet CodecPacketFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::bytes::Codec::Packet value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldHeadFID = env->GetFieldID(CodecPacketClass(), "head", "[B");
+    jbyteArray fieldHead = static_cast<jbyteArray>(env->GetObjectField(object, fieldHeadFID));
+    if(fieldHead != nullptr){
+        jsize fieldHeadLength = env->GetArrayLength(fieldHead);
+        jbyte *fieldHeadData = env->GetByteArrayElements(fieldHead, nullptr);
+        value.setHead(std::vector<uint8_t>(fieldHeadData, fieldHeadData + fieldHeadLength));
+        env->ReleaseByteArrayElements(fieldHead, fieldHeadData, JNI_ABORT);
+        env->DeleteLocalRef(fieldHead);
+    }
+    static jfieldID fieldFrameFID = env->GetFieldID(CodecPacketClass(), "frame", "Lcom/example/gen/BlobsJNI$Frame;");
+    jobject fieldFrame = env->GetObjectField(object, fieldFrameFID);
+    value.setFrame(BlobsFrameFromJava(env, fieldFrame));
+    env->DeleteLocalRef(fieldFrame);
+    return value;
+}
+
+inline jobjectArray CodecPacketArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::bytes::Codec::Packet> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), CodecPacketClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = CodecPacketToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::bytes::Codec::Packet> CodecPacketArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::bytes::Codec::Packet> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(CodecPacketFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+#endif
@@ -0,0 +1,412 @@
+package com.example.gen;
+
+public class CodecJNI {
+
+	static {
+		System.loadLibrary("Codec-Client");
+	}
+
+	public long proxyptr;
+	public native long start(String instance, String connection);
+	private CodecService service;
+
+    public static class Packet {
+		byte[] head;
+		BlobsJNI.Frame frame;
+
+		public Packet(){}
+        
+		public Packet(byte[] head, BlobsJNI.Frame frame){
+			this.head = head;
+			this.frame = frame;
+		}
+	}
+    public Packet PacketToCPP() {
+        return new Packet();
+    }
+    int AttributeBufferSubscription = -1;
+    public void subscribeAttributeBuffer(){
+        subAttributeBuffer(this.proxyptr);
+        ++AttributeBufferSubscription;
+    }
+        
+    public byte[] getAttributeBufferValue(){
+        return getAttributeBufferValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeBufferValue(byte[] buffer){
+        setAttributeBufferValue(this.proxyptr, service.timeout, service.sender,buffer);   
+    }
+        
+    public native void subAttributeBuffer(long proxyptr);
+    public void subAttributeBufferHandler(byte[] buffer){
+        service.AttributeBufferHandle(buffer);
+    }
+    public native byte[] getAttributeBufferValue(long proxyptr, int timeout, int sender);
+    public native byte[] setAttributeBufferValue(long proxyptr, int timeout, int sender, byte[] buffer);
+    public native void unsubAttributeBuffer(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeBuffer(){
+        if(this.AttributeBufferSubscription >= 0){
+            unsubAttributeBuffer(this.proxyptr, this.AttributeBufferSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeBufferRoSubscription = -1;
+    public void subscribeAttributeBufferRo(){
+        subAttributeBufferRo(this.proxyptr);
+        ++AttributeBufferRoSubscription;
+    }
+        
+    public byte[] getAttributeBufferRoValue(){
+        return getAttributeBufferRoValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public native void subAttributeBufferRo(long proxyptr);
+    public void subAttributeBufferRoHandler(byte[] bufferRo){
+        service.AttributeBufferRoHandle(bufferRo);
+    }
+    public native byte[] getAttributeBufferRoValue(long proxyptr, int timeout, int sender);
+    public native void unsubAttributeBufferRo(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeBufferRo(){
+        if(this.AttributeBufferRoSubscription >= 0){
+            unsubAttributeBufferRo(this.proxyptr, this.AttributeBufferRoSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeStoreSubscription = -1;
+    public void subscribeAttributeStore(){
+        subAttributeStore(this.proxyptr);
+        ++AttributeStoreSubscription;
+    }
+        
+    public Store[] getAttributeStoreValue(){
+        return getAttributeStoreValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeStoreValue(Store[] store){
+        setAttributeStoreValue(this.proxyptr, service.timeout, service.sender,store);   
+    }
+        
+    public native void subAttributeStore(long proxyptr);
+    public void subAttributeStoreHandler(Store[] store){
+        service.AttributeStoreHandle(store);
+    }
+    public native Store[] getAttributeStoreValue(long proxyptr, int timeout, int sender);
+    public native Store[] setAttributeStoreValue(long proxyptr, int timeout, int sender, Store[] store);
+    public native void unsubAttributeStore(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeStore(){
+        if(this.AttributeStoreSubscription >= 0){
+            unsubAttributeStore(this.proxyptr, this.AttributeStoreSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributePacketSubscription = -1;
+    public void subscribeAttributePacket(){
+        subAttributePacket(this.proxyptr);
+        ++AttributePacketSubscription;
+    }
+        
+    public Packet getAttributePacketValue(){
+        return getAttributePacketValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributePacketValue(Packet packet){
+        setAttributePacketValue(this.proxyptr, service.timeout, service.sender,packet);   
+    }
+        
+    public native void subAttributePacket(long proxyptr);
+    public void subAttributePacketHandler(Packet packet){
+        service.AttributePacketHandle(packet);
+    }
+    public native Packet getAttributePacketValue(long proxyptr, int timeout, int sender);
+    public native Packet setAttributePacketValue(long proxyptr, int timeout, int sender, Packet packet);
+    public native void unsubAttributePacket(long proxyptr, int subscription);
+    
+    
+    public void unsubscribeAttributePacket(){
+        if(this.AttributePacketSubscription >= 0){
+            unsubAttributePacket(this.proxyptr, this.AttributePacketSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributePacketsSubscription = -1;
+    public void subscribeAttributePackets(){
+        subAttributePackets(this.proxyptr);
+        ++AttributePacketsSubscription;
+    }
+        
+    public Packet[] getAttributePacketsValue(){
+        return getAttributePacketsValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributePacketsValue(Packet[] packets){
+        setAttributePacketsValue(this.proxyptr, service.timeout, service.sender,packets);   
+    }
+        
+    public native void subAttributePackets(long proxyptr);
+    public void subAttributePacketsHandler(Packet[] packets){
+        service.AttributePacketsHandle(packets);
+    }
+    public native Packet[] getAttributePacketsValue(long proxyptr, int timeout, int sender);
+    public native Packet[] setAttributePacketsValue(long proxyptr, int timeout, int sender, Packet[] packets);
+    public native void unsubAttributePackets(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributePackets(){
+        if(this.AttributePacketsSubscription >= 0){
+            unsubAttributePackets(this.proxyptr, this.AttributePacketsSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributePacketListSubscription = -1;
+    public void subscribeAttributePacketList(){
+        subAttributePacketList(this.proxyptr);
+        ++AttributePacketListSubscription;
+    }
+        
+    public Packet[] getAttributePacketListValue(){
+        return getAttributePacketListValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributePacketListValue(Packet[] packetList){
+        setAttributePacketListValue(this.proxyptr, service.timeout, service.sender,packetList);   
+    }
+        
+    public native void subAttributePacketList(long proxyptr);
+    public void subAttributePacketListHandler(Packet[] packetList){
+        service.AttributePacketListHandle(packetList);
+    }
+    public native Packet[] getAttributePacketListValue(long proxyptr, int timeout, int sender);
+    public native Packet[] setAttributePacketListValue(long proxyptr, int timeout, int sender, Packet[] packetList);
+    public native void unsubAttributePacketList(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributePacketList(){
+        if(this.AttributePacketListSubscription >= 0){
+            unsubAttributePacketList(this.proxyptr, this.AttributePacketListSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeFramesSubscription = -1;
+    public void subscribeAttributeFrames(){
+        subAttributeFrames(this.proxyptr);
+        ++AttributeFramesSubscription;
+    }
+        
+    public Frames[] getAttributeFramesValue(){
+        return getAttributeFramesValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeFramesValue(Frames[] frames){
+        setAttributeFramesValue(this.proxyptr, service.timeout, service.sender,frames);   
+    }
+        
+    public native void subAttributeFrames(long proxyptr);
+    public void subAttributeFramesHandler(Frames[] frames){
+        service.AttributeFramesHandle(frames);
+    }
+    public native Frames[] getAttributeFramesValue(long proxyptr, int timeout, int sender);
+    public native Frames[] setAttributeFramesValue(long proxyptr, int timeout, int sender, Frames[] frames);
+    public native void unsubAttributeFrames(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeFrames(){
+        if(this.AttributeFramesSubscription >= 0){
+            unsubAttributeFrames(this.proxyptr, this.AttributeFramesSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeEnvelopeSubscription = -1;
+    public void subscribeAttributeEnvelope(){
+        subAttributeEnvelope(this.proxyptr);
+        ++AttributeEnvelopeSubscription;
+    }
+        
+    public BlobsJNI.Envelope getAttributeEnvelopeValue(){
+        return getAttributeEnvelopeValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeEnvelopeValue(BlobsJNI.Envelope envelope){
+        setAttributeEnvelopeValue(this.proxyptr, service.timeout, service.sender,envelope);   
+    }
+        
+    public native void subAttributeEnvelope(long proxyptr);
+    public void subAttributeEnvelopeHandler(BlobsJNI.Envelope envelope){
+        service.AttributeEnvelopeHandle(envelope);
+    }
+    public native BlobsJNI.Envelope getAttributeEnvelopeValue(long proxyptr, int timeout, int sender);
+    public native BlobsJNI.Envelope setAttributeEnvelopeValue(long proxyptr, int timeout, int sender, BlobsJNI.Envelope envelope);
+    public native void unsubAttributeEnvelope(long proxyptr, int subscription);
+    
+    
+    public void unsubscribeAttributeEnvelope(){
+        if(this.AttributeEnvelopeSubscription >= 0){
+            unsubAttributeEnvelope(this.proxyptr, this.AttributeEnvelopeSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeFrameListSubscription = -1;
+    public void subscribeAttributeFrameList(){
+        subAttributeFrameList(this.proxyptr);
+        ++AttributeFrameListSubscription;
+    }
+        
+    public Frame[] getAttributeFrameListValue(){
+        return getAttributeFrameListValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeFrameListValue(Frame[] frameList){
+        setAttributeFrameListValue(this.proxyptr, service.timeout, service.sender,frameList);   
+    }
+        
+    public native void subAttributeFrameList(long proxyptr);
+    public void subAttributeFrameListHandler(Frame[] frameList){
+        service.AttributeFrameListHandle(frameList);
+    }
+    public native Frame[] getAttributeFrameListValue(long proxyptr, int timeout, int sender);
+    public native Frame[] setAttributeFrameListValue(long proxyptr, int timeout, int sender, Frame[] frameList);
+    public native void unsubAttributeFrameList(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeFrameList(){
+        if(this.AttributeFrameListSubscription >= 0){
+            unsubAttributeFrameList(this.proxyptr, this.AttributeFrameListSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    static class EncodeReturnType{
+        public byte[] output;
+		public Blobs.Frame f;
+		public Blobs.Envelope e2;
+		
+        public EncodeReturnType(){
+		}
+
+        public EncodeReturnType(byte[] output, Blobs.Frame f, Blobs.Envelope e2){
+			this.output = output;
+			this.f = f;
+			this.e2 = e2;
+		}
+
+    }
+    
+    public EncodeReturnType encode(byte[] input, Packet p, BlobsJNI.Envelope e){
+        return Encode(this.proxyptr, input, p, e);
+    }
+    public native EncodeReturnType Encode(long proxyptr, byte[] input, Packet p, BlobsJNI.Envelope e);
+    
+    /////////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    static class DecodeReturnType{
+        public Packet[] out1;
+		public Frame[] fs;
+		
+        public DecodeReturnType(){
+		}
+
+        public DecodeReturnType(Packet[] out1, Frame[] fs){
+			this.out1 = out1;
+			this.fs = fs;
+		}
+
+    }
+    
+    public DecodeReturnType decode(Packet[] ps, Frame[] fl){
+        return Decode(this.proxyptr, ps, fl);
+    }
+    public native DecodeReturnType Decode(long proxyptr, Packet[] ps, Frame[] fl);
+    
+    /////////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    public byte[] single(byte[] only){
+        return Single(this.proxyptr, only);
+    }
+    public native byte[] Single(long proxyptr, byte[] only);
+    
+    /////////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    public Store[] store(Store[] s){
+        return Store(this.proxyptr, s);
+    }
+    public native Store[] Store(long proxyptr, Store[] s);
+    
+    /////////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    public void push(byte[] data){
+        Push(this.proxyptr, data);
+    }
+    public native void Push(long proxyptr, byte[] data);
+    
+    ////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+    int ReceivedSubscription = -1;
+    public native void subBroadcastReceived(long proxyptr);
+    public native void unsubBroadcastReceived(long proxyptr, int subscription);
+    public void subscribeReceived(){
+        subBroadcastReceived(this.proxyptr);
+        ++this.ReceivedSubscription;
+    }
+    public void unsubscribeReceived(){
+        if(this.ReceivedSubscription >= 0){
+            unsubBroadcastReceived(this.proxyptr, this.ReceivedSubscription--);
+        }
+    }
+    
+    public void subBroadcastReceivedCallback(byte[] data, Packet p){
+        service.ReceivedCallback(data, p);
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int RawSubscription = -1;
+    public native void subBroadcastRaw(long proxyptr);
+    public native void unsubBroadcastRaw(long proxyptr, int subscription);
+    public void subscribeRaw(){
+        subBroadcastRaw(this.proxyptr);
+        ++this.RawSubscription;
+    }
+    public void unsubscribeRaw(){
+        if(this.RawSubscription >= 0){
+            unsubBroadcastRaw(this.proxyptr, this.RawSubscription--);
+        }
+    }
+    
+    public void subBroadcastRawCallback(byte[] data){
+        service.RawCallback(data);
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int EnvelopesSubscription = -1;
+    public native void subBroadcastEnvelopes(long proxyptr);
+    public native void unsubBroadcastEnvelopes(long proxyptr, int subscription);
+    public void subscribeEnvelopes(){
+        subBroadcastEnvelopes(this.proxyptr);
+        ++this.EnvelopesSubscription;
+    }
+    public void unsubscribeEnvelopes(){
+        if(this.EnvelopesSubscription >= 0){
+            unsubBroadcastEnvelopes(this.proxyptr, this.EnvelopesSubscription--);
+        }
+    }
+    
+    public void subBroadcastEnvelopesCallback(Blobs.Envelope e, Store[] s){
+        service.EnvelopesCallback(e, s);
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    
+	CodecJNI(CodecService service, String instance, String connection){
+		this.proxyptr = start(instance, connection);
+		this.service = service;
+	}
+
+}
\ No newline at end of file
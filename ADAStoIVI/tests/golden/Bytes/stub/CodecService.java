@@ -0,0 +1,1090 @@
+package com.example.gen;
+
+import android.app.Service;
+import android.content.Intent;
+import android.os.IBinder;
+import android.os.RemoteException;
+import android.util.Log;
+import java.util.ArrayList;
+    
+public class CodecService extends Service{
+    public CodecService(){}
+    private CodecJNI myProxy;
+    public static int timeout = 1000; // Needs to be changed
+    public static int sender = 5555; // Needs to be changed
+    public static String connection = ""; // Needs to be changed
+    public static String instance = ""; // Needs to be changed
+    private static final String TAG = "CodecService";
+    
+    public boolean proxyGeneration(){
+        if(myProxy == null){
+            myProxy = new CodecJNI(this, instance, connection);
+        }
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+            return false;
+        }
+        else{
+            Log.d(TAG, "Proxy Connection Succeeded!");
+            return true;
+        }
+    }
+    
+    @Override
+    public void onCreate(){
+        super.onCreate();
+        myProxy = new CodecJNI(this, instance, connection);
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+        }
+        Log.d(TAG, "onCreate");
+    }
+    @Override
+    public IBinder onBind(Intent intent){
+        Log.d(TAG, "onBind");
+        return binder;
+    }
+    private final Codec.Stub binder = new Codec.Stub(){
+        @Override
+        public void subscribeAttributeBuffer(CodecBufferHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.BufferHandler.contains(handler)){
+                CodecService.BufferHandler.add(handler);
+                if(CodecService.BufferHandler.size() == 1){
+                    myProxy.subscribeAttributeBuffer();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeBufferValue(byte[] buffer) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeBufferValue(buffer);
+        }
+        @Override
+        public byte[] getAttributeBufferValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            byte[] _buffer = myProxy.getAttributeBufferValue();
+            byte[] buffer;
+            buffer = _buffer;
+            return buffer;
+        }
+        @Override
+        public void unsubscribeAttributeBuffer(CodecBufferHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.BufferHandler.contains(handler)){
+                CodecService.BufferHandler.remove(handler);
+                if(CodecService.BufferHandler.size() == 0){
+                    myProxy.unsubscribeAttributeBuffer(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeBufferRo(CodecBufferRoHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.BufferRoHandler.contains(handler)){
+                CodecService.BufferRoHandler.add(handler);
+                if(CodecService.BufferRoHandler.size() == 1){
+                    myProxy.subscribeAttributeBufferRo();    
+                }
+            }
+        }
+        @Override
+        public byte[] getAttributeBufferRoValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            byte[] _bufferRo = myProxy.getAttributeBufferRoValue();
+            byte[] bufferRo;
+            bufferRo = _bufferRo;
+            return bufferRo;
+        }
+        @Override
+        public void unsubscribeAttributeBufferRo(CodecBufferRoHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.BufferRoHandler.contains(handler)){
+                CodecService.BufferRoHandler.remove(handler);
+                if(CodecService.BufferRoHandler.size() == 0){
+                    myProxy.unsubscribeAttributeBufferRo(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeStore(CodecStoreHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.StoreHandler.contains(handler)){
+                CodecService.StoreHandler.add(handler);
+                if(CodecService.StoreHandler.size() == 1){
+                    myProxy.subscribeAttributeStore();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeStoreValue(Store[] store) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            BlobsJNI.Store[] _store = new BlobsJNI.Store[store.length];
+            for(int m = 0; m < store.length; m++){
+                _store[m] = new BlobsJNI.Store();
+                _store[m].key = store[m].key;
+                _store[m].value = store[m].value;
+            }
+            
+            myProxy.setAttributeStoreValue(_store);
+        }
+        @Override
+        public Store[] getAttributeStoreValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            BlobsJNI.Store[] _store = myProxy.getAttributeStoreValue();
+            if(_store == null){
+                return null;
+            }
+            Store[] store = new Store[_store.length];
+            for(int m = 0; m < _store.length; m++){
+                store[m] = new Store();
+                store[m].key = _store[m].key;
+                store[m].value = _store[m].value;
+            }
+            
+            
+            return store;
+        }
+        @Override
+        public void unsubscribeAttributeStore(CodecStoreHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.StoreHandler.contains(handler)){
+                CodecService.StoreHandler.remove(handler);
+                if(CodecService.StoreHandler.size() == 0){
+                    myProxy.unsubscribeAttributeStore(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributePacket(CodecPacketHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.PacketHandler.contains(handler)){
+                CodecService.PacketHandler.add(handler);
+                if(CodecService.PacketHandler.size() == 1){
+                    myProxy.subscribeAttributePacket();    
+                }
+            }
+        }
+        @Override
+        public void setAttributePacketValue(Packet packet) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            CodecJNI.Packet _packet = new CodecJNI.Packet();
+            _packet.head = packet.head;
+            _packet.frame = new BlobsJNI.Frame();
+            _packet.frame.id = packet.frame.id;
+            _packet.frame.data = packet.frame.data;
+            myProxy.setAttributePacketValue(_packet);
+        }
+        @Override
+        public Packet getAttributePacketValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            CodecJNI.Packet _packet = myProxy.getAttributePacketValue();
+            Packet packet = new Packet();
+            packet.head = _packet.head;
+            packet.frame = new /*Blobs.*/Frame();
+            packet.frame.id = _packet.frame.id;
+            packet.frame.data = _packet.frame.data;
+            return packet;
+        }
+        @Override
+        public void unsubscribeAttributePacket(CodecPacketHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.PacketHandler.contains(handler)){
+                CodecService.PacketHandler.remove(handler);
+                if(CodecService.PacketHandler.size() == 0){
+                    myProxy.unsubscribeAttributePacket(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributePackets(CodecPacketsHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.PacketsHandler.contains(handler)){
+                CodecService.PacketsHandler.add(handler);
+                if(CodecService.PacketsHandler.size() == 1){
+                    myProxy.subscribeAttributePackets();    
+                }
+            }
+        }
+        @Override
+        public void setAttributePacketsValue(Packets packets) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            CodecJNI.Packet[] _packets = new CodecJNI.Packet[packets.data.length];
+            for(int i = 0; i < packets.data.length; i++){
+                _packets[i] = new CodecJNI.Packet();	
+	            _packets[i].head = packets.data[i].head;
+	            _packets[i].frame = new BlobsJNI.Frame();
+	            _packets[i].frame.id = packets.data[i].frame.id;
+	            _packets[i].frame.data = packets.data[i].frame.data;
+            }
+            myProxy.setAttributePacketsValue(_packets);
+        }
+        @Override
+        public Packets getAttributePacketsValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            CodecJNI.Packet[] _packets = myProxy.getAttributePacketsValue();
+            if(_packets == null){
+                return null;
+            }
+            Packets packets = new Packets();
+            packets.data = new Packet[_packets.length];
+            for(int i = 0; i < _packets.length; i++){
+                packets.data[i] = new Packet();	
+	            packets.data[i].head = new Byte[_packets[i].head.length];
+	            packets.data[i].head = _packets[i].head;
+	            packets.data[i].frame = new /*Blobs.*/Frame();
+	            packets.data[i].frame.id = _packets[i].frame.id;
+	            packets.data[i].frame.data = _packets[i].frame.data;
+            }
+            return packets;
+        }
+        @Override
+        public void unsubscribeAttributePackets(CodecPacketsHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.PacketsHandler.contains(handler)){
+                CodecService.PacketsHandler.remove(handler);
+                if(CodecService.PacketsHandler.size() == 0){
+                    myProxy.unsubscribeAttributePackets(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributePacketList(CodecPacketListHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.PacketListHandler.contains(handler)){
+                CodecService.PacketListHandler.add(handler);
+                if(CodecService.PacketListHandler.size() == 1){
+                    myProxy.subscribeAttributePacketList();    
+                }
+            }
+        }
+        @Override
+        public void setAttributePacketListValue(Packet[] packetList) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            CodecJNI.Packet[] _packetList = new CodecJNI.Packet[packetList.length];
+            for(int i = 0; i < packetList.length; i++){
+                _packetList[i] = new CodecJNI.Packet();	
+	            _packetList[i].head = packetList[i].head;
+	            _packetList[i].frame = new BlobsJNI.Frame();
+	            _packetList[i].frame.id = packetList[i].frame.id;
+	            _packetList[i].frame.data = packetList[i].frame.data;
+            }
+            myProxy.setAttributePacketListValue(_packetList);
+        }
+        @Override
+        public Packet[] getAttributePacketListValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            CodecJNI.Packet[] _packetList = myProxy.getAttributePacketListValue();
+            if(_packetList == null){
+                return null;
+            }
+            Packet[] packetList = new Packet[_packetList.length];
+            for(int i = 0; i < _packetList.length; i++){
+                packetList[i] = new Packet();	
+	            packetList[i].head = new Byte[_packetList[i].head.length];
+	            packetList[i].head = _packetList[i].head;
+	            packetList[i].frame = new /*Blobs.*/Frame();
+	            packetList[i].frame.id = _packetList[i].frame.id;
+	            packetList[i].frame.data = _packetList[i].frame.data;
+            }
+            return packetList;
+        }
+        @Override
+        public void unsubscribeAttributePacketList(CodecPacketListHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.PacketListHandler.contains(handler)){
+                CodecService.PacketListHandler.remove(handler);
+                if(CodecService.PacketListHandler.size() == 0){
+                    myProxy.unsubscribeAttributePacketList(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeFrames(CodecFramesHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.FramesHandler.contains(handler)){
+                CodecService.FramesHandler.add(handler);
+                if(CodecService.FramesHandler.size() == 1){
+                    myProxy.subscribeAttributeFrames();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeFramesValue(Frames[] frames) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            BlobsJNI.Frames[] _frames = new BlobsJNI.Frames[frames.length];
+            for(int m = 0; m < frames.length; m++){
+                _frames[m] = new BlobsJNI.Frames();
+                _frames[m].key = frames[m].key;
+                _frames[m].value = new BlobsJNI.Frame();
+                _frames[m].value.id = frames[m].value.id;
+                
+            }
+            
+            myProxy.setAttributeFramesValue(_frames);
+        }
+        @Override
+        public Frames[] getAttributeFramesValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            BlobsJNI.Frames[] _frames = myProxy.getAttributeFramesValue();
+            if(_frames == null){
+                return null;
+            }
+            Frames[] frames = new Frames[_frames.length];
+            for(int m = 0; m < _frames.length; m++){
+                frames[m] = new Frames();
+                frames[m].key = _frames[m].key;
+                frames[m].value = new Frame();
+                frames[m].value.id = _frames[m].value.id;
+                
+            }
+            
+            
+            return frames;
+        }
+        @Override
+        public void unsubscribeAttributeFrames(CodecFramesHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.FramesHandler.contains(handler)){
+                CodecService.FramesHandler.remove(handler);
+                if(CodecService.FramesHandler.size() == 0){
+                    myProxy.unsubscribeAttributeFrames(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeEnvelope(CodecEnvelopeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.EnvelopeHandler.contains(handler)){
+                CodecService.EnvelopeHandler.add(handler);
+                if(CodecService.EnvelopeHandler.size() == 1){
+                    myProxy.subscribeAttributeEnvelope();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeEnvelopeValue(Envelope envelope) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            BlobsJNI.Envelope _envelope = new BlobsJNI.Envelope();
+            _envelope.frame = new BlobsJNI.Frame();
+            _envelope.frame.id = envelope.frame.id;
+            _envelope.frame.data = envelope.frame.data;
+            _envelope.frames = new BlobsJNI.Frame[envelope.frames.length];
+            for(int k = 0; k < envelope.frames.length; k++){	
+	            _envelope.frames[k].id = envelope.frames[k].id;
+	            _envelope.frames[k].data = envelope.frames[k].data;
+            }
+            _envelope.trailer = envelope.trailer;
+            myProxy.setAttributeEnvelopeValue(_envelope);
+        }
+        @Override
+        public Envelope getAttributeEnvelopeValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            BlobsJNI.Envelope _envelope = myProxy.getAttributeEnvelopeValue();
+            Envelope envelope = new Envelope();
+            envelope.frame = new /*Blobs.*/Frame();
+            envelope.frame.id = _envelope.frame.id;
+            envelope.frame.data = _envelope.frame.data;
+            envelope.frames = new Frame[_envelope.frames.length];
+            for(int j = 0; j < _envelope.frames.length; j++){
+                envelope.frames[j] = new Frame();	
+	            envelope.frames[j].id = _envelope.frames[j].id;
+	            envelope.frames[j].data = new Byte[_envelope.frames[j].data.length];
+	            envelope.frames[j].data = _envelope.frames[j].data;
+            }
+            envelope.trailer = _envelope.trailer;
+            return envelope;
+        }
+        @Override
+        public void unsubscribeAttributeEnvelope(CodecEnvelopeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.EnvelopeHandler.contains(handler)){
+                CodecService.EnvelopeHandler.remove(handler);
+                if(CodecService.EnvelopeHandler.size() == 0){
+                    myProxy.unsubscribeAttributeEnvelope(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeFrameList(CodecFrameListHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.FrameListHandler.contains(handler)){
+                CodecService.FrameListHandler.add(handler);
+                if(CodecService.FrameListHandler.size() == 1){
+                    myProxy.subscribeAttributeFrameList();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeFrameListValue(FrameList frameList) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            BlobsJNI.Frame[] _frameList = new BlobsJNI.Frame[frameList.data.length];
+            for(int i = 0; i < frameList.data.length; i++){
+                _frameList[i] = new BlobsJNI.Frame();	
+	            _frameList[i].id = frameList.data[i].id;
+	            _frameList[i].data = frameList.data[i].data;
+            }
+            myProxy.setAttributeFrameListValue(_frameList);
+        }
+        @Override
+        public FrameList getAttributeFrameListValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            BlobsJNI.Frame[] _frameList = myProxy.getAttributeFrameListValue();
+            if(_frameList == null){
+                return null;
+            }
+            Blobs.FrameList frameList = new Blobs.FrameList();
+            frameList.data = new Frame[_frameList.length];
+            for(int i = 0; i < _frameList.length; i++){
+                frameList.data[i] = new Frame();	
+	            frameList.data[i].id = _frameList[i].id;
+	            frameList.data[i].data = new Byte[_frameList[i].data.length];
+	            frameList.data[i].data = _frameList[i].data;
+            }
+            return frameList;
+        }
+        @Override
+        public void unsubscribeAttributeFrameList(CodecFrameListHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.FrameListHandler.contains(handler)){
+                CodecService.FrameListHandler.remove(handler);
+                if(CodecService.FrameListHandler.size() == 0){
+                    myProxy.unsubscribeAttributeFrameList(); 
+                }
+            }
+        }
+        
+        @Override
+        public EncodeReturnType encode(byte[] input, Packet p, Blobs.Envelope e) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            EncodeReturnType encodeService = new EncodeReturnType();
+            CodecJNI.Packet _p = new CodecJNI.Packet();
+            _p.head = p.head;
+            _p.frame = new BlobsJNI.Frame();
+            _p.frame.id = p.frame.id;
+            _p.frame.data = p.frame.data;BlobsJNI.Envelope _e = new BlobsJNI.Envelope();
+            _e.frame = new BlobsJNI.Frame();
+            _e.frame.id = e.frame.id;
+            _e.frame.data = e.frame.data;
+            _e.frames = new BlobsJNI.Frame[e.frames.length];
+            for(int k = 0; k < e.frames.length; k++){	
+	            _e.frames[k].id = e.frames[k].id;
+	            _e.frames[k].data = e.frames[k].data;
+            }
+            _e.trailer = e.trailer;
+            CodecJNI.EncodeReturnType _encodeService = myProxy.encode(input, _p, _e);
+            encodeService.output = new Byte[_encodeService.output.length];
+            encodeService.output = _encodeService.output;
+            encodeService.f = new Blobs.Frame();
+            encodeService.f.id = _encodeService.f.id;
+            encodeService.f.data = _encodeService.f.data;encodeService.e2 = new Blobs.Envelope();
+            encodeService.e2.frame = new /*Blobs.*/Frame();
+            encodeService.e2.frame.id = _encodeService.e2.frame.id;
+            encodeService.e2.frame.data = _encodeService.e2.frame.data;
+            encodeService.e2.frames = new Frame[_encodeService.e2.frames.length];
+            for(int j = 0; j < _encodeService.e2.frames.length; j++){
+                encodeService.e2.frames[j] = new Frame();	
+	            encodeService.e2.frames[j].id = _encodeService.e2.frames[j].id;
+	            encodeService.e2.frames[j].data = new Byte[_encodeService.e2.frames[j].data.length];
+	            encodeService.e2.frames[j].data = _encodeService.e2.frames[j].data;
+            }
+            encodeService.e2.trailer = _encodeService.e2.trailer;
+            return encodeService;
+        }
+        
+        @Override
+        public DecodeReturnType decode(Packet[] ps, FrameList fl) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            DecodeReturnType decodeService = new DecodeReturnType();
+            CodecJNI.Packet[] _ps = new CodecJNI.Packet[ps.length];
+            for(int i = 0; i < ps.length; i++){
+                _ps[i] = new CodecJNI.Packet();	
+	            _ps[i].head = ps[i].head;
+	            _ps[i].frame = new BlobsJNI.Frame();
+	            _ps[i].frame.id = ps[i].frame.id;
+	            _ps[i].frame.data = ps[i].frame.data;
+            }BlobsJNI.Frame[] _fl = new BlobsJNI.Frame[fl.data.length];
+            for(int i = 0; i < fl.data.length; i++){
+                _fl[i] = new BlobsJNI.Frame();	
+	            _fl[i].id = fl.data[i].id;
+	            _fl[i].data = fl.data[i].data;
+            }
+            CodecJNI.DecodeReturnType _decodeService = myProxy.decode(_ps, _fl);
+            decodeService.out1.data = new Packet[_decodeService.out1.length];
+            for(int i = 0; i < _decodeService.out1.length; i ++){
+                decodeService.out1[i] = new Packet();
+                	
+	            decodeService.out1.data[i].head = new Byte[_decodeService.out1.data[i].head.length];
+	            decodeService.out1.data[i].head = _decodeService.out1.data[i].head;
+	            decodeService.out1.data[i].frame = new /*Blobs.*/Frame();
+	            decodeService.out1.data[i].frame.id = _decodeService.out1.data[i].frame.id;
+	            decodeService.out1.data[i].frame.data = _decodeService.out1.data[i].frame.data;
+            }
+            decodeService.fs = new Frame[_decodeService.fs.length];
+            for(int i = 0; i < _decodeService.fs.length; i ++){
+                decodeService.fs[i] = new Frame();
+                	
+	            decodeService.fs[i].id = _decodeService.fs[i].id;
+	            decodeService.fs[i].data = new Byte[_decodeService.fs[i].data.length];
+	            decodeService.fs[i].data = _decodeService.fs[i].data;
+            }
+            
+            return decodeService;
+        }
+        
+        @Override
+        public byte[] single(byte[] only) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            byte[] result;
+            
+            byte[] _result = myProxy.single(only);
+            result = new Byte[_result.length];
+            result = _result;
+            
+            return result;
+        }
+        
+        @Override
+        public Store[] store(Store[] s) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            Store[] r;
+            BlobsJNI.Store[] _s = new BlobsJNI.Store[s.length];
+            for(int m = 0; m < s.length; m++){
+                _s[m] = new BlobsJNI.Store();
+                _s[m].key = s[m].key;
+                _s[m].value = s[m].value;
+            }
+            
+            
+            BlobsJNI.Store[] _r = myProxy.store(_s);
+            r = new Store[_r.length];
+                for(int m = 0; m < _r.length; m++){
+                r[m] = new Store();
+                r[m].key = _r[m].key;
+                r[m].value = _r[m].value;
+            }
+            
+            
+            return r;
+        }
+        
+        @Override
+        public void push(byte[] data) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            //No Return value
+            
+            myProxy.push(data);
+            
+            
+        }
+        
+        @Override
+        public void subscribeReceived(CodecReceivedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.ReceivedCallback.contains(callback)){
+                CodecService.ReceivedCallback.add(callback);
+                if(CodecService.ReceivedCallback.size() == 1){
+                    myProxy.subscribeReceived();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeReceived(CodecReceivedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.ReceivedCallback.contains(callback)){
+                CodecService.ReceivedCallback.remove(callback);
+                if(CodecService.ReceivedCallback.size() == 1){
+                    myProxy.unsubscribeReceived();
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeRaw(CodecRawCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.RawCallback.contains(callback)){
+                CodecService.RawCallback.add(callback);
+                if(CodecService.RawCallback.size() == 1){
+                    myProxy.subscribeRaw();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeRaw(CodecRawCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.RawCallback.contains(callback)){
+                CodecService.RawCallback.remove(callback);
+                if(CodecService.RawCallback.size() == 1){
+                    myProxy.unsubscribeRaw();
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeEnvelopes(CodecEnvelopesCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!CodecService.EnvelopesCallback.contains(callback)){
+                CodecService.EnvelopesCallback.add(callback);
+                if(CodecService.EnvelopesCallback.size() == 1){
+                    myProxy.subscribeEnvelopes();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeEnvelopes(CodecEnvelopesCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(CodecService.EnvelopesCallback.contains(callback)){
+                CodecService.EnvelopesCallback.remove(callback);
+                if(CodecService.EnvelopesCallback.size() == 1){
+                    myProxy.unsubscribeEnvelopes();
+                }
+            }
+        }
+        
+    };
+    private static ArrayList<CodecBufferHandler> BufferHandler = new ArrayList<>();
+    void AttributeBufferHandle(byte[] _buffer){
+        if(this.BufferHandler != null){
+            byte[] buffer = _buffer;
+            for(CodecBufferHandler handler : this.BufferHandler){
+                try {
+                    handler.runBufferHandler(buffer);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecBufferRoHandler> BufferRoHandler = new ArrayList<>();
+    void AttributeBufferRoHandle(byte[] _bufferRo){
+        if(this.BufferRoHandler != null){
+            byte[] bufferRo = _bufferRo;
+            for(CodecBufferRoHandler handler : this.BufferRoHandler){
+                try {
+                    handler.runBufferRoHandler(bufferRo);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecStoreHandler> StoreHandler = new ArrayList<>();
+    void AttributeStoreHandle(BlobsJNI.Store[] _store){
+        if(this.StoreHandler != null){
+            Store[] store = new Store[_store.length];
+            for(int m = 0; m < _store.length; m++){
+                store[m] = new Store();
+                store[m].key = _store[m].key;
+                store[m].value = _store[m].value;
+            }
+            
+            for(CodecStoreHandler handler : this.StoreHandler){
+                try {
+                    handler.runStoreHandler(store);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecPacketHandler> PacketHandler = new ArrayList<>();
+    void AttributePacketHandle(CodecJNI.Packet _packet){
+        if(this.PacketHandler != null){
+            /*Codec.*/Packet packet = new /*Codec.*/Packet();
+            packet.head = _packet.head;
+            packet.frame = new /*Blobs.*/Frame();
+            packet.frame.id = _packet.frame.id;
+            packet.frame.data = _packet.frame.data;
+            for(CodecPacketHandler handler : this.PacketHandler){
+                try {
+                    handler.runPacketHandler(packet);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecPacketsHandler> PacketsHandler = new ArrayList<>();
+    void AttributePacketsHandle(CodecJNI.Packet[] _packets){
+        if(this.PacketsHandler != null){
+            /*Codec.*/Packets packets = new /*Codec.*/Packets();
+            packets.data = new Packet[_packets.length];
+            for(int i = 0; i < _packets.length; i++){
+                //CodecJNI.Packet _packetsElement = _packets[i];
+                packets.data[i] = new Packet();
+            	
+	            packets.data[i].head = new Byte[_packets[i].head.length];
+	            packets.data[i].head = _packets[i].head;
+	            packets.data[i].frame = new /*Blobs.*/Frame();
+	            packets.data[i].frame.id = _packets[i].frame.id;
+	            packets.data[i].frame.data = _packets[i].frame.data;
+            }
+            for(CodecPacketsHandler handler : this.PacketsHandler){
+                try {
+                    handler.runPacketsHandler(packets);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecPacketListHandler> PacketListHandler = new ArrayList<>();
+    void AttributePacketListHandle(CodecJNI.Packet[] _packetList){
+        if(this.PacketListHandler != null){
+            Packet[] packetList = new Packet[_packetList.length];
+            for(int i = 0; i < _packetList.length; i++){
+                packetList[i] = new Packet();
+            	
+	            packetList[i].head = new Byte[_packetList[i].head.length];
+	            packetList[i].head = _packetList[i].head;
+	            packetList[i].frame = new /*Blobs.*/Frame();
+	            packetList[i].frame.id = _packetList[i].frame.id;
+	            packetList[i].frame.data = _packetList[i].frame.data;
+            }
+            for(CodecPacketListHandler handler : this.PacketListHandler){
+                try {
+                    handler.runPacketListHandler(packetList);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecFramesHandler> FramesHandler = new ArrayList<>();
+    void AttributeFramesHandle(BlobsJNI.Frames[] _frames){
+        if(this.FramesHandler != null){
+            Frames[] frames = new Frames[_frames.length];
+            for(int m = 0; m < _frames.length; m++){
+                frames[m] = new Frames();
+                frames[m].key = _frames[m].key;
+                frames[m].value = new Frame();
+                frames[m].value.id = _frames[m].value.id;
+                
+            }
+            
+            for(CodecFramesHandler handler : this.FramesHandler){
+                try {
+                    handler.runFramesHandler(frames);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecEnvelopeHandler> EnvelopeHandler = new ArrayList<>();
+    void AttributeEnvelopeHandle(BlobsJNI.Envelope _envelope){
+        if(this.EnvelopeHandler != null){
+            /*Blobs.*/Envelope envelope = new /*Blobs.*/Envelope();
+            envelope.frame = new /*Blobs.*/Frame();
+            envelope.frame.id = _envelope.frame.id;
+            envelope.frame.data = _envelope.frame.data;
+            envelope.frames = new Frame[_envelope.frames.length];
+            for(int j = 0; j < _envelope.frames.length; j++){
+                envelope.frames[j] = new Frame();	
+	            envelope.frames[j].id = _envelope.frames[j].id;
+	            envelope.frames[j].data = new Byte[_envelope.frames[j].data.length];
+	            envelope.frames[j].data = _envelope.frames[j].data;
+            }
+            envelope.trailer = _envelope.trailer;
+            for(CodecEnvelopeHandler handler : this.EnvelopeHandler){
+                try {
+                    handler.runEnvelopeHandler(envelope);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecFrameListHandler> FrameListHandler = new ArrayList<>();
+    void AttributeFrameListHandle(BlobsJNI.Frame[] _frameList){
+        if(this.FrameListHandler != null){
+            /*Blobs.*/FrameList frameList = new /*Blobs.*/FrameList();
+            frameList.data = new Frame[_frameList.length];
+            for(int i = 0; i < _frameList.length; i++){
+                //BlobsJNI.Frame _frameListElement = _frameList[i];
+                frameList.data[i] = new Frame();
+            	
+	            frameList.data[i].id = _frameList[i].id;
+	            frameList.data[i].data = new Byte[_frameList[i].data.length];
+	            frameList.data[i].data = _frameList[i].data;
+            }
+            for(CodecFrameListHandler handler : this.FrameListHandler){
+                try {
+                    handler.runFrameListHandler(frameList);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecReceivedCallback> ReceivedCallback = new ArrayList<>();
+    void ReceivedCallback(byte[] _data, CodecJNI.Packet _p){
+        if(this.ReceivedCallback != null){
+            byte[] data = _data;
+            Packet p = new Packet();
+            p.head = _p.head;
+            p.frame = new /*Blobs.*/Frame();
+            p.frame.id = _p.frame.id;
+            p.frame.data = _p.frame.data;
+			for(CodecReceivedCallback callback : this.ReceivedCallback){
+                try {
+                    callback.onReceivedReceived(data, p);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecRawCallback> RawCallback = new ArrayList<>();
+    void RawCallback(byte[] _data){
+        if(this.RawCallback != null){
+            byte[] data = _data;
+            for(CodecRawCallback callback : this.RawCallback){
+                try {
+                    callback.onRawReceived(data);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<CodecEnvelopesCallback> EnvelopesCallback = new ArrayList<>();
+    void EnvelopesCallback(BlobsJNI.Blobs.Envelope _e, BlobsJNI.Store[] _s){
+        if(this.EnvelopesCallback != null){
+            Envelope e = new Envelope();
+            e.frame = new /*Blobs.*/Frame();
+            e.frame.id = _e.frame.id;
+            e.frame.data = _e.frame.data;
+            e.frames = new Frame[_e.frames.length];
+            for(int j = 0; j < _e.frames.length; j++){
+                e.frames[j] = new Frame();	
+	            e.frames[j].id = _e.frames[j].id;
+	            e.frames[j].data = new Byte[_e.frames[j].data.length];
+	            e.frames[j].data = _e.frames[j].data;
+            }
+            e.trailer = _e.trailer;
+			Store[] s = new Store[_s.length];
+            for(int m = 0; m < _s.length; m++){
+                s[m] = new Store();
+                s[m].key = _s[m].key;
+                s[m].value = _s[m].value;
+            }
+            for(CodecEnvelopesCallback callback : this.EnvelopesCallback){
+                try {
+                    callback.onEnvelopesReceived(e, s);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+}
\ No newline at end of file
@@ -0,0 +1,271 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: BaseClient.cpp
+
+#include <iostream>
+#include <jni.h>
+#include <string.h>
+#include <CommonAPI/CommonAPI.hpp>
+#include "v1/org/example/inherit/BaseProxy.hpp"
+#include "BaseConversions.hpp"
+
+#define LOGI(...) ((void)__android_log_print(ANDROID_LOG_INFO, LOG_TAG, __VA_ARGS__))
+#define LOGE(...) ((void)__android_log_print(ANDROID_LOG_ERROR, LOG_TAG, __VA_ARGS__))
+#include <android/log.h>
+#define LOG_TAG "BaseClientCPP"
+using namespace v1::org::example::inherit;
+
+class BaseClient{
+	public:
+	BaseClient(){
+	};
+	std::shared_ptr<BaseProxy<>> myProxy;
+	void main(std::string pinstance, std::string pconnection);
+	jclass BaseClazz;
+	jobject BaseInstance;
+	jclass CommonClazz;
+	//jobject CommonInstance
+};
+        
+JavaVM *jvm;
+JNIEnv *jenv;
+
+JNIEXPORT jint JNICALL JNI_OnLoad(JavaVM* vm, void* reserved){
+	jvm = vm;
+	if ((vm)->GetEnv((void**)&jenv, JNI_VERSION_1_6) != JNI_OK) {
+		return JNI_ERR; //Failed to obtain JNIEnv
+	}
+	return JNI_VERSION_1_6;
+}
+
+void BaseClient::main(std::string pinstance, std::string pconnection){
+	std::shared_ptr<CommonAPI::Runtime> runtime = CommonAPI::Runtime::get();
+	
+    std::string domain = "local";
+	//std::string instance = "org.example.inherit.Base";
+	std::string instance = pinstance;
+	std::string connection = pconnection;
+    myProxy = runtime->buildProxy<BaseProxy>(domain, instance,connection);
+    int8_t break_cnt = 0;
+    while(!myProxy->isAvailable()){
+        std::this_thread::sleep_for(std::chrono::microseconds(10));
+        if(break_cnt == 50){
+            break;
+        }
+        break_cnt++;
+    }
+}
+extern "C"{
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_BaseJNI_subAttributeMode(JNIEnv *env, jobject instance, jlong proxyptr){
+        BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+        _BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	_BaseClient->myProxy->getModeAttribute().getChangedEvent().subscribe(
+    		[_BaseClient](Base::Mode _mode){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject BaseInstance = _BaseClient->BaseInstance;
+    		jclass BaseClazz = env->GetObjectClass(BaseInstance);
+        	jmethodID ModeMID = env->GetMethodID(BaseClazz, "subAttributeModeHandler", "(B)V");
+        	uint8_t _modeInt = static_cast<uint8_t>(_mode);
+        	jbyte mode = static_cast<jbyte>(_modeInt);
+			env->CallVoidMethod(BaseInstance, ModeMID, mode);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_BaseJNI_getAttributeModeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+    	//_BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	jobject BaseInstance = env->AllocObject(_BaseClient->BaseClazz);
+            
+        /*::v1::org::example::inherit::*/Base::Mode _mode;
+    	_BaseClient->myProxy->getModeAttribute().getValue(callStatus, _mode, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value mode failed!");
+    	}
+        uint8_t _modeInt = static_cast<uint8_t>(_mode);
+        jbyte modeInt = static_cast<jbyte>(_modeInt);
+        env->DeleteLocalRef(BaseInstance);
+        return modeInt;
+    }
+
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_BaseJNI_setAttributeModeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyte mode){
+    	BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+    	//_BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        jbyte modeInt = mode;
+        uint8_t _modeInt = static_cast<uint8_t>(modeInt);
+        Base::Mode _mode = Base::Mode::Literal(_modeInt);
+        Base::Mode _modeResponse;
+        _BaseClient->myProxy->getModeAttribute().setValue(_mode, callStatus, _modeResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value mode failed!");
+        }
+        _modeInt = static_cast<uint8_t>(_modeResponse);
+        jbyte modeResponse = static_cast<jbyte>(_modeInt);
+        return modeResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_BaseJNI_unsubAttributeMode(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+    	//_BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_BaseClient->myProxy->getModeAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_BaseJNI_subAttributeOuter(JNIEnv *env, jobject instance, jlong proxyptr){
+        BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+        _BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	_BaseClient->myProxy->getOuterAttribute().getChangedEvent().subscribe(
+    		[_BaseClient](Base::Outer _outer){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject BaseInstance = _BaseClient->BaseInstance;
+    		jclass BaseClazz = env->GetObjectClass(BaseInstance);
+        	jmethodID OuterMID = env->GetMethodID(BaseClazz, "subAttributeOuterHandler", "(Lcom/example/gen/BaseJNI$Outer;)V");
+        	jobject outer = BaseOuterToJava(env, _outer);
+			env->CallVoidMethod(BaseInstance, OuterMID, outer);
+			env->DeleteLocalRef(outer);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_BaseJNI_getAttributeOuterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+    	//_BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::inherit::*/Base::Outer _outer;
+    	_BaseClient->myProxy->getOuterAttribute().getValue(callStatus, _outer, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value outer failed!");
+    	}
+        jobject outer = BaseOuterToJava(env, _outer);
+        return outer;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_BaseJNI_setAttributeOuterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject outer){
+    	BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+    	//_BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::inherit::Base::Outer _outer = BaseOuterFromJava(env, outer);
+        ::v1::org::example::inherit::Base::Outer _outerResponse;
+        _BaseClient->myProxy->getOuterAttribute().setValue(_outer, callStatus, _outerResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value outer failed!");
+        }
+        jobject outerResponse = BaseOuterToJava(env, _outerResponse);
+        return outerResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_BaseJNI_unsubAttributeOuter(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+    	//_BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_BaseClient->myProxy->getOuterAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_BaseJNI_subBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr){
+        BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+        _BaseClient->BaseInstance = env->NewGlobalRef(instance);
+        _BaseClient->myProxy->getChangedEvent().subscribe(
+            [_BaseClient](Base::Inner _inner){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastChanged!");  
+            }
+            jobject BaseInstance = _BaseClient->BaseInstance;
+            jclass BaseClazz = env->GetObjectClass(BaseInstance);
+            jmethodID ChangedMID = env->GetMethodID(BaseClazz, "subBroadcastChangedCallback", "(Lcom/example/gen/BaseJNI$Inner;)V");
+                jobject inner = BaseInnerToJava(env, _inner);
+                env->CallVoidMethod(BaseInstance,ChangedMID, inner);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_BaseJNI_unsubBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+        _BaseClient->BaseInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_BaseClient->myProxy->getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT jobject JNICALL
+    Java_com_example_gen_BaseJNI_Configure(JNIEnv *env, jobject instance, jlong proxyptr, jobject config, jbyte mode){
+        BaseClient* _BaseClient = reinterpret_cast<BaseClient*>(proxyptr);
+        _BaseClient->BaseInstance = env->NewGlobalRef(instance);
+        jobject BaseInstance = env->AllocObject(_BaseClient->BaseClazz);
+        
+        ::v1::org::example::inherit::Base::Outer _config = BaseOuterFromJava(env, config);
+        jbyte modeInt = mode;
+        uint8_t _modeInt = static_cast<uint8_t>(modeInt);
+        Base::Mode _mode = Base::Mode::Literal(_modeInt);
+        
+        ::v1::org::example::inherit::Base::Inner _result;
+        
+        CommonAPI::CallStatus callStatus;
+        _BaseClient->myProxy->configure(_config, _mode, callStatus, _result);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("configure failed!");
+        }
+        jobject result = BaseInnerToJava(env, _result);
+        
+        return result;
+    }
+
+	JNIEXPORT jlong JNICALL
+	Java_com_example_gen_BaseJNI_start(JNIEnv *env, jobject instance, jstring pinstance, jstring pconnection){
+        BaseClient* _BaseClient = new BaseClient();
+        const char* char_instance = env->GetStringUTFChars(pinstance,nullptr);
+		std::string _instance(char_instance);
+        const char* char_connection = env->GetStringUTFChars(pconnection,nullptr);
+		std::string _connection(char_connection);
+        _BaseClient->main(_instance, _connection);
+        _BaseClient->BaseClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/BaseJNI")));
+        _BaseClient->BaseInstance = nullptr;
+        BaseConversionsInit(env);
+        if(!(_BaseClient->myProxy->isAvailable())){
+            delete _BaseClient;
+            _BaseClient = nullptr;
+            return (jlong)0;
+        }
+        else{
+            return reinterpret_cast<jlong>(_BaseClient);
+        }
+    _BaseClient->CommonClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/CommonJNI")));}
+}
@@ -0,0 +1,144 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: BaseConversions.hpp
+
+#ifndef BASE_CONVERSIONS_HPP
+#define BASE_CONVERSIONS_HPP
+
+#include <string>
+#include <vector>
+#include <jni.h>
+#include "v1/org/example/inherit/Base.hpp"
+#include "CommonConversions.hpp"
+
+inline jobject BaseInnerToJava(JNIEnv *env, const ::v1::org::example::inherit::Base::Inner &value);
+inline ::v1::org::example::inherit::Base::Inner BaseInnerFromJava(JNIEnv *env, jobject object);
+inline jobjectArray BaseInnerArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::inherit::Base::Inner> &values);
+inline std::vector<::v1::org::example::inherit::Base::Inner> BaseInnerArrayFromJava(JNIEnv *env, jobjectArray array);
+inline jobject BaseOuterToJava(JNIEnv *env, const ::v1::org::example::inherit::Base::Outer &value);
+inline ::v1::org::example::inherit::Base::Outer BaseOuterFromJava(JNIEnv *env, jobject object);
+inline jobjectArray BaseOuterArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::inherit::Base::Outer> &values);
+inline std::vector<::v1::org::example::inherit::Base::Outer> BaseOuterArrayFromJava(JNIEnv *env, jobjectArray array);
+
+inline jclass &BaseInnerClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline jclass &BaseOuterClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline void BaseConversionsInit(JNIEnv *env){
+    CommonConversionsInit(env);
+    if(BaseInnerClass() == nullptr){
+        BaseInnerClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/BaseJNI$Inner")));
+    }
+    if(BaseOuterClass() == nullptr){
+        BaseOuterClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/BaseJNI$Outer")));
+    }
+}
+
+inline jobject BaseInnerToJava(JNIEnv *env, const ::v1::org::example::inherit::Base::Inner &value){
+    static jmethodID constructor = env->GetMethodID(BaseInnerClass(), "<init>", "(BLcom/example/gen/CommonJNI$Point;)V");
+    jbyte fieldLevel = static_cast<jbyte>(value.getLevel());
+    jobject fieldPoint = CommonPointToJava(env, value.getPoint());
+    jobject object = env->NewObject(BaseInnerClass(), constructor, fieldLevel, fieldPoint);
+    env->DeleteLocalRef(fieldPoint);
+    return object;
+}
+
+inline ::v1::org::example::inherit::Base::Inner BaseInnerFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::inherit::Base::Inner value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldLevelFID = env->GetFieldID(BaseInnerClass(), "level", "B");
+    value.setLevel(static_cast<uint8_t>(env->GetByteField(object, fieldLevelFID)));
+    static jfieldID fieldPointFID = env->GetFieldID(BaseInnerClass(), "point", "Lcom/example/gen/CommonJNI$Point;");
+    jobject fieldPoint = env->GetObjectField(object, fieldPointFID);
+    value.setPoint(CommonPointFromJava(env, fieldPoint));
+    env->DeleteLocalRef(fieldPoint);
+    return value;
+}
+
+inline jobjectArray BaseInnerArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::inherit::Base::Inner> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), BaseInnerClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = BaseInnerToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::inherit::Base::Inner> BaseInnerArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::inherit::Base::Inner> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(BaseInnerFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+inline jobject BaseOuterToJava(JNIEnv *env, const ::v1::org::example::inherit::Base::Outer &value){
+    static jmethodID constructor = env->GetMethodID(BaseOuterClass(), "<init>", "(Lcom/example/gen/BaseJNI$Inner;[Lcom/example/gen/BaseJNI$Inner;B)V");
+    jobject fieldInner = BaseInnerToJava(env, value.getInner());
+    jobjectArray fieldInners = BaseInnerArrayToJava(env, value.getInners());
+    jbyte fieldMode = static_cast<jbyte>(static_cast<uint8_t>(value.getMode()));
+    jobject object = env->NewObject(BaseOuterClass(), constructor, fieldInner, fieldInners, fieldMode);
+    env->DeleteLocalRef(fieldInner);
+    env->DeleteLocalRef(fieldInners);
+    return object;
+}
+
+inline ::v1::org::example::inherit::Base::Outer BaseOuterFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::inherit::Base::Outer value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldInnerFID = env->GetFieldID(BaseOuterClass(), "inner", "Lcom/example/gen/BaseJNI$Inner;");
+    jobject fieldInner = env->GetObjectField(object, fieldInnerFID);
+    value.setInner(BaseInnerFromJava(env, fieldInner));
+    env->DeleteLocalRef(fieldInner);
+    static jfieldID fieldInnersFID = env->GetFieldID(BaseOuterClass(), "inners", "[Lcom/example/gen/BaseJNI$Inner;");
+    jobjectArray fieldInners = static_cast<jobjectArray>(env->GetObjectField(object, fieldInnersFID));
+    value.setInners(BaseInnerArrayFromJava(env, fieldInners));
+    env->DeleteLocalRef(fieldInners);
+    static jfieldID fieldModeFID = env->GetFieldID(BaseOuterClass(), "mode", "B");
+    value.setMode(::v1::org::example::inherit::Base::Mode::Literal(static_cast<uint8_t>(env->GetByteField(object, fieldModeFID))));
+    return value;
+}
+
+inline jobjectArray BaseOuterArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::inherit::Base::Outer> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), BaseOuterClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = BaseOuterToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::inherit::Base::Outer> BaseOuterArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::inherit::Base::Outer> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(BaseOuterFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+#endif
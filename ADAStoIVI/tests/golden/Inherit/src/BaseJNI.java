@@ -0,0 +1,132 @@
+package com.example.gen;
+
+public class BaseJNI {
+
+	static {
+		System.loadLibrary("Base-Client");
+	}
+
+	public long proxyptr;
+	public native long start(String instance, String connection);
+	private BaseService service;
+
+    public static class Inner {
+		byte level;
+		CommonJNI.Point point;
+
+		public Inner(){}
+        
+		public Inner(byte level, CommonJNI.Point point){
+			this.level = level;
+			this.point = point;
+		}
+	}
+    public Inner InnerToCPP() {
+        return new Inner();
+    }
+    public static class Outer {
+		Inner inner;
+		Inner[] inners;
+		byte mode;
+
+		public Outer(){}
+        
+		public Outer(Inner inner, Inner[] inners, byte mode){
+			this.inner = inner;
+			this.inners = inners;
+			this.mode = mode;
+		}
+	}
+    public Outer OuterToCPP() {
+        return new Outer();
+    }
+    int AttributeModeSubscription = -1;
+    public void subscribeAttributeMode(){
+        subAttributeMode(this.proxyptr);
+        ++AttributeModeSubscription;
+    }
+        
+    public byte getAttributeModeValue(){
+        return getAttributeModeValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeModeValue(byte mode){
+        setAttributeModeValue(this.proxyptr, service.timeout, service.sender,mode);   
+    }
+        
+    public native void subAttributeMode(long proxyptr);
+    public void subAttributeModeHandler(byte mode){
+        service.AttributeModeHandle(mode);
+    }
+    public native byte getAttributeModeValue(long proxyptr, int timeout, int sender);
+    public native byte setAttributeModeValue(long proxyptr, int timeout, int sender, byte mode);
+    public native void unsubAttributeMode(long proxyptr, int subscription);
+    
+    
+    public void unsubscribeAttributeMode(){
+        if(this.AttributeModeSubscription >= 0){
+            unsubAttributeMode(this.proxyptr, this.AttributeModeSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeOuterSubscription = -1;
+    public void subscribeAttributeOuter(){
+        subAttributeOuter(this.proxyptr);
+        ++AttributeOuterSubscription;
+    }
+        
+    public Outer getAttributeOuterValue(){
+        return getAttributeOuterValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeOuterValue(Outer outer){
+        setAttributeOuterValue(this.proxyptr, service.timeout, service.sender,outer);   
+    }
+        
+    public native void subAttributeOuter(long proxyptr);
+    public void subAttributeOuterHandler(Outer outer){
+        service.AttributeOuterHandle(outer);
+    }
+    public native Outer getAttributeOuterValue(long proxyptr, int timeout, int sender);
+    public native Outer setAttributeOuterValue(long proxyptr, int timeout, int sender, Outer outer);
+    public native void unsubAttributeOuter(long proxyptr, int subscription);
+    
+    
+    public void unsubscribeAttributeOuter(){
+        if(this.AttributeOuterSubscription >= 0){
+            unsubAttributeOuter(this.proxyptr, this.AttributeOuterSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    public Inner configure(Outer config, byte mode){
+        return Configure(this.proxyptr, config, mode);
+    }
+    public native Inner Configure(long proxyptr, Outer config, byte mode);
+    
+    ////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+    int ChangedSubscription = -1;
+    public native void subBroadcastChanged(long proxyptr);
+    public native void unsubBroadcastChanged(long proxyptr, int subscription);
+    public void subscribeChanged(){
+        subBroadcastChanged(this.proxyptr);
+        ++this.ChangedSubscription;
+    }
+    public void unsubscribeChanged(){
+        if(this.ChangedSubscription >= 0){
+            unsubBroadcastChanged(this.proxyptr, this.ChangedSubscription--);
+        }
+    }
+    
+    public void subBroadcastChangedCallback(Inner inner){
+        service.ChangedCallback(inner);
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    
+	BaseJNI(BaseService service, String instance, String connection){
+		this.proxyptr = start(instance, connection);
+		this.service = service;
+	}
+
+}
\ No newline at end of file
@@ -0,0 +1,73 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: CommonConversions.hpp
+
+#ifndef COMMON_CONVERSIONS_HPP
+#define COMMON_CONVERSIONS_HPP
+
+#include <string>
+#include <vector>
+#include <jni.h>
+#include "v1/org/example/inherit/Common.hpp"
+
+inline jobject CommonPointToJava(JNIEnv *env, const ::v1::org::example::inherit::Common::Point &value);
+inline ::v1::org::example::inherit::Common::Point CommonPointFromJava(JNIEnv *env, jobject object);
+inline jobjectArray CommonPointArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::inherit::Common::Point> &values);
+inline std::vector<::v1::org::example::inherit::Common::Point> CommonPointArrayFromJava(JNIEnv *env, jobjectArray array);
+
+inline jclass &CommonPointClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline void CommonConversionsInit(JNIEnv *env){
+    if(CommonPointClass() == nullptr){
+        CommonPointClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/CommonJNI$Point")));
+    }
+}
+
+inline jobject CommonPointToJava(JNIEnv *env, const ::v1::org::example::inherit::Common::Point &value){
+    static jmethodID constructor = env->GetMethodID(CommonPointClass(), "<init>", "(II)V");
+    jint fieldX = static_cast<jint>(value.getX());
+    jint fieldY = static_cast<jint>(value.getY());
+    jobject object = env->NewObject(CommonPointClass(), constructor, fieldX, fieldY);
+    return object;
+}
+
+inline ::v1::org::example::inherit::Common::Point CommonPointFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::inherit::Common::Point value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldXFID = env->GetFieldID(CommonPointClass(), "x", "I");
+    value.setX(static_cast<int32_t>(env->GetIntField(object, fieldXFID)));
+    static jfieldID fieldYFID = env->GetFieldID(CommonPointClass(), "y", "I");
+    value.setY(static_cast<int32_t>(env->GetIntField(object, fieldYFID)));
+    return value;
+}
+
+inline jobjectArray CommonPointArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::inherit::Common::Point> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), CommonPointClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = CommonPointToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::inherit::Common::Point> CommonPointArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::inherit::Common::Point> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(CommonPointFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+#endif
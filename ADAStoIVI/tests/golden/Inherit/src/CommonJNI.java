@@ -0,0 +1,18 @@
+package com.example.gen;
+public class CommonJNI{
+    
+    public static class Point {
+		int x;
+		int y;
+
+		public Point(){}
+        
+		public Point(int x, int y){
+			this.x = x;
+			this.y = y;
+		}
+	}
+    public Point PointToCPP() {
+        return new Point();
+    }
+}
\ No newline at end of file
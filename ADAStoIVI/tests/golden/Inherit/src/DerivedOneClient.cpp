@@ -0,0 +1,349 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: DerivedOneClient.cpp
+
+#include <iostream>
+#include <jni.h>
+#include <string.h>
+#include <CommonAPI/CommonAPI.hpp>
+#include "v1/org/example/inherit/DerivedOneProxy.hpp"
+#include "BaseConversions.hpp"
+
+//extends interface Base
+
+#define LOGI(...) ((void)__android_log_print(ANDROID_LOG_INFO, LOG_TAG, __VA_ARGS__))
+#define LOGE(...) ((void)__android_log_print(ANDROID_LOG_ERROR, LOG_TAG, __VA_ARGS__))
+#include <android/log.h>
+#define LOG_TAG "DerivedOneClientCPP"
+using namespace v1::org::example::inherit;
+
+class DerivedOneClient{
+	public:
+	DerivedOneClient(){
+	};
+	std::shared_ptr<DerivedOneProxy<>> myProxy;
+	void main(std::string pinstance, std::string pconnection);
+	jclass DerivedOneClazz;
+	jobject DerivedOneInstance;
+	jclass CommonClazz;
+	//jobject CommonInstance
+};
+        
+JavaVM *jvm;
+JNIEnv *jenv;
+
+JNIEXPORT jint JNICALL JNI_OnLoad(JavaVM* vm, void* reserved){
+	jvm = vm;
+	if ((vm)->GetEnv((void**)&jenv, JNI_VERSION_1_6) != JNI_OK) {
+		return JNI_ERR; //Failed to obtain JNIEnv
+	}
+	return JNI_VERSION_1_6;
+}
+
+void DerivedOneClient::main(std::string pinstance, std::string pconnection){
+	std::shared_ptr<CommonAPI::Runtime> runtime = CommonAPI::Runtime::get();
+	
+    std::string domain = "local";
+	//std::string instance = "org.example.inherit.DerivedOne";
+	std::string instance = pinstance;
+	std::string connection = pconnection;
+    myProxy = runtime->buildProxy<DerivedOneProxy>(domain, instance,connection);
+    int8_t break_cnt = 0;
+    while(!myProxy->isAvailable()){
+        std::this_thread::sleep_for(std::chrono::microseconds(10));
+        if(break_cnt == 50){
+            break;
+        }
+        break_cnt++;
+    }
+}
+extern "C"{
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedOneJNI_subAttributeCount(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+        _DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	_DerivedOneClient->myProxy->getCountAttribute().getChangedEvent().subscribe(
+    		[_DerivedOneClient](uint32_t _count){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedOneInstance = _DerivedOneClient->DerivedOneInstance;
+    		jclass DerivedOneClazz = env->GetObjectClass(DerivedOneInstance);
+			jmethodID CountMID = env->GetMethodID(DerivedOneClazz, "subAttributeCountHandler", "(J)V");
+        	jlong count = static_cast<jlong>(_count);
+			env->CallVoidMethod(DerivedOneInstance, CountMID, count);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jlong JNICALL
+	Java_com_example_gen_DerivedOneJNI_getAttributeCountValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	uint32_t _count;
+    	_DerivedOneClient->myProxy->getCountAttribute().getValue(callStatus, _count, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value count failed!");
+    	}
+        return static_cast<jlong>(_count);
+    }
+
+    
+    JNIEXPORT jlong JNICALL
+	Java_com_example_gen_DerivedOneJNI_setAttributeCountValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jlong count){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        uint32_t _count = static_cast<uint32_t>(count);
+        uint32_t _countResponse;
+        _DerivedOneClient->myProxy->getCountAttribute().setValue(_count, callStatus, _countResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value count failed!");
+        }
+        return static_cast<jlong>(_countResponse);
+        }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedOneJNI_unsubAttributeCount(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedOneClient->myProxy->getCountAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+    Java_com_example_gen_DerivedOneJNI_Reset(JNIEnv *env, jobject instance, jlong proxyptr, jbyte level){
+        DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+        _DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+        uint8_t _level = static_cast<uint8_t>(level);
+		
+        CommonAPI::CallStatus callStatus;
+        _DerivedOneClient->myProxy->reset(_level, callStatus);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("reset failed!");
+        }
+        
+    }
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedOneJNI_subAttributeMode(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+        _DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	_DerivedOneClient->myProxy->getModeAttribute().getChangedEvent().subscribe(
+    		[_DerivedOneClient](DerivedOne::Mode _mode){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedOneInstance = _DerivedOneClient->DerivedOneInstance;
+    		jclass DerivedOneClazz = env->GetObjectClass(DerivedOneInstance);
+        	jmethodID ModeMID = env->GetMethodID(DerivedOneClazz, "subAttributeModeHandler", "(B)V");
+        	uint8_t _modeInt = static_cast<uint8_t>(_mode);
+        	jbyte mode = static_cast<jbyte>(_modeInt);
+			env->CallVoidMethod(DerivedOneInstance, ModeMID, mode);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_DerivedOneJNI_getAttributeModeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	jobject DerivedOneInstance = env->AllocObject(_DerivedOneClient->DerivedOneClazz);
+            
+        /*::v1::org::example::inherit::*/DerivedOne::Mode _mode;
+    	_DerivedOneClient->myProxy->getModeAttribute().getValue(callStatus, _mode, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value mode failed!");
+    	}
+        uint8_t _modeInt = static_cast<uint8_t>(_mode);
+        jbyte modeInt = static_cast<jbyte>(_modeInt);
+        env->DeleteLocalRef(DerivedOneInstance);
+        return modeInt;
+    }
+
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_DerivedOneJNI_setAttributeModeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyte mode){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        jbyte modeInt = mode;
+        uint8_t _modeInt = static_cast<uint8_t>(modeInt);
+        DerivedOne::Mode _mode = DerivedOne::Mode::Literal(_modeInt);
+        DerivedOne::Mode _modeResponse;
+        _DerivedOneClient->myProxy->getModeAttribute().setValue(_mode, callStatus, _modeResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value mode failed!");
+        }
+        _modeInt = static_cast<uint8_t>(_modeResponse);
+        jbyte modeResponse = static_cast<jbyte>(_modeInt);
+        return modeResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedOneJNI_unsubAttributeMode(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedOneClient->myProxy->getModeAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedOneJNI_subAttributeOuter(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+        _DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	_DerivedOneClient->myProxy->getOuterAttribute().getChangedEvent().subscribe(
+    		[_DerivedOneClient](DerivedOne::Outer _outer){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedOneInstance = _DerivedOneClient->DerivedOneInstance;
+    		jclass DerivedOneClazz = env->GetObjectClass(DerivedOneInstance);
+        	jmethodID OuterMID = env->GetMethodID(DerivedOneClazz, "subAttributeOuterHandler", "(Lcom/example/gen/DerivedOneJNI$Outer;)V");
+        	jobject outer = BaseOuterToJava(env, _outer);
+			env->CallVoidMethod(DerivedOneInstance, OuterMID, outer);
+			env->DeleteLocalRef(outer);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_DerivedOneJNI_getAttributeOuterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::inherit::*/DerivedOne::Outer _outer;
+    	_DerivedOneClient->myProxy->getOuterAttribute().getValue(callStatus, _outer, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value outer failed!");
+    	}
+        jobject outer = BaseOuterToJava(env, _outer);
+        return outer;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_DerivedOneJNI_setAttributeOuterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject outer){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::inherit::Base::Outer _outer = BaseOuterFromJava(env, outer);
+        ::v1::org::example::inherit::Base::Outer _outerResponse;
+        _DerivedOneClient->myProxy->getOuterAttribute().setValue(_outer, callStatus, _outerResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value outer failed!");
+        }
+        jobject outerResponse = BaseOuterToJava(env, _outerResponse);
+        return outerResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedOneJNI_unsubAttributeOuter(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+    	//_DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedOneClient->myProxy->getOuterAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_DerivedOneJNI_subBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+        _DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+        _DerivedOneClient->myProxy->getChangedEvent().subscribe(
+            [_DerivedOneClient](DerivedOne::Inner _inner){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastChanged!");  
+            }
+            jobject DerivedOneInstance = _DerivedOneClient->DerivedOneInstance;
+            jclass DerivedOneClazz = env->GetObjectClass(DerivedOneInstance);
+            jmethodID ChangedMID = env->GetMethodID(DerivedOneClazz, "subBroadcastChangedCallback", "(Lcom/example/gen/DerivedOneJNI$Inner;)V");
+                jobject inner = BaseInnerToJava(env, _inner);
+                env->CallVoidMethod(DerivedOneInstance,ChangedMID, inner);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedOneJNI_unsubBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+        _DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_DerivedOneClient->myProxy->getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT jobject JNICALL
+    Java_com_example_gen_DerivedOneJNI_Configure(JNIEnv *env, jobject instance, jlong proxyptr, jobject config, jbyte mode){
+        DerivedOneClient* _DerivedOneClient = reinterpret_cast<DerivedOneClient*>(proxyptr);
+        _DerivedOneClient->DerivedOneInstance = env->NewGlobalRef(instance);
+        jobject DerivedOneInstance = env->AllocObject(_DerivedOneClient->DerivedOneClazz);
+        
+        ::v1::org::example::inherit::Base::Outer _config = BaseOuterFromJava(env, config);
+        jbyte modeInt = mode;
+        uint8_t _modeInt = static_cast<uint8_t>(modeInt);
+        DerivedOne::Mode _mode = DerivedOne::Mode::Literal(_modeInt);
+        
+        ::v1::org::example::inherit::Base::Inner _result;
+        
+        CommonAPI::CallStatus callStatus;
+        _DerivedOneClient->myProxy->configure(_config, _mode, callStatus, _result);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("configure failed!");
+        }
+        jobject result = BaseInnerToJava(env, _result);
+        
+        return result;
+    }
+
+	JNIEXPORT jlong JNICALL
+	Java_com_example_gen_DerivedOneJNI_start(JNIEnv *env, jobject instance, jstring pinstance, jstring pconnection){
+        DerivedOneClient* _DerivedOneClient = new DerivedOneClient();
+        const char* char_instance = env->GetStringUTFChars(pinstance,nullptr);
+		std::string _instance(char_instance);
+        const char* char_connection = env->GetStringUTFChars(pconnection,nullptr);
+		std::string _connection(char_connection);
+        _DerivedOneClient->main(_instance, _connection);
+        _DerivedOneClient->DerivedOneClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/DerivedOneJNI")));
+        _DerivedOneClient->DerivedOneInstance = nullptr;
+        BaseConversionsInit(env);
+        if(!(_DerivedOneClient->myProxy->isAvailable())){
+            delete _DerivedOneClient;
+            _DerivedOneClient = nullptr;
+            return (jlong)0;
+        }
+        else{
+            return reinterpret_cast<jlong>(_DerivedOneClient);
+        }
+    _DerivedOneClient->CommonClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/CommonJNI")));}
+}
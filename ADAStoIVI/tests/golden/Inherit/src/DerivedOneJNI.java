@@ -0,0 +1,55 @@
+package com.example.gen;
+
+public class DerivedOneJNI extends BaseJNI{
+
+	static {
+		System.loadLibrary("DerivedOne-Client");
+	}
+
+	public long proxyptr;
+	public native long start(String instance, String connection);
+	private DerivedOneService service;
+
+    int AttributeCountSubscription = -1;
+    public void subscribeAttributeCount(){
+        subAttributeCount(this.proxyptr);
+        ++AttributeCountSubscription;
+    }
+        
+    public long getAttributeCountValue(){
+        return getAttributeCountValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeCountValue(long count){
+        setAttributeCountValue(this.proxyptr, service.timeout, service.sender,count);   
+    }
+        
+    public native void subAttributeCount(long proxyptr);
+    public void subAttributeCountHandler(long count){
+        service.AttributeCountHandle(count);
+    }
+    public native long getAttributeCountValue(long proxyptr, int timeout, int sender);
+    public native long setAttributeCountValue(long proxyptr, int timeout, int sender, long count);
+    public native void unsubAttributeCount(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeCount(){
+        if(this.AttributeCountSubscription >= 0){
+            unsubAttributeCount(this.proxyptr, this.AttributeCountSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    public void reset(byte level){
+        Reset(this.proxyptr, level);
+    }
+    public native void Reset(long proxyptr, byte level);
+    
+    /////////////////////////////////////////////////////////////////////////////////////////
+	DerivedOneJNI(DerivedOneService service, String instance, String connection){
+		this.proxyptr = start(instance, connection);
+		this.service = service;
+	}
+
+}
\ No newline at end of file
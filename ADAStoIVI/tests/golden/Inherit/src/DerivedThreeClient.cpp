@@ -0,0 +1,336 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: DerivedThreeClient.cpp
+
+#include <iostream>
+#include <jni.h>
+#include <string.h>
+#include <CommonAPI/CommonAPI.hpp>
+#include "v1/org/example/inherit/DerivedThreeProxy.hpp"
+#include "BaseConversions.hpp"
+
+//extends interface Base
+
+#define LOGI(...) ((void)__android_log_print(ANDROID_LOG_INFO, LOG_TAG, __VA_ARGS__))
+#define LOGE(...) ((void)__android_log_print(ANDROID_LOG_ERROR, LOG_TAG, __VA_ARGS__))
+#include <android/log.h>
+#define LOG_TAG "DerivedThreeClientCPP"
+using namespace v1::org::example::inherit;
+
+class DerivedThreeClient{
+	public:
+	DerivedThreeClient(){
+	};
+	std::shared_ptr<DerivedThreeProxy<>> myProxy;
+	void main(std::string pinstance, std::string pconnection);
+	jclass DerivedThreeClazz;
+	jobject DerivedThreeInstance;
+	jclass CommonClazz;
+	//jobject CommonInstance
+};
+        
+JavaVM *jvm;
+JNIEnv *jenv;
+
+JNIEXPORT jint JNICALL JNI_OnLoad(JavaVM* vm, void* reserved){
+	jvm = vm;
+	if ((vm)->GetEnv((void**)&jenv, JNI_VERSION_1_6) != JNI_OK) {
+		return JNI_ERR; //Failed to obtain JNIEnv
+	}
+	return JNI_VERSION_1_6;
+}
+
+void DerivedThreeClient::main(std::string pinstance, std::string pconnection){
+	std::shared_ptr<CommonAPI::Runtime> runtime = CommonAPI::Runtime::get();
+	
+    std::string domain = "local";
+	//std::string instance = "org.example.inherit.DerivedThree";
+	std::string instance = pinstance;
+	std::string connection = pconnection;
+    myProxy = runtime->buildProxy<DerivedThreeProxy>(domain, instance,connection);
+    int8_t break_cnt = 0;
+    while(!myProxy->isAvailable()){
+        std::this_thread::sleep_for(std::chrono::microseconds(10));
+        if(break_cnt == 50){
+            break;
+        }
+        break_cnt++;
+    }
+}
+extern "C"{
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedThreeJNI_subAttributeEnabled(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+        _DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	_DerivedThreeClient->myProxy->getEnabledAttribute().getChangedEvent().subscribe(
+    		[_DerivedThreeClient](bool _enabled){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedThreeInstance = _DerivedThreeClient->DerivedThreeInstance;
+    		jclass DerivedThreeClazz = env->GetObjectClass(DerivedThreeInstance);
+			jmethodID EnabledMID = env->GetMethodID(DerivedThreeClazz, "subAttributeEnabledHandler", "(Z)V");
+        	jboolean enabled = static_cast<jboolean>(_enabled);
+			env->CallVoidMethod(DerivedThreeInstance, EnabledMID, enabled);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jboolean JNICALL
+	Java_com_example_gen_DerivedThreeJNI_getAttributeEnabledValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	bool _enabled;
+    	_DerivedThreeClient->myProxy->getEnabledAttribute().getValue(callStatus, _enabled, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value enabled failed!");
+    	}
+        return static_cast<jboolean>(_enabled);
+    }
+
+    
+    JNIEXPORT jboolean JNICALL
+	Java_com_example_gen_DerivedThreeJNI_setAttributeEnabledValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jboolean enabled){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        bool _enabled = static_cast<bool>(enabled);
+        bool _enabledResponse;
+        _DerivedThreeClient->myProxy->getEnabledAttribute().setValue(_enabled, callStatus, _enabledResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value enabled failed!");
+        }
+        return static_cast<jboolean>(_enabledResponse);
+        }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedThreeJNI_unsubAttributeEnabled(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedThreeClient->myProxy->getEnabledAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedThreeJNI_subAttributeMode(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+        _DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	_DerivedThreeClient->myProxy->getModeAttribute().getChangedEvent().subscribe(
+    		[_DerivedThreeClient](DerivedThree::Mode _mode){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedThreeInstance = _DerivedThreeClient->DerivedThreeInstance;
+    		jclass DerivedThreeClazz = env->GetObjectClass(DerivedThreeInstance);
+        	jmethodID ModeMID = env->GetMethodID(DerivedThreeClazz, "subAttributeModeHandler", "(B)V");
+        	uint8_t _modeInt = static_cast<uint8_t>(_mode);
+        	jbyte mode = static_cast<jbyte>(_modeInt);
+			env->CallVoidMethod(DerivedThreeInstance, ModeMID, mode);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_DerivedThreeJNI_getAttributeModeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	jobject DerivedThreeInstance = env->AllocObject(_DerivedThreeClient->DerivedThreeClazz);
+            
+        /*::v1::org::example::inherit::*/DerivedThree::Mode _mode;
+    	_DerivedThreeClient->myProxy->getModeAttribute().getValue(callStatus, _mode, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value mode failed!");
+    	}
+        uint8_t _modeInt = static_cast<uint8_t>(_mode);
+        jbyte modeInt = static_cast<jbyte>(_modeInt);
+        env->DeleteLocalRef(DerivedThreeInstance);
+        return modeInt;
+    }
+
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_DerivedThreeJNI_setAttributeModeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyte mode){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        jbyte modeInt = mode;
+        uint8_t _modeInt = static_cast<uint8_t>(modeInt);
+        DerivedThree::Mode _mode = DerivedThree::Mode::Literal(_modeInt);
+        DerivedThree::Mode _modeResponse;
+        _DerivedThreeClient->myProxy->getModeAttribute().setValue(_mode, callStatus, _modeResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value mode failed!");
+        }
+        _modeInt = static_cast<uint8_t>(_modeResponse);
+        jbyte modeResponse = static_cast<jbyte>(_modeInt);
+        return modeResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedThreeJNI_unsubAttributeMode(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedThreeClient->myProxy->getModeAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedThreeJNI_subAttributeOuter(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+        _DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	_DerivedThreeClient->myProxy->getOuterAttribute().getChangedEvent().subscribe(
+    		[_DerivedThreeClient](DerivedThree::Outer _outer){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedThreeInstance = _DerivedThreeClient->DerivedThreeInstance;
+    		jclass DerivedThreeClazz = env->GetObjectClass(DerivedThreeInstance);
+        	jmethodID OuterMID = env->GetMethodID(DerivedThreeClazz, "subAttributeOuterHandler", "(Lcom/example/gen/DerivedThreeJNI$Outer;)V");
+        	jobject outer = BaseOuterToJava(env, _outer);
+			env->CallVoidMethod(DerivedThreeInstance, OuterMID, outer);
+			env->DeleteLocalRef(outer);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_DerivedThreeJNI_getAttributeOuterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::inherit::*/DerivedThree::Outer _outer;
+    	_DerivedThreeClient->myProxy->getOuterAttribute().getValue(callStatus, _outer, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value outer failed!");
+    	}
+        jobject outer = BaseOuterToJava(env, _outer);
+        return outer;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_DerivedThreeJNI_setAttributeOuterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject outer){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::inherit::Base::Outer _outer = BaseOuterFromJava(env, outer);
+        ::v1::org::example::inherit::Base::Outer _outerResponse;
+        _DerivedThreeClient->myProxy->getOuterAttribute().setValue(_outer, callStatus, _outerResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value outer failed!");
+        }
+        jobject outerResponse = BaseOuterToJava(env, _outerResponse);
+        return outerResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedThreeJNI_unsubAttributeOuter(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+    	//_DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedThreeClient->myProxy->getOuterAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_DerivedThreeJNI_subBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+        _DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+        _DerivedThreeClient->myProxy->getChangedEvent().subscribe(
+            [_DerivedThreeClient](DerivedThree::Inner _inner){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastChanged!");  
+            }
+            jobject DerivedThreeInstance = _DerivedThreeClient->DerivedThreeInstance;
+            jclass DerivedThreeClazz = env->GetObjectClass(DerivedThreeInstance);
+            jmethodID ChangedMID = env->GetMethodID(DerivedThreeClazz, "subBroadcastChangedCallback", "(Lcom/example/gen/DerivedThreeJNI$Inner;)V");
+                jobject inner = BaseInnerToJava(env, _inner);
+                env->CallVoidMethod(DerivedThreeInstance,ChangedMID, inner);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedThreeJNI_unsubBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+        _DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_DerivedThreeClient->myProxy->getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT jobject JNICALL
+    Java_com_example_gen_DerivedThreeJNI_Configure(JNIEnv *env, jobject instance, jlong proxyptr, jobject config, jbyte mode){
+        DerivedThreeClient* _DerivedThreeClient = reinterpret_cast<DerivedThreeClient*>(proxyptr);
+        _DerivedThreeClient->DerivedThreeInstance = env->NewGlobalRef(instance);
+        jobject DerivedThreeInstance = env->AllocObject(_DerivedThreeClient->DerivedThreeClazz);
+        
+        ::v1::org::example::inherit::Base::Outer _config = BaseOuterFromJava(env, config);
+        jbyte modeInt = mode;
+        uint8_t _modeInt = static_cast<uint8_t>(modeInt);
+        DerivedThree::Mode _mode = DerivedThree::Mode::Literal(_modeInt);
+        
+        ::v1::org::example::inherit::Base::Inner _result;
+        
+        CommonAPI::CallStatus callStatus;
+        _DerivedThreeClient->myProxy->configure(_config, _mode, callStatus, _result);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("configure failed!");
+        }
+        jobject result = BaseInnerToJava(env, _result);
+        
+        return result;
+    }
+
+	JNIEXPORT jlong JNICALL
+	Java_com_example_gen_DerivedThreeJNI_start(JNIEnv *env, jobject instance, jstring pinstance, jstring pconnection){
+        DerivedThreeClient* _DerivedThreeClient = new DerivedThreeClient();
+        const char* char_instance = env->GetStringUTFChars(pinstance,nullptr);
+		std::string _instance(char_instance);
+        const char* char_connection = env->GetStringUTFChars(pconnection,nullptr);
+		std::string _connection(char_connection);
+        _DerivedThreeClient->main(_instance, _connection);
+        _DerivedThreeClient->DerivedThreeClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/DerivedThreeJNI")));
+        _DerivedThreeClient->DerivedThreeInstance = nullptr;
+        BaseConversionsInit(env);
+        if(!(_DerivedThreeClient->myProxy->isAvailable())){
+            delete _DerivedThreeClient;
+            _DerivedThreeClient = nullptr;
+            return (jlong)0;
+        }
+        else{
+            return reinterpret_cast<jlong>(_DerivedThreeClient);
+        }
+    _DerivedThreeClient->CommonClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/CommonJNI")));}
+}
@@ -0,0 +1,47 @@
+package com.example.gen;
+
+public class DerivedThreeJNI extends BaseJNI{
+
+	static {
+		System.loadLibrary("DerivedThree-Client");
+	}
+
+	public long proxyptr;
+	public native long start(String instance, String connection);
+	private DerivedThreeService service;
+
+    int AttributeEnabledSubscription = -1;
+    public void subscribeAttributeEnabled(){
+        subAttributeEnabled(this.proxyptr);
+        ++AttributeEnabledSubscription;
+    }
+        
+    public boolean getAttributeEnabledValue(){
+        return getAttributeEnabledValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeEnabledValue(boolean enabled){
+        setAttributeEnabledValue(this.proxyptr, service.timeout, service.sender,enabled);   
+    }
+        
+    public native void subAttributeEnabled(long proxyptr);
+    public void subAttributeEnabledHandler(boolean enabled){
+        service.AttributeEnabledHandle(enabled);
+    }
+    public native boolean getAttributeEnabledValue(long proxyptr, int timeout, int sender);
+    public native boolean setAttributeEnabledValue(long proxyptr, int timeout, int sender, boolean enabled);
+    public native void unsubAttributeEnabled(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeEnabled(){
+        if(this.AttributeEnabledSubscription >= 0){
+            unsubAttributeEnabled(this.proxyptr, this.AttributeEnabledSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+	DerivedThreeJNI(DerivedThreeService service, String instance, String connection){
+		this.proxyptr = start(instance, connection);
+		this.service = service;
+	}
+
+}
\ No newline at end of file
@@ -0,0 +1,446 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: DerivedTwoClient.cpp
+
+#include <iostream>
+#include <jni.h>
+#include <string.h>
+#include <CommonAPI/CommonAPI.hpp>
+#include "v1/org/example/inherit/DerivedTwoProxy.hpp"
+#include "BaseConversions.hpp"
+
+//extends interface DerivedOne
+
+#define LOGI(...) ((void)__android_log_print(ANDROID_LOG_INFO, LOG_TAG, __VA_ARGS__))
+#define LOGE(...) ((void)__android_log_print(ANDROID_LOG_ERROR, LOG_TAG, __VA_ARGS__))
+#include <android/log.h>
+#define LOG_TAG "DerivedTwoClientCPP"
+using namespace v1::org::example::inherit;
+
+class DerivedTwoClient{
+	public:
+	DerivedTwoClient(){
+	};
+	std::shared_ptr<DerivedTwoProxy<>> myProxy;
+	void main(std::string pinstance, std::string pconnection);
+	jclass DerivedTwoClazz;
+	jobject DerivedTwoInstance;
+	jclass CommonClazz;
+	//jobject CommonInstance
+};
+        
+JavaVM *jvm;
+JNIEnv *jenv;
+
+JNIEXPORT jint JNICALL JNI_OnLoad(JavaVM* vm, void* reserved){
+	jvm = vm;
+	if ((vm)->GetEnv((void**)&jenv, JNI_VERSION_1_6) != JNI_OK) {
+		return JNI_ERR; //Failed to obtain JNIEnv
+	}
+	return JNI_VERSION_1_6;
+}
+
+void DerivedTwoClient::main(std::string pinstance, std::string pconnection){
+	std::shared_ptr<CommonAPI::Runtime> runtime = CommonAPI::Runtime::get();
+	
+    std::string domain = "local";
+	//std::string instance = "org.example.inherit.DerivedTwo";
+	std::string instance = pinstance;
+	std::string connection = pconnection;
+    myProxy = runtime->buildProxy<DerivedTwoProxy>(domain, instance,connection);
+    int8_t break_cnt = 0;
+    while(!myProxy->isAvailable()){
+        std::this_thread::sleep_for(std::chrono::microseconds(10));
+        if(break_cnt == 50){
+            break;
+        }
+        break_cnt++;
+    }
+}
+extern "C"{
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_subAttributeLabel(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	_DerivedTwoClient->myProxy->getLabelAttribute().getChangedEvent().subscribe(
+    		[_DerivedTwoClient](std::string _label){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedTwoInstance = _DerivedTwoClient->DerivedTwoInstance;
+    		jclass DerivedTwoClazz = env->GetObjectClass(DerivedTwoInstance);
+			jmethodID LabelMID = env->GetMethodID(DerivedTwoClazz, "subAttributeLabelHandler", "(Ljava/lang/String;)V");
+        	jstring label = env->NewStringUTF(_label.c_str());
+			env->CallVoidMethod(DerivedTwoInstance, LabelMID, label);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jstring JNICALL
+	Java_com_example_gen_DerivedTwoJNI_getAttributeLabelValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	std::string _label;
+    	_DerivedTwoClient->myProxy->getLabelAttribute().getValue(callStatus, _label, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value label failed!");
+    	}jstring label = env->NewStringUTF(_label.c_str());
+    
+	return label;
+    }
+
+    
+    JNIEXPORT jstring JNICALL
+	Java_com_example_gen_DerivedTwoJNI_setAttributeLabelValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jstring label){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+            const char* char_label = env->GetStringUTFChars(label,nullptr);
+            std::string _label(char_label);
+            std::string _labelResponse;
+        _DerivedTwoClient->myProxy->getLabelAttribute().setValue(_label, callStatus, _labelResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value label failed!");
+        }
+        jstring labelResponse = env->NewStringUTF(_labelResponse.c_str());
+        return labelResponse;
+        }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_unsubAttributeLabel(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedTwoClient->myProxy->getLabelAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_DerivedTwoJNI_subBroadcastRenamed(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+        _DerivedTwoClient->myProxy->getRenamedEvent().subscribe(
+            [_DerivedTwoClient](std::string _oldLabel, std::string _newLabel){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastRenamed!");  
+            }
+            jobject DerivedTwoInstance = _DerivedTwoClient->DerivedTwoInstance;
+            jclass DerivedTwoClazz = env->GetObjectClass(DerivedTwoInstance);
+            jmethodID RenamedMID = env->GetMethodID(DerivedTwoClazz, "subBroadcastRenamedCallback", "(Ljava/lang/String;Ljava/lang/String;)V");
+                jstring oldLabel = env->NewStringUTF(_oldLabel.c_str());
+                jstring newLabel = env->NewStringUTF(_newLabel.c_str());
+                env->CallVoidMethod(DerivedTwoInstance,RenamedMID, oldLabel, newLabel);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_unsubBroadcastRenamed(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_DerivedTwoClient->myProxy->getRenamedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_subAttributeCount(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	_DerivedTwoClient->myProxy->getCountAttribute().getChangedEvent().subscribe(
+    		[_DerivedTwoClient](uint32_t _count){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedTwoInstance = _DerivedTwoClient->DerivedTwoInstance;
+    		jclass DerivedTwoClazz = env->GetObjectClass(DerivedTwoInstance);
+			jmethodID CountMID = env->GetMethodID(DerivedTwoClazz, "subAttributeCountHandler", "(J)V");
+        	jlong count = static_cast<jlong>(_count);
+			env->CallVoidMethod(DerivedTwoInstance, CountMID, count);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jlong JNICALL
+	Java_com_example_gen_DerivedTwoJNI_getAttributeCountValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	uint32_t _count;
+    	_DerivedTwoClient->myProxy->getCountAttribute().getValue(callStatus, _count, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value count failed!");
+    	}
+        return static_cast<jlong>(_count);
+    }
+
+    
+    JNIEXPORT jlong JNICALL
+	Java_com_example_gen_DerivedTwoJNI_setAttributeCountValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jlong count){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        uint32_t _count = static_cast<uint32_t>(count);
+        uint32_t _countResponse;
+        _DerivedTwoClient->myProxy->getCountAttribute().setValue(_count, callStatus, _countResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value count failed!");
+        }
+        return static_cast<jlong>(_countResponse);
+        }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_unsubAttributeCount(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedTwoClient->myProxy->getCountAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+    Java_com_example_gen_DerivedTwoJNI_Reset(JNIEnv *env, jobject instance, jlong proxyptr, jbyte level){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+        uint8_t _level = static_cast<uint8_t>(level);
+		
+        CommonAPI::CallStatus callStatus;
+        _DerivedTwoClient->myProxy->reset(_level, callStatus);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("reset failed!");
+        }
+        
+    }
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_subAttributeMode(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	_DerivedTwoClient->myProxy->getModeAttribute().getChangedEvent().subscribe(
+    		[_DerivedTwoClient](DerivedTwo::Mode _mode){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedTwoInstance = _DerivedTwoClient->DerivedTwoInstance;
+    		jclass DerivedTwoClazz = env->GetObjectClass(DerivedTwoInstance);
+        	jmethodID ModeMID = env->GetMethodID(DerivedTwoClazz, "subAttributeModeHandler", "(B)V");
+        	uint8_t _modeInt = static_cast<uint8_t>(_mode);
+        	jbyte mode = static_cast<jbyte>(_modeInt);
+			env->CallVoidMethod(DerivedTwoInstance, ModeMID, mode);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_DerivedTwoJNI_getAttributeModeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	jobject DerivedTwoInstance = env->AllocObject(_DerivedTwoClient->DerivedTwoClazz);
+            
+        /*::v1::org::example::inherit::*/DerivedTwo::Mode _mode;
+    	_DerivedTwoClient->myProxy->getModeAttribute().getValue(callStatus, _mode, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value mode failed!");
+    	}
+        uint8_t _modeInt = static_cast<uint8_t>(_mode);
+        jbyte modeInt = static_cast<jbyte>(_modeInt);
+        env->DeleteLocalRef(DerivedTwoInstance);
+        return modeInt;
+    }
+
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_DerivedTwoJNI_setAttributeModeValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyte mode){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        jbyte modeInt = mode;
+        uint8_t _modeInt = static_cast<uint8_t>(modeInt);
+        DerivedTwo::Mode _mode = DerivedTwo::Mode::Literal(_modeInt);
+        DerivedTwo::Mode _modeResponse;
+        _DerivedTwoClient->myProxy->getModeAttribute().setValue(_mode, callStatus, _modeResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value mode failed!");
+        }
+        _modeInt = static_cast<uint8_t>(_modeResponse);
+        jbyte modeResponse = static_cast<jbyte>(_modeInt);
+        return modeResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_unsubAttributeMode(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedTwoClient->myProxy->getModeAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_subAttributeOuter(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	_DerivedTwoClient->myProxy->getOuterAttribute().getChangedEvent().subscribe(
+    		[_DerivedTwoClient](DerivedTwo::Outer _outer){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject DerivedTwoInstance = _DerivedTwoClient->DerivedTwoInstance;
+    		jclass DerivedTwoClazz = env->GetObjectClass(DerivedTwoInstance);
+        	jmethodID OuterMID = env->GetMethodID(DerivedTwoClazz, "subAttributeOuterHandler", "(Lcom/example/gen/DerivedTwoJNI$Outer;)V");
+        	jobject outer = BaseOuterToJava(env, _outer);
+			env->CallVoidMethod(DerivedTwoInstance, OuterMID, outer);
+			env->DeleteLocalRef(outer);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_DerivedTwoJNI_getAttributeOuterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::inherit::*/DerivedTwo::Outer _outer;
+    	_DerivedTwoClient->myProxy->getOuterAttribute().getValue(callStatus, _outer, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value outer failed!");
+    	}
+        jobject outer = BaseOuterToJava(env, _outer);
+        return outer;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_DerivedTwoJNI_setAttributeOuterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject outer){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::inherit::Base::Outer _outer = BaseOuterFromJava(env, outer);
+        ::v1::org::example::inherit::Base::Outer _outerResponse;
+        _DerivedTwoClient->myProxy->getOuterAttribute().setValue(_outer, callStatus, _outerResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value outer failed!");
+        }
+        jobject outerResponse = BaseOuterToJava(env, _outerResponse);
+        return outerResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_unsubAttributeOuter(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+    	//_DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_DerivedTwoClient->myProxy->getOuterAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_DerivedTwoJNI_subBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+        _DerivedTwoClient->myProxy->getChangedEvent().subscribe(
+            [_DerivedTwoClient](DerivedTwo::Inner _inner){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastChanged!");  
+            }
+            jobject DerivedTwoInstance = _DerivedTwoClient->DerivedTwoInstance;
+            jclass DerivedTwoClazz = env->GetObjectClass(DerivedTwoInstance);
+            jmethodID ChangedMID = env->GetMethodID(DerivedTwoClazz, "subBroadcastChangedCallback", "(Lcom/example/gen/DerivedTwoJNI$Inner;)V");
+                jobject inner = BaseInnerToJava(env, _inner);
+                env->CallVoidMethod(DerivedTwoInstance,ChangedMID, inner);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_DerivedTwoJNI_unsubBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_DerivedTwoClient->myProxy->getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT jobject JNICALL
+    Java_com_example_gen_DerivedTwoJNI_Configure(JNIEnv *env, jobject instance, jlong proxyptr, jobject config, jbyte mode){
+        DerivedTwoClient* _DerivedTwoClient = reinterpret_cast<DerivedTwoClient*>(proxyptr);
+        _DerivedTwoClient->DerivedTwoInstance = env->NewGlobalRef(instance);
+        jobject DerivedTwoInstance = env->AllocObject(_DerivedTwoClient->DerivedTwoClazz);
+        
+        ::v1::org::example::inherit::Base::Outer _config = BaseOuterFromJava(env, config);
+        jbyte modeInt = mode;
+        uint8_t _modeInt = static_cast<uint8_t>(modeInt);
+        DerivedTwo::Mode _mode = DerivedTwo::Mode::Literal(_modeInt);
+        
+        ::v1::org::example::inherit::Base::Inner _result;
+        
+        CommonAPI::CallStatus callStatus;
+        _DerivedTwoClient->myProxy->configure(_config, _mode, callStatus, _result);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("configure failed!");
+        }
+        jobject result = BaseInnerToJava(env, _result);
+        
+        return result;
+    }
+
+	JNIEXPORT jlong JNICALL
+	Java_com_example_gen_DerivedTwoJNI_start(JNIEnv *env, jobject instance, jstring pinstance, jstring pconnection){
+        DerivedTwoClient* _DerivedTwoClient = new DerivedTwoClient();
+        const char* char_instance = env->GetStringUTFChars(pinstance,nullptr);
+		std::string _instance(char_instance);
+        const char* char_connection = env->GetStringUTFChars(pconnection,nullptr);
+		std::string _connection(char_connection);
+        _DerivedTwoClient->main(_instance, _connection);
+        _DerivedTwoClient->DerivedTwoClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/DerivedTwoJNI")));
+        _DerivedTwoClient->DerivedTwoInstance = nullptr;
+        BaseConversionsInit(env);
+        if(!(_DerivedTwoClient->myProxy->isAvailable())){
+            delete _DerivedTwoClient;
+            _DerivedTwoClient = nullptr;
+            return (jlong)0;
+        }
+        else{
+            return reinterpret_cast<jlong>(_DerivedTwoClient);
+        }
+    _DerivedTwoClient->CommonClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/CommonJNI")));}
+}
@@ -0,0 +1,65 @@
+package com.example.gen;
+
+public class DerivedTwoJNI extends DerivedOneJNI{
+
+	static {
+		System.loadLibrary("DerivedTwo-Client");
+	}
+
+	public long proxyptr;
+	public native long start(String instance, String connection);
+	private DerivedTwoService service;
+
+    int AttributeLabelSubscription = -1;
+    public void subscribeAttributeLabel(){
+        subAttributeLabel(this.proxyptr);
+        ++AttributeLabelSubscription;
+    }
+        
+    public String getAttributeLabelValue(){
+        return getAttributeLabelValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeLabelValue(String label){
+        setAttributeLabelValue(this.proxyptr, service.timeout, service.sender,label);   
+    }
+        
+    public native void subAttributeLabel(long proxyptr);
+    public void subAttributeLabelHandler(String label){
+        service.AttributeLabelHandle(label);
+    }
+    public native String getAttributeLabelValue(long proxyptr, int timeout, int sender);
+    public native String setAttributeLabelValue(long proxyptr, int timeout, int sender, String label);
+    public native void unsubAttributeLabel(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeLabel(){
+        if(this.AttributeLabelSubscription >= 0){
+            unsubAttributeLabel(this.proxyptr, this.AttributeLabelSubscription--);
+        }
+    }
+    //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+    int RenamedSubscription = -1;
+    public native void subBroadcastRenamed(long proxyptr);
+    public native void unsubBroadcastRenamed(long proxyptr, int subscription);
+    public void subscribeRenamed(){
+        subBroadcastRenamed(this.proxyptr);
+        ++this.RenamedSubscription;
+    }
+    public void unsubscribeRenamed(){
+        if(this.RenamedSubscription >= 0){
+            unsubBroadcastRenamed(this.proxyptr, this.RenamedSubscription--);
+        }
+    }
+    
+    public void subBroadcastRenamedCallback(String oldLabel, String newLabel){
+        service.RenamedCallback(oldLabel, newLabel);
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    
+	DerivedTwoJNI(DerivedTwoService service, String instance, String connection){
+		this.proxyptr = start(instance, connection);
+		this.service = service;
+	}
+
+}
\ No newline at end of file
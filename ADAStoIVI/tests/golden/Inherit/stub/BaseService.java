@@ -0,0 +1,296 @@
+package com.example.gen;
+
+import android.app.Service;
+import android.content.Intent;
+import android.os.IBinder;
+import android.os.RemoteException;
+import android.util.Log;
+import java.util.ArrayList;
+    
+public class BaseService extends Service{
+    public BaseService(){}
+    private BaseJNI myProxy;
+    public static int timeout = 1000; // Needs to be changed
+    public static int sender = 5555; // Needs to be changed
+    public static String connection = ""; // Needs to be changed
+    public static String instance = ""; // Needs to be changed
+    private static final String TAG = "BaseService";
+    
+    public boolean proxyGeneration(){
+        if(myProxy == null){
+            myProxy = new BaseJNI(this, instance, connection);
+        }
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+            return false;
+        }
+        else{
+            Log.d(TAG, "Proxy Connection Succeeded!");
+            return true;
+        }
+    }
+    
+    @Override
+    public void onCreate(){
+        super.onCreate();
+        myProxy = new BaseJNI(this, instance, connection);
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+        }
+        Log.d(TAG, "onCreate");
+    }
+    @Override
+    public IBinder onBind(Intent intent){
+        Log.d(TAG, "onBind");
+        return binder;
+    }
+    private final Base.Stub binder = new Base.Stub(){
+        @Override
+        public void subscribeAttributeMode(BaseModeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!BaseService.ModeHandler.contains(handler)){
+                BaseService.ModeHandler.add(handler);
+                if(BaseService.ModeHandler.size() == 1){
+                    myProxy.subscribeAttributeMode();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeModeValue(byte mode) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeModeValue(mode);
+        }
+        @Override
+        public byte getAttributeModeValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeModeValue();
+        }
+        @Override
+        public void unsubscribeAttributeMode(BaseModeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(BaseService.ModeHandler.contains(handler)){
+                BaseService.ModeHandler.remove(handler);
+                if(BaseService.ModeHandler.size() == 0){
+                    myProxy.unsubscribeAttributeMode(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeOuter(BaseOuterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!BaseService.OuterHandler.contains(handler)){
+                BaseService.OuterHandler.add(handler);
+                if(BaseService.OuterHandler.size() == 1){
+                    myProxy.subscribeAttributeOuter();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeOuterValue(Outer outer) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            BaseJNI.Outer _outer = new BaseJNI.Outer();
+            _outer.inner = new BaseJNI.Inner();
+            _outer.inner.level = outer.inner.level;
+            _outer.inner.point = new CommonJNI.Point();
+            _outer.inner.point.x = outer.inner.point.x;
+            _outer.inner.point.y = outer.inner.point.y;
+            _outer.inners = new BaseJNI.Inner[outer.inners.length];
+            for(int k = 0; k < outer.inners.length; k++){	
+	            _outer.inners[k].level = outer.inners[k].level;
+	            _outer.inners[k].point = new CommonJNI.Point();
+	            _outer.inners[k].point.x = outer.inners[k].point.x;
+	            _outer.inners[k].point.y = outer.inners[k].point.y;
+            }
+            _outer.mode = outer.mode;
+            myProxy.setAttributeOuterValue(_outer);
+        }
+        @Override
+        public Outer getAttributeOuterValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            BaseJNI.Outer _outer = myProxy.getAttributeOuterValue();
+            Outer outer = new Outer();
+            outer.inner = new /*Base.*/Inner();
+            outer.inner.level = _outer.inner.level;
+            outer.inner.point = new /*Common.*/Point();
+            outer.inner.point.x = _outer.inner.point.x;
+            outer.inner.point.y = _outer.inner.point.y;
+            outer.inners = new Inner[_outer.inners.length];
+            for(int j = 0; j < _outer.inners.length; j++){
+                outer.inners[j] = new Inner();	
+	            outer.inners[j].level = _outer.inners[j].level;
+	            outer.inners[j].point = new /*Common.*/Point();
+	            outer.inners[j].point.x = _outer.inners[j].point.x;
+	            outer.inners[j].point.y = _outer.inners[j].point.y;
+            }
+            outer.mode = _outer.mode;
+            return outer;
+        }
+        @Override
+        public void unsubscribeAttributeOuter(BaseOuterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(BaseService.OuterHandler.contains(handler)){
+                BaseService.OuterHandler.remove(handler);
+                if(BaseService.OuterHandler.size() == 0){
+                    myProxy.unsubscribeAttributeOuter(); 
+                }
+            }
+        }
+        
+        @Override
+        public Inner configure(Outer config, byte mode) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            Inner result = new Inner();
+            BaseJNI.Outer _config = new BaseJNI.Outer();
+            _config.inner = new BaseJNI.Inner();
+            _config.inner.level = config.inner.level;
+            _config.inner.point = new CommonJNI.Point();
+            _config.inner.point.x = config.inner.point.x;
+            _config.inner.point.y = config.inner.point.y;
+            _config.inners = new BaseJNI.Inner[config.inners.length];
+            for(int k = 0; k < config.inners.length; k++){	
+	            _config.inners[k].level = config.inners[k].level;
+	            _config.inners[k].point = new CommonJNI.Point();
+	            _config.inners[k].point.x = config.inners[k].point.x;
+	            _config.inners[k].point.y = config.inners[k].point.y;
+            }
+            _config.mode = config.mode;byte _mode = mode;
+            BaseJNI.Inner _result = myProxy.configure(_config, _mode);
+            
+            result.level = _result.level;
+            result.point = new /*Common.*/Point();
+            result.point.x = _result.point.x;
+            result.point.y = _result.point.y;
+            return result;
+        }
+        
+        @Override
+        public void subscribeChanged(BaseChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!BaseService.ChangedCallback.contains(callback)){
+                BaseService.ChangedCallback.add(callback);
+                if(BaseService.ChangedCallback.size() == 1){
+                    myProxy.subscribeChanged();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeChanged(BaseChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(BaseService.ChangedCallback.contains(callback)){
+                BaseService.ChangedCallback.remove(callback);
+                if(BaseService.ChangedCallback.size() == 1){
+                    myProxy.unsubscribeChanged();
+                }
+            }
+        }
+        
+    };
+    private static ArrayList<BaseModeHandler> ModeHandler = new ArrayList<>();
+    void AttributeModeHandle(byte _mode){
+        if(this.ModeHandler != null){
+            byte mode = _mode;
+            for(BaseModeHandler handler : this.ModeHandler){
+                try {
+                    handler.runModeHandler(mode);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<BaseOuterHandler> OuterHandler = new ArrayList<>();
+    void AttributeOuterHandle(BaseJNI.Outer _outer){
+        if(this.OuterHandler != null){
+            /*Base.*/Outer outer = new /*Base.*/Outer();
+            outer.inner = new /*Base.*/Inner();
+            outer.inner.level = _outer.inner.level;
+            outer.inner.point = new /*Common.*/Point();
+            outer.inner.point.x = _outer.inner.point.x;
+            outer.inner.point.y = _outer.inner.point.y;
+            outer.inners = new Inner[_outer.inners.length];
+            for(int j = 0; j < _outer.inners.length; j++){
+                outer.inners[j] = new Inner();	
+	            outer.inners[j].level = _outer.inners[j].level;
+	            outer.inners[j].point = new /*Common.*/Point();
+	            outer.inners[j].point.x = _outer.inners[j].point.x;
+	            outer.inners[j].point.y = _outer.inners[j].point.y;
+            }
+            outer.mode = _outer.mode;
+            for(BaseOuterHandler handler : this.OuterHandler){
+                try {
+                    handler.runOuterHandler(outer);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<BaseChangedCallback> ChangedCallback = new ArrayList<>();
+    void ChangedCallback(BaseJNI.Inner _inner){
+        if(this.ChangedCallback != null){
+            Inner inner = new Inner();
+            inner.level = _inner.level;
+            inner.point = new /*Common.*/Point();
+            inner.point.x = _inner.point.x;
+            inner.point.y = _inner.point.y;
+			for(BaseChangedCallback callback : this.ChangedCallback){
+                try {
+                    callback.onChangedReceived(inner);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+}
\ No newline at end of file
@@ -0,0 +1,371 @@
+package com.example.gen;
+
+import android.app.Service;
+import android.content.Intent;
+import android.os.IBinder;
+import android.os.RemoteException;
+import android.util.Log;
+import java.util.ArrayList;
+    
+public class DerivedOneService extends Service{
+    public DerivedOneService(){}
+    private DerivedOneJNI myProxy;
+    public static int timeout = 1000; // Needs to be changed
+    public static int sender = 5555; // Needs to be changed
+    public static String connection = ""; // Needs to be changed
+    public static String instance = ""; // Needs to be changed
+    private static final String TAG = "DerivedOneService";
+    
+    public boolean proxyGeneration(){
+        if(myProxy == null){
+            myProxy = new DerivedOneJNI(this, instance, connection);
+        }
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+            return false;
+        }
+        else{
+            Log.d(TAG, "Proxy Connection Succeeded!");
+            return true;
+        }
+    }
+    
+    @Override
+    public void onCreate(){
+        super.onCreate();
+        myProxy = new DerivedOneJNI(this, instance, connection);
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+        }
+        Log.d(TAG, "onCreate");
+    }
+    @Override
+    public IBinder onBind(Intent intent){
+        Log.d(TAG, "onBind");
+        return binder;
+    }
+    private final DerivedOne.Stub binder = new DerivedOne.Stub(){
+        @Override
+        public void subscribeAttributeCount(DerivedOneCountHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedOneService.CountHandler.contains(handler)){
+                DerivedOneService.CountHandler.add(handler);
+                if(DerivedOneService.CountHandler.size() == 1){
+                    myProxy.subscribeAttributeCount();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeCountValue(long count) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeCountValue(count);
+        }
+        @Override
+        public long getAttributeCountValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeCountValue();
+        }
+        @Override
+        public void unsubscribeAttributeCount(DerivedOneCountHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedOneService.CountHandler.contains(handler)){
+                DerivedOneService.CountHandler.remove(handler);
+                if(DerivedOneService.CountHandler.size() == 0){
+                    myProxy.unsubscribeAttributeCount(); 
+                }
+            }
+        }
+        
+        @Override
+        public void reset(byte level) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            //No Return value
+            
+            myProxy.reset(level);
+            
+            
+        }
+        
+        @Override
+        public void subscribeAttributeMode(DerivedOneModeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedOneService.ModeHandler.contains(handler)){
+                DerivedOneService.ModeHandler.add(handler);
+                if(DerivedOneService.ModeHandler.size() == 1){
+                    myProxy.subscribeAttributeMode();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeModeValue(byte mode) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeModeValue(mode);
+        }
+        @Override
+        public byte getAttributeModeValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeModeValue();
+        }
+        @Override
+        public void unsubscribeAttributeMode(DerivedOneModeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedOneService.ModeHandler.contains(handler)){
+                DerivedOneService.ModeHandler.remove(handler);
+                if(DerivedOneService.ModeHandler.size() == 0){
+                    myProxy.unsubscribeAttributeMode(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeOuter(DerivedOneOuterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedOneService.OuterHandler.contains(handler)){
+                DerivedOneService.OuterHandler.add(handler);
+                if(DerivedOneService.OuterHandler.size() == 1){
+                    myProxy.subscribeAttributeOuter();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeOuterValue(Outer outer) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            DerivedOneJNI.Outer _outer = new DerivedOneJNI.Outer();
+            _outer.inner = new DerivedOneJNI.Inner();
+            _outer.inner.level = outer.inner.level;
+            _outer.inner.point = new CommonJNI.Point();
+            _outer.inner.point.x = outer.inner.point.x;
+            _outer.inner.point.y = outer.inner.point.y;
+            _outer.inners = new DerivedOneJNI.Inner[outer.inners.length];
+            for(int k = 0; k < outer.inners.length; k++){	
+	            _outer.inners[k].level = outer.inners[k].level;
+	            _outer.inners[k].point = new CommonJNI.Point();
+	            _outer.inners[k].point.x = outer.inners[k].point.x;
+	            _outer.inners[k].point.y = outer.inners[k].point.y;
+            }
+            _outer.mode = outer.mode;
+            myProxy.setAttributeOuterValue(_outer);
+        }
+        @Override
+        public Outer getAttributeOuterValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            DerivedOneJNI.Outer _outer = myProxy.getAttributeOuterValue();
+            Outer outer = new Outer();
+            outer.inner = new /*DerivedOne.*/Inner();
+            outer.inner.level = _outer.inner.level;
+            outer.inner.point = new /*Common.*/Point();
+            outer.inner.point.x = _outer.inner.point.x;
+            outer.inner.point.y = _outer.inner.point.y;
+            outer.inners = new Inner[_outer.inners.length];
+            for(int j = 0; j < _outer.inners.length; j++){
+                outer.inners[j] = new Inner();	
+	            outer.inners[j].level = _outer.inners[j].level;
+	            outer.inners[j].point = new /*Common.*/Point();
+	            outer.inners[j].point.x = _outer.inners[j].point.x;
+	            outer.inners[j].point.y = _outer.inners[j].point.y;
+            }
+            outer.mode = _outer.mode;
+            return outer;
+        }
+        @Override
+        public void unsubscribeAttributeOuter(DerivedOneOuterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedOneService.OuterHandler.contains(handler)){
+                DerivedOneService.OuterHandler.remove(handler);
+                if(DerivedOneService.OuterHandler.size() == 0){
+                    myProxy.unsubscribeAttributeOuter(); 
+                }
+            }
+        }
+        
+        @Override
+        public Inner configure(Outer config, byte mode) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            Inner result = new Inner();
+            DerivedOneJNI.Outer _config = new DerivedOneJNI.Outer();
+            _config.inner = new DerivedOneJNI.Inner();
+            _config.inner.level = config.inner.level;
+            _config.inner.point = new CommonJNI.Point();
+            _config.inner.point.x = config.inner.point.x;
+            _config.inner.point.y = config.inner.point.y;
+            _config.inners = new DerivedOneJNI.Inner[config.inners.length];
+            for(int k = 0; k < config.inners.length; k++){	
+	            _config.inners[k].level = config.inners[k].level;
+	            _config.inners[k].point = new CommonJNI.Point();
+	            _config.inners[k].point.x = config.inners[k].point.x;
+	            _config.inners[k].point.y = config.inners[k].point.y;
+            }
+            _config.mode = config.mode;byte _mode = mode;
+            DerivedOneJNI.Inner _result = myProxy.configure(_config, _mode);
+            
+            result.level = _result.level;
+            result.point = new /*Common.*/Point();
+            result.point.x = _result.point.x;
+            result.point.y = _result.point.y;
+            return result;
+        }
+        
+        @Override
+        public void subscribeChanged(DerivedOneChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedOneService.ChangedCallback.contains(callback)){
+                DerivedOneService.ChangedCallback.add(callback);
+                if(DerivedOneService.ChangedCallback.size() == 1){
+                    myProxy.subscribeChanged();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeChanged(DerivedOneChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedOneService.ChangedCallback.contains(callback)){
+                DerivedOneService.ChangedCallback.remove(callback);
+                if(DerivedOneService.ChangedCallback.size() == 1){
+                    myProxy.unsubscribeChanged();
+                }
+            }
+        }
+        
+    };
+    private static ArrayList<DerivedOneCountHandler> CountHandler = new ArrayList<>();
+    void AttributeCountHandle(long _count){
+        if(this.CountHandler != null){
+            long count = _count;
+            for(DerivedOneCountHandler handler : this.CountHandler){
+                try {
+                    handler.runCountHandler(count);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedOneModeHandler> ModeHandler = new ArrayList<>();
+    void AttributeModeHandle(byte _mode){
+        if(this.ModeHandler != null){
+            byte mode = _mode;
+            for(DerivedOneModeHandler handler : this.ModeHandler){
+                try {
+                    handler.runModeHandler(mode);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedOneOuterHandler> OuterHandler = new ArrayList<>();
+    void AttributeOuterHandle(DerivedOneJNI.Outer _outer){
+        if(this.OuterHandler != null){
+            /*DerivedOne.*/Outer outer = new /*DerivedOne.*/Outer();
+            outer.inner = new /*DerivedOne.*/Inner();
+            outer.inner.level = _outer.inner.level;
+            outer.inner.point = new /*Common.*/Point();
+            outer.inner.point.x = _outer.inner.point.x;
+            outer.inner.point.y = _outer.inner.point.y;
+            outer.inners = new Inner[_outer.inners.length];
+            for(int j = 0; j < _outer.inners.length; j++){
+                outer.inners[j] = new Inner();	
+	            outer.inners[j].level = _outer.inners[j].level;
+	            outer.inners[j].point = new /*Common.*/Point();
+	            outer.inners[j].point.x = _outer.inners[j].point.x;
+	            outer.inners[j].point.y = _outer.inners[j].point.y;
+            }
+            outer.mode = _outer.mode;
+            for(DerivedOneOuterHandler handler : this.OuterHandler){
+                try {
+                    handler.runOuterHandler(outer);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedOneChangedCallback> ChangedCallback = new ArrayList<>();
+    void ChangedCallback(DerivedOneJNI.Inner _inner){
+        if(this.ChangedCallback != null){
+            Inner inner = new Inner();
+            inner.level = _inner.level;
+            inner.point = new /*Common.*/Point();
+            inner.point.x = _inner.point.x;
+            inner.point.y = _inner.point.y;
+			for(DerivedOneChangedCallback callback : this.ChangedCallback){
+                try {
+                    callback.onChangedReceived(inner);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+}
\ No newline at end of file
@@ -0,0 +1,357 @@
+package com.example.gen;
+
+import android.app.Service;
+import android.content.Intent;
+import android.os.IBinder;
+import android.os.RemoteException;
+import android.util.Log;
+import java.util.ArrayList;
+    
+public class DerivedThreeService extends Service{
+    public DerivedThreeService(){}
+    private DerivedThreeJNI myProxy;
+    public static int timeout = 1000; // Needs to be changed
+    public static int sender = 5555; // Needs to be changed
+    public static String connection = ""; // Needs to be changed
+    public static String instance = ""; // Needs to be changed
+    private static final String TAG = "DerivedThreeService";
+    
+    public boolean proxyGeneration(){
+        if(myProxy == null){
+            myProxy = new DerivedThreeJNI(this, instance, connection);
+        }
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+            return false;
+        }
+        else{
+            Log.d(TAG, "Proxy Connection Succeeded!");
+            return true;
+        }
+    }
+    
+    @Override
+    public void onCreate(){
+        super.onCreate();
+        myProxy = new DerivedThreeJNI(this, instance, connection);
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+        }
+        Log.d(TAG, "onCreate");
+    }
+    @Override
+    public IBinder onBind(Intent intent){
+        Log.d(TAG, "onBind");
+        return binder;
+    }
+    private final DerivedThree.Stub binder = new DerivedThree.Stub(){
+        @Override
+        public void subscribeAttributeEnabled(DerivedThreeEnabledHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedThreeService.EnabledHandler.contains(handler)){
+                DerivedThreeService.EnabledHandler.add(handler);
+                if(DerivedThreeService.EnabledHandler.size() == 1){
+                    myProxy.subscribeAttributeEnabled();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeEnabledValue(boolean enabled) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeEnabledValue(enabled);
+        }
+        @Override
+        public boolean getAttributeEnabledValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return false;
+                }
+            }
+            return myProxy.getAttributeEnabledValue();
+        }
+        @Override
+        public void unsubscribeAttributeEnabled(DerivedThreeEnabledHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedThreeService.EnabledHandler.contains(handler)){
+                DerivedThreeService.EnabledHandler.remove(handler);
+                if(DerivedThreeService.EnabledHandler.size() == 0){
+                    myProxy.unsubscribeAttributeEnabled(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeMode(DerivedThreeModeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedThreeService.ModeHandler.contains(handler)){
+                DerivedThreeService.ModeHandler.add(handler);
+                if(DerivedThreeService.ModeHandler.size() == 1){
+                    myProxy.subscribeAttributeMode();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeModeValue(byte mode) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeModeValue(mode);
+        }
+        @Override
+        public byte getAttributeModeValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeModeValue();
+        }
+        @Override
+        public void unsubscribeAttributeMode(DerivedThreeModeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedThreeService.ModeHandler.contains(handler)){
+                DerivedThreeService.ModeHandler.remove(handler);
+                if(DerivedThreeService.ModeHandler.size() == 0){
+                    myProxy.unsubscribeAttributeMode(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeOuter(DerivedThreeOuterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedThreeService.OuterHandler.contains(handler)){
+                DerivedThreeService.OuterHandler.add(handler);
+                if(DerivedThreeService.OuterHandler.size() == 1){
+                    myProxy.subscribeAttributeOuter();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeOuterValue(Outer outer) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            DerivedThreeJNI.Outer _outer = new DerivedThreeJNI.Outer();
+            _outer.inner = new DerivedThreeJNI.Inner();
+            _outer.inner.level = outer.inner.level;
+            _outer.inner.point = new CommonJNI.Point();
+            _outer.inner.point.x = outer.inner.point.x;
+            _outer.inner.point.y = outer.inner.point.y;
+            _outer.inners = new DerivedThreeJNI.Inner[outer.inners.length];
+            for(int k = 0; k < outer.inners.length; k++){	
+	            _outer.inners[k].level = outer.inners[k].level;
+	            _outer.inners[k].point = new CommonJNI.Point();
+	            _outer.inners[k].point.x = outer.inners[k].point.x;
+	            _outer.inners[k].point.y = outer.inners[k].point.y;
+            }
+            _outer.mode = outer.mode;
+            myProxy.setAttributeOuterValue(_outer);
+        }
+        @Override
+        public Outer getAttributeOuterValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            DerivedThreeJNI.Outer _outer = myProxy.getAttributeOuterValue();
+            Outer outer = new Outer();
+            outer.inner = new /*DerivedThree.*/Inner();
+            outer.inner.level = _outer.inner.level;
+            outer.inner.point = new /*Common.*/Point();
+            outer.inner.point.x = _outer.inner.point.x;
+            outer.inner.point.y = _outer.inner.point.y;
+            outer.inners = new Inner[_outer.inners.length];
+            for(int j = 0; j < _outer.inners.length; j++){
+                outer.inners[j] = new Inner();	
+	            outer.inners[j].level = _outer.inners[j].level;
+	            outer.inners[j].point = new /*Common.*/Point();
+	            outer.inners[j].point.x = _outer.inners[j].point.x;
+	            outer.inners[j].point.y = _outer.inners[j].point.y;
+            }
+            outer.mode = _outer.mode;
+            return outer;
+        }
+        @Override
+        public void unsubscribeAttributeOuter(DerivedThreeOuterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedThreeService.OuterHandler.contains(handler)){
+                DerivedThreeService.OuterHandler.remove(handler);
+                if(DerivedThreeService.OuterHandler.size() == 0){
+                    myProxy.unsubscribeAttributeOuter(); 
+                }
+            }
+        }
+        
+        @Override
+        public Inner configure(Outer config, byte mode) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            Inner result = new Inner();
+            DerivedThreeJNI.Outer _config = new DerivedThreeJNI.Outer();
+            _config.inner = new DerivedThreeJNI.Inner();
+            _config.inner.level = config.inner.level;
+            _config.inner.point = new CommonJNI.Point();
+            _config.inner.point.x = config.inner.point.x;
+            _config.inner.point.y = config.inner.point.y;
+            _config.inners = new DerivedThreeJNI.Inner[config.inners.length];
+            for(int k = 0; k < config.inners.length; k++){	
+	            _config.inners[k].level = config.inners[k].level;
+	            _config.inners[k].point = new CommonJNI.Point();
+	            _config.inners[k].point.x = config.inners[k].point.x;
+	            _config.inners[k].point.y = config.inners[k].point.y;
+            }
+            _config.mode = config.mode;byte _mode = mode;
+            DerivedThreeJNI.Inner _result = myProxy.configure(_config, _mode);
+            
+            result.level = _result.level;
+            result.point = new /*Common.*/Point();
+            result.point.x = _result.point.x;
+            result.point.y = _result.point.y;
+            return result;
+        }
+        
+        @Override
+        public void subscribeChanged(DerivedThreeChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedThreeService.ChangedCallback.contains(callback)){
+                DerivedThreeService.ChangedCallback.add(callback);
+                if(DerivedThreeService.ChangedCallback.size() == 1){
+                    myProxy.subscribeChanged();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeChanged(DerivedThreeChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedThreeService.ChangedCallback.contains(callback)){
+                DerivedThreeService.ChangedCallback.remove(callback);
+                if(DerivedThreeService.ChangedCallback.size() == 1){
+                    myProxy.unsubscribeChanged();
+                }
+            }
+        }
+        
+    };
+    private static ArrayList<DerivedThreeEnabledHandler> EnabledHandler = new ArrayList<>();
+    void AttributeEnabledHandle(boolean _enabled){
+        if(this.EnabledHandler != null){
+            boolean enabled = _enabled;
+            for(DerivedThreeEnabledHandler handler : this.EnabledHandler){
+                try {
+                    handler.runEnabledHandler(enabled);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedThreeModeHandler> ModeHandler = new ArrayList<>();
+    void AttributeModeHandle(byte _mode){
+        if(this.ModeHandler != null){
+            byte mode = _mode;
+            for(DerivedThreeModeHandler handler : this.ModeHandler){
+                try {
+                    handler.runModeHandler(mode);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedThreeOuterHandler> OuterHandler = new ArrayList<>();
+    void AttributeOuterHandle(DerivedThreeJNI.Outer _outer){
+        if(this.OuterHandler != null){
+            /*DerivedThree.*/Outer outer = new /*DerivedThree.*/Outer();
+            outer.inner = new /*DerivedThree.*/Inner();
+            outer.inner.level = _outer.inner.level;
+            outer.inner.point = new /*Common.*/Point();
+            outer.inner.point.x = _outer.inner.point.x;
+            outer.inner.point.y = _outer.inner.point.y;
+            outer.inners = new Inner[_outer.inners.length];
+            for(int j = 0; j < _outer.inners.length; j++){
+                outer.inners[j] = new Inner();	
+	            outer.inners[j].level = _outer.inners[j].level;
+	            outer.inners[j].point = new /*Common.*/Point();
+	            outer.inners[j].point.x = _outer.inners[j].point.x;
+	            outer.inners[j].point.y = _outer.inners[j].point.y;
+            }
+            outer.mode = _outer.mode;
+            for(DerivedThreeOuterHandler handler : this.OuterHandler){
+                try {
+                    handler.runOuterHandler(outer);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedThreeChangedCallback> ChangedCallback = new ArrayList<>();
+    void ChangedCallback(DerivedThreeJNI.Inner _inner){
+        if(this.ChangedCallback != null){
+            Inner inner = new Inner();
+            inner.level = _inner.level;
+            inner.point = new /*Common.*/Point();
+            inner.point.x = _inner.point.x;
+            inner.point.y = _inner.point.y;
+			for(DerivedThreeChangedCallback callback : this.ChangedCallback){
+                try {
+                    callback.onChangedReceived(inner);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+}
\ No newline at end of file
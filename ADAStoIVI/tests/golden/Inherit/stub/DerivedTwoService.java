@@ -0,0 +1,477 @@
+package com.example.gen;
+
+import android.app.Service;
+import android.content.Intent;
+import android.os.IBinder;
+import android.os.RemoteException;
+import android.util.Log;
+import java.util.ArrayList;
+    
+public class DerivedTwoService extends Service{
+    public DerivedTwoService(){}
+    private DerivedTwoJNI myProxy;
+    public static int timeout = 1000; // Needs to be changed
+    public static int sender = 5555; // Needs to be changed
+    public static String connection = ""; // Needs to be changed
+    public static String instance = ""; // Needs to be changed
+    private static final String TAG = "DerivedTwoService";
+    
+    public boolean proxyGeneration(){
+        if(myProxy == null){
+            myProxy = new DerivedTwoJNI(this, instance, connection);
+        }
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+            return false;
+        }
+        else{
+            Log.d(TAG, "Proxy Connection Succeeded!");
+            return true;
+        }
+    }
+    
+    @Override
+    public void onCreate(){
+        super.onCreate();
+        myProxy = new DerivedTwoJNI(this, instance, connection);
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+        }
+        Log.d(TAG, "onCreate");
+    }
+    @Override
+    public IBinder onBind(Intent intent){
+        Log.d(TAG, "onBind");
+        return binder;
+    }
+    private final DerivedTwo.Stub binder = new DerivedTwo.Stub(){
+        @Override
+        public void subscribeAttributeLabel(DerivedTwoLabelHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedTwoService.LabelHandler.contains(handler)){
+                DerivedTwoService.LabelHandler.add(handler);
+                if(DerivedTwoService.LabelHandler.size() == 1){
+                    myProxy.subscribeAttributeLabel();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeLabelValue(String label) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeLabelValue(label);
+        }
+        @Override
+        public String getAttributeLabelValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeLabelValue();
+        }
+        @Override
+        public void unsubscribeAttributeLabel(DerivedTwoLabelHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedTwoService.LabelHandler.contains(handler)){
+                DerivedTwoService.LabelHandler.remove(handler);
+                if(DerivedTwoService.LabelHandler.size() == 0){
+                    myProxy.unsubscribeAttributeLabel(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeRenamed(DerivedTwoRenamedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedTwoService.RenamedCallback.contains(callback)){
+                DerivedTwoService.RenamedCallback.add(callback);
+                if(DerivedTwoService.RenamedCallback.size() == 1){
+                    myProxy.subscribeRenamed();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeRenamed(DerivedTwoRenamedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedTwoService.RenamedCallback.contains(callback)){
+                DerivedTwoService.RenamedCallback.remove(callback);
+                if(DerivedTwoService.RenamedCallback.size() == 1){
+                    myProxy.unsubscribeRenamed();
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeCount(DerivedTwoCountHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedTwoService.CountHandler.contains(handler)){
+                DerivedTwoService.CountHandler.add(handler);
+                if(DerivedTwoService.CountHandler.size() == 1){
+                    myProxy.subscribeAttributeCount();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeCountValue(long count) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeCountValue(count);
+        }
+        @Override
+        public long getAttributeCountValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeCountValue();
+        }
+        @Override
+        public void unsubscribeAttributeCount(DerivedTwoCountHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedTwoService.CountHandler.contains(handler)){
+                DerivedTwoService.CountHandler.remove(handler);
+                if(DerivedTwoService.CountHandler.size() == 0){
+                    myProxy.unsubscribeAttributeCount(); 
+                }
+            }
+        }
+        
+        @Override
+        public void reset(byte level) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            //No Return value
+            
+            myProxy.reset(level);
+            
+            
+        }
+        
+        @Override
+        public void subscribeAttributeMode(DerivedTwoModeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedTwoService.ModeHandler.contains(handler)){
+                DerivedTwoService.ModeHandler.add(handler);
+                if(DerivedTwoService.ModeHandler.size() == 1){
+                    myProxy.subscribeAttributeMode();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeModeValue(byte mode) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeModeValue(mode);
+        }
+        @Override
+        public byte getAttributeModeValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeModeValue();
+        }
+        @Override
+        public void unsubscribeAttributeMode(DerivedTwoModeHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedTwoService.ModeHandler.contains(handler)){
+                DerivedTwoService.ModeHandler.remove(handler);
+                if(DerivedTwoService.ModeHandler.size() == 0){
+                    myProxy.unsubscribeAttributeMode(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeOuter(DerivedTwoOuterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedTwoService.OuterHandler.contains(handler)){
+                DerivedTwoService.OuterHandler.add(handler);
+                if(DerivedTwoService.OuterHandler.size() == 1){
+                    myProxy.subscribeAttributeOuter();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeOuterValue(Outer outer) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            DerivedTwoJNI.Outer _outer = new DerivedTwoJNI.Outer();
+            _outer.inner = new DerivedTwoJNI.Inner();
+            _outer.inner.level = outer.inner.level;
+            _outer.inner.point = new CommonJNI.Point();
+            _outer.inner.point.x = outer.inner.point.x;
+            _outer.inner.point.y = outer.inner.point.y;
+            _outer.inners = new DerivedTwoJNI.Inner[outer.inners.length];
+            for(int k = 0; k < outer.inners.length; k++){	
+	            _outer.inners[k].level = outer.inners[k].level;
+	            _outer.inners[k].point = new CommonJNI.Point();
+	            _outer.inners[k].point.x = outer.inners[k].point.x;
+	            _outer.inners[k].point.y = outer.inners[k].point.y;
+            }
+            _outer.mode = outer.mode;
+            myProxy.setAttributeOuterValue(_outer);
+        }
+        @Override
+        public Outer getAttributeOuterValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            DerivedTwoJNI.Outer _outer = myProxy.getAttributeOuterValue();
+            Outer outer = new Outer();
+            outer.inner = new /*DerivedTwo.*/Inner();
+            outer.inner.level = _outer.inner.level;
+            outer.inner.point = new /*Common.*/Point();
+            outer.inner.point.x = _outer.inner.point.x;
+            outer.inner.point.y = _outer.inner.point.y;
+            outer.inners = new Inner[_outer.inners.length];
+            for(int j = 0; j < _outer.inners.length; j++){
+                outer.inners[j] = new Inner();	
+	            outer.inners[j].level = _outer.inners[j].level;
+	            outer.inners[j].point = new /*Common.*/Point();
+	            outer.inners[j].point.x = _outer.inners[j].point.x;
+	            outer.inners[j].point.y = _outer.inners[j].point.y;
+            }
+            outer.mode = _outer.mode;
+            return outer;
+        }
+        @Override
+        public void unsubscribeAttributeOuter(DerivedTwoOuterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedTwoService.OuterHandler.contains(handler)){
+                DerivedTwoService.OuterHandler.remove(handler);
+                if(DerivedTwoService.OuterHandler.size() == 0){
+                    myProxy.unsubscribeAttributeOuter(); 
+                }
+            }
+        }
+        
+        @Override
+        public Inner configure(Outer config, byte mode) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            Inner result = new Inner();
+            DerivedTwoJNI.Outer _config = new DerivedTwoJNI.Outer();
+            _config.inner = new DerivedTwoJNI.Inner();
+            _config.inner.level = config.inner.level;
+            _config.inner.point = new CommonJNI.Point();
+            _config.inner.point.x = config.inner.point.x;
+            _config.inner.point.y = config.inner.point.y;
+            _config.inners = new DerivedTwoJNI.Inner[config.inners.length];
+            for(int k = 0; k < config.inners.length; k++){	
+	            _config.inners[k].level = config.inners[k].level;
+	            _config.inners[k].point = new CommonJNI.Point();
+	            _config.inners[k].point.x = config.inners[k].point.x;
+	            _config.inners[k].point.y = config.inners[k].point.y;
+            }
+            _config.mode = config.mode;byte _mode = mode;
+            DerivedTwoJNI.Inner _result = myProxy.configure(_config, _mode);
+            
+            result.level = _result.level;
+            result.point = new /*Common.*/Point();
+            result.point.x = _result.point.x;
+            result.point.y = _result.point.y;
+            return result;
+        }
+        
+        @Override
+        public void subscribeChanged(DerivedTwoChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!DerivedTwoService.ChangedCallback.contains(callback)){
+                DerivedTwoService.ChangedCallback.add(callback);
+                if(DerivedTwoService.ChangedCallback.size() == 1){
+                    myProxy.subscribeChanged();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeChanged(DerivedTwoChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(DerivedTwoService.ChangedCallback.contains(callback)){
+                DerivedTwoService.ChangedCallback.remove(callback);
+                if(DerivedTwoService.ChangedCallback.size() == 1){
+                    myProxy.unsubscribeChanged();
+                }
+            }
+        }
+        
+    };
+    private static ArrayList<DerivedTwoLabelHandler> LabelHandler = new ArrayList<>();
+    void AttributeLabelHandle(String _label){
+        if(this.LabelHandler != null){
+            String label = _label;
+            for(DerivedTwoLabelHandler handler : this.LabelHandler){
+                try {
+                    handler.runLabelHandler(label);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedTwoRenamedCallback> RenamedCallback = new ArrayList<>();
+    void RenamedCallback(String _oldLabel, String _newLabel){
+        if(this.RenamedCallback != null){
+            String oldLabel = _oldLabel;
+            String newLabel = _newLabel;
+            for(DerivedTwoRenamedCallback callback : this.RenamedCallback){
+                try {
+                    callback.onRenamedReceived(oldLabel, newLabel);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedTwoCountHandler> CountHandler = new ArrayList<>();
+    void AttributeCountHandle(long _count){
+        if(this.CountHandler != null){
+            long count = _count;
+            for(DerivedTwoCountHandler handler : this.CountHandler){
+                try {
+                    handler.runCountHandler(count);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedTwoModeHandler> ModeHandler = new ArrayList<>();
+    void AttributeModeHandle(byte _mode){
+        if(this.ModeHandler != null){
+            byte mode = _mode;
+            for(DerivedTwoModeHandler handler : this.ModeHandler){
+                try {
+                    handler.runModeHandler(mode);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedTwoOuterHandler> OuterHandler = new ArrayList<>();
+    void AttributeOuterHandle(DerivedTwoJNI.Outer _outer){
+        if(this.OuterHandler != null){
+            /*DerivedTwo.*/Outer outer = new /*DerivedTwo.*/Outer();
+            outer.inner = new /*DerivedTwo.*/Inner();
+            outer.inner.level = _outer.inner.level;
+            outer.inner.point = new /*Common.*/Point();
+            outer.inner.point.x = _outer.inner.point.x;
+            outer.inner.point.y = _outer.inner.point.y;
+            outer.inners = new Inner[_outer.inners.length];
+            for(int j = 0; j < _outer.inners.length; j++){
+                outer.inners[j] = new Inner();	
+	            outer.inners[j].level = _outer.inners[j].level;
+	            outer.inners[j].point = new /*Common.*/Point();
+	            outer.inners[j].point.x = _outer.inners[j].point.x;
+	            outer.inners[j].point.y = _outer.inners[j].point.y;
+            }
+            outer.mode = _outer.mode;
+            for(DerivedTwoOuterHandler handler : this.OuterHandler){
+                try {
+                    handler.runOuterHandler(outer);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<DerivedTwoChangedCallback> ChangedCallback = new ArrayList<>();
+    void ChangedCallback(DerivedTwoJNI.Inner _inner){
+        if(this.ChangedCallback != null){
+            Inner inner = new Inner();
+            inner.level = _inner.level;
+            inner.point = new /*Common.*/Point();
+            inner.point.x = _inner.point.x;
+            inner.point.y = _inner.point.y;
+			for(DerivedTwoChangedCallback callback : this.ChangedCallback){
+                try {
+                    callback.onChangedReceived(inner);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+}
\ No newline at end of file
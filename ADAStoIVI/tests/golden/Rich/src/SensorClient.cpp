@@ -0,0 +1,987 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: SensorClient.cpp
+
+#include <iostream>
+#include <jni.h>
+#include <string.h>
+#include <CommonAPI/CommonAPI.hpp>
+#include "v1/org/example/rich/SensorProxy.hpp"
+#include "SharedConversions.hpp"
+#include "SensorConversions.hpp"
+
+#define LOGI(...) ((void)__android_log_print(ANDROID_LOG_INFO, LOG_TAG, __VA_ARGS__))
+#define LOGE(...) ((void)__android_log_print(ANDROID_LOG_ERROR, LOG_TAG, __VA_ARGS__))
+#include <android/log.h>
+#define LOG_TAG "SensorClientCPP"
+using namespace v1::org::example::rich;
+
+class SensorClient{
+	public:
+	SensorClient(){
+	};
+	std::shared_ptr<SensorProxy<>> myProxy;
+	void main(std::string pinstance, std::string pconnection);
+	jclass SensorClazz;
+	jobject SensorInstance;
+	jclass SharedClazz;
+	//jobject SharedInstance
+};
+        
+JavaVM *jvm;
+JNIEnv *jenv;
+
+JNIEXPORT jint JNICALL JNI_OnLoad(JavaVM* vm, void* reserved){
+	jvm = vm;
+	if ((vm)->GetEnv((void**)&jenv, JNI_VERSION_1_6) != JNI_OK) {
+		return JNI_ERR; //Failed to obtain JNIEnv
+	}
+	return JNI_VERSION_1_6;
+}
+
+void SensorClient::main(std::string pinstance, std::string pconnection){
+	std::shared_ptr<CommonAPI::Runtime> runtime = CommonAPI::Runtime::get();
+	
+    std::string domain = "local";
+	//std::string instance = "org.example.rich.Sensor";
+	std::string instance = pinstance;
+	std::string connection = pconnection;
+    myProxy = runtime->buildProxy<SensorProxy>(domain, instance,connection);
+    int8_t break_cnt = 0;
+    while(!myProxy->isAvailable()){
+        std::this_thread::sleep_for(std::chrono::microseconds(10));
+        if(break_cnt == 50){
+            break;
+        }
+        break_cnt++;
+    }
+}
+extern "C"{
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeRaw(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getRawAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](std::vector<uint8_t> _raw){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+			jmethodID RawMID = env->GetMethodID(SensorClazz, "subAttributeRawHandler", "([B)V");
+            std::vector<int8_t> _rawSigned;
+            _rawSigned.assign(_raw.begin(), _raw.end());
+            jbyte* rawData = static_cast<jbyte*>(_rawSigned.data());
+    		jsize rawLength = static_cast<jsize>(_raw.size());
+    		jbyteArray raw = env->NewByteArray(rawLength);
+    		env->SetByteArrayRegion(raw, 0, rawLength, rawData);
+			env->CallVoidMethod(SensorInstance, RawMID, raw);
+			env->DeleteLocalRef(raw);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jbyteArray JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeRawValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        std::vector<uint8_t> _raw;
+    	_SensorClient->myProxy->getRawAttribute().getValue(callStatus, _raw, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value raw failed!");
+    	}
+        std::vector<int8_t> _rawSigned;
+        _rawSigned.assign(_raw.begin(), _raw.end());
+        jbyte* rawData = static_cast<jbyte*>(_rawSigned.data());
+        jsize rawLength = static_cast<jsize>(_raw.size());
+        jbyteArray raw = env->NewByteArray(rawLength);
+        env->SetByteArrayRegion(raw, 0, rawLength, rawData);
+        return raw;
+    }
+
+    
+    JNIEXPORT jbyteArray JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeRawValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyteArray raw){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        jbyte* rawData = env->GetByteArrayElements(raw, nullptr);
+        jsize rawLength = env->GetArrayLength(raw);
+        std::vector<uint8_t> _raw(rawData, rawData + rawLength);
+        std::vector<uint8_t> _rawResponse;
+        _SensorClient->myProxy->getRawAttribute().setValue(_raw, callStatus, _rawResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value raw failed!");
+        }
+        std::vector<int8_t> _rawResponseSigned;
+        _rawResponseSigned.assign(_rawResponse.begin(), _rawResponse.end());
+        rawData = static_cast<jbyte*>(_rawResponseSigned.data());
+        jbyteArray rawResponse = env->NewByteArray(rawLength);
+        env->SetByteArrayRegion(rawResponse, 0, rawLength, rawData);
+        return rawResponse;
+        }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeRaw(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getRawAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeSample(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getSampleAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](Shared::Sample _sample){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+        	jmethodID SampleMID = env->GetMethodID(SensorClazz, "subAttributeSampleHandler", "(Lcom/example/gen/SensorJNI$Sample;)V");
+        	jobject sample = SharedSampleToJava(env, _sample);
+			env->CallVoidMethod(SensorInstance, SampleMID, sample);
+			env->DeleteLocalRef(sample);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeSampleValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::rich::*/Shared::Sample _sample;
+    	_SensorClient->myProxy->getSampleAttribute().getValue(callStatus, _sample, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value sample failed!");
+    	}
+        jobject sample = SharedSampleToJava(env, _sample);
+        return sample;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeSampleValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject sample){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::rich::Shared::Sample _sample = SharedSampleFromJava(env, sample);
+        ::v1::org::example::rich::Shared::Sample _sampleResponse;
+        _SensorClient->myProxy->getSampleAttribute().setValue(_sample, callStatus, _sampleResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value sample failed!");
+        }
+        jobject sampleResponse = SharedSampleToJava(env, _sampleResponse);
+        return sampleResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeSample(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getSampleAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeWrapper(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getWrapperAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](Shared::Wrapper _wrapper){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+        	jmethodID WrapperMID = env->GetMethodID(SensorClazz, "subAttributeWrapperHandler", "(Lcom/example/gen/SensorJNI$Wrapper;)V");
+        	jobject wrapper = SharedWrapperToJava(env, _wrapper);
+			env->CallVoidMethod(SensorInstance, WrapperMID, wrapper);
+			env->DeleteLocalRef(wrapper);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeWrapperValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::rich::*/Shared::Wrapper _wrapper;
+    	_SensorClient->myProxy->getWrapperAttribute().getValue(callStatus, _wrapper, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value wrapper failed!");
+    	}
+        jobject wrapper = SharedWrapperToJava(env, _wrapper);
+        return wrapper;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeWrapperValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject wrapper){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::rich::Shared::Wrapper _wrapper = SharedWrapperFromJava(env, wrapper);
+        ::v1::org::example::rich::Shared::Wrapper _wrapperResponse;
+        _SensorClient->myProxy->getWrapperAttribute().setValue(_wrapper, callStatus, _wrapperResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value wrapper failed!");
+        }
+        jobject wrapperResponse = SharedWrapperToJava(env, _wrapperResponse);
+        return wrapperResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeWrapper(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getWrapperAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeSamples(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getSamplesAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](Shared::Samples _samples){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+        	jmethodID SamplesMID = env->GetMethodID(SensorClazz, "subAttributeSamplesHandler", "([Lcom/example/gen/SensorJNI$Sample;)V");
+        	jobjectArray samples = SharedSampleArrayToJava(env, _samples);
+            env->CallVoidMethod(SensorInstance, SamplesMID, samples);
+            env->DeleteLocalRef(samples);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeSamplesValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::rich::*/Shared::Samples _samples;
+    	_SensorClient->myProxy->getSamplesAttribute().getValue(callStatus, _samples, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value samples failed!");
+    	}
+        jobjectArray samples = SharedSampleArrayToJava(env, _samples);
+        return samples;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeSamplesValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray samples){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        std::vector<::v1::org::example::rich::Shared::Sample> _samples = SharedSampleArrayFromJava(env, samples);
+        std::vector<::v1::org::example::rich::Shared::Sample> _samplesResponse;
+        _SensorClient->myProxy->getSamplesAttribute().setValue(_samples, callStatus, _samplesResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value samples failed!");
+        }
+        jobjectArray samplesResponse = SharedSampleArrayToJava(env, _samplesResponse);
+        return samplesResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeSamples(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getSamplesAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeLevels(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getLevelsAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](Shared::Levels _levels){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+			jmethodID LevelsMID = env->GetMethodID(SensorClazz, "subAttributeLevelsHandler", "([J)V");
+    		jlong* levelsData = static_cast<jlong*>(_levels.data());
+    		jsize levelsLength = static_cast<jsize>(_levels.size());
+    		jlongArray levels = env->NewLongArray(levelsLength);
+    		env->SetLongArrayRegion(levels, 0, levelsLength, levelsData);
+			env->CallVoidMethod(SensorInstance, LevelsMID, levels);
+			env->DeleteLocalRef(levels);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jlongArray JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeLevelsValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::rich::*/Shared::Levels _levels;
+    	_SensorClient->myProxy->getLevelsAttribute().getValue(callStatus, _levels, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value levels failed!");
+    	}
+        jlong* levelsData = static_cast<jlong*>(_levels.data());
+        jsize levelsLength = static_cast<jsize>(_levels.size());
+        jlongArray levels = env->NewLongArray(levelsLength);
+        env->SetLongArrayRegion(levels, 0, levelsLength, levelsData);
+        return levels;
+    }
+
+    
+    JNIEXPORT jlongArray JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeLevelsValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jlongArray levels){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        jlong* levelsData = env->GetLongArrayElements(levels, nullptr);
+        jsize levelsLength = env->GetArrayLength(levels);
+        /*::v1::org::example::rich::*/Shared::Levels _levels(levelsData, levelsData + levelsLength);
+        /*::v1::org::example::rich::*/Shared::Levels _levelsResponse;
+        _SensorClient->myProxy->getLevelsAttribute().setValue(_levels, callStatus, _levelsResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value levels failed!");
+        }
+        levelsData = static_cast<jlong*>(_levelsResponse.data());
+        jlongArray levelsResponse = env->NewLongArray(levelsLength);
+        env->SetLongArrayRegion(levelsResponse, 0, levelsLength, levelsData);
+        return levelsResponse;
+        }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeLevels(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getLevelsAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeLevel(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getLevelAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](Shared::Level _level){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+    		jobject SharedInstance = env->AllocObject(_SensorClient->SharedClazz);
+    		jclass SharedClazz = env->GetObjectClass(SharedInstance);
+        	jmethodID LevelMID = env->GetMethodID(SharedClazz, "subAttributeLevelHandler", "(B)V");
+        	uint8_t _levelInt = static_cast<uint8_t>(_level);
+        	jbyte level = static_cast<jbyte>(_levelInt);
+			env->CallVoidMethod(SensorInstance, LevelMID, level);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeLevelValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	jobject SharedInstance = env->AllocObject(_SensorClient->SharedClazz);
+            
+        /*::v1::org::example::rich::*/Shared::Level _level;
+    	_SensorClient->myProxy->getLevelAttribute().getValue(callStatus, _level, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value level failed!");
+    	}
+        uint8_t _levelInt = static_cast<uint8_t>(_level);
+        jbyte levelInt = static_cast<jbyte>(_levelInt);
+        env->DeleteLocalRef(SharedInstance);
+        return levelInt;
+    }
+
+
+    JNIEXPORT jbyte JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeLevelValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jbyte level){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        jbyte levelInt = level;
+        uint8_t _levelInt = static_cast<uint8_t>(levelInt);
+        Shared::Level _level = Shared::Level::Literal(_levelInt);
+        Shared::Level _levelResponse;
+        _SensorClient->myProxy->getLevelAttribute().setValue(_level, callStatus, _levelResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value level failed!");
+        }
+        _levelInt = static_cast<uint8_t>(_levelResponse);
+        jbyte levelResponse = static_cast<jbyte>(_levelInt);
+        return levelResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeLevel(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getLevelAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeLocal(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getLocalAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](Sensor::Local _local){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+        	jmethodID LocalMID = env->GetMethodID(SensorClazz, "subAttributeLocalHandler", "(Lcom/example/gen/SensorJNI$Local;)V");
+        	jobject local = SensorLocalToJava(env, _local);
+			env->CallVoidMethod(SensorInstance, LocalMID, local);
+			env->DeleteLocalRef(local);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeLocalValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::rich::*/Sensor::Local _local;
+    	_SensorClient->myProxy->getLocalAttribute().getValue(callStatus, _local, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value local failed!");
+    	}
+        jobject local = SensorLocalToJava(env, _local);
+        return local;
+    }
+
+
+    JNIEXPORT jobject JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeLocalValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobject local){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        ::v1::org::example::rich::Sensor::Local _local = SensorLocalFromJava(env, local);
+        ::v1::org::example::rich::Sensor::Local _localResponse;
+        _SensorClient->myProxy->getLocalAttribute().setValue(_local, callStatus, _localResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value local failed!");
+        }
+        jobject localResponse = SensorLocalToJava(env, _localResponse);
+        return localResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeLocal(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getLocalAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeLocals(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getLocalsAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](Sensor::Locals _locals){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+        	jmethodID LocalsMID = env->GetMethodID(SensorClazz, "subAttributeLocalsHandler", "([Lcom/example/gen/SensorJNI$Local;)V");
+        	jobjectArray locals = SensorLocalArrayToJava(env, _locals);
+            env->CallVoidMethod(SensorInstance, LocalsMID, locals);
+            env->DeleteLocalRef(locals);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeLocalsValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        /*::v1::org::example::rich::*/Sensor::Locals _locals;
+    	_SensorClient->myProxy->getLocalsAttribute().getValue(callStatus, _locals, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value locals failed!");
+    	}
+        jobjectArray locals = SensorLocalArrayToJava(env, _locals);
+        return locals;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeLocalsValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray locals){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        std::vector<::v1::org::example::rich::Sensor::Local> _locals = SensorLocalArrayFromJava(env, locals);
+        std::vector<::v1::org::example::rich::Sensor::Local> _localsResponse;
+        _SensorClient->myProxy->getLocalsAttribute().setValue(_locals, callStatus, _localsResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value locals failed!");
+        }
+        jobjectArray localsResponse = SensorLocalArrayToJava(env, _localsResponse);
+        return localsResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeLocals(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getLocalsAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeSampleList(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getSampleListAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](std::vector<Shared::Sample> _sampleList){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+        	jmethodID SampleListMID = env->GetMethodID(SensorClazz, "subAttributeSampleListHandler", "([Lcom/example/gen/SensorJNI$Sample;)V");
+        	jobjectArray sampleList = SharedSampleArrayToJava(env, _sampleList);
+            env->CallVoidMethod(SensorInstance, SampleListMID, sampleList);
+            env->DeleteLocalRef(sampleList);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeSampleListValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        std::vector<Shared::Sample> _sampleList;
+    	_SensorClient->myProxy->getSampleListAttribute().getValue(callStatus, _sampleList, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value sampleList failed!");
+    	}
+        jobjectArray sampleList = SharedSampleArrayToJava(env, _sampleList);
+        return sampleList;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeSampleListValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray sampleList){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        std::vector<::v1::org::example::rich::Shared::Sample> _sampleList = SharedSampleArrayFromJava(env, sampleList);
+        std::vector<::v1::org::example::rich::Shared::Sample> _sampleListResponse;
+        _SensorClient->myProxy->getSampleListAttribute().setValue(_sampleList, callStatus, _sampleListResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value sampleList failed!");
+        }
+        jobjectArray sampleListResponse = SharedSampleArrayToJava(env, _sampleListResponse);
+        return sampleListResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeSampleList(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getSampleListAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeLookup(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getLookupAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](Shared::Lookup _lookup){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+            jmethodID LookupMID = env->GetMethodID(SensorClazz, "subAttributeLookupHandler", "([Lcom/example/gen/SharedJNI$Lookup;)V");
+            jobjectArray lookup = SharedLookupMapToJava(env, _lookup);
+            env->CallVoidMethod(SensorInstance, LookupMID, lookup);
+            env->DeleteLocalRef(lookup);
+            jvm->DetachCurrentThread();
+            }
+        );
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeLookupValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    
+        Shared::Lookup _lookup;
+    	_SensorClient->myProxy->getLookupAttribute().getValue(callStatus, _lookup, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value lookup failed!");
+    	}
+        jobjectArray lookup = SharedLookupMapToJava(env, _lookup);
+        return lookup;
+    }
+
+    
+    JNIEXPORT jobjectArray JNICALL
+	Java_com_example_gen_SensorJNI_setAttributeLookupValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender, jobjectArray lookup){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+        Shared::Lookup _lookup = SharedLookupMapFromJava(env, lookup);
+        Shared::Lookup _lookupResponse;
+        
+        _SensorClient->myProxy->getLookupAttribute().setValue(_lookup, callStatus, _lookupResponse, &info);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+        	LOGE("Set Value lookup failed!");
+        }
+        jobjectArray lookupResponse = SharedLookupMapToJava(env, _lookupResponse);
+        
+        return lookupResponse;
+    }
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeLookup(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getLookupAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_subAttributeCounter(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	_SensorClient->myProxy->getCounterAttribute().getChangedEvent().subscribe(
+    		[_SensorClient](uint64_t _counter){
+			JNIEnv* env;
+    		if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+    		    LOGI("Attach Error!");    
+    		};
+    		jobject SensorInstance = _SensorClient->SensorInstance;
+    		jclass SensorClazz = env->GetObjectClass(SensorInstance);
+			jmethodID CounterMID = env->GetMethodID(SensorClazz, "subAttributeCounterHandler", "(J)V");
+        	jlong counter = static_cast<jlong>(_counter);
+			env->CallVoidMethod(SensorInstance, CounterMID, counter);
+			jvm->DetachCurrentThread();
+    		}
+    	);
+    }
+
+    JNIEXPORT jlong JNICALL
+	Java_com_example_gen_SensorJNI_getAttributeCounterValue(JNIEnv *env, jobject instance, jlong proxyptr, jint timeout, jint sender){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	CommonAPI::CallStatus callStatus;
+    	CommonAPI::CallInfo info(static_cast<int>(timeout));
+    	info.sender_ = static_cast<int>(sender);
+    	uint64_t _counter;
+    	_SensorClient->myProxy->getCounterAttribute().getValue(callStatus, _counter, &info);
+    	if(callStatus != CommonAPI::CallStatus::SUCCESS) {
+    		LOGE("Get Value counter failed!");
+    	}
+        return static_cast<jlong>(_counter);
+    }
+
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubAttributeCounter(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+    	SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+    	//_SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getCounterAttribute().getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_SensorJNI_subBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+        _SensorClient->myProxy->getChangedEvent().subscribe(
+            [_SensorClient](Shared::Sample _s, Shared::Level _l, std::vector<int32_t> _vals){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastChanged!");  
+            }
+            jobject SensorInstance = _SensorClient->SensorInstance;
+            jclass SensorClazz = env->GetObjectClass(SensorInstance);
+            jobject SharedInstance = env->AllocObject(_SensorClient->SharedClazz);
+                jclass SharedClazz = env->GetObjectClass(SharedInstance);
+                jmethodID ChangedMID = env->GetMethodID(SensorClazz, "subBroadcastChangedCallback", "(Lcom/example/gen/SharedJNI$Sample;B[I)V");
+                jobject s = SharedSampleToJava(env, _s);
+                uint8_t _lInt = static_cast<uint8_t>(_l);
+        		jbyte l = static_cast<jbyte>(_lInt);
+                jint* valsData = static_cast<jint*>(_vals.data());
+                jsize valsLength = static_cast<jsize>(_vals.size());
+        		jintArray vals = env->NewIntArray(valsLength);
+        		env->SetIntArrayRegion(vals, 0, valsLength, valsData);
+                env->CallVoidMethod(SensorInstance,ChangedMID, s, l, vals);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubBroadcastChanged(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getChangedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+	JNIEXPORT void JNICALL
+    Java_com_example_gen_SensorJNI_subBroadcastWrapped(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+        _SensorClient->myProxy->getWrappedEvent().subscribe(
+            [_SensorClient](Shared::Wrapper _w){
+            JNIEnv* env;
+            if((jvm)->AttachCurrentThread(&env,nullptr) != JNI_OK){
+                LOGE("Attach Error at subBroadcastWrapped!");  
+            }
+            jobject SensorInstance = _SensorClient->SensorInstance;
+            jclass SensorClazz = env->GetObjectClass(SensorInstance);
+            jmethodID WrappedMID = env->GetMethodID(SensorClazz, "subBroadcastWrappedCallback", "(Lcom/example/gen/SharedJNI$Wrapper;)V");
+                jobject w = SharedWrapperToJava(env, _w);
+                env->CallVoidMethod(SensorInstance,WrappedMID, w);
+                jvm->DetachCurrentThread();
+            }
+        );
+    }
+    
+    JNIEXPORT void JNICALL
+	Java_com_example_gen_SensorJNI_unsubBroadcastWrapped(JNIEnv *env, jobject instance, jlong proxyptr, jint subscription){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+    	int32_t _subscription = static_cast<int>(subscription);
+    	_SensorClient->myProxy->getWrappedEvent().unsubscribe(_subscription);
+    }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+    JNIEXPORT jobject JNICALL
+    Java_com_example_gen_SensorJNI_Configure(JNIEnv *env, jobject instance, jlong proxyptr, jobject s, jbyteArray blob, jobject w, jbyte l, jintArray nums){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+        jobject SharedInstance = env->AllocObject(_SensorClient->SharedClazz);
+        
+        jclass configureClazz = env->FindClass("com/example/gen/SensorJNI$ConfigureReturnType");
+        jmethodID configureConstructor = env->GetMethodID(configureClazz, "<init>", "(Lcom/example/gen/SharedJNI$Wrapper;[Lcom/example/gen/SharedJNI$Sample;D)V");
+        ::v1::org::example::rich::Shared::Sample _s = SharedSampleFromJava(env, s);
+        jbyte* blobData = env->GetByteArrayElements(blob, nullptr);
+        jsize blobLength = env->GetArrayLength(blob);
+        std::vector<uint8_t> _blob(blobData, blobData + blobLength);
+        ::v1::org::example::rich::Shared::Wrapper _w = SharedWrapperFromJava(env, w);
+        jbyte lInt = l;
+        uint8_t _lInt = static_cast<uint8_t>(lInt);
+        Shared::Level _l = Shared::Level::Literal(_lInt);
+        jint* numsData = env->GetIntArrayElements(nums, nullptr);
+        jsize numsLength = env->GetArrayLength(nums);
+        std::vector<uint16_t> _nums(numsData, numsData + numsLength);
+        
+        ::v1::org::example::rich::Shared::Wrapper _result;
+        
+        std::vector<::v1::org::example::rich::Shared::Sample> _all;
+        double _d;
+		
+        CommonAPI::CallStatus callStatus;
+        _SensorClient->myProxy->configure(_s, _blob, _w, _l, _nums, callStatus, _result, _all, _d);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("configure failed!");
+        }
+        jobject result = SharedWrapperToJava(env, _result);
+        jobjectArray all = SharedSampleArrayToJava(env, _all);
+        
+		jdouble d = static_cast<jdouble>(_d);
+        jobject ConfigureReturnType = env->NewObject(configureClazz, configureConstructor, result, all, d);
+        return ConfigureReturnType;
+    }
+
+    JNIEXPORT jobject JNICALL
+    Java_com_example_gen_SensorJNI_Fetch(JNIEnv *env, jobject instance, jlong proxyptr, jint idx){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+        int32_t _idx = static_cast<int32_t>(idx);
+		
+        ::v1::org::example::rich::Sensor::Local _loc;
+        
+        CommonAPI::CallStatus callStatus;
+        _SensorClient->myProxy->fetch(_idx, callStatus, _loc);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("fetch failed!");
+        }
+        jobject loc = SensorLocalToJava(env, _loc);
+        
+        return loc;
+    }
+
+    JNIEXPORT jobjectArray JNICALL
+    Java_com_example_gen_SensorJNI_ListAll(JNIEnv *env, jobject instance, jlong proxyptr){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+        
+        std::vector<::v1::org::example::rich::Sensor::Local> _items;
+        
+        CommonAPI::CallStatus callStatus;
+        _SensorClient->myProxy->listAll(callStatus, _items);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("listAll failed!");
+        }
+        jobjectArray items = SensorLocalArrayToJava(env, _items);
+        
+        return items;
+    }
+
+    JNIEXPORT void JNICALL
+    Java_com_example_gen_SensorJNI_Reset(JNIEnv *env, jobject instance, jlong proxyptr, jboolean hard){
+        SensorClient* _SensorClient = reinterpret_cast<SensorClient*>(proxyptr);
+        _SensorClient->SensorInstance = env->NewGlobalRef(instance);
+        bool _hard = static_cast<bool>(hard);
+		
+        CommonAPI::CallStatus callStatus;
+        _SensorClient->myProxy->reset(_hard, callStatus);
+        if(callStatus != CommonAPI::CallStatus::SUCCESS){
+            LOGE("reset failed!");
+        }
+        
+    }
+	JNIEXPORT jlong JNICALL
+	Java_com_example_gen_SensorJNI_start(JNIEnv *env, jobject instance, jstring pinstance, jstring pconnection){
+        SensorClient* _SensorClient = new SensorClient();
+        const char* char_instance = env->GetStringUTFChars(pinstance,nullptr);
+		std::string _instance(char_instance);
+        const char* char_connection = env->GetStringUTFChars(pconnection,nullptr);
+		std::string _connection(char_connection);
+        _SensorClient->main(_instance, _connection);
+        _SensorClient->SensorClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/SensorJNI")));
+        _SensorClient->SensorInstance = nullptr;
+        SharedConversionsInit(env);
+        SensorConversionsInit(env);
+        if(!(_SensorClient->myProxy->isAvailable())){
+            delete _SensorClient;
+            _SensorClient = nullptr;
+            return (jlong)0;
+        }
+        else{
+            return reinterpret_cast<jlong>(_SensorClient);
+        }
+    _SensorClient->SharedClazz = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/SharedJNI")));}
+}
@@ -0,0 +1,92 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: SensorConversions.hpp
+
+#ifndef SENSOR_CONVERSIONS_HPP
+#define SENSOR_CONVERSIONS_HPP
+
+#include <string>
+#include <vector>
+#include <jni.h>
+#include "v1/org/example/rich/Sensor.hpp"
+#include "SharedConversions.hpp"
+
+inline jobject SensorLocalToJava(JNIEnv *env, const ::v1::org::example::rich::Sensor::Local &value);
+inline ::v1::org::example::rich::Sensor::Local SensorLocalFromJava(JNIEnv *env, jobject object);
+inline jobjectArray SensorLocalArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::rich::Sensor::Local> &values);
+inline std::vector<::v1::org::example::rich::Sensor::Local> SensorLocalArrayFromJava(JNIEnv *env, jobjectArray array);
+
+inline jclass &SensorLocalClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline void SensorConversionsInit(JNIEnv *env){
+    SharedConversionsInit(env);
+    if(SensorLocalClass() == nullptr){
+        SensorLocalClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/SensorJNI$Local")));
+    }
+}
+
+inline jobject SensorLocalToJava(JNIEnv *env, const ::v1::org::example::rich::Sensor::Local &value){
+    static jmethodID constructor = env->GetMethodID(SensorLocalClass(), "<init>", "(FLcom/example/gen/SharedJNI$Sample;[Z)V");
+    jfloat fieldF = static_cast<jfloat>(value.getF());
+    jobject fieldS = SharedSampleToJava(env, value.getS());
+    const auto &valueBits = value.getBits();
+    std::vector<jboolean> fieldBitsData(valueBits.begin(), valueBits.end());
+    jbooleanArray fieldBits = env->NewBooleanArray(static_cast<jsize>(fieldBitsData.size()));
+    env->SetBooleanArrayRegion(fieldBits, 0, static_cast<jsize>(fieldBitsData.size()), fieldBitsData.data());
+    jobject object = env->NewObject(SensorLocalClass(), constructor, fieldF, fieldS, fieldBits);
+    env->DeleteLocalRef(fieldS);
+    env->DeleteLocalRef(fieldBits);
+    return object;
+}
+
+inline ::v1::org::example::rich::Sensor::Local SensorLocalFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::rich::Sensor::Local value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldFFID = env->GetFieldID(SensorLocalClass(), "f", "F");
+    value.setF(static_cast<float>(env->GetFloatField(object, fieldFFID)));
+    static jfieldID fieldSFID = env->GetFieldID(SensorLocalClass(), "s", "Lcom/example/gen/SharedJNI$Sample;");
+    jobject fieldS = env->GetObjectField(object, fieldSFID);
+    value.setS(SharedSampleFromJava(env, fieldS));
+    env->DeleteLocalRef(fieldS);
+    static jfieldID fieldBitsFID = env->GetFieldID(SensorLocalClass(), "bits", "[Z");
+    jbooleanArray fieldBits = static_cast<jbooleanArray>(env->GetObjectField(object, fieldBitsFID));
+    if(fieldBits != nullptr){
+        jsize fieldBitsLength = env->GetArrayLength(fieldBits);
+        jboolean *fieldBitsData = env->GetBooleanArrayElements(fieldBits, nullptr);
+        value.setBits(std::vector<bool>(fieldBitsData, fieldBitsData + fieldBitsLength));
+        env->ReleaseBooleanArrayElements(fieldBits, fieldBitsData, JNI_ABORT);
+        env->DeleteLocalRef(fieldBits);
+    }
+    return value;
+}
+
+inline jobjectArray SensorLocalArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::rich::Sensor::Local> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), SensorLocalClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = SensorLocalToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::rich::Sensor::Local> SensorLocalArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::rich::Sensor::Local> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(SensorLocalFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+#endif
@@ -0,0 +1,432 @@
+package com.example.gen;
+
+public class SensorJNI {
+
+	static {
+		System.loadLibrary("Sensor-Client");
+	}
+
+	public long proxyptr;
+	public native long start(String instance, String connection);
+	private SensorService service;
+
+    public static class Local {
+		float f;
+		SharedJNI.Sample s;
+		boolean[] bits;
+
+		public Local(){}
+        
+		public Local(float f, SharedJNI.Sample s, boolean[] bits){
+			this.f = f;
+			this.s = s;
+			this.bits = bits;
+		}
+	}
+    public Local LocalToCPP() {
+        return new Local();
+    }
+    int AttributeRawSubscription = -1;
+    public void subscribeAttributeRaw(){
+        subAttributeRaw(this.proxyptr);
+        ++AttributeRawSubscription;
+    }
+        
+    public byte[] getAttributeRawValue(){
+        return getAttributeRawValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeRawValue(byte[] raw){
+        setAttributeRawValue(this.proxyptr, service.timeout, service.sender,raw);   
+    }
+        
+    public native void subAttributeRaw(long proxyptr);
+    public void subAttributeRawHandler(byte[] raw){
+        service.AttributeRawHandle(raw);
+    }
+    public native byte[] getAttributeRawValue(long proxyptr, int timeout, int sender);
+    public native byte[] setAttributeRawValue(long proxyptr, int timeout, int sender, byte[] raw);
+    public native void unsubAttributeRaw(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeRaw(){
+        if(this.AttributeRawSubscription >= 0){
+            unsubAttributeRaw(this.proxyptr, this.AttributeRawSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeSampleSubscription = -1;
+    public void subscribeAttributeSample(){
+        subAttributeSample(this.proxyptr);
+        ++AttributeSampleSubscription;
+    }
+        
+    public SampleJNI.Sample getAttributeSampleValue(){
+        return getAttributeSampleValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeSampleValue(SampleJNI.Sample sample){
+        setAttributeSampleValue(this.proxyptr, service.timeout, service.sender,sample);   
+    }
+        
+    public native void subAttributeSample(long proxyptr);
+    public void subAttributeSampleHandler(SampleJNI.Sample sample){
+        service.AttributeSampleHandle(sample);
+    }
+    public native SampleJNI.Sample getAttributeSampleValue(long proxyptr, int timeout, int sender);
+    public native SampleJNI.Sample setAttributeSampleValue(long proxyptr, int timeout, int sender, SampleJNI.Sample sample);
+    public native void unsubAttributeSample(long proxyptr, int subscription);
+    
+    
+    public void unsubscribeAttributeSample(){
+        if(this.AttributeSampleSubscription >= 0){
+            unsubAttributeSample(this.proxyptr, this.AttributeSampleSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeWrapperSubscription = -1;
+    public void subscribeAttributeWrapper(){
+        subAttributeWrapper(this.proxyptr);
+        ++AttributeWrapperSubscription;
+    }
+        
+    public WrapperJNI.Wrapper getAttributeWrapperValue(){
+        return getAttributeWrapperValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeWrapperValue(WrapperJNI.Wrapper wrapper){
+        setAttributeWrapperValue(this.proxyptr, service.timeout, service.sender,wrapper);   
+    }
+        
+    public native void subAttributeWrapper(long proxyptr);
+    public void subAttributeWrapperHandler(WrapperJNI.Wrapper wrapper){
+        service.AttributeWrapperHandle(wrapper);
+    }
+    public native WrapperJNI.Wrapper getAttributeWrapperValue(long proxyptr, int timeout, int sender);
+    public native WrapperJNI.Wrapper setAttributeWrapperValue(long proxyptr, int timeout, int sender, WrapperJNI.Wrapper wrapper);
+    public native void unsubAttributeWrapper(long proxyptr, int subscription);
+    
+    
+    public void unsubscribeAttributeWrapper(){
+        if(this.AttributeWrapperSubscription >= 0){
+            unsubAttributeWrapper(this.proxyptr, this.AttributeWrapperSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeSamplesSubscription = -1;
+    public void subscribeAttributeSamples(){
+        subAttributeSamples(this.proxyptr);
+        ++AttributeSamplesSubscription;
+    }
+        
+    public Sample[] getAttributeSamplesValue(){
+        return getAttributeSamplesValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeSamplesValue(Sample[] samples){
+        setAttributeSamplesValue(this.proxyptr, service.timeout, service.sender,samples);   
+    }
+        
+    public native void subAttributeSamples(long proxyptr);
+    public void subAttributeSamplesHandler(Sample[] samples){
+        service.AttributeSamplesHandle(samples);
+    }
+    public native Sample[] getAttributeSamplesValue(long proxyptr, int timeout, int sender);
+    public native Sample[] setAttributeSamplesValue(long proxyptr, int timeout, int sender, Sample[] samples);
+    public native void unsubAttributeSamples(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeSamples(){
+        if(this.AttributeSamplesSubscription >= 0){
+            unsubAttributeSamples(this.proxyptr, this.AttributeSamplesSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeLevelsSubscription = -1;
+    public void subscribeAttributeLevels(){
+        subAttributeLevels(this.proxyptr);
+        ++AttributeLevelsSubscription;
+    }
+        
+    public long[] getAttributeLevelsValue(){
+        return getAttributeLevelsValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeLevelsValue(long[] levels){
+        setAttributeLevelsValue(this.proxyptr, service.timeout, service.sender,levels);   
+    }
+        
+    public native void subAttributeLevels(long proxyptr);
+    public void subAttributeLevelsHandler(long[] levels){
+        service.AttributeLevelsHandle(levels);
+    }
+    public native long[] getAttributeLevelsValue(long proxyptr, int timeout, int sender);
+    public native long[] setAttributeLevelsValue(long proxyptr, int timeout, int sender, long[] levels);
+    public native void unsubAttributeLevels(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeLevels(){
+        if(this.AttributeLevelsSubscription >= 0){
+            unsubAttributeLevels(this.proxyptr, this.AttributeLevelsSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeLevelSubscription = -1;
+    public void subscribeAttributeLevel(){
+        subAttributeLevel(this.proxyptr);
+        ++AttributeLevelSubscription;
+    }
+        
+    public byte getAttributeLevelValue(){
+        return getAttributeLevelValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeLevelValue(byte level){
+        setAttributeLevelValue(this.proxyptr, service.timeout, service.sender,level);   
+    }
+        
+    public native void subAttributeLevel(long proxyptr);
+    public void subAttributeLevelHandler(byte level){
+        service.AttributeLevelHandle(level);
+    }
+    public native byte getAttributeLevelValue(long proxyptr, int timeout, int sender);
+    public native byte setAttributeLevelValue(long proxyptr, int timeout, int sender, byte level);
+    public native void unsubAttributeLevel(long proxyptr, int subscription);
+    
+    
+    public void unsubscribeAttributeLevel(){
+        if(this.AttributeLevelSubscription >= 0){
+            unsubAttributeLevel(this.proxyptr, this.AttributeLevelSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeLocalSubscription = -1;
+    public void subscribeAttributeLocal(){
+        subAttributeLocal(this.proxyptr);
+        ++AttributeLocalSubscription;
+    }
+        
+    public Local getAttributeLocalValue(){
+        return getAttributeLocalValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeLocalValue(Local local){
+        setAttributeLocalValue(this.proxyptr, service.timeout, service.sender,local);   
+    }
+        
+    public native void subAttributeLocal(long proxyptr);
+    public void subAttributeLocalHandler(Local local){
+        service.AttributeLocalHandle(local);
+    }
+    public native Local getAttributeLocalValue(long proxyptr, int timeout, int sender);
+    public native Local setAttributeLocalValue(long proxyptr, int timeout, int sender, Local local);
+    public native void unsubAttributeLocal(long proxyptr, int subscription);
+    
+    
+    public void unsubscribeAttributeLocal(){
+        if(this.AttributeLocalSubscription >= 0){
+            unsubAttributeLocal(this.proxyptr, this.AttributeLocalSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeLocalsSubscription = -1;
+    public void subscribeAttributeLocals(){
+        subAttributeLocals(this.proxyptr);
+        ++AttributeLocalsSubscription;
+    }
+        
+    public Local[] getAttributeLocalsValue(){
+        return getAttributeLocalsValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeLocalsValue(Local[] locals){
+        setAttributeLocalsValue(this.proxyptr, service.timeout, service.sender,locals);   
+    }
+        
+    public native void subAttributeLocals(long proxyptr);
+    public void subAttributeLocalsHandler(Local[] locals){
+        service.AttributeLocalsHandle(locals);
+    }
+    public native Local[] getAttributeLocalsValue(long proxyptr, int timeout, int sender);
+    public native Local[] setAttributeLocalsValue(long proxyptr, int timeout, int sender, Local[] locals);
+    public native void unsubAttributeLocals(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeLocals(){
+        if(this.AttributeLocalsSubscription >= 0){
+            unsubAttributeLocals(this.proxyptr, this.AttributeLocalsSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeSampleListSubscription = -1;
+    public void subscribeAttributeSampleList(){
+        subAttributeSampleList(this.proxyptr);
+        ++AttributeSampleListSubscription;
+    }
+        
+    public Sample[] getAttributeSampleListValue(){
+        return getAttributeSampleListValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeSampleListValue(Sample[] sampleList){
+        setAttributeSampleListValue(this.proxyptr, service.timeout, service.sender,sampleList);   
+    }
+        
+    public native void subAttributeSampleList(long proxyptr);
+    public void subAttributeSampleListHandler(Sample[] sampleList){
+        service.AttributeSampleListHandle(sampleList);
+    }
+    public native Sample[] getAttributeSampleListValue(long proxyptr, int timeout, int sender);
+    public native Sample[] setAttributeSampleListValue(long proxyptr, int timeout, int sender, Sample[] sampleList);
+    public native void unsubAttributeSampleList(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeSampleList(){
+        if(this.AttributeSampleListSubscription >= 0){
+            unsubAttributeSampleList(this.proxyptr, this.AttributeSampleListSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeLookupSubscription = -1;
+    public void subscribeAttributeLookup(){
+        subAttributeLookup(this.proxyptr);
+        ++AttributeLookupSubscription;
+    }
+        
+    public Lookup[] getAttributeLookupValue(){
+        return getAttributeLookupValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public void setAttributeLookupValue(Lookup[] lookup){
+        setAttributeLookupValue(this.proxyptr, service.timeout, service.sender,lookup);   
+    }
+        
+    public native void subAttributeLookup(long proxyptr);
+    public void subAttributeLookupHandler(Lookup[] lookup){
+        service.AttributeLookupHandle(lookup);
+    }
+    public native Lookup[] getAttributeLookupValue(long proxyptr, int timeout, int sender);
+    public native Lookup[] setAttributeLookupValue(long proxyptr, int timeout, int sender, Lookup[] lookup);
+    public native void unsubAttributeLookup(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeLookup(){
+        if(this.AttributeLookupSubscription >= 0){
+            unsubAttributeLookup(this.proxyptr, this.AttributeLookupSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int AttributeCounterSubscription = -1;
+    public void subscribeAttributeCounter(){
+        subAttributeCounter(this.proxyptr);
+        ++AttributeCounterSubscription;
+    }
+        
+    public long getAttributeCounterValue(){
+        return getAttributeCounterValue(this.proxyptr, service.timeout, service.sender);   
+    }
+        
+    public native void subAttributeCounter(long proxyptr);
+    public void subAttributeCounterHandler(long counter){
+        service.AttributeCounterHandle(counter);
+    }
+    public native long getAttributeCounterValue(long proxyptr, int timeout, int sender);
+    public native void unsubAttributeCounter(long proxyptr, int subscription);
+
+
+    public void unsubscribeAttributeCounter(){
+        if(this.AttributeCounterSubscription >= 0){
+            unsubAttributeCounter(this.proxyptr, this.AttributeCounterSubscription--);
+        }
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    static class ConfigureReturnType{
+        public Wrapper result;
+		public Sample[] all;
+		public double d;
+		
+        public ConfigureReturnType(){
+		}
+
+        public ConfigureReturnType(Wrapper result, Sample[] all, double d){
+			this.result = result;
+			this.all = all;
+			this.d = d;
+		}
+
+    }
+    
+    public ConfigureReturnType configure(Sample s, byte[] blob, Wrapper w, byte l, int[] nums){
+        return Configure(this.proxyptr, s, blob, w, l, nums);
+    }
+    public native ConfigureReturnType Configure(long proxyptr, Sample s, byte[] blob, Wrapper w, byte l, int[] nums);
+    
+    /////////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    public Local fetch(int idx){
+        return Fetch(this.proxyptr, idx);
+    }
+    public native Local Fetch(long proxyptr, int idx);
+    
+    /////////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    public Local[] listAll(){
+        return ListAll(this.proxyptr);
+    }
+    public native Local[] ListAll(long proxyptr);
+    
+    /////////////////////////////////////////////////////////////////////////////////////////
+    /////////////////////////////////////////////////////////////////////////////////////////
+    
+    public void reset(boolean hard){
+        Reset(this.proxyptr, hard);
+    }
+    public native void Reset(long proxyptr, boolean hard);
+    
+    ////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+    int ChangedSubscription = -1;
+    public native void subBroadcastChanged(long proxyptr);
+    public native void unsubBroadcastChanged(long proxyptr, int subscription);
+    public void subscribeChanged(){
+        subBroadcastChanged(this.proxyptr);
+        ++this.ChangedSubscription;
+    }
+    public void unsubscribeChanged(){
+        if(this.ChangedSubscription >= 0){
+            unsubBroadcastChanged(this.proxyptr, this.ChangedSubscription--);
+        }
+    }
+    
+    public void subBroadcastChangedCallback(Sample s, byte l, int[] vals){
+        service.ChangedCallback(s, l, vals);
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////////////////////
+    int WrappedSubscription = -1;
+    public native void subBroadcastWrapped(long proxyptr);
+    public native void unsubBroadcastWrapped(long proxyptr, int subscription);
+    public void subscribeWrapped(){
+        subBroadcastWrapped(this.proxyptr);
+        ++this.WrappedSubscription;
+    }
+    public void unsubscribeWrapped(){
+        if(this.WrappedSubscription >= 0){
+            unsubBroadcastWrapped(this.proxyptr, this.WrappedSubscription--);
+        }
+    }
+    
+    public void subBroadcastWrappedCallback(Wrapper w){
+        service.WrappedCallback(w);
+    }
+    ///////////////////////////////////////////////////////////////////////////////////////
+    
+	SensorJNI(SensorService service, String instance, String connection){
+		this.proxyptr = start(instance, connection);
+		this.service = service;
+	}
+
+}
\ No newline at end of file
@@ -0,0 +1,231 @@
+// Auto-generated by FIDL-SRC Converter
+// Filename: SharedConversions.hpp
+
+#ifndef SHARED_CONVERSIONS_HPP
+#define SHARED_CONVERSIONS_HPP
+
+#include <string>
+#include <vector>
+#include <jni.h>
+#include "v1/org/example/rich/Shared.hpp"
+
+inline jobject SharedSampleToJava(JNIEnv *env, const ::v1::org::example::rich::Shared::Sample &value);
+inline ::v1::org::example::rich::Shared::Sample SharedSampleFromJava(JNIEnv *env, jobject object);
+inline jobjectArray SharedSampleArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::rich::Shared::Sample> &values);
+inline std::vector<::v1::org::example::rich::Shared::Sample> SharedSampleArrayFromJava(JNIEnv *env, jobjectArray array);
+inline jobject SharedWrapperToJava(JNIEnv *env, const ::v1::org::example::rich::Shared::Wrapper &value);
+inline ::v1::org::example::rich::Shared::Wrapper SharedWrapperFromJava(JNIEnv *env, jobject object);
+inline jobjectArray SharedWrapperArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::rich::Shared::Wrapper> &values);
+inline std::vector<::v1::org::example::rich::Shared::Wrapper> SharedWrapperArrayFromJava(JNIEnv *env, jobjectArray array);
+inline jobjectArray SharedLookupMapToJava(JNIEnv *env, const ::v1::org::example::rich::Shared::Lookup &values);
+inline ::v1::org::example::rich::Shared::Lookup SharedLookupMapFromJava(JNIEnv *env, jobjectArray array);
+
+inline jclass &SharedSampleClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline jclass &SharedWrapperClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline jclass &SharedLookupClass(){
+    static jclass clazz = nullptr;
+    return clazz;
+}
+
+inline void SharedConversionsInit(JNIEnv *env){
+    if(SharedSampleClass() == nullptr){
+        SharedSampleClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/SharedJNI$Sample")));
+    }
+    if(SharedWrapperClass() == nullptr){
+        SharedWrapperClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/SharedJNI$Wrapper")));
+    }
+    if(SharedLookupClass() == nullptr){
+        SharedLookupClass() = static_cast<jclass>(env->NewGlobalRef(env->FindClass("com/example/gen/SharedJNI$Lookup")));
+    }
+}
+
+inline jobject SharedSampleToJava(JNIEnv *env, const ::v1::org::example::rich::Shared::Sample &value){
+    static jmethodID constructor = env->GetMethodID(SharedSampleClass(), "<init>", "(JLjava/lang/String;[I[B)V");
+    jlong fieldId = static_cast<jlong>(value.getId());
+    jstring fieldTag = env->NewStringUTF(value.getTag().c_str());
+    const auto &valueValues = value.getValues();
+    std::vector<jint> fieldValuesData(valueValues.begin(), valueValues.end());
+    jintArray fieldValues = env->NewIntArray(static_cast<jsize>(fieldValuesData.size()));
+    env->SetIntArrayRegion(fieldValues, 0, static_cast<jsize>(fieldValuesData.size()), fieldValuesData.data());
+    const auto &valuePayload = value.getPayload();
+    std::vector<jbyte> fieldPayloadData(valuePayload.begin(), valuePayload.end());
+    jbyteArray fieldPayload = env->NewByteArray(static_cast<jsize>(fieldPayloadData.size()));
+    env->SetByteArrayRegion(fieldPayload, 0, static_cast<jsize>(fieldPayloadData.size()), fieldPayloadData.data());
+    jobject object = env->NewObject(SharedSampleClass(), constructor, fieldId, fieldTag, fieldValues, fieldPayload);
+    env->DeleteLocalRef(fieldTag);
+    env->DeleteLocalRef(fieldValues);
+    env->DeleteLocalRef(fieldPayload);
+    return object;
+}
+
+inline ::v1::org::example::rich::Shared::Sample SharedSampleFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::rich::Shared::Sample value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldIdFID = env->GetFieldID(SharedSampleClass(), "id", "J");
+    value.setId(static_cast<uint32_t>(env->GetLongField(object, fieldIdFID)));
+    static jfieldID fieldTagFID = env->GetFieldID(SharedSampleClass(), "tag", "Ljava/lang/String;");
+    jstring fieldTag = static_cast<jstring>(env->GetObjectField(object, fieldTagFID));
+    if(fieldTag != nullptr){
+        const char *fieldTagChars = env->GetStringUTFChars(fieldTag, nullptr);
+        value.setTag(std::string(fieldTagChars));
+        env->ReleaseStringUTFChars(fieldTag, fieldTagChars);
+        env->DeleteLocalRef(fieldTag);
+    }
+    static jfieldID fieldValuesFID = env->GetFieldID(SharedSampleClass(), "values", "[I");
+    jintArray fieldValues = static_cast<jintArray>(env->GetObjectField(object, fieldValuesFID));
+    if(fieldValues != nullptr){
+        jsize fieldValuesLength = env->GetArrayLength(fieldValues);
+        jint *fieldValuesData = env->GetIntArrayElements(fieldValues, nullptr);
+        value.setValues(std::vector<int16_t>(fieldValuesData, fieldValuesData + fieldValuesLength));
+        env->ReleaseIntArrayElements(fieldValues, fieldValuesData, JNI_ABORT);
+        env->DeleteLocalRef(fieldValues);
+    }
+    static jfieldID fieldPayloadFID = env->GetFieldID(SharedSampleClass(), "payload", "[B");
+    jbyteArray fieldPayload = static_cast<jbyteArray>(env->GetObjectField(object, fieldPayloadFID));
+    if(fieldPayload != nullptr){
+        jsize fieldPayloadLength = env->GetArrayLength(fieldPayload);
+        jbyte *fieldPayloadData = env->GetByteArrayElements(fieldPayload, nullptr);
+        value.setPayload(std::vector<uint8_t>(fieldPayloadData, fieldPayloadData + fieldPayloadLength));
+        env->ReleaseByteArrayElements(fieldPayload, fieldPayloadData, JNI_ABORT);
+        env->DeleteLocalRef(fieldPayload);
+    }
+    return value;
+}
+
+inline jobjectArray SharedSampleArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::rich::Shared::Sample> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), SharedSampleClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = SharedSampleToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::rich::Shared::Sample> SharedSampleArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::rich::Shared::Sample> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(SharedSampleFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+inline jobject SharedWrapperToJava(JNIEnv *env, const ::v1::org::example::rich::Shared::Wrapper &value){
+    static jmethodID constructor = env->GetMethodID(SharedWrapperClass(), "<init>", "(Lcom/example/gen/SharedJNI$Sample;[Lcom/example/gen/SharedJNI$Sample;BB)V");
+    jobject fieldFirst = SharedSampleToJava(env, value.getFirst());
+    jobjectArray fieldMore = SharedSampleArrayToJava(env, value.getMore());
+    jbyte fieldLevel = static_cast<jbyte>(static_cast<uint8_t>(value.getLevel()));
+    jbyte fieldFlag = static_cast<jbyte>(value.getFlag());
+    jobject object = env->NewObject(SharedWrapperClass(), constructor, fieldFirst, fieldMore, fieldLevel, fieldFlag);
+    env->DeleteLocalRef(fieldFirst);
+    env->DeleteLocalRef(fieldMore);
+    return object;
+}
+
+inline ::v1::org::example::rich::Shared::Wrapper SharedWrapperFromJava(JNIEnv *env, jobject object){
+    ::v1::org::example::rich::Shared::Wrapper value;
+    if(object == nullptr){
+        return value;
+    }
+    static jfieldID fieldFirstFID = env->GetFieldID(SharedWrapperClass(), "first", "Lcom/example/gen/SharedJNI$Sample;");
+    jobject fieldFirst = env->GetObjectField(object, fieldFirstFID);
+    value.setFirst(SharedSampleFromJava(env, fieldFirst));
+    env->DeleteLocalRef(fieldFirst);
+    static jfieldID fieldMoreFID = env->GetFieldID(SharedWrapperClass(), "more", "[Lcom/example/gen/SharedJNI$Sample;");
+    jobjectArray fieldMore = static_cast<jobjectArray>(env->GetObjectField(object, fieldMoreFID));
+    value.setMore(SharedSampleArrayFromJava(env, fieldMore));
+    env->DeleteLocalRef(fieldMore);
+    static jfieldID fieldLevelFID = env->GetFieldID(SharedWrapperClass(), "level", "B");
+    value.setLevel(::v1::org::example::rich::Shared::Level::Literal(static_cast<uint8_t>(env->GetByteField(object, fieldLevelFID))));
+    static jfieldID fieldFlagFID = env->GetFieldID(SharedWrapperClass(), "flag", "B");
+    value.setFlag(static_cast<uint8_t>(env->GetByteField(object, fieldFlagFID)));
+    return value;
+}
+
+inline jobjectArray SharedWrapperArrayToJava(JNIEnv *env, const std::vector<::v1::org::example::rich::Shared::Wrapper> &values){
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), SharedWrapperClass(), nullptr);
+    for(jsize i = 0; i < static_cast<jsize>(values.size()); i++){
+        jobject item = SharedWrapperToJava(env, values[i]);
+        env->SetObjectArrayElement(array, i, item);
+        env->DeleteLocalRef(item);
+    }
+    return array;
+}
+
+inline std::vector<::v1::org::example::rich::Shared::Wrapper> SharedWrapperArrayFromJava(JNIEnv *env, jobjectArray array){
+    std::vector<::v1::org::example::rich::Shared::Wrapper> values;
+    if(array == nullptr){
+        return values;
+    }
+    jsize length = env->GetArrayLength(array);
+    values.reserve(length);
+    for(jsize i = 0; i < length; i++){
+        jobject item = env->GetObjectArrayElement(array, i);
+        values.push_back(SharedWrapperFromJava(env, item));
+        env->DeleteLocalRef(item);
+    }
+    return values;
+}
+
+inline jobjectArray SharedLookupMapToJava(JNIEnv *env, const ::v1::org::example::rich::Shared::Lookup &values){
+    static jmethodID constructor = env->GetMethodID(SharedLookupClass(), "<init>", "(Ljava/lang/String;Lcom/example/gen/SharedJNI$Sample;)V");
+    jobjectArray array = env->NewObjectArray(static_cast<jsize>(values.size()), SharedLookupClass(), nullptr);
+    jsize index = 0;
+    for(const auto &pair: values){
+        jstring key = env->NewStringUTF(pair.first.c_str());
+        jobject value = SharedSampleToJava(env, pair.second);
+        jobject item = env->NewObject(SharedLookupClass(), constructor, key, value);
+        env->SetObjectArrayElement(array, index++, item);
+        env->DeleteLocalRef(item);
+        env->DeleteLocalRef(key);
+        env->DeleteLocalRef(value);
+    }
+    return array;
+}
+
+inline ::v1::org::example::rich::Shared::Lookup SharedLookupMapFromJava(JNIEnv *env, jobjectArray array){
+    ::v1::org::example::rich::Shared::Lookup values;
+    if(array == nullptr){
+        return values;
+    }
+    static jfieldID keyFID = env->GetFieldID(SharedLookupClass(), "key", "Ljava/lang/String;");
+    static jfieldID valueFID = env->GetFieldID(SharedLookupClass(), "value", "Lcom/example/gen/SharedJNI$Sample;");
+    jsize length = env->GetArrayLength(array);
+    for(jsize index = 0; index < length; index++){
+        jobject object = env->GetObjectArrayElement(array, index);
+        std::string entryKey;
+        ::v1::org::example::rich::Shared::Sample entryValue;
+        jstring key = static_cast<jstring>(env->GetObjectField(object, keyFID));
+        if(key != nullptr){
+            const char *keyChars = env->GetStringUTFChars(key, nullptr);
+            entryKey = std::string(keyChars);
+            env->ReleaseStringUTFChars(key, keyChars);
+            env->DeleteLocalRef(key);
+        }
+        jobject value = env->GetObjectField(object, valueFID);
+        entryValue = SharedSampleFromJava(env, value);
+        env->DeleteLocalRef(value);
+        values[entryKey] = entryValue;
+        env->DeleteLocalRef(object);
+    }
+    return values;
+}
+
+#endif
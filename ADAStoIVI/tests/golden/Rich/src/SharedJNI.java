@@ -0,0 +1,52 @@
+package com.example.gen;
+public class SharedJNI{
+    
+    public static class Sample {
+		long id;
+		String tag;
+		int[] values;
+		byte[] payload;
+
+		public Sample(){}
+        
+		public Sample(long id, String tag, int[] values, byte[] payload){
+			this.id = id;
+			this.tag = tag;
+			this.values = values;
+			this.payload = payload;
+		}
+	}
+    public Sample SampleToCPP() {
+        return new Sample();
+    }
+    public static class Wrapper {
+		Sample first;
+		Sample[] more;
+		byte level;
+		byte flag;
+
+		public Wrapper(){}
+        
+		public Wrapper(Sample first, Sample[] more, byte level, byte flag){
+			this.first = first;
+			this.more = more;
+			this.level = level;
+			this.flag = flag;
+		}
+	}
+    public Wrapper WrapperToCPP() {
+        return new Wrapper();
+    }
+    public static class Lookup {
+        String key;
+        Sample value;
+        public Lookup() {}
+        public Lookup(String key, Sample value){
+            this.key = key;
+            this.value = value;
+        }
+    }
+    public Lookup LookupToCPP() {
+        return new Lookup();
+    }
+}
\ No newline at end of file
@@ -0,0 +1,1188 @@
+package com.example.gen;
+
+import android.app.Service;
+import android.content.Intent;
+import android.os.IBinder;
+import android.os.RemoteException;
+import android.util.Log;
+import java.util.ArrayList;
+    
+public class SensorService extends Service{
+    public SensorService(){}
+    private SensorJNI myProxy;
+    public static int timeout = 1000; // Needs to be changed
+    public static int sender = 5555; // Needs to be changed
+    public static String connection = ""; // Needs to be changed
+    public static String instance = ""; // Needs to be changed
+    private static final String TAG = "SensorService";
+    
+    public boolean proxyGeneration(){
+        if(myProxy == null){
+            myProxy = new SensorJNI(this, instance, connection);
+        }
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+            return false;
+        }
+        else{
+            Log.d(TAG, "Proxy Connection Succeeded!");
+            return true;
+        }
+    }
+    
+    @Override
+    public void onCreate(){
+        super.onCreate();
+        myProxy = new SensorJNI(this, instance, connection);
+        if(myProxy.proxyptr == 0){
+            Log.d(TAG, "Proxy Connection Failed!");
+            myProxy = null;
+        }
+        Log.d(TAG, "onCreate");
+    }
+    @Override
+    public IBinder onBind(Intent intent){
+        Log.d(TAG, "onBind");
+        return binder;
+    }
+    private final Sensor.Stub binder = new Sensor.Stub(){
+        @Override
+        public void subscribeAttributeRaw(SensorRawHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.RawHandler.contains(handler)){
+                SensorService.RawHandler.add(handler);
+                if(SensorService.RawHandler.size() == 1){
+                    myProxy.subscribeAttributeRaw();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeRawValue(byte[] raw) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeRawValue(raw);
+        }
+        @Override
+        public byte[] getAttributeRawValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            byte[] _raw = myProxy.getAttributeRawValue();
+            byte[] raw;
+            raw = _raw;
+            return raw;
+        }
+        @Override
+        public void unsubscribeAttributeRaw(SensorRawHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.RawHandler.contains(handler)){
+                SensorService.RawHandler.remove(handler);
+                if(SensorService.RawHandler.size() == 0){
+                    myProxy.unsubscribeAttributeRaw(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeSample(SensorSampleHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.SampleHandler.contains(handler)){
+                SensorService.SampleHandler.add(handler);
+                if(SensorService.SampleHandler.size() == 1){
+                    myProxy.subscribeAttributeSample();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeSampleValue(Sample sample) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            SharedJNI.Sample _sample = new SharedJNI.Sample();
+            _sample.id = sample.id;
+            _sample.tag = sample.tag;
+            _sample.values = sample.values;
+            _sample.payload = sample.payload;
+            myProxy.setAttributeSampleValue(_sample);
+        }
+        @Override
+        public Sample getAttributeSampleValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            SharedJNI.Sample _sample = myProxy.getAttributeSampleValue();
+            Sample sample = new Sample();
+            sample.id = _sample.id;
+            sample.tag = _sample.tag;
+            sample.values = _sample.values;
+            sample.payload = _sample.payload;
+            return sample;
+        }
+        @Override
+        public void unsubscribeAttributeSample(SensorSampleHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.SampleHandler.contains(handler)){
+                SensorService.SampleHandler.remove(handler);
+                if(SensorService.SampleHandler.size() == 0){
+                    myProxy.unsubscribeAttributeSample(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeWrapper(SensorWrapperHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.WrapperHandler.contains(handler)){
+                SensorService.WrapperHandler.add(handler);
+                if(SensorService.WrapperHandler.size() == 1){
+                    myProxy.subscribeAttributeWrapper();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeWrapperValue(Wrapper wrapper) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            SharedJNI.Wrapper _wrapper = new SharedJNI.Wrapper();
+            _wrapper.first = new SharedJNI.Sample();
+            _wrapper.first.id = wrapper.first.id;
+            _wrapper.first.tag = wrapper.first.tag;
+            _wrapper.first.values = wrapper.first.values;
+            _wrapper.first.payload = wrapper.first.payload;
+            _wrapper.more = new SharedJNI.Sample[wrapper.more.length];
+            for(int k = 0; k < wrapper.more.length; k++){	
+	            _wrapper.more[k].id = wrapper.more[k].id;
+	            _wrapper.more[k].tag = wrapper.more[k].tag;
+	            _wrapper.more[k].values = wrapper.more[k].values;
+	            _wrapper.more[k].payload = wrapper.more[k].payload;
+            }
+            _wrapper.level = wrapper.level;
+            _wrapper.flag = wrapper.flag;
+            myProxy.setAttributeWrapperValue(_wrapper);
+        }
+        @Override
+        public Wrapper getAttributeWrapperValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            SharedJNI.Wrapper _wrapper = myProxy.getAttributeWrapperValue();
+            Wrapper wrapper = new Wrapper();
+            wrapper.first = new /*Shared.*/Sample();
+            wrapper.first.id = _wrapper.first.id;
+            wrapper.first.tag = _wrapper.first.tag;
+            wrapper.first.values = _wrapper.first.values;
+            wrapper.first.payload = _wrapper.first.payload;
+            wrapper.more = new Sample[_wrapper.more.length];
+            for(int j = 0; j < _wrapper.more.length; j++){
+                wrapper.more[j] = new Sample();	
+	            wrapper.more[j].id = _wrapper.more[j].id;
+	            wrapper.more[j].tag = _wrapper.more[j].tag;
+	            wrapper.more[j].values = new Int[_wrapper.more[j].values.length];
+	            wrapper.more[j].values = _wrapper.more[j].values;
+	            wrapper.more[j].payload = new Byte[_wrapper.more[j].payload.length];
+	            wrapper.more[j].payload = _wrapper.more[j].payload;
+            }
+            wrapper.level = _wrapper.level;
+            wrapper.flag = _wrapper.flag;
+            return wrapper;
+        }
+        @Override
+        public void unsubscribeAttributeWrapper(SensorWrapperHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.WrapperHandler.contains(handler)){
+                SensorService.WrapperHandler.remove(handler);
+                if(SensorService.WrapperHandler.size() == 0){
+                    myProxy.unsubscribeAttributeWrapper(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeSamples(SensorSamplesHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.SamplesHandler.contains(handler)){
+                SensorService.SamplesHandler.add(handler);
+                if(SensorService.SamplesHandler.size() == 1){
+                    myProxy.subscribeAttributeSamples();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeSamplesValue(Samples samples) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            SharedJNI.Sample[] _samples = new SharedJNI.Sample[samples.data.length];
+            for(int i = 0; i < samples.data.length; i++){
+                _samples[i] = new SharedJNI.Sample();	
+	            _samples[i].id = samples.data[i].id;
+	            _samples[i].tag = samples.data[i].tag;
+	            _samples[i].values = samples.data[i].values;
+	            _samples[i].payload = samples.data[i].payload;
+            }
+            myProxy.setAttributeSamplesValue(_samples);
+        }
+        @Override
+        public Samples getAttributeSamplesValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            SharedJNI.Sample[] _samples = myProxy.getAttributeSamplesValue();
+            if(_samples == null){
+                return null;
+            }
+            Samples samples = new Samples();
+            samples.data = new Sample[_samples.length];
+            for(int i = 0; i < _samples.length; i++){
+                samples.data[i] = new Sample();	
+	            samples.data[i].id = _samples[i].id;
+	            samples.data[i].tag = _samples[i].tag;
+	            samples.data[i].values = new Int[_samples[i].values.length];
+	            samples.data[i].values = _samples[i].values;
+	            samples.data[i].payload = new Byte[_samples[i].payload.length];
+	            samples.data[i].payload = _samples[i].payload;
+            }
+            return samples;
+        }
+        @Override
+        public void unsubscribeAttributeSamples(SensorSamplesHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.SamplesHandler.contains(handler)){
+                SensorService.SamplesHandler.remove(handler);
+                if(SensorService.SamplesHandler.size() == 0){
+                    myProxy.unsubscribeAttributeSamples(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeLevels(SensorLevelsHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.LevelsHandler.contains(handler)){
+                SensorService.LevelsHandler.add(handler);
+                if(SensorService.LevelsHandler.size() == 1){
+                    myProxy.subscribeAttributeLevels();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeLevelsValue(Levels levels) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            long[] _levels = levels.data;
+            myProxy.setAttributeLevelsValue(_levels);
+        }
+        @Override
+        public Levels getAttributeLevelsValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            long[] _levels = myProxy.getAttributeLevelsValue();
+            Levels levels = new Levels();
+            levels.data = _levels;
+            return levels;
+        }
+        @Override
+        public void unsubscribeAttributeLevels(SensorLevelsHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.LevelsHandler.contains(handler)){
+                SensorService.LevelsHandler.remove(handler);
+                if(SensorService.LevelsHandler.size() == 0){
+                    myProxy.unsubscribeAttributeLevels(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeLevel(SensorLevelHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.LevelHandler.contains(handler)){
+                SensorService.LevelHandler.add(handler);
+                if(SensorService.LevelHandler.size() == 1){
+                    myProxy.subscribeAttributeLevel();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeLevelValue(byte level) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            myProxy.setAttributeLevelValue(level);
+        }
+        @Override
+        public byte getAttributeLevelValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeLevelValue();
+        }
+        @Override
+        public void unsubscribeAttributeLevel(SensorLevelHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.LevelHandler.contains(handler)){
+                SensorService.LevelHandler.remove(handler);
+                if(SensorService.LevelHandler.size() == 0){
+                    myProxy.unsubscribeAttributeLevel(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeLocal(SensorLocalHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.LocalHandler.contains(handler)){
+                SensorService.LocalHandler.add(handler);
+                if(SensorService.LocalHandler.size() == 1){
+                    myProxy.subscribeAttributeLocal();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeLocalValue(Local local) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            SensorJNI.Local _local = new SensorJNI.Local();
+            _local.f = local.f;
+            _local.s = new SharedJNI.Sample();
+            _local.s.id = local.s.id;
+            _local.s.tag = local.s.tag;
+            _local.s.values = local.s.values;
+            _local.s.payload = local.s.payload;
+            _local.bits = local.bits;
+            myProxy.setAttributeLocalValue(_local);
+        }
+        @Override
+        public Local getAttributeLocalValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            SensorJNI.Local _local = myProxy.getAttributeLocalValue();
+            Local local = new Local();
+            local.f = _local.f;
+            local.s = new /*Shared.*/Sample();
+            local.s.id = _local.s.id;
+            local.s.tag = _local.s.tag;
+            local.s.values = _local.s.values;
+            local.s.payload = _local.s.payload;
+            local.bits = _local.bits;
+            return local;
+        }
+        @Override
+        public void unsubscribeAttributeLocal(SensorLocalHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.LocalHandler.contains(handler)){
+                SensorService.LocalHandler.remove(handler);
+                if(SensorService.LocalHandler.size() == 0){
+                    myProxy.unsubscribeAttributeLocal(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeLocals(SensorLocalsHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.LocalsHandler.contains(handler)){
+                SensorService.LocalsHandler.add(handler);
+                if(SensorService.LocalsHandler.size() == 1){
+                    myProxy.subscribeAttributeLocals();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeLocalsValue(Locals locals) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            SensorJNI.Local[] _locals = new SensorJNI.Local[locals.data.length];
+            for(int i = 0; i < locals.data.length; i++){
+                _locals[i] = new SensorJNI.Local();	
+	            _locals[i].f = locals.data[i].f;
+	            _locals[i].s = new SharedJNI.Sample();
+	            _locals[i].s.id = locals.data[i].s.id;
+	            _locals[i].s.tag = locals.data[i].s.tag;
+	            _locals[i].s.values = locals.data[i].s.values;
+	            _locals[i].s.payload = locals.data[i].s.payload;
+	            _locals[i].bits = locals.data[i].bits;
+            }
+            myProxy.setAttributeLocalsValue(_locals);
+        }
+        @Override
+        public Locals getAttributeLocalsValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            SensorJNI.Local[] _locals = myProxy.getAttributeLocalsValue();
+            if(_locals == null){
+                return null;
+            }
+            Locals locals = new Locals();
+            locals.data = new Local[_locals.length];
+            for(int i = 0; i < _locals.length; i++){
+                locals.data[i] = new Local();	
+	            locals.data[i].f = _locals[i].f;
+	            locals.data[i].s = new /*Shared.*/Sample();
+	            locals.data[i].s.id = _locals[i].s.id;
+	            locals.data[i].s.tag = _locals[i].s.tag;
+	            locals.data[i].s.values = _locals[i].s.values;
+	            locals.data[i].s.payload = _locals[i].s.payload;
+	            locals.data[i].bits = new Boolean[_locals[i].bits.length];
+	            locals.data[i].bits = _locals[i].bits;
+            }
+            return locals;
+        }
+        @Override
+        public void unsubscribeAttributeLocals(SensorLocalsHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.LocalsHandler.contains(handler)){
+                SensorService.LocalsHandler.remove(handler);
+                if(SensorService.LocalsHandler.size() == 0){
+                    myProxy.unsubscribeAttributeLocals(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeSampleList(SensorSampleListHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.SampleListHandler.contains(handler)){
+                SensorService.SampleListHandler.add(handler);
+                if(SensorService.SampleListHandler.size() == 1){
+                    myProxy.subscribeAttributeSampleList();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeSampleListValue(Sample[] sampleList) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            SharedJNI.Sample[] _sampleList = new SharedJNI.Sample[sampleList.length];
+            for(int i = 0; i < sampleList.length; i++){
+                _sampleList[i] = new SharedJNI.Sample();	
+	            _sampleList[i].id = sampleList[i].id;
+	            _sampleList[i].tag = sampleList[i].tag;
+	            _sampleList[i].values = sampleList[i].values;
+	            _sampleList[i].payload = sampleList[i].payload;
+            }
+            myProxy.setAttributeSampleListValue(_sampleList);
+        }
+        @Override
+        public Sample[] getAttributeSampleListValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            SharedJNI.Sample[] _sampleList = myProxy.getAttributeSampleListValue();
+            if(_sampleList == null){
+                return null;
+            }
+            Sample[] sampleList = new Sample[_sampleList.length];
+            for(int i = 0; i < _sampleList.length; i++){
+                sampleList[i] = new Sample();	
+	            sampleList[i].id = _sampleList[i].id;
+	            sampleList[i].tag = _sampleList[i].tag;
+	            sampleList[i].values = new Int[_sampleList[i].values.length];
+	            sampleList[i].values = _sampleList[i].values;
+	            sampleList[i].payload = new Byte[_sampleList[i].payload.length];
+	            sampleList[i].payload = _sampleList[i].payload;
+            }
+            return sampleList;
+        }
+        @Override
+        public void unsubscribeAttributeSampleList(SensorSampleListHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.SampleListHandler.contains(handler)){
+                SensorService.SampleListHandler.remove(handler);
+                if(SensorService.SampleListHandler.size() == 0){
+                    myProxy.unsubscribeAttributeSampleList(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeLookup(SensorLookupHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.LookupHandler.contains(handler)){
+                SensorService.LookupHandler.add(handler);
+                if(SensorService.LookupHandler.size() == 1){
+                    myProxy.subscribeAttributeLookup();    
+                }
+            }
+        }
+        @Override
+        public void setAttributeLookupValue(Lookup[] lookup) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            SharedJNI.Lookup[] _lookup = new SharedJNI.Lookup[lookup.length];
+            for(int m = 0; m < lookup.length; m++){
+                _lookup[m] = new SharedJNI.Lookup();
+                _lookup[m].key = lookup[m].key;
+                _lookup[m].value = new SharedJNI.Sample();
+                _lookup[m].value.id = lookup[m].value.id;
+                _lookup[m].value.tag = lookup[m].value.tag;
+                
+            }
+            
+            myProxy.setAttributeLookupValue(_lookup);
+        }
+        @Override
+        public Lookup[] getAttributeLookupValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            SharedJNI.Lookup[] _lookup = myProxy.getAttributeLookupValue();
+            if(_lookup == null){
+                return null;
+            }
+            Lookup[] lookup = new Lookup[_lookup.length];
+            for(int m = 0; m < _lookup.length; m++){
+                lookup[m] = new Lookup();
+                lookup[m].key = _lookup[m].key;
+                lookup[m].value = new Sample();
+                lookup[m].value.id = _lookup[m].value.id;
+                lookup[m].value.tag = _lookup[m].value.tag;
+                
+            }
+            
+            
+            return lookup;
+        }
+        @Override
+        public void unsubscribeAttributeLookup(SensorLookupHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.LookupHandler.contains(handler)){
+                SensorService.LookupHandler.remove(handler);
+                if(SensorService.LookupHandler.size() == 0){
+                    myProxy.unsubscribeAttributeLookup(); 
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeAttributeCounter(SensorCounterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.CounterHandler.contains(handler)){
+                SensorService.CounterHandler.add(handler);
+                if(SensorService.CounterHandler.size() == 1){
+                    myProxy.subscribeAttributeCounter();    
+                }
+            }
+        }
+        @Override
+        public long getAttributeCounterValue() throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return  null;
+                }
+            }
+            return myProxy.getAttributeCounterValue();
+        }
+        @Override
+        public void unsubscribeAttributeCounter(SensorCounterHandler handler) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.CounterHandler.contains(handler)){
+                SensorService.CounterHandler.remove(handler);
+                if(SensorService.CounterHandler.size() == 0){
+                    myProxy.unsubscribeAttributeCounter(); 
+                }
+            }
+        }
+        
+        @Override
+        public ConfigureReturnType configure(Sample s, byte[] blob, Wrapper w, byte l, int[] nums) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            ConfigureReturnType configureService = new ConfigureReturnType();
+            SharedJNI.Sample _s = new SharedJNI.Sample();
+            _s.id = s.id;
+            _s.tag = s.tag;
+            _s.values = s.values;
+            _s.payload = s.payload;SharedJNI.Wrapper _w = new SharedJNI.Wrapper();
+            _w.first = new SharedJNI.Sample();
+            _w.first.id = w.first.id;
+            _w.first.tag = w.first.tag;
+            _w.first.values = w.first.values;
+            _w.first.payload = w.first.payload;
+            _w.more = new SharedJNI.Sample[w.more.length];
+            for(int k = 0; k < w.more.length; k++){	
+	            _w.more[k].id = w.more[k].id;
+	            _w.more[k].tag = w.more[k].tag;
+	            _w.more[k].values = w.more[k].values;
+	            _w.more[k].payload = w.more[k].payload;
+            }
+            _w.level = w.level;
+            _w.flag = w.flag;byte _l = l;
+            SensorJNI.ConfigureReturnType _configureService = myProxy.configure(_s, blob, _w, _l, nums);
+            configureService.result = new Wrapper();
+            configureService.result.first = new /*Shared.*/Sample();
+            configureService.result.first.id = _configureService.result.first.id;
+            configureService.result.first.tag = _configureService.result.first.tag;
+            configureService.result.first.values = _configureService.result.first.values;
+            configureService.result.first.payload = _configureService.result.first.payload;
+            configureService.result.more = new Sample[_configureService.result.more.length];
+            for(int j = 0; j < _configureService.result.more.length; j++){
+                configureService.result.more[j] = new Sample();	
+	            configureService.result.more[j].id = _configureService.result.more[j].id;
+	            configureService.result.more[j].tag = _configureService.result.more[j].tag;
+	            configureService.result.more[j].values = new Int[_configureService.result.more[j].values.length];
+	            configureService.result.more[j].values = _configureService.result.more[j].values;
+	            configureService.result.more[j].payload = new Byte[_configureService.result.more[j].payload.length];
+	            configureService.result.more[j].payload = _configureService.result.more[j].payload;
+            }
+            configureService.result.level = _configureService.result.level;
+            configureService.result.flag = _configureService.result.flag;configureService.all.data = new Sample[_configureService.all.length];
+            for(int i = 0; i < _configureService.all.length; i ++){
+                configureService.all[i] = new Sample();
+                	
+	            configureService.all.data[i].id = _configureService.all.data[i].id;
+	            configureService.all.data[i].tag = _configureService.all.data[i].tag;
+	            configureService.all.data[i].values = new Int[_configureService.all.data[i].values.length];
+	            configureService.all.data[i].values = _configureService.all.data[i].values;
+	            configureService.all.data[i].payload = new Byte[_configureService.all.data[i].payload.length];
+	            configureService.all.data[i].payload = _configureService.all.data[i].payload;
+            }
+            
+            configureService.d = _configureService.d;
+            return configureService;
+        }
+        
+        @Override
+        public Local fetch(int idx) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            Local loc = new Local();
+            
+            SensorJNI.Local _loc = myProxy.fetch(idx);
+            
+            loc.f = _loc.f;
+            loc.s = new /*Shared.*/Sample();
+            loc.s.id = _loc.s.id;
+            loc.s.tag = _loc.s.tag;
+            loc.s.values = _loc.s.values;
+            loc.s.payload = _loc.s.payload;
+            loc.bits = _loc.bits;
+            return loc;
+        }
+        
+        @Override
+        public Local[] listAll() throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return null;
+                }
+            }
+            Local[] items;
+            
+            SensorJNI.Local[] _items = myProxy.listAll();
+            items = new Local[_items.length];
+            for(int i = 0; i < _items.length; i ++){
+                items[i] = new Local();
+                	
+	            items[i].f = _items[i].f;
+	            items[i].s = new /*Shared.*/Sample();
+	            items[i].s.id = _items[i].s.id;
+	            items[i].s.tag = _items[i].s.tag;
+	            items[i].s.values = _items[i].s.values;
+	            items[i].s.payload = _items[i].s.payload;
+	            items[i].bits = new Boolean[_items[i].bits.length];
+	            items[i].bits = _items[i].bits;
+            }
+            
+            return items;
+        }
+        
+        @Override
+        public void reset(boolean hard) throws RemoteException{
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            //No Return value
+            
+            myProxy.reset(hard);
+            
+            
+        }
+        
+        @Override
+        public void subscribeChanged(SensorChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.ChangedCallback.contains(callback)){
+                SensorService.ChangedCallback.add(callback);
+                if(SensorService.ChangedCallback.size() == 1){
+                    myProxy.subscribeChanged();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeChanged(SensorChangedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.ChangedCallback.contains(callback)){
+                SensorService.ChangedCallback.remove(callback);
+                if(SensorService.ChangedCallback.size() == 1){
+                    myProxy.unsubscribeChanged();
+                }
+            }
+        }
+        
+        @Override
+        public void subscribeWrapped(SensorWrappedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(!SensorService.WrappedCallback.contains(callback)){
+                SensorService.WrappedCallback.add(callback);
+                if(SensorService.WrappedCallback.size() == 1){
+                    myProxy.subscribeWrapped();
+                }
+            }
+        }
+        
+        @Override
+        public void unsubscribeWrapped(SensorWrappedCallback callback) throws RemoteException {
+            if(myProxy == null){
+                if(!proxyGeneration()){
+                    return;
+                }
+            }
+            if(SensorService.WrappedCallback.contains(callback)){
+                SensorService.WrappedCallback.remove(callback);
+                if(SensorService.WrappedCallback.size() == 1){
+                    myProxy.unsubscribeWrapped();
+                }
+            }
+        }
+        
+    };
+    private static ArrayList<SensorRawHandler> RawHandler = new ArrayList<>();
+    void AttributeRawHandle(byte[] _raw){
+        if(this.RawHandler != null){
+            byte[] raw = _raw;
+            for(SensorRawHandler handler : this.RawHandler){
+                try {
+                    handler.runRawHandler(raw);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorSampleHandler> SampleHandler = new ArrayList<>();
+    void AttributeSampleHandle(SharedJNI.Sample _sample){
+        if(this.SampleHandler != null){
+            /*Shared.*/Sample sample = new /*Shared.*/Sample();
+            sample.id = _sample.id;
+            sample.tag = _sample.tag;
+            sample.values = _sample.values;
+            sample.payload = _sample.payload;
+            for(SensorSampleHandler handler : this.SampleHandler){
+                try {
+                    handler.runSampleHandler(sample);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorWrapperHandler> WrapperHandler = new ArrayList<>();
+    void AttributeWrapperHandle(SharedJNI.Wrapper _wrapper){
+        if(this.WrapperHandler != null){
+            /*Shared.*/Wrapper wrapper = new /*Shared.*/Wrapper();
+            wrapper.first = new /*Shared.*/Sample();
+            wrapper.first.id = _wrapper.first.id;
+            wrapper.first.tag = _wrapper.first.tag;
+            wrapper.first.values = _wrapper.first.values;
+            wrapper.first.payload = _wrapper.first.payload;
+            wrapper.more = new Sample[_wrapper.more.length];
+            for(int j = 0; j < _wrapper.more.length; j++){
+                wrapper.more[j] = new Sample();	
+	            wrapper.more[j].id = _wrapper.more[j].id;
+	            wrapper.more[j].tag = _wrapper.more[j].tag;
+	            wrapper.more[j].values = new Int[_wrapper.more[j].values.length];
+	            wrapper.more[j].values = _wrapper.more[j].values;
+	            wrapper.more[j].payload = new Byte[_wrapper.more[j].payload.length];
+	            wrapper.more[j].payload = _wrapper.more[j].payload;
+            }
+            wrapper.level = _wrapper.level;
+            wrapper.flag = _wrapper.flag;
+            for(SensorWrapperHandler handler : this.WrapperHandler){
+                try {
+                    handler.runWrapperHandler(wrapper);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorSamplesHandler> SamplesHandler = new ArrayList<>();
+    void AttributeSamplesHandle(SharedJNI.Sample[] _samples){
+        if(this.SamplesHandler != null){
+            /*Shared.*/Samples samples = new /*Shared.*/Samples();
+            samples.data = new Sample[_samples.length];
+            for(int i = 0; i < _samples.length; i++){
+                //SharedJNI.Sample _samplesElement = _samples[i];
+                samples.data[i] = new Sample();
+            	
+	            samples.data[i].id = _samples[i].id;
+	            samples.data[i].tag = _samples[i].tag;
+	            samples.data[i].values = new Int[_samples[i].values.length];
+	            samples.data[i].values = _samples[i].values;
+	            samples.data[i].payload = new Byte[_samples[i].payload.length];
+	            samples.data[i].payload = _samples[i].payload;
+            }
+            for(SensorSamplesHandler handler : this.SamplesHandler){
+                try {
+                    handler.runSamplesHandler(samples);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorLevelsHandler> LevelsHandler = new ArrayList<>();
+    void AttributeLevelsHandle(long[] _levels){
+        if(this.LevelsHandler != null){
+            /*Shared.*/Levels levels = new /*Shared.*/Levels();
+            levels.data = _levels;
+            for(SensorLevelsHandler handler : this.LevelsHandler){
+                try {
+                    handler.runLevelsHandler(levels);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorLevelHandler> LevelHandler = new ArrayList<>();
+    void AttributeLevelHandle(byte _level){
+        if(this.LevelHandler != null){
+            byte level = _level;
+            for(SensorLevelHandler handler : this.LevelHandler){
+                try {
+                    handler.runLevelHandler(level);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorLocalHandler> LocalHandler = new ArrayList<>();
+    void AttributeLocalHandle(SensorJNI.Local _local){
+        if(this.LocalHandler != null){
+            /*Sensor.*/Local local = new /*Sensor.*/Local();
+            local.f = _local.f;
+            local.s = new /*Shared.*/Sample();
+            local.s.id = _local.s.id;
+            local.s.tag = _local.s.tag;
+            local.s.values = _local.s.values;
+            local.s.payload = _local.s.payload;
+            local.bits = _local.bits;
+            for(SensorLocalHandler handler : this.LocalHandler){
+                try {
+                    handler.runLocalHandler(local);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorLocalsHandler> LocalsHandler = new ArrayList<>();
+    void AttributeLocalsHandle(SensorJNI.Local[] _locals){
+        if(this.LocalsHandler != null){
+            /*Sensor.*/Locals locals = new /*Sensor.*/Locals();
+            locals.data = new Local[_locals.length];
+            for(int i = 0; i < _locals.length; i++){
+                //SensorJNI.Local _localsElement = _locals[i];
+                locals.data[i] = new Local();
+            	
+	            locals.data[i].f = _locals[i].f;
+	            locals.data[i].s = new /*Shared.*/Sample();
+	            locals.data[i].s.id = _locals[i].s.id;
+	            locals.data[i].s.tag = _locals[i].s.tag;
+	            locals.data[i].s.values = _locals[i].s.values;
+	            locals.data[i].s.payload = _locals[i].s.payload;
+	            locals.data[i].bits = new Boolean[_locals[i].bits.length];
+	            locals.data[i].bits = _locals[i].bits;
+            }
+            for(SensorLocalsHandler handler : this.LocalsHandler){
+                try {
+                    handler.runLocalsHandler(locals);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorSampleListHandler> SampleListHandler = new ArrayList<>();
+    void AttributeSampleListHandle(SharedJNI.Sample[] _sampleList){
+        if(this.SampleListHandler != null){
+            Sample[] sampleList = new Sample[_sampleList.length];
+            for(int i = 0; i < _sampleList.length; i++){
+                sampleList[i] = new Sample();
+            	
+	            sampleList[i].id = _sampleList[i].id;
+	            sampleList[i].tag = _sampleList[i].tag;
+	            sampleList[i].values = new Int[_sampleList[i].values.length];
+	            sampleList[i].values = _sampleList[i].values;
+	            sampleList[i].payload = new Byte[_sampleList[i].payload.length];
+	            sampleList[i].payload = _sampleList[i].payload;
+            }
+            for(SensorSampleListHandler handler : this.SampleListHandler){
+                try {
+                    handler.runSampleListHandler(sampleList);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorLookupHandler> LookupHandler = new ArrayList<>();
+    void AttributeLookupHandle(SharedJNI.Lookup[] _lookup){
+        if(this.LookupHandler != null){
+            Lookup[] lookup = new Lookup[_lookup.length];
+            for(int m = 0; m < _lookup.length; m++){
+                lookup[m] = new Lookup();
+                lookup[m].key = _lookup[m].key;
+                lookup[m].value = new Sample();
+                lookup[m].value.id = _lookup[m].value.id;
+                lookup[m].value.tag = _lookup[m].value.tag;
+                
+            }
+            
+            for(SensorLookupHandler handler : this.LookupHandler){
+                try {
+                    handler.runLookupHandler(lookup);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorCounterHandler> CounterHandler = new ArrayList<>();
+    void AttributeCounterHandle(long _counter){
+        if(this.CounterHandler != null){
+            long counter = _counter;
+            for(SensorCounterHandler handler : this.CounterHandler){
+                try {
+                    handler.runCounterHandler(counter);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorChangedCallback> ChangedCallback = new ArrayList<>();
+    void ChangedCallback(SharedJNI.Sample _s, byte _l, int[] _vals){
+        if(this.ChangedCallback != null){
+            Sample s = new Sample();
+            s.id = _s.id;
+            s.tag = _s.tag;
+            s.values = _s.values;
+            s.payload = _s.payload;
+			byte l = _l;
+            int[] vals = _vals;
+            for(SensorChangedCallback callback : this.ChangedCallback){
+                try {
+                    callback.onChangedReceived(s, l, vals);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+    private static ArrayList<SensorWrappedCallback> WrappedCallback = new ArrayList<>();
+    void WrappedCallback(SharedJNI.Wrapper _w){
+        if(this.WrappedCallback != null){
+            Wrapper w = new Wrapper();
+            w.first = new /*Shared.*/Sample();
+            w.first.id = _w.first.id;
+            w.first.tag = _w.first.tag;
+            w.first.values = _w.first.values;
+            w.first.payload = _w.first.payload;
+            w.more = new Sample[_w.more.length];
+            for(int j = 0; j < _w.more.length; j++){
+                w.more[j] = new Sample();	
+	            w.more[j].id = _w.more[j].id;
+	            w.more[j].tag = _w.more[j].tag;
+	            w.more[j].values = new Int[_w.more[j].values.length];
+	            w.more[j].values = _w.more[j].values;
+	            w.more[j].payload = new Byte[_w.more[j].payload.length];
+	            w.more[j].payload = _w.more[j].payload;
+            }
+            w.level = _w.level;
+            w.flag = _w.flag;
+			for(SensorWrappedCallback callback : this.WrappedCallback){
+                try {
+                    callback.onWrappedReceived(w);
+                } catch (RemoteException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+        }
+    }
+    
+}
\ No newline at end of file
@@ -0,0 +1,92 @@
+/*
+ * Minimal jni.h for the syntax checks of the generated headers: the types
+ * and the JNIEnv functions they use, with the class hierarchy of the C++
+ * jni.h, so that the casts between references are checked as well.
+ */
+#ifndef _JNI_H
+#define _JNI_H
+
+#include <cstdint>
+
+typedef unsigned char jboolean;
+typedef signed char jbyte;
+typedef unsigned short jchar;
+typedef short jshort;
+typedef int32_t jint;
+typedef int64_t jlong;
+typedef float jfloat;
+typedef double jdouble;
+typedef jint jsize;
+
+class _jobject {};
+class _jclass : public _jobject {};
+class _jstring : public _jobject {};
+class _jarray : public _jobject {};
+class _jobjectArray : public _jarray {};
+class _jbooleanArray : public _jarray {};
+class _jbyteArray : public _jarray {};
+class _jcharArray : public _jarray {};
+class _jshortArray : public _jarray {};
+class _jintArray : public _jarray {};
+class _jlongArray : public _jarray {};
+class _jfloatArray : public _jarray {};
+class _jdoubleArray : public _jarray {};
+
+typedef _jobject *jobject;
+typedef _jclass *jclass;
+typedef _jstring *jstring;
+typedef _jarray *jarray;
+typedef _jobjectArray *jobjectArray;
+typedef _jbooleanArray *jbooleanArray;
+typedef _jbyteArray *jbyteArray;
+typedef _jcharArray *jcharArray;
+typedef _jshortArray *jshortArray;
+typedef _jintArray *jintArray;
+typedef _jlongArray *jlongArray;
+typedef _jfloatArray *jfloatArray;
+typedef _jdoubleArray *jdoubleArray;
+
+struct _jmethodID;
+typedef struct _jmethodID *jmethodID;
+struct _jfieldID;
+typedef struct _jfieldID *jfieldID;
+
+#define JNI_OK 0
+#define JNI_ABORT 2
+
+#define JNI_PRIMITIVE_FUNCTIONS(Type, type) \
+    type Get##Type##Field(jobject object, jfieldID field); \
+    type##Array New##Type##Array(jsize length); \
+    void Set##Type##ArrayRegion(type##Array array, jsize start, jsize length, const type *buffer); \
+    type *Get##Type##ArrayElements(type##Array array, jboolean *isCopy); \
+    void Release##Type##ArrayElements(type##Array array, type *elements, jint mode);
+
+struct JNIEnv {
+    jclass FindClass(const char *name);
+    jclass GetObjectClass(jobject object);
+    jobject NewGlobalRef(jobject object);
+    void DeleteLocalRef(jobject object);
+    jmethodID GetMethodID(jclass clazz, const char *name, const char *signature);
+    jfieldID GetFieldID(jclass clazz, const char *name, const char *signature);
+    jobject NewObject(jclass clazz, jmethodID constructor, ...);
+    jobject CallObjectMethod(jobject object, jmethodID method, ...);
+    void CallVoidMethod(jobject object, jmethodID method, ...);
+    jobject GetObjectField(jobject object, jfieldID field);
+    jstring NewStringUTF(const char *chars);
+    const char *GetStringUTFChars(jstring string, jboolean *isCopy);
+    void ReleaseStringUTFChars(jstring string, const char *chars);
+    jsize GetArrayLength(jarray array);
+    jobjectArray NewObjectArray(jsize length, jclass clazz, jobject initial);
+    jobject GetObjectArrayElement(jobjectArray array, jsize index);
+    void SetObjectArrayElement(jobjectArray array, jsize index, jobject value);
+    JNI_PRIMITIVE_FUNCTIONS(Boolean, jboolean)
+    JNI_PRIMITIVE_FUNCTIONS(Byte, jbyte)
+    JNI_PRIMITIVE_FUNCTIONS(Char, jchar)
+    JNI_PRIMITIVE_FUNCTIONS(Short, jshort)
+    JNI_PRIMITIVE_FUNCTIONS(Int, jint)
+    JNI_PRIMITIVE_FUNCTIONS(Long, jlong)
+    JNI_PRIMITIVE_FUNCTIONS(Float, jfloat)
+    JNI_PRIMITIVE_FUNCTIONS(Double, jdouble)
+};
+
+#endif
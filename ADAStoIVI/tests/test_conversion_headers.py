@@ -0,0 +1,154 @@
+"""
+Syntax check of the generated src/<Namespace>Conversions.hpp headers with
+g++ -fsyntax-only, against tests/stubs/jni.h and CommonAPI type stubs built
+from the model. Skipped without g++.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from pyfranca import Processor, ast
+from tests.test_golden import MODELS, generate
+
+STUBS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stubs")
+GXX = shutil.which("g++")
+
+CPP_TYPES = {
+    "Int8": "int8_t", "Int16": "int16_t", "Int32": "int32_t", "Int64": "int64_t",
+    "UInt8": "uint8_t", "UInt16": "uint16_t", "UInt32": "uint32_t", "UInt64": "uint64_t",
+    "Float": "float", "Double": "double", "Boolean": "bool", "String": "std::string",
+    "ByteBuffer": "CommonAPI::ByteBuffer",
+}
+
+
+def namespace_path(namespace):
+    version = "v{}/".format(namespace.version.major) if namespace.version is not None else ""
+    return version + namespace.package.name.replace(".", "/") + "/" + namespace.name
+
+
+def cpp_name(item):
+    return "::" + namespace_path(item.namespace).replace("/", "::") + "::" + item.name
+
+
+def cpp_type(item_type):
+    if isinstance(item_type, ast.Reference):
+        return cpp_name(item_type.reference)
+    if item_type.name is None:
+        return "std::vector<{}>".format(cpp_type(item_type.type))
+    return CPP_TYPES[item_type.name]
+
+
+def local_references(item_type, namespace):
+    if isinstance(item_type, ast.Reference):
+        if item_type.reference.namespace is namespace:
+            yield item_type.reference
+    elif isinstance(item_type, ast.Array):
+        for reference in local_references(item_type.type, namespace):
+            yield reference
+
+
+def type_dependencies(item, namespace):
+    if isinstance(item, ast.Struct):
+        types = [field.type for field in item.fields.values()]
+    elif isinstance(item, ast.Array):
+        types = [item.type]
+    elif isinstance(item, ast.Map):
+        types = [item.key_type, item.value_type]
+    else:
+        types = []
+    for item_type in types:
+        for reference in local_references(item_type, namespace):
+            yield reference
+
+
+def type_stub(item):
+    if isinstance(item, ast.Enumeration):
+        return ("    struct {0} {{\n        enum Literal : uint8_t {{}};\n"
+                "        {0}(Literal value = Literal());\n"
+                "        operator uint8_t() const;\n    }};\n").format(item.name)
+    if isinstance(item, ast.Struct):
+        stub = "    struct {} {{\n".format(item.name)
+        for field in item.fields.values():
+            name = field.name[0].upper() + field.name[1:]
+            stub += "        const {0} &get{1}() const;\n        void set{1}(const {0} &value);\n".format(cpp_type(field.type), name)
+        return stub + "    };\n"
+    if isinstance(item, ast.Array):
+        return "    typedef std::vector<{}> {};\n".format(cpp_type(item.type), item.name)
+    return "    typedef std::unordered_map<{}, {}> {};\n".format(cpp_type(item.key_type), cpp_type(item.value_type), item.name)
+
+
+def namespace_stub(namespace):
+    """
+    CommonAPI types of a namespace, every type after the types of the
+        namespace it depends on.
+    """
+    items = list(namespace.enumerations.values()) + list(namespace.structs.values()) + \
+        list(namespace.arrays.values()) + list(namespace.maps.values())
+    ordered = []
+
+    def visit(item):
+        if item in ordered:
+            return
+        for dependency in type_dependencies(item, namespace):
+            visit(dependency)
+        ordered.append(item)
+    for item in items:
+        visit(item)
+    parts = namespace_path(namespace).split("/")
+    stub = "".join("namespace {} {{\n".format(part) for part in parts[:-1])
+    stub += "struct {} {{\n".format(parts[-1]) + "".join(type_stub(item) for item in ordered) + "};\n"
+    return stub + "}" * (len(parts) - 1) + "\n"
+
+
+def write_commonapi_stubs(packages, directory):
+    """
+    Write the CommonAPI type headers the conversion headers include, all of
+        them include one header with the types of every namespace.
+    """
+    types = "#pragma once\n#include <cstdint>\n#include <string>\n#include <unordered_map>\n#include <vector>\n"
+    types += "namespace CommonAPI {\ntypedef std::vector<uint8_t> ByteBuffer;\n}\n"
+    for package in packages.values():
+        for namespace in list(package.typecollections.values()) + list(package.interfaces.values()):
+            types += namespace_stub(namespace)
+            path = os.path.join(directory, namespace_path(namespace) + ".hpp")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("#include \"commonapi_types.hpp\"\n")
+    with open(os.path.join(directory, "commonapi_types.hpp"), "w") as f:
+        f.write(types)
+
+
+@unittest.skipIf(GXX is None, "g++ not found")
+class TestConversionHeaders(unittest.TestCase):
+    """The generated conversion headers compile against the stubs."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_syntax(self):
+        for name, fspec in MODELS:
+            with self.subTest(model=name):
+                output_dir = os.path.join(self.tmp_dir, name)
+                stub_dir = os.path.join(self.tmp_dir, name + "_stubs")
+                self.assertTrue(generate(fspec, output_dir))
+                processor = Processor()
+                processor.import_files([fspec])
+                write_commonapi_stubs(processor.packages, stub_dir)
+                src_dir = os.path.join(output_dir, "src")
+                headers = sorted(header for header in os.listdir(src_dir) if header.endswith("Conversions.hpp"))
+                self.assertTrue(headers)
+                for header in headers:
+                    result = subprocess.run([GXX, "-std=c++14", "-fsyntax-only", "-Wall", "-Werror", "-x", "c++",
+                                             "-I", STUBS_DIR, "-I", stub_dir, "-I", src_dir, os.path.join(src_dir, header)],
+                                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+                    self.assertEqual(result.returncode, 0, "{}:\n{}".format(header, result.stdout))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+"""
+Tests of fidl_module_converter type classification.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+import fidl_module_converter as fidl
+import sdvgen_cli
+from pyfranca import Processor, ast
+
+FIDL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fidl")
+RICH_FIDL = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "pyfranca", "tests", "fidl", "Rich.fidl")
+
+
+def typed_elements(packages):
+    """
+    Typed elements and map types of the packages with the type they have.
+    """
+    for package in packages.values():
+        for namespace in list(package.typecollections.values()) + list(package.interfaces.values()):
+            for struct in namespace.structs.values():
+                for field in struct.fields.values():
+                    yield field, field.type
+            for item in namespace.maps.values():
+                yield item, item.value_type
+            if isinstance(namespace, ast.Interface):
+                for attribute in namespace.attributes.values():
+                    yield attribute, attribute.type
+                for method in namespace.methods.values():
+                    for arg in list(method.in_args.values()) + list(method.out_args.values()):
+                        yield arg, arg.type
+                for broadcast in namespace.broadcasts.values():
+                    for arg in broadcast.out_args.values():
+                        yield arg, arg.type
+
+
+class TestByteBuffer(unittest.TestCase):
+    """ByteBuffer is generated as an implicit UInt8 array."""
+
+    def setUp(self):
+        self.fspec = os.path.join(FIDL_DIR, "Bytes.fidl")
+        self.processor = Processor()
+        self.processor.import_files([self.fspec])
+        self.packages = self.processor.packages
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_descriptor(self):
+        fidl.annotate_types(self.packages)
+        codec = self.packages["org.example.bytes"].interfaces["Codec"]
+        attribute = codec.attributes["buffer"]
+        descriptor = fidl.type_descriptor(attribute)
+        self.assertIsInstance(attribute.type, ast.ByteBuffer)
+        self.assertEqual(descriptor.code, 5)
+        self.assertIs(descriptor.type, fidl.BYTE_BUFFER_TYPE)
+        self.assertIs(fidl.element_type(attribute), fidl.BYTE_BUFFER_TYPE)
+        self.assertEqual(descriptor.element_spelling.name, "UInt8")
+        self.assertTrue(descriptor.unsigned)
+
+    def test_generate_keeps_model(self):
+        before = [(element, element_type) for element, element_type in typed_elements(self.packages)]
+        self.assertTrue(any(isinstance(element_type, ast.ByteBuffer) for _, element_type in before))
+        args = sdvgen_cli.parse_command_line(["fidl", "-J", "com.example.gen", "-O", self.tmp_dir, self.fspec])
+        with redirect_stdout(StringIO()):
+            self.assertTrue(fidl.generate(self.packages, args))
+        after = list(typed_elements(self.packages))
+        self.assertEqual(len(after), len(before))
+        for (element, element_type), (_, current) in zip(before, after):
+            self.assertIs(current, element_type, element.name)
+
+
+class TestMemoizedSnippet(unittest.TestCase):
+    """Cached emitter output is rendered with the prefix of every call."""
+
+    def setUp(self):
+        fidl.clear_conversion_snippets()
+        self.calls = []
+
+        @fidl.memoized_snippet("prefix")
+        def emitter(element, prefix="", upper=False):
+            self.calls.append(prefix)
+            if prefix == "":
+                return "{}Value = get();".format(element), "// ωΩ"
+            name = fidl.capitalize_first_letter(prefix) if upper else prefix
+            return "{}{}Value = get{}();".format(name, element, fidl.capitalize_first_letter(prefix)), "// ωΩ"
+        self.emitter = emitter
+
+    def tearDown(self):
+        fidl.clear_conversion_snippets()
+
+    def test_render(self):
+        self.assertEqual(self.emitter("X", "speed"), ("speedXValue = getSpeed();", "// ωΩ"))
+        self.assertEqual(self.emitter("X", "gear", True), ("GearXValue = getGear();", "// ωΩ"))
+        self.assertEqual(self.emitter("X", "rpm"), ("rpmXValue = getRpm();", "// ωΩ"))
+        self.assertEqual(self.emitter("X", "Rpm"), ("RpmXValue = getRpm();", "// ωΩ"))
+        self.assertEqual(self.emitter("X"), ("XValue = get();", "// ωΩ"))
+        self.assertEqual(len(self.calls), 4)
+
+    def test_uncached_prefix(self):
+        self.assertEqual(self.emitter("X", "_raw"), ("_rawXValue = get_raw();", "// ωΩ"))
+        self.assertEqual(self.emitter("X", "_raw"), ("_rawXValue = get_raw();", "// ωΩ"))
+        self.assertEqual(self.calls, ["_raw", "_raw"])
+
+    def test_renamed_namespace(self):
+        @fidl.memoized_snippet()
+        def emitter(interface):
+            self.calls.append(interface.name)
+            return "{}JNI".format(interface.name)
+        interface = ast.Interface("Base")
+        interface.package = ast.Package("org.example")
+        self.assertEqual(emitter(interface), "BaseJNI")
+        interface.name = "Derived"
+        self.assertEqual(emitter(interface), "DerivedJNI")
+        self.assertEqual(self.calls, ["Base", "Derived"])
+
+    def test_profiled_nesting(self):
+        @fidl.memoized_snippet("prefix")
+        @fidl.profiled_recursion
+        def complex_array(levels, prefix=""):
+            self.calls.append(levels)
+            inner = complex_array(levels - 1, prefix + "Item") if levels > 1 else ""
+            return "{}Array[{}]".format(prefix, inner)
+        profile = fidl.start_profile()
+        try:
+            records = []
+            for name in ["first", "second"]:
+                record = fidl.ProfileRecord(name, "attribute")
+                profile.stack.append(record)
+                self.assertEqual(complex_array(3, name), "{0}Array[{0}ItemArray[{0}ItemItemArray[]]]".format(name))
+                profile.stack.pop()
+                records.append(record)
+        finally:
+            fidl.stop_profile()
+        self.assertEqual(self.calls, [3, 2, 1])
+        self.assertEqual([record.depth["complex_array"] for record in records], [3, 3])
+
+
+class TestProfile(unittest.TestCase):
+    """The --profile report of a generation."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def profile(self, fspec):
+        profile_path = os.path.join(self.tmp_dir, "profile.json")
+        processor = Processor()
+        processor.import_files([fspec])
+        args = sdvgen_cli.parse_command_line(["fidl", "-J", "com.example.gen", "-O", self.tmp_dir,
+                                              "--profile", profile_path, fspec])
+        with redirect_stdout(StringIO()):
+            fidl.generate(processor.packages, args)
+        with open(profile_path) as f:
+            report = json.load(f)
+        return dict((record["name"], record) for record in report["interfaces"])
+
+    def assertRecord(self, record, kinds):
+        self.assertIn(record["kind"], kinds)
+        fields = ["name", "kind", "seconds", "bytes", "calls", "depth"]
+        if record["kind"] in ("interface", "typecollection"):
+            fields.append("members")
+        self.assertEqual(list(record), fields)
+        self.assertIsInstance(record["name"], str)
+        self.assertGreaterEqual(record["seconds"], 0.0)
+        self.assertGreaterEqual(record["bytes"], 0)
+        self.assertGreaterEqual(record["calls"], 0)
+        self.assertEqual(sorted(record["depth"]), sorted(fidl.RECURSIVE_EMITTERS))
+
+    def test_schema(self):
+        profile_path = os.path.join(self.tmp_dir, "profile.json")
+        interfaces = self.profile(RICH_FIDL)
+        with open(profile_path) as f:
+            report = json.load(f)
+        self.assertEqual(list(report), ["seconds", "bytes", "interfaces"])
+        self.assertEqual(report["bytes"], sum(record["bytes"] for record in report["interfaces"]))
+        for record in report["interfaces"]:
+            self.assertRecord(record, ("interface", "typecollection"))
+            for member in record["members"]:
+                self.assertRecord(member, ("attribute", "method", "broadcast", "conversions"))
+            self.assertLessEqual(sum(member["bytes"] for member in record["members"]), record["bytes"])
+        sensor = interfaces["org.example.rich.Sensor"]
+        self.assertEqual(sensor["calls"], 2) # AIDL and native client
+        members = dict((member["name"], member) for member in sensor["members"])
+        # AIDL handler, native client and JNI class of the wrapper attribute
+        self.assertEqual(members["wrapper"]["calls"], 3)
+        self.assertGreater(members["wrapper"]["bytes"], 0)
+        self.assertEqual(members["configure"]["kind"], "method")
+        self.assertGreater(members["configure"]["depth"]["struct_fields_set_gen"], 0)
+
+    def test_nested_struct_depth(self):
+        interfaces = self.profile(RICH_FIDL)
+        members = dict((member["name"], member) for member in interfaces["org.example.rich.Sensor"]["members"])
+        # Wrapper { Sample first, Sample[] more }, Sample holds no struct
+        self.assertEqual(members["wrapper"]["depth"],
+                         {"struct_fields_sub_gen": 2, "struct_fields_set_gen": 2, "complex_array": 1})
+        self.assertEqual(members["raw"]["depth"],
+                         {"struct_fields_sub_gen": 0, "struct_fields_set_gen": 0, "complex_array": 0})
+
+    def test_conversions_record(self):
+        interfaces = self.profile(RICH_FIDL)
+        shared = interfaces["org.example.rich.Shared"]
+        self.assertEqual(shared["kind"], "typecollection")
+        conversions = [member for member in shared["members"] if member["kind"] == "conversions"]
+        self.assertEqual([member["name"] for member in conversions], ["SharedConversions"])
+        self.assertGreater(conversions[0]["bytes"], 0)
+        self.assertGreater(conversions[0]["depth"]["struct_fields_sub_gen"], 0)
+        self.assertLessEqual(conversions[0]["bytes"], shared["bytes"])
+
+
+class TestGeneratorContext(unittest.TestCase):
+    """The incremental generation hash covers every generator module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.generator_sources = fidl.generator_sources
+        self.generator_digest = fidl.generator_digest
+
+    def tearDown(self):
+        fidl.generator_sources = self.generator_sources
+        fidl.generator_digest = self.generator_digest
+        shutil.rmtree(self.tmp_dir)
+
+    def test_sources(self):
+        names = [os.path.relpath(path, os.path.dirname(fidl.__file__)) for path in fidl.generator_sources()]
+        for name in ["fidl_module_converter.py", "converter_common.py",
+                     os.path.join("pyfranca", "ast.py"), os.path.join("pyfranca", "franca_processor.py")]:
+            self.assertIn(name, names)
+
+    def test_source_change(self):
+        sources = []
+        for path in self.generator_sources():
+            copy = os.path.join(self.tmp_dir, "{}_{}".format(len(sources), os.path.basename(path)))
+            shutil.copyfile(path, copy)
+            sources.append(copy)
+        fidl.generator_sources = lambda: sources
+        fidl.generator_digest = None
+        before = fidl.generator_context({}, "src")
+        with open(sources[-1], "a") as f:
+            f.write("\n# changed\n")
+        fidl.generator_digest = None
+        self.assertNotEqual(fidl.generator_context({}, "src"), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
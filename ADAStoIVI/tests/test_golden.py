@@ -0,0 +1,169 @@
+"""
+Golden output tests of the FIDL generator: the generated files of the
+representative models must match tests/golden byte for byte.
+
+After an intended change of the output, regenerate the golden files with
+
+    python tests/test_golden.py --update
+"""
+
+import filecmp
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from collections import OrderedDict
+from contextlib import redirect_stdout
+from io import StringIO
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TESTS_DIR)
+sys.path.insert(0, ROOT)
+
+import fidl_module_converter as fidl
+import sdvgen_cli
+from pyfranca import Processor
+
+GOLDEN_DIR = os.path.join(TESTS_DIR, "golden")
+
+# Golden directory name and model of every representative FIDL.
+MODELS = [
+    ("Bytes", os.path.join(TESTS_DIR, "fidl", "Bytes.fidl")),
+    ("Rich", os.path.join(ROOT, "pyfranca", "tests", "fidl", "Rich.fidl")),
+    ("Inherit", os.path.join(TESTS_DIR, "fidl", "Inherit.fidl")),
+]
+
+
+def generate(fspec, output_dir, jobs=1, options=()):
+    """
+    Generate the AIDL, JNI/C++ and Service files of a model as the fidl
+        command does.
+
+    :param options: More arguments of the fidl command.
+    """
+    processor = Processor()
+    processor.import_files([fspec])
+    args = sdvgen_cli.parse_command_line(["fidl", "-J", "com.example.gen", "-O", output_dir, "-j", str(jobs)] + list(options) + [fspec])
+    with redirect_stdout(StringIO()):
+        return fidl.generate(processor.packages, args, sdvgen_cli.TARGETS[args.target])
+
+
+def relative_files(directory):
+    files = []
+    for current, _, names in os.walk(directory):
+        for name in names:
+            files.append(os.path.relpath(os.path.join(current, name), directory))
+    return sorted(files)
+
+
+def update_golden():
+    for name, fspec in MODELS:
+        golden = os.path.join(GOLDEN_DIR, name)
+        shutil.rmtree(golden, ignore_errors=True)
+        generate(fspec, golden)
+
+
+def assert_same_tree(test, expected, actual):
+    files = relative_files(expected)
+    test.assertTrue(files)
+    test.assertEqual(relative_files(actual), files)
+    _, mismatch, errors = filecmp.cmpfiles(expected, actual, files, shallow=False)
+    test.assertEqual(mismatch + errors, [])
+
+
+class TestGolden(unittest.TestCase):
+    """Compare the generated files with the golden files."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_models(self):
+        for name, fspec in MODELS:
+            with self.subTest(model=name):
+                output_dir = os.path.join(self.tmp_dir, name)
+                self.assertTrue(generate(fspec, output_dir))
+                assert_same_tree(self, os.path.join(GOLDEN_DIR, name), output_dir)
+
+    def test_jobs(self):
+        # The fork pool of -j 2 writes the same files as the serial generation,
+        # models with one interface (Bytes, Rich) stay serial, Inherit has four
+        for name, fspec in MODELS:
+            with self.subTest(model=name):
+                output_dir = os.path.join(self.tmp_dir, name)
+                self.assertTrue(generate(fspec, output_dir, jobs=2))
+                assert_same_tree(self, os.path.join(GOLDEN_DIR, name), output_dir)
+
+    def test_stream(self):
+        # Streaming writes the same bytes, each converter on its own as well
+        for name, fspec in MODELS:
+            with self.subTest(model=name):
+                output_dir = os.path.join(self.tmp_dir, name)
+                self.assertTrue(generate(fspec, output_dir, options=["--stream"]))
+                assert_same_tree(self, os.path.join(GOLDEN_DIR, name), output_dir)
+                for target in ("aidl", "client"):
+                    target_dir = os.path.join(self.tmp_dir, name + "-" + target)
+                    self.assertTrue(generate(fspec, target_dir, options=["--stream", "-T", target]))
+                    expected = relative_files(target_dir)
+                    self.assertTrue(expected)
+                    _, mismatch, errors = filecmp.cmpfiles(os.path.join(GOLDEN_DIR, name), target_dir, expected, shallow=False)
+                    self.assertEqual(mismatch + errors, [])
+                    self.assertEqual(target == "aidl", all(path.startswith("aidl") for path in expected))
+
+    def test_inheritance_jobs(self):
+        # The inherited members do not depend on which derived interface is generated first
+        fspec = dict(MODELS)["Inherit"]
+        serial = os.path.join(self.tmp_dir, "serial")
+        parallel = os.path.join(self.tmp_dir, "parallel")
+        self.assertTrue(generate(fspec, serial, jobs=1))
+        self.assertTrue(generate(fspec, parallel, jobs=4))
+        assert_same_tree(self, serial, parallel)
+
+    def test_virtual_output(self):
+        # The in-memory files are the files written to disk
+        for name, fspec in MODELS:
+            with self.subTest(model=name):
+                processor = Processor()
+                processor.import_files([fspec])
+                golden = os.path.join(GOLDEN_DIR, name)
+                with redirect_stdout(StringIO()):
+                    fidl.annotate_types(processor.packages)
+                    files = fidl.generate_aidl_and_src_client_files(processor.packages, "JNI_VERSION_1_6", "com.example.gen")
+                self.assertEqual(sorted(path.replace("/", os.sep) for path in files), relative_files(golden))
+                for path, text in files.items():
+                    with open(os.path.join(golden, path), "r", encoding="utf-8") as f:
+                        self.assertEqual(text, f.read(), path)
+                output = fidl.VirtualOutput()
+                output.files.update(files)
+                output_dir = os.path.join(self.tmp_dir, name)
+                self.assertEqual(sorted(output.write(output_dir)), sorted(files))
+                assert_same_tree(self, golden, output_dir)
+                # Unchanged files are not written again
+                self.assertEqual(output.write(output_dir), [])
+
+    def test_aidl_and_src_client(self):
+        # Option 2 writes the files of convert_to_aidl and convert_to_src_client, streamed or not
+        for name, fspec in MODELS:
+            processor = Processor()
+            processor.import_files([fspec])
+            with redirect_stdout(StringIO()):
+                fidl.annotate_types(processor.packages)
+                expected = OrderedDict(fidl.generate_aidl_files(processor.packages, "com.example.gen"))
+                expected.update(fidl.generate_src_client_files(processor.packages, "JNI_VERSION_1_6", "com.example.gen"))
+                for stream in (False, True):
+                    with self.subTest(model=name, stream=stream):
+                        streamed = OrderedDict()
+                        files = fidl.generate_aidl_and_src_client_files(processor.packages, "JNI_VERSION_1_6", "com.example.gen",
+                                                                       sink=streamed.__setitem__ if stream else None)
+                        # Streamed files come in generation order
+                        self.assertEqual(dict(streamed if stream else files), dict(expected))
+
+
+if __name__ == "__main__":
+    if "--update" in sys.argv:
+        update_golden()
+    else:
+        unittest.main()
@@ -0,0 +1,135 @@
+"""
+Tests of the sdvgen_cli.py command line: argument parsing, --connect without
+a daemon, and SDVGen.py -C, which runs it without the GUI.
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from tests.test_golden import GOLDEN_DIR, MODELS, ROOT, assert_same_tree
+
+import sdvgen_cli
+
+# Runs SDVGen.main with the arguments, exits with 3 if the GUI was imported.
+SDVGEN = """
+import sys
+import SDVGen
+status = SDVGen.main()
+sys.exit(3 if "tkinter" in sys.modules or "sdvgen_gui" in sys.modules else status)
+"""
+
+
+class TestParseCommandLine(unittest.TestCase):
+    """sdvgen_cli.parse_command_line"""
+
+    def parse_error(self, argv):
+        with redirect_stderr(io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit) as raised:
+                sdvgen_cli.parse_command_line(argv)
+        self.assertEqual(raised.exception.code, 2)
+        return stderr.getvalue()
+
+    def test_commands(self):
+        commands = [
+            (["arxml", "-P", "org.example", "Sensor.arxml"], sdvgen_cli.run_arxml),
+            (["fidl", "-J", "com.example.gen", "Sensor.fidl"], sdvgen_cli.run_fidl),
+            (["pipeline", "-J", "com.example.gen", "Sensor.arxml"], sdvgen_cli.run_pipeline),
+            (["serve", "--socket", "/tmp/sdvgen.sock"], sdvgen_cli.run_serve),
+        ]
+        for argv, run in commands:
+            with self.subTest(command=argv[0]):
+                args = sdvgen_cli.parse_command_line(argv)
+                self.assertEqual(args.command, argv[0])
+                self.assertIs(args.run, run)
+        self.parse_error([])
+        self.parse_error(["convert", "Sensor.fidl"])
+
+    def test_fidl_defaults(self):
+        args = sdvgen_cli.parse_command_line(["fidl", "-J", "com.example.gen", "A.fidl", "B.fidl"])
+        self.assertEqual(args.fidl, ["A.fidl", "B.fidl"])
+        self.assertEqual(args.packagejava, "com.example.gen")
+        self.assertEqual(args.jniversion, "JNI_VERSION_1_6")
+        self.assertEqual(args.output_dir, "outputs")
+        self.assertEqual(args.target, "all")
+        self.assertEqual(args.jobs, 1)
+        self.assertIsNone(args.connect)
+
+    def test_required(self):
+        self.assertIn("-J", self.parse_error(["fidl", "Sensor.fidl"]))
+        self.assertIn("-J", self.parse_error(["pipeline", "Sensor.arxml"]))
+        self.parse_error(["fidl", "-J", "com.example.gen"])
+        self.parse_error(["serve"])
+
+    def test_jni_version(self):
+        for version, expected in [("1_8", "JNI_VERSION_1_8"), ("JNI_VERSION_1_8", "JNI_VERSION_1_8"),
+                                  ("21", "JNI_VERSION_21")]:
+            with self.subTest(version=version):
+                args = sdvgen_cli.parse_command_line(["fidl", "-V", version, "-J", "com.example.gen", "Sensor.fidl"])
+                self.assertEqual(args.jniversion, expected)
+        self.assertIn("unknown JNI version", self.parse_error(["fidl", "-V", "1_7", "-J", "com.example.gen", "Sensor.fidl"]))
+
+    def test_target(self):
+        for target, option in sdvgen_cli.TARGETS.items():
+            args = sdvgen_cli.parse_command_line(["fidl", "-T", target, "-J", "com.example.gen", "Sensor.fidl"])
+            self.assertEqual(sdvgen_cli.TARGETS[args.target], option)
+        self.parse_error(["fidl", "-T", "java", "-J", "com.example.gen", "Sensor.fidl"])
+
+    def test_connect(self):
+        args = sdvgen_cli.parse_command_line(["--connect", "/tmp/sdvgen.sock", "fidl", "-J", "com.example.gen", "Sensor.fidl"])
+        self.assertEqual(args.connect, "/tmp/sdvgen.sock")
+        self.parse_error(["--connect", "/tmp/sdvgen.sock", "serve", "--socket", "/tmp/other.sock"])
+        self.parse_error(["--connect", "/tmp/sdvgen.sock", "fidl", "--watch", "-J", "com.example.gen", "Sensor.fidl"])
+
+
+class TestMain(unittest.TestCase):
+    """sdvgen_cli.main and SDVGen.py -C"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.tmp_dir, "Bytes")
+        self.argv = ["fidl", "-J", "com.example.gen", "-O", self.output_dir, dict(MODELS)["Bytes"]]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_connect_fallback(self):
+        # No daemon on the socket, the command runs in this process
+        socket_path = os.path.join(self.tmp_dir, "missing.sock")
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()) as stderr:
+            status = sdvgen_cli.main(["--connect", socket_path] + self.argv)
+        self.assertEqual(status, 0)
+        self.assertIn("No daemon on {}".format(socket_path), stderr.getvalue())
+        assert_same_tree(self, os.path.join(GOLDEN_DIR, "Bytes"), self.output_dir)
+
+    def test_status(self):
+        with redirect_stdout(io.StringIO()) as stdout:
+            status = sdvgen_cli.main(["fidl", "-J", "com.example.gen", "-O", self.output_dir,
+                                      os.path.join(self.tmp_dir, "Missing.fidl")])
+        self.assertEqual(status, 1)
+        self.assertIn("ERROR", stdout.getvalue())
+
+    def run_sdvgen(self, argv):
+        return subprocess.run([sys.executable, "-c", SDVGEN] + argv, cwd=ROOT,
+                              stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+
+    def test_sdvgen_cli(self):
+        process = self.run_sdvgen(["-C"] + self.argv)
+        self.assertEqual(process.returncode, 0, process.stdout)
+        assert_same_tree(self, os.path.join(GOLDEN_DIR, "Bytes"), self.output_dir)
+
+    def test_sdvgen_cli_help(self):
+        process = self.run_sdvgen(["-C", "--help"])
+        self.assertEqual(process.returncode, 0, process.stdout)
+        self.assertIn("usage: sdvgen", process.stdout)
+        process = self.run_sdvgen(["-C", "fidl", "Sensor.fidl"])
+        self.assertEqual(process.returncode, 2, process.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
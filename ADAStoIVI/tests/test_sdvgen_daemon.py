@@ -0,0 +1,122 @@
+"""
+Tests of the sdvgen_cli.py serve daemon: requests sent with
+sdvgen_daemon.request produce the golden files, concurrently and after a
+model changed. POSIX only.
+"""
+
+import json
+import os
+import shutil
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from tests.test_golden import GOLDEN_DIR, MODELS, ROOT, assert_same_tree
+
+import sdvgen_daemon
+
+STARTUP_TIMEOUT = 30.0
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX") and hasattr(os, "fork"), "POSIX only")
+class TestDaemon(unittest.TestCase):
+    """Run requests in a daemon started with sdvgen_cli.py serve."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.tmp_dir, "sdvgen.sock")
+        self.daemon = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "sdvgen_cli.py"), "serve",
+             "--socket", self.socket_path, "--max-requests", "2"],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while not os.path.exists(self.socket_path):
+            self.assertIsNone(self.daemon.poll(), "daemon exited")
+            self.assertLess(time.monotonic(), deadline, "daemon did not start")
+            time.sleep(0.05)
+
+    def tearDown(self):
+        self.daemon.terminate()
+        self.daemon.wait()
+        shutil.rmtree(self.tmp_dir)
+
+    def fidl(self, fspec, output_dir):
+        return sdvgen_daemon.request(self.socket_path, [
+            "fidl", "-J", "com.example.gen", "-O", output_dir, fspec])
+
+    def test_round_trip(self):
+        output_dir = os.path.join(self.tmp_dir, "Bytes")
+        response = self.fidl(dict(MODELS)["Bytes"], output_dir)
+        self.assertEqual(response["status"], 0, response["output"])
+        assert_same_tree(self, os.path.join(GOLDEN_DIR, "Bytes"), output_dir)
+
+    def test_socket_mode(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+
+    def test_malformed_request(self):
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(self.socket_path)
+            client.sendall(b"{not json")
+            client.shutdown(socket.SHUT_WR)
+            response = json.loads(sdvgen_daemon.receive(client).decode("utf-8"))
+        finally:
+            client.close()
+        self.assertEqual(response["status"], 1)
+        self.assertIn("Invalid request", response["output"])
+
+    def test_concurrent_requests(self):
+        # A client that has not sent its request yet does not block the others
+        idle = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        idle.connect(self.socket_path)
+        responses = {}
+
+        def run(name, fspec):
+            responses[name] = self.fidl(fspec, os.path.join(self.tmp_dir, name))
+
+        try:
+            threads = [threading.Thread(target=run, args=model) for model in MODELS]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            idle.close()
+        for name, _ in MODELS:
+            with self.subTest(model=name):
+                self.assertEqual(responses[name]["status"], 0, responses[name]["output"])
+                assert_same_tree(self, os.path.join(GOLDEN_DIR, name), os.path.join(self.tmp_dir, name))
+
+    def test_reload_after_change(self):
+        fspec = os.path.join(self.tmp_dir, "Bytes.fidl")
+        shutil.copyfile(dict(MODELS)["Bytes"], fspec)
+        output_dir = os.path.join(self.tmp_dir, "Bytes")
+        self.assertEqual(self.fidl(fspec, output_dir)["status"], 0)
+        handler = os.path.join(output_dir, "aidl", "CodecCounterHandler.aidl")
+        self.assertFalse(os.path.exists(handler))
+        # The daemon refreshes its Processor after the request, wait for it
+        time.sleep(0.5)
+        with open(fspec, "r") as f:
+            fidl = f.read()
+        with open(fspec, "w") as f:
+            f.write(fidl.replace("    attribute ByteBuffer buffer\n",
+                                 "    attribute ByteBuffer buffer\n    attribute UInt32 counter\n"))
+        response = self.fidl(fspec, output_dir)
+        self.assertEqual(response["status"], 0, response["output"])
+        self.assertTrue(os.path.exists(handler))
+        # And back, the output matches the golden files again
+        with open(fspec, "w") as f:
+            f.write(fidl)
+        shutil.rmtree(output_dir)
+        response = self.fidl(fspec, output_dir)
+        self.assertEqual(response["status"], 0, response["output"])
+        assert_same_tree(self, os.path.join(GOLDEN_DIR, "Bytes"), output_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests of --watch with the polling backend, which every platform falls back
+to: changes of a model within the debounce window are generated once.
+"""
+
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from tests.test_golden import MODELS, ROOT
+
+import sdvgen_watch
+
+# Runs sdvgen_cli with the PollingWatcher instead of inotify.
+POLLING_CLI = """
+import sys
+import sdvgen_cli, sdvgen_watch
+sdvgen_watch.create_watcher = sdvgen_watch.PollingWatcher
+sys.exit(sdvgen_cli.main(sys.argv[1:]))
+"""
+
+DEBOUNCE = 1.0
+POLL_INTERVAL = 0.05
+TIMEOUT = 30.0
+
+
+def add_attribute(fspec, name):
+    with open(fspec, "r") as f:
+        fidl = f.read()
+    with open(fspec, "w") as f:
+        f.write(fidl.replace("    attribute ByteBuffer buffer\n",
+                             "    attribute ByteBuffer buffer\n    attribute UInt32 {}\n".format(name)))
+
+
+class TestPollingWatcher(unittest.TestCase):
+    """PollingWatcher.wait and the watch cycles of sdvgen_cli --watch."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fspec = os.path.join(self.tmp_dir, "Bytes.fidl")
+        shutil.copyfile(dict(MODELS)["Bytes"], self.fspec)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_wait(self):
+        watcher = sdvgen_watch.PollingWatcher(POLL_INTERVAL)
+        watcher.watch([self.fspec], [], time.time() + 1)
+        self.assertEqual(watcher.pending, set())
+
+        def edit():
+            for index in range(3):
+                time.sleep(0.1)
+                add_attribute(self.fspec, "counter{}".format(index))
+
+        editor = threading.Thread(target=edit)
+        start = time.monotonic()
+        editor.start()
+        changed = watcher.wait(0.5)
+        editor.join()
+        self.assertEqual(changed, {os.path.realpath(self.fspec)})
+        # Returned only after the last edit stayed unchanged for the debounce
+        self.assertGreaterEqual(time.monotonic() - start, 0.3 + 0.5)
+        self.assertEqual(watcher.poll(0.2), set())
+
+    def test_one_cycle_per_debounce(self):
+        output_dir = os.path.join(self.tmp_dir, "outputs")
+        process = subprocess.Popen(
+            [sys.executable, "-u", "-c", POLLING_CLI, "fidl", "--watch",
+             "--debounce", str(DEBOUNCE), "--poll-interval", str(POLL_INTERVAL),
+             "-J", "com.example.gen", "-O", output_dir, self.fspec],
+            cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        lines = queue.Queue()
+        reader = threading.Thread(target=lambda: [lines.put(line) for line in process.stdout])
+        reader.start()
+        output = []
+
+        def read_until_watching():
+            deadline = time.monotonic() + TIMEOUT
+            while True:
+                line = lines.get(timeout=max(0, deadline - time.monotonic()))
+                output.append(line)
+                if line.startswith("Watching"):
+                    return
+
+        try:
+            read_until_watching()
+            # Three saves within one debounce window
+            for index in range(3):
+                add_attribute(self.fspec, "counter{}".format(index))
+                time.sleep(DEBOUNCE / 4)
+            read_until_watching()
+            time.sleep(DEBOUNCE * 2)
+        finally:
+            process.send_signal(signal.SIGINT)
+            process.wait(TIMEOUT)
+            reader.join()
+        while not lines.empty():
+            output.append(lines.get())
+        cycles = [line for line in output if line.startswith("Cycle")]
+        self.assertEqual(len(cycles), 2, "".join(output))
+        self.assertTrue(cycles[1].startswith("Cycle 2 (Bytes.fidl)"), cycles[1])
+        for index in range(3):
+            self.assertTrue(os.path.exists(os.path.join(output_dir, "aidl", "CodecCounter{}Handler.aidl".format(index))))
+
+
+if __name__ == "__main__":
+    unittest.main()
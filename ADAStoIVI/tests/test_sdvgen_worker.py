@@ -0,0 +1,83 @@
+"""
+Headless tests of sdvgen_worker.ConversionQueue, which runs the conversions
+of the GUI in worker processes.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from tests.test_golden import GOLDEN_DIR, MODELS, assert_same_tree
+
+import sdvgen_worker
+
+TIMEOUT = 60.0
+
+
+class TestConversionQueue(unittest.TestCase):
+    """Queue, cancel and events of the worker processes."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.events = []
+        self.conversions = sdvgen_worker.ConversionQueue(
+            lambda title, kind, value: self.events.append((title, kind, value)))
+
+    def tearDown(self):
+        self.conversions.cancel()
+        shutil.rmtree(self.tmp_dir)
+
+    def argv(self, name):
+        return ["fidl", "-J", "com.example.gen", "-O", os.path.join(self.tmp_dir, name), dict(MODELS)[name]]
+
+    def wait(self):
+        deadline = time.monotonic() + TIMEOUT
+        while self.conversions.poll():
+            self.assertLess(time.monotonic(), deadline, "conversion did not finish")
+            time.sleep(0.05)
+
+    def of(self, title, kind):
+        return [value for event_title, event_kind, value in self.events
+                if event_title == title and event_kind == kind]
+
+    def test_cancel_first(self):
+        self.conversions.add("first", self.argv("Rich"))
+        self.conversions.add("second", self.argv("Bytes"))
+        self.assertEqual(self.conversions.current, "first")
+        self.assertEqual(len(self.conversions.queued), 1)
+        self.assertEqual(self.conversions.cancel(queued=False), 0)
+        self.assertEqual(self.conversions.current, "second")
+        self.wait()
+        self.assertEqual(self.of("first", "finished"), ["Cancelled"])
+        self.assertEqual(self.of("second", "finished"), ["Done"])
+        self.assertEqual(self.events[-1], ("second", "finished", "Done"))
+        assert_same_tree(self, os.path.join(GOLDEN_DIR, "Bytes"), os.path.join(self.tmp_dir, "Bytes"))
+        progress = self.of("second", "progress")
+        phases = [item["phase"] for item in progress]
+        self.assertIn("parse", phases)
+        self.assertEqual(progress[0]["file"], "Bytes.fidl")
+        generation = [item for item in progress if item["total"]]
+        self.assertTrue(generation)
+        self.assertEqual(max(item["done"] for item in generation), generation[-1]["total"])
+        self.assertTrue(self.of("second", "output"))
+
+    def test_cancel_queued(self):
+        self.conversions.add("first", self.argv("Rich"))
+        self.conversions.add("second", self.argv("Bytes"))
+        self.assertEqual(self.conversions.cancel(), 1)
+        self.assertIsNone(self.conversions.current)
+        self.assertFalse(self.conversions.poll())
+        self.assertEqual([kind for _, kind, _ in self.events], ["started", "finished"])
+
+    def test_errors(self):
+        self.conversions.add("missing", ["fidl", "-J", "com.example.gen", "-O", self.tmp_dir,
+                                         os.path.join(self.tmp_dir, "Missing.fidl")])
+        self.wait()
+        self.assertEqual(self.of("missing", "finished"), ["Finished with errors"])
+        self.assertIn("ERROR", "".join(self.of("missing", "output")))
+
+
+if __name__ == "__main__":
+    unittest.main()